@@ -152,11 +152,13 @@ def parse_report(text: str) -> dict | None:
 
 
 def extract_all_tool_names() -> set[str]:
-    """Extract all unifi_* tool names from generated/server.py."""
+    """Extract all unifi_* tool names from generated/server.py and unifi_tools/."""
     if not SERVER_PY.exists():
         return set()
-    text = SERVER_PY.read_text()
-    return set(re.findall(r"async def (unifi_\w+)\(", text))
+    paths = [SERVER_PY, *sorted((SERVER_PY.parent / "unifi_tools").glob("*.py"))]
+    text = "\n".join(path.read_text() for path in paths)
+    # Hand-written tools are `async def unifi_*`; the rest are tool table rows
+    return set(re.findall(r'(?:async def |^\s*\("\w+", ")(unifi_\w+)', text, re.MULTILINE))
 
 
 def collect_invoked_tools(reports: list[dict]) -> set[str]:
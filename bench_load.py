@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""Drive concurrent MCP load at the generated server over stdio or streamable HTTP.
+
+Opens --sessions MCP sessions and replays a weighted mix of tool calls
+from generated/tests/bench_cases.py (the bench_tools.py cases) for
+--duration seconds after a --warmup. Load is either closed-loop,
+--concurrency calls in flight, or open-loop, Poisson arrivals at --rate
+calls/s. Open-loop latency counts from the scheduled start, so queueing
+in an overloaded server shows up in it.
+
+With --transport stdio every session is its own server process, the way
+an agent platform spawns one per session. With --transport http one
+server process serves all sessions at /mcp. Either way the server runs
+under a wrapper (--serve) that samples its event-loop lag into a file.
+
+Reports throughput, latency percentiles overall and per family, errors,
+server and driver event-loop lag, and controller fan-out (requests per
+tool call, logins, busiest routes) from the mock's /_mock/stats.
+
+Run: uv run python bench_load.py [--transport http] [--sessions 8] [--concurrency 32]
+     uv run python bench_load.py --rate 200 --mix list=3,unifi_list_clients=2 --scale medium
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from bench_tools import FAMILIES, GENERATED_DIR, ROOT, _Arguments, _cleanup, _failed, _free_port, start_mock
+
+DEFAULT_MIX = "list=5,get=3,v2=1,cmd=1"
+LAG_INTERVAL = 0.05  # seconds between event-loop lag samples
+
+
+def _pct(values: list[float], q: float) -> float:
+    """q-quantile of sorted values (0.0 when empty)."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+async def _watch_lag(samples: list[tuple[float, float]]) -> None:
+    """Append (wall time, lag ms) every LAG_INTERVAL: how late the loop woke up."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + LAG_INTERVAL
+        await asyncio.sleep(LAG_INTERVAL)
+        samples.append((time.time(), (loop.time() - expected) * 1000))
+
+
+# ---------------------------------------------------------------------------
+# Server side: the generated server plus a lag monitor
+# ---------------------------------------------------------------------------
+
+
+async def _flush_lag(samples: list[tuple[float, float]], path: Path) -> None:
+    """Write new samples to path as one JSON line per second."""
+    written = 0
+    with path.open("a") as f:
+        while True:
+            await asyncio.sleep(1)
+            f.write(json.dumps(samples[written:]) + "\n")
+            f.flush()
+            written = len(samples)
+
+
+async def serve(transport: str, port: int, lag_file: Path) -> None:
+    sys.path.insert(0, str(GENERATED_DIR))
+    import server
+
+    samples: list[tuple[float, float]] = []
+    monitors = [asyncio.create_task(_watch_lag(samples)), asyncio.create_task(_flush_lag(samples, lag_file))]
+    try:
+        if transport == "http":
+            await server.mcp.run_async("http", show_banner=False, host="127.0.0.1", port=port, log_level="warning")
+        else:
+            await server.mcp.run_async("stdio", show_banner=False)
+    finally:
+        for task in monitors:
+            task.cancel()
+
+
+def read_lag(paths: list[Path], since: float, until: float) -> list[float]:
+    """Sorted lag samples (ms) from the servers' lag files within [since, until]."""
+    lags = []
+    for path in paths:
+        if not path.exists():
+            continue
+        for line in path.read_text().splitlines():
+            lags += [lag for t, lag in json.loads(line) if since <= t <= until]
+    return sorted(lags)
+
+
+# ---------------------------------------------------------------------------
+# Driver side
+# ---------------------------------------------------------------------------
+
+
+def parse_mix(spec: str, cases: list[tuple], parser: argparse.ArgumentParser) -> list[tuple[float, list[tuple]]]:
+    """"family=weight,tool=weight,..." → [(weight, cases)]; a family picks uniformly among its tools."""
+    mix = []
+    for entry in spec.split(","):
+        name, _, weight = entry.strip().partition("=")
+        chosen = [case for case in cases if name in (case[0], case[1])]
+        if not chosen:
+            parser.error(f"--mix: {name!r} is neither a family ({', '.join(FAMILIES)}) nor a registered tool")
+        try:
+            mix.append((float(weight or 1), chosen))
+        except ValueError:
+            parser.error(f"--mix: bad weight in {entry!r}")
+    return mix
+
+
+class _Recorder:
+    """Latencies and failures per family for one phase."""
+
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: Counter = Counter()  # family → tool errors
+        self.exceptions: Counter = Counter()  # exception type → count
+        self.dropped = 0  # open loop: arrivals skipped at --max-inflight
+
+    @property
+    def calls(self) -> int:
+        return sum(len(values) for values in self.latencies.values())
+
+
+class Driver:
+    def __init__(self, args: argparse.Namespace, sessions: list, mix: list[tuple[float, list[tuple]]],
+                 arguments: _Arguments) -> None:
+        self.args = args
+        self.sessions = sessions
+        self.mix = mix
+        self.weights = [weight for weight, _ in mix]
+        self.arguments = arguments
+        self.rng = random.Random(args.seed)
+        self.recorder = _Recorder()
+        self.inflight = 0
+
+    def pick(self) -> tuple:
+        _, cases = self.rng.choices(self.mix, weights=self.weights)[0]
+        return self.rng.choice(cases)
+
+    async def call(self, session, started: float | None = None) -> None:
+        family, tool, case_args, cleanup = self.pick()
+        args = await self.arguments.fill(case_args)
+        recorder = self.recorder
+        started = time.perf_counter() if started is None else started
+        try:
+            result = await session.call_tool_mcp(tool, args, timeout=self.args.timeout)
+        except Exception as e:
+            recorder.latencies[family].append((time.perf_counter() - started) * 1000)
+            recorder.exceptions[type(e).__name__] += 1
+            return
+        recorder.latencies[family].append((time.perf_counter() - started) * 1000)
+        if _failed(result):
+            recorder.errors[family] += 1
+        # Created records are removed untimed; their requests still count in fan-out
+        await _cleanup(session, cleanup, result)
+
+    async def closed_loop(self, seconds: float) -> None:
+        deadline = time.perf_counter() + seconds
+
+        async def worker(index: int) -> None:
+            session = self.sessions[index % len(self.sessions)]
+            while time.perf_counter() < deadline:
+                await self.call(session)
+
+        await asyncio.gather(*(worker(i) for i in range(self.args.concurrency)))
+
+    async def open_loop(self, seconds: float) -> None:
+        rate = self.args.rate
+        deadline = time.perf_counter() + seconds
+        scheduled = time.perf_counter()
+        tasks: set[asyncio.Task] = set()
+        index = 0
+        while True:
+            scheduled += self.rng.expovariate(rate)
+            if scheduled >= deadline:
+                break
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+            if self.inflight >= self.args.max_inflight:
+                self.recorder.dropped += 1
+                continue
+            task = asyncio.create_task(self._tracked(self.sessions[index % len(self.sessions)], scheduled))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            index += 1
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def _tracked(self, session, scheduled: float) -> None:
+        self.inflight += 1
+        try:
+            await self.call(session, started=scheduled)
+        finally:
+            self.inflight -= 1
+
+    async def phase(self, seconds: float) -> _Recorder:
+        self.recorder = _Recorder()
+        if self.args.rate:
+            await self.open_loop(seconds)
+        else:
+            await self.closed_loop(seconds)
+        return self.recorder
+
+
+def _server_env(controller: tuple[str, int]) -> dict[str, str]:
+    env = dict(os.environ, UNIFI_HOST=controller[0], UNIFI_PORT=str(controller[1]), UNIFI_USERNAME="bench",
+               UNIFI_PASSWORD="bench", UNIFI_SITE="default", UNIFI_TOOL_LOADING="eager", PYTHONWARNINGS="ignore")
+    for name in ("UNIFI_MODULES", "UNIFI_READ_ONLY", "UNIFI_CASSETTE", "UNIFI_CASSETTE_MODE"):
+        env.pop(name, None)
+    return env
+
+
+def _wait_for_port(port: int, proc: subprocess.Popen, timeout: float = 60) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"MCP server exited with {proc.returncode}")
+        with contextlib.suppress(OSError), socket.create_connection(("127.0.0.1", port), timeout=1):
+            return
+        time.sleep(0.2)
+    raise RuntimeError(f"MCP server did not listen on {port} within {timeout:.0f}s")
+
+
+def _mock_stats(controller: tuple[str, int], reset: bool = False) -> dict | None:
+    """The mock's request counters (None against a real controller)."""
+    import httpx
+
+    url = f"https://{controller[0]}:{controller[1]}/_mock/{'reset' if reset else 'stats'}"
+    try:
+        response = httpx.post(url, verify=False) if reset else httpx.get(url, verify=False)
+    except httpx.HTTPError:
+        return None
+    return response.json() if response.status_code == 200 else None
+
+
+async def run(args: argparse.Namespace, controller: tuple[str, int], workdir: Path,
+              parser: argparse.ArgumentParser) -> dict:
+    from fastmcp import Client
+    from fastmcp.client.transports import StdioTransport, StreamableHttpTransport
+
+    sys.path.insert(0, str(GENERATED_DIR / "tests"))
+    from bench_cases import CASES
+
+    env = _server_env(controller)
+    serve_command = [str(Path(__file__).resolve()), "--serve", args.transport]
+    lag_files: list[Path] = []
+    http_server = None
+    async with contextlib.AsyncExitStack() as stack:
+        if args.transport == "http":
+            port = _free_port()
+            lag_files.append(workdir / "lag-http.jsonl")
+            with (workdir / "server-http.log").open("w") as log:
+                http_server = subprocess.Popen(
+                    [sys.executable, *serve_command, "--port", str(port), "--lag-file", str(lag_files[0])],
+                    env=env, cwd=ROOT, stdout=log, stderr=subprocess.STDOUT)
+            stack.callback(http_server.wait)
+            stack.callback(http_server.terminate)
+            _wait_for_port(port, http_server)
+
+        def connect(index: int) -> Client:
+            if args.transport == "http":
+                return Client(StreamableHttpTransport(f"http://127.0.0.1:{port}/mcp"), timeout=args.timeout)
+            lag_files.append(workdir / f"lag-stdio-{index}.jsonl")
+            transport = StdioTransport(sys.executable, [*serve_command, "--lag-file", str(lag_files[-1])],
+                                       env=env, cwd=str(ROOT), keep_alive=False,
+                                       log_file=workdir / f"server-stdio-{index}.log")
+            return Client(transport, timeout=args.timeout, init_timeout=120)
+
+        started = time.perf_counter()
+        sessions = [await stack.enter_async_context(connect(i)) for i in range(args.sessions)]
+        connect_s = time.perf_counter() - started
+
+        registered = {tool.name for tool in await sessions[0].list_tools()}
+        cases = [case for case in CASES if case[1] in registered]
+        mix = parse_mix(args.mix, cases, parser)
+        arguments = _Arguments(sessions[0])
+        for _, chosen in mix:
+            for case in chosen:
+                await arguments.fill(case[2])  # look up every {id:...}/{mac:...} up front
+
+        driver = Driver(args, sessions, mix, arguments)
+        driver_lag: list[tuple[float, float]] = []
+        watcher = asyncio.create_task(_watch_lag(driver_lag))
+        if args.warmup:
+            await driver.phase(args.warmup)
+        _mock_stats(controller, reset=True)
+        since = time.time()
+        started = time.perf_counter()
+        recorder = await driver.phase(args.duration)
+        elapsed = time.perf_counter() - started
+        until = time.time()
+        stats = _mock_stats(controller)
+        watcher.cancel()
+        await asyncio.sleep(1.2)  # let the servers flush their last lag samples
+        server_lag = read_lag(lag_files, since, until)
+
+    driver_lags = sorted(lag for t, lag in driver_lag if since <= t <= until)
+    every = sorted(value for values in recorder.latencies.values() for value in values)
+    failed = sum(recorder.errors.values()) + sum(recorder.exceptions.values())
+    result = {
+        "transport": args.transport,
+        "sessions": args.sessions,
+        "load": f"{args.rate:g} calls/s" if args.rate else f"{args.concurrency} in flight",
+        "duration_s": round(elapsed, 2),
+        "connect_s": round(connect_s, 2),
+        "calls": recorder.calls,
+        "throughput": round(recorder.calls / elapsed, 1),
+        "errors": sum(recorder.errors.values()),
+        "exceptions": dict(recorder.exceptions),
+        "error_rate": round(failed / max(recorder.calls, 1), 4),
+        "dropped": recorder.dropped,
+        "latency_ms": {name: round(_pct(every, q), 2) for name, q in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99))}
+        | {"max": round(every[-1], 2) if every else 0.0},
+        "families": {
+            family: {
+                "calls": len(values),
+                "p50_ms": round(_pct(sorted(values), 0.5), 2),
+                "p99_ms": round(_pct(sorted(values), 0.99), 2),
+                "errors": recorder.errors[family],
+            }
+            for family, values in sorted(recorder.latencies.items(), key=lambda item: FAMILIES.index(item[0]))
+        },
+        "server_lag_ms": _lag_summary(server_lag),
+        "driver_lag_ms": _lag_summary(driver_lags),
+        "controller": None,
+    }
+    if stats is not None:
+        routes = {k: v for k, v in stats.items() if k.split(" ")[0] in ("GET", "POST", "PUT", "DELETE")}
+        result["controller"] = {
+            "requests": stats.get("requests", 0),
+            "per_call": round(stats.get("requests", 0) / max(recorder.calls, 1), 2),
+            "logins": stats.get("POST login", 0),
+            "sessions": stats.get("sessions", 0),
+            "top_routes": dict(Counter(routes).most_common(5)),
+        }
+    return result
+
+
+def _lag_summary(lags: list[float]) -> dict:
+    return {"samples": len(lags), "p50": round(_pct(lags, 0.5), 2), "p99": round(_pct(lags, 0.99), 2),
+            "max": round(lags[-1], 2) if lags else 0.0,
+            "mean": round(statistics.fmean(lags), 2) if lags else 0.0}
+
+
+def report(result: dict) -> None:
+    print(f"{result['transport']}, {result['sessions']} sessions, {result['load']}, "
+          f"{result['duration_s']:.0f}s (sessions up in {result['connect_s']:.1f}s)")
+    failed = result["errors"] + sum(result["exceptions"].values())
+    print(f"  calls        {result['calls']:,} ({result['throughput']:,.1f}/s), "
+          f"{failed} failed ({result['error_rate']:.2%})"
+          + (f", {result['dropped']} dropped at --max-inflight" if result["dropped"] else ""))
+    if result["exceptions"]:
+        print("  exceptions   " + ", ".join(f"{name} {n}" for name, n in result["exceptions"].items()))
+    latency = result["latency_ms"]
+    print(f"  latency      p50 {latency['p50']:.1f}ms  p90 {latency['p90']:.1f}ms  "
+          f"p99 {latency['p99']:.1f}ms  max {latency['max']:.1f}ms")
+    for family, row in result["families"].items():
+        print(f"    {family:<9} {row['calls']:>7,} calls  p50 {row['p50_ms']:>7.1f}ms  "
+              f"p99 {row['p99_ms']:>7.1f}ms  {row['errors']} errors")
+    for label, key in (("server lag", "server_lag_ms"), ("driver lag", "driver_lag_ms")):
+        lag = result[key]
+        print(f"  {label:<12} p50 {lag['p50']:.1f}ms  p99 {lag['p99']:.1f}ms  max {lag['max']:.1f}ms "
+              f"({lag['samples']} samples)")
+    controller = result["controller"]
+    if controller is None:
+        print("  controller   no /_mock/stats (not the mock controller)")
+        return
+    print(f"  controller   {controller['requests']:,} requests ({controller['per_call']:.2f} per call), "
+          f"{controller['logins']} logins, {controller['sessions']} sessions")
+    print("  top routes   " + ", ".join(f"{route} {n:,}" for route, n in controller["top_routes"].items()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transport", choices=("stdio", "http"), default="stdio",
+                        help="stdio: a server process per session; http: one streamable HTTP server")
+    parser.add_argument("--sessions", type=int, default=4, help="Concurrent MCP sessions (default 4)")
+    load = parser.add_mutually_exclusive_group()
+    load.add_argument("--concurrency", type=int, default=16, help="Calls in flight, closed loop (default 16)")
+    load.add_argument("--rate", type=float, help="Target calls/s, open loop with Poisson arrivals")
+    parser.add_argument("--max-inflight", type=int, default=1000,
+                        help="Open loop: drop arrivals past this many calls in flight (default 1000)")
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+                        help=f"Weighted families and/or tools, e.g. list=3,unifi_get_device=1 (default {DEFAULT_MIX})")
+    parser.add_argument("--duration", type=float, default=20, help="Measured seconds (default 20)")
+    parser.add_argument("--warmup", type=float, default=3, help="Unmeasured seconds first (default 3)")
+    parser.add_argument("--timeout", type=float, default=30, help="Per-call timeout in seconds (default 30)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the mix and arrivals (default 0)")
+    parser.add_argument("--scale", default="small", help="Mock controller scale (default small)")
+    parser.add_argument("--mock-args", default="", help='Extra mock flags, e.g. "--latency 20 --jitter 5"')
+    parser.add_argument("--controller", metavar="HOST:PORT",
+                        help="Use a running controller (e.g. a mock with custom flags) instead of starting one")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    parser.add_argument("--serve", choices=("stdio", "http"), help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--lag-file", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        asyncio.run(serve(args.serve, args.port, args.lag_file))
+        return
+    if args.sessions < 1 or args.concurrency < 1 or (args.rate is not None and args.rate <= 0):
+        parser.error("--sessions, --concurrency and --rate must be positive")
+
+    mock = None
+    if args.controller:
+        host, _, port = args.controller.rpartition(":")
+        controller = (host or "127.0.0.1", int(port))
+    else:
+        mock, port = start_mock(args.scale, args.mock_args.split())
+        controller = ("127.0.0.1", port)
+    try:
+        with tempfile.TemporaryDirectory(prefix="bench-load-") as workdir:
+            result = asyncio.run(run(args, controller, Path(workdir), parser))
+    finally:
+        if mock is not None:
+            mock.terminate()
+            mock.wait()
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        report(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""Replay a workload captured with UNIFI_CAPTURE against the mock controller or a cassette.
+
+Re-issues the captured tool calls through in-process MCP clients, one
+session per captured session. --timing original (the default) starts each
+call at its captured offset divided by --speed, so calls overlap as they
+did when captured; --timing fast issues them in captured order as fast as
+possible, --concurrency at a time.
+
+The replay is itself captured (to --save, or a temporary file), so the
+report puts each tool's replayed latency, result size, controller
+requests per call and errors next to the captured ones, with throughput,
+event-loop lag and, for original timing, how far calls started behind
+schedule.
+
+Captured arguments replay as written: redacted values are sent as
+"REDACTED", and IDs from a real controller mostly do not exist on the
+mock, so those calls replay as errors (counted per tool). A capture made
+while recording a cassette (UNIFI_CASSETTE_MODE=record) replays its
+controller responses exactly with --cassette; set UNIFI_USERNAME to the
+recording's user so the login matches.
+
+Run: uv run python bench_replay.py capture.ndjson [--timing fast --concurrency 8] [--scale medium]
+     uv run python bench_replay.py capture.ndjson --cassette prod.cassette --speed 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from bench_load import _lag_summary, _pct, _watch_lag
+from bench_tools import GENERATED_DIR, start_mock
+
+
+def read_capture(path: Path, tools: set[str], limit: int) -> list[dict]:
+    """The capture's calls in start order, optionally filtered and truncated."""
+    calls = []
+    with path.open() as f:
+        for line in f:
+            call = json.loads(line)
+            if "tool" in call and (not tools or call["tool"] in tools):
+                calls.append(call)
+    calls.sort(key=lambda call: call["start"])
+    return calls[:limit] if limit else calls
+
+
+async def replay(calls: list[dict], args: argparse.Namespace) -> dict:
+    """Issue calls through the in-process server; returns timing and scheduling stats."""
+    sys.path.insert(0, str(GENERATED_DIR))
+    import server
+    from fastmcp import Client
+
+    lag: list[tuple[float, float]] = []
+    watcher = asyncio.create_task(_watch_lag(lag))
+    sessions: dict[str | None, Client] = {}
+    behind: list[float] = []  # original timing: ms each call started after its slot
+    try:
+        for session in dict.fromkeys(call.get("session") for call in calls):
+            client = Client(server.mcp, timeout=args.timeout)
+            sessions[session] = await client.__aenter__()
+
+        async def issue(call: dict) -> None:
+            try:
+                await sessions[call.get("session")].call_tool_mcp(call["tool"], call["args"])
+            except Exception:
+                pass  # the replay capture records the call as an error
+
+        started = time.perf_counter()
+        if args.timing == "original":
+            origin = calls[0]["start"]
+            tasks = []
+            for call in calls:
+                slot = started + (call["start"] - origin) / args.speed
+                await asyncio.sleep(max(0.0, slot - time.perf_counter()))
+                behind.append((time.perf_counter() - slot) * 1000)
+                tasks.append(asyncio.create_task(issue(call)))
+            await asyncio.gather(*tasks)
+        else:
+            queue: asyncio.Queue = asyncio.Queue()
+            for call in calls:
+                queue.put_nowait(call)
+
+            async def worker() -> None:
+                while not queue.empty():
+                    await issue(queue.get_nowait())
+
+            await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+    finally:
+        watcher.cancel()
+        for client in sessions.values():
+            await client.__aexit__(None, None, None)
+    return {
+        "elapsed_s": elapsed,
+        "sessions": len(sessions),
+        "lag_ms": _lag_summary(sorted(value for _, value in lag)),
+        "behind_ms": _lag_summary(sorted(behind)) if behind else None,
+    }
+
+
+def _per_tool(calls: list[dict]) -> dict[str, dict]:
+    grouped: dict[str, list[dict]] = defaultdict(list)
+    for call in calls:
+        grouped[call["tool"]].append(call)
+    summary = {}
+    for tool, rows in grouped.items():
+        durations = sorted(row["duration_ms"] for row in rows)
+        summary[tool] = {
+            "calls": len(rows),
+            "p50_ms": round(_pct(durations, 0.5), 2),
+            "p99_ms": round(_pct(durations, 0.99), 2),
+            "requests_per_call": round(sum(len(row["requests"]) for row in rows) / len(rows), 2),
+            "result_bytes": round(statistics.fmean(row["result_bytes"] for row in rows)),
+            "errors": sum(row["error"] for row in rows),
+        }
+    return summary
+
+
+def _overall(calls: list[dict], elapsed: float) -> dict:
+    durations = sorted(call["duration_ms"] for call in calls)
+    return {
+        "calls": len(calls),
+        "span_s": round(elapsed, 2),
+        "throughput": round(len(calls) / max(elapsed, 1e-9), 1),
+        "p50_ms": round(_pct(durations, 0.5), 2),
+        "p99_ms": round(_pct(durations, 0.99), 2),
+        "errors": sum(call["error"] for call in calls),
+        "requests_per_call": round(sum(len(call["requests"]) for call in calls) / max(len(calls), 1), 2),
+    }
+
+
+def report(result: dict, verbose: bool) -> None:
+    captured, replayed = result["captured"], result["replayed"]
+    timing = f"original timing x{result['speed']:g}" if result["timing"] == "original" \
+        else f"fast, {result['concurrency']} at a time"
+    print(f"Replayed {replayed['calls']:,} calls in {result['sessions']} sessions ({timing}) "
+          f"against {result['target']}")
+    print(f"  {'':<18} {'captured':>12} {'replayed':>12}")
+    for label, key, fmt in (("span", "span_s", "{:,.1f}s"), ("calls/s", "throughput", "{:,.1f}"),
+                            ("p50", "p50_ms", "{:,.1f}ms"), ("p99", "p99_ms", "{:,.1f}ms"),
+                            ("errors", "errors", "{:,}"), ("requests/call", "requests_per_call", "{:.2f}")):
+        print(f"  {label:<18} {fmt.format(captured[key]):>12} {fmt.format(replayed[key]):>12}")
+    lag = result["lag_ms"]
+    print(f"  event-loop lag     p50 {lag['p50']:.1f}ms  p99 {lag['p99']:.1f}ms  max {lag['max']:.1f}ms")
+    if result["behind_ms"]:
+        behind = result["behind_ms"]
+        print(f"  behind schedule    p50 {behind['p50']:.1f}ms  p99 {behind['p99']:.1f}ms  max {behind['max']:.1f}ms")
+
+    rows = sorted(result["tools"].items(), key=lambda item: -item[1]["replayed"]["calls"])
+    if not verbose:
+        rows = rows[:15]
+    print(f"\n  {'tool':<40} {'calls':>6} {'p50 cap → rep':>19} {'req/call':>11} {'errors':>9}")
+    for tool, row in rows:
+        cap, rep = row["captured"], row["replayed"]
+        print(f"  {tool:<40} {rep['calls']:>6} {cap['p50_ms']:>7.1f} → {rep['p50_ms']:>7.1f}ms "
+              f"{cap['requests_per_call']:>4.1f} → {rep['requests_per_call']:<4.1f} "
+              f"{cap['errors']:>3} → {rep['errors']}")
+    if len(result["tools"]) > len(rows):
+        print(f"  ... {len(result['tools']) - len(rows)} more tools (-v for all)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", type=Path, help="Capture file written with UNIFI_CAPTURE")
+    parser.add_argument("--timing", choices=("original", "fast"), default="original",
+                        help="original: captured start offsets (default); fast: back to back")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="Original timing: divide the captured offsets by this (default 1)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Fast timing: calls in flight (default 1)")
+    parser.add_argument("--tools", default="", help="Only replay these tools (comma-separated)")
+    parser.add_argument("--limit", type=int, default=0, help="Only replay the first N calls")
+    parser.add_argument("--timeout", type=float, default=60, help="Per-call timeout in seconds (default 60)")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--cassette", type=Path, help="Answer controller requests from this cassette")
+    target.add_argument("--controller", metavar="HOST:PORT", help="Use a running (mock) controller")
+    parser.add_argument("--cassette-latency", default="1",
+                        help="UNIFI_CASSETTE_LATENCY for --cassette (default 1, the recorded times)")
+    parser.add_argument("--scale", default="small", help="Mock controller scale (default small)")
+    parser.add_argument("--mock-args", default="", help='Extra mock flags, e.g. "--latency 20"')
+    parser.add_argument("--save", type=Path, help="Keep the replay's own capture here")
+    parser.add_argument("--verbose", "-v", action="store_true", help="List every tool")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args()
+    if args.speed <= 0 or args.concurrency < 1:
+        parser.error("--speed and --concurrency must be positive")
+
+    calls = read_capture(args.capture, {t.strip() for t in args.tools.split(",") if t.strip()}, args.limit)
+    if not calls:
+        parser.error(f"no tool calls to replay in {args.capture}")
+
+    # The server reads its configuration at import, so set it up first
+    for name in ("UNIFI_MODULES", "UNIFI_READ_ONLY", "UNIFI_CASSETTE", "UNIFI_CASSETTE_MODE"):
+        os.environ.pop(name, None)
+    os.environ.update(UNIFI_TOOL_LOADING="eager", PYTHONWARNINGS="ignore")
+    os.environ.setdefault("UNIFI_PASSWORD", "bench")
+    mock = None
+    if args.cassette:
+        os.environ.update(UNIFI_CASSETTE=str(args.cassette), UNIFI_CASSETTE_MODE="replay",
+                          UNIFI_CASSETTE_LATENCY=args.cassette_latency)
+        target_name = f"cassette {args.cassette}"
+    else:
+        if args.controller:
+            host, _, port = args.controller.rpartition(":")
+            host = host or "127.0.0.1"
+        else:
+            mock, port = start_mock(args.scale, args.mock_args.split())
+            host = "127.0.0.1"
+        os.environ.update(UNIFI_HOST=host, UNIFI_PORT=str(port))
+        target_name = args.controller or f"mock controller ({args.scale})"
+
+    with tempfile.TemporaryDirectory(prefix="bench-replay-") as workdir:
+        replay_path = args.save or Path(workdir) / "replay.ndjson"
+        replay_path.unlink(missing_ok=True)
+        os.environ["UNIFI_CAPTURE"] = str(replay_path)
+        try:
+            stats = asyncio.run(replay(calls, args))
+        finally:
+            if mock is not None:
+                mock.terminate()
+                mock.wait()
+        replayed = read_capture(replay_path, set(), 0)
+
+    captured_span = (calls[-1]["start"] + calls[-1]["duration_ms"] / 1000) - calls[0]["start"]
+    captured_tools, replayed_tools = _per_tool(calls), _per_tool(replayed)
+    result = {
+        "capture": str(args.capture),
+        "target": target_name,
+        "timing": args.timing,
+        "speed": args.speed,
+        "concurrency": args.concurrency,
+        "sessions": stats["sessions"],
+        "captured": _overall(calls, captured_span),
+        "replayed": _overall(replayed, stats["elapsed_s"]),
+        "lag_ms": stats["lag_ms"],
+        "behind_ms": stats["behind_ms"],
+        "tools": {
+            tool: {"captured": captured_tools[tool], "replayed": replayed_tools.get(tool) or
+                   {"calls": 0, "p50_ms": 0.0, "p99_ms": 0.0, "requests_per_call": 0.0,
+                    "result_bytes": 0, "errors": 0}}
+            for tool in captured_tools
+        },
+    }
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        report(result, args.verbose)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark generated server startup for several UNIFI_MODULES settings.
+
+Each run is a fresh interpreter that imports the framework (httpx, fastmcp),
+then generated/server.py with UNIFI_TOOL_LOADING=lazy, then registers every
+module the way eager loading does at import. Reports the median of each
+phase plus peak RSS. Run: uv run python bench_startup.py [--runs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+GENERATED_DIR = ROOT / "generated"
+
+DEFAULT_COMBINATIONS = [
+    "v1,v2",
+    "v1",
+    "v2",
+    "device",
+    "monitor",
+    "device,client,monitor",
+    "device,client,wifi,network,monitor",
+]
+
+# Runs inside the child interpreter; prints one JSON line.
+_CHILD = """
+import json, resource, sys, time
+sys.path.insert(0, sys.argv[1])
+t0 = time.perf_counter()
+import fastmcp, httpx
+t1 = time.perf_counter()
+import server
+t2 = time.perf_counter()
+for module in list(server._MODULE_APIS):
+    server._enable_module(module)
+t3 = time.perf_counter()
+print(json.dumps({
+    "deps_s": t1 - t0,
+    "server_s": t2 - t1,
+    "register_s": t3 - t2,
+    "tools": len(server.mcp._tool_manager._tools),
+    "rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}))
+"""
+
+
+def run_once(modules: str, generated_dir: Path) -> dict:
+    """Start one interpreter with UNIFI_MODULES=modules and return its timings."""
+    env = dict(os.environ, UNIFI_MODULES=modules, UNIFI_TOOL_LOADING="lazy", PYTHONWARNINGS="ignore")
+    result = subprocess.run(
+        [sys.executable, "-c", _CHILD, str(generated_dir)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def bench(modules: str, runs: int, generated_dir: Path) -> dict:
+    """Median of each phase over runs; tool count and peak RSS from the last run."""
+    samples = [run_once(modules, generated_dir) for _ in range(runs)]
+    summary = {key: statistics.median(s[key] for s in samples) for key in ("deps_s", "server_s", "register_s")}
+    summary["startup_s"] = summary["server_s"] + summary["register_s"]
+    summary["tools"] = samples[-1]["tools"]
+    summary["rss_mb"] = max(s["rss_kb"] for s in samples) / 1024
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Interpreter starts per combination (default 5)")
+    parser.add_argument(
+        "--modules",
+        action="append",
+        help="UNIFI_MODULES value to benchmark (repeatable; default: a fixed set)",
+    )
+    parser.add_argument(
+        "--generated-dir",
+        type=Path,
+        default=GENERATED_DIR,
+        help="Directory containing server.py (default: generated/)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = {m: bench(m, args.runs, args.generated_dir) for m in args.modules or DEFAULT_COMBINATIONS}
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Startup benchmark ({args.runs} runs each, median; deps = fastmcp + httpx import)")
+    print(f"  {'UNIFI_MODULES':<36} {'tools':>5} {'deps':>8} {'server':>8} {'register':>9} {'startup':>8} {'RSS':>8}")
+    for modules, r in results.items():
+        print(
+            f"  {modules:<36} {r['tools']:>5} {r['deps_s'] * 1000:>6.0f}ms {r['server_s'] * 1000:>6.0f}ms "
+            f"{r['register_s'] * 1000:>7.0f}ms {r['startup_s'] * 1000:>6.0f}ms {r['rss_mb']:>6.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
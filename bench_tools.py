@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""Benchmark the generated tools per family against the mock controller or a cassette.
+
+Runs every case in generated/tests/bench_cases.py (emitted by generate.py
+with the tests) through an in-process MCP client, so each call includes
+argument validation, the controller round trip and result serialization.
+Per tool it records p50/p99 latency over --iterations calls, peak
+allocations of one call under tracemalloc (least of three), and the
+serialized result size; per family (list/get/create/cmd/v2/overview) it
+reports throughput.
+
+Each scale starts mock-controller/mock_controller.py --scale <scale> on a
+free port, and the cases run in a fresh interpreter against it.
+--cassette replays a recording instead (UNIFI_CASSETTE, no delays).
+
+Results are compared with bench_baselines.json. A tool whose metric goes
+past baseline * ratio + slack (BUDGETS) is a regression, and the run
+exits 1. Only the machine-independent metrics (allocations, output size,
+errors) are gated by default; the baselines' latencies were measured on
+one machine, so --check-latency gates p50/p99 only where that is the
+same machine. --update-baselines records the measured scales instead.
+
+Run: uv run python bench_tools.py [--scales small,medium] [--families list,get]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import uuid
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+GENERATED_DIR = ROOT / "generated"
+MOCK_CONTROLLER = ROOT / "mock-controller" / "mock_controller.py"
+BASELINES_PATH = ROOT / "bench_baselines.json"
+
+FAMILIES = ("list", "get", "create", "cmd", "v2", "overview")
+DEFAULT_SCALES = ("small", "medium")
+ALLOC_PASSES = 3
+
+# metric → (allowed ratio over baseline, absolute slack). Latencies get room
+# for machine noise; allocations and output size are nearly deterministic.
+BUDGETS = {
+    "p50_ms": (1.5, 2.0),
+    "p99_ms": (2.0, 10.0),
+    "alloc_kb": (1.25, 64.0),
+    "output_bytes": (1.1, 1024),
+    "errors": (1.0, 0),
+}
+LATENCY_METRICS = ("p50_ms", "p99_ms")  # gated only with --check-latency
+
+
+# ---------------------------------------------------------------------------
+# Child: run the cases against one controller
+# ---------------------------------------------------------------------------
+
+
+def _parse(result) -> object:
+    text = "".join(getattr(c, "text", "") for c in result.content)
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def _output_bytes(result) -> int:
+    return sum(len(getattr(c, "text", "").encode()) for c in result.content)
+
+
+def _failed(result) -> bool:
+    if result.isError:
+        return True
+    parsed = _parse(result)
+    return isinstance(parsed, dict) and parsed.get("error") is True
+
+
+class _Arguments:
+    """Fills case placeholders; "{id:...}"/"{mac:...}" are looked up once."""
+
+    def __init__(self, client) -> None:
+        self.client = client
+        self.firsts: dict[str, dict] = {}
+
+    async def first(self, tool: str) -> dict:
+        if tool not in self.firsts:
+            result = await self.client.call_tool_mcp(tool, {"limit": 1})
+            parsed = _parse(result)
+            data = parsed.get("data") if isinstance(parsed, dict) else None
+            self.firsts[tool] = data[0] if isinstance(data, list) and data else {}
+        return self.firsts[tool]
+
+    async def fill(self, value: object) -> object:
+        if isinstance(value, dict):
+            return {k: await self.fill(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [await self.fill(v) for v in value]
+        if not isinstance(value, str):
+            return value
+        if value.startswith(("{id:", "{mac:")) and value.endswith("}"):
+            field, _, tool = value[1:-1].partition(":")
+            record = await self.first(tool)
+            return record.get("_id" if field == "id" else "mac", "")
+        if "{default_network_id}" in value:
+            value = value.replace("{default_network_id}", (await self.first("unifi_list_networks")).get("_id", ""))
+        return value.replace("{unique}", uuid.uuid4().hex[:8])
+
+
+async def _cleanup(client, tool: str | None, result) -> None:
+    if tool is None:
+        return
+    parsed = _parse(result)
+    data = parsed.get("data") if isinstance(parsed, dict) else None
+    record = data[0] if isinstance(data, list) and data else data
+    if isinstance(record, dict) and record.get("_id"):
+        await client.call_tool_mcp(tool, {"id": record["_id"], "confirm": True})
+
+
+async def run_cases(families: set[str], tools: set[str], iterations: int) -> dict[str, dict]:
+    """Measure every selected case; tool → metrics."""
+    sys.path.insert(0, str(GENERATED_DIR))
+    sys.path.insert(0, str(GENERATED_DIR / "tests"))
+    import server
+    from bench_cases import CASES
+    from fastmcp import Client
+
+    results: dict[str, dict] = {}
+    async with Client(server.mcp) as client:
+        registered = {tool.name for tool in await client.list_tools()}
+        arguments = _Arguments(client)
+        selected = [case for case in CASES
+                    if case[0] in families and (not tools or case[1] in tools) and case[1] in registered]
+        for family, tool, case_args, cleanup in selected:
+            # Warm-up call: resolves placeholders, logs in, fills caches
+            result = await client.call_tool_mcp(tool, await arguments.fill(case_args))
+            await _cleanup(client, cleanup, result)
+            times, errors = [], 0
+            for _ in range(iterations):
+                args = await arguments.fill(case_args)
+                started = time.perf_counter()
+                result = await client.call_tool_mcp(tool, args)
+                times.append((time.perf_counter() - started) * 1000)
+                errors += _failed(result)
+                await _cleanup(client, cleanup, result)
+            times.sort()
+            results[tool] = {
+                "family": family,
+                "calls": iterations,
+                "p50_ms": round(statistics.median(times), 3),
+                "p99_ms": round(times[min(len(times) - 1, int(len(times) * 0.99))], 3),
+                "total_ms": round(sum(times), 3),
+                "output_bytes": _output_bytes(result),
+                "errors": errors,
+            }
+        # Allocations last, with tracing on for the whole pass: starting and
+        # stopping tracemalloc per call races the client's worker threads.
+        # The least of ALLOC_PASSES collected calls keeps GC timing out of it.
+        tracemalloc.start()
+        for family, tool, case_args, cleanup in selected:
+            peaks = []
+            for _ in range(ALLOC_PASSES):
+                args = await arguments.fill(case_args)
+                gc.collect()
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                result = await client.call_tool_mcp(tool, args)
+                _, peak = tracemalloc.get_traced_memory()
+                peaks.append(peak - before)
+                await _cleanup(client, cleanup, result)
+            results[tool]["alloc_kb"] = round(min(peaks) / 1024, 1)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Parent: controllers, scales, baselines
+# ---------------------------------------------------------------------------
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_mock(scale: str, extra_args: list[str] | None = None) -> tuple[subprocess.Popen, int]:
+    """Start the mock controller at scale and wait until it answers /status."""
+    import httpx
+
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, str(MOCK_CONTROLLER), "--scale", scale, "--port", str(port), "--warm",
+         *(extra_args or [])],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 300
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"mock controller exited with {proc.returncode} (scale {scale})")
+        try:
+            if httpx.get(f"https://127.0.0.1:{port}/status", verify=False, timeout=2).status_code == 200:
+                return proc, port
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    proc.kill()
+    raise RuntimeError(f"mock controller did not start within 300s (scale {scale})")
+
+
+def run_child(env: dict[str, str], args: argparse.Namespace) -> dict[str, dict]:
+    """Run the cases in a fresh interpreter with env; returns tool → metrics."""
+    command = [sys.executable, __file__, "--child", "--iterations", str(args.iterations),
+               "--families", ",".join(args.families)]
+    if args.tools:
+        command += ["--tools", ",".join(args.tools)]
+    result = subprocess.run(command, capture_output=True, text=True, env=env, check=False)
+    if result.returncode != 0:
+        raise RuntimeError(f"benchmark child failed:\n{result.stderr[-4000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def bench_scale(scale: str, args: argparse.Namespace) -> dict[str, dict]:
+    env = dict(os.environ, UNIFI_USERNAME="bench", UNIFI_PASSWORD="bench", UNIFI_SITE="default",
+               UNIFI_TOOL_LOADING="eager", PYTHONWARNINGS="ignore")
+    for name in ("UNIFI_MODULES", "UNIFI_READ_ONLY", "UNIFI_CASSETTE", "UNIFI_CASSETTE_MODE"):
+        env.pop(name, None)
+    if args.cassette:
+        env.update(UNIFI_CASSETTE=str(args.cassette), UNIFI_CASSETTE_MODE="replay", UNIFI_CASSETTE_LATENCY="0")
+        return run_child(env, args)
+    proc, port = start_mock(scale)
+    try:
+        env.update(UNIFI_HOST="127.0.0.1", UNIFI_PORT=str(port))
+        return run_child(env, args)
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def regressions(scale: str, results: dict[str, dict], baselines: dict, latency: bool = False) -> list[str]:
+    """Metrics over budget against the scale's baselines (latencies only if latency)."""
+    found = []
+    for tool, metrics in results.items():
+        base = baselines.get(scale, {}).get(tool)
+        if base is None:
+            continue
+        for metric, (ratio, slack) in BUDGETS.items():
+            if metric in LATENCY_METRICS and not latency:
+                continue
+            limit = base[metric] * ratio + slack
+            if metrics[metric] > limit:
+                found.append(f"{scale} {tool}: {metric} {metrics[metric]:g} > budget {limit:g} "
+                             f"(baseline {base[metric]:g})")
+    return found
+
+
+def report(scale: str, results: dict[str, dict], verbose: bool) -> None:
+    by_family: dict[str, list[dict]] = defaultdict(list)
+    for metrics in results.values():
+        by_family[metrics["family"]].append(metrics)
+    print(f"\n[{scale}] {len(results)} tools")
+    print(f"  {'family':<9} {'tools':>5} {'calls/s':>8} {'p50 med':>9} {'p99 max':>9} {'alloc max':>10} "
+          f"{'out max':>9} {'errors':>6}")
+    for family in FAMILIES:
+        rows = by_family.get(family)
+        if not rows:
+            continue
+        # Sequential calls, so throughput is calls over the time spent in them
+        throughput = 1000 * sum(r["calls"] for r in rows) / max(sum(r["total_ms"] for r in rows), 1e-9)
+        print(f"  {family:<9} {len(rows):>5} {throughput:>8.0f} "
+              f"{statistics.median(r['p50_ms'] for r in rows):>7.2f}ms {max(r['p99_ms'] for r in rows):>7.1f}ms "
+              f"{max(r['alloc_kb'] for r in rows):>8.0f}KB {max(r['output_bytes'] for r in rows) / 1024:>7.0f}KB "
+              f"{sum(r['errors'] for r in rows):>6}")
+    if verbose:
+        print(f"\n  {'tool':<44} {'p50':>9} {'p99':>9} {'alloc':>9} {'output':>10} {'err':>4}")
+        for tool, r in sorted(results.items(), key=lambda item: (FAMILIES.index(item[1]["family"]), item[0])):
+            print(f"  {tool:<44} {r['p50_ms']:>7.2f}ms {r['p99_ms']:>7.2f}ms {r['alloc_kb']:>7.0f}KB "
+                  f"{r['output_bytes']:>9,}B {r['errors']:>4}")
+
+
+def _csv(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=_csv, default=list(DEFAULT_SCALES),
+                        help=f"Mock controller scales to run (default: {','.join(DEFAULT_SCALES)})")
+    parser.add_argument("--cassette", type=Path, help="Replay this cassette instead of starting the mock")
+    parser.add_argument("--families", type=_csv, default=list(FAMILIES),
+                        help=f"Tool families to run (default: {','.join(FAMILIES)})")
+    parser.add_argument("--tools", type=_csv, default=[], help="Only these tools (comma-separated)")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed calls per tool (default 20)")
+    parser.add_argument("--baselines", type=Path, default=BASELINES_PATH,
+                        help="Baselines file (default: bench_baselines.json)")
+    parser.add_argument("--check-latency", action="store_true",
+                        help="Also gate p50/p99 latency (only meaningful on the baselines' machine)")
+    parser.add_argument("--update-baselines", action="store_true",
+                        help="Record the measured scales as the new baselines instead of checking")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Print every tool's metrics")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    unknown = set(args.families) - set(FAMILIES)
+    if unknown:
+        parser.error(f"unknown families: {', '.join(sorted(unknown))}")
+
+    if args.child:
+        results = asyncio.run(run_cases(set(args.families), set(args.tools), args.iterations))
+        print(json.dumps(results))
+        return
+
+    scales = ["cassette"] if args.cassette else args.scales
+    baselines = json.loads(args.baselines.read_text()) if args.baselines.exists() else {}
+    measured = {}
+    for scale in scales:
+        started = time.perf_counter()
+        measured[scale] = bench_scale(scale, args)
+        if not args.json:
+            report(scale, measured[scale], args.verbose)
+            print(f"  ({time.perf_counter() - started:.0f}s)")
+    if args.json:
+        print(json.dumps(measured, indent=2))
+    # With --json, stdout holds only the results
+    out = sys.stderr if args.json else sys.stdout
+
+    if args.update_baselines:
+        baselines["meta"] = {"python": platform.python_version(), "machine": platform.machine(),
+                             "iterations": args.iterations}
+        for scale, results in measured.items():
+            baselines.setdefault(scale, {}).update(
+                {tool: {k: m[k] for k in ("family", *BUDGETS)} for tool, m in results.items()})
+            baselines[scale] = dict(sorted(baselines[scale].items()))
+        args.baselines.write_text(json.dumps(baselines, indent=1, sort_keys=True) + "\n")
+        print(f"\nBaselines for {', '.join(measured)} written to {args.baselines}", file=out)
+        return
+    found = [line for scale, results in measured.items()
+             for line in regressions(scale, results, baselines, args.check_latency)]
+    if found:
+        print(f"\n{len(found)} regression(s) past budget:", file=out)
+        for line in found:
+            print(f"  {line}", file=out)
+        sys.exit(1)
+    checked = sum(1 for scale, results in measured.items() for tool in results if tool in baselines.get(scale, {}))
+    gated = "all metrics" if args.check_latency else "allocations, output size and errors; --check-latency for p50/p99"
+    print(f"\nNo regressions ({checked} tool/scale pairs checked against {args.baselines.name}: {gated})", file=out)
+
+
+if __name__ == "__main__":
+    main()
@@ -98,12 +98,14 @@ def count_from_spec() -> dict:
         v2_detail[name] = methods
 
     global_tools = global_count  # 1 tool per global endpoint
-    port_override = 1  # port override helper
+    port_override = 2  # port override helpers (single + bulk)
+    history = 3  # local history helpers (time-series query, report planner, event search)
     report_issue = 1  # error reporting helper
     overview = 1  # network overview composite tool
-    search_tools = 1  # tool discovery helper
+    search_tools = 3  # tool + field discovery helpers, field descriptions
+    enable_module = 1  # module loading helper (lazy tool loading)
 
-    total_tools = rest_tools + stat_tools + cmd_tools + v2_tools + global_tools + port_override + report_issue + overview + search_tools
+    total_tools = rest_tools + stat_tools + cmd_tools + v2_tools + global_tools + port_override + history + report_issue + overview + search_tools + enable_module
 
     return {
         "endpoints": {
@@ -125,9 +127,11 @@ def count_from_spec() -> dict:
             "v2": v2_tools,
             "global": global_tools,
             "port_override": port_override,
+            "history": history,
             "report_issue": report_issue,
             "overview": overview,
             "search_tools": search_tools,
+            "enable_module": enable_module,
             "total": total_tools,
         },
         "rest_detail": rest_detail,
@@ -201,8 +205,11 @@ def count_readonly_breakdown() -> dict[str, int]:
         else:
             ro += 1
 
-    # Port override: mutating
-    mut += 1
+    # Port override helpers (single + bulk): mutating
+    mut += 2
+
+    # Local history helpers: read-only (only write to local stores)
+    ro += 3
 
     # Report issue: read-only
     ro += 1
@@ -210,7 +217,10 @@ def count_readonly_breakdown() -> dict[str, int]:
     # Overview: read-only
     ro += 1
 
-    # Search tools: read-only
+    # Search helpers (tools, fields, field descriptions): read-only
+    ro += 3
+
+    # Module loading helper: read-only
     ro += 1
 
     return {"readonly": ro, "mutating": mut}
@@ -276,19 +286,25 @@ def count_module_breakdown(counts: dict) -> dict[str, dict]:
         # Only GET methods are read-only
         modules[mod]["v2_ro"] += methods.count("GET")
 
-    # Port override helper → device module (mutating, not read-only)
-    modules["device"]["v1"] += 1
+    # Port override helpers → device module (mutating, not read-only)
+    modules["device"]["v1"] += 2
+
+    # Local history helpers → monitor module (read-only)
+    modules["monitor"]["v1"] += 3
+    modules["monitor"]["v1_ro"] += 3
 
     return modules
 
 
 def count_actual_tools() -> int | None:
-    """Count actual tool functions in generated/server.py if it exists."""
+    """Count actual tool functions in generated/server.py + unifi_tools/ if present."""
     server_path = ROOT / "generated" / "server.py"
     if not server_path.exists():
         return None
-    code = server_path.read_text()
-    return len(re.findall(r"^\s*async def unifi_", code, re.MULTILINE))
+    paths = [server_path, *sorted((ROOT / "generated" / "unifi_tools").glob("*.py"))]
+    code = "\n".join(path.read_text() for path in paths)
+    # Hand-written tools are `async def unifi_*`; the rest are tool table rows
+    return len(re.findall(r'^\s*(?:async def |\("\w+", ")unifi_', code, re.MULTILINE))
 
 
 def main():
@@ -334,9 +350,11 @@ def main():
         print(f"    {name:25s} → {n} tools")
     print(f"  Global tools:        {t['global']}")
     print(f"  Port override:       {t['port_override']}")
+    print(f"  Local history:       {t['history']}")
     print(f"  Report issue:        {t['report_issue']}")
     print(f"  Overview:            {t['overview']}")
     print(f"  Search tools:        {t['search_tools']}")
+    print(f"  Enable module:       {t['enable_module']}")
     print(f"  TOTAL tools:         {t['total']}")
 
     # Module breakdown
@@ -345,7 +363,7 @@ def main():
     print("=" * 60)
     print("MODULE BREAKDOWN")
     print("=" * 60)
-    always_on = t["global"] + t["report_issue"] + t["overview"] + t["search_tools"]
+    always_on = t["global"] + t["report_issue"] + t["overview"] + t["search_tools"] + t["enable_module"]
     print(f"  {'Module':<12s} {'v1':>5s} {'v2':>5s} {'Total':>7s}  (with always-on: +{always_on})")
     print(f"  {'-'*12:s} {'-'*5:s} {'-'*5:s} {'-'*7:s}")
     total_v1 = 0
@@ -387,7 +405,7 @@ def main():
         print("VERIFICATION")
         print("=" * 60)
         print(f"  Computed from spec:  {t['total']}")
-        print(f"  Actual in server.py: {actual}")
+        print(f"  Actual in generated: {actual}")
         if t["total"] == actual:
             print("  \u2713 MATCH")
         else:
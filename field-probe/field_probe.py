@@ -20,14 +20,25 @@ Usage:
     # Or with explicit args:
     uv run python field-probe/field_probe.py --host 192.168.1.1 --username admin --password secret
 
+    # Several controllers/sites at once (no single site has every kind of
+    # hardware); field maps are merged, seen_in/total_records summed:
+    uv run python field-probe/field_probe.py --target 192.168.1.1/default \
+        --target 192.168.1.1/branch --target 10.0.0.1:443/default
+    uv run python field-probe/field_probe.py --targets targets.json  # per-target credentials
+
+    # Fold a new run into the existing inventory instead of replacing it
+    # (re-probing a target replaces that target's earlier contribution):
+    uv run python field-probe/field_probe.py --target 10.0.0.1/default --merge
+
     # Dry run — show what would be probed:
     uv run python field-probe/field_probe.py --dry-run
 
 Output:
     field-probe/field-inventory.json — field names per endpoint (no values)
 
-The output can then be fed into the generator to enrich docstrings with
-available field names, so LLM consumers know what to ask for.
+Copy it to spec/field-inventory.json (or pass --output spec/field-inventory.json
+--merge) and the generator uses it to enrich docstrings with available field
+names, so LLM consumers know what to ask for.
 """
 
 from __future__ import annotations
@@ -36,6 +47,7 @@ import argparse
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import httpx
@@ -43,13 +55,6 @@ import httpx
 ROOT = Path(__file__).parent
 OUTPUT = ROOT / "field-inventory.json"
 
-# Fields whose values must never be written to disk.
-SCRUB_FIELDS = frozenset({
-    "x_password", "x_passphrase", "x_shadow", "x_private_key",
-    "x_certificate_pem", "x_certificate_arn", "device_auth",
-})
-SCRUB_SUBSTRINGS = ("secret", "token", "key", "password", "passphrase")
-
 # ── Endpoints to probe ─────────────────────────────────────────────────────
 # These are endpoints known to return empty on a bare controller.
 # Grouped by API pattern.
@@ -140,6 +145,8 @@ V2_ENDPOINTS: list[dict] = [
     {"category": "v2", "name": "apgroups", "path": "apgroups"},
 ]
 
+ALL_ENDPOINTS = SITE_ENDPOINTS + V2_ENDPOINTS
+
 
 class FieldProber:
     """Connects to a UniFi controller and captures field names from each endpoint."""
@@ -302,60 +309,116 @@ class FieldProber:
 
         return self._extract_fields(data)
 
-    def run(self, dry_run: bool = False) -> dict:
-        """Probe all endpoints and return field inventory."""
-        inventory: dict[str, dict] = {}
+    def collect(self) -> dict[str, dict | None] | None:
+        """Probe all endpoints; return {endpoint key: field info or None}.
 
-        all_endpoints = SITE_ENDPOINTS + V2_ENDPOINTS
-        print(f"\nField probe: {len(all_endpoints)} endpoints to check\n")
-
-        if dry_run:
-            for ep in all_endpoints:
-                method = ep.get("method", "GET")
+        None for an endpoint means empty or error. Returns None if login fails.
+        """
+        if not self.login():
+            return None
+        collected: dict[str, dict | None] = {}
+        try:
+            for ep in ALL_ENDPOINTS:
+                key = f"{ep['category']}_{ep['name']}"
                 if ep["category"] == "v2":
-                    path = f"/v2/api/site/{self.site}/{ep['path']}"
+                    collected[key] = self.probe_v2_endpoint(ep)
                 else:
-                    path = f"/api/s/{self.site}/{ep['path']}"
-                print(f"  {method:4s} {path}")
-            return {}
-
-        if not self.login():
-            print("FATAL: Could not authenticate", file=sys.stderr)
-            sys.exit(1)
-
-        found = 0
-        empty = 0
-        errors = 0
-
-        for ep in all_endpoints:
-            key = f"{ep['category']}_{ep['name']}"
-
-            if ep["category"] == "v2":
-                fields = self.probe_v2_endpoint(ep)
-            else:
-                fields = self.probe_site_endpoint(ep)
-
-            if fields is None:
-                status = "empty/error"
-                errors += 1
-            elif not fields:
-                status = "empty"
-                empty += 1
-            else:
-                status = f"{len(fields)} fields"
-                found += 1
-                inventory[key] = {
-                    "category": ep["category"],
-                    "name": ep["name"],
-                    "path": ep["path"],
-                    "field_count": len(fields),
-                    "fields": fields,
-                }
-
-            print(f"  {key:40s} → {status}")
-
-        print(f"\nResults: {found} with data, {empty} empty, {errors} errors")
-        return inventory
+                    collected[key] = self.probe_site_endpoint(ep)
+        finally:
+            self.client.close()
+        return collected
+
+
+# ── Targets ─────────────────────────────────────────────────────────────────
+def parse_target(value: str, port: int, site: str) -> dict:
+    """Parse HOST[:PORT][/SITE]; missing parts default to port and site."""
+    address, _, target_site = value.partition("/")
+    host, _, target_port = address.partition(":")
+    return {"host": host, "port": int(target_port or port), "site": target_site or site}
+
+
+def endpoint_path(ep: dict, site: str) -> str:
+    if ep["category"] == "v2":
+        return f"/v2/api/site/{site}/{ep['path']}"
+    return f"/api/s/{site}/{ep['path']}"
+
+
+def target_label(target: dict) -> str:
+    return f"{target['host']}:{target['port']}/{target['site']}"
+
+
+def probe_targets(targets: list[dict], jobs: int, verbose: bool) -> list[dict | None]:
+    """Probe every target concurrently (one thread each, up to jobs at once).
+
+    Each target is {host, port, site, username, password, verify_ssl}.
+    Returns each target's FieldProber.collect() result, in target order.
+    """
+    def collect(target: dict) -> dict | None:
+        prober = FieldProber(verbose=verbose, **target)
+        collected = prober.collect()
+        if collected is not None:
+            with_data = sum(1 for fields in collected.values() if fields)
+            print(f"  {target_label(target)}: {with_data}/{len(collected)} endpoints with data")
+        return collected
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        return list(pool.map(collect, targets))
+
+
+def merge_fields(field_maps: list[dict]) -> dict:
+    """Merge _extract_fields outputs for one endpoint from several targets.
+
+    seen_in is summed per field. total_records becomes the endpoint's record
+    count across all targets, including targets where a field never
+    appeared, so seen_in / total_records stays the field's commonality. A
+    "null" type gives way to the first concrete type seen.
+    """
+    total = sum(next(iter(fields.values()))["total_records"] for fields in field_maps if fields)
+    merged: dict[str, dict] = {}
+    for fields in field_maps:
+        for name, info in fields.items():
+            entry = merged.setdefault(name, {"type": info["type"], "seen_in": 0})
+            if entry["type"] == "null":
+                entry["type"] = info["type"]
+            entry["seen_in"] += info["seen_in"]
+    for entry in merged.values():
+        entry["total_records"] = total
+    return dict(sorted(merged.items()))
+
+
+def merge_inventory(results: list[dict | None], existing: dict | None = None,
+                    labels: list[str] | None = None) -> dict:
+    """Build field-inventory.json from per-target collect() results.
+
+    Each endpoint keeps every target's field map under "sources", keyed by
+    target label (labels, parallel to results), and "fields" is merge_fields
+    over them. With existing, a target probed again replaces its earlier
+    contribution, so re-merging a run is idempotent; targets without data
+    this time keep theirs, and an entry from before sources were recorded
+    counts as one "(previous)" target. Endpoints keep ALL_ENDPOINTS order.
+    """
+    labels = labels or [f"target {i + 1}" for i in range(len(results))]
+    inventory = dict(existing or {})
+    for ep in ALL_ENDPOINTS:
+        key = f"{ep['category']}_{ep['name']}"
+        probed = {label: collected[key] for label, collected in zip(labels, results)
+                  if collected and collected.get(key)}
+        if not probed:
+            continue
+        previous = inventory.get(key) or {}
+        sources = dict(previous.get("sources") or
+                       ({"(previous)": previous["fields"]} if previous.get("fields") else {}))
+        sources.update(probed)
+        fields = merge_fields(list(sources.values()))
+        inventory[key] = {
+            "category": ep["category"],
+            "name": ep["name"],
+            "path": ep["path"],
+            "field_count": len(fields),
+            "fields": fields,
+            "sources": dict(sorted(sources.items())),
+        }
+    return inventory
 
 
 def main():
@@ -365,27 +428,72 @@ def main():
     parser.add_argument("--username", default=os.environ.get("UNIFI_USERNAME", "admin"))
     parser.add_argument("--password", default=os.environ.get("UNIFI_PASSWORD", ""))
     parser.add_argument("--site", default=os.environ.get("UNIFI_SITE", "default"))
+    parser.add_argument("--target", action="append", default=[], metavar="HOST[:PORT][/SITE]",
+                        help="Controller and site to probe (repeatable; default: --host/--site)")
+    parser.add_argument("--targets", type=Path,
+                        help="JSON list of {host, port, site, username, password} targets")
+    parser.add_argument("--jobs", "-j", type=int, default=4, help="Targets probed at once (default 4)")
+    parser.add_argument("--merge", action="store_true",
+                        help="Merge into the existing output file instead of replacing it")
     parser.add_argument("--no-verify-ssl", action="store_true", default=True)
     parser.add_argument("--verbose", "-v", action="store_true")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be probed without connecting")
     parser.add_argument("--output", type=Path, default=OUTPUT, help="Output file path")
     args = parser.parse_args()
 
-    if not args.password and not args.dry_run:
-        print("ERROR: UNIFI_PASSWORD env var or --password required", file=sys.stderr)
+    targets = [parse_target(t, args.port, args.site) for t in args.target]
+    if args.targets:
+        targets += [dict({"port": args.port, "site": args.site}, **t)
+                    for t in json.loads(args.targets.read_text())]
+    if not targets:
+        targets = [{"host": args.host, "port": args.port, "site": args.site}]
+    for target in targets:
+        target.setdefault("username", args.username)
+        target.setdefault("password", args.password)
+        target["verify_ssl"] = not args.no_verify_ssl
+
+    print(f"\nField probe: {len(ALL_ENDPOINTS)} endpoints on {len(targets)} target(s)\n")
+
+    if args.dry_run:
+        for target in targets:
+            print(f"  {target_label(target)}")
+            for ep in ALL_ENDPOINTS:
+                print(f"    {ep.get('method', 'GET'):4s} {endpoint_path(ep, target['site'])}")
+        return
+
+    missing = [target_label(t) for t in targets if not t["password"]]
+    if missing:
+        print(f"ERROR: UNIFI_PASSWORD env var or --password required ({', '.join(missing)})",
+              file=sys.stderr)
         sys.exit(1)
 
-    prober = FieldProber(
-        host=args.host,
-        port=args.port,
-        username=args.username,
-        password=args.password,
-        site=args.site,
-        verify_ssl=not args.no_verify_ssl,
-        verbose=args.verbose,
-    )
-
-    inventory = prober.run(dry_run=args.dry_run)
+    results = probe_targets(targets, args.jobs, args.verbose)
+    if not any(collected is not None for collected in results):
+        print("FATAL: Could not authenticate", file=sys.stderr)
+        sys.exit(1)
+
+    existing = None
+    if args.merge and args.output.exists():
+        existing = json.loads(args.output.read_text())
+    inventory = merge_inventory(results, existing, [target_label(t) for t in targets])
+
+    probed = [collected for collected in results if collected is not None]
+    found = empty = errors = 0
+    for ep in ALL_ENDPOINTS:
+        key = f"{ep['category']}_{ep['name']}"
+        outcomes = [collected[key] for collected in probed]
+        with_data = sum(1 for fields in outcomes if fields)
+        if with_data:
+            status = f"{inventory[key]['field_count']} fields ({with_data}/{len(probed)} targets)"
+            found += 1
+        elif any(fields is not None for fields in outcomes):
+            status = "empty"
+            empty += 1
+        else:
+            status = "empty/error"
+            errors += 1
+        print(f"  {key:40s} → {status}")
+    print(f"\nResults: {found} with data, {empty} empty, {errors} errors")
 
     if inventory:
         args.output.write_text(json.dumps(inventory, indent=2) + "\n")
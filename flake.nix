@@ -26,7 +26,7 @@
             name = "unifi-mcp";
             runtimeInputs = [ pythonEnv ];
             text = ''
-              exec fastmcp run ${./generated/server.py}
+              exec fastmcp run ${./generated}/server.py
             '';
           };
         }
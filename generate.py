@@ -2,26 +2,43 @@
 """UniFi MCP Server Generator.
 
 Reads endpoint-inventory.json + api-samples/ and produces:
-  - generated/server.py (FastMCP server with ~139 tools)
+  - generated/server.py (FastMCP server core, global and meta tools)
+  - generated/unifi_tools/<module>.py (per-module tools, imported on demand)
+  - generated/unifi_cassette.py (record/replay transport, UNIFI_CASSETTE)
+  - generated/unifi_capture.py (tool call capture middleware, UNIFI_CAPTURE)
   - generated/conftest.py (pytest fixtures)
   - generated/tests/test_rest_*.py (per-resource CRUD tests)
   - generated/tests/test_stat.py
   - generated/tests/test_cmd.py
   - generated/tests/test_v2.py
   - generated/tests/test_global.py
+  - generated/tests/bench_cases.py (per-tool cases for bench_tools.py)
+
+Generation is incremental: each output is keyed by a hash of its template
+(plus imported macros), the context it is rendered from and the render code,
+recorded in generated/.generate-manifest.json. Unchanged outputs are not
+re-rendered; --force ignores the manifest. Test templates render in a
+process pool while the server and tool modules render in this process.
 """
 
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, meta
 
 from generator.context_builder import build_context
 from generator.loader import load_inventory
+from generator.module_split import core_imports, top_level_names
 from generator.naming import HARDWARE_DEPENDENT_REST, MINIMAL_CREATE_PAYLOADS, READ_ONLY_REST
+from generator.scrub import ARG_SCRUB_PREFIXES, ARG_SCRUB_SUBSTRINGS, SCRUB_FIELDS, SCRUB_SUBSTRINGS
 
 ROOT = Path(__file__).parent
 INVENTORY_PATH = ROOT / "spec" / "endpoint-inventory.json"
@@ -30,6 +47,16 @@ FIELD_INVENTORY_PATH = ROOT / "spec" / "field-inventory.json"
 TEMPLATES_DIR = ROOT / "templates"
 OUTPUT_DIR = ROOT / "generated"
 TESTS_DIR = OUTPUT_DIR / "tests"
+TOOLS_DIR = OUTPUT_DIR / "unifi_tools"
+MANIFEST_PATH = OUTPUT_DIR / ".generate-manifest.json"
+
+# Code that turns the context into files. The rest of generator/ only shapes
+# the context, which is hashed per output, so a change to naming.py re-renders
+# just the outputs whose slice of the context changed.
+RENDER_CODE = (Path(__file__), ROOT / "generator" / "module_split.py")
+
+# A tool is either a hand-written `async def unifi_*` or a tool table row
+TOOL_NAME_RE = re.compile(r'^\s*(?:async def |\("\w+", ")(unifi_\w+)', re.MULTILINE)
 
 
 def _render_create_payload(resource: str, create_payload: dict) -> str:
@@ -94,8 +121,144 @@ def _get_update_field(resource: str) -> tuple[str | None, str | None]:
     return field, value
 
 
-def generate() -> None:
-    """Run the full generation pipeline."""
+
+
+def _jinja_env() -> Environment:
+    return Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        keep_trailing_newline=True,
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _digest(*parts: object) -> str:
+    """Hash parts serialized as canonical JSON."""
+    return _sha256(json.dumps(parts, sort_keys=True, separators=(",", ":")))
+
+
+# Jinja environment of a pool worker, created on its first job
+_WORKER_ENV: Environment | None = None
+
+
+def _render_template(name: str, context: dict) -> str:
+    """Render one template in a pool worker."""
+    global _WORKER_ENV
+    if _WORKER_ENV is None:
+        _WORKER_ENV = _jinja_env()
+    return _WORKER_ENV.get_template(name).render(**context)
+
+
+class _Manifest:
+    """Content hashes of the last run, used to skip unchanged outputs.
+
+    outputs[path] = {"inputs": hash of everything the file is rendered from,
+    "sha256": hash of the file as written}. An output is reused only if both
+    still match, so a hand-edited or deleted file is regenerated.
+    """
+
+    def __init__(self, force: bool):
+        previous = {}
+        if not force and MANIFEST_PATH.exists():
+            previous = json.loads(MANIFEST_PATH.read_text())
+        self.templates: dict[str, dict] = previous.get("templates", {})
+        self.previous: dict[str, dict] = previous.get("outputs", {})
+        self.outputs: dict[str, dict] = {}
+        self.render_code = _digest(*(path.read_text() for path in RENDER_CODE))
+        self.written = 0
+        self.unchanged = 0
+
+    def template(self, env: Environment, name: str) -> tuple[str, list[str]]:
+        """Return (digest of the template and its imports, context names it reads)."""
+        source = env.loader.get_source(env, name)[0]
+        source_hash = _sha256(source)
+        entry = self.templates.get(name)
+        if entry is None or entry["source"] != source_hash:
+            parsed = env.parse(source)
+            entry = {
+                "source": source_hash,
+                "imports": sorted(t for t in meta.find_referenced_templates(parsed) if t),
+                "variables": sorted(meta.find_undeclared_variables(parsed)),
+            }
+            self.templates[name] = entry
+        imports = [self.template(env, dep)[0] for dep in entry["imports"]]
+        return _digest(source_hash, imports), entry["variables"]
+
+    def key(self, template_digest: str, *inputs: object) -> str:
+        return _digest(self.render_code, template_digest, inputs)
+
+    def current(self, path: Path, key: str) -> str | None:
+        """Return path's content if it was generated from key and is untouched since."""
+        rel = path.relative_to(OUTPUT_DIR).as_posix()
+        entry = self.previous.get(rel)
+        if entry is None or entry["inputs"] != key or not path.exists():
+            return None
+        content = path.read_text()
+        if _sha256(content) != entry["sha256"]:
+            return None
+        self.outputs[rel] = entry
+        self.unchanged += 1
+        return content
+
+    def write(self, path: Path, key: str, content: str) -> None:
+        path.write_text(content)
+        self.outputs[path.relative_to(OUTPUT_DIR).as_posix()] = {"inputs": key, "sha256": _sha256(content)}
+        self.written += 1
+
+    def save(self) -> None:
+        manifest = {"templates": self.templates, "outputs": self.outputs}
+        MANIFEST_PATH.write_text(json.dumps(manifest, indent=1, sort_keys=True) + "\n")
+
+
+def _test_jobs(ctx: dict, env: Environment, manifest: _Manifest) -> list[tuple[Path, str, str, dict]]:
+    """List (path, key, template, context) for conftest.py, every test file and the bench cases."""
+    jobs = []
+
+    def add(path: Path, template: str, context: dict | None = None) -> None:
+        digest, variables = manifest.template(env, template)
+        if context is None:
+            # Render from (and hash) only the context names the template reads
+            context = {name: ctx[name] for name in variables if name in ctx}
+        jobs.append((path, manifest.key(digest, context), template, context))
+
+    add(OUTPUT_DIR / "conftest.py", "conftest.py.j2")
+    for tool in ctx["rest_tools"]:
+        # Enhance tool context for the test template
+        tool_ctx = dict(tool)
+        tool_ctx["create_payload_rendered"] = _render_create_payload(
+            tool["resource"], tool.get("create_payload", {})
+        )
+        tool_ctx["needs_network_id"] = _needs_network_id(tool["resource"])
+        tool_ctx["is_hardware_dependent"] = tool["resource"] in HARDWARE_DEPENDENT_REST
+        update_field, update_value = _get_update_field(tool["resource"])
+        tool_ctx["update_field"] = update_field
+        tool_ctx["update_value"] = update_value
+        add(TESTS_DIR / f"test_rest_{tool['resource']}.py", "test_rest.py.j2", {"tool": tool_ctx})
+    for kind in ("stat", "cmd", "v2", "global", "server"):
+        add(TESTS_DIR / f"test_{kind}.py", f"test_{kind}.py.j2")
+    add(TESTS_DIR / "bench_cases.py", "bench_cases.py.j2")
+    return jobs
+
+
+def generate(force: bool = False, jobs: int | None = None) -> None:
+    """Run the generation pipeline, re-rendering only outputs whose inputs changed.
+
+    force ignores the manifest and re-renders everything; jobs caps the
+    worker processes for test templates (1 renders them in this process).
+    """
+    timings: dict[str, float] = {}
+    started = lap = time.perf_counter()
+
+    def stage(name: str) -> None:
+        nonlocal lap
+        now = time.perf_counter()
+        timings[name] = now - lap
+        lap = now
+
     print("Loading endpoint inventory...")
     inventory = load_inventory(INVENTORY_PATH, SAMPLES_DIR, FIELD_INVENTORY_PATH)
     print(f"  Controller version: {inventory.controller_version}")
@@ -104,104 +267,152 @@ def generate() -> None:
     print(f"  Cmd endpoints: {len(inventory.cmd_endpoints)}")
     print(f"  v2 endpoints: {len(inventory.v2_endpoints)}")
     print(f"  Global endpoints: {len(inventory.global_endpoints)}")
+    stage("load")
 
     print("\nBuilding template context...")
     ctx = build_context(inventory)
     print(f"  Estimated tool count: {ctx['tool_count']}")
+    stats = ctx["field_catalogue_stats"]
+    print(f"  Field catalogue: {stats['fields']} fields for {stats['tools']} tools ({stats['bytes']} bytes compressed)")
+    stage("context")
 
-    # Set up Jinja2
-    env = Environment(
-        loader=FileSystemLoader(str(TEMPLATES_DIR)),
-        keep_trailing_newline=True,
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
+    env = _jinja_env()
+    manifest = _Manifest(force)
 
     # Ensure output dirs exist
     OUTPUT_DIR.mkdir(exist_ok=True)
     TESTS_DIR.mkdir(exist_ok=True)
+    TOOLS_DIR.mkdir(exist_ok=True)
+
+    # --- Start test templates in the pool; they don't depend on server.py ---
+    test_jobs = _test_jobs(ctx, env, manifest)
+    dirty = [job for job in test_jobs if manifest.current(job[0], job[1]) is None]
+    workers = min(jobs or os.cpu_count() or 1, len(dirty))
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    pending = [
+        (path, key, pool.submit(_render_template, template, context) if pool else None, template, context)
+        for path, key, template, context in dirty
+    ]
+    stage("plan")
 
     # --- Render server.py ---
     print("\nRendering server.py...")
-    server_template = env.get_template("server.py.j2")
-    server_code = server_template.render(**ctx)
-    (OUTPUT_DIR / "server.py").write_text(server_code)
+    server_path = OUTPUT_DIR / "server.py"
+    digest, variables = manifest.template(env, "server.py.j2")
+    server_ctx = {name: ctx[name] for name in variables if name in ctx}
+    server_key = manifest.key(digest, server_ctx)
+    server_code = manifest.current(server_path, server_key)
+    if server_code is None:
+        server_code = env.get_template("server.py.j2").render(**server_ctx)
+        manifest.write(server_path, server_key, server_code)
+    else:
+        print("  unchanged")
     # Count tool functions
-    tool_count = len(re.findall(r"^\s*async def unifi_", server_code, re.MULTILINE))
-    print(f"  Generated {tool_count} tool functions")
+    tool_count = len(TOOL_NAME_RE.findall(server_code))
+    stage("server")
+
+    # --- Render the cassette transport (scrubbed with generator/scrub.py's rules) ---
+    cassette_path = OUTPUT_DIR / "unifi_cassette.py"
+    cassette_digest, _ = manifest.template(env, "cassette.py.j2")
+    cassette_ctx = {"scrub_fields": sorted(SCRUB_FIELDS), "scrub_substrings": list(SCRUB_SUBSTRINGS)}
+    cassette_key = manifest.key(cassette_digest, cassette_ctx)
+    if manifest.current(cassette_path, cassette_key) is None:
+        manifest.write(cassette_path, cassette_key, env.get_template("cassette.py.j2").render(**cassette_ctx))
+
+    # --- Render the workload capture middleware (UNIFI_CAPTURE) ---
+    capture_path = OUTPUT_DIR / "unifi_capture.py"
+    capture_digest, _ = manifest.template(env, "capture.py.j2")
+    capture_ctx = {"arg_scrub_prefixes": list(ARG_SCRUB_PREFIXES), "arg_scrub_substrings": list(ARG_SCRUB_SUBSTRINGS)}
+    capture_key = manifest.key(capture_digest, capture_ctx)
+    if manifest.current(capture_path, capture_key) is None:
+        manifest.write(capture_path, capture_key, env.get_template("capture.py.j2").render(**capture_ctx))
 
-    # --- Render conftest.py ---
-    print("Rendering conftest.py...")
-    conftest_template = env.get_template("conftest.py.j2")
-    conftest_code = conftest_template.render(**ctx)
-    (OUTPUT_DIR / "conftest.py").write_text(conftest_code)
+    # --- Render per-module tool files ---
+    print("Rendering tool modules...")
+    module_digest, _ = manifest.template(env, "tool_module.py.j2")
+    server_imports, server_defined = top_level_names(server_code)
+    server_scope = (sorted(server_imports.items()), sorted(server_defined))
+    module_template = None
+    rendered = 0
+    for mod, apis in ctx["module_apis"].items():
+        module_ctx = {
+            "mod": mod,
+            "apis": apis,
+            "controller_version": ctx["controller_version"],
+            "mod_rest": ctx["rest_by_module"].get(mod, []),
+            "mod_stat": ctx["stat_by_module"].get(mod, []),
+            "mod_cmd": ctx["cmd_by_module"].get(mod, []),
+            "mod_v2": ctx["v2_by_module"].get(mod, []),
+        }
+        module_path = TOOLS_DIR / f"{mod}.py"
+        module_key = manifest.key(module_digest, module_ctx, server_scope)
+        module_code = manifest.current(module_path, module_key)
+        if module_code is None:
+            module_template = module_template or env.get_template("tool_module.py.j2")
+            # First pass finds the server names the tools use, second pass imports them
+            draft = module_template.render(**module_ctx, stdlib_imports=[], core_names=[])
+            stdlib_imports, core_names = core_imports(draft, server_code)
+            module_code = module_template.render(
+                **module_ctx, stdlib_imports=stdlib_imports, core_names=core_names
+            )
+            manifest.write(module_path, module_key, module_code)
+            rendered += 1
+        tool_count += len(TOOL_NAME_RE.findall(module_code))
+    init_code = '"""Per-module UniFi MCP tools (auto-generated), imported by server._enable_module()."""\n'
+    if manifest.current(TOOLS_DIR / "__init__.py", _digest(init_code)) is None:
+        manifest.write(TOOLS_DIR / "__init__.py", _digest(init_code), init_code)
+    # Remove modules that are no longer generated
+    for old_file in TOOLS_DIR.glob("*.py"):
+        if old_file.stem != "__init__" and old_file.stem not in ctx["module_apis"]:
+            old_file.unlink()
+    print(f"  Generated {tool_count} tool functions ({len(ctx['module_apis'])} modules, {rendered} re-rendered)")
+    stage("tool modules")
 
-    # --- Render per-resource REST test files ---
-    # Clean up stale REST test files before regenerating
+    # --- Collect conftest.py and test files ---
+    print(f"Rendering tests... ({len(dirty)} of {len(test_jobs)} changed, {workers if pool else 1} process(es))")
+    for path, key, future, template, context in pending:
+        code = future.result() if future else env.get_template(template).render(**context)
+        manifest.write(path, key, code)
+    if pool:
+        pool.shutdown()
+    if manifest.current(TESTS_DIR / "__init__.py", _digest("")) is None:
+        manifest.write(TESTS_DIR / "__init__.py", _digest(""), "")
+    # Remove REST test files for resources that are no longer generated
+    planned = {job[0] for job in test_jobs}
     for old_file in TESTS_DIR.glob("test_rest_*.py"):
-        old_file.unlink()
-    print("Rendering REST test files...")
-    rest_template = env.get_template("test_rest.py.j2")
-    rest_test_count = 0
-    for tool in ctx["rest_tools"]:
-        # Enhance tool context for the test template
-        tool_ctx = dict(tool)
-        tool_ctx["create_payload_rendered"] = _render_create_payload(
-            tool["resource"], tool.get("create_payload", {})
-        )
-        tool_ctx["needs_network_id"] = _needs_network_id(tool["resource"])
-        tool_ctx["is_hardware_dependent"] = tool["resource"] in HARDWARE_DEPENDENT_REST
-        update_field, update_value = _get_update_field(tool["resource"])
-        tool_ctx["update_field"] = update_field
-        tool_ctx["update_value"] = update_value
+        if old_file not in planned:
+            old_file.unlink()
+    print(f"  Generated {sum(1 for job in test_jobs if job[2] == 'test_rest.py.j2')} REST test files")
+    stage("tests")
 
-        test_code = rest_template.render(tool=tool_ctx)
-        filename = f"test_rest_{tool['resource']}.py"
-        (TESTS_DIR / filename).write_text(test_code)
-        rest_test_count += 1
-    print(f"  Generated {rest_test_count} REST test files")
-
-    # --- Render stat tests ---
-    print("Rendering stat tests...")
-    stat_template = env.get_template("test_stat.py.j2")
-    stat_code = stat_template.render(**ctx)
-    (TESTS_DIR / "test_stat.py").write_text(stat_code)
-
-    # --- Render command tests ---
-    print("Rendering command tests...")
-    cmd_template = env.get_template("test_cmd.py.j2")
-    cmd_code = cmd_template.render(**ctx)
-    (TESTS_DIR / "test_cmd.py").write_text(cmd_code)
-
-    # --- Render v2 tests ---
-    print("Rendering v2 tests...")
-    v2_template = env.get_template("test_v2.py.j2")
-    v2_code = v2_template.render(**ctx)
-    (TESTS_DIR / "test_v2.py").write_text(v2_code)
-
-    # --- Render global tests ---
-    print("Rendering global tests...")
-    global_template = env.get_template("test_global.py.j2")
-    global_code = global_template.render(**ctx)
-    (TESTS_DIR / "test_global.py").write_text(global_code)
-
-    # --- Render server validation tests ---
-    print("Rendering server validation tests...")
-    server_test_template = env.get_template("test_server.py.j2")
-    server_test_code = server_test_template.render(**ctx)
-    (TESTS_DIR / "test_server.py").write_text(server_test_code)
-
-    # --- Write tests __init__.py ---
-    (TESTS_DIR / "__init__.py").write_text("")
+    manifest.save()
 
     # Summary
     test_files = list(TESTS_DIR.glob("test_*.py"))
     print(f"\n=== Generation Complete ===")
-    print(f"  Server: generated/server.py ({tool_count} tools)")
+    print(f"  Server: generated/server.py + generated/unifi_tools/ ({tool_count} tools)")
     print(f"  Config: generated/conftest.py")
     print(f"  Tests:  {len(test_files)} test files in generated/tests/")
+    print(f"  Files:  {manifest.written} written, {manifest.unchanged} unchanged")
+    print("\nTimings:")
+    for name, seconds in timings.items():
+        print(f"  {name:<13} {seconds * 1000:7.1f}ms")
+    print(f"  {'total':<13} {(time.perf_counter() - started) * 1000:7.1f}ms")
     print(f"\nTo run: python -c \"import generated.server\"")
 
 
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate the UniFi MCP server and its tests.")
+    parser.add_argument("--force", action="store_true", help="Re-render every output, ignoring the manifest")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for test templates (default: CPU count; 1 = no pool)",
+    )
+    args = parser.parse_args()
+    generate(force=args.force, jobs=args.jobs)
+
+
 if __name__ == "__main__":
-    generate()
+    main()
@@ -7,11 +7,16 @@ from __future__ import annotations
 
 import os
 import subprocess
+import sys
 import time
+from pathlib import Path
 
 import httpx
 import pytest
 
+sys.path.insert(0, str(Path(__file__).parent))
+import unifi_cassette  # noqa: E402
+
 CONTROLLER_HOST = os.environ.get("UNIFI_HOST", "localhost")
 CONTROLLER_PORT = int(os.environ.get("UNIFI_PORT", "8443"))
 CONTROLLER_USERNAME = os.environ.get("UNIFI_USERNAME", "admin")
@@ -19,6 +24,14 @@ CONTROLLER_PASSWORD = os.environ.get("UNIFI_PASSWORD", "testpassword123")
 CONTROLLER_SITE = os.environ.get("UNIFI_SITE", "default")
 CONTAINER_NAME = os.environ.get("UNIFI_CONTAINER", "unifi-test-controller")
 BASE_URL = f"https://{CONTROLLER_HOST}:{CONTROLLER_PORT}"
+# Record/replay transport when UNIFI_CASSETTE is set; None talks to the controller
+CASSETTE = unifi_cassette.transport_from_env(verify=False)
+
+
+@pytest.fixture(scope="session")
+def controller_transport() -> httpx.BaseTransport | None:
+    """Transport for tests that build their own httpx client."""
+    return CASSETTE
 
 
 @pytest.fixture(scope="session")
@@ -28,7 +41,8 @@ def controller_url() -> str:
     deadline = time.time() + 180  # 3 minutes max
     while time.time() < deadline:
         try:
-            resp = httpx.get(f"{url}/status", verify=False, timeout=5.0)
+            with httpx.Client(verify=False, timeout=5.0, transport=CASSETTE) as client:
+                resp = client.get(f"{url}/status")
             if resp.status_code == 200:
                 return url
         except (httpx.ConnectError, httpx.ReadTimeout, httpx.ConnectTimeout):
@@ -40,7 +54,7 @@ def controller_url() -> str:
 def _try_login(base_url: str) -> bool:
     """Attempt login and return True if successful."""
     try:
-        with httpx.Client(base_url=base_url, verify=False, timeout=10.0) as client:
+        with httpx.Client(base_url=base_url, verify=False, timeout=10.0, transport=CASSETTE) as client:
             resp = client.post(
                 "/api/login",
                 json={"username": CONTROLLER_USERNAME, "password": CONTROLLER_PASSWORD},
@@ -152,7 +166,7 @@ class AuthenticatedClient:
     """Wrapper around httpx.Client with UniFi auth."""
 
     def __init__(self, base_url: str, username: str, password: str) -> None:
-        self.client = httpx.Client(base_url=base_url, verify=False, timeout=30.0)
+        self.client = httpx.Client(base_url=base_url, verify=False, timeout=30.0, transport=CASSETTE)
         self.base_url = base_url
         self.username = username
         self.password = password
@@ -1,27 +1,37 @@
 """UniFi Network Controller MCP Server (auto-generated).
 
 Generated from controller version 10.0.162.
-Total tools: ~286
+Total tools: ~293
 
 DO NOT EDIT THIS FILE. All changes must be made in the generator.
 """
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import importlib
+import inspect
 import json
 import os
 import re
-from typing import Any
+import sqlite3
+import sys
+import time
+import zlib
+from typing import Any, NamedTuple
 
 import httpx
 from fastmcp import FastMCP
+from fastmcp.tools import FunctionTool
 
 mcp = FastMCP(
     "UniFi Network Controller",
     instructions=(
-        "This server has 286 tools. "
+        "This server has 293 tools. "
         "Call unifi_search_tools first to find relevant tools by keyword "
         "(e.g. 'vlan', 'firewall rule', 'backup') instead of scanning all tool signatures. "
+        "If a tool you need is not listed, load its module with unifi_enable_module. "
         "If a tool returns an unexpected error, call unifi_report_issue to report it."
     ),
 )
@@ -40,7 +50,24 @@ UNIFI_MODULES = set(
     m.strip() for m in os.environ.get("UNIFI_MODULES", "v1,v2").split(",") if m.strip()
 )
 UNIFI_READ_ONLY = os.environ.get("UNIFI_READ_ONLY", "false").lower() == "true"
+UNIFI_TOOL_LOADING = os.environ.get("UNIFI_TOOL_LOADING", "eager").strip().lower()
 UNIFI_REDACT_SECRETS = os.environ.get("UNIFI_REDACT_SECRETS", "true").lower() != "false"
+UNIFI_TIMESERIES_DB = os.environ.get("UNIFI_TIMESERIES_DB", "")
+UNIFI_EVENT_ARCHIVE_DB = os.environ.get("UNIFI_EVENT_ARCHIVE_DB", "")
+
+
+def _import_generated(name: str) -> Any:
+    """Import a module generated alongside this one (unifi_tools.*, unifi_capture, ...).
+
+    Relative to the package when imported as one (`import generated.server`),
+    top-level when generated/ itself is on sys.path (`fastmcp run server.py`).
+    """
+    return importlib.import_module(f"{__package__}.{name}" if __package__ else name)
+
+
+# Opt-in workload capture: one line per tool call (see unifi_capture.py)
+if os.environ.get("UNIFI_CAPTURE"):
+    mcp.add_middleware(_import_generated("unifi_capture").middleware_from_env())
 
 
 # ---------------------------------------------------------------------------
@@ -48,6 +75,25 @@ UNIFI_REDACT_SECRETS = os.environ.get("UNIFI_REDACT_SECRETS", "true").lower() !=
 # ---------------------------------------------------------------------------
 
 
+def _cassette_transport() -> httpx.AsyncBaseTransport | None:
+    """Record/replay transport when UNIFI_CASSETTE is set (see unifi_cassette.py)."""
+    if not os.environ.get("UNIFI_CASSETTE"):
+        return None
+    return _import_generated("unifi_cassette").transport_from_env(verify=UNIFI_VERIFY_SSL)
+
+
+def _controller_transport() -> httpx.AsyncBaseTransport | None:
+    """Transport for the server's controller clients.
+
+    The cassette transport, if any, wrapped when UNIFI_CAPTURE is set so
+    each request is attributed to the tool call that issued it.
+    """
+    transport = _cassette_transport()
+    if not os.environ.get("UNIFI_CAPTURE"):
+        return transport
+    return _import_generated("unifi_capture").RequestCounter(transport or httpx.AsyncHTTPTransport(verify=UNIFI_VERIFY_SSL))
+
+
 class UniFiClient:
     """Handles authentication, session cookies, and CSRF tokens."""
 
@@ -56,6 +102,7 @@ class UniFiClient:
             base_url=f"https://{UNIFI_HOST}:{UNIFI_PORT}",
             verify=UNIFI_VERIFY_SSL,
             timeout=30.0,
+            transport=_controller_transport(),
         )
         self._csrf_token: str | None = None
         self._logged_in = False
@@ -172,11 +219,14 @@ class UniFiClient:
         await self._client.aclose()
 
 
-# Singleton client
-_client = UniFiClient()
+# Singleton client, created on first use so importing the server stays cheap
+_client: UniFiClient | None = None
 
 
 async def _get_client() -> UniFiClient:
+    global _client
+    if _client is None:
+        _client = UniFiClient()
     return _client
 
 
@@ -354,6 +404,918 @@ def _tool_error(msg: str | Exception) -> dict:
     return {"error": True, "message": str(msg)}
 
 
+# ---------------------------------------------------------------------------
+# Helper: switch port overrides
+# ---------------------------------------------------------------------------
+
+# One lock per device _id. port_overrides is a single array on the device
+# object, so two concurrent read-modify-write cycles would drop each other's
+# changes without serialization.
+_PORT_OVERRIDE_LOCKS: dict[str, asyncio.Lock] = {}
+
+
+def _port_override_lock(device_id: str) -> asyncio.Lock:
+    """Return the lock serializing port_overrides edits for a device."""
+    lock = _PORT_OVERRIDE_LOCKS.get(device_id)
+    if lock is None:
+        lock = _PORT_OVERRIDE_LOCKS[device_id] = asyncio.Lock()
+    return lock
+
+
+def _merge_port_overrides(existing: list, overrides: list[dict]) -> list[dict]:
+    """Replace or append overrides by port_idx, keeping all other ports as-is."""
+    new_idx = {o["port_idx"] for o in overrides}
+    merged = [
+        o for o in existing
+        if not (isinstance(o, dict) and o.get("port_idx") in new_idx)
+    ]
+    merged.extend(overrides)
+    return merged
+
+
+async def _apply_port_overrides(
+    client: "UniFiClient", device_id: str, overrides: list[dict], site: str | None
+) -> dict | list:
+    """Merge overrides into a device's port_overrides with one GET and one PUT."""
+    async with _port_override_lock(device_id):
+        # Read current overrides inside the lock so concurrent edits stack
+        device_data = await client.request("GET", f"rest/device/{device_id}", site=site)
+        if isinstance(device_data, list) and device_data:
+            device_data = device_data[0]
+
+        existing_overrides = []
+        if isinstance(device_data, dict):
+            existing_overrides = device_data.get("port_overrides", [])
+
+        return await client.request(
+            "PUT",
+            f"rest/device/{device_id}",
+            json_data={"port_overrides": _merge_port_overrides(existing_overrides, overrides)},
+            site=site,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Helper: stat/report request body
+# ---------------------------------------------------------------------------
+
+
+def _report_body(start: int = 0, end: int = 0, attrs: str = "", macs: str = "") -> dict:
+    """Build a stat/report POST body so the controller filters server-side.
+
+    start/end are epoch milliseconds; attrs and macs are comma-separated.
+    Empty values are omitted so the controller applies its own defaults.
+    "time" is always requested alongside explicit attrs — rows without it
+    cannot be placed on a timeline.
+    """
+    body: dict[str, Any] = {}
+    if start:
+        body["start"] = start
+    if end:
+        body["end"] = end
+    attr_list = [a.strip() for a in attrs.split(",") if a.strip()]
+    if attr_list:
+        if "time" not in attr_list:
+            attr_list.insert(0, "time")
+        body["attrs"] = attr_list
+    mac_list = [m.strip().lower() for m in macs.split(",") if m.strip()]
+    if mac_list:
+        body["macs"] = mac_list
+    return body
+
+
+# ---------------------------------------------------------------------------
+# Helper: stat/event and stat/alarm query body
+# ---------------------------------------------------------------------------
+
+
+def _event_query_body(limit: int = 0, offset: int = 0, within_hours: int = 0, archived: str = "") -> dict:
+    """Build a stat/event or stat/alarm POST body, newest first.
+
+    Empty values are omitted so the controller applies its own defaults.
+    archived is 'true'/'false' (alarms only); '' returns both.
+    """
+    body: dict[str, Any] = {"_sort": "-time"}
+    if limit:
+        body["_limit"] = limit
+    if offset:
+        body["_start"] = offset
+    if within_hours:
+        body["within"] = within_hours
+    if archived:
+        body["archived"] = archived == "true"
+    return body
+
+
+# ---------------------------------------------------------------------------
+# Helper: local time-series store (optional, UNIFI_TIMESERIES_DB)
+# ---------------------------------------------------------------------------
+
+_REPORT_INTERVALS = ("5minutes", "hourly", "daily", "monthly")
+
+# Report type → row key holding the object MAC (site reports have none)
+_REPORT_OBJECT_KEYS = {"site": "", "ap": "ap", "user": "user", "gw": "gw"}
+
+# Attributes pulled on sync. Explicit attrs are requested on top of these.
+_REPORT_DEFAULT_ATTRS = {
+    "site": ["bytes", "wan-tx_bytes", "wan-rx_bytes", "wlan_bytes", "num_sta", "lan-num_sta", "wlan-num_sta"],
+    "ap": ["bytes", "num_sta", "rx_bytes", "tx_bytes"],
+    "user": ["rx_bytes", "tx_bytes"],
+    "gw": ["cpu", "mem", "loadavg_5", "wan-tx_bytes", "wan-rx_bytes", "lan-rx_bytes", "lan-tx_bytes"],
+}
+
+# How far back the first sync reaches (roughly what the controller retains)
+_REPORT_LOOKBACK_MS = {
+    "5minutes": 24 * 3600 * 1000,
+    "hourly": 7 * 24 * 3600 * 1000,
+    "daily": 52 * 7 * 24 * 3600 * 1000,
+    "monthly": 52 * 7 * 24 * 3600 * 1000,
+}
+
+_TIMESERIES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    site TEXT NOT NULL,
+    report TEXT NOT NULL,
+    mac TEXT NOT NULL,
+    time INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (site, report, mac, time)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_samples_mac_time ON samples (mac, time);
+CREATE TABLE IF NOT EXISTS watermarks (
+    site TEXT NOT NULL,
+    report TEXT NOT NULL,
+    mac TEXT NOT NULL,
+    attr TEXT NOT NULL,
+    time INTEGER NOT NULL,
+    PRIMARY KEY (site, report, mac, attr)
+);
+"""
+
+_TIMESERIES_CONN: sqlite3.Connection | None = None
+
+
+def _timeseries_connect(path: str) -> sqlite3.Connection:
+    """Open (and create if needed) a time-series store at path."""
+    conn = sqlite3.connect(path)
+    # Watermarks from before they were kept per attribute cannot say which
+    # attrs they cover; dropping them makes the next sync backfill (upserts)
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(watermarks)")]
+    if columns and "attr" not in columns:
+        conn.execute("DROP TABLE watermarks")
+    conn.executescript(_TIMESERIES_SCHEMA)
+    return conn
+
+
+def _timeseries_db() -> sqlite3.Connection:
+    """Return the shared store, or raise if UNIFI_TIMESERIES_DB is not set."""
+    global _TIMESERIES_CONN
+    if _TIMESERIES_CONN is None:
+        if not UNIFI_TIMESERIES_DB:
+            raise RuntimeError(
+                "Local time-series store is disabled. Set UNIFI_TIMESERIES_DB to a "
+                "SQLite file path (e.g. ~/.cache/unifi-mcp/timeseries.db) to enable it."
+            )
+        _TIMESERIES_CONN = _timeseries_connect(os.path.expanduser(UNIFI_TIMESERIES_DB))
+    return _TIMESERIES_CONN
+
+
+def _parse_report(report: str) -> tuple[str, str]:
+    """Split '5minutes.ap' into (interval, type), raising on unknown values."""
+    interval, _, rtype = report.partition(".")
+    if interval not in _REPORT_INTERVALS or rtype not in _REPORT_OBJECT_KEYS:
+        raise RuntimeError(
+            f"Unknown report '{report}'. Expected <interval>.<type> with interval in "
+            f"{', '.join(_REPORT_INTERVALS)} and type in {', '.join(_REPORT_OBJECT_KEYS)}."
+        )
+    return interval, rtype
+
+
+async def _timeseries_sync(
+    client: "UniFiClient",
+    conn: sqlite3.Connection,
+    site: str,
+    report: str,
+    macs: list[str],
+    attrs: list[str],
+    now_ms: int,
+) -> int:
+    """Pull report rows newer than the stored watermark into the store.
+
+    The watermark is kept per (site, report, mac, attr); "*" tracks syncs
+    over all objects. The request starts at the oldest watermark of any
+    requested mac and attr (inclusive, so the last, possibly still-filling
+    bucket is refreshed), so an attr never synced before is backfilled over
+    the whole lookback. Rows are upserted, merging attributes into what is
+    already stored. Returns the number of rows received.
+    """
+    interval, rtype = _parse_report(report)
+    keys = macs or ["*"]
+    pulled = list(dict.fromkeys(_REPORT_DEFAULT_ATTRS[rtype] + attrs))
+    marks = {
+        (mac, attr): t
+        for mac, attr, t in conn.execute(
+            f"SELECT mac, attr, time FROM watermarks WHERE site = ? AND report = ? "
+            f"AND mac IN ({','.join('?' * (len(keys) + 1))})",
+            [site, report, *keys, "*"],
+        )
+    }
+    default_start = now_ms - _REPORT_LOOKBACK_MS[interval]
+    start = min(marks.get((k, a), marks.get(("*", a), default_start)) for k in keys for a in pulled)
+
+    body = _report_body(start, now_ms, ",".join(pulled), ",".join(macs))
+    rows = await client.request("POST", f"stat/report/{interval}.{rtype}", json_data=body, site=site)
+
+    obj_key = _REPORT_OBJECT_KEYS[rtype]
+    latest: dict[str, int] = {}
+    with conn:
+        for row in rows:
+            if not isinstance(row, dict) or not isinstance(row.get("time"), (int, float)):
+                continue
+            mac = str(row.get(obj_key, "")).lower() if obj_key else ""
+            t = int(row["time"])
+            data = {k: v for k, v in row.items() if k not in ("time", "oid", "o", obj_key)}
+            conn.execute(
+                "INSERT INTO samples (site, report, mac, time, data) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (site, report, mac, time) DO UPDATE SET data = json_patch(data, excluded.data)",
+                (site, report, mac, t, json.dumps(data)),
+            )
+            latest[mac] = max(t, latest.get(mac, t))
+        if not macs and latest:
+            latest["*"] = max(latest.values())
+        conn.executemany(
+            "INSERT INTO watermarks (site, report, mac, attr, time) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (site, report, mac, attr) DO UPDATE SET time = max(time, excluded.time)",
+            [(site, report, mac, attr, t) for mac, t in latest.items() for attr in pulled],
+        )
+    return len(rows)
+
+
+_TIMESERIES_AGGS = ("avg", "min", "max", "sum")
+
+
+def _timeseries_query(
+    conn: sqlite3.Connection,
+    site: str,
+    report: str,
+    start: int,
+    end: int,
+    macs: list[str],
+    attrs: list[str],
+    agg: str = "",
+) -> list[dict]:
+    """Answer a range query from the store.
+
+    Without agg, returns one row per sample (time, mac and the stored
+    attributes, or only attrs when given). With agg, returns one row per mac
+    with agg(attr) for each attr plus the sample count, sorted by the first
+    attr descending.
+    """
+    where = "site = ? AND report = ? AND time >= ? AND time <= ?"
+    params: list[Any] = [site, report, start, end]
+    if macs:
+        where += f" AND mac IN ({','.join('?' * len(macs))})"
+        params.extend(macs)
+
+    if not agg:
+        out = []
+        for mac, t, data in conn.execute(
+            f"SELECT mac, time, data FROM samples WHERE {where} ORDER BY mac, time", params,
+        ):
+            values = json.loads(data)
+            if attrs:
+                values = {a: values.get(a) for a in attrs}
+            out.append({"time": t, "mac": mac, **values})
+        return out
+
+    if agg not in _TIMESERIES_AGGS:
+        raise RuntimeError(f"Unknown agg '{agg}'. Expected one of: {', '.join(_TIMESERIES_AGGS)}.")
+    if not attrs:
+        raise RuntimeError("attrs is required when agg is set (e.g. attrs='bytes,num_sta').")
+    # Quote attribute names in the JSON path: many contain '-' (wan-tx_bytes)
+    cols = ", ".join(f"{agg}(json_extract(data, ?))" for _ in attrs)
+    sql = (
+        f"SELECT mac, count(*), min(time), max(time), {cols} FROM samples "
+        f"WHERE {where} GROUP BY mac ORDER BY 5 DESC"
+    )
+    out = []
+    for mac, n, t0, t1, *values in conn.execute(sql, [f'$."{a}"' for a in attrs] + params):
+        row = {"mac": mac, "samples": n, "first_time": t0, "last_time": t1}
+        row.update({f"{agg}_{a}": v for a, v in zip(attrs, values)})
+        out.append(row)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Helper: full-text event/alarm archive (optional, UNIFI_EVENT_ARCHIVE_DB)
+# ---------------------------------------------------------------------------
+
+_EVENT_ARCHIVE_PATHS = {"event": "stat/event", "alarm": "stat/alarm"}
+_EVENT_ARCHIVE_PAGE = 1000  # records per stat/event request
+_EVENT_ARCHIVE_MAX_PAGES = 50  # bound on one sync
+_EVENT_ARCHIVE_FIRST_SYNC_HOURS = 30 * 24  # how far back an empty archive reaches
+_EVENT_ARCHIVE_OPEN = 2**62  # hi of a gap no page has been fetched for yet
+
+_EVENT_ARCHIVE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    site TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    time INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_site_time ON events (site, time);
+CREATE TABLE IF NOT EXISTS event_macs (
+    mac TEXT NOT NULL,
+    event INTEGER NOT NULL,
+    PRIMARY KEY (mac, event)
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(msg, key, names);
+CREATE TABLE IF NOT EXISTS event_gaps (
+    rowid INTEGER PRIMARY KEY,
+    site TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    lo INTEGER NOT NULL,
+    hi INTEGER NOT NULL
+);
+"""
+
+_EVENT_ARCHIVE_CONN: sqlite3.Connection | None = None
+
+
+def _event_archive_connect(path: str) -> sqlite3.Connection:
+    """Open (and create if needed) an event archive at path."""
+    conn = sqlite3.connect(path)
+    conn.executescript(_EVENT_ARCHIVE_SCHEMA)
+    return conn
+
+
+def _event_archive_db() -> sqlite3.Connection:
+    """Return the shared archive, or raise if UNIFI_EVENT_ARCHIVE_DB is not set."""
+    global _EVENT_ARCHIVE_CONN
+    if _EVENT_ARCHIVE_CONN is None:
+        if not UNIFI_EVENT_ARCHIVE_DB:
+            raise RuntimeError(
+                "Event archive is disabled. Set UNIFI_EVENT_ARCHIVE_DB to a SQLite "
+                "file path (e.g. ~/.cache/unifi-mcp/events.db) to enable it."
+            )
+        _EVENT_ARCHIVE_CONN = _event_archive_connect(os.path.expanduser(UNIFI_EVENT_ARCHIVE_DB))
+    return _EVENT_ARCHIVE_CONN
+
+
+def _event_archive_ingest(conn: sqlite3.Connection, site: str, kind: str, rows: list) -> tuple[int, int]:
+    """Store new events/alarms, skipping _ids already archived.
+
+    MACs in top-level fields (ap, user, sw, gw, ...) are indexed for exact
+    lookup; msg, key and *_name/*_displayName values are full-text indexed.
+    Returns (new, already_known).
+    """
+    new = known = 0
+    with conn:
+        for row in rows:
+            if not isinstance(row, dict) or not row.get("_id"):
+                continue
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO events (id, site, kind, time, key, data) VALUES (?, ?, ?, ?, ?, ?)",
+                (row["_id"], site, kind, int(row.get("time") or 0), str(row.get("key", "")), json.dumps(row)),
+            )
+            if not cur.rowcount:
+                known += 1
+                continue
+            new += 1
+            rowid = cur.lastrowid
+            macs = {
+                v.lower() for v in row.values()
+                if isinstance(v, str) and _MAC_RE.match(v)
+            }
+            conn.executemany(
+                "INSERT OR IGNORE INTO event_macs (mac, event) VALUES (?, ?)",
+                [(mac, rowid) for mac in macs],
+            )
+            names = " ".join(
+                str(v) for k, v in row.items()
+                if isinstance(v, str) and (k.endswith("_name") or k.endswith("_displayName") or k == "hostname")
+            )
+            conn.execute(
+                "INSERT INTO events_fts (rowid, msg, key, names) VALUES (?, ?, ?, ?)",
+                (rowid, str(row.get("msg", "")), str(row.get("key", "")), names),
+            )
+    return new, known
+
+
+async def _event_archive_sync(client: "UniFiClient", conn: sqlite3.Connection, site: str, kind: str) -> int:
+    """Pull the events/alarms the archive is missing, newest first, page by page.
+
+    Missing time ranges are kept in event_gaps as (lo, hi): each sync opens
+    one above the newest archived record, then fills gaps newest first.
+    After every page a gap's hi drops to the oldest record fetched, and the
+    gap is removed once a page reaches lo or comes back short. A sync cut
+    off by _EVENT_ARCHIVE_MAX_PAGES or a failed request therefore resumes
+    below what it already has on the next call instead of leaving a hole.
+    Returns the number of new records.
+    """
+    now = int(time.time() * 1000)
+    latest = conn.execute(
+        "SELECT max(time) FROM events WHERE site = ? AND kind = ?", (site, kind),
+    ).fetchone()[0]
+    with conn:
+        opened = conn.execute(
+            "SELECT 1 FROM event_gaps WHERE site = ? AND kind = ? AND hi = ?", (site, kind, _EVENT_ARCHIVE_OPEN),
+        ).fetchone()
+        if not opened:
+            lo = latest if latest else now - _EVENT_ARCHIVE_FIRST_SYNC_HOURS * 3_600_000
+            conn.execute(
+                "INSERT INTO event_gaps (site, kind, lo, hi) VALUES (?, ?, ?, ?)",
+                (site, kind, lo, _EVENT_ARCHIVE_OPEN),
+            )
+    gaps = conn.execute(
+        "SELECT rowid, lo, hi FROM event_gaps WHERE site = ? AND kind = ? ORDER BY hi DESC", (site, kind),
+    ).fetchall()
+    total_new = pages = 0
+    for gap, lo, hi in gaps:
+        while True:
+            if pages == _EVENT_ARCHIVE_MAX_PAGES:
+                return total_new
+            # Everything archived at or above hi sits before the gap in the
+            # controller's newest-first listing, so skip that many records
+            offset = conn.execute(
+                "SELECT count(*) FROM events WHERE site = ? AND kind = ? AND time >= ?", (site, kind, hi),
+            ).fetchone()[0]
+            within = max(1, -(-(now - lo) // 3_600_000) + 1)
+            body = _event_query_body(_EVENT_ARCHIVE_PAGE, offset, within)
+            rows = await client.request("POST", _EVENT_ARCHIVE_PATHS[kind], json_data=body, site=site)
+            pages += 1
+            total_new += _event_archive_ingest(conn, site, kind, rows)[0]
+            times = [int(row.get("time") or 0) for row in rows if isinstance(row, dict)]
+            with conn:
+                if len(rows) < _EVENT_ARCHIVE_PAGE or not times or min(times) <= lo:
+                    conn.execute("DELETE FROM event_gaps WHERE rowid = ?", (gap,))
+                    break
+                hi = min(hi, min(times))
+                conn.execute("UPDATE event_gaps SET hi = ? WHERE rowid = ?", (hi, gap))
+    return total_new
+
+
+def _event_archive_search(
+    conn: sqlite3.Connection,
+    site: str,
+    query: str = "",
+    key: str = "",
+    mac: str = "",
+    since: int = 0,
+    until: int = 0,
+    kind: str = "",
+    limit: int = 0,
+    offset: int = 0,
+) -> list[dict]:
+    """Search the archive, newest first.
+
+    query terms are matched as whole words (all must appear) in msg, key and
+    device/client names; a trailing '*' on a term matches prefixes.
+    """
+    sql = "SELECT e.kind, e.data FROM events e"
+    where = ["e.site = ?"]
+    params: list[Any] = [site]
+    if query:
+        terms = []
+        for term in query.split():
+            prefix = term.endswith("*")
+            term = term.rstrip("*").replace('"', '""')
+            if term:
+                terms.append(f'"{term}"' + ("*" if prefix else ""))
+        if terms:
+            sql += " JOIN events_fts f ON f.rowid = e.rowid"
+            where.append("events_fts MATCH ?")
+            params.append(" ".join(terms))
+    if mac:
+        sql += " JOIN event_macs m ON m.event = e.rowid"
+        where.append("m.mac = ?")
+        params.append(mac.lower())
+    if key:
+        where.append("e.key = ? COLLATE NOCASE")
+        params.append(key)
+    if since:
+        where.append("e.time >= ?")
+        params.append(since)
+    if until:
+        where.append("e.time <= ?")
+        params.append(until)
+    if kind:
+        where.append("e.kind = ?")
+        params.append(kind)
+    sql += " WHERE " + " AND ".join(where) + " ORDER BY e.time DESC"
+    if limit or offset:
+        sql += " LIMIT ? OFFSET ?"
+        params.extend([limit or -1, offset])
+    return [{"kind": k, **json.loads(data)} for k, data in conn.execute(sql, params)]
+
+
+# ---------------------------------------------------------------------------
+# Helper: report granularity planner
+# ---------------------------------------------------------------------------
+
+# Bucket width per report interval (monthly approximated as 30 days)
+_REPORT_STEP_MS = {
+    "5minutes": 5 * 60 * 1000,
+    "hourly": 3600 * 1000,
+    "daily": 24 * 3600 * 1000,
+    "monthly": 30 * 24 * 3600 * 1000,
+}
+
+
+def _plan_report_segments(start: int, end: int, max_points: int, now_ms: int) -> list[tuple[str, int, int]]:
+    """Split [start, end] into (interval, seg_start, seg_end) fetches.
+
+    Picks the finest interval whose point count fits max_points (so the
+    payload stays small without losing more resolution than needed). The
+    part of the range older than that interval's retention is handed to the
+    next coarser interval, and so on — stitching fine recent data onto
+    coarse older data. Segments are returned oldest first.
+    """
+    span = max(end - start, 1)
+    order = list(_REPORT_INTERVALS)
+    first = next(
+        (i for i, name in enumerate(order) if span / _REPORT_STEP_MS[name] <= max_points),
+        len(order) - 1,
+    )
+    segments: list[tuple[str, int, int]] = []
+    seg_end = end
+    for name in order[first:]:
+        if seg_end < start:
+            break
+        # monthly has no practical retention limit: it takes whatever is left
+        cutoff = start if name == order[-1] else max(start, now_ms - _REPORT_LOOKBACK_MS[name])
+        if cutoff <= seg_end:
+            segments.append((name, cutoff, seg_end))
+            seg_end = cutoff - 1
+    return segments[::-1]
+
+
+def _downsample_report(rows: list[dict], attrs: list[str], start: int, end: int, max_points: int) -> list[dict]:
+    """Reduce each object's series to at most max_points min/avg/max buckets.
+
+    Series already within max_points are returned unchanged. Rows are
+    grouped by "mac" (site reports have none) and bucketed by time.
+    """
+    series: dict[str, list[dict]] = {}
+    for row in rows:
+        series.setdefault(row.get("mac", ""), []).append(row)
+    if all(len(points) <= max_points for points in series.values()):
+        return rows
+
+    width = max((end - start + 1) / max_points, 1)
+    out: list[dict] = []
+    for mac, points in series.items():
+        buckets: dict[int, list[dict]] = {}
+        for row in points:
+            idx = min(int((row["time"] - start) / width), max_points - 1)
+            buckets.setdefault(idx, []).append(row)
+        for idx in sorted(buckets):
+            bucket = buckets[idx]
+            merged: dict[str, Any] = {"time": int(start + idx * width)}
+            if mac:
+                merged["mac"] = mac
+            merged["interval"] = "+".join(dict.fromkeys(r["interval"] for r in bucket))
+            merged["points"] = len(bucket)
+            for a in attrs:
+                values = [r[a] for r in bucket if isinstance(r.get(a), (int, float))]
+                if values:
+                    merged[f"{a}_min"] = min(values)
+                    merged[f"{a}_avg"] = sum(values) / len(values)
+                    merged[f"{a}_max"] = max(values)
+            out.append(merged)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Helper: windowed, chunked session queries
+# ---------------------------------------------------------------------------
+
+_SESSION_DEFAULT_WINDOW_S = 24 * 3600  # default range when start is not given
+_SESSION_CHUNK_S = 24 * 3600  # max window per stat/session request
+_SESSION_CONCURRENCY = 4  # windows fetched at once
+
+
+def _session_windows(start: int, end: int, chunk: int = _SESSION_CHUNK_S) -> list[tuple[int, int]]:
+    """Split [start, end] (epoch seconds) into chunk-sized windows, newest first."""
+    windows = []
+    while end > start:
+        windows.append((max(start, end - chunk), end))
+        end -= chunk
+    return windows or [(start, end)]
+
+
+async def _fetch_sessions(
+    client: "UniFiClient",
+    body: dict,
+    windows: list[tuple[int, int]],
+    site: str | None,
+    want: int = 0,
+) -> tuple[list, bool]:
+    """Fetch stat/session over windows, _SESSION_CONCURRENCY at a time.
+
+    Windows are fetched newest first; once `want` records (0 = all) are
+    collected the remaining windows are skipped. Sessions spanning a window
+    boundary are returned once. Returns (records, complete).
+    """
+    records: list = []
+    seen: set[str] = set()
+    for i in range(0, len(windows), _SESSION_CONCURRENCY):
+        batch = windows[i:i + _SESSION_CONCURRENCY]
+        results = await asyncio.gather(*(
+            client.request("POST", "stat/session", json_data={**body, "start": s, "end": e}, site=site)
+            for s, e in batch
+        ))
+        for data in results:
+            for r in data:
+                rid = r.get("_id") if isinstance(r, dict) else None
+                if rid:
+                    if rid in seen:
+                        continue
+                    seen.add(rid)
+                records.append(r)
+        if want and len(records) >= want:
+            return records, i + _SESSION_CONCURRENCY >= len(windows)
+    return records, True
+
+
+
+# ---------------------------------------------------------------------------
+# Helper: table-driven tools
+# ---------------------------------------------------------------------------
+# Most tools differ only in path and docstring. Tool modules describe them as
+# rows of a table; _register_tool_table() wraps one generic handler per kind
+# in a function carrying the tool's own name, docstring and signature, so the
+# MCP schema is the same as for a hand-written tool.
+
+
+class _ToolSpec(NamedTuple):
+    """One row of a tool table."""
+
+    kind: str  # key of _TOOL_KINDS
+    name: str  # MCP tool name
+    path: str  # API path; v2 paths start with "/" and contain {site}
+    label: str  # plural for lists, singular for CRUD, command for cmd tools
+    options: dict | None  # kind-specific, e.g. {"params": ..., "mutation": True} for cmd
+    doc: str
+
+
+_PARAM_TYPES: dict[str, type] = {"str": str, "int": int, "bool": bool, "list": list, "dict": dict}
+_REQUIRED = inspect.Parameter.empty
+
+# Shared parameter lists: (name, annotation, default)
+_LIST_PARAMS = (("site", str, ""), ("limit", int, 0), ("offset", int, 0), ("fields", str, ""))
+_REPORT_PARAMS = (("start", int, 0), ("end", int, 0), ("attrs", str, ""))
+_CONFIRM_SITE_PARAMS = (("confirm", bool, False), ("site", str, ""))
+
+
+def _v2_path(spec: _ToolSpec, site: str, id: str = "") -> str:
+    path = spec.path.replace("{site}", site or UNIFI_SITE)
+    return f"{path}/{id}" if id else path
+
+
+async def _handle_list(spec: _ToolSpec, site: str, limit: int, offset: int, fields: str) -> dict:
+    client = await _get_client()
+    data = await client.request("GET", spec.path, site=site or None)
+    total = len(data)
+    data, missing = _paginate_and_filter(data, limit, offset, fields)
+    return _format_response(data, f"Found {total} {spec.label}", missing_fields=missing)
+
+
+async def _handle_get(spec: _ToolSpec, id: str, site: str) -> dict:
+    client = await _get_client()
+    data = await client.request("GET", f"{spec.path}/{id}", site=site or None)
+    if isinstance(data, list) and len(data) == 1:
+        return _format_response(data[0])
+    return _format_response(data)
+
+
+async def _handle_create(spec: _ToolSpec, data: dict, confirm: bool, site: str) -> dict:
+    if not confirm:
+        return _format_response(
+            {"action": f"create_{spec.label}", "data": data},
+            f"DRY RUN (POST {spec.path}): Set confirm=True to execute.",
+        )
+    client = await _get_client()
+    result = await client.request("POST", spec.path, json_data=data, site=site or None)
+    return _format_response(result, f"Created {spec.label}")
+
+
+async def _handle_update(spec: _ToolSpec, id: str, data: dict, confirm: bool, site: str) -> dict:
+    if not confirm:
+        return _format_response(
+            {"action": f"update_{spec.label}", "id": id, "data": data},
+            f"DRY RUN (PUT {spec.path}/{{id}}): Set confirm=True to execute.",
+        )
+    client = await _get_client()
+    result = await client.request("PUT", f"{spec.path}/{id}", json_data=data, site=site or None)
+    return _format_response(result, f"Updated {spec.label}")
+
+
+async def _handle_delete(spec: _ToolSpec, id: str, confirm: bool, site: str) -> dict:
+    if not confirm:
+        return _format_response(
+            {"action": f"delete_{spec.label}", "id": id},
+            f"DRY RUN (DELETE {spec.path}/{{id}}): Set confirm=True to execute.",
+        )
+    client = await _get_client()
+    result = await client.request("DELETE", f"{spec.path}/{id}", site=site or None)
+    return _format_response(result, f"Deleted {spec.label}")
+
+
+async def _handle_stat(
+    spec: _ToolSpec,
+    site: str,
+    limit: int,
+    offset: int,
+    fields: str,
+    start: int = 0,
+    end: int = 0,
+    attrs: str = "",
+    macs: str = "",
+) -> dict:
+    options = spec.options or {}
+    client = await _get_client()
+    if options.get("report"):
+        data = await client.request("POST", spec.path, json_data=_report_body(start, end, attrs, macs), site=site or None)
+    elif "body" in options:
+        data = await client.request("POST", spec.path, json_data=dict(options["body"]), site=site or None)
+    else:
+        data = await client.request("GET", spec.path, site=site or None)
+    gw_note = None
+    if options.get("gateway"):
+        # Normalize trivially-empty responses (e.g. [{}] from DPI)
+        if isinstance(data, list) and all(isinstance(d, dict) and not d for d in data):
+            data = []
+        # Detect missing gateway
+        if not data:
+            health = await client.request("GET", "stat/health", site=site or None)
+            wan_status = next(
+                (h.get("status") for h in health
+                 if isinstance(h, dict) and h.get("subsystem") == "wan"),
+                "unknown",
+            )
+            if wan_status == "unknown":
+                gw_note = "No UniFi gateway detected (wan: unknown). This endpoint requires a USG, UDM, or UCG."
+    if options.get("enrich"):
+        data = await _enrich_clients(client, data, site or None)
+    total = len(data)
+    data, missing = _paginate_and_filter(data, limit, offset, fields)
+    return _format_response(data, f"Found {total} {spec.label} records", missing_fields=missing, note=gw_note)
+
+
+async def _handle_cmd(spec: _ToolSpec, confirm: bool = False, site: str = "", **args: Any) -> dict:
+    # Command parameters named "site" are exposed as target_site
+    values = {p: args["target_site" if p == "site" else p] for p, _ in spec.options["params"]}
+    if spec.options["mutation"] and not confirm:
+        return _format_response(
+            {"action": spec.name.removeprefix("unifi_"), "cmd": spec.label, **values},
+            f"DRY RUN (POST {spec.path}): Set confirm=True to execute.",
+        )
+    if "mac" in values:
+        mac_err = _validate_mac(values["mac"])
+        if mac_err:
+            return _format_response({"error": mac_err}, mac_err)
+    payload: dict[str, Any] = {"cmd": spec.label, **values}
+    client = await _get_client()
+    result = await client.request("POST", spec.path, json_data=payload, site=site or None)
+    return _format_response(result, f"Executed {spec.label}")
+
+
+async def _handle_v2_list(spec: _ToolSpec, site: str, limit: int, offset: int, fields: str) -> dict:
+    client = await _get_client()
+    data = await client.request("GET", _v2_path(spec, site))
+    if isinstance(data, list):
+        total = len(data)
+        data, missing = _paginate_and_filter(data, limit, offset, fields)
+        return _format_response(data, f"Found {total} {spec.label}", missing_fields=missing)
+    return _format_response(data)
+
+
+async def _handle_v2_create(spec: _ToolSpec, data: dict, confirm: bool, site: str) -> dict:
+    if not confirm:
+        return _format_response(
+            {"action": f"create_{spec.label}", "data": data},
+            f"DRY RUN (POST {spec.path}): Set confirm=True to execute.",
+        )
+    client = await _get_client()
+    result = await client.request("POST", _v2_path(spec, site), json_data=data)
+    return _format_response(result, f"Created {spec.label}")
+
+
+async def _handle_v2_update(spec: _ToolSpec, id: str, data: dict, confirm: bool, site: str) -> dict:
+    if not confirm:
+        return _format_response(
+            {"action": f"update_{spec.label}", "id": id, "data": data},
+            f"DRY RUN (PUT {spec.path}/{{id}}): Set confirm=True to execute.",
+        )
+    client = await _get_client()
+    result = await client.request("PUT", _v2_path(spec, site, id), json_data=data)
+    return _format_response(result, f"Updated {spec.label}")
+
+
+async def _handle_v2_delete(spec: _ToolSpec, id: str, confirm: bool, site: str) -> dict:
+    if not confirm:
+        return _format_response(
+            {"action": f"delete_{spec.label}", "id": id},
+            f"DRY RUN (DELETE {spec.path}/{{id}}): Set confirm=True to execute.",
+        )
+    client = await _get_client()
+    result = await client.request("DELETE", _v2_path(spec, site, id))
+    return _format_response(result, f"Deleted {spec.label}")
+
+
+# kind → (handler, parameters, mutating); cmd and report-stat parameters
+# depend on the row (see _tool_params)
+_TOOL_KINDS: dict[str, tuple[Any, tuple, bool]] = {
+    "list": (_handle_list, _LIST_PARAMS, False),
+    "get": (_handle_get, (("id", str, _REQUIRED), ("site", str, "")), False),
+    "create": (_handle_create, (("data", dict, _REQUIRED), *_CONFIRM_SITE_PARAMS), True),
+    "update": (_handle_update, (("id", str, _REQUIRED), ("data", dict, _REQUIRED), *_CONFIRM_SITE_PARAMS), True),
+    "delete": (_handle_delete, (("id", str, _REQUIRED), *_CONFIRM_SITE_PARAMS), True),
+    "stat": (_handle_stat, _LIST_PARAMS, False),
+    "cmd": (_handle_cmd, (), False),
+    "v2_list": (_handle_v2_list, _LIST_PARAMS, False),
+    "v2_create": (_handle_v2_create, (("data", dict, _REQUIRED), *_CONFIRM_SITE_PARAMS), True),
+    "v2_update": (_handle_v2_update, (("id", str, _REQUIRED), ("data", dict, _REQUIRED), *_CONFIRM_SITE_PARAMS), True),
+    "v2_delete": (_handle_v2_delete, (("id", str, _REQUIRED), *_CONFIRM_SITE_PARAMS), True),
+}
+
+
+def _tool_params(spec: _ToolSpec) -> tuple:
+    """The (name, annotation, default) parameters a table tool exposes."""
+    options = spec.options or {}
+    if spec.kind == "cmd":
+        params = tuple(
+            ("target_site" if p == "site" else p, _PARAM_TYPES[t], _REQUIRED) for p, t in options["params"]
+        )
+        if options["mutation"]:
+            params += (("confirm", bool, False),)
+        return params + (("site", str, ""),)
+    if options.get("report"):
+        macs = (("macs", str, ""),) if options.get("macs") else ()
+        return _REPORT_PARAMS + macs + _LIST_PARAMS
+    return _TOOL_KINDS[spec.kind][1]
+
+
+def _table_tool(spec: _ToolSpec) -> Any:
+    """Build the typed wrapper FastMCP registers for one table row.
+
+    This is the single entry point of every table-driven tool call, so
+    cross-cutting behaviour (errors today; caching or metrics later) goes here.
+    """
+    handler = _TOOL_KINDS[spec.kind][0]
+    signature = inspect.Signature(
+        [
+            inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD, default=default, annotation=annotation)
+            for name, annotation, default in _tool_params(spec)
+        ],
+        return_annotation=dict,
+    )
+
+    async def tool(*args: Any, **kwargs: Any) -> dict:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        try:
+            return await handler(spec, **bound.arguments)
+        except RuntimeError as e:
+            return _tool_error(e)
+
+    tool.__name__ = tool.__qualname__ = spec.name
+    tool.__doc__ = spec.doc
+    tool.__signature__ = signature
+    tool.__annotations__ = {p.name: p.annotation for p in signature.parameters.values()} | {"return": dict}
+    return tool
+
+
+# Parameters → (input schema, output schema) of the first FastMCP tool
+# registered with them. Later rows with the same signature pass these to
+# FunctionTool rather than have pydantic rebuild them, which is most of the
+# cost of registering a tool.
+_TABLE_TOOL_SCHEMAS: dict[tuple, tuple[dict[str, Any], dict[str, Any] | None]] = {}
+
+
+def _register_tool_table(rows: tuple) -> None:
+    """Register every row of a tool table; mutating tools honour UNIFI_READ_ONLY."""
+    for row in rows:
+        spec = _ToolSpec(*row)
+        mutating = _TOOL_KINDS[spec.kind][2] or (spec.kind == "cmd" and spec.options["mutation"])
+        if UNIFI_READ_ONLY and mutating:
+            continue
+        fn = _table_tool(spec)
+        params = _tool_params(spec)
+        schemas = _TABLE_TOOL_SCHEMAS.get(params)
+        if schemas is None:
+            tool = mcp.tool(fn)
+            _TABLE_TOOL_SCHEMAS[params] = (tool.parameters, tool.output_schema)
+        else:
+            parameters, output_schema = schemas
+            mcp.add_tool(FunctionTool(name=spec.name, description=inspect.getdoc(fn), fn=fn,
+                                      parameters=parameters, output_schema=output_schema))
+
+
 # ===========================================================================
 # Error Reporting Tool (always-on)
 # ===========================================================================
@@ -404,8850 +1366,223 @@ async def unifi_report_issue(
     )
 
 
+# ===========================================================================
+# Tool modules (generated/unifi_tools/<module>.py)
+# ===========================================================================
+
+# Module → APIs it has tools for. Each module's tools live in
+# unifi_tools/<module>.py as register_v1()/register_v2(); the file is only
+# imported once UNIFI_MODULES allows one of its APIs. "" (global, defined
+# below) is always allowed.
+_MODULE_APIS: dict[str, tuple[str, ...]] = {
+    "device": ("v1",),
+    "client": ("v1", "v2"),
+    "wifi": ("v1", "v2"),
+    "network": ("v1",),
+    "firewall": ("v1", "v2"),
+    "monitor": ("v1",),
+    "admin": ("v1",),
+    "hotspot": ("v1",),
+    "advanced": ("v1",),
+    "global": ("",),
+}
+
+# Tool modules import their shared helpers from "unifi_server"; register this
+# module under that name since `fastmcp run` imports it as "server_module".
+sys.modules.setdefault("unifi_server", sys.modules[__name__])
+
+
+# ===========================================================================
+# Global Endpoint Tools (always-on)
+# ===========================================================================
+
 
-if "device" in UNIFI_MODULES or "v1" in UNIFI_MODULES:
-    # ===========================================================================
-    # Module: device
-    # ===========================================================================
+def _register_global() -> None:
+    """Register the global endpoint tools (status, self, sites, ...)."""
+    
+    if not UNIFI_READ_ONLY:
+        @mcp.tool()
+        async def unifi_logout() -> dict:
+            """Logout.
 
-    # --- Device_config (read-only) ---
+            If this tool returns an unexpected error, call unifi_report_issue to report it.
+            """
+            try:
+                client = await _get_client()
+                data = await client.request("POST", "/api/logout")
+                return _format_response(data)
+            except RuntimeError as e:
+                return _tool_error(e)
 
     @mcp.tool()
-    async def unifi_list_device_configs(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all device_configs.
-
-        Returns device_configs from the UniFi controller.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+    async def unifi_self() -> dict:
+        """Self.
 
         If this tool returns an unexpected error, call unifi_report_issue to report it.
         """
         try:
             client = await _get_client()
-            data = await client.request("GET", "rest/device", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} device_configs", missing_fields=missing)
+            data = await client.request("GET", "/api/self")
+            # Strip ui_settings noise — it's internal controller UI state
+            if isinstance(data, list):
+                for item in data:
+                    if isinstance(item, dict):
+                        item.pop("ui_settings", None)
+            elif isinstance(data, dict):
+                data.pop("ui_settings", None)
+            return _format_response(data)
         except RuntimeError as e:
             return _tool_error(e)
 
 
-
-    # --- Element (read-only) ---
-
     @mcp.tool()
-    async def unifi_list_elements(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all elements.
-
-        Returns elements from the UniFi controller.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+    async def unifi_sites() -> dict:
+        """Sites.
 
         If this tool returns an unexpected error, call unifi_report_issue to report it.
         """
         try:
             client = await _get_client()
-            data = await client.request("GET", "rest/element", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} elements", missing_fields=missing)
+            data = await client.request("GET", "/api/self/sites")
+            return _format_response(data)
         except RuntimeError as e:
             return _tool_error(e)
 
 
-
-    # --- Virtual_device (read-only) ---
-
     @mcp.tool()
-    async def unifi_list_virtual_devices(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all virtual_devices.
-
-        Returns virtual_devices from the UniFi controller.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+    async def unifi_stat_admin() -> dict:
+        """Stat Admin.
 
         If this tool returns an unexpected error, call unifi_report_issue to report it.
         """
         try:
             client = await _get_client()
-            data = await client.request("GET", "rest/virtualdevice", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} virtual_devices", missing_fields=missing)
+            data = await client.request("GET", "/api/stat/admin")
+            return _format_response(data)
         except RuntimeError as e:
             return _tool_error(e)
 
 
-
     @mcp.tool()
-    async def unifi_list_devices(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List devices statistics.
-
-        Note: also POST with macs filter
-
-        Known fields: _uptime, adopt_ip, adopt_url, adoptable_when_upgraded, adopted, adopted_at, adopted_by_client, adoption_completed, anomalies, anon_id, antenna_table, architecture, atf_enabled, bandsteering_mode, ble_caps, board_rev, bytes, bytes-d, bytes-r, cfgversion, config_network, connect_request_ip, connect_request_port, connected_at, connection_network_id, connection_network_name, country_code, countrycode_table, credential_caps, default, detailed_states, device_id, dhcp_server_table, disabled, disconnected_at, discovered_via, displayable_version, dot1x_portctrl_enabled, downlink_lldp_macs, downlink_table, element_peer_mac, ethernet_table, external_id, fixed_ap_available, flowctrl_enabled, fw2_caps, fw3_caps, fw_caps, gateway_mac, guest-num_sta, guest-wlan-num_sta, guest_kicks, guest_token, has_eth1, has_fan, has_speaker, has_temperature, hash_id, heightInMeters, hide_ch_width, hw_caps, inform_ip, inform_url, internet, ip, ipv6, is_access_point, isolated, jumboframe_enabled, kernel_version, known_cfgversion, last_connection_network_id, last_connection_network_name, last_seen, last_uplink, led_override, led_override_color, led_override_color_brightness, link_aggregation_groups, lldp_table, locating, mac, manufacturer_id, map_id, mesh_sta_vap_enabled, meshv3_peer_mac, mgmt_network_id, min_inform_interval_seconds, model, model_in_eol, model_in_lts, model_incompatible, name, next_interval, num_sta, outdoor_mode_override, overheating, port_overrides, port_table, power_source_ctrl_enabled, prev_non_busy_state, provisioned_at, quick_scan_state, quickscan_scanning, radio_table, radio_table_stats, reboot_duration, required_version, rollupgrade, rx_bytes, rx_bytes-d, safe_for_autoupgrade, satisfaction, scan_radio_table, scanning, serial, service_mac, setup_id, shortname, site_id, slimcfg_caps, snmp_contact, snmp_location, spectrum_scanning, ssh_session_table, start_connected_millis, start_disconnected_millis, startup_timestamp, stat, state, stp_priority, stp_version, support_wifi6e, supported_afc_regions, supports_fingerprint_ml, switch_caps, sys_error_caps, sys_stats, sysid, syslog_key, system-stats, total_max_effective_power, total_max_power, total_used_power, two_phase_adopt, tx_bytes, tx_bytes-d, type, unsupported, unsupported_reason, upgradable, upgrade_duration, uplink, uplink_depth, uplink_table, uptime, user-num_sta, user-wlan-num_sta, vap_table, version, vwireEnabled, vwire_table, vwire_vap_table, wifi_caps, wifi_caps2, wlangroup_id_na, wlangroup_id_ng, x, x_aes_gcm, x_authkey, x_fingerprint, x_has_ssh_hostkey, x_ssh_hostkey_fingerprint, x_vwirekey, y
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+    async def unifi_stat_sites() -> dict:
+        """Stat Sites.
 
         If this tool returns an unexpected error, call unifi_report_issue to report it.
         """
         try:
             client = await _get_client()
-            data = await client.request("GET", "stat/device", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} devices records", missing_fields=missing)
+            data = await client.request("GET", "/api/stat/sites")
+            return _format_response(data)
         except RuntimeError as e:
             return _tool_error(e)
 
 
-
     @mcp.tool()
-    async def unifi_list_devices_basic(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List devices_basic statistics.
-
-        Known fields: adopted, disabled, in_gateway_mode, mac, model, name, state, type
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+    async def unifi_status() -> dict:
+        """Status.
+
+        No authentication required.
 
         If this tool returns an unexpected error, call unifi_report_issue to report it.
         """
         try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/device-basic", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} devices_basic records", missing_fields=missing)
+            # No auth required
+            async with httpx.AsyncClient(
+                base_url=f"https://{UNIFI_HOST}:{UNIFI_PORT}",
+                verify=UNIFI_VERIFY_SSL,
+                timeout=30.0,
+                transport=_controller_transport(),
+            ) as c:
+                resp = await c.request("GET", "/status")
+                resp.raise_for_status()
+                data = resp.json()
+            return _format_response(data)
         except RuntimeError as e:
             return _tool_error(e)
 
 
-
     if not UNIFI_READ_ONLY:
-        
         @mcp.tool()
-        async def unifi_adopt_device(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'adopt' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
+        async def unifi_system_poweroff() -> dict:
+            """System Poweroff.
 
             If this tool returns an unexpected error, call unifi_report_issue to report it.
             """
             try:
-                if not confirm:
-                    preview = {"action": "adopt_device", "cmd": "adopt"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "adopt"}
-                payload["mac"] = mac
                 client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed adopt")
+                data = await client.request("POST", "/api/system/poweroff")
+                return _format_response(data)
             except RuntimeError as e:
                 return _tool_error(e)
 
-
-
     if not UNIFI_READ_ONLY:
-        
         @mcp.tool()
-        async def unifi_restart_device(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'restart' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
+        async def unifi_system_reboot() -> dict:
+            """System Reboot.
 
             If this tool returns an unexpected error, call unifi_report_issue to report it.
             """
             try:
-                if not confirm:
-                    preview = {"action": "restart_device", "cmd": "restart"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "restart"}
-                payload["mac"] = mac
                 client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed restart")
+                data = await client.request("POST", "/api/system/reboot")
+                return _format_response(data)
             except RuntimeError as e:
                 return _tool_error(e)
 
 
+# ===========================================================================
+# Module loading (eager by default, on demand with UNIFI_TOOL_LOADING=lazy)
+# ===========================================================================
 
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_force_provision_device(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'force-provision' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "force_provision_device", "cmd": "force-provision"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "force-provision"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed force-provision")
-            except RuntimeError as e:
-                return _tool_error(e)
-
+_LOADED_MODULES: set[str] = set()
 
 
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_power_cycle_port(
-            mac: str,
-            port_idx: int,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'power-cycle' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-            Args:
-                port_idx: port_idx parameter (int).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
+def _enable_module(module: str) -> None:
+    """Register a module's tools once.
 
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "power_cycle_port", "cmd": "power-cycle"}
-                    preview["mac"] = mac
-                    preview["port_idx"] = port_idx
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "power-cycle"}
-                payload["mac"] = mac
-                payload["port_idx"] = port_idx
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed power-cycle")
-            except RuntimeError as e:
-                return _tool_error(e)
+    v1/v2 parts are only registered when UNIFI_MODULES allows them, and
+    UNIFI_READ_ONLY still applies inside each registrar. Registering from
+    within a tool call makes FastMCP send notifications/tools/list_changed.
+    """
+    if module in _LOADED_MODULES:
+        return
+    if module == "global":
+        _register_global()
+    else:
+        apis = [api for api in _MODULE_APIS[module] if module in UNIFI_MODULES or api in UNIFI_MODULES]
+        if apis:
+            tools = _import_generated(f"unifi_tools.{module}")
+            for api in apis:
+                getattr(tools, f"register_{api}")()
+    _LOADED_MODULES.add(module)
 
 
+if UNIFI_TOOL_LOADING != "lazy":
+    for _module in _MODULE_APIS:
+        _enable_module(_module)
 
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_run_speedtest(
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'speedtest' via devmgr.
 
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
+# ===========================================================================
+# Network Overview Tool (always-on, read-only)
+# ===========================================================================
 
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "run_speedtest", "cmd": "speedtest"}
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "speedtest"}
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed speedtest")
-            except RuntimeError as e:
-                return _tool_error(e)
 
+@mcp.tool()
+async def unifi_get_overview(site: str = "") -> dict:
+    """Get a concise network overview in a single call.
 
+    Returns controller version, health status, device/network/WLAN summaries,
+    client count, and active alarm count. Use this as a starting point before
+    calling detailed tools.
 
-    @mcp.tool()
-    async def unifi_get_speedtest_status(
-        site: str = "",
-    ) -> dict:
-        """Execute 'speedtest-status' via devmgr.
+    Args:
+        site: Site name (default: from env).
 
-            site: Site name override (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            payload: dict[str, Any] = {"cmd": "speedtest-status"}
-            client = await _get_client()
-            result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-            return _format_response(result, "Executed speedtest-status")
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_locate_device(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'set-locate' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "locate_device", "cmd": "set-locate"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "set-locate"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed set-locate")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_unlocate_device(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'unset-locate' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "unlocate_device", "cmd": "unset-locate"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "unset-locate"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed unset-locate")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_upgrade_device(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'upgrade' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "upgrade_device", "cmd": "upgrade"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "upgrade"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed upgrade")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_upgrade_device_external(
-            mac: str,
-            url: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'upgrade-external' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-            Args:
-                url: url parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "upgrade_device_external", "cmd": "upgrade-external"}
-                    preview["mac"] = mac
-                    preview["url"] = url
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "upgrade-external"}
-                payload["mac"] = mac
-                payload["url"] = url
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed upgrade-external")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_migrate_device(
-            mac: str,
-            inform_url: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'migrate' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-            Args:
-                inform_url: inform_url parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "migrate_device", "cmd": "migrate"}
-                    preview["mac"] = mac
-                    preview["inform_url"] = inform_url
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "migrate"}
-                payload["mac"] = mac
-                payload["inform_url"] = inform_url
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed migrate")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_cancel_migrate_device(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'cancel-migrate' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "cancel_migrate_device", "cmd": "cancel-migrate"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "cancel-migrate"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed cancel-migrate")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_spectrum_scan(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'spectrum-scan' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "spectrum_scan", "cmd": "spectrum-scan"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "spectrum-scan"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed spectrum-scan")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_rename_device(
-            mac: str,
-            name: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'rename' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-            Args:
-                name: name parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "rename_device", "cmd": "rename"}
-                    preview["mac"] = mac
-                    preview["name"] = name
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "rename"}
-                payload["mac"] = mac
-                payload["name"] = name
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed rename")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_led_override_device(
-            mac: str,
-            led_override: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'led-override' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-            Args:
-                led_override: led_override parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "led_override_device", "cmd": "led-override"}
-                    preview["mac"] = mac
-                    preview["led_override"] = led_override
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "led-override"}
-                payload["mac"] = mac
-                payload["led_override"] = led_override
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed led-override")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_disable_ap(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'disable-ap' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "disable_ap", "cmd": "disable-ap"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "disable-ap"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed disable-ap")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_upgrade_all_devices(
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'upgrade-all-devices' via devmgr.
-
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "upgrade_all_devices", "cmd": "upgrade-all-devices"}
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "upgrade-all-devices"}
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed upgrade-all-devices")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_advanced_adopt_device(
-            mac: str,
-            url: str,
-            key: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'advanced-adopt' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-            Args:
-                url: url parameter (str).
-            Args:
-                key: key parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "advanced_adopt_device", "cmd": "advanced-adopt"}
-                    preview["mac"] = mac
-                    preview["url"] = url
-                    preview["key"] = key
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "advanced-adopt"}
-                payload["mac"] = mac
-                payload["url"] = url
-                payload["key"] = key
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed advanced-adopt")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_restart_http_portal(
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'restart-http-portal' via devmgr.
-
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "restart_http_portal", "cmd": "restart-http-portal"}
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "restart-http-portal"}
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed restart-http-portal")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_enable_device(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'enable' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "enable_device", "cmd": "enable"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "enable"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed enable")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_disable_device(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'disable' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "disable_device", "cmd": "disable"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "disable"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed disable")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_cable_test(
-            mac: str,
-            port_idx: int,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'cable-test' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-            Args:
-                port_idx: port_idx parameter (int).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "cable_test", "cmd": "cable-test"}
-                    preview["mac"] = mac
-                    preview["port_idx"] = port_idx
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "cable-test"}
-                payload["mac"] = mac
-                payload["port_idx"] = port_idx
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed cable-test")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_set_inform_device(
-            mac: str,
-            inform_url: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'set-inform' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-            Args:
-                inform_url: inform_url parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "set_inform_device", "cmd": "set-inform"}
-                    preview["mac"] = mac
-                    preview["inform_url"] = inform_url
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "set-inform"}
-                payload["mac"] = mac
-                payload["inform_url"] = inform_url
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed set-inform")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_move_device(
-            mac: str,
-            target_site: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'move-device' via sitemgr.
-
-            Args:
-                mac: mac parameter (str).
-            Args:
-                target_site: Target site for the command (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "move_device", "cmd": "move-device"}
-                    preview["mac"] = mac
-                    preview["site"] = target_site
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/sitemgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "move-device"}
-                payload["mac"] = mac
-                payload["site"] = target_site
-                client = await _get_client()
-                result = await client.request("POST", "cmd/sitemgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed move-device")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_delete_device(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'delete-device' via sitemgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "delete_device", "cmd": "delete-device"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/sitemgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "delete-device"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/sitemgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed delete-device")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_reboot_cloudkey(
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'reboot-cloudkey' via system.
-
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "reboot_cloudkey", "cmd": "reboot-cloudkey"}
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/system): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "reboot-cloudkey"}
-                client = await _get_client()
-                result = await client.request("POST", "cmd/system", json_data=payload, site=site or None)
-                return _format_response(result, "Executed reboot-cloudkey")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_element_adoption(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'element-adoption' via system.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "element_adoption", "cmd": "element-adoption"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/system): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "element-adoption"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/system", json_data=payload, site=site or None)
-                return _format_response(result, "Executed element-adoption")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # ===========================================================================
-    # Special: Port Override Helper
-    # ===========================================================================
-
-    if not UNIFI_READ_ONLY:
-        @mcp.tool()
-        async def unifi_set_port_override(
-            device_id: str,
-            port_idx: int,
-            portconf_id: str = "",
-            name: str = "",
-            native_networkconf_id: str = "",
-            forward: str = "",
-            poe_mode: str = "",
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Set port override on a device (switch port configuration).
-
-            This updates a specific port on a UniFi switch device.
-
-            Args:
-                device_id: The _id of the device.
-                port_idx: Port number (1-based).
-                portconf_id: Port profile ID to apply (from rest/portconf).
-                name: Custom port name.
-                native_networkconf_id: Network ID for native VLAN.
-                forward: Forward mode ('all', 'customize', 'disabled').
-                poe_mode: PoE mode ('auto', 'off', 'pasv24', 'passthrough').
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                override: dict[str, Any] = {"port_idx": port_idx}
-                if portconf_id:
-                    override["portconf_id"] = portconf_id
-                if name:
-                    override["name"] = name
-                if native_networkconf_id:
-                    override["native_networkconf_id"] = native_networkconf_id
-                if forward:
-                    override["forward"] = forward
-                if poe_mode:
-                    override["poe_mode"] = poe_mode
-
-                if not confirm:
-                    return _format_response(
-                        {"action": "set_port_override", "device_id": device_id, "override": override},
-                        "DRY RUN (PUT rest/device/{device_id}): Set confirm=True to execute.",
-                    )
-
-                client = await _get_client()
-                # First get current device to preserve existing overrides
-                device_data = await client.request("GET", f"rest/device/{device_id}", site=site or None)
-                if isinstance(device_data, list) and device_data:
-                    device_data = device_data[0]
-
-                existing_overrides = []
-                if isinstance(device_data, dict):
-                    existing_overrides = device_data.get("port_overrides", [])
-
-                # Replace or append override for this port_idx
-                new_overrides = [o for o in existing_overrides if o.get("port_idx") != port_idx]
-                new_overrides.append(override)
-
-                result = await client.request(
-                    "PUT",
-                    f"rest/device/{device_id}",
-                    json_data={"port_overrides": new_overrides},
-                    site=site or None,
-                )
-                return _format_response(result, f"Set port override on port {port_idx}")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-if "client" in UNIFI_MODULES or "v1" in UNIFI_MODULES:
-    # ===========================================================================
-    # Module: client
-    # ===========================================================================
-
-    # --- User CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_users(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all users.
-
-        Known fields: disconnect_timestamp, first_seen, hostname, is_guest, is_wired, last_1x_identity, last_connection_network_id, last_connection_network_name, last_ip, last_radio, last_seen, last_uplink_mac, last_uplink_name, last_uplink_remote_port, mac, network_members_group_ids, oui, site_id, usergroup_id, wlanconf_id
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/user", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} users", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_user(id: str, site: str = "") -> dict:
-        """Get a single user by ID.
-
-        Args:
-            id: The _id of the user.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/user/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_user(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new user.
-
-            Args:
-                data: User configuration.
-                    Known fields: disconnect_timestamp, first_seen, hostname, is_guest, is_wired, last_1x_identity, last_connection_network_id, last_connection_network_name, last_ip, last_radio, last_seen, last_uplink_mac, last_uplink_name, last_uplink_remote_port, mac, network_members_group_ids, oui, site_id, usergroup_id, wlanconf_id
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Note: To remove a user, use unifi_forget_client with the user's MAC address. REST DELETE is not supported for the user resource.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_user", "data": data},
-                        "DRY RUN (POST rest/user): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/user", json_data=data, site=site or None)
-                return _format_response(result, "Created user")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_user(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing user.
-
-            Args:
-                id: The _id of the user to update.
-                data: Fields to update.
-                    Known fields: disconnect_timestamp, first_seen, hostname, is_guest, is_wired, last_1x_identity, last_connection_network_id, last_connection_network_name, last_ip, last_radio, last_seen, last_uplink_mac, last_uplink_name, last_uplink_remote_port, mac, network_members_group_ids, oui, site_id, usergroup_id, wlanconf_id
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Note: To remove a user, use unifi_forget_client with the user's MAC address. REST DELETE is not supported for the user resource.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_user", "id": id, "data": data},
-                        "DRY RUN (PUT rest/user/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/user/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated user")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_all_users(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all_users statistics.
-
-        Known fields: disconnect_timestamp, first_seen, hostname, is_guest, is_wired, last_1x_identity, last_connection_network_id, last_connection_network_name, last_ip, last_radio, last_seen, last_uplink_mac, last_uplink_name, last_uplink_remote_port, mac, network_members_group_ids, oui, site_id, usergroup_id, wlanconf_id
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/alluser", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} all_users records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_guests(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List guests statistics.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/guest", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} guests records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_sessions(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List sessions statistics.
-
-        Note: requires POST with {"type":"all","start":0,"end":9999999999}
-
-        Known fields: ap_mac, assoc_time, duration, gw_mac, hostname, ip, is_guest, is_wired, mac, name, o, oid, roaming_sessions, rx_bytes, satisfaction, satisfaction_avg, sw_mac, sw_port, tx_bytes
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("POST", "stat/session", json_data={'type': 'all', 'start': 0, 'end': 9999999999}, site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} sessions records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_clients(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List clients statistics.
-
-        Note: Wireless clients are automatically enriched with network_name (the VLAN/network name from networkconf, resolved via essid → wlanconf). No manual join needed — just use fields=essid,network_name to see SSID-to-VLAN mappings.
-
-        Known fields: _is_guest_by_uap, _is_guest_by_usw, _last_seen_by_uap, _last_seen_by_usw, _uptime_by_uap, _uptime_by_usw, anomalies, anon_client_id, ap_mac, assoc_time, authorized, bssid, bytes-r, ccq, channel, channelWidth, channel_width, detailed_states, dhcpend_time, disconnect_timestamp, eagerly_discovered, essid, first_seen, hostname, hostname_source, idletime, ip, is_11r, is_guest, is_mlo, is_wired, last_1x_identity, last_connection_network_id, last_connection_network_name, last_ip, last_radio, last_seen, last_uplink_mac, last_uplink_name, last_uplink_remote_port, latest_assoc_time, mac, network, network_id, network_members_group_ids, noise, nss, oui, powersave_enabled, qos_policy_applied, radio, radio_name, radio_proto, roam_count, rssi, rx_bytes, rx_bytes-r, rx_packets, rx_rate, satisfaction, satisfaction_avg, satisfaction_now, satisfaction_real, satisfaction_reason, signal, site_id, sw_depth, sw_mac, sw_port, tx_bytes, tx_bytes-r, tx_mcs, tx_packets, tx_power, tx_rate, tx_retries, tx_retry_burst_count, uptime, user_group_id_computed, user_id, usergroup_id, wifi_tx_attempts, wifi_tx_dropped, wifi_tx_retries_percentage, wired-rx_bytes, wired-rx_bytes-r, wired-rx_packets, wired-tx_bytes, wired-tx_bytes-r, wired-tx_packets, wired_rate_mbps, wlanconf_id
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/sta", site=site or None)
-            data = await _enrich_clients(client, data, site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} clients records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_block_client(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'block-sta' via stamgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "block_client", "cmd": "block-sta"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/stamgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "block-sta"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/stamgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed block-sta")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_unblock_client(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'unblock-sta' via stamgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "unblock_client", "cmd": "unblock-sta"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/stamgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "unblock-sta"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/stamgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed unblock-sta")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_kick_client(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'kick-sta' via stamgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "kick_client", "cmd": "kick-sta"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/stamgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "kick-sta"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/stamgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed kick-sta")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_forget_client(
-            macs: list,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'forget-sta' via stamgr.
-
-            Args:
-                macs: macs parameter (list).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "forget_client", "cmd": "forget-sta"}
-                    preview["macs"] = macs
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/stamgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "forget-sta"}
-                payload["macs"] = macs
-                client = await _get_client()
-                result = await client.request("POST", "cmd/stamgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed forget-sta")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_unauthorize_guest(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'unauthorize-guest' via stamgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "unauthorize_guest", "cmd": "unauthorize-guest"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/stamgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "unauthorize-guest"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/stamgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed unauthorize-guest")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_authorize_guest(
-            mac: str,
-            minutes: int,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'authorize-guest' via stamgr.
-
-            Args:
-                mac: mac parameter (str).
-            Args:
-                minutes: minutes parameter (int).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "authorize_guest", "cmd": "authorize-guest"}
-                    preview["mac"] = mac
-                    preview["minutes"] = minutes
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/stamgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "authorize-guest"}
-                payload["mac"] = mac
-                payload["minutes"] = minutes
-                client = await _get_client()
-                result = await client.request("POST", "cmd/stamgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed authorize-guest")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_reconnect_client(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'reconnect-sta' via stamgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "reconnect_client", "cmd": "reconnect-sta"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/stamgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "reconnect-sta"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/stamgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed reconnect-sta")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-if "client" in UNIFI_MODULES or "v2" in UNIFI_MODULES:
-    
-    # --- v2: Active_client ---
-
-    @mcp.tool()
-    async def unifi_list_active_clients(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all active_clients (v2 API).
-
-        Known fields: anomalies, ap_mac, assoc_time, authorized, blocked, bssid, ccq, channel, channel_width, detailed_states, dhcpend_time, display_name, essid, fingerprint, first_seen, hostname, id, idletime, ip, is_allowed_in_visual_programming, is_guest, is_mlo, is_wired, last_connection_network_id, last_connection_network_name, last_ip, last_radio, last_seen, last_uplink_mac, last_uplink_name, last_uplink_remote_port, latest_assoc_time, local_dns_record_enabled, mac, mimo, network_id, network_members_group_ids, network_name, noise, noted, oui, powersave_enabled, radio, radio_name, radio_proto, rate_imbalance, roam_count, rssi, rx_bytes, rx_bytes-r, rx_packets, rx_rate, signal, site_id, status, sw_port, tags, tx_bytes, tx_bytes-r, tx_mcs_index, tx_packets, tx_rate, type, unifi_device, uplink_mac, uptime, use_fixedip, user_id, usergroup_id, virtual_network_override_enabled, wifi_experience_average, wifi_experience_score, wifi_tx_attempts, wifi_tx_retries_percentage, wired_rate_mbps, wlanconf_id
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            effective_site = site or UNIFI_SITE
-            data = await client.request("GET", "/v2/api/site/{site}/clients/active".replace("{site}", effective_site))
-            if isinstance(data, list):
-                total = len(data)
-                data, missing = _paginate_and_filter(data, limit, offset, fields)
-                return _format_response(data, f"Found {total} active_clients", missing_fields=missing)
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    # --- v2: Client_history ---
-
-    @mcp.tool()
-    async def unifi_list_clients_history(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all clients_history (v2 API).
-
-        Known fields: blocked, channel, display_name, fingerprint, first_seen, hostname, id, is_allowed_in_visual_programming, is_guest, is_mlo, is_wired, last_connection_network_id, last_connection_network_name, last_ip, last_radio, last_seen, last_uplink_mac, last_uplink_name, last_uplink_remote_port, local_dns_record_enabled, mac, network_members_group_ids, noted, oui, site_id, status, sw_port, tags, type, unifi_device, uplink_mac, use_fixedip, user_id, usergroup_id, virtual_network_override_enabled, wired_rate_mbps, wlanconf_id
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            effective_site = site or UNIFI_SITE
-            data = await client.request("GET", "/v2/api/site/{site}/clients/history".replace("{site}", effective_site))
-            if isinstance(data, list):
-                total = len(data)
-                data, missing = _paginate_and_filter(data, limit, offset, fields)
-                return _format_response(data, f"Found {total} clients_history", missing_fields=missing)
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-if "wifi" in UNIFI_MODULES or "v1" in UNIFI_MODULES:
-    # ===========================================================================
-    # Module: wifi
-    # ===========================================================================
-
-    # --- Channel_plan (read-only) ---
-
-    @mcp.tool()
-    async def unifi_list_channel_plans(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all channel_plans.
-
-        Returns channel_plans from the UniFi controller.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/channelplan", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} channel_plans", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    # --- Wlan CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_wlans(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all wlans.
-
-        Known fields: ap_group_ids, ap_group_mode, b_supported, bc_filter_enabled, bc_filter_list, bss_transition, dtim_6e, dtim_mode, dtim_na, dtim_ng, enabled, enhanced_iot, external_id, fast_roaming_enabled, group_rekey, hide_ssid, hotspot2conf_enabled, iapp_enabled, is_guest, l2_isolation, mac_filter_enabled, mac_filter_list, mac_filter_policy, mcastenhance_enabled, mdns_proxy_custom, mdns_proxy_mode, minrate_na_advertising_rates, minrate_na_data_rate_kbps, minrate_na_enabled, minrate_ng_advertising_rates, minrate_ng_data_rate_kbps, minrate_ng_enabled, minrate_setting_preference, mlo_enabled, name, networkconf_id, no2ghz_oui, optimize_iot_wifi_connectivity, passphrase_autogenerated, pmf_mode, private_preshared_keys, private_preshared_keys_enabled, proxy_arp, radius_das_enabled, radius_mac_auth_enabled, radius_macacl_empty_password, radius_macacl_format, sae_groups, sae_psk, schedule, schedule_with_duration, security, setting_preference, site_id, uapsd_enabled, usergroup_id, wep_idx, wlan_band, wlan_bands, wpa3_enhanced_192, wpa3_fast_roaming, wpa3_support, wpa3_transition, wpa_enc, wpa_mode, x_iapp_key, x_passphrase
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/wlanconf", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} wlans", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_wlan(id: str, site: str = "") -> dict:
-        """Get a single wlan by ID.
-
-        Args:
-            id: The _id of the wlan.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/wlanconf/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_wlan(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new wlan.
-
-            Args:
-                data: Wlan configuration.
-                    Known fields: ap_group_ids, ap_group_mode, b_supported, bc_filter_enabled, bc_filter_list, bss_transition, dtim_6e, dtim_mode, dtim_na, dtim_ng, enabled, enhanced_iot, external_id, fast_roaming_enabled, group_rekey, hide_ssid, hotspot2conf_enabled, iapp_enabled, is_guest, l2_isolation, mac_filter_enabled, mac_filter_list, mac_filter_policy, mcastenhance_enabled, mdns_proxy_custom, mdns_proxy_mode, minrate_na_advertising_rates, minrate_na_data_rate_kbps, minrate_na_enabled, minrate_ng_advertising_rates, minrate_ng_data_rate_kbps, minrate_ng_enabled, minrate_setting_preference, mlo_enabled, name, networkconf_id, no2ghz_oui, optimize_iot_wifi_connectivity, passphrase_autogenerated, pmf_mode, private_preshared_keys, private_preshared_keys_enabled, proxy_arp, radius_das_enabled, radius_mac_auth_enabled, radius_macacl_empty_password, radius_macacl_format, sae_groups, sae_psk, schedule, schedule_with_duration, security, setting_preference, site_id, uapsd_enabled, usergroup_id, wep_idx, wlan_band, wlan_bands, wpa3_enhanced_192, wpa3_fast_roaming, wpa3_support, wpa3_transition, wpa_enc, wpa_mode, x_iapp_key, x_passphrase
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Tip: Requires a network (networkconf_id from unifi_list_networks) and at least one adopted AP.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_wlan", "data": data},
-                        "DRY RUN (POST rest/wlanconf): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/wlanconf", json_data=data, site=site or None)
-                return _format_response(result, "Created wlan")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_wlan(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing wlan.
-
-            Args:
-                id: The _id of the wlan to update.
-                data: Fields to update.
-                    Known fields: ap_group_ids, ap_group_mode, b_supported, bc_filter_enabled, bc_filter_list, bss_transition, dtim_6e, dtim_mode, dtim_na, dtim_ng, enabled, enhanced_iot, external_id, fast_roaming_enabled, group_rekey, hide_ssid, hotspot2conf_enabled, iapp_enabled, is_guest, l2_isolation, mac_filter_enabled, mac_filter_list, mac_filter_policy, mcastenhance_enabled, mdns_proxy_custom, mdns_proxy_mode, minrate_na_advertising_rates, minrate_na_data_rate_kbps, minrate_na_enabled, minrate_ng_advertising_rates, minrate_ng_data_rate_kbps, minrate_ng_enabled, minrate_setting_preference, mlo_enabled, name, networkconf_id, no2ghz_oui, optimize_iot_wifi_connectivity, passphrase_autogenerated, pmf_mode, private_preshared_keys, private_preshared_keys_enabled, proxy_arp, radius_das_enabled, radius_mac_auth_enabled, radius_macacl_empty_password, radius_macacl_format, sae_groups, sae_psk, schedule, schedule_with_duration, security, setting_preference, site_id, uapsd_enabled, usergroup_id, wep_idx, wlan_band, wlan_bands, wpa3_enhanced_192, wpa3_fast_roaming, wpa3_support, wpa3_transition, wpa_enc, wpa_mode, x_iapp_key, x_passphrase
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Tip: Requires a network (networkconf_id from unifi_list_networks) and at least one adopted AP.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_wlan", "id": id, "data": data},
-                        "DRY RUN (PUT rest/wlanconf/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/wlanconf/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated wlan")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_wlan(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a wlan.
-
-            Args:
-                id: The _id of the wlan to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_wlan", "id": id},
-                        "DRY RUN (DELETE rest/wlanconf/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/wlanconf/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted wlan")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Wlan_group CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_wlan_groups(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all wlan_groups.
-
-        Key fields: name (str)
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/wlangroup", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} wlan_groups", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_wlan_group(id: str, site: str = "") -> dict:
-        """Get a single wlan_group by ID.
-
-        Args:
-            id: The _id of the wlan_group.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/wlangroup/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_wlan_group(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new wlan_group.
-
-            Args:
-                data: Wlan_group configuration.
-                    Fields: name (str)
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_wlan_group", "data": data},
-                        "DRY RUN (POST rest/wlangroup): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/wlangroup", json_data=data, site=site or None)
-                return _format_response(result, "Created wlan_group")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_wlan_group(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing wlan_group.
-
-            Args:
-                id: The _id of the wlan_group to update.
-                data: Fields to update.
-                    Fields: name (str)
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_wlan_group", "id": id, "data": data},
-                        "DRY RUN (PUT rest/wlangroup/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/wlangroup/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated wlan_group")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_wlan_group(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a wlan_group.
-
-            Args:
-                id: The _id of the wlan_group to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_wlan_group", "id": id},
-                        "DRY RUN (DELETE rest/wlangroup/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/wlangroup/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted wlan_group")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_country_codes(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List country_codes statistics.
-
-        Key fields: code, key, name
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/ccode", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} country_codes records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_current_channels(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List current_channels statistics.
-
-        Key fields: afc, channels_6e, channels_6e_160, channels_6e_320, channels_6e_40
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/current-channel", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} current_channels records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_spectrum_scans(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List spectrum_scans statistics.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/spectrum-scan", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} spectrum_scans records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-if "wifi" in UNIFI_MODULES or "v2" in UNIFI_MODULES:
-    
-    # --- v2: Ap_group ---
-
-    @mcp.tool()
-    async def unifi_list_ap_groups(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all ap_groups (v2 API).
-
-        Key fields: device_macs (list), for_wlanconf (bool), name (str)
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            effective_site = site or UNIFI_SITE
-            data = await client.request("GET", "/v2/api/site/{site}/apgroups".replace("{site}", effective_site))
-            if isinstance(data, list):
-                total = len(data)
-                data, missing = _paginate_and_filter(data, limit, offset, fields)
-                return _format_response(data, f"Found {total} ap_groups", missing_fields=missing)
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-if "network" in UNIFI_MODULES or "v1" in UNIFI_MODULES:
-    # ===========================================================================
-    # Module: network
-    # ===========================================================================
-
-    # --- Network CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_networks(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all networks.
-
-        Key fields: ipv6_interface_type (str: "none"), ipv6_ra_priority (str: "high"), ipv6_setting_preference (str: "auto"), networkgroup (str: "LAN"), purpose (str: "corporate"), auto_scale_enabled (bool), dhcpd_enabled (bool), dhcpd_start (str)
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/networkconf", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} networks", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_network(id: str, site: str = "") -> dict:
-        """Get a single network by ID.
-
-        Args:
-            id: The _id of the network.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/networkconf/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_network(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new network.
-
-            Args:
-                data: Network configuration.
-                    Fields: ipv6_interface_type (str: "none"), ipv6_ra_priority (str: "high"), ipv6_setting_preference (str: "auto"), networkgroup (str: "LAN"), purpose (str: "corporate"), auto_scale_enabled (bool), dhcpd_enabled (bool), dhcpd_start (str), dhcpd_stop (str), dhcpdv6_dns_auto (bool)
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Tip: Use this network's _id as native_networkconf_id in port profiles or networkconf_id in WLANs.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_network", "data": data},
-                        "DRY RUN (POST rest/networkconf): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/networkconf", json_data=data, site=site or None)
-                return _format_response(result, "Created network")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_network(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing network.
-
-            Args:
-                id: The _id of the network to update.
-                data: Fields to update.
-                    Fields: ipv6_interface_type (str: "none"), ipv6_ra_priority (str: "high"), ipv6_setting_preference (str: "auto"), networkgroup (str: "LAN"), purpose (str: "corporate"), auto_scale_enabled (bool), dhcpd_enabled (bool), dhcpd_start (str), dhcpd_stop (str), dhcpdv6_dns_auto (bool)
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Tip: Use this network's _id as native_networkconf_id in port profiles or networkconf_id in WLANs.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_network", "id": id, "data": data},
-                        "DRY RUN (PUT rest/networkconf/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/networkconf/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated network")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_network(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a network.
-
-            Args:
-                id: The _id of the network to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_network", "id": id},
-                        "DRY RUN (DELETE rest/networkconf/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/networkconf/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted network")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Port_profile CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_port_profiles(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all port_profiles.
-
-        Known fields: autoneg, dot1x_ctrl, dot1x_idle_timeout, egress_rate_limit_kbps, egress_rate_limit_kbps_enabled, excluded_networkconf_ids, forward, isolation, lldpmed_enabled, lldpmed_notify_enabled, name, native_networkconf_id, op_mode, poe_mode, setting_preference, site_id, stormctrl_bcast_enabled, stormctrl_bcast_rate, stormctrl_mcast_enabled, stormctrl_mcast_rate, stormctrl_ucast_enabled, stormctrl_ucast_rate, stp_port_mode, tagged_vlan_mgmt, voice_networkconf_id
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/portconf", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} port_profiles", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_port_profile(id: str, site: str = "") -> dict:
-        """Get a single port_profile by ID.
-
-        Args:
-            id: The _id of the port_profile.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/portconf/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_port_profile(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new port_profile.
-
-            Args:
-                data: Port_profile configuration.
-                    Known fields: autoneg, dot1x_ctrl, dot1x_idle_timeout, egress_rate_limit_kbps, egress_rate_limit_kbps_enabled, excluded_networkconf_ids, forward, isolation, lldpmed_enabled, lldpmed_notify_enabled, name, native_networkconf_id, op_mode, poe_mode, setting_preference, site_id, stormctrl_bcast_enabled, stormctrl_bcast_rate, stormctrl_mcast_enabled, stormctrl_mcast_rate, stormctrl_ucast_enabled, stormctrl_ucast_rate, stp_port_mode, tagged_vlan_mgmt, voice_networkconf_id
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Tip: Apply this profile to switch ports via unifi_set_port_override with portconf_id.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_port_profile", "data": data},
-                        "DRY RUN (POST rest/portconf): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/portconf", json_data=data, site=site or None)
-                return _format_response(result, "Created port_profile")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_port_profile(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing port_profile.
-
-            Args:
-                id: The _id of the port_profile to update.
-                data: Fields to update.
-                    Known fields: autoneg, dot1x_ctrl, dot1x_idle_timeout, egress_rate_limit_kbps, egress_rate_limit_kbps_enabled, excluded_networkconf_ids, forward, isolation, lldpmed_enabled, lldpmed_notify_enabled, name, native_networkconf_id, op_mode, poe_mode, setting_preference, site_id, stormctrl_bcast_enabled, stormctrl_bcast_rate, stormctrl_mcast_enabled, stormctrl_mcast_rate, stormctrl_ucast_enabled, stormctrl_ucast_rate, stp_port_mode, tagged_vlan_mgmt, voice_networkconf_id
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Tip: Apply this profile to switch ports via unifi_set_port_override with portconf_id.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_port_profile", "id": id, "data": data},
-                        "DRY RUN (PUT rest/portconf/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/portconf/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated port_profile")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_port_profile(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a port_profile.
-
-            Args:
-                id: The _id of the port_profile to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_port_profile", "id": id},
-                        "DRY RUN (DELETE rest/portconf/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/portconf/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted port_profile")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-if "firewall" in UNIFI_MODULES or "v1" in UNIFI_MODULES:
-    # ===========================================================================
-    # Module: firewall
-    # ===========================================================================
-
-    # --- Dhcp_option CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_dhcp_options(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all dhcp_options.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/dhcpoption", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} dhcp_options", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_dhcp_option(id: str, site: str = "") -> dict:
-        """Get a single dhcp_option by ID.
-
-        Args:
-            id: The _id of the dhcp_option.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/dhcpoption/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_dhcp_option(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new dhcp_option.
-
-            Args:
-                data: Dhcp_option configuration.
-                    Required: name (str), code (int, DHCP option number 7-254 excluding reserved: 15,42,43,44,51,66,67,252), value (str). Note: May require a DHCP-enabled network with gateway device.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_dhcp_option", "data": data},
-                        "DRY RUN (POST rest/dhcpoption): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/dhcpoption", json_data=data, site=site or None)
-                return _format_response(result, "Created dhcp_option")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_dhcp_option(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing dhcp_option.
-
-            Args:
-                id: The _id of the dhcp_option to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_dhcp_option", "id": id, "data": data},
-                        "DRY RUN (PUT rest/dhcpoption/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/dhcpoption/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated dhcp_option")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_dhcp_option(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a dhcp_option.
-
-            Args:
-                id: The _id of the dhcp_option to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_dhcp_option", "id": id},
-                        "DRY RUN (DELETE rest/dhcpoption/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/dhcpoption/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted dhcp_option")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Dns_record CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_dns_records(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all dns_records.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/dnsrecord", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} dns_records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_dns_record(id: str, site: str = "") -> dict:
-        """Get a single dns_record by ID.
-
-        Args:
-            id: The _id of the dns_record.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/dnsrecord/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_dns_record(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new dns_record.
-
-            Args:
-                data: Dns_record configuration.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_dns_record", "data": data},
-                        "DRY RUN (POST rest/dnsrecord): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/dnsrecord", json_data=data, site=site or None)
-                return _format_response(result, "Created dns_record")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_dns_record(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing dns_record.
-
-            Args:
-                id: The _id of the dns_record to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_dns_record", "id": id, "data": data},
-                        "DRY RUN (PUT rest/dnsrecord/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/dnsrecord/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated dns_record")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_dns_record(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a dns_record.
-
-            Args:
-                id: The _id of the dns_record to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_dns_record", "id": id},
-                        "DRY RUN (DELETE rest/dnsrecord/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/dnsrecord/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted dns_record")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Dynamic_dns CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_dynamic_dns_entries(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all dynamic_dns_entries.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/dynamicdns", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} dynamic_dns_entries", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_dynamic_dns(id: str, site: str = "") -> dict:
-        """Get a single dynamic_dns by ID.
-
-        Args:
-            id: The _id of the dynamic_dns.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/dynamicdns/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_dynamic_dns(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new dynamic_dns.
-
-            Args:
-                data: Dynamic_dns configuration.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_dynamic_dns", "data": data},
-                        "DRY RUN (POST rest/dynamicdns): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/dynamicdns", json_data=data, site=site or None)
-                return _format_response(result, "Created dynamic_dns")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_dynamic_dns(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing dynamic_dns.
-
-            Args:
-                id: The _id of the dynamic_dns to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_dynamic_dns", "id": id, "data": data},
-                        "DRY RUN (PUT rest/dynamicdns/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/dynamicdns/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated dynamic_dns")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_dynamic_dns(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a dynamic_dns.
-
-            Args:
-                id: The _id of the dynamic_dns to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_dynamic_dns", "id": id},
-                        "DRY RUN (DELETE rest/dynamicdns/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/dynamicdns/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted dynamic_dns")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Firewall_group CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_firewall_groups(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all firewall_groups.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/firewallgroup", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} firewall_groups", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_firewall_group(id: str, site: str = "") -> dict:
-        """Get a single firewall_group by ID.
-
-        Args:
-            id: The _id of the firewall_group.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/firewallgroup/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_firewall_group(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new firewall_group.
-
-            Args:
-                data: Firewall_group configuration.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Tip: Reference this group's _id in src_firewallgroup_ids or dst_firewallgroup_ids when creating firewall rules.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_firewall_group", "data": data},
-                        "DRY RUN (POST rest/firewallgroup): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/firewallgroup", json_data=data, site=site or None)
-                return _format_response(result, "Created firewall_group")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_firewall_group(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing firewall_group.
-
-            Args:
-                id: The _id of the firewall_group to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Tip: Reference this group's _id in src_firewallgroup_ids or dst_firewallgroup_ids when creating firewall rules.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_firewall_group", "id": id, "data": data},
-                        "DRY RUN (PUT rest/firewallgroup/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/firewallgroup/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated firewall_group")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_firewall_group(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a firewall_group.
-
-            Args:
-                id: The _id of the firewall_group to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_firewall_group", "id": id},
-                        "DRY RUN (DELETE rest/firewallgroup/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/firewallgroup/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted firewall_group")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Firewall_rule CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_firewall_rules(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all firewall_rules.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/firewallrule", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} firewall_rules", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_firewall_rule(id: str, site: str = "") -> dict:
-        """Get a single firewall_rule by ID.
-
-        Args:
-            id: The _id of the firewall_rule.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/firewallrule/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_firewall_rule(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new firewall_rule.
-
-            Args:
-                data: Firewall_rule configuration.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Tip: Create firewall groups first (unifi_create_firewall_group) to use in src/dst_firewallgroup_ids.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_firewall_rule", "data": data},
-                        "DRY RUN (POST rest/firewallrule): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/firewallrule", json_data=data, site=site or None)
-                return _format_response(result, "Created firewall_rule")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_firewall_rule(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing firewall_rule.
-
-            Args:
-                id: The _id of the firewall_rule to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Tip: Create firewall groups first (unifi_create_firewall_group) to use in src/dst_firewallgroup_ids.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_firewall_rule", "id": id, "data": data},
-                        "DRY RUN (PUT rest/firewallrule/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/firewallrule/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated firewall_rule")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_firewall_rule(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a firewall_rule.
-
-            Args:
-                id: The _id of the firewall_rule to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_firewall_rule", "id": id},
-                        "DRY RUN (DELETE rest/firewallrule/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/firewallrule/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted firewall_rule")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Port_forward CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_port_forwards(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all port_forwards.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/portforward", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} port_forwards", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_port_forward(id: str, site: str = "") -> dict:
-        """Get a single port_forward by ID.
-
-        Args:
-            id: The _id of the port_forward.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/portforward/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_port_forward(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new port_forward.
-
-            Args:
-                data: Port_forward configuration.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Tip: Ensure the destination IP (fwd) is a static address or DHCP reservation on your network.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_port_forward", "data": data},
-                        "DRY RUN (POST rest/portforward): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/portforward", json_data=data, site=site or None)
-                return _format_response(result, "Created port_forward")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_port_forward(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing port_forward.
-
-            Args:
-                id: The _id of the port_forward to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Tip: Ensure the destination IP (fwd) is a static address or DHCP reservation on your network.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_port_forward", "id": id, "data": data},
-                        "DRY RUN (PUT rest/portforward/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/portforward/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated port_forward")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_port_forward(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a port_forward.
-
-            Args:
-                id: The _id of the port_forward to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_port_forward", "id": id},
-                        "DRY RUN (DELETE rest/portforward/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/portforward/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted port_forward")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Route CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_routes(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all routes.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/routing", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} routes", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_route(id: str, site: str = "") -> dict:
-        """Get a single route by ID.
-
-        Args:
-            id: The _id of the route.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/routing/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_route(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new route.
-
-            Args:
-                data: Route configuration.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_route", "data": data},
-                        "DRY RUN (POST rest/routing): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/routing", json_data=data, site=site or None)
-                return _format_response(result, "Created route")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_route(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing route.
-
-            Args:
-                id: The _id of the route to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_route", "id": id, "data": data},
-                        "DRY RUN (PUT rest/routing/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/routing/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated route")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_route(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a route.
-
-            Args:
-                id: The _id of the route to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_route", "id": id},
-                        "DRY RUN (DELETE rest/routing/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/routing/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted route")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-if "firewall" in UNIFI_MODULES or "v2" in UNIFI_MODULES:
-    
-    # --- v2: Firewall_policy ---
-
-    @mcp.tool()
-    async def unifi_list_firewall_policies(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all firewall_policies (v2 API).
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            effective_site = site or UNIFI_SITE
-            data = await client.request("GET", "/v2/api/site/{site}/firewall-policies".replace("{site}", effective_site))
-            if isinstance(data, list):
-                total = len(data)
-                data, missing = _paginate_and_filter(data, limit, offset, fields)
-                return _format_response(data, f"Found {total} firewall_policies", missing_fields=missing)
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_firewall_policy(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new firewall_policy (v2 API).
-
-            Args:
-                data: Firewall_policy configuration.
-                    Required: action (str), ipVersion (str: 'V4'|'V6'), source (obj with zoneId from unifi_list_firewall_zones), destination (obj with zoneId from unifi_list_firewall_zones), schedule (obj with mode, e.g. {'mode': 'ALWAYS'}). Note: Requires firewall zones which are created when a gateway device is adopted.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_firewall_policy", "data": data},
-                        "DRY RUN (POST /v2/api/site/{site}/firewall-policies): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                effective_site = site or UNIFI_SITE
-                result = await client.request("POST", "/v2/api/site/{site}/firewall-policies".replace("{site}", effective_site), json_data=data)
-                return _format_response(result, "Created firewall_policy")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_firewall_policy(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update a firewall_policy (v2 API).
-
-            Args:
-                id: The ID of the firewall_policy to update.
-                data: The FULL firewall_policy object with your changes applied.
-                    v2 API requires sending the complete object, not just changed fields.
-                    First GET the current object, modify the fields you want, then send the full object.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_firewall_policy", "id": id, "data": data},
-                        "DRY RUN (PUT /v2/api/site/{site}/firewall-policies/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                effective_site = site or UNIFI_SITE
-                result = await client.request("PUT", "/v2/api/site/{site}/firewall-policies/{id}".replace("{site}", effective_site).format(id=id), json_data=data)
-                return _format_response(result, "Updated firewall_policy")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_firewall_policy(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a firewall_policy (v2 API).
-
-            Args:
-                id: The ID of the firewall_policy to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_firewall_policy", "id": id},
-                        "DRY RUN (DELETE /v2/api/site/{site}/firewall-policies/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                effective_site = site or UNIFI_SITE
-                result = await client.request("DELETE", "/v2/api/site/{site}/firewall-policies/{id}".replace("{site}", effective_site).format(id=id))
-                return _format_response(result, "Deleted firewall_policy")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- v2: Firewall_zone ---
-
-    @mcp.tool()
-    async def unifi_list_firewall_zones(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all firewall_zones (v2 API).
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            effective_site = site or UNIFI_SITE
-            data = await client.request("GET", "/v2/api/site/{site}/firewall/zone".replace("{site}", effective_site))
-            if isinstance(data, list):
-                total = len(data)
-                data, missing = _paginate_and_filter(data, limit, offset, fields)
-                return _format_response(data, f"Found {total} firewall_zones", missing_fields=missing)
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_update_firewall_zone(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update a firewall_zone (v2 API).
-
-            Args:
-                id: The ID of the firewall_zone to update.
-                data: The FULL firewall_zone object with your changes applied.
-                    v2 API requires sending the complete object, not just changed fields.
-                    First GET the current object, modify the fields you want, then send the full object.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_firewall_zone", "id": id, "data": data},
-                        "DRY RUN (PUT /v2/api/site/{site}/firewall/zone/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                effective_site = site or UNIFI_SITE
-                result = await client.request("PUT", "/v2/api/site/{site}/firewall/zone/{id}".replace("{site}", effective_site).format(id=id), json_data=data)
-                return _format_response(result, "Updated firewall_zone")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- v2: Traffic_rule ---
-
-    @mcp.tool()
-    async def unifi_list_traffic_rules(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all traffic_rules (v2 API).
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            effective_site = site or UNIFI_SITE
-            data = await client.request("GET", "/v2/api/site/{site}/trafficrules".replace("{site}", effective_site))
-            if isinstance(data, list):
-                total = len(data)
-                data, missing = _paginate_and_filter(data, limit, offset, fields)
-                return _format_response(data, f"Found {total} traffic_rules", missing_fields=missing)
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_traffic_rule(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new traffic_rule (v2 API).
-
-            Args:
-                data: Traffic_rule configuration.
-                    Required: action (str: 'BLOCK'|'ALLOW'), enabled (bool), matching_target (str: 'INTERNET'|'LOCAL_NETWORK'), target_devices (list of {type: 'ALL_CLIENTS'|'CLIENT'|'NETWORK', client_mac/network_id}), network_id (str, _id from unifi_list_networks)
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_traffic_rule", "data": data},
-                        "DRY RUN (POST /v2/api/site/{site}/trafficrules): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                effective_site = site or UNIFI_SITE
-                result = await client.request("POST", "/v2/api/site/{site}/trafficrules".replace("{site}", effective_site), json_data=data)
-                return _format_response(result, "Created traffic_rule")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_traffic_rule(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update a traffic_rule (v2 API).
-
-            Args:
-                id: The ID of the traffic_rule to update.
-                data: The FULL traffic_rule object with your changes applied.
-                    v2 API requires sending the complete object, not just changed fields.
-                    First GET the current object, modify the fields you want, then send the full object.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_traffic_rule", "id": id, "data": data},
-                        "DRY RUN (PUT /v2/api/site/{site}/trafficrules/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                effective_site = site or UNIFI_SITE
-                result = await client.request("PUT", "/v2/api/site/{site}/trafficrules/{id}".replace("{site}", effective_site).format(id=id), json_data=data)
-                return _format_response(result, "Updated traffic_rule")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_traffic_rule(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a traffic_rule (v2 API).
-
-            Args:
-                id: The ID of the traffic_rule to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_traffic_rule", "id": id},
-                        "DRY RUN (DELETE /v2/api/site/{site}/trafficrules/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                effective_site = site or UNIFI_SITE
-                result = await client.request("DELETE", "/v2/api/site/{site}/trafficrules/{id}".replace("{site}", effective_site).format(id=id))
-                return _format_response(result, "Deleted traffic_rule")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- v2: Traffic_route ---
-
-    @mcp.tool()
-    async def unifi_list_traffic_routes(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all traffic_routes (v2 API).
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            effective_site = site or UNIFI_SITE
-            data = await client.request("GET", "/v2/api/site/{site}/trafficroutes".replace("{site}", effective_site))
-            if isinstance(data, list):
-                total = len(data)
-                data, missing = _paginate_and_filter(data, limit, offset, fields)
-                return _format_response(data, f"Found {total} traffic_routes", missing_fields=missing)
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_update_traffic_route(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update a traffic_route (v2 API).
-
-            Args:
-                id: The ID of the traffic_route to update.
-                data: The FULL traffic_route object with your changes applied.
-                    v2 API requires sending the complete object, not just changed fields.
-                    First GET the current object, modify the fields you want, then send the full object.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_traffic_route", "id": id, "data": data},
-                        "DRY RUN (PUT /v2/api/site/{site}/trafficroutes/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                effective_site = site or UNIFI_SITE
-                result = await client.request("PUT", "/v2/api/site/{site}/trafficroutes/{id}".replace("{site}", effective_site).format(id=id), json_data=data)
-                return _format_response(result, "Updated traffic_route")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-if "monitor" in UNIFI_MODULES or "v1" in UNIFI_MODULES:
-    # ===========================================================================
-    # Module: monitor
-    # ===========================================================================
-
-    # --- Alarm (read-only) ---
-
-    @mcp.tool()
-    async def unifi_list_alarms(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all alarms.
-
-        Returns alarms from the UniFi controller.
-
-        Known fields: ap, ap_displayName, ap_model, ap_name, archived, datetime, freq, is_negative, key, msg, radar_channel, site_id, subsystem, time
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/alarm", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} alarms", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    # --- Event (read-only) ---
-
-    @mcp.tool()
-    async def unifi_list_events(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all events.
-
-        Returns events from the UniFi controller.
-
-        Known fields: ap, ap_displayName, ap_model, ap_name, channel_from, channel_to, datetime, freq, guest, is_negative, key, msg, radar_channel, radio, radio_from, radio_to, site_id, subsystem, sw, sw_displayName, sw_model, sw_name, time, user, version_from, version_to
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/event", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} events", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_stat_alarms(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List stat_alarms statistics.
-
-        Known fields: ap, ap_displayName, ap_model, ap_name, archived, datetime, freq, is_negative, key, msg, radar_channel, site_id, subsystem, time
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/alarm", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} stat_alarms records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_anomalies(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List anomalies statistics.
-
-        Note: site anomalies (unpoller). Supports ?scale=hourly&end=<timestamp>
-
-        Known fields: anomaly, mac, timestamps
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/anomalies", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} anomalies records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_authorizations(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List authorizations statistics.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("POST", "stat/authorization", json_data={}, site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} authorizations records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_dashboard(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List dashboard statistics.
-
-        Key fields: time
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/dashboard", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} dashboard records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_dpi_stats(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List dpi_stats statistics.
-
-        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/dpi", site=site or None)
-            # Normalize trivially-empty responses (e.g. [{}] from DPI)
-            if isinstance(data, list) and all(isinstance(d, dict) and not d for d in data):
-                data = []
-            # Detect missing gateway
-            gw_note = None
-            if not data:
-                health = await client.request("GET", "stat/health", site=site or None)
-                wan_status = next(
-                    (h.get("status") for h in health
-                     if isinstance(h, dict) and h.get("subsystem") == "wan"),
-                    "unknown",
-                )
-                if wan_status == "unknown":
-                    gw_note = "No UniFi gateway detected (wan: unknown). This endpoint requires a USG, UDM, or UCG."
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} dpi_stats records", missing_fields=missing, note=gw_note)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_dynamic_dns_stats(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List dynamic_dns_stats statistics.
-
-        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/dynamicdns", site=site or None)
-            # Normalize trivially-empty responses (e.g. [{}] from DPI)
-            if isinstance(data, list) and all(isinstance(d, dict) and not d for d in data):
-                data = []
-            # Detect missing gateway
-            gw_note = None
-            if not data:
-                health = await client.request("GET", "stat/health", site=site or None)
-                wan_status = next(
-                    (h.get("status") for h in health
-                     if isinstance(h, dict) and h.get("subsystem") == "wan"),
-                    "unknown",
-                )
-                if wan_status == "unknown":
-                    gw_note = "No UniFi gateway detected (wan: unknown). This endpoint requires a USG, UDM, or UCG."
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} dynamic_dns_stats records", missing_fields=missing, note=gw_note)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_stat_events(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List stat_events statistics.
-
-        Known fields: admin, ap, ap_displayName, ap_model, ap_name, channel_from, channel_to, datetime, freq, guest, ip, is_admin, is_negative, key, msg, radar_channel, radio, radio_from, radio_to, site_id, subsystem, sw, sw_displayName, sw_model, sw_name, time, user, version_from, version_to
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/event", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} stat_events records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_gateway_stats(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List gateway_stats statistics.
-
-        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/gateway", site=site or None)
-            # Normalize trivially-empty responses (e.g. [{}] from DPI)
-            if isinstance(data, list) and all(isinstance(d, dict) and not d for d in data):
-                data = []
-            # Detect missing gateway
-            gw_note = None
-            if not data:
-                health = await client.request("GET", "stat/health", site=site or None)
-                wan_status = next(
-                    (h.get("status") for h in health
-                     if isinstance(h, dict) and h.get("subsystem") == "wan"),
-                    "unknown",
-                )
-                if wan_status == "unknown":
-                    gw_note = "No UniFi gateway detected (wan: unknown). This endpoint requires a USG, UDM, or UCG."
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} gateway_stats records", missing_fields=missing, note=gw_note)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_health(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List health statistics.
-
-        Key fields: status, subsystem
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/health", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} health records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_ips_events(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List ips_events statistics.
-
-        Note: IDS/IPS events — singular form (unpoller APIEventPathIDS)
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("POST", "stat/ips/event", json_data={}, site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} ips_events records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_port_forward_stats(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List port_forward_stats statistics.
-
-        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/portforward", site=site or None)
-            # Normalize trivially-empty responses (e.g. [{}] from DPI)
-            if isinstance(data, list) and all(isinstance(d, dict) and not d for d in data):
-                data = []
-            # Detect missing gateway
-            gw_note = None
-            if not data:
-                health = await client.request("GET", "stat/health", site=site or None)
-                wan_status = next(
-                    (h.get("status") for h in health
-                     if isinstance(h, dict) and h.get("subsystem") == "wan"),
-                    "unknown",
-                )
-                if wan_status == "unknown":
-                    gw_note = "No UniFi gateway detected (wan: unknown). This endpoint requires a USG, UDM, or UCG."
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} port_forward_stats records", missing_fields=missing, note=gw_note)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_remote_user_vpn(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List remote_user_vpn statistics.
-
-        Note: remote user VPN stats
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/remoteuservpn", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} remote_user_vpn records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_report(
-        interval: str = "hourly",
-        report_type: str = "site",
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """Get statistical reports.
-
-        Args:
-            interval: Report interval: '5minutes', 'hourly', or 'daily'.
-            report_type: Report type: 'site', 'user', 'ap'.
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        Note: intervals: 5minutes, hourly, daily, monthly; types: site, ap, user, gw
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            path = f"stat/report/{interval}.{report_type}"
-            data = await client.request("POST", path, json_data={}, site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} report records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_report_5min_ap(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List report_5min_ap statistics.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("POST", "stat/report/5minutes.ap", json_data={}, site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} report_5min_ap records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_report_5min_gateway(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List report_5min_gateway statistics.
-
-        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("POST", "stat/report/5minutes.gw", json_data={}, site=site or None)
-            # Normalize trivially-empty responses (e.g. [{}] from DPI)
-            if isinstance(data, list) and all(isinstance(d, dict) and not d for d in data):
-                data = []
-            # Detect missing gateway
-            gw_note = None
-            if not data:
-                health = await client.request("GET", "stat/health", site=site or None)
-                wan_status = next(
-                    (h.get("status") for h in health
-                     if isinstance(h, dict) and h.get("subsystem") == "wan"),
-                    "unknown",
-                )
-                if wan_status == "unknown":
-                    gw_note = "No UniFi gateway detected (wan: unknown). This endpoint requires a USG, UDM, or UCG."
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} report_5min_gateway records", missing_fields=missing, note=gw_note)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_speedtest_results(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List speedtest_results statistics.
-
-        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("POST", "stat/report/archive.speedtest", json_data={}, site=site or None)
-            # Normalize trivially-empty responses (e.g. [{}] from DPI)
-            if isinstance(data, list) and all(isinstance(d, dict) and not d for d in data):
-                data = []
-            # Detect missing gateway
-            gw_note = None
-            if not data:
-                health = await client.request("GET", "stat/health", site=site or None)
-                wan_status = next(
-                    (h.get("status") for h in health
-                     if isinstance(h, dict) and h.get("subsystem") == "wan"),
-                    "unknown",
-                )
-                if wan_status == "unknown":
-                    gw_note = "No UniFi gateway detected (wan: unknown). This endpoint requires a USG, UDM, or UCG."
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} speedtest_results records", missing_fields=missing, note=gw_note)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_report_daily_gateway(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List report_daily_gateway statistics.
-
-        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("POST", "stat/report/daily.gw", json_data={}, site=site or None)
-            # Normalize trivially-empty responses (e.g. [{}] from DPI)
-            if isinstance(data, list) and all(isinstance(d, dict) and not d for d in data):
-                data = []
-            # Detect missing gateway
-            gw_note = None
-            if not data:
-                health = await client.request("GET", "stat/health", site=site or None)
-                wan_status = next(
-                    (h.get("status") for h in health
-                     if isinstance(h, dict) and h.get("subsystem") == "wan"),
-                    "unknown",
-                )
-                if wan_status == "unknown":
-                    gw_note = "No UniFi gateway detected (wan: unknown). This endpoint requires a USG, UDM, or UCG."
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} report_daily_gateway records", missing_fields=missing, note=gw_note)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_report_hourly_gateway(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List report_hourly_gateway statistics.
-
-        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("POST", "stat/report/hourly.gw", json_data={}, site=site or None)
-            # Normalize trivially-empty responses (e.g. [{}] from DPI)
-            if isinstance(data, list) and all(isinstance(d, dict) and not d for d in data):
-                data = []
-            # Detect missing gateway
-            gw_note = None
-            if not data:
-                health = await client.request("GET", "stat/health", site=site or None)
-                wan_status = next(
-                    (h.get("status") for h in health
-                     if isinstance(h, dict) and h.get("subsystem") == "wan"),
-                    "unknown",
-                )
-                if wan_status == "unknown":
-                    gw_note = "No UniFi gateway detected (wan: unknown). This endpoint requires a USG, UDM, or UCG."
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} report_hourly_gateway records", missing_fields=missing, note=gw_note)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_report_monthly_ap(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List report_monthly_ap statistics.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("POST", "stat/report/monthly.ap", json_data={}, site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} report_monthly_ap records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_report_monthly_gateway(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List report_monthly_gateway statistics.
-
-        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("POST", "stat/report/monthly.gw", json_data={}, site=site or None)
-            # Normalize trivially-empty responses (e.g. [{}] from DPI)
-            if isinstance(data, list) and all(isinstance(d, dict) and not d for d in data):
-                data = []
-            # Detect missing gateway
-            gw_note = None
-            if not data:
-                health = await client.request("GET", "stat/health", site=site or None)
-                wan_status = next(
-                    (h.get("status") for h in health
-                     if isinstance(h, dict) and h.get("subsystem") == "wan"),
-                    "unknown",
-                )
-                if wan_status == "unknown":
-                    gw_note = "No UniFi gateway detected (wan: unknown). This endpoint requires a USG, UDM, or UCG."
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} report_monthly_gateway records", missing_fields=missing, note=gw_note)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_report_monthly_site(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List report_monthly_site statistics.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("POST", "stat/report/monthly.site", json_data={}, site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} report_monthly_site records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_report_monthly_user(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List report_monthly_user statistics.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("POST", "stat/report/monthly.user", json_data={}, site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} report_monthly_user records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_rogue_aps(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List rogue_aps statistics.
-
-        Known fields: age, ap_mac, band, bssid, bw, center_freq, channel, essid, freq, is_adhoc, is_rogue, is_ubnt, last_seen, noise, oui, radio, radio_name, report_time, rssi, rssi_age, security, signal, site_id
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/rogueap", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} rogue_aps records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_routing_stats(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List routing_stats statistics.
-
-        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/routing", site=site or None)
-            # Normalize trivially-empty responses (e.g. [{}] from DPI)
-            if isinstance(data, list) and all(isinstance(d, dict) and not d for d in data):
-                data = []
-            # Detect missing gateway
-            gw_note = None
-            if not data:
-                health = await client.request("GET", "stat/health", site=site or None)
-                wan_status = next(
-                    (h.get("status") for h in health
-                     if isinstance(h, dict) and h.get("subsystem") == "wan"),
-                    "unknown",
-                )
-                if wan_status == "unknown":
-                    gw_note = "No UniFi gateway detected (wan: unknown). This endpoint requires a USG, UDM, or UCG."
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} routing_stats records", missing_fields=missing, note=gw_note)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_sdn_status(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List sdn_status statistics.
-
-        Key fields: cloud_env, connected, connecting, enabled, has_sso_auth
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/sdn", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} sdn_status records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_site_dpi(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List site_dpi statistics.
-
-        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/sitedpi", site=site or None)
-            # Normalize trivially-empty responses (e.g. [{}] from DPI)
-            if isinstance(data, list) and all(isinstance(d, dict) and not d for d in data):
-                data = []
-            # Detect missing gateway
-            gw_note = None
-            if not data:
-                health = await client.request("GET", "stat/health", site=site or None)
-                wan_status = next(
-                    (h.get("status") for h in health
-                     if isinstance(h, dict) and h.get("subsystem") == "wan"),
-                    "unknown",
-                )
-                if wan_status == "unknown":
-                    gw_note = "No UniFi gateway detected (wan: unknown). This endpoint requires a USG, UDM, or UCG."
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} site_dpi records", missing_fields=missing, note=gw_note)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_client_dpi(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List client_dpi statistics.
-
-        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/stadpi", site=site or None)
-            # Normalize trivially-empty responses (e.g. [{}] from DPI)
-            if isinstance(data, list) and all(isinstance(d, dict) and not d for d in data):
-                data = []
-            # Detect missing gateway
-            gw_note = None
-            if not data:
-                health = await client.request("GET", "stat/health", site=site or None)
-                wan_status = next(
-                    (h.get("status") for h in health
-                     if isinstance(h, dict) and h.get("subsystem") == "wan"),
-                    "unknown",
-                )
-                if wan_status == "unknown":
-                    gw_note = "No UniFi gateway detected (wan: unknown). This endpoint requires a USG, UDM, or UCG."
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} client_dpi records", missing_fields=missing, note=gw_note)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_sysinfo(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List sysinfo statistics.
-
-        Key fields: anonymous_controller_id, autobackup, build, data_retention_days, data_retention_time_in_hours_for_5minutes_scale
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/sysinfo", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} sysinfo records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_alarm_archive(
-            _id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'archive' via alarm.
-
-            Args:
-                _id: _id parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "alarm_archive", "cmd": "archive"}
-                    preview["_id"] = _id
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/alarm): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "archive"}
-                payload["_id"] = _id
-                client = await _get_client()
-                result = await client.request("POST", "cmd/alarm", json_data=payload, site=site or None)
-                return _format_response(result, "Executed archive")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_archive_all_alarms(
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'archive-all-alarms' via evtmgr.
-
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "archive_all_alarms", "cmd": "archive-all-alarms"}
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/evtmgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "archive-all-alarms"}
-                client = await _get_client()
-                result = await client.request("POST", "cmd/evtmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed archive-all-alarms")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_archive_alarm(
-            _id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'archive-alarm' via evtmgr.
-
-            Args:
-                _id: _id parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "archive_alarm", "cmd": "archive-alarm"}
-                    preview["_id"] = _id
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/evtmgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "archive-alarm"}
-                payload["_id"] = _id
-                client = await _get_client()
-                result = await client.request("POST", "cmd/evtmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed archive-alarm")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_clear_dpi(
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'reset-dpi' via stat.
-
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "clear_dpi", "cmd": "reset-dpi"}
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/stat): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "reset-dpi"}
-                client = await _get_client()
-                result = await client.request("POST", "cmd/stat", json_data=payload, site=site or None)
-                return _format_response(result, "Executed reset-dpi")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-if "admin" in UNIFI_MODULES or "v1" in UNIFI_MODULES:
-    # ===========================================================================
-    # Module: admin
-    # ===========================================================================
-
-    # --- Account CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_accounts(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all accounts.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/account", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} accounts", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_account(id: str, site: str = "") -> dict:
-        """Get a single account by ID.
-
-        Args:
-            id: The _id of the account.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/account/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_account(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new account.
-
-            Args:
-                data: Account configuration.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_account", "data": data},
-                        "DRY RUN (POST rest/account): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/account", json_data=data, site=site or None)
-                return _format_response(result, "Created account")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_account(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing account.
-
-            Args:
-                id: The _id of the account to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_account", "id": id, "data": data},
-                        "DRY RUN (PUT rest/account/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/account/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated account")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_account(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a account.
-
-            Args:
-                id: The _id of the account to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_account", "id": id},
-                        "DRY RUN (DELETE rest/account/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/account/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted account")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Settings (special handling: keyed by 'key' field) ---
-
-    @mcp.tool()
-    async def unifi_list_settings(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all site settings. Returns all setting categories.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'key,name'). Supports dot-notation for nested fields. Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/setting", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} setting categories", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_setting(key: str, site: str = "") -> dict:
-        """Get a specific site setting by key (e.g. 'super_identity', 'snmp').
-
-        Args:
-            key: The setting key to retrieve.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/setting", site=site or None)
-            for item in data:
-                if isinstance(item, dict) and item.get("key") == key:
-                    return _format_response(item)
-            return _format_response(None, f"Setting '{key}' not found")
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_update_setting(
-            key: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update a site setting by key.
-
-            Args:
-                key: The setting key to update (e.g. 'mgmt', 'snmp', 'ntp', 'locale').
-                data: Fields to update. Read current values first with unifi_get_setting.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_setting", "key": key, "data": data},
-                        "DRY RUN (PUT set/setting/{key}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", f"set/setting/{key}", json_data=data, site=site or None)
-                return _format_response(result, f"Updated setting '{key}'")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Tag CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_tags(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all tags.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/tag", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} tags", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_tag(id: str, site: str = "") -> dict:
-        """Get a single tag by ID.
-
-        Args:
-            id: The _id of the tag.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/tag/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_tag(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new tag.
-
-            Args:
-                data: Tag configuration.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_tag", "data": data},
-                        "DRY RUN (POST rest/tag): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/tag", json_data=data, site=site or None)
-                return _format_response(result, "Created tag")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_tag(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing tag.
-
-            Args:
-                id: The _id of the tag to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_tag", "id": id, "data": data},
-                        "DRY RUN (PUT rest/tag/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/tag/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated tag")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_tag(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a tag.
-
-            Args:
-                id: The _id of the tag to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_tag", "id": id},
-                        "DRY RUN (DELETE rest/tag/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/tag/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted tag")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- User_group CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_user_groups(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all user_groups.
-
-        Key fields: name (str), qos_rate_max_down (int), qos_rate_max_up (int)
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/usergroup", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} user_groups", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_user_group(id: str, site: str = "") -> dict:
-        """Get a single user_group by ID.
-
-        Args:
-            id: The _id of the user_group.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/usergroup/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_user_group(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new user_group.
-
-            Args:
-                data: User_group configuration.
-                    Fields: name (str), qos_rate_max_down (int), qos_rate_max_up (int)
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Tip: Assign users to this group by setting usergroup_id when creating or updating users.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_user_group", "data": data},
-                        "DRY RUN (POST rest/usergroup): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/usergroup", json_data=data, site=site or None)
-                return _format_response(result, "Created user_group")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_user_group(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing user_group.
-
-            Args:
-                id: The _id of the user_group to update.
-                data: Fields to update.
-                    Fields: name (str), qos_rate_max_down (int), qos_rate_max_up (int)
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Tip: Assign users to this group by setting usergroup_id when creating or updating users.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_user_group", "id": id, "data": data},
-                        "DRY RUN (PUT rest/usergroup/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/usergroup/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated user_group")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_user_group(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a user_group.
-
-            Args:
-                id: The _id of the user_group to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_user_group", "id": id},
-                        "DRY RUN (DELETE rest/usergroup/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/usergroup/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted user_group")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_backups(
-        site: str = "",
-    ) -> dict:
-        """Execute 'list-backups' via backup.
-
-            site: Site name override (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            payload: dict[str, Any] = {"cmd": "list-backups"}
-            client = await _get_client()
-            result = await client.request("POST", "cmd/backup", json_data=payload, site=site or None)
-            return _format_response(result, "Executed list-backups")
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_delete_backup(
-            filename: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'delete-backup' via backup.
-
-            Args:
-                filename: filename parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "delete_backup", "cmd": "delete-backup"}
-                    preview["filename"] = filename
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/backup): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "delete-backup"}
-                payload["filename"] = filename
-                client = await _get_client()
-                result = await client.request("POST", "cmd/backup", json_data=payload, site=site or None)
-                return _format_response(result, "Executed delete-backup")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_generate_backup(
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'generate-backup' via backup.
-
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "generate_backup", "cmd": "generate-backup"}
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/backup): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "generate-backup"}
-                client = await _get_client()
-                result = await client.request("POST", "cmd/backup", json_data=payload, site=site or None)
-                return _format_response(result, "Executed generate-backup")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_generate_backup_site(
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'generate-backup-site' via backup.
-
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "generate_backup_site", "cmd": "generate-backup-site"}
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/backup): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "generate-backup-site"}
-                client = await _get_client()
-                result = await client.request("POST", "cmd/backup", json_data=payload, site=site or None)
-                return _format_response(result, "Executed generate-backup-site")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_rolling_upgrade(
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'rolling-upgrade' via devmgr.
-
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "rolling_upgrade", "cmd": "rolling-upgrade"}
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "rolling-upgrade"}
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed rolling-upgrade")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_cancel_rolling_upgrade(
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'cancel-rolling-upgrade' via devmgr.
-
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "cancel_rolling_upgrade", "cmd": "cancel-rolling-upgrade"}
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "cancel-rolling-upgrade"}
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed cancel-rolling-upgrade")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_check_firmware_update(
-        site: str = "",
-    ) -> dict:
-        """Execute 'check-firmware-update' via devmgr.
-
-            site: Site name override (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            payload: dict[str, Any] = {"cmd": "check-firmware-update"}
-            client = await _get_client()
-            result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-            return _format_response(result, "Executed check-firmware-update")
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_set_rollupgrade(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'set-rollupgrade' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "set_rollupgrade", "cmd": "set-rollupgrade"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "set-rollupgrade"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed set-rollupgrade")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_unset_rollupgrade(
-            mac: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'unset-rollupgrade' via devmgr.
-
-            Args:
-                mac: mac parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "unset_rollupgrade", "cmd": "unset-rollupgrade"}
-                    preview["mac"] = mac
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/devmgr): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "unset-rollupgrade"}
-                payload["mac"] = mac
-                client = await _get_client()
-                result = await client.request("POST", "cmd/devmgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed unset-rollupgrade")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_add_site(
-            desc: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'add-site' via sitemgr.
-
-            Args:
-                desc: desc parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "add_site", "cmd": "add-site"}
-                    preview["desc"] = desc
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/sitemgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "add-site"}
-                payload["desc"] = desc
-                client = await _get_client()
-                result = await client.request("POST", "cmd/sitemgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed add-site")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_delete_site(
-            target_site: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'delete-site' via sitemgr.
-
-            Args:
-                target_site: Target site for the command (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "delete_site", "cmd": "delete-site"}
-                    preview["site"] = target_site
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/sitemgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "delete-site"}
-                payload["site"] = target_site
-                client = await _get_client()
-                result = await client.request("POST", "cmd/sitemgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed delete-site")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_update_site(
-            desc: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'update-site' via sitemgr.
-
-            Args:
-                desc: desc parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "update_site", "cmd": "update-site"}
-                    preview["desc"] = desc
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/sitemgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "update-site"}
-                payload["desc"] = desc
-                client = await _get_client()
-                result = await client.request("POST", "cmd/sitemgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed update-site")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_get_admins(
-        site: str = "",
-    ) -> dict:
-        """Execute 'get-admins' via sitemgr.
-
-            site: Site name override (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            payload: dict[str, Any] = {"cmd": "get-admins"}
-            client = await _get_client()
-            result = await client.request("POST", "cmd/sitemgr", json_data=payload, site=site or None)
-            return _format_response(result, "Executed get-admins")
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_set_site_leds(
-            led_enabled: bool,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'site-leds' via sitemgr.
-
-            Args:
-                led_enabled: led_enabled parameter (bool).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "set_site_leds", "cmd": "site-leds"}
-                    preview["led_enabled"] = led_enabled
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/sitemgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "site-leds"}
-                payload["led_enabled"] = led_enabled
-                client = await _get_client()
-                result = await client.request("POST", "cmd/sitemgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed site-leds")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_invite_admin(
-            email: str,
-            name: str,
-            role: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'invite-admin' via sitemgr.
-
-            Args:
-                email: email parameter (str).
-            Args:
-                name: name parameter (str).
-            Args:
-                role: role parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "invite_admin", "cmd": "invite-admin"}
-                    preview["email"] = email
-                    preview["name"] = name
-                    preview["role"] = role
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/sitemgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "invite-admin"}
-                payload["email"] = email
-                payload["name"] = name
-                payload["role"] = role
-                client = await _get_client()
-                result = await client.request("POST", "cmd/sitemgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed invite-admin")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_assign_existing_admin(
-            admin: str,
-            role: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'assign-existing-admin' via sitemgr.
-
-            Args:
-                admin: admin parameter (str).
-            Args:
-                role: role parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "assign_existing_admin", "cmd": "assign-existing-admin"}
-                    preview["admin"] = admin
-                    preview["role"] = role
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/sitemgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "assign-existing-admin"}
-                payload["admin"] = admin
-                payload["role"] = role
-                client = await _get_client()
-                result = await client.request("POST", "cmd/sitemgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed assign-existing-admin")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_update_admin(
-            admin: str,
-            role: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'update-admin' via sitemgr.
-
-            Args:
-                admin: admin parameter (str).
-            Args:
-                role: role parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "update_admin", "cmd": "update-admin"}
-                    preview["admin"] = admin
-                    preview["role"] = role
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/sitemgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "update-admin"}
-                payload["admin"] = admin
-                payload["role"] = role
-                client = await _get_client()
-                result = await client.request("POST", "cmd/sitemgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed update-admin")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_revoke_admin(
-            admin: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'revoke-admin' via sitemgr.
-
-            Args:
-                admin: admin parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "revoke_admin", "cmd": "revoke-admin"}
-                    preview["admin"] = admin
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/sitemgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "revoke-admin"}
-                payload["admin"] = admin
-                client = await _get_client()
-                result = await client.request("POST", "cmd/sitemgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed revoke-admin")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_grant_super_admin(
-            admin: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'grant-super-admin' via sitemgr.
-
-            Args:
-                admin: admin parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "grant_super_admin", "cmd": "grant-super-admin"}
-                    preview["admin"] = admin
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/sitemgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "grant-super-admin"}
-                payload["admin"] = admin
-                client = await _get_client()
-                result = await client.request("POST", "cmd/sitemgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed grant-super-admin")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_admin(
-            name: str,
-            email: str,
-            x_password: str,
-            role: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'create-admin' via sitemgr.
-
-            Args:
-                name: name parameter (str).
-            Args:
-                email: email parameter (str).
-            Args:
-                x_password: x_password parameter (str).
-            Args:
-                role: role parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "create_admin", "cmd": "create-admin"}
-                    preview["name"] = name
-                    preview["email"] = email
-                    preview["x_password"] = x_password
-                    preview["role"] = role
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/sitemgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "create-admin"}
-                payload["name"] = name
-                payload["email"] = email
-                payload["x_password"] = x_password
-                payload["role"] = role
-                client = await _get_client()
-                result = await client.request("POST", "cmd/sitemgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed create-admin")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_revoke_super_admin(
-            admin: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'revoke-super-admin' via sitemgr.
-
-            Args:
-                admin: admin parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "revoke_super_admin", "cmd": "revoke-super-admin"}
-                    preview["admin"] = admin
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/sitemgr): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "revoke-super-admin"}
-                payload["admin"] = admin
-                client = await _get_client()
-                result = await client.request("POST", "cmd/sitemgr", json_data=payload, site=site or None)
-                return _format_response(result, "Executed revoke-super-admin")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_backup(
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'backup' via system.
-
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "create_backup", "cmd": "backup"}
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/system): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "backup"}
-                client = await _get_client()
-                result = await client.request("POST", "cmd/system", json_data=payload, site=site or None)
-                return _format_response(result, "Executed backup")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_download_backup(
-            filename: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'download-backup' via system.
-
-            Args:
-                filename: filename parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "download_backup", "cmd": "download-backup"}
-                    preview["filename"] = filename
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/system): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "download-backup"}
-                payload["filename"] = filename
-                client = await _get_client()
-                result = await client.request("POST", "cmd/system", json_data=payload, site=site or None)
-                return _format_response(result, "Executed download-backup")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-if "hotspot" in UNIFI_MODULES or "v1" in UNIFI_MODULES:
-    # ===========================================================================
-    # Module: hotspot
-    # ===========================================================================
-
-    # --- Hotspot2_config CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_hotspot2_configs(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all hotspot2_configs.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/hotspot2conf", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} hotspot2_configs", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_hotspot2_config(id: str, site: str = "") -> dict:
-        """Get a single hotspot2_config by ID.
-
-        Args:
-            id: The _id of the hotspot2_config.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/hotspot2conf/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_hotspot2_config(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new hotspot2_config.
-
-            Args:
-                data: Hotspot2_config configuration.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_hotspot2_config", "data": data},
-                        "DRY RUN (POST rest/hotspot2conf): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/hotspot2conf", json_data=data, site=site or None)
-                return _format_response(result, "Created hotspot2_config")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_hotspot2_config(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing hotspot2_config.
-
-            Args:
-                id: The _id of the hotspot2_config to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_hotspot2_config", "id": id, "data": data},
-                        "DRY RUN (PUT rest/hotspot2conf/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/hotspot2conf/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated hotspot2_config")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_hotspot2_config(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a hotspot2_config.
-
-            Args:
-                id: The _id of the hotspot2_config to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_hotspot2_config", "id": id},
-                        "DRY RUN (DELETE rest/hotspot2conf/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/hotspot2conf/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted hotspot2_config")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Hotspot_operator CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_hotspot_operators(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all hotspot_operators.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/hotspotop", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} hotspot_operators", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_hotspot_operator(id: str, site: str = "") -> dict:
-        """Get a single hotspot_operator by ID.
-
-        Args:
-            id: The _id of the hotspot_operator.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/hotspotop/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_hotspot_operator(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new hotspot_operator.
-
-            Args:
-                data: Hotspot_operator configuration.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_hotspot_operator", "data": data},
-                        "DRY RUN (POST rest/hotspotop): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/hotspotop", json_data=data, site=site or None)
-                return _format_response(result, "Created hotspot_operator")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_hotspot_operator(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing hotspot_operator.
-
-            Args:
-                id: The _id of the hotspot_operator to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_hotspot_operator", "id": id, "data": data},
-                        "DRY RUN (PUT rest/hotspotop/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/hotspotop/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated hotspot_operator")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_hotspot_operator(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a hotspot_operator.
-
-            Args:
-                id: The _id of the hotspot_operator to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_hotspot_operator", "id": id},
-                        "DRY RUN (DELETE rest/hotspotop/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/hotspotop/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted hotspot_operator")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Hotspot_package CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_hotspot_packages(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all hotspot_packages.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/hotspotpackage", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} hotspot_packages", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_hotspot_package(id: str, site: str = "") -> dict:
-        """Get a single hotspot_package by ID.
-
-        Args:
-            id: The _id of the hotspot_package.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/hotspotpackage/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_hotspot_package(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new hotspot_package.
-
-            Args:
-                data: Hotspot_package configuration.
-                    Required: name (str), amount (int, price in cents, 0=free), currency (str, e.g. 'USD'), hours (int, access duration in hours), bytes (int, bandwidth limit, 0=unlimited). Note: Requires hotspot portal + payment gateway configured on the controller.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_hotspot_package", "data": data},
-                        "DRY RUN (POST rest/hotspotpackage): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/hotspotpackage", json_data=data, site=site or None)
-                return _format_response(result, "Created hotspot_package")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_hotspot_package(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing hotspot_package.
-
-            Args:
-                id: The _id of the hotspot_package to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_hotspot_package", "id": id, "data": data},
-                        "DRY RUN (PUT rest/hotspotpackage/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/hotspotpackage/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated hotspot_package")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_hotspot_package(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a hotspot_package.
-
-            Args:
-                id: The _id of the hotspot_package to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_hotspot_package", "id": id},
-                        "DRY RUN (DELETE rest/hotspotpackage/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/hotspotpackage/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted hotspot_package")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Radius_account CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_radius_accounts(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all radius_accounts.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/radiusaccount", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} radius_accounts", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_radius_account(id: str, site: str = "") -> dict:
-        """Get a single radius_account by ID.
-
-        Args:
-            id: The _id of the radius_account.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/radiusaccount/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_radius_account(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new radius_account.
-
-            Args:
-                data: Radius_account configuration.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_radius_account", "data": data},
-                        "DRY RUN (POST rest/radiusaccount): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/radiusaccount", json_data=data, site=site or None)
-                return _format_response(result, "Created radius_account")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_radius_account(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing radius_account.
-
-            Args:
-                id: The _id of the radius_account to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_radius_account", "id": id, "data": data},
-                        "DRY RUN (PUT rest/radiusaccount/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/radiusaccount/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated radius_account")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_radius_account(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a radius_account.
-
-            Args:
-                id: The _id of the radius_account to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_radius_account", "id": id},
-                        "DRY RUN (DELETE rest/radiusaccount/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/radiusaccount/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted radius_account")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Radius_profile CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_radius_profiles(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all radius_profiles.
-
-        Key fields: acct_servers (list), auth_servers (list), external_id (str), name (str), use_usg_auth_server (bool)
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/radiusprofile", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} radius_profiles", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_radius_profile(id: str, site: str = "") -> dict:
-        """Get a single radius_profile by ID.
-
-        Args:
-            id: The _id of the radius_profile.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/radiusprofile/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_radius_profile(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new radius_profile.
-
-            Args:
-                data: Radius_profile configuration.
-                    Fields: acct_servers (list), auth_servers (list), external_id (str), name (str), use_usg_auth_server (bool)
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Tip: Reference this profile's _id as radiusprofile_id when configuring WLANs with 802.1X authentication.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_radius_profile", "data": data},
-                        "DRY RUN (POST rest/radiusprofile): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/radiusprofile", json_data=data, site=site or None)
-                return _format_response(result, "Created radius_profile")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_radius_profile(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing radius_profile.
-
-            Args:
-                id: The _id of the radius_profile to update.
-                data: Fields to update.
-                    Fields: acct_servers (list), auth_servers (list), external_id (str), name (str), use_usg_auth_server (bool)
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Tip: Reference this profile's _id as radiusprofile_id when configuring WLANs with 802.1X authentication.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_radius_profile", "id": id, "data": data},
-                        "DRY RUN (PUT rest/radiusprofile/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/radiusprofile/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated radius_profile")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_radius_profile(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a radius_profile.
-
-            Args:
-                id: The _id of the radius_profile to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_radius_profile", "id": id},
-                        "DRY RUN (DELETE rest/radiusprofile/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/radiusprofile/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted radius_profile")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_payments(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List payments statistics.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/payment", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} payments records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    @mcp.tool()
-    async def unifi_list_vouchers(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List vouchers statistics.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "stat/voucher", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} vouchers records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_hotspot_authorize_guest(
-            mac: str,
-            minutes: int,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'authorize-guest' via hotspot.
-
-            Args:
-                mac: mac parameter (str).
-            Args:
-                minutes: minutes parameter (int).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "hotspot_authorize_guest", "cmd": "authorize-guest"}
-                    preview["mac"] = mac
-                    preview["minutes"] = minutes
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/hotspot): Set confirm=True to execute.",
-                    )
-                mac_err = _validate_mac(mac)
-                if mac_err:
-                    return _format_response({"error": mac_err}, mac_err)
-                payload: dict[str, Any] = {"cmd": "authorize-guest"}
-                payload["mac"] = mac
-                payload["minutes"] = minutes
-                client = await _get_client()
-                result = await client.request("POST", "cmd/hotspot", json_data=payload, site=site or None)
-                return _format_response(result, "Executed authorize-guest")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_voucher(
-            expire: int,
-            n: int,
-            quota: int,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'create-voucher' via hotspot.
-
-            Args:
-                expire: expire parameter (int).
-            Args:
-                n: n parameter (int).
-            Args:
-                quota: quota parameter (int).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "create_voucher", "cmd": "create-voucher"}
-                    preview["expire"] = expire
-                    preview["n"] = n
-                    preview["quota"] = quota
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/hotspot): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "create-voucher"}
-                payload["expire"] = expire
-                payload["n"] = n
-                payload["quota"] = quota
-                client = await _get_client()
-                result = await client.request("POST", "cmd/hotspot", json_data=payload, site=site or None)
-                return _format_response(result, "Executed create-voucher")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_revoke_voucher(
-            _id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'revoke-voucher' via hotspot.
-
-            Args:
-                _id: _id parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "revoke_voucher", "cmd": "revoke-voucher"}
-                    preview["_id"] = _id
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/hotspot): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "revoke-voucher"}
-                payload["_id"] = _id
-                client = await _get_client()
-                result = await client.request("POST", "cmd/hotspot", json_data=payload, site=site or None)
-                return _format_response(result, "Executed revoke-voucher")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_extend_guest_validity(
-            _id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'extend-guest-validity' via hotspot.
-
-            Args:
-                _id: _id parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "extend_guest_validity", "cmd": "extend-guest-validity"}
-                    preview["_id"] = _id
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/hotspot): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "extend-guest-validity"}
-                payload["_id"] = _id
-                client = await _get_client()
-                result = await client.request("POST", "cmd/hotspot", json_data=payload, site=site or None)
-                return _format_response(result, "Executed extend-guest-validity")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_delete_voucher(
-            _id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Execute 'delete-voucher' via hotspot.
-
-            Args:
-                _id: _id parameter (str).
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name override (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    preview = {"action": "delete_voucher", "cmd": "delete-voucher"}
-                    preview["_id"] = _id
-                    return _format_response(
-                        preview,
-                        "DRY RUN (POST cmd/hotspot): Set confirm=True to execute.",
-                    )
-                payload: dict[str, Any] = {"cmd": "delete-voucher"}
-                payload["_id"] = _id
-                client = await _get_client()
-                result = await client.request("POST", "cmd/hotspot", json_data=payload, site=site or None)
-                return _format_response(result, "Executed delete-voucher")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-if "advanced" in UNIFI_MODULES or "v1" in UNIFI_MODULES:
-    # ===========================================================================
-    # Module: advanced
-    # ===========================================================================
-
-    # --- Broadcast_group CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_broadcast_groups(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all broadcast_groups.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/broadcastgroup", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} broadcast_groups", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_broadcast_group(id: str, site: str = "") -> dict:
-        """Get a single broadcast_group by ID.
-
-        Args:
-            id: The _id of the broadcast_group.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/broadcastgroup/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_broadcast_group(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new broadcast_group.
-
-            Args:
-                data: Broadcast_group configuration.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_broadcast_group", "data": data},
-                        "DRY RUN (POST rest/broadcastgroup): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/broadcastgroup", json_data=data, site=site or None)
-                return _format_response(result, "Created broadcast_group")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_broadcast_group(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing broadcast_group.
-
-            Args:
-                id: The _id of the broadcast_group to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_broadcast_group", "id": id, "data": data},
-                        "DRY RUN (PUT rest/broadcastgroup/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/broadcastgroup/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated broadcast_group")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_broadcast_group(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a broadcast_group.
-
-            Args:
-                id: The _id of the broadcast_group to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_broadcast_group", "id": id},
-                        "DRY RUN (DELETE rest/broadcastgroup/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/broadcastgroup/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted broadcast_group")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Dpi_app CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_dpi_apps(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all dpi_apps.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/dpiapp", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} dpi_apps", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_dpi_app(id: str, site: str = "") -> dict:
-        """Get a single dpi_app by ID.
-
-        Args:
-            id: The _id of the dpi_app.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/dpiapp/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_dpi_app(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new dpi_app.
-
-            Args:
-                data: Dpi_app configuration.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_dpi_app", "data": data},
-                        "DRY RUN (POST rest/dpiapp): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/dpiapp", json_data=data, site=site or None)
-                return _format_response(result, "Created dpi_app")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_dpi_app(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing dpi_app.
-
-            Args:
-                id: The _id of the dpi_app to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_dpi_app", "id": id, "data": data},
-                        "DRY RUN (PUT rest/dpiapp/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/dpiapp/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated dpi_app")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_dpi_app(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a dpi_app.
-
-            Args:
-                id: The _id of the dpi_app to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_dpi_app", "id": id},
-                        "DRY RUN (DELETE rest/dpiapp/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/dpiapp/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted dpi_app")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Dpi_group CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_dpi_groups(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all dpi_groups.
-
-        Key fields: name (str)
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/dpigroup", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} dpi_groups", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_dpi_group(id: str, site: str = "") -> dict:
-        """Get a single dpi_group by ID.
-
-        Args:
-            id: The _id of the dpi_group.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/dpigroup/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_dpi_group(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new dpi_group.
-
-            Args:
-                data: Dpi_group configuration.
-                    Fields: name (str)
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_dpi_group", "data": data},
-                        "DRY RUN (POST rest/dpigroup): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/dpigroup", json_data=data, site=site or None)
-                return _format_response(result, "Created dpi_group")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_dpi_group(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing dpi_group.
-
-            Args:
-                id: The _id of the dpi_group to update.
-                data: Fields to update.
-                    Fields: name (str)
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_dpi_group", "id": id, "data": data},
-                        "DRY RUN (PUT rest/dpigroup/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/dpigroup/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated dpi_group")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_dpi_group(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a dpi_group.
-
-            Args:
-                id: The _id of the dpi_group to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_dpi_group", "id": id},
-                        "DRY RUN (DELETE rest/dpigroup/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/dpigroup/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted dpi_group")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Heatmap CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_heatmaps(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all heatmaps.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/heatmap", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} heatmaps", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_heatmap(id: str, site: str = "") -> dict:
-        """Get a single heatmap by ID.
-
-        Args:
-            id: The _id of the heatmap.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/heatmap/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_heatmap(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new heatmap.
-
-            Args:
-                data: Heatmap configuration.
-                    Required: name (str), map_id (str, _id from unifi_list_maps)
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_heatmap", "data": data},
-                        "DRY RUN (POST rest/heatmap): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/heatmap", json_data=data, site=site or None)
-                return _format_response(result, "Created heatmap")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_heatmap(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing heatmap.
-
-            Args:
-                id: The _id of the heatmap to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_heatmap", "id": id, "data": data},
-                        "DRY RUN (PUT rest/heatmap/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/heatmap/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated heatmap")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_heatmap(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a heatmap.
-
-            Args:
-                id: The _id of the heatmap to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_heatmap", "id": id},
-                        "DRY RUN (DELETE rest/heatmap/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/heatmap/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted heatmap")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Heatmap_point CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_heatmap_points(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all heatmap_points.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/heatmappoint", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} heatmap_points", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_heatmap_point(id: str, site: str = "") -> dict:
-        """Get a single heatmap_point by ID.
-
-        Args:
-            id: The _id of the heatmap_point.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/heatmappoint/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_heatmap_point(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new heatmap_point.
-
-            Args:
-                data: Heatmap_point configuration.
-                    Required: heatmap_id (str, _id from unifi_list_heatmaps), x (float, 0.0–1.0), y (float, 0.0–1.0)
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_heatmap_point", "data": data},
-                        "DRY RUN (POST rest/heatmappoint): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/heatmappoint", json_data=data, site=site or None)
-                return _format_response(result, "Created heatmap_point")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_heatmap_point(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing heatmap_point.
-
-            Args:
-                id: The _id of the heatmap_point to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_heatmap_point", "id": id, "data": data},
-                        "DRY RUN (PUT rest/heatmappoint/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/heatmappoint/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated heatmap_point")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_heatmap_point(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a heatmap_point.
-
-            Args:
-                id: The _id of the heatmap_point to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_heatmap_point", "id": id},
-                        "DRY RUN (DELETE rest/heatmappoint/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/heatmappoint/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted heatmap_point")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Map CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_maps(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all maps.
-
-        Known fields: content_type, filename, filesize, height, last_modified, md5, name, offset_left, offset_top, selected, site_id, type, unit, upp, url, width, zoom
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/map", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} maps", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_map(id: str, site: str = "") -> dict:
-        """Get a single map by ID.
-
-        Args:
-            id: The _id of the map.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/map/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_map(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new map.
-
-            Args:
-                data: Map configuration.
-                    Known fields: content_type, filename, filesize, height, last_modified, md5, name, offset_left, offset_top, selected, site_id, type, unit, upp, url, width, zoom
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_map", "data": data},
-                        "DRY RUN (POST rest/map): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/map", json_data=data, site=site or None)
-                return _format_response(result, "Created map")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_map(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing map.
-
-            Args:
-                id: The _id of the map to update.
-                data: Fields to update.
-                    Known fields: content_type, filename, filesize, height, last_modified, md5, name, offset_left, offset_top, selected, site_id, type, unit, upp, url, width, zoom
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_map", "id": id, "data": data},
-                        "DRY RUN (PUT rest/map/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/map/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated map")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_map(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a map.
-
-            Args:
-                id: The _id of the map to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_map", "id": id},
-                        "DRY RUN (DELETE rest/map/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/map/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted map")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Media_file CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_media_files(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all media_files.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/mediafile", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} media_files", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_media_file(id: str, site: str = "") -> dict:
-        """Get a single media_file by ID.
-
-        Args:
-            id: The _id of the media_file.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/mediafile/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_media_file(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new media_file.
-
-            Args:
-                data: Media_file configuration.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_media_file", "data": data},
-                        "DRY RUN (POST rest/mediafile): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/mediafile", json_data=data, site=site or None)
-                return _format_response(result, "Created media_file")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_media_file(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing media_file.
-
-            Args:
-                id: The _id of the media_file to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_media_file", "id": id, "data": data},
-                        "DRY RUN (PUT rest/mediafile/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/mediafile/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated media_file")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_media_file(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a media_file.
-
-            Args:
-                id: The _id of the media_file to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_media_file", "id": id},
-                        "DRY RUN (DELETE rest/mediafile/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/mediafile/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted media_file")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Known_rogue_ap (read-only) ---
-
-    @mcp.tool()
-    async def unifi_list_known_rogue_aps(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all known_rogue_aps.
-
-        Returns known_rogue_aps from the UniFi controller.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/rogueknown", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} known_rogue_aps", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-
-    # --- Schedule_task CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_schedule_tasks(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all schedule_tasks.
-
-        Known fields: action, cron_expr, execute_only_once, name, site_id, upgrade_targets
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/scheduletask", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} schedule_tasks", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_schedule_task(id: str, site: str = "") -> dict:
-        """Get a single schedule_task by ID.
-
-        Args:
-            id: The _id of the schedule_task.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/scheduletask/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_schedule_task(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new schedule_task.
-
-            Args:
-                data: Schedule_task configuration.
-                    Known fields: action, cron_expr, execute_only_once, name, site_id, upgrade_targets
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_schedule_task", "data": data},
-                        "DRY RUN (POST rest/scheduletask): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/scheduletask", json_data=data, site=site or None)
-                return _format_response(result, "Created schedule_task")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_schedule_task(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing schedule_task.
-
-            Args:
-                id: The _id of the schedule_task to update.
-                data: Fields to update.
-                    Known fields: action, cron_expr, execute_only_once, name, site_id, upgrade_targets
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            Note: This resource requires sending the FULL object on update, not just changed fields.
-            First GET the current object, modify the fields you want, then send the complete object.
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_schedule_task", "id": id, "data": data},
-                        "DRY RUN (PUT rest/scheduletask/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/scheduletask/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated schedule_task")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_schedule_task(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a schedule_task.
-
-            Args:
-                id: The _id of the schedule_task to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_schedule_task", "id": id},
-                        "DRY RUN (DELETE rest/scheduletask/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/scheduletask/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted schedule_task")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-    # --- Spatial_record CRUD ---
-
-    @mcp.tool()
-    async def unifi_list_spatial_records(
-        site: str = "",
-        limit: int = 0,
-        offset: int = 0,
-        fields: str = "",
-    ) -> dict:
-        """List all spatial_records.
-
-        Args:
-            site: Site name (default: from env).
-            limit: Max records to return (0 = all).
-            offset: Number of records to skip.
-            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/spatialrecord", site=site or None)
-            total = len(data)
-            data, missing = _paginate_and_filter(data, limit, offset, fields)
-            return _format_response(data, f"Found {total} spatial_records", missing_fields=missing)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-
-    @mcp.tool()
-    async def unifi_get_spatial_record(id: str, site: str = "") -> dict:
-        """Get a single spatial_record by ID.
-
-        Args:
-            id: The _id of the spatial_record.
-            site: Site name (default: from env).
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("GET", "rest/spatialrecord/{id}".format(id=id), site=site or None)
-            if isinstance(data, list) and len(data) == 1:
-                return _format_response(data[0])
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-    if not UNIFI_READ_ONLY:
-        
-        @mcp.tool()
-        async def unifi_create_spatial_record(
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Create a new spatial_record.
-
-            Args:
-                data: Spatial_record configuration.
-                    Required: name (str), devices (list, device references e.g. []), description (str, e.g. 'Room label')
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "create_spatial_record", "data": data},
-                        "DRY RUN (POST rest/spatialrecord): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("POST", "rest/spatialrecord", json_data=data, site=site or None)
-                return _format_response(result, "Created spatial_record")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_update_spatial_record(
-            id: str,
-            data: dict,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Update an existing spatial_record.
-
-            Args:
-                id: The _id of the spatial_record to update.
-                data: Fields to update.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "update_spatial_record", "id": id, "data": data},
-                        "DRY RUN (PUT rest/spatialrecord/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("PUT", "rest/spatialrecord/{id}".format(id=id), json_data=data, site=site or None)
-                return _format_response(result, "Updated spatial_record")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-        @mcp.tool()
-        async def unifi_delete_spatial_record(
-            id: str,
-            confirm: bool = False,
-            site: str = "",
-        ) -> dict:
-            """Delete a spatial_record.
-
-            Args:
-                id: The _id of the spatial_record to delete.
-                confirm: Must be True to execute. Returns preview if False.
-                site: Site name (default: from env).
-
-            If this tool returns an unexpected error, call unifi_report_issue to report it.
-            """
-            try:
-                if not confirm:
-                    return _format_response(
-                        {"action": "delete_spatial_record", "id": id},
-                        "DRY RUN (DELETE rest/spatialrecord/{id}): Set confirm=True to execute.",
-                    )
-                client = await _get_client()
-                result = await client.request("DELETE", "rest/spatialrecord/{id}".format(id=id), site=site or None)
-                return _format_response(result, "Deleted spatial_record")
-            except RuntimeError as e:
-                return _tool_error(e)
-
-
-
-# ===========================================================================
-# Global Endpoint Tools (always-on)
-# ===========================================================================
-
-if not UNIFI_READ_ONLY:
-    @mcp.tool()
-    async def unifi_logout() -> dict:
-        """Logout.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("POST", "/api/logout")
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-@mcp.tool()
-async def unifi_self() -> dict:
-    """Self.
-
-    If this tool returns an unexpected error, call unifi_report_issue to report it.
-    """
-    try:
-        client = await _get_client()
-        data = await client.request("GET", "/api/self")
-        # Strip ui_settings noise — it's internal controller UI state
-        if isinstance(data, list):
-            for item in data:
-                if isinstance(item, dict):
-                    item.pop("ui_settings", None)
-        elif isinstance(data, dict):
-            data.pop("ui_settings", None)
-        return _format_response(data)
-    except RuntimeError as e:
-        return _tool_error(e)
-
-
-@mcp.tool()
-async def unifi_sites() -> dict:
-    """Sites.
-
-    If this tool returns an unexpected error, call unifi_report_issue to report it.
-    """
-    try:
-        client = await _get_client()
-        data = await client.request("GET", "/api/self/sites")
-        return _format_response(data)
-    except RuntimeError as e:
-        return _tool_error(e)
-
-
-@mcp.tool()
-async def unifi_stat_admin() -> dict:
-    """Stat Admin.
-
-    If this tool returns an unexpected error, call unifi_report_issue to report it.
-    """
-    try:
-        client = await _get_client()
-        data = await client.request("GET", "/api/stat/admin")
-        return _format_response(data)
-    except RuntimeError as e:
-        return _tool_error(e)
-
-
-@mcp.tool()
-async def unifi_stat_sites() -> dict:
-    """Stat Sites.
-
-    If this tool returns an unexpected error, call unifi_report_issue to report it.
-    """
-    try:
-        client = await _get_client()
-        data = await client.request("GET", "/api/stat/sites")
-        return _format_response(data)
-    except RuntimeError as e:
-        return _tool_error(e)
-
-
-@mcp.tool()
-async def unifi_status() -> dict:
-    """Status.
-
-    No authentication required.
-
-    If this tool returns an unexpected error, call unifi_report_issue to report it.
-    """
-    try:
-        # No auth required
-        async with httpx.AsyncClient(
-            base_url=f"https://{UNIFI_HOST}:{UNIFI_PORT}",
-            verify=UNIFI_VERIFY_SSL,
-            timeout=30.0,
-        ) as c:
-            resp = await c.request("GET", "/status")
-            resp.raise_for_status()
-            data = resp.json()
-        return _format_response(data)
-    except RuntimeError as e:
-        return _tool_error(e)
-
-
-if not UNIFI_READ_ONLY:
-    @mcp.tool()
-    async def unifi_system_poweroff() -> dict:
-        """System Poweroff.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("POST", "/api/system/poweroff")
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-if not UNIFI_READ_ONLY:
-    @mcp.tool()
-    async def unifi_system_reboot() -> dict:
-        """System Reboot.
-
-        If this tool returns an unexpected error, call unifi_report_issue to report it.
-        """
-        try:
-            client = await _get_client()
-            data = await client.request("POST", "/api/system/reboot")
-            return _format_response(data)
-        except RuntimeError as e:
-            return _tool_error(e)
-
-# ===========================================================================
-# Network Overview Tool (always-on, read-only)
-# ===========================================================================
-
-
-@mcp.tool()
-async def unifi_get_overview(site: str = "") -> dict:
-    """Get a concise network overview in a single call.
-
-    Returns controller version, health status, device/network/WLAN summaries,
-    client count, and active alarm count. Use this as a starting point before
-    calling detailed tools.
-
-    Args:
-        site: Site name (default: from env).
-
-    If this tool returns an unexpected error, call unifi_report_issue to report it.
-    """
-    try:
-        client = await _get_client()
-        s = site or UNIFI_SITE
+    If this tool returns an unexpected error, call unifi_report_issue to report it.
+    """
+    try:
+        client = await _get_client()
+        s = site or UNIFI_SITE
 
         health = await client.request("GET", "stat/health", site=s)
         devices = await client.request("GET", "stat/device", site=s)
@@ -9312,28 +1647,259 @@ async def unifi_get_overview(site: str = "") -> dict:
 # Tool Search (always-on, read-only)
 # ===========================================================================
 
-_TOOL_INDEX = [{"description": "List all accounts", "keywords": "account accounts admin list rest", "module": "admin", "name": "unifi_list_accounts"}, {"description": "Get a single account by ID", "keywords": "account accounts admin get rest", "module": "admin", "name": "unifi_get_account"}, {"description": "Create a new account", "keywords": "account accounts admin create rest", "module": "admin", "name": "unifi_create_account"}, {"description": "Update an existing account", "keywords": "account accounts admin rest update", "module": "admin", "name": "unifi_update_account"}, {"description": "Delete a account", "keywords": "account accounts admin delete rest", "module": "admin", "name": "unifi_delete_account"}, {"description": "List all alarms", "keywords": "alarm alarms ap ap_displayname ap_model ap_name archived datetime displayname freq is is_negative key list model monitor msg name negative rest", "module": "monitor", "name": "unifi_list_alarms"}, {"description": "List all broadcast groups", "keywords": "advanced broadcast broadcast_group broadcast_groups broadcastgroup group groups list rest", "module": "advanced", "name": "unifi_list_broadcast_groups"}, {"description": "Get a single broadcast group by ID", "keywords": "advanced broadcast broadcast_group broadcast_groups broadcastgroup get group groups rest", "module": "advanced", "name": "unifi_get_broadcast_group"}, {"description": "Create a new broadcast group", "keywords": "advanced broadcast broadcast_group broadcast_groups broadcastgroup create group groups rest", "module": "advanced", "name": "unifi_create_broadcast_group"}, {"description": "Update an existing broadcast group", "keywords": "advanced broadcast broadcast_group broadcast_groups broadcastgroup group groups rest update", "module": "advanced", "name": "unifi_update_broadcast_group"}, {"description": "Delete a broadcast group", "keywords": "advanced broadcast broadcast_group broadcast_groups broadcastgroup delete group groups rest", "module": "advanced", "name": "unifi_delete_broadcast_group"}, {"description": "List all channel plans", "keywords": "channel channel_plan channel_plans channelplan list plan plans rest wifi", "module": "wifi", "name": "unifi_list_channel_plans"}, {"description": "List all device configs", "keywords": "config configs device device_config device_configs list rest", "module": "device", "name": "unifi_list_device_configs"}, {"description": "List all dhcp options", "keywords": "dhcp dhcp_option dhcp_options dhcpoption firewall list option options rest", "module": "firewall", "name": "unifi_list_dhcp_options"}, {"description": "Get a single dhcp option by ID", "keywords": "dhcp dhcp_option dhcp_options dhcpoption firewall get option options rest", "module": "firewall", "name": "unifi_get_dhcp_option"}, {"description": "Create a new dhcp option", "keywords": "create dhcp dhcp_option dhcp_options dhcpoption firewall option options rest", "module": "firewall", "name": "unifi_create_dhcp_option"}, {"description": "Update an existing dhcp option", "keywords": "dhcp dhcp_option dhcp_options dhcpoption firewall option options rest update", "module": "firewall", "name": "unifi_update_dhcp_option"}, {"description": "Delete a dhcp option", "keywords": "delete dhcp dhcp_option dhcp_options dhcpoption firewall option options rest", "module": "firewall", "name": "unifi_delete_dhcp_option"}, {"description": "List all dns records", "keywords": "dns dns_record dns_records dnsrecord firewall list record records rest", "module": "firewall", "name": "unifi_list_dns_records"}, {"description": "Get a single dns record by ID", "keywords": "dns dns_record dns_records dnsrecord firewall get record records rest", "module": "firewall", "name": "unifi_get_dns_record"}, {"description": "Create a new dns record", "keywords": "create dns dns_record dns_records dnsrecord firewall record records rest", "module": "firewall", "name": "unifi_create_dns_record"}, {"description": "Update an existing dns record", "keywords": "dns dns_record dns_records dnsrecord firewall record records rest update", "module": "firewall", "name": "unifi_update_dns_record"}, {"description": "Delete a dns record", "keywords": "delete dns dns_record dns_records dnsrecord firewall record records rest", "module": "firewall", "name": "unifi_delete_dns_record"}, {"description": "List all dpi apps", "keywords": "advanced app apps dpi dpi_app dpi_apps dpiapp list rest", "module": "advanced", "name": "unifi_list_dpi_apps"}, {"description": "Get a single dpi app by ID", "keywords": "advanced app apps dpi dpi_app dpi_apps dpiapp get rest", "module": "advanced", "name": "unifi_get_dpi_app"}, {"description": "Create a new dpi app", "keywords": "advanced app apps create dpi dpi_app dpi_apps dpiapp rest", "module": "advanced", "name": "unifi_create_dpi_app"}, {"description": "Update an existing dpi app", "keywords": "advanced app apps dpi dpi_app dpi_apps dpiapp rest update", "module": "advanced", "name": "unifi_update_dpi_app"}, {"description": "Delete a dpi app", "keywords": "advanced app apps delete dpi dpi_app dpi_apps dpiapp rest", "module": "advanced", "name": "unifi_delete_dpi_app"}, {"description": "List all dpi groups", "keywords": "advanced dpi dpi_group dpi_groups dpigroup group groups list name rest", "module": "advanced", "name": "unifi_list_dpi_groups"}, {"description": "Get a single dpi group by ID", "keywords": "advanced dpi dpi_group dpi_groups dpigroup get group groups name rest", "module": "advanced", "name": "unifi_get_dpi_group"}, {"description": "Create a new dpi group", "keywords": "advanced create dpi dpi_group dpi_groups dpigroup group groups name rest", "module": "advanced", "name": "unifi_create_dpi_group"}, {"description": "Update an existing dpi group", "keywords": "advanced dpi dpi_group dpi_groups dpigroup group groups name rest update", "module": "advanced", "name": "unifi_update_dpi_group"}, {"description": "Delete a dpi group", "keywords": "advanced delete dpi dpi_group dpi_groups dpigroup group groups name rest", "module": "advanced", "name": "unifi_delete_dpi_group"}, {"description": "List all dynamic dns entries", "keywords": "dns dynamic dynamic_dns dynamic_dns_entries dynamicdns entries firewall list rest", "module": "firewall", "name": "unifi_list_dynamic_dns_entries"}, {"description": "Get a single dynamic dns by ID", "keywords": "dns dynamic dynamic_dns dynamic_dns_entries dynamicdns entries firewall get rest", "module": "firewall", "name": "unifi_get_dynamic_dns"}, {"description": "Create a new dynamic dns", "keywords": "create dns dynamic dynamic_dns dynamic_dns_entries dynamicdns entries firewall rest", "module": "firewall", "name": "unifi_create_dynamic_dns"}, {"description": "Update an existing dynamic dns", "keywords": "dns dynamic dynamic_dns dynamic_dns_entries dynamicdns entries firewall rest update", "module": "firewall", "name": "unifi_update_dynamic_dns"}, {"description": "Delete a dynamic dns", "keywords": "delete dns dynamic dynamic_dns dynamic_dns_entries dynamicdns entries firewall rest", "module": "firewall", "name": "unifi_delete_dynamic_dns"}, {"description": "List all elements", "keywords": "device element elements list rest", "module": "device", "name": "unifi_list_elements"}, {"description": "List all events", "keywords": "ap ap_displayname ap_model ap_name channel channel_from channel_to datetime displayname event events freq from guest is is_negative list model monitor name negative rest to", "module": "monitor", "name": "unifi_list_events"}, {"description": "List all firewall groups", "keywords": "firewall firewall_group firewall_groups firewallgroup group groups list rest", "module": "firewall", "name": "unifi_list_firewall_groups"}, {"description": "Get a single firewall group by ID", "keywords": "firewall firewall_group firewall_groups firewallgroup get group groups rest", "module": "firewall", "name": "unifi_get_firewall_group"}, {"description": "Create a new firewall group", "keywords": "create firewall firewall_group firewall_groups firewallgroup group groups rest", "module": "firewall", "name": "unifi_create_firewall_group"}, {"description": "Update an existing firewall group", "keywords": "firewall firewall_group firewall_groups firewallgroup group groups rest update", "module": "firewall", "name": "unifi_update_firewall_group"}, {"description": "Delete a firewall group", "keywords": "delete firewall firewall_group firewall_groups firewallgroup group groups rest", "module": "firewall", "name": "unifi_delete_firewall_group"}, {"description": "List all firewall rules", "keywords": "firewall firewall_rule firewall_rules firewallrule list rest rule rules", "module": "firewall", "name": "unifi_list_firewall_rules"}, {"description": "Get a single firewall rule by ID", "keywords": "firewall firewall_rule firewall_rules firewallrule get rest rule rules", "module": "firewall", "name": "unifi_get_firewall_rule"}, {"description": "Create a new firewall rule", "keywords": "create firewall firewall_rule firewall_rules firewallrule rest rule rules", "module": "firewall", "name": "unifi_create_firewall_rule"}, {"description": "Update an existing firewall rule", "keywords": "firewall firewall_rule firewall_rules firewallrule rest rule rules update", "module": "firewall", "name": "unifi_update_firewall_rule"}, {"description": "Delete a firewall rule", "keywords": "delete firewall firewall_rule firewall_rules firewallrule rest rule rules", "module": "firewall", "name": "unifi_delete_firewall_rule"}, {"description": "List all heatmaps", "keywords": "advanced heatmap heatmaps list rest", "module": "advanced", "name": "unifi_list_heatmaps"}, {"description": "Get a single heatmap by ID", "keywords": "advanced get heatmap heatmaps rest", "module": "advanced", "name": "unifi_get_heatmap"}, {"description": "Create a new heatmap", "keywords": "advanced create heatmap heatmaps rest", "module": "advanced", "name": "unifi_create_heatmap"}, {"description": "Update an existing heatmap", "keywords": "advanced heatmap heatmaps rest update", "module": "advanced", "name": "unifi_update_heatmap"}, {"description": "Delete a heatmap", "keywords": "advanced delete heatmap heatmaps rest", "module": "advanced", "name": "unifi_delete_heatmap"}, {"description": "List all heatmap points", "keywords": "advanced heatmap heatmap_point heatmap_points heatmappoint list point points rest", "module": "advanced", "name": "unifi_list_heatmap_points"}, {"description": "Get a single heatmap point by ID", "keywords": "advanced get heatmap heatmap_point heatmap_points heatmappoint point points rest", "module": "advanced", "name": "unifi_get_heatmap_point"}, {"description": "Create a new heatmap point", "keywords": "advanced create heatmap heatmap_point heatmap_points heatmappoint point points rest", "module": "advanced", "name": "unifi_create_heatmap_point"}, {"description": "Update an existing heatmap point", "keywords": "advanced heatmap heatmap_point heatmap_points heatmappoint point points rest update", "module": "advanced", "name": "unifi_update_heatmap_point"}, {"description": "Delete a heatmap point", "keywords": "advanced delete heatmap heatmap_point heatmap_points heatmappoint point points rest", "module": "advanced", "name": "unifi_delete_heatmap_point"}, {"description": "List all hotspot2 configs", "keywords": "config configs hotspot hotspot2 hotspot2_config hotspot2_configs hotspot2conf list rest", "module": "hotspot", "name": "unifi_list_hotspot2_configs"}, {"description": "Get a single hotspot2 config by ID", "keywords": "config configs get hotspot hotspot2 hotspot2_config hotspot2_configs hotspot2conf rest", "module": "hotspot", "name": "unifi_get_hotspot2_config"}, {"description": "Create a new hotspot2 config", "keywords": "config configs create hotspot hotspot2 hotspot2_config hotspot2_configs hotspot2conf rest", "module": "hotspot", "name": "unifi_create_hotspot2_config"}, {"description": "Update an existing hotspot2 config", "keywords": "config configs hotspot hotspot2 hotspot2_config hotspot2_configs hotspot2conf rest update", "module": "hotspot", "name": "unifi_update_hotspot2_config"}, {"description": "Delete a hotspot2 config", "keywords": "config configs delete hotspot hotspot2 hotspot2_config hotspot2_configs hotspot2conf rest", "module": "hotspot", "name": "unifi_delete_hotspot2_config"}, {"description": "List all hotspot operators", "keywords": "hotspot hotspot_operator hotspot_operators hotspotop list operator operators rest", "module": "hotspot", "name": "unifi_list_hotspot_operators"}, {"description": "Get a single hotspot operator by ID", "keywords": "get hotspot hotspot_operator hotspot_operators hotspotop operator operators rest", "module": "hotspot", "name": "unifi_get_hotspot_operator"}, {"description": "Create a new hotspot operator", "keywords": "create hotspot hotspot_operator hotspot_operators hotspotop operator operators rest", "module": "hotspot", "name": "unifi_create_hotspot_operator"}, {"description": "Update an existing hotspot operator", "keywords": "hotspot hotspot_operator hotspot_operators hotspotop operator operators rest update", "module": "hotspot", "name": "unifi_update_hotspot_operator"}, {"description": "Delete a hotspot operator", "keywords": "delete hotspot hotspot_operator hotspot_operators hotspotop operator operators rest", "module": "hotspot", "name": "unifi_delete_hotspot_operator"}, {"description": "List all hotspot packages", "keywords": "hotspot hotspot_package hotspot_packages hotspotpackage list package packages rest", "module": "hotspot", "name": "unifi_list_hotspot_packages"}, {"description": "Get a single hotspot package by ID", "keywords": "get hotspot hotspot_package hotspot_packages hotspotpackage package packages rest", "module": "hotspot", "name": "unifi_get_hotspot_package"}, {"description": "Create a new hotspot package", "keywords": "create hotspot hotspot_package hotspot_packages hotspotpackage package packages rest", "module": "hotspot", "name": "unifi_create_hotspot_package"}, {"description": "Update an existing hotspot package", "keywords": "hotspot hotspot_package hotspot_packages hotspotpackage package packages rest update", "module": "hotspot", "name": "unifi_update_hotspot_package"}, {"description": "Delete a hotspot package", "keywords": "delete hotspot hotspot_package hotspot_packages hotspotpackage package packages rest", "module": "hotspot", "name": "unifi_delete_hotspot_package"}, {"description": "List all maps", "keywords": "advanced content content_type filename filesize height last last_modified left list map maps md5 modified name offset offset_left offset_top rest selected top type", "module": "advanced", "name": "unifi_list_maps"}, {"description": "Get a single map by ID", "keywords": "advanced content content_type filename filesize get height last last_modified left map maps md5 modified name offset offset_left offset_top rest selected top type", "module": "advanced", "name": "unifi_get_map"}, {"description": "Create a new map", "keywords": "advanced content content_type create filename filesize height last last_modified left map maps md5 modified name offset offset_left offset_top rest selected top type", "module": "advanced", "name": "unifi_create_map"}, {"description": "Update an existing map", "keywords": "advanced content content_type filename filesize height last last_modified left map maps md5 modified name offset offset_left offset_top rest selected top type update", "module": "advanced", "name": "unifi_update_map"}, {"description": "Delete a map", "keywords": "advanced content content_type delete filename filesize height last last_modified left map maps md5 modified name offset offset_left offset_top rest selected top type", "module": "advanced", "name": "unifi_delete_map"}, {"description": "List all media files", "keywords": "advanced file files list media media_file media_files mediafile rest", "module": "advanced", "name": "unifi_list_media_files"}, {"description": "Get a single media file by ID", "keywords": "advanced file files get media media_file media_files mediafile rest", "module": "advanced", "name": "unifi_get_media_file"}, {"description": "Create a new media file", "keywords": "advanced create file files media media_file media_files mediafile rest", "module": "advanced", "name": "unifi_create_media_file"}, {"description": "Update an existing media file", "keywords": "advanced file files media media_file media_files mediafile rest update", "module": "advanced", "name": "unifi_update_media_file"}, {"description": "Delete a media file", "keywords": "advanced delete file files media media_file media_files mediafile rest", "module": "advanced", "name": "unifi_delete_media_file"}, {"description": "List all networks", "keywords": "auto auto_scale_enabled dhcpd dhcpd_enabled dhcpd_start dhcpd_stop dhcpdv6 dhcpdv6_dns_auto dns enabled interface ipv6 ipv6_interface_type ipv6_ra_priority ipv6_setting_preference list network networkconf networkgroup networks preference priority purpose ra rest scale setting start stop type", "module": "network", "name": "unifi_list_networks"}, {"description": "Get a single network by ID", "keywords": "auto auto_scale_enabled dhcpd dhcpd_enabled dhcpd_start dhcpd_stop dhcpdv6 dhcpdv6_dns_auto dns enabled get interface ipv6 ipv6_interface_type ipv6_ra_priority ipv6_setting_preference network networkconf networkgroup networks preference priority purpose ra rest scale setting start stop type", "module": "network", "name": "unifi_get_network"}, {"description": "Create a new network", "keywords": "auto auto_scale_enabled create dhcpd dhcpd_enabled dhcpd_start dhcpd_stop dhcpdv6 dhcpdv6_dns_auto dns enabled interface ipv6 ipv6_interface_type ipv6_ra_priority ipv6_setting_preference network networkconf networkgroup networks preference priority purpose ra rest scale setting start stop type", "module": "network", "name": "unifi_create_network"}, {"description": "Update an existing network", "keywords": "auto auto_scale_enabled dhcpd dhcpd_enabled dhcpd_start dhcpd_stop dhcpdv6 dhcpdv6_dns_auto dns enabled interface ipv6 ipv6_interface_type ipv6_ra_priority ipv6_setting_preference network networkconf networkgroup networks preference priority purpose ra rest scale setting start stop type update", "module": "network", "name": "unifi_update_network"}, {"description": "Delete a network", "keywords": "auto auto_scale_enabled delete dhcpd dhcpd_enabled dhcpd_start dhcpd_stop dhcpdv6 dhcpdv6_dns_auto dns enabled interface ipv6 ipv6_interface_type ipv6_ra_priority ipv6_setting_preference network networkconf networkgroup networks preference priority purpose ra rest scale setting start stop type", "module": "network", "name": "unifi_delete_network"}, {"description": "List all port profiles", "keywords": "autoneg ctrl dot1x dot1x_ctrl dot1x_idle_timeout egress egress_rate_limit_kbps egress_rate_limit_kbps_enabled enabled excluded excluded_networkconf_ids forward idle ids isolation kbps limit list lldpmed lldpmed_enabled lldpmed_notify_enabled network networkconf notify port port_profile port_profiles portconf profile profiles rate rest timeout", "module": "network", "name": "unifi_list_port_profiles"}, {"description": "Get a single port profile by ID", "keywords": "autoneg ctrl dot1x dot1x_ctrl dot1x_idle_timeout egress egress_rate_limit_kbps egress_rate_limit_kbps_enabled enabled excluded excluded_networkconf_ids forward get idle ids isolation kbps limit lldpmed lldpmed_enabled lldpmed_notify_enabled network networkconf notify port port_profile port_profiles portconf profile profiles rate rest timeout", "module": "network", "name": "unifi_get_port_profile"}, {"description": "Create a new port profile", "keywords": "autoneg create ctrl dot1x dot1x_ctrl dot1x_idle_timeout egress egress_rate_limit_kbps egress_rate_limit_kbps_enabled enabled excluded excluded_networkconf_ids forward idle ids isolation kbps limit lldpmed lldpmed_enabled lldpmed_notify_enabled network networkconf notify port port_profile port_profiles portconf profile profiles rate rest timeout", "module": "network", "name": "unifi_create_port_profile"}, {"description": "Update an existing port profile", "keywords": "autoneg ctrl dot1x dot1x_ctrl dot1x_idle_timeout egress egress_rate_limit_kbps egress_rate_limit_kbps_enabled enabled excluded excluded_networkconf_ids forward idle ids isolation kbps limit lldpmed lldpmed_enabled lldpmed_notify_enabled network networkconf notify port port_profile port_profiles portconf profile profiles rate rest timeout update", "module": "network", "name": "unifi_update_port_profile"}, {"description": "Delete a port profile", "keywords": "autoneg ctrl delete dot1x dot1x_ctrl dot1x_idle_timeout egress egress_rate_limit_kbps egress_rate_limit_kbps_enabled enabled excluded excluded_networkconf_ids forward idle ids isolation kbps limit lldpmed lldpmed_enabled lldpmed_notify_enabled network networkconf notify port port_profile port_profiles portconf profile profiles rate rest timeout", "module": "network", "name": "unifi_delete_port_profile"}, {"description": "List all port forwards", "keywords": "firewall forward forwards list port port_forward port_forwards portforward rest", "module": "firewall", "name": "unifi_list_port_forwards"}, {"description": "Get a single port forward by ID", "keywords": "firewall forward forwards get port port_forward port_forwards portforward rest", "module": "firewall", "name": "unifi_get_port_forward"}, {"description": "Create a new port forward", "keywords": "create firewall forward forwards port port_forward port_forwards portforward rest", "module": "firewall", "name": "unifi_create_port_forward"}, {"description": "Update an existing port forward", "keywords": "firewall forward forwards port port_forward port_forwards portforward rest update", "module": "firewall", "name": "unifi_update_port_forward"}, {"description": "Delete a port forward", "keywords": "delete firewall forward forwards port port_forward port_forwards portforward rest", "module": "firewall", "name": "unifi_delete_port_forward"}, {"description": "List all radius accounts", "keywords": "account accounts hotspot list radius radius_account radius_accounts radiusaccount rest", "module": "hotspot", "name": "unifi_list_radius_accounts"}, {"description": "Get a single radius account by ID", "keywords": "account accounts get hotspot radius radius_account radius_accounts radiusaccount rest", "module": "hotspot", "name": "unifi_get_radius_account"}, {"description": "Create a new radius account", "keywords": "account accounts create hotspot radius radius_account radius_accounts radiusaccount rest", "module": "hotspot", "name": "unifi_create_radius_account"}, {"description": "Update an existing radius account", "keywords": "account accounts hotspot radius radius_account radius_accounts radiusaccount rest update", "module": "hotspot", "name": "unifi_update_radius_account"}, {"description": "Delete a radius account", "keywords": "account accounts delete hotspot radius radius_account radius_accounts radiusaccount rest", "module": "hotspot", "name": "unifi_delete_radius_account"}, {"description": "List all radius profiles", "keywords": "acct acct_servers auth auth_servers external external_id hotspot id list name profile profiles radius radius_profile radius_profiles radiusprofile rest server servers use use_usg_auth_server usg", "module": "hotspot", "name": "unifi_list_radius_profiles"}, {"description": "Get a single radius profile by ID", "keywords": "acct acct_servers auth auth_servers external external_id get hotspot id name profile profiles radius radius_profile radius_profiles radiusprofile rest server servers use use_usg_auth_server usg", "module": "hotspot", "name": "unifi_get_radius_profile"}, {"description": "Create a new radius profile", "keywords": "acct acct_servers auth auth_servers create external external_id hotspot id name profile profiles radius radius_profile radius_profiles radiusprofile rest server servers use use_usg_auth_server usg", "module": "hotspot", "name": "unifi_create_radius_profile"}, {"description": "Update an existing radius profile", "keywords": "acct acct_servers auth auth_servers external external_id hotspot id name profile profiles radius radius_profile radius_profiles radiusprofile rest server servers update use use_usg_auth_server usg", "module": "hotspot", "name": "unifi_update_radius_profile"}, {"description": "Delete a radius profile", "keywords": "acct acct_servers auth auth_servers delete external external_id hotspot id name profile profiles radius radius_profile radius_profiles radiusprofile rest server servers use use_usg_auth_server usg", "module": "hotspot", "name": "unifi_delete_radius_profile"}, {"description": "List all known rogue aps", "keywords": "advanced ap aps known known_rogue_ap known_rogue_aps list rest rogue rogueknown", "module": "advanced", "name": "unifi_list_known_rogue_aps"}, {"description": "List all routes", "keywords": "firewall list rest route routes routing", "module": "firewall", "name": "unifi_list_routes"}, {"description": "Get a single route by ID", "keywords": "firewall get rest route routes routing", "module": "firewall", "name": "unifi_get_route"}, {"description": "Create a new route", "keywords": "create firewall rest route routes routing", "module": "firewall", "name": "unifi_create_route"}, {"description": "Update an existing route", "keywords": "firewall rest route routes routing update", "module": "firewall", "name": "unifi_update_route"}, {"description": "Delete a route", "keywords": "delete firewall rest route routes routing", "module": "firewall", "name": "unifi_delete_route"}, {"description": "List all schedule tasks", "keywords": "action advanced cron cron_expr execute execute_only_once expr id list name once only rest schedule schedule_task schedule_tasks scheduletask site site_id targets task tasks upgrade upgrade_targets", "module": "advanced", "name": "unifi_list_schedule_tasks"}, {"description": "Get a single schedule task by ID", "keywords": "action advanced cron cron_expr execute execute_only_once expr get id name once only rest schedule schedule_task schedule_tasks scheduletask site site_id targets task tasks upgrade upgrade_targets", "module": "advanced", "name": "unifi_get_schedule_task"}, {"description": "Create a new schedule task", "keywords": "action advanced create cron cron_expr execute execute_only_once expr id name once only rest schedule schedule_task schedule_tasks scheduletask site site_id targets task tasks upgrade upgrade_targets", "module": "advanced", "name": "unifi_create_schedule_task"}, {"description": "Update an existing schedule task", "keywords": "action advanced cron cron_expr execute execute_only_once expr id name once only rest schedule schedule_task schedule_tasks scheduletask site site_id targets task tasks update upgrade upgrade_targets", "module": "advanced", "name": "unifi_update_schedule_task"}, {"description": "Delete a schedule task", "keywords": "action advanced cron cron_expr delete execute execute_only_once expr id name once only rest schedule schedule_task schedule_tasks scheduletask site site_id targets task tasks upgrade upgrade_targets", "module": "advanced", "name": "unifi_delete_schedule_task"}, {"description": "List all site settings", "keywords": "admin advanced advanced_filtering_preference auth auto auto_channel_presets_type autobackup autobackup_cron_expr autobackup_timezone channel cron cron_expr data data_retention_setting_preference default default_security_posture expr filtering fingerbank fingerbank_key ips ips_mode key list mode posture preference presets retention security setting settings timezone type", "module": "admin", "name": "unifi_list_settings"}, {"description": "Get a specific site setting by key", "keywords": "admin advanced advanced_filtering_preference auth auto auto_channel_presets_type autobackup autobackup_cron_expr autobackup_timezone channel cron cron_expr data data_retention_setting_preference default default_security_posture expr filtering fingerbank fingerbank_key get ips ips_mode key mode posture preference presets retention security setting timezone type", "module": "admin", "name": "unifi_get_setting"}, {"description": "Update a site setting", "keywords": "admin advanced advanced_filtering_preference auth auto auto_channel_presets_type autobackup autobackup_cron_expr autobackup_timezone channel cron cron_expr data data_retention_setting_preference default default_security_posture expr filtering fingerbank fingerbank_key ips ips_mode key mode posture preference presets retention security setting timezone type update", "module": "admin", "name": "unifi_update_setting"}, {"description": "List all spatial records", "keywords": "advanced list record records rest spatial spatial_record spatial_records spatialrecord", "module": "advanced", "name": "unifi_list_spatial_records"}, {"description": "Get a single spatial record by ID", "keywords": "advanced get record records rest spatial spatial_record spatial_records spatialrecord", "module": "advanced", "name": "unifi_get_spatial_record"}, {"description": "Create a new spatial record", "keywords": "advanced create record records rest spatial spatial_record spatial_records spatialrecord", "module": "advanced", "name": "unifi_create_spatial_record"}, {"description": "Update an existing spatial record", "keywords": "advanced record records rest spatial spatial_record spatial_records spatialrecord update", "module": "advanced", "name": "unifi_update_spatial_record"}, {"description": "Delete a spatial record", "keywords": "advanced delete record records rest spatial spatial_record spatial_records spatialrecord", "module": "advanced", "name": "unifi_delete_spatial_record"}, {"description": "List all tags", "keywords": "admin list rest tag tags", "module": "admin", "name": "unifi_list_tags"}, {"description": "Get a single tag by ID", "keywords": "admin get rest tag tags", "module": "admin", "name": "unifi_get_tag"}, {"description": "Create a new tag", "keywords": "admin create rest tag tags", "module": "admin", "name": "unifi_create_tag"}, {"description": "Update an existing tag", "keywords": "admin rest tag tags update", "module": "admin", "name": "unifi_update_tag"}, {"description": "Delete a tag", "keywords": "admin delete rest tag tags", "module": "admin", "name": "unifi_delete_tag"}, {"description": "List all users", "keywords": "1x client connection disconnect disconnect_timestamp first first_seen guest hostname id identity ip is is_guest is_wired last last_1x_identity last_connection_network_id last_connection_network_name last_ip last_radio list name network radio rest seen timestamp user users wired", "module": "client", "name": "unifi_list_users"}, {"description": "Get a single user by ID", "keywords": "1x client connection disconnect disconnect_timestamp first first_seen get guest hostname id identity ip is is_guest is_wired last last_1x_identity last_connection_network_id last_connection_network_name last_ip last_radio name network radio rest seen timestamp user users wired", "module": "client", "name": "unifi_get_user"}, {"description": "Create a new user", "keywords": "1x client connection create disconnect disconnect_timestamp first first_seen guest hostname id identity ip is is_guest is_wired last last_1x_identity last_connection_network_id last_connection_network_name last_ip last_radio name network radio rest seen timestamp user users wired", "module": "client", "name": "unifi_create_user"}, {"description": "Update an existing user", "keywords": "1x client connection disconnect disconnect_timestamp first first_seen guest hostname id identity ip is is_guest is_wired last last_1x_identity last_connection_network_id last_connection_network_name last_ip last_radio name network radio rest seen timestamp update user users wired", "module": "client", "name": "unifi_update_user"}, {"description": "List all user groups", "keywords": "admin down group groups list max name qos qos_rate_max_down qos_rate_max_up rate rest up user user_group user_groups usergroup", "module": "admin", "name": "unifi_list_user_groups"}, {"description": "Get a single user group by ID", "keywords": "admin down get group groups max name qos qos_rate_max_down qos_rate_max_up rate rest up user user_group user_groups usergroup", "module": "admin", "name": "unifi_get_user_group"}, {"description": "Create a new user group", "keywords": "admin create down group groups max name qos qos_rate_max_down qos_rate_max_up rate rest up user user_group user_groups usergroup", "module": "admin", "name": "unifi_create_user_group"}, {"description": "Update an existing user group", "keywords": "admin down group groups max name qos qos_rate_max_down qos_rate_max_up rate rest up update user user_group user_groups usergroup", "module": "admin", "name": "unifi_update_user_group"}, {"description": "Delete a user group", "keywords": "admin delete down group groups max name qos qos_rate_max_down qos_rate_max_up rate rest up user user_group user_groups usergroup", "module": "admin", "name": "unifi_delete_user_group"}, {"description": "List all virtual devices", "keywords": "device devices list rest virtual virtual_device virtual_devices virtualdevice", "module": "device", "name": "unifi_list_virtual_devices"}, {"description": "List all wlans", "keywords": "6e ap ap_group_ids ap_group_mode b b_supported bc bc_filter_enabled bc_filter_list bss bss_transition dtim dtim_6e dtim_mode dtim_na dtim_ng enabled filter group ids list mode na ng rest supported transition wifi wlan wlanconf wlans", "module": "wifi", "name": "unifi_list_wlans"}, {"description": "Get a single wlan by ID", "keywords": "6e ap ap_group_ids ap_group_mode b b_supported bc bc_filter_enabled bc_filter_list bss bss_transition dtim dtim_6e dtim_mode dtim_na dtim_ng enabled filter get group ids list mode na ng rest supported transition wifi wlan wlanconf wlans", "module": "wifi", "name": "unifi_get_wlan"}, {"description": "Create a new wlan", "keywords": "6e ap ap_group_ids ap_group_mode b b_supported bc bc_filter_enabled bc_filter_list bss bss_transition create dtim dtim_6e dtim_mode dtim_na dtim_ng enabled filter group ids list mode na ng rest supported transition wifi wlan wlanconf wlans", "module": "wifi", "name": "unifi_create_wlan"}, {"description": "Update an existing wlan", "keywords": "6e ap ap_group_ids ap_group_mode b b_supported bc bc_filter_enabled bc_filter_list bss bss_transition dtim dtim_6e dtim_mode dtim_na dtim_ng enabled filter group ids list mode na ng rest supported transition update wifi wlan wlanconf wlans", "module": "wifi", "name": "unifi_update_wlan"}, {"description": "Delete a wlan", "keywords": "6e ap ap_group_ids ap_group_mode b b_supported bc bc_filter_enabled bc_filter_list bss bss_transition delete dtim dtim_6e dtim_mode dtim_na dtim_ng enabled filter group ids list mode na ng rest supported transition wifi wlan wlanconf wlans", "module": "wifi", "name": "unifi_delete_wlan"}, {"description": "List all wlan groups", "keywords": "group groups list name rest wifi wlan wlan_group wlan_groups wlangroup", "module": "wifi", "name": "unifi_list_wlan_groups"}, {"description": "Get a single wlan group by ID", "keywords": "get group groups name rest wifi wlan wlan_group wlan_groups wlangroup", "module": "wifi", "name": "unifi_get_wlan_group"}, {"description": "Create a new wlan group", "keywords": "create group groups name rest wifi wlan wlan_group wlan_groups wlangroup", "module": "wifi", "name": "unifi_create_wlan_group"}, {"description": "Update an existing wlan group", "keywords": "group groups name rest update wifi wlan wlan_group wlan_groups wlangroup", "module": "wifi", "name": "unifi_update_wlan_group"}, {"description": "Delete a wlan group", "keywords": "delete group groups name rest wifi wlan wlan_group wlan_groups wlangroup", "module": "wifi", "name": "unifi_delete_wlan_group"}, {"description": "List stat alarms", "keywords": "alarm alarms ap ap_displayname ap_model ap_name archived datetime displayname freq is is_negative key list model monitor msg name negative stat stat_alarms", "module": "monitor", "name": "unifi_list_stat_alarms"}, {"description": "List all users", "keywords": "1x all all_users alluser client connection disconnect disconnect_timestamp first first_seen guest hostname id identity ip is is_guest is_wired last last_1x_identity last_connection_network_id last_connection_network_name last_ip last_radio list name network radio seen stat timestamp users wired", "module": "client", "name": "unifi_list_all_users"}, {"description": "List anomalies (site anomalies (unpoller). Supports ?scale=hourly\u0026end=\u003ctimestamp\u003e)", "keywords": "anomalies anomaly list mac monitor stat timestamps", "module": "monitor", "name": "unifi_list_anomalies"}, {"description": "List authorizations", "keywords": "authorization authorizations list monitor stat", "module": "monitor", "name": "unifi_list_authorizations"}, {"description": "List country codes", "keywords": "ccode codes country country_codes list stat wifi", "module": "wifi", "name": "unifi_list_country_codes"}, {"description": "List current channels", "keywords": "channel channels current current_channel current_channels list stat wifi", "module": "wifi", "name": "unifi_list_current_channels"}, {"description": "List dashboard", "keywords": "dashboard list monitor stat", "module": "monitor", "name": "unifi_list_dashboard"}, {"description": "List devices (also POST with macs filter)", "keywords": "_uptime adopt adopt_ip adopt_url adoptable adoptable_when_upgraded adopted adopted_at adopted_by_client adoption adoption_completed anomalies anon anon_id at by client completed device devices id ip list stat upgraded uptime url when", "module": "device", "name": "unifi_list_devices"}, {"description": "List devices basic", "keywords": "adopted basic device device_basic devices devices_basic disabled gateway in in_gateway_mode list mac mode model name stat state type", "module": "device", "name": "unifi_list_devices_basic"}, {"description": "List dpi stats (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "keywords": "dpi dpi_stats list monitor stat stats", "module": "monitor", "name": "unifi_list_dpi_stats"}, {"description": "List dynamic dns stats (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "keywords": "dns dynamic dynamic_dns_stats dynamicdns list monitor stat stats", "module": "monitor", "name": "unifi_list_dynamic_dns_stats"}, {"description": "List stat events", "keywords": "admin ap ap_displayname ap_model ap_name channel channel_from channel_to datetime displayname event events freq from guest list model monitor name stat stat_events to", "module": "monitor", "name": "unifi_list_stat_events"}, {"description": "List gateway stats (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "keywords": "gateway gateway_stats list monitor stat stats", "module": "monitor", "name": "unifi_list_gateway_stats"}, {"description": "List guests", "keywords": "client guest guests list stat", "module": "client", "name": "unifi_list_guests"}, {"description": "List health", "keywords": "health list monitor stat", "module": "monitor", "name": "unifi_list_health"}, {"description": "List ips events (IDS/IPS events \u2014 singular form (unpoller APIEventPathIDS))", "keywords": "event events ips ips_event ips_events list monitor stat", "module": "monitor", "name": "unifi_list_ips_events"}, {"description": "List payments", "keywords": "hotspot list payment payments stat", "module": "hotspot", "name": "unifi_list_payments"}, {"description": "List port forward stats (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "keywords": "forward list monitor port port_forward_stats portforward stat stats", "module": "monitor", "name": "unifi_list_port_forward_stats"}, {"description": "List remote user vpn (remote user VPN stats)", "keywords": "list monitor remote remote_user_vpn remoteuservpn stat user vpn", "module": "monitor", "name": "unifi_list_remote_user_vpn"}, {"description": "List report (intervals: 5minutes, hourly, daily, monthly; types: site, ap, user, gw)", "keywords": "list monitor num num_sta o oid report site sta stat", "module": "monitor", "name": "unifi_list_report"}, {"description": "List report 5min ap", "keywords": "5min ap list monitor report report_5min_ap stat", "module": "monitor", "name": "unifi_list_report_5min_ap"}, {"description": "List report 5min gateway (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "keywords": "5min gateway gw list monitor report report_5min_gateway report_5min_gw stat", "module": "monitor", "name": "unifi_list_report_5min_gateway"}, {"description": "List speedtest results (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "keywords": "archive list monitor report report_archive_speedtest results speedtest speedtest_results stat", "module": "monitor", "name": "unifi_list_speedtest_results"}, {"description": "List report daily gateway (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "keywords": "daily gateway gw list monitor report report_daily_gateway report_daily_gw stat", "module": "monitor", "name": "unifi_list_report_daily_gateway"}, {"description": "List report hourly gateway (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "keywords": "gateway gw hourly list monitor report report_hourly_gateway report_hourly_gw stat", "module": "monitor", "name": "unifi_list_report_hourly_gateway"}, {"description": "List report monthly ap", "keywords": "ap list monitor monthly report report_monthly_ap stat", "module": "monitor", "name": "unifi_list_report_monthly_ap"}, {"description": "List report monthly gateway (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "keywords": "gateway gw list monitor monthly report report_monthly_gateway report_monthly_gw stat", "module": "monitor", "name": "unifi_list_report_monthly_gateway"}, {"description": "List report monthly site", "keywords": "list monitor monthly report report_monthly_site site stat", "module": "monitor", "name": "unifi_list_report_monthly_site"}, {"description": "List report monthly user", "keywords": "list monitor monthly report report_monthly_user stat user", "module": "monitor", "name": "unifi_list_report_monthly_user"}, {"description": "List rogue aps", "keywords": "adhoc age ap ap_mac aps band bssid bw center center_freq channel essid freq is is_adhoc list mac monitor rogue rogue_aps rogueap stat", "module": "monitor", "name": "unifi_list_rogue_aps"}, {"description": "List routing stats (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "keywords": "list monitor routing routing_stats stat stats", "module": "monitor", "name": "unifi_list_routing_stats"}, {"description": "List sdn status", "keywords": "list monitor sdn sdn_status stat status", "module": "monitor", "name": "unifi_list_sdn_status"}, {"description": "List sessions (requires POST with {\"type\":\"all\",\"start\":0,\"end\":9999999999})", "keywords": "ap ap_mac assoc assoc_time client duration guest gw gw_mac hostname ip is is_guest is_wired list mac name session sessions stat time wired", "module": "client", "name": "unifi_list_sessions"}, {"description": "List site dpi (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "keywords": "dpi list monitor site site_dpi sitedpi stat", "module": "monitor", "name": "unifi_list_site_dpi"}, {"description": "List spectrum scans", "keywords": "list scan scans spectrum spectrum_scan spectrum_scans stat wifi", "module": "wifi", "name": "unifi_list_spectrum_scans"}, {"description": "List clients (Wireless clients are automatically enriched with network_name (the VLAN/network name from networkconf, resolved via essid \u2192 wlanconf). No manual join needed \u2014 just use fields=essid,network_name to see SSID-to-VLAN mappings.)", "keywords": "_is_guest_by_uap _is_guest_by_usw _last_seen_by_uap _last_seen_by_usw _uptime_by_uap _uptime_by_usw anomalies anon anon_client_id ap ap_mac assoc assoc_time by client clients guest id is last list mac seen sta stat time uap uptime usw", "module": "client", "name": "unifi_list_clients"}, {"description": "List client dpi (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "keywords": "client client_dpi dpi list monitor stadpi stat", "module": "monitor", "name": "unifi_list_client_dpi"}, {"description": "List sysinfo", "keywords": "list monitor stat sysinfo", "module": "monitor", "name": "unifi_list_sysinfo"}, {"description": "List vouchers", "keywords": "hotspot list stat voucher vouchers", "module": "hotspot", "name": "unifi_list_vouchers"}, {"description": "Archive (alarm)", "keywords": "alarm alarm_archive archive cmd monitor", "module": "monitor", "name": "unifi_alarm_archive"}, {"description": "List Backups (backup)", "keywords": "admin backup backups cmd list list_backups", "module": "admin", "name": "unifi_list_backups"}, {"description": "Delete Backup (backup)", "keywords": "admin backup cmd delete delete_backup", "module": "admin", "name": "unifi_delete_backup"}, {"description": "Generate Backup (backup)", "keywords": "admin backup cmd generate generate_backup", "module": "admin", "name": "unifi_generate_backup"}, {"description": "Generate Backup Site (backup)", "keywords": "admin backup cmd generate generate_backup_site site", "module": "admin", "name": "unifi_generate_backup_site"}, {"description": "Adopt (devmgr)", "keywords": "adopt adopt_device cmd device devmgr", "module": "device", "name": "unifi_adopt_device"}, {"description": "Restart (devmgr)", "keywords": "cmd device devmgr restart restart_device", "module": "device", "name": "unifi_restart_device"}, {"description": "Force Provision (devmgr)", "keywords": "cmd device devmgr force force_provision force_provision_device provision", "module": "device", "name": "unifi_force_provision_device"}, {"description": "Power Cycle (devmgr)", "keywords": "cmd cycle device devmgr port power power_cycle power_cycle_port", "module": "device", "name": "unifi_power_cycle_port"}, {"description": "Speedtest (devmgr)", "keywords": "cmd device devmgr run run_speedtest speedtest", "module": "device", "name": "unifi_run_speedtest"}, {"description": "Speedtest Status (devmgr)", "keywords": "cmd device devmgr get get_speedtest_status speedtest speedtest_status status", "module": "device", "name": "unifi_get_speedtest_status"}, {"description": "Set Locate (devmgr)", "keywords": "cmd device devmgr locate locate_device set set_locate", "module": "device", "name": "unifi_locate_device"}, {"description": "Unset Locate (devmgr)", "keywords": "cmd device devmgr locate unlocate unlocate_device unset unset_locate", "module": "device", "name": "unifi_unlocate_device"}, {"description": "Upgrade (devmgr)", "keywords": "cmd device devmgr upgrade upgrade_device", "module": "device", "name": "unifi_upgrade_device"}, {"description": "Upgrade External (devmgr)", "keywords": "cmd device devmgr external upgrade upgrade_device_external upgrade_external", "module": "device", "name": "unifi_upgrade_device_external"}, {"description": "Migrate (devmgr)", "keywords": "cmd device devmgr migrate migrate_device", "module": "device", "name": "unifi_migrate_device"}, {"description": "Cancel Migrate (devmgr)", "keywords": "cancel cancel_migrate cancel_migrate_device cmd device devmgr migrate", "module": "device", "name": "unifi_cancel_migrate_device"}, {"description": "Spectrum Scan (devmgr)", "keywords": "cmd device devmgr scan spectrum spectrum_scan", "module": "device", "name": "unifi_spectrum_scan"}, {"description": "Rename (devmgr)", "keywords": "cmd device devmgr rename rename_device", "module": "device", "name": "unifi_rename_device"}, {"description": "Led Override (devmgr)", "keywords": "cmd device devmgr led led_override led_override_device override", "module": "device", "name": "unifi_led_override_device"}, {"description": "Disable Ap (devmgr)", "keywords": "ap cmd device devmgr disable disable_ap", "module": "device", "name": "unifi_disable_ap"}, {"description": "Rolling Upgrade (devmgr)", "keywords": "admin cmd devmgr rolling rolling_upgrade upgrade", "module": "admin", "name": "unifi_rolling_upgrade"}, {"description": "Cancel Rolling Upgrade (devmgr)", "keywords": "admin cancel cancel_rolling_upgrade cmd devmgr rolling upgrade", "module": "admin", "name": "unifi_cancel_rolling_upgrade"}, {"description": "Check Firmware Update (devmgr)", "keywords": "admin check check_firmware_update cmd devmgr firmware update", "module": "admin", "name": "unifi_check_firmware_update"}, {"description": "Upgrade All Devices (devmgr)", "keywords": "all cmd device devices devmgr upgrade upgrade_all_devices", "module": "device", "name": "unifi_upgrade_all_devices"}, {"description": "Advanced Adopt (devmgr)", "keywords": "adopt advanced advanced_adopt advanced_adopt_device cmd device devmgr", "module": "device", "name": "unifi_advanced_adopt_device"}, {"description": "Set Rollupgrade (devmgr)", "keywords": "admin cmd devmgr rollupgrade set set_rollupgrade", "module": "admin", "name": "unifi_set_rollupgrade"}, {"description": "Unset Rollupgrade (devmgr)", "keywords": "admin cmd devmgr rollupgrade unset unset_rollupgrade", "module": "admin", "name": "unifi_unset_rollupgrade"}, {"description": "Restart Http Portal (devmgr)", "keywords": "cmd device devmgr http portal restart restart_http_portal", "module": "device", "name": "unifi_restart_http_portal"}, {"description": "Enable (devmgr)", "keywords": "cmd device devmgr enable enable_device", "module": "device", "name": "unifi_enable_device"}, {"description": "Disable (devmgr)", "keywords": "cmd device devmgr disable disable_device", "module": "device", "name": "unifi_disable_device"}, {"description": "Cable Test (devmgr)", "keywords": "cable cable_test cmd device devmgr test", "module": "device", "name": "unifi_cable_test"}, {"description": "Set Inform (devmgr)", "keywords": "cmd device devmgr inform set set_inform set_inform_device", "module": "device", "name": "unifi_set_inform_device"}, {"description": "Archive All Alarms (evtmgr)", "keywords": "alarms all archive archive_all_alarms cmd evtmgr monitor", "module": "monitor", "name": "unifi_archive_all_alarms"}, {"description": "Archive Alarm (evtmgr)", "keywords": "alarm archive archive_alarm cmd evtmgr monitor", "module": "monitor", "name": "unifi_archive_alarm"}, {"description": "Authorize Guest (hotspot)", "keywords": "authorize authorize_guest cmd guest hotspot hotspot_authorize_guest", "module": "hotspot", "name": "unifi_hotspot_authorize_guest"}, {"description": "Create Voucher (hotspot)", "keywords": "cmd create create_voucher hotspot voucher", "module": "hotspot", "name": "unifi_create_voucher"}, {"description": "Revoke Voucher (hotspot)", "keywords": "cmd hotspot revoke revoke_voucher voucher", "module": "hotspot", "name": "unifi_revoke_voucher"}, {"description": "Extend Guest Validity (hotspot)", "keywords": "cmd extend extend_guest_validity guest hotspot validity", "module": "hotspot", "name": "unifi_extend_guest_validity"}, {"description": "Delete Voucher (hotspot)", "keywords": "cmd delete delete_voucher hotspot voucher", "module": "hotspot", "name": "unifi_delete_voucher"}, {"description": "Add Site (sitemgr)", "keywords": "add add_site admin cmd site sitemgr", "module": "admin", "name": "unifi_add_site"}, {"description": "Delete Site (sitemgr)", "keywords": "admin cmd delete delete_site site sitemgr", "module": "admin", "name": "unifi_delete_site"}, {"description": "Update Site (sitemgr)", "keywords": "admin cmd site sitemgr update update_site", "module": "admin", "name": "unifi_update_site"}, {"description": "Get Admins (sitemgr)", "keywords": "admin admins cmd get get_admins sitemgr", "module": "admin", "name": "unifi_get_admins"}, {"description": "Move Device (sitemgr)", "keywords": "cmd device move move_device sitemgr", "module": "device", "name": "unifi_move_device"}, {"description": "Delete Device (sitemgr)", "keywords": "cmd delete delete_device device sitemgr", "module": "device", "name": "unifi_delete_device"}, {"description": "Site Leds (sitemgr)", "keywords": "admin cmd leds set set_site_leds site site_leds sitemgr", "module": "admin", "name": "unifi_set_site_leds"}, {"description": "Invite Admin (sitemgr)", "keywords": "admin cmd invite invite_admin sitemgr", "module": "admin", "name": "unifi_invite_admin"}, {"description": "Assign Existing Admin (sitemgr)", "keywords": "admin assign assign_existing_admin cmd existing sitemgr", "module": "admin", "name": "unifi_assign_existing_admin"}, {"description": "Update Admin (sitemgr)", "keywords": "admin cmd sitemgr update update_admin", "module": "admin", "name": "unifi_update_admin"}, {"description": "Revoke Admin (sitemgr)", "keywords": "admin cmd revoke revoke_admin sitemgr", "module": "admin", "name": "unifi_revoke_admin"}, {"description": "Grant Super Admin (sitemgr)", "keywords": "admin cmd grant grant_super_admin sitemgr super", "module": "admin", "name": "unifi_grant_super_admin"}, {"description": "Create Admin (sitemgr)", "keywords": "admin cmd create create_admin sitemgr", "module": "admin", "name": "unifi_create_admin"}, {"description": "Revoke Super Admin (sitemgr)", "keywords": "admin cmd revoke revoke_super_admin sitemgr super", "module": "admin", "name": "unifi_revoke_super_admin"}, {"description": "Block Sta (stamgr)", "keywords": "block block_client block_sta client cmd sta stamgr", "module": "client", "name": "unifi_block_client"}, {"description": "Unblock Sta (stamgr)", "keywords": "client cmd sta stamgr unblock unblock_client unblock_sta", "module": "client", "name": "unifi_unblock_client"}, {"description": "Kick Sta (stamgr)", "keywords": "client cmd kick kick_client kick_sta sta stamgr", "module": "client", "name": "unifi_kick_client"}, {"description": "Forget Sta (stamgr)", "keywords": "client cmd forget forget_client forget_sta sta stamgr", "module": "client", "name": "unifi_forget_client"}, {"description": "Unauthorize Guest (stamgr)", "keywords": "client cmd guest stamgr unauthorize unauthorize_guest", "module": "client", "name": "unifi_unauthorize_guest"}, {"description": "Authorize Guest (stamgr)", "keywords": "authorize authorize_guest client cmd guest stamgr", "module": "client", "name": "unifi_authorize_guest"}, {"description": "Reconnect Sta (stamgr)", "keywords": "client cmd reconnect reconnect_client reconnect_sta sta stamgr", "module": "client", "name": "unifi_reconnect_client"}, {"description": "Reset Dpi (stat)", "keywords": "clear clear_dpi cmd dpi monitor reset reset_dpi stat", "module": "monitor", "name": "unifi_clear_dpi"}, {"description": "Backup (system)", "keywords": "admin backup cmd create create_backup system", "module": "admin", "name": "unifi_create_backup"}, {"description": "Reboot Cloudkey (system)", "keywords": "cloudkey cmd device reboot reboot_cloudkey system", "module": "device", "name": "unifi_reboot_cloudkey"}, {"description": "Element Adoption (system)", "keywords": "adoption cmd device element element_adoption system", "module": "device", "name": "unifi_element_adoption"}, {"description": "Download Backup (system)", "keywords": "admin backup cmd download download_backup system", "module": "admin", "name": "unifi_download_backup"}, {"description": "List all ap groups (v2 API)", "keywords": "ap ap_group ap_groups apgroups device device_macs for for_wlanconf group groups list macs name v2 wifi wlanconf", "module": "wifi", "name": "unifi_list_ap_groups"}, {"description": "List all active clients (v2 API)", "keywords": "active active_client active_clients anomalies ap ap_mac assoc assoc_time authorized blocked bssid ccq channel channel_width client clients clients_active detailed detailed_states list mac states time v2 width", "module": "client", "name": "unifi_list_active_clients"}, {"description": "List all clients history (v2 API)", "keywords": "allowed blocked channel client client_history clients clients_history display display_name fingerprint first first_seen guest history hostname id in is is_allowed_in_visual_programming is_guest is_mlo list mlo name programming seen v2 visual", "module": "client", "name": "unifi_list_clients_history"}, {"description": "List all firewall policies (v2 API)", "keywords": "firewall firewall_policies firewall_policy list policies policy v2", "module": "firewall", "name": "unifi_list_firewall_policies"}, {"description": "Create a new firewall policy (v2 API)", "keywords": "create firewall firewall_policies firewall_policy policies policy v2", "module": "firewall", "name": "unifi_create_firewall_policy"}, {"description": "Update a firewall policy (v2 API)", "keywords": "firewall firewall_policies firewall_policy policies policy update v2", "module": "firewall", "name": "unifi_update_firewall_policy"}, {"description": "Delete a firewall policy (v2 API)", "keywords": "delete firewall firewall_policies firewall_policy policies policy v2", "module": "firewall", "name": "unifi_delete_firewall_policy"}, {"description": "List all firewall zones (v2 API)", "keywords": "firewall firewall_zone firewall_zones list v2 zone zones", "module": "firewall", "name": "unifi_list_firewall_zones"}, {"description": "Update a firewall zone (v2 API)", "keywords": "firewall firewall_zone firewall_zones update v2 zone zones", "module": "firewall", "name": "unifi_update_firewall_zone"}, {"description": "List all traffic rules (v2 API)", "keywords": "firewall list rule rules traffic traffic_rule traffic_rules v2", "module": "firewall", "name": "unifi_list_traffic_rules"}, {"description": "Create a new traffic rule (v2 API)", "keywords": "create firewall rule rules traffic traffic_rule traffic_rules v2", "module": "firewall", "name": "unifi_create_traffic_rule"}, {"description": "Update a traffic rule (v2 API)", "keywords": "firewall rule rules traffic traffic_rule traffic_rules update v2", "module": "firewall", "name": "unifi_update_traffic_rule"}, {"description": "Delete a traffic rule (v2 API)", "keywords": "delete firewall rule rules traffic traffic_rule traffic_rules v2", "module": "firewall", "name": "unifi_delete_traffic_rule"}, {"description": "List all traffic routes (v2 API)", "keywords": "firewall list route routes traffic traffic_route traffic_routes trafficroutes v2", "module": "firewall", "name": "unifi_list_traffic_routes"}, {"description": "Update a traffic route (v2 API)", "keywords": "firewall route routes traffic traffic_route traffic_routes trafficroutes update v2", "module": "firewall", "name": "unifi_update_traffic_route"}, {"description": "Global: logout", "keywords": "global logout", "module": "global", "name": "unifi_logout"}, {"description": "Global: self", "keywords": "global self", "module": "global", "name": "unifi_self"}, {"description": "Global: sites", "keywords": "global sites", "module": "global", "name": "unifi_sites"}, {"description": "Global: stat admin", "keywords": "admin global stat stat_admin", "module": "global", "name": "unifi_stat_admin"}, {"description": "Global: stat sites", "keywords": "global sites stat stat_sites", "module": "global", "name": "unifi_stat_sites"}, {"description": "Global: status", "keywords": "global status", "module": "global", "name": "unifi_status"}, {"description": "Global: system poweroff", "keywords": "global poweroff system system_poweroff", "module": "global", "name": "unifi_system_poweroff"}, {"description": "Global: system reboot", "keywords": "global reboot system system_reboot", "module": "global", "name": "unifi_system_reboot"}, {"description": "Configure switch port profiles and VLAN assignments", "keywords": "device override poe port profile set switch vlan", "module": "device", "name": "unifi_set_port_override"}, {"description": "Compose a gh issue create command for unexpected errors", "keywords": "bug error github issue report", "module": "global", "name": "unifi_report_issue"}, {"description": "Network overview in a single call: health, devices, networks, WLANs, clients, alarms", "keywords": "alarm client device health network overview status summary wlan", "module": "global", "name": "unifi_get_overview"}, {"description": "Search for UniFi MCP tools by keyword", "keywords": "discover find help list search tools", "module": "global", "name": "unifi_search_tools"}]
+# Inverted index precomputed by the generator (generator/search_index.py):
+# docs[i] = {name, description, module}; postings[token] = [[i, bm25_weight], ...]
+# The indexes below are embedded as JSON text: json.loads() is far cheaper at
+# startup than compiling the equivalent dict literals.
+_SEARCH_INDEX = json.loads(r'{"docs": [{"description": "List all accounts", "module": "admin", "name": "unifi_list_accounts"}, {"description": "Get a single account by ID", "module": "admin", "name": "unifi_get_account"}, {"description": "Create a new account", "module": "admin", "name": "unifi_create_account"}, {"description": "Update an existing account", "module": "admin", "name": "unifi_update_account"}, {"description": "Delete a account", "module": "admin", "name": "unifi_delete_account"}, {"description": "List all alarms", "module": "monitor", "name": "unifi_list_alarms"}, {"description": "List all broadcast groups", "module": "advanced", "name": "unifi_list_broadcast_groups"}, {"description": "Get a single broadcast group by ID", "module": "advanced", "name": "unifi_get_broadcast_group"}, {"description": "Create a new broadcast group", "module": "advanced", "name": "unifi_create_broadcast_group"}, {"description": "Update an existing broadcast group", "module": "advanced", "name": "unifi_update_broadcast_group"}, {"description": "Delete a broadcast group", "module": "advanced", "name": "unifi_delete_broadcast_group"}, {"description": "List all channel plans", "module": "wifi", "name": "unifi_list_channel_plans"}, {"description": "List all device configs", "module": "device", "name": "unifi_list_device_configs"}, {"description": "List all dhcp options", "module": "firewall", "name": "unifi_list_dhcp_options"}, {"description": "Get a single dhcp option by ID", "module": "firewall", "name": "unifi_get_dhcp_option"}, {"description": "Create a new dhcp option", "module": "firewall", "name": "unifi_create_dhcp_option"}, {"description": "Update an existing dhcp option", "module": "firewall", "name": "unifi_update_dhcp_option"}, {"description": "Delete a dhcp option", "module": "firewall", "name": "unifi_delete_dhcp_option"}, {"description": "List all dns records", "module": "firewall", "name": "unifi_list_dns_records"}, {"description": "Get a single dns record by ID", "module": "firewall", "name": "unifi_get_dns_record"}, {"description": "Create a new dns record", "module": "firewall", "name": "unifi_create_dns_record"}, {"description": "Update an existing dns record", "module": "firewall", "name": "unifi_update_dns_record"}, {"description": "Delete a dns record", "module": "firewall", "name": "unifi_delete_dns_record"}, {"description": "List all dpi apps", "module": "advanced", "name": "unifi_list_dpi_apps"}, {"description": "Get a single dpi app by ID", "module": "advanced", "name": "unifi_get_dpi_app"}, {"description": "Create a new dpi app", "module": "advanced", "name": "unifi_create_dpi_app"}, {"description": "Update an existing dpi app", "module": "advanced", "name": "unifi_update_dpi_app"}, {"description": "Delete a dpi app", "module": "advanced", "name": "unifi_delete_dpi_app"}, {"description": "List all dpi groups", "module": "advanced", "name": "unifi_list_dpi_groups"}, {"description": "Get a single dpi group by ID", "module": "advanced", "name": "unifi_get_dpi_group"}, {"description": "Create a new dpi group", "module": "advanced", "name": "unifi_create_dpi_group"}, {"description": "Update an existing dpi group", "module": "advanced", "name": "unifi_update_dpi_group"}, {"description": "Delete a dpi group", "module": "advanced", "name": "unifi_delete_dpi_group"}, {"description": "List all dynamic dns entries", "module": "firewall", "name": "unifi_list_dynamic_dns_entries"}, {"description": "Get a single dynamic dns by ID", "module": "firewall", "name": "unifi_get_dynamic_dns"}, {"description": "Create a new dynamic dns", "module": "firewall", "name": "unifi_create_dynamic_dns"}, {"description": "Update an existing dynamic dns", "module": "firewall", "name": "unifi_update_dynamic_dns"}, {"description": "Delete a dynamic dns", "module": "firewall", "name": "unifi_delete_dynamic_dns"}, {"description": "List all elements", "module": "device", "name": "unifi_list_elements"}, {"description": "List all events", "module": "monitor", "name": "unifi_list_events"}, {"description": "List all firewall groups", "module": "firewall", "name": "unifi_list_firewall_groups"}, {"description": "Get a single firewall group by ID", "module": "firewall", "name": "unifi_get_firewall_group"}, {"description": "Create a new firewall group", "module": "firewall", "name": "unifi_create_firewall_group"}, {"description": "Update an existing firewall group", "module": "firewall", "name": "unifi_update_firewall_group"}, {"description": "Delete a firewall group", "module": "firewall", "name": "unifi_delete_firewall_group"}, {"description": "List all firewall rules", "module": "firewall", "name": "unifi_list_firewall_rules"}, {"description": "Get a single firewall rule by ID", "module": "firewall", "name": "unifi_get_firewall_rule"}, {"description": "Create a new firewall rule", "module": "firewall", "name": "unifi_create_firewall_rule"}, {"description": "Update an existing firewall rule", "module": "firewall", "name": "unifi_update_firewall_rule"}, {"description": "Delete a firewall rule", "module": "firewall", "name": "unifi_delete_firewall_rule"}, {"description": "List all heatmaps", "module": "advanced", "name": "unifi_list_heatmaps"}, {"description": "Get a single heatmap by ID", "module": "advanced", "name": "unifi_get_heatmap"}, {"description": "Create a new heatmap", "module": "advanced", "name": "unifi_create_heatmap"}, {"description": "Update an existing heatmap", "module": "advanced", "name": "unifi_update_heatmap"}, {"description": "Delete a heatmap", "module": "advanced", "name": "unifi_delete_heatmap"}, {"description": "List all heatmap points", "module": "advanced", "name": "unifi_list_heatmap_points"}, {"description": "Get a single heatmap point by ID", "module": "advanced", "name": "unifi_get_heatmap_point"}, {"description": "Create a new heatmap point", "module": "advanced", "name": "unifi_create_heatmap_point"}, {"description": "Update an existing heatmap point", "module": "advanced", "name": "unifi_update_heatmap_point"}, {"description": "Delete a heatmap point", "module": "advanced", "name": "unifi_delete_heatmap_point"}, {"description": "List all hotspot2 configs", "module": "hotspot", "name": "unifi_list_hotspot2_configs"}, {"description": "Get a single hotspot2 config by ID", "module": "hotspot", "name": "unifi_get_hotspot2_config"}, {"description": "Create a new hotspot2 config", "module": "hotspot", "name": "unifi_create_hotspot2_config"}, {"description": "Update an existing hotspot2 config", "module": "hotspot", "name": "unifi_update_hotspot2_config"}, {"description": "Delete a hotspot2 config", "module": "hotspot", "name": "unifi_delete_hotspot2_config"}, {"description": "List all hotspot operators", "module": "hotspot", "name": "unifi_list_hotspot_operators"}, {"description": "Get a single hotspot operator by ID", "module": "hotspot", "name": "unifi_get_hotspot_operator"}, {"description": "Create a new hotspot operator", "module": "hotspot", "name": "unifi_create_hotspot_operator"}, {"description": "Update an existing hotspot operator", "module": "hotspot", "name": "unifi_update_hotspot_operator"}, {"description": "Delete a hotspot operator", "module": "hotspot", "name": "unifi_delete_hotspot_operator"}, {"description": "List all hotspot packages", "module": "hotspot", "name": "unifi_list_hotspot_packages"}, {"description": "Get a single hotspot package by ID", "module": "hotspot", "name": "unifi_get_hotspot_package"}, {"description": "Create a new hotspot package", "module": "hotspot", "name": "unifi_create_hotspot_package"}, {"description": "Update an existing hotspot package", "module": "hotspot", "name": "unifi_update_hotspot_package"}, {"description": "Delete a hotspot package", "module": "hotspot", "name": "unifi_delete_hotspot_package"}, {"description": "List all maps", "module": "advanced", "name": "unifi_list_maps"}, {"description": "Get a single map by ID", "module": "advanced", "name": "unifi_get_map"}, {"description": "Create a new map", "module": "advanced", "name": "unifi_create_map"}, {"description": "Update an existing map", "module": "advanced", "name": "unifi_update_map"}, {"description": "Delete a map", "module": "advanced", "name": "unifi_delete_map"}, {"description": "List all media files", "module": "advanced", "name": "unifi_list_media_files"}, {"description": "Get a single media file by ID", "module": "advanced", "name": "unifi_get_media_file"}, {"description": "Create a new media file", "module": "advanced", "name": "unifi_create_media_file"}, {"description": "Update an existing media file", "module": "advanced", "name": "unifi_update_media_file"}, {"description": "Delete a media file", "module": "advanced", "name": "unifi_delete_media_file"}, {"description": "List all networks", "module": "network", "name": "unifi_list_networks"}, {"description": "Get a single network by ID", "module": "network", "name": "unifi_get_network"}, {"description": "Create a new network", "module": "network", "name": "unifi_create_network"}, {"description": "Update an existing network", "module": "network", "name": "unifi_update_network"}, {"description": "Delete a network", "module": "network", "name": "unifi_delete_network"}, {"description": "List all port profiles", "module": "network", "name": "unifi_list_port_profiles"}, {"description": "Get a single port profile by ID", "module": "network", "name": "unifi_get_port_profile"}, {"description": "Create a new port profile", "module": "network", "name": "unifi_create_port_profile"}, {"description": "Update an existing port profile", "module": "network", "name": "unifi_update_port_profile"}, {"description": "Delete a port profile", "module": "network", "name": "unifi_delete_port_profile"}, {"description": "List all port forwards", "module": "firewall", "name": "unifi_list_port_forwards"}, {"description": "Get a single port forward by ID", "module": "firewall", "name": "unifi_get_port_forward"}, {"description": "Create a new port forward", "module": "firewall", "name": "unifi_create_port_forward"}, {"description": "Update an existing port forward", "module": "firewall", "name": "unifi_update_port_forward"}, {"description": "Delete a port forward", "module": "firewall", "name": "unifi_delete_port_forward"}, {"description": "List all radius accounts", "module": "hotspot", "name": "unifi_list_radius_accounts"}, {"description": "Get a single radius account by ID", "module": "hotspot", "name": "unifi_get_radius_account"}, {"description": "Create a new radius account", "module": "hotspot", "name": "unifi_create_radius_account"}, {"description": "Update an existing radius account", "module": "hotspot", "name": "unifi_update_radius_account"}, {"description": "Delete a radius account", "module": "hotspot", "name": "unifi_delete_radius_account"}, {"description": "List all radius profiles", "module": "hotspot", "name": "unifi_list_radius_profiles"}, {"description": "Get a single radius profile by ID", "module": "hotspot", "name": "unifi_get_radius_profile"}, {"description": "Create a new radius profile", "module": "hotspot", "name": "unifi_create_radius_profile"}, {"description": "Update an existing radius profile", "module": "hotspot", "name": "unifi_update_radius_profile"}, {"description": "Delete a radius profile", "module": "hotspot", "name": "unifi_delete_radius_profile"}, {"description": "List all known rogue aps", "module": "advanced", "name": "unifi_list_known_rogue_aps"}, {"description": "List all routes", "module": "firewall", "name": "unifi_list_routes"}, {"description": "Get a single route by ID", "module": "firewall", "name": "unifi_get_route"}, {"description": "Create a new route", "module": "firewall", "name": "unifi_create_route"}, {"description": "Update an existing route", "module": "firewall", "name": "unifi_update_route"}, {"description": "Delete a route", "module": "firewall", "name": "unifi_delete_route"}, {"description": "List all schedule tasks", "module": "advanced", "name": "unifi_list_schedule_tasks"}, {"description": "Get a single schedule task by ID", "module": "advanced", "name": "unifi_get_schedule_task"}, {"description": "Create a new schedule task", "module": "advanced", "name": "unifi_create_schedule_task"}, {"description": "Update an existing schedule task", "module": "advanced", "name": "unifi_update_schedule_task"}, {"description": "Delete a schedule task", "module": "advanced", "name": "unifi_delete_schedule_task"}, {"description": "List all site settings", "module": "admin", "name": "unifi_list_settings"}, {"description": "Get a specific site setting by key", "module": "admin", "name": "unifi_get_setting"}, {"description": "Update a site setting", "module": "admin", "name": "unifi_update_setting"}, {"description": "List all spatial records", "module": "advanced", "name": "unifi_list_spatial_records"}, {"description": "Get a single spatial record by ID", "module": "advanced", "name": "unifi_get_spatial_record"}, {"description": "Create a new spatial record", "module": "advanced", "name": "unifi_create_spatial_record"}, {"description": "Update an existing spatial record", "module": "advanced", "name": "unifi_update_spatial_record"}, {"description": "Delete a spatial record", "module": "advanced", "name": "unifi_delete_spatial_record"}, {"description": "List all tags", "module": "admin", "name": "unifi_list_tags"}, {"description": "Get a single tag by ID", "module": "admin", "name": "unifi_get_tag"}, {"description": "Create a new tag", "module": "admin", "name": "unifi_create_tag"}, {"description": "Update an existing tag", "module": "admin", "name": "unifi_update_tag"}, {"description": "Delete a tag", "module": "admin", "name": "unifi_delete_tag"}, {"description": "List all users", "module": "client", "name": "unifi_list_users"}, {"description": "Get a single user by ID", "module": "client", "name": "unifi_get_user"}, {"description": "Create a new user", "module": "client", "name": "unifi_create_user"}, {"description": "Update an existing user", "module": "client", "name": "unifi_update_user"}, {"description": "List all user groups", "module": "admin", "name": "unifi_list_user_groups"}, {"description": "Get a single user group by ID", "module": "admin", "name": "unifi_get_user_group"}, {"description": "Create a new user group", "module": "admin", "name": "unifi_create_user_group"}, {"description": "Update an existing user group", "module": "admin", "name": "unifi_update_user_group"}, {"description": "Delete a user group", "module": "admin", "name": "unifi_delete_user_group"}, {"description": "List all virtual devices", "module": "device", "name": "unifi_list_virtual_devices"}, {"description": "List all wlans", "module": "wifi", "name": "unifi_list_wlans"}, {"description": "Get a single wlan by ID", "module": "wifi", "name": "unifi_get_wlan"}, {"description": "Create a new wlan", "module": "wifi", "name": "unifi_create_wlan"}, {"description": "Update an existing wlan", "module": "wifi", "name": "unifi_update_wlan"}, {"description": "Delete a wlan", "module": "wifi", "name": "unifi_delete_wlan"}, {"description": "List all wlan groups", "module": "wifi", "name": "unifi_list_wlan_groups"}, {"description": "Get a single wlan group by ID", "module": "wifi", "name": "unifi_get_wlan_group"}, {"description": "Create a new wlan group", "module": "wifi", "name": "unifi_create_wlan_group"}, {"description": "Update an existing wlan group", "module": "wifi", "name": "unifi_update_wlan_group"}, {"description": "Delete a wlan group", "module": "wifi", "name": "unifi_delete_wlan_group"}, {"description": "List stat alarms", "module": "monitor", "name": "unifi_list_stat_alarms"}, {"description": "List all users", "module": "client", "name": "unifi_list_all_users"}, {"description": "List anomalies (site anomalies (unpoller). Supports ?scale=hourly\u0026end=\u003ctimestamp\u003e)", "module": "monitor", "name": "unifi_list_anomalies"}, {"description": "List authorizations", "module": "monitor", "name": "unifi_list_authorizations"}, {"description": "List country codes", "module": "wifi", "name": "unifi_list_country_codes"}, {"description": "List current channels", "module": "wifi", "name": "unifi_list_current_channels"}, {"description": "List dashboard", "module": "monitor", "name": "unifi_list_dashboard"}, {"description": "List devices (also POST with macs filter)", "module": "device", "name": "unifi_list_devices"}, {"description": "List devices basic", "module": "device", "name": "unifi_list_devices_basic"}, {"description": "List dpi stats (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "module": "monitor", "name": "unifi_list_dpi_stats"}, {"description": "List dynamic dns stats (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "module": "monitor", "name": "unifi_list_dynamic_dns_stats"}, {"description": "List stat events", "module": "monitor", "name": "unifi_list_stat_events"}, {"description": "List gateway stats (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "module": "monitor", "name": "unifi_list_gateway_stats"}, {"description": "List guests", "module": "client", "name": "unifi_list_guests"}, {"description": "List health", "module": "monitor", "name": "unifi_list_health"}, {"description": "List ips events (IDS/IPS events \u2014 singular form (unpoller APIEventPathIDS))", "module": "monitor", "name": "unifi_list_ips_events"}, {"description": "List payments", "module": "hotspot", "name": "unifi_list_payments"}, {"description": "List port forward stats (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "module": "monitor", "name": "unifi_list_port_forward_stats"}, {"description": "List remote user vpn (remote user VPN stats)", "module": "monitor", "name": "unifi_list_remote_user_vpn"}, {"description": "List report (intervals: 5minutes, hourly, daily, monthly; types: site, ap, user, gw)", "module": "monitor", "name": "unifi_list_report"}, {"description": "List report 5min ap", "module": "monitor", "name": "unifi_list_report_5min_ap"}, {"description": "List report 5min gateway (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "module": "monitor", "name": "unifi_list_report_5min_gateway"}, {"description": "List speedtest results (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "module": "monitor", "name": "unifi_list_speedtest_results"}, {"description": "List report daily gateway (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "module": "monitor", "name": "unifi_list_report_daily_gateway"}, {"description": "List report hourly gateway (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "module": "monitor", "name": "unifi_list_report_hourly_gateway"}, {"description": "List report monthly ap", "module": "monitor", "name": "unifi_list_report_monthly_ap"}, {"description": "List report monthly gateway (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "module": "monitor", "name": "unifi_list_report_monthly_gateway"}, {"description": "List report monthly site", "module": "monitor", "name": "unifi_list_report_monthly_site"}, {"description": "List report monthly user", "module": "monitor", "name": "unifi_list_report_monthly_user"}, {"description": "List rogue aps", "module": "monitor", "name": "unifi_list_rogue_aps"}, {"description": "List routing stats (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "module": "monitor", "name": "unifi_list_routing_stats"}, {"description": "List sdn status", "module": "monitor", "name": "unifi_list_sdn_status"}, {"description": "List sessions (requires POST with {\"type\":\"all\",\"start\":0,\"end\":9999999999})", "module": "client", "name": "unifi_list_sessions"}, {"description": "List site dpi (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "module": "monitor", "name": "unifi_list_site_dpi"}, {"description": "List spectrum scans", "module": "wifi", "name": "unifi_list_spectrum_scans"}, {"description": "List clients (Wireless clients are automatically enriched with network_name (the VLAN/network name from networkconf, resolved via essid \u2192 wlanconf). No manual join needed \u2014 just use fields=essid,network_name to see SSID-to-VLAN mappings.)", "module": "client", "name": "unifi_list_clients"}, {"description": "List client dpi (Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.)", "module": "monitor", "name": "unifi_list_client_dpi"}, {"description": "List sysinfo", "module": "monitor", "name": "unifi_list_sysinfo"}, {"description": "List vouchers", "module": "hotspot", "name": "unifi_list_vouchers"}, {"description": "Archive (alarm)", "module": "monitor", "name": "unifi_alarm_archive"}, {"description": "List Backups (backup)", "module": "admin", "name": "unifi_list_backups"}, {"description": "Delete Backup (backup)", "module": "admin", "name": "unifi_delete_backup"}, {"description": "Generate Backup (backup)", "module": "admin", "name": "unifi_generate_backup"}, {"description": "Generate Backup Site (backup)", "module": "admin", "name": "unifi_generate_backup_site"}, {"description": "Adopt (devmgr)", "module": "device", "name": "unifi_adopt_device"}, {"description": "Restart (devmgr)", "module": "device", "name": "unifi_restart_device"}, {"description": "Force Provision (devmgr)", "module": "device", "name": "unifi_force_provision_device"}, {"description": "Power Cycle (devmgr)", "module": "device", "name": "unifi_power_cycle_port"}, {"description": "Speedtest (devmgr)", "module": "device", "name": "unifi_run_speedtest"}, {"description": "Speedtest Status (devmgr)", "module": "device", "name": "unifi_get_speedtest_status"}, {"description": "Set Locate (devmgr)", "module": "device", "name": "unifi_locate_device"}, {"description": "Unset Locate (devmgr)", "module": "device", "name": "unifi_unlocate_device"}, {"description": "Upgrade (devmgr)", "module": "device", "name": "unifi_upgrade_device"}, {"description": "Upgrade External (devmgr)", "module": "device", "name": "unifi_upgrade_device_external"}, {"description": "Migrate (devmgr)", "module": "device", "name": "unifi_migrate_device"}, {"description": "Cancel Migrate (devmgr)", "module": "device", "name": "unifi_cancel_migrate_device"}, {"description": "Spectrum Scan (devmgr)", "module": "device", "name": "unifi_spectrum_scan"}, {"description": "Rename (devmgr)", "module": "device", "name": "unifi_rename_device"}, {"description": "Led Override (devmgr)", "module": "device", "name": "unifi_led_override_device"}, {"description": "Disable Ap (devmgr)", "module": "device", "name": "unifi_disable_ap"}, {"description": "Rolling Upgrade (devmgr)", "module": "admin", "name": "unifi_rolling_upgrade"}, {"description": "Cancel Rolling Upgrade (devmgr)", "module": "admin", "name": "unifi_cancel_rolling_upgrade"}, {"description": "Check Firmware Update (devmgr)", "module": "admin", "name": "unifi_check_firmware_update"}, {"description": "Upgrade All Devices (devmgr)", "module": "device", "name": "unifi_upgrade_all_devices"}, {"description": "Advanced Adopt (devmgr)", "module": "device", "name": "unifi_advanced_adopt_device"}, {"description": "Set Rollupgrade (devmgr)", "module": "admin", "name": "unifi_set_rollupgrade"}, {"description": "Unset Rollupgrade (devmgr)", "module": "admin", "name": "unifi_unset_rollupgrade"}, {"description": "Restart Http Portal (devmgr)", "module": "device", "name": "unifi_restart_http_portal"}, {"description": "Enable (devmgr)", "module": "device", "name": "unifi_enable_device"}, {"description": "Disable (devmgr)", "module": "device", "name": "unifi_disable_device"}, {"description": "Cable Test (devmgr)", "module": "device", "name": "unifi_cable_test"}, {"description": "Set Inform (devmgr)", "module": "device", "name": "unifi_set_inform_device"}, {"description": "Archive All Alarms (evtmgr)", "module": "monitor", "name": "unifi_archive_all_alarms"}, {"description": "Archive Alarm (evtmgr)", "module": "monitor", "name": "unifi_archive_alarm"}, {"description": "Authorize Guest (hotspot)", "module": "hotspot", "name": "unifi_hotspot_authorize_guest"}, {"description": "Create Voucher (hotspot)", "module": "hotspot", "name": "unifi_create_voucher"}, {"description": "Revoke Voucher (hotspot)", "module": "hotspot", "name": "unifi_revoke_voucher"}, {"description": "Extend Guest Validity (hotspot)", "module": "hotspot", "name": "unifi_extend_guest_validity"}, {"description": "Delete Voucher (hotspot)", "module": "hotspot", "name": "unifi_delete_voucher"}, {"description": "Add Site (sitemgr)", "module": "admin", "name": "unifi_add_site"}, {"description": "Delete Site (sitemgr)", "module": "admin", "name": "unifi_delete_site"}, {"description": "Update Site (sitemgr)", "module": "admin", "name": "unifi_update_site"}, {"description": "Get Admins (sitemgr)", "module": "admin", "name": "unifi_get_admins"}, {"description": "Move Device (sitemgr)", "module": "device", "name": "unifi_move_device"}, {"description": "Delete Device (sitemgr)", "module": "device", "name": "unifi_delete_device"}, {"description": "Site Leds (sitemgr)", "module": "admin", "name": "unifi_set_site_leds"}, {"description": "Invite Admin (sitemgr)", "module": "admin", "name": "unifi_invite_admin"}, {"description": "Assign Existing Admin (sitemgr)", "module": "admin", "name": "unifi_assign_existing_admin"}, {"description": "Update Admin (sitemgr)", "module": "admin", "name": "unifi_update_admin"}, {"description": "Revoke Admin (sitemgr)", "module": "admin", "name": "unifi_revoke_admin"}, {"description": "Grant Super Admin (sitemgr)", "module": "admin", "name": "unifi_grant_super_admin"}, {"description": "Create Admin (sitemgr)", "module": "admin", "name": "unifi_create_admin"}, {"description": "Revoke Super Admin (sitemgr)", "module": "admin", "name": "unifi_revoke_super_admin"}, {"description": "Block Sta (stamgr)", "module": "client", "name": "unifi_block_client"}, {"description": "Unblock Sta (stamgr)", "module": "client", "name": "unifi_unblock_client"}, {"description": "Kick Sta (stamgr)", "module": "client", "name": "unifi_kick_client"}, {"description": "Forget Sta (stamgr)", "module": "client", "name": "unifi_forget_client"}, {"description": "Unauthorize Guest (stamgr)", "module": "client", "name": "unifi_unauthorize_guest"}, {"description": "Authorize Guest (stamgr)", "module": "client", "name": "unifi_authorize_guest"}, {"description": "Reconnect Sta (stamgr)", "module": "client", "name": "unifi_reconnect_client"}, {"description": "Reset Dpi (stat)", "module": "monitor", "name": "unifi_clear_dpi"}, {"description": "Backup (system)", "module": "admin", "name": "unifi_create_backup"}, {"description": "Reboot Cloudkey (system)", "module": "device", "name": "unifi_reboot_cloudkey"}, {"description": "Element Adoption (system)", "module": "device", "name": "unifi_element_adoption"}, {"description": "Download Backup (system)", "module": "admin", "name": "unifi_download_backup"}, {"description": "List all ap groups (v2 API)", "module": "wifi", "name": "unifi_list_ap_groups"}, {"description": "List all active clients (v2 API)", "module": "client", "name": "unifi_list_active_clients"}, {"description": "List all clients history (v2 API)", "module": "client", "name": "unifi_list_clients_history"}, {"description": "List all firewall policies (v2 API)", "module": "firewall", "name": "unifi_list_firewall_policies"}, {"description": "Create a new firewall policy (v2 API)", "module": "firewall", "name": "unifi_create_firewall_policy"}, {"description": "Update a firewall policy (v2 API)", "module": "firewall", "name": "unifi_update_firewall_policy"}, {"description": "Delete a firewall policy (v2 API)", "module": "firewall", "name": "unifi_delete_firewall_policy"}, {"description": "List all firewall zones (v2 API)", "module": "firewall", "name": "unifi_list_firewall_zones"}, {"description": "Update a firewall zone (v2 API)", "module": "firewall", "name": "unifi_update_firewall_zone"}, {"description": "List all traffic rules (v2 API)", "module": "firewall", "name": "unifi_list_traffic_rules"}, {"description": "Create a new traffic rule (v2 API)", "module": "firewall", "name": "unifi_create_traffic_rule"}, {"description": "Update a traffic rule (v2 API)", "module": "firewall", "name": "unifi_update_traffic_rule"}, {"description": "Delete a traffic rule (v2 API)", "module": "firewall", "name": "unifi_delete_traffic_rule"}, {"description": "List all traffic routes (v2 API)", "module": "firewall", "name": "unifi_list_traffic_routes"}, {"description": "Update a traffic route (v2 API)", "module": "firewall", "name": "unifi_update_traffic_route"}, {"description": "Global: logout", "module": "global", "name": "unifi_logout"}, {"description": "Global: self", "module": "global", "name": "unifi_self"}, {"description": "Global: sites", "module": "global", "name": "unifi_sites"}, {"description": "Global: stat admin", "module": "global", "name": "unifi_stat_admin"}, {"description": "Global: stat sites", "module": "global", "name": "unifi_stat_sites"}, {"description": "Global: status", "module": "global", "name": "unifi_status"}, {"description": "Global: system poweroff", "module": "global", "name": "unifi_system_poweroff"}, {"description": "Global: system reboot", "module": "global", "name": "unifi_system_reboot"}, {"description": "Configure switch port profiles and VLAN assignments", "module": "device", "name": "unifi_set_port_override"}, {"description": "Configure many switch ports in one update (bulk port override)", "module": "device", "name": "unifi_set_port_overrides"}, {"description": "Query report history (min/avg/max/sum per MAC) from the local time-series store with incremental sync", "module": "monitor", "name": "unifi_query_timeseries"}, {"description": "Report series over any time range: picks 5minutes/hourly/daily/monthly for max_points, stitches intervals, downsamples min/avg/max", "module": "monitor", "name": "unifi_get_report"}, {"description": "Full-text search of archived events and alarms by words, event key, MAC and time range", "module": "monitor", "name": "unifi_search_events"}, {"description": "Compose a gh issue create command for unexpected errors", "module": "global", "name": "unifi_report_issue"}, {"description": "Network overview in a single call: health, devices, networks, WLANs, clients, alarms", "module": "global", "name": "unifi_get_overview"}, {"description": "Search for UniFi MCP tools by keyword", "module": "global", "name": "unifi_search_tools"}, {"description": "Load a module\u0027s tools on demand (lazy tool loading)", "module": "global", "name": "unifi_enable_module"}, {"description": "Field types, enums, read-only flags and cross-references for a tool", "module": "global", "name": "unifi_describe_fields"}, {"description": "Find which tools return a field (typo-tolerant)", "module": "global", "name": "unifi_search_fields"}], "postings": {"0": [[186, 6.0592]], "1x": [[134, 4.5022], [135, 4.3165], [136, 4.4385], [137, 4.4385], [155, 4.3165]], "5min": [[174, 9.0546], [175, 8.3439]], "5minute": [[173, 6.093], [285, 5.3943]], "6e": [[144, 4.5022], [145, 4.2871], [146, 4.4074], [147, 4.4074], [148, 4.4701]], "9999999999": [[186, 6.0592]], "a": [[1, 1.4239], [2, 1.48], [4, 1.5098], [7, 1.2895], [8, 1.3354], [10, 1.3595], [14, 1.2895], [15, 1.3354], [17, 1.3595], [19, 1.2895], [20, 1.3354], [22, 1.3595], [24, 1.2895], [25, 1.3354], [27, 1.3595], [29, 1.2786], [30, 1.3236], [32, 1.3473], [34, 1.2786], [35, 1.3236], [37, 1.3473], [41, 1.3007], [42, 1.3473], [44, 1.3719], [46, 1.3007], [47, 1.3473], [49, 1.3719], [51, 1.4239], [52, 1.48], [54, 1.5098], [56, 1.2895], [57, 1.3354], [59, 1.3595], [61, 1.2895], [62, 1.3354], [64, 1.3595], [66, 1.3007], [67, 1.3473], [69, 1.3719], [71, 1.3007], [72, 1.3473], [74, 1.3719], [76, 1.1876], [77, 1.2264], [79, 1.2467], [81, 1.2895], [82, 1.3354], [84, 1.3595], [86, 1.0469], [87, 1.077], [89, 1.0926], [91, 0.9662], [92, 0.9917], [94, 1.0049], [96, 1.2895], [97, 1.3354], [99, 1.3595], [101, 1.2895], [102, 1.3354], [104, 1.3595], [106, 1.1087], [107, 1.1425], [109, 1.1601], [112, 1.4106], [113, 1.4656], [115, 1.4948], [117, 1.1006], [118, 1.1338], [120, 1.1512], [122, 0.9917], [123, 1.0326], [125, 1.2895], [126, 1.3354], [128, 1.3595], [130, 1.4239], [131, 1.48], [133, 1.5098], [135, 1.0326], [136, 1.0617], [139, 1.1512], [140, 1.1876], [142, 1.2067], [145, 1.0255], [146, 1.0543], [148, 1.0693], [150, 1.2786], [151, 1.3236], [153, 1.3473], [163, 1.117], [164, 1.0543], [166, 1.117], [171, 1.0543], [175, 1.0326], [176, 1.077], [177, 1.0326], [178, 1.0326], [180, 1.0326], [184, 1.117], [187, 1.1087], [190, 1.1087], [263, 1.312], [264, 1.3354], [265, 1.3354], [267, 1.3354], [269, 1.3007], [270, 1.3236], [271, 1.3236], [273, 1.312], [287, 1.3473], [288, 1.2365], [290, 1.3007], [291, 1.2165], [292, 1.3236]], "account": [[0, 6.6012], [1, 6.4622], [2, 6.5542], [3, 6.5542], [4, 6.6012], [100, 6.5452], [101, 6.4384], [102, 6.5092], [103, 6.5092], [104, 6.5452]], "acct": [[105, 4.8497], [106, 4.635], [107, 4.776], [108, 4.776], [109, 4.8497]], "action": [[116, 3.3185], [117, 3.1207], [118, 3.2499], [119, 3.2499], [120, 3.3185]], "activate": [[290, 5.2313]], "active": [[260, 9.6971]], "add": [[233, 10.3816]], "adhoc": [[183, 6.7459]], "admin": [[0, 2.37], [1, 2.1658], [2, 2.2978], [3, 2.2978], [4, 2.37], [121, 1.3633], [122, 1.3043], [123, 1.3757], [129, 2.37], [130, 2.1658], [131, 2.2978], [132, 2.2978], [133, 2.37], [138, 1.7016], [139, 1.5937], [140, 1.664], [141, 1.664], [142, 1.7016], [165, 1.6826], [194, 2.2978], [195, 2.3333], [196, 2.3333], [197, 2.1053], [214, 2.2978], [215, 2.0764], [216, 2.0764], [219, 2.2978], [220, 2.2978], [233, 2.2978], [234, 2.2978], [235, 2.2978], [236, 3.8089], [239, 2.0764], [240, 3.7718], [241, 3.6798], [242, 3.7718], [243, 3.7718], [244, 3.6798], [245, 3.7718], [246, 3.6798], [255, 2.37], [258, 2.2978], [277, 3.7854]], "adopt": [[161, 5.982], [198, 8.8091], [218, 8.6679]], "adoptable": [[161, 5.9723]], "adopted": [[161, 4.063], [162, 2.8401], [163, 3.5318], [164, 3.3336], [166, 3.5318], [171, 3.3336], [175, 3.2649], [176, 3.4052], [177, 3.2649], [178, 3.2649], [180, 3.2649], [184, 3.5318], [187, 3.5058], [190, 3.5058]], "adoption": [[161, 5.3943], [257, 9.3769]], "advanced": [[6, 1.8629], [7, 1.7243], [8, 1.8143], [9, 1.8143], [10, 1.8629], [23, 1.8629], [24, 1.7243], [25, 1.8143], [26, 1.8143], [27, 1.8629], [28, 1.8383], [29, 1.7032], [30, 1.791], [31, 1.791], [32, 1.8383], [50, 2.1849], [51, 1.9967], [52, 2.1183], [53, 2.1183], [54, 2.1849], [55, 1.8629], [56, 1.7243], [57, 1.8143], [58, 1.8143], [59, 1.8629], [75, 1.6428], [76, 1.5341], [77, 1.6049], [78, 1.6049], [79, 1.6428], [80, 1.8629], [81, 1.7243], [82, 1.8143], [83, 1.8143], [84, 1.8629], [110, 1.6826], [116, 1.4693], [117, 1.3817], [118, 1.4389], [119, 1.4389], [120, 1.4693], [121, 1.8981], [122, 1.8354], [123, 1.9111], [124, 1.8629], [125, 1.7243], [126, 1.8143], [127, 1.8143], [128, 1.8629], [218, 3.4462]], "age": [[183, 4.7538]], "aggregate": [[284, 4.2237]], "alarm": [[5, 6.8042], [154, 6.838], [193, 7.2939], [226, 7.0405], [227, 7.216], [286, 5.6428], [288, 5.5194]], "all": [[0, 2.8585], [5, 2.4003], [6, 2.574], [11, 2.574], [12, 2.6215], [13, 2.574], [18, 2.574], [23, 2.574], [28, 2.5509], [33, 2.4415], [38, 2.8585], [39, 2.3031], [40, 2.5975], [45, 2.5975], [50, 2.8585], [55, 2.574], [60, 2.574], [65, 2.5975], [70, 2.5975], [75, 2.3605], [80, 2.574], [85, 2.0687], [90, 1.9027], [95, 2.574], [100, 2.574], [105, 2.1964], [110, 2.4003], [111, 2.8301], [116, 2.1796], [121, 1.9416], [124, 2.574], [129, 2.8585], [134, 2.039], [138, 2.2846], [143, 2.5975], [144, 2.039], [149, 2.5509], [155, 3.0645], [186, 2.0687], [217, 3.4582], [226, 3.4582], [259, 2.3031], [260, 2.0992], [261, 2.0102], [262, 2.5283], [266, 2.5283], [268, 2.506], [272, 2.4841]], "allowed": [[261, 5.8879]], "alluser": [[155, 3.8]], "also": [[161, 5.9723]], "an": [[3, 3.5753], [9, 3.2258], [16, 3.2258], [21, 3.2258], [26, 3.2258], [31, 3.1974], [36, 3.1974], [43, 3.2547], [48, 3.2547], [53, 3.5753], [58, 3.2258], [63, 3.2258], [68, 3.2547], [73, 3.2547], [78, 2.9625], [83, 3.2258], [88, 2.6016], [93, 2.3956], [98, 3.2258], [103, 3.2258], [108, 2.7598], [114, 3.5404], [119, 2.739], [127, 3.2258], [132, 3.5753], [137, 2.5648], [141, 2.8689], [147, 2.5468], [152, 3.1974]], "and": [[282, 6.1618], [286, 6.815], [291, 5.663]], "anomalie": [[156, 7.9785], [161, 3.1832], [189, 1.9], [260, 3.311]], "anomaly": [[156, 5.2313]], "anon": [[161, 5.3943], [189, 3.5922]], "any": [[285, 5.9723]], "ap": [[5, 4.5021], [39, 4.3868], [110, 3.6139], [144, 3.663], [145, 3.5225], [146, 3.6014], [147, 3.6014], [148, 3.6423], [154, 4.3868], [165, 4.3423], [173, 3.4677], [174, 5.1531], [179, 5.1531], [183, 3.4677], [186, 3.1147], [189, 2.0444], [213, 5.3366], [259, 5.057], [260, 3.1606]], "apgroup": [[259, 4.7538]], "api": [[259, 3.7611], [260, 3.4281], [261, 3.2827], [262, 4.1287], [263, 4.0566], [264, 4.1287], [265, 4.1287], [266, 4.1287], [267, 4.1287], [268, 4.0924], [269, 4.0215], [270, 4.0924], [271, 4.0924], [272, 4.0566], [273, 4.0566]], "apieventpathid": [[169, 6.8569]], "app": [[23, 7.8153], [24, 7.6878], [25, 7.7723], [26, 7.7723], [27, 7.8153]], "aps": [[110, 8.8418], [183, 8.6959]], "archive": [[176, 4.5022], [193, 7.9105], [226, 7.6358], [227, 7.826], [286, 3.2166]], "archived": [[5, 4.2321], [154, 3.9907], [286, 5.2389]], "are": [[189, 3.9771]], "assign": [[241, 10.1645]], "assignment": [[282, 7.3401]], "assoc": [[186, 5.0865], [189, 3.3386], [260, 5.1616]], "at": [[161, 5.9723]], "attribute": [[292, 5.366]], "auth": [[105, 5.0733], [106, 4.8957], [107, 5.0127], [108, 5.0127], [109, 5.0733], [121, 2.5281], [122, 2.4188], [123, 2.5512]], "authorization": [[157, 10.5316]], "authorize": [[228, 9.3551], [252, 9.3769]], "authorized": [[260, 4.1813]], "auto": [[85, 4.8392], [86, 4.6774], [87, 4.7841], [88, 4.7841], [89, 4.8392], [121, 3.818], [122, 3.692], [123, 3.8443]], "autobackup": [[121, 5.7525], [122, 5.599], [123, 5.7842]], "automatically": [[189, 3.9771]], "autoneg": [[90, 2.7637], [91, 2.6251], [92, 2.7159], [93, 2.7159], [94, 2.7637]], "avg": [[284, 5.5948], [285, 5.3943]], "b": [[144, 4.5022], [145, 4.2871], [146, 4.4074], [147, 4.4074], [148, 4.4701]], "backup": [[194, 7.7436], [195, 7.7001], [196, 7.7001], [197, 7.5498], [255, 7.5512], [258, 7.4974]], "band": [[183, 4.7538]], "basic": [[162, 9.9553]], "bc": [[144, 5.3718], [145, 5.1656], [146, 5.2815], [147, 5.2815], [148, 5.3413]], "block": [[247, 10.4549]], "blocked": [[260, 3.7766], [261, 3.5622]], "broadcast": [[6, 7.712], [7, 7.5725], [8, 7.6649], [9, 7.6649], [10, 7.712]], "broadcastgroup": [[6, 4.2077], [7, 3.8946], [8, 4.0979], [9, 4.0979], [10, 4.2077]], "bss": [[144, 4.5022], [145, 4.2871], [146, 4.4074], [147, 4.4074], [148, 4.4701]], "bssid": [[183, 4.2937], [260, 3.7766]], "bug": [[287, 5.5079]], "bulk": [[283, 7.8907]], "bw": [[183, 4.7538]], "by": [[1, 3.2056], [7, 2.903], [14, 2.903], [19, 2.903], [24, 2.903], [29, 2.8783], [34, 2.8783], [41, 2.9281], [46, 2.9281], [51, 3.2056], [56, 2.903], [61, 2.903], [66, 2.9281], [71, 2.9281], [76, 2.6735], [81, 2.903], [86, 2.3569], [91, 2.175], [96, 2.903], [101, 2.903], [106, 2.496], [112, 3.1755], [117, 2.4777], [122, 2.2324], [125, 2.903], [130, 3.2056], [135, 2.3245], [139, 2.5916], [145, 2.3086], [150, 2.8783], [161, 2.4244], [189, 3.0441], [286, 2.5334], [289, 3.1169]], "cable": [[224, 10.3816]], "call": [[288, 6.8569]], "cancel": [[209, 9.3261], [215, 9.1489]], "ccode": [[158, 5.9824]], "ccq": [[260, 4.1813]], "center": [[183, 6.7459]], "channel": [[11, 6.4587], [39, 4.9503], [121, 3.5904], [122, 3.4719], [123, 3.615], [159, 6.5999], [165, 4.889], [183, 3.0012], [260, 3.8818], [261, 2.4899]], "channelplan": [[11, 5.5817]], "check": [[216, 10.1292]], "clear": [[254, 9.8187]], "client": [[134, 2.0283], [135, 1.9173], [136, 1.9899], [137, 1.9899], [155, 1.9173], [161, 3.0134], [167, 3.4102], [186, 2.0682], [189, 4.2335], [190, 4.6727], [247, 4.9776], [248, 4.9776], [249, 4.9776], [250, 4.9776], [251, 3.2025], [252, 3.2025], [253, 4.9776], [260, 4.9749], [261, 4.8181], [288, 4.0067]], "cloudkey": [[256, 10.3816]], "cmd": [[193, 1.873], [194, 1.7874], [195, 1.815], [196, 1.815], [197, 1.6377], [198, 1.873], [199, 1.873], [200, 1.6377], [201, 1.6151], [202, 1.8435], [203, 1.6151], [204, 1.7345], [205, 1.7093], [206, 1.873], [207, 1.6377], [208, 1.873], [209, 1.6377], [210, 1.7874], [211, 1.873], [212, 1.6377], [213, 1.7874], [214, 1.7874], [215, 1.6151], [216, 1.6151], [217, 1.6151], [218, 1.6377], [219, 1.7874], [220, 1.7874], [221, 1.6151], [222, 1.873], [223, 1.873], [224, 1.7874], [225, 1.6377], [226, 1.6151], [227, 1.7874], [228, 1.6609], [229, 1.815], [230, 1.815], [231, 1.6377], [232, 1.815], [233, 1.7874], [234, 1.7874], [235, 1.7874], [236, 1.7874], [237, 1.815], [238, 1.815], [239, 1.6151], [240, 1.815], [241, 1.6377], [242, 1.815], [243, 1.815], [244, 1.6377], [245, 1.815], [246, 1.6377], [247, 1.7345], [248, 1.7345], [249, 1.7345], [250, 1.7345], [251, 1.7874], [252, 1.7874], [253, 1.7345], [254, 1.7093], [255, 1.8435], [256, 1.7874], [257, 1.7874], [258, 1.7874]], "code": [[158, 10.2359]], "column": [[292, 5.366]], "command": [[287, 7.4717]], "completed": [[161, 5.9723]], "compose": [[287, 7.4717]], "config": [[12, 7.5288], [60, 7.4872], [61, 7.365], [62, 7.446], [63, 7.446], [64, 7.4872]], "configure": [[282, 6.6297], [283, 6.1427]], "connection": [[134, 5.3718], [135, 5.1941], [136, 5.3112], [137, 5.3112], [155, 5.1941]], "content": [[75, 5.2119], [76, 4.9647], [77, 5.1268], [78, 5.1268], [79, 5.2119]], "country": [[158, 10.2359]], "create": [[2, 4.086], [8, 3.9105], [15, 3.9105], [20, 3.9105], [25, 3.9105], [30, 3.8953], [35, 3.8953], [42, 3.9258], [47, 3.9258], [52, 4.086], [57, 3.9105], [62, 3.9105], [67, 3.9258], [72, 3.9258], [77, 3.7635], [82, 3.9105], [87, 3.5375], [92, 3.3936], [97, 3.9105], [102, 3.9105], [107, 3.6403], [113, 4.0694], [118, 3.6272], [126, 3.9105], [131, 4.086], [136, 3.5126], [140, 3.7077], [146, 3.5004], [151, 3.8953], [229, 4.173], [245, 4.173], [255, 4.0276], [263, 3.8802], [269, 3.8652], [287, 2.9927]], "cron": [[116, 4.286], [117, 4.0977], [118, 4.2214], [119, 4.2214], [120, 4.286], [121, 4.6005], [122, 4.4777], [123, 4.6258]], "cross": [[291, 6.7459]], "ctrl": [[90, 4.2011], [91, 4.039], [92, 4.1456], [93, 4.1456], [94, 4.2011]], "current": [[159, 10.3254]], "cycle": [[201, 10.2935]], "daily": [[173, 5.663], [177, 7.755], [285, 5.0136]], "dashboard": [[160, 10.414]], "data": [[121, 3.1707], [122, 3.0661], [123, 3.1925], [163, 3.4535], [164, 3.2597], [166, 3.4535], [171, 3.2597], [175, 3.1925], [176, 3.3298], [177, 3.1925], [178, 3.1925], [180, 3.1925], [184, 3.4535], [187, 3.4281], [190, 3.4281]], "datetime": [[5, 3.9921], [39, 3.7643], [154, 3.7643], [165, 3.6803]], "default": [[121, 4.7741], [122, 4.6165], [123, 4.8069]], "delete": [[4, 4.1753], [10, 3.9945], [17, 3.9945], [22, 3.9945], [27, 3.9945], [32, 3.9789], [37, 3.9789], [44, 4.0103], [49, 4.0103], [54, 4.1753], [59, 3.9945], [64, 3.9945], [69, 4.0103], [74, 4.0103], [79, 3.8432], [84, 3.9945], [89, 3.6108], [94, 3.4629], [99, 3.9945], [104, 3.9945], [109, 3.7166], [115, 4.1582], [120, 3.703], [128, 3.9945], [133, 4.1753], [142, 3.7859], [148, 3.5726], [153, 3.9789], [195, 4.2294], [232, 4.2294], [234, 4.2144], [238, 4.2294], [265, 3.9633], [271, 3.9479]], "demand": [[290, 7.213]], "describe": [[291, 8.534]], "detailed": [[260, 6.1486]], "device": [[12, 4.0687], [38, 2.5876], [143, 4.1092], [161, 3.6146], [162, 3.9984], [198, 3.994], [199, 3.994], [200, 3.8269], [201, 2.267], [202, 2.5876], [203, 2.267], [204, 3.8994], [205, 3.881], [206, 3.994], [207, 3.8269], [208, 3.994], [209, 3.8269], [210, 2.5087], [211, 3.994], [212, 3.8269], [213, 2.5087], [217, 4.0687], [218, 3.8269], [221, 2.267], [222, 3.994], [223, 3.994], [224, 2.5087], [225, 3.8269], [237, 4.1182], [238, 4.1182], [256, 2.5087], [257, 2.5087], [259, 2.6664], [282, 2.121], [283, 1.9007], [288, 3.1387]], "devmgr": [[198, 4.1118], [199, 4.1118], [200, 3.8537], [201, 3.827], [202, 4.0814], [203, 3.827], [204, 3.9643], [205, 3.936], [206, 4.1118], [207, 3.8537], [208, 4.1118], [209, 3.8537], [210, 4.022], [211, 4.1118], [212, 3.8537], [213, 4.022], [214, 4.022], [215, 3.827], [216, 3.827], [217, 3.827], [218, 3.8537], [219, 4.022], [220, 4.022], [221, 3.827], [222, 4.1118], [223, 4.1118], [224, 4.022], [225, 3.8537]], "dfs": [[286, 4.267]], "dhcp": [[13, 7.712], [14, 7.5725], [15, 7.6649], [16, 7.6649], [17, 7.712]], "dhcpd": [[85, 6.0029], [86, 5.8356], [87, 5.9461], [88, 5.9461], [89, 6.0029]], "dhcpdv6": [[85, 4.5676], [86, 4.3767], [87, 4.5022], [88, 4.5022], [89, 4.5676]], "dhcpoption": [[13, 4.2077], [14, 3.8946], [15, 4.0979], [16, 4.0979], [17, 4.2077]], "disable": [[213, 9.3769], [223, 9.4781]], "disabled": [[162, 4.9811]], "disconnect": [[134, 4.5022], [135, 4.3165], [136, 4.4385], [137, 4.4385], [155, 4.3165]], "discover": [[289, 5.1803], [292, 4.8467]], "display": [[261, 5.8879]], "displayname": [[5, 5.5671], [39, 5.3418], [154, 5.3418], [165, 5.2567]], "dns": [[18, 5.5826], [19, 5.4816], [20, 5.5485], [21, 5.5485], [22, 5.5826], [33, 5.4816], [34, 5.4652], [35, 5.5317], [36, 5.5317], [37, 5.5655], [85, 3.3064], [86, 3.1682], [87, 3.259], [88, 3.259], [89, 3.3064], [164, 4.9437]], "dnsrecord": [[18, 4.2077], [19, 3.8946], [20, 4.0979], [21, 4.0979], [22, 4.2077]], "dot1x": [[90, 5.0821], [91, 4.9228], [92, 5.0278], [93, 5.0278], [94, 5.0821]], "down": [[138, 5.0445], [139, 4.8126], [140, 4.9647], [141, 4.9647], [142, 5.0445]], "download": [[258, 10.3816]], "downsample": [[285, 7.1259]], "dpi": [[23, 5.833], [24, 5.7276], [25, 5.7975], [26, 5.7975], [27, 5.833], [28, 5.8152], [29, 5.7104], [30, 5.7798], [31, 5.7798], [32, 5.8152], [163, 5.2971], [187, 5.2803], [190, 5.2803], [254, 5.9425]], "dpiapp": [[23, 4.2077], [24, 3.8946], [25, 4.0979], [26, 4.0979], [27, 4.2077]], "dpigroup": [[28, 4.1521], [29, 3.8469], [30, 4.0451], [31, 4.0451], [32, 4.1521]], "dtim": [[144, 6.3536], [145, 6.1786], [146, 6.2774], [147, 6.2774], [148, 6.328]], "duration": [[186, 4.099]], "dynamic": [[33, 7.2546], [34, 7.2328], [35, 7.3208], [36, 7.3208], [37, 7.3656], [164, 6.5426]], "dynamicdn": [[33, 3.7311], [34, 3.6854], [35, 3.8753], [36, 3.8753], [37, 3.9777], [164, 2.8215]], "egress": [[90, 5.0821], [91, 4.9228], [92, 5.0278], [93, 5.0278], [94, 5.0821]], "element": [[38, 9.4441], [257, 9.3769]], "empty": [[163, 3.706], [164, 3.498], [166, 3.706], [171, 3.498], [175, 3.4259], [176, 3.5732], [177, 3.4259], [178, 3.4259], [180, 3.4259], [184, 3.706], [187, 3.6787], [190, 3.6787]], "enable": [[222, 9.4781], [290, 8.0373]], "enabled": [[85, 4.0188], [86, 3.8844], [87, 3.973], [88, 3.973], [89, 4.0188], [90, 4.199], [91, 4.0881], [92, 4.1614], [93, 4.1614], [94, 4.199], [144, 3.3298], [145, 3.1707], [146, 3.2597], [147, 3.2597], [148, 3.3061]], "end": [[156, 6.5149], [186, 5.4728]], "endpoint": [[292, 5.366]], "enriched": [[189, 3.9771]], "entrie": [[33, 7.4294], [34, 5.3449], [35, 5.5332], [36, 5.5332], [37, 5.6325]], "enum": [[291, 7.8412]], "error": [[287, 8.4795]], "essid": [[183, 4.2937], [189, 5.3514]], "event": [[39, 7.6237], [165, 7.7444], [169, 8.1654], [286, 7.7186]], "evtmgr": [[226, 7.8179], [227, 8.2162]], "excluded": [[90, 4.2011], [91, 4.039], [92, 4.1456], [93, 4.1456], [94, 4.2011]], "execute": [[116, 4.8126], [117, 4.6011], [118, 4.74], [119, 4.74], [120, 4.8126]], "existing": [[3, 3.5235], [9, 3.179], [16, 3.179], [21, 3.179], [26, 3.179], [31, 3.151], [36, 3.151], [43, 3.2076], [48, 3.2076], [53, 3.5235], [58, 3.179], [63, 3.179], [68, 3.2076], [73, 3.2076], [78, 2.9196], [83, 3.179], [88, 2.5639], [93, 2.3608], [98, 3.179], [103, 3.179], [108, 2.7198], [114, 3.4891], [119, 2.6993], [127, 3.179], [132, 3.5235], [137, 2.5276], [141, 2.8273], [147, 2.5099], [152, 3.151], [241, 4.3635]], "expr": [[116, 4.286], [117, 4.0977], [118, 4.2214], [119, 4.2214], [120, 4.286], [121, 4.6005], [122, 4.4777], [123, 4.6258]], "extend": [[231, 10.1645]], "external": [[105, 4.6461], [106, 4.4404], [107, 4.5755], [108, 4.5755], [109, 4.6461], [207, 7.4568]], "field": [[189, 3.3386], [291, 8.0821], [292, 8.358]], "file": [[80, 7.8153], [81, 7.6878], [82, 7.7723], [83, 7.7723], [84, 7.8153]], "filename": [[75, 3.7106], [76, 3.465], [77, 3.6249], [78, 3.6249], [79, 3.7106]], "filesize": [[75, 3.7106], [76, 3.465], [77, 3.6249], [78, 3.6249], [79, 3.7106]], "filter": [[144, 5.1463], [145, 4.9488], [146, 5.0597], [147, 5.0597], [148, 5.1171], [161, 4.3131]], "filtering": [[121, 4.7741], [122, 4.6165], [123, 4.8069]], "find": [[289, 5.1803], [292, 7.5563]], "fingerbank": [[121, 4.7741], [122, 4.6165], [123, 4.8069]], "fingerprint": [[261, 3.9439]], "firewall": [[13, 1.9277], [14, 1.7843], [15, 1.8774], [16, 1.8774], [17, 1.9277], [18, 1.9277], [19, 1.7843], [20, 1.8774], [21, 1.8774], [22, 1.9277], [33, 1.7843], [34, 1.7624], [35, 1.8532], [36, 1.8532], [37, 1.9022], [40, 3.544], [41, 3.4797], [42, 3.5223], [43, 3.5223], [44, 3.544], [45, 3.544], [46, 3.4797], [47, 3.5223], [48, 3.5223], [49, 3.544], [95, 1.9277], [96, 1.7843], [97, 1.8774], [98, 1.8774], [99, 1.9277], [111, 2.2259], [112, 2.0368], [113, 2.1591], [114, 2.1591], [115, 2.2259], [262, 3.5116], [263, 3.4903], [264, 3.5116], [265, 3.5116], [266, 3.5116], [267, 3.5116], [268, 1.8532], [269, 1.8067], [270, 1.8532], [271, 1.8532], [272, 1.8297], [273, 1.8297]], "firewallgroup": [[40, 4.2648], [41, 3.9435], [42, 4.1521], [43, 4.1521], [44, 4.2648]], "firewallrule": [[45, 4.2648], [46, 3.9435], [47, 4.1521], [48, 4.1521], [49, 4.2648]], "firmware": [[216, 10.1292]], "first": [[134, 4.3131], [135, 4.1353], [136, 4.2522], [137, 4.2522], [155, 4.1353], [261, 4.2522]], "flag": [[291, 6.7459]], "for": [[259, 5.0853], [285, 4.5022], [287, 5.6325], [289, 5.7881], [291, 5.0853]], "force": [[200, 10.3254]], "forget": [[250, 10.4549]], "form": [[169, 6.8569]], "forward": [[90, 2.2514], [91, 2.1385], [92, 2.2125], [93, 2.2125], [94, 2.2514], [95, 6.3665], [96, 6.2626], [97, 6.3315], [98, 6.3315], [99, 6.3665], [171, 5.5633]], "freq": [[5, 3.8004], [39, 3.5836], [154, 3.5836], [165, 3.5036], [183, 5.0853]], "from": [[39, 5.3418], [165, 5.2567], [189, 3.1493], [284, 4.905]], "full": [[286, 6.2407]], "gateway": [[162, 4.0694], [163, 4.7158], [164, 4.5397], [166, 5.848], [171, 4.5397], [175, 5.7107], [176, 4.6042], [177, 5.7107], [178, 5.7107], [180, 5.7107], [184, 4.7158], [187, 4.693], [190, 4.693]], "generate": [[196, 9.4104], [197, 9.1808]], "get": [[1, 4.0747], [7, 3.9024], [14, 3.9024], [19, 3.9024], [24, 3.9024], [29, 3.8874], [34, 3.8874], [41, 3.9174], [46, 3.9174], [51, 4.0747], [56, 3.9024], [61, 3.9024], [66, 3.9174], [71, 3.9174], [76, 3.7579], [81, 3.9024], [86, 3.5353], [91, 3.3935], [96, 3.9024], [101, 3.9024], [106, 3.6367], [112, 4.0584], [117, 3.6237], [122, 3.4395], [125, 3.9024], [130, 4.0747], [135, 3.5108], [139, 3.703], [145, 3.4987], [150, 3.8874], [203, 3.9121], [236, 4.2144], [285, 3.202], [288, 3.2235]], "gh": [[287, 7.4717]], "github": [[287, 5.5079]], "global": [[274, 6.5864], [275, 6.5864], [276, 6.5864], [277, 6.1973], [278, 6.1973], [279, 6.5864], [280, 6.1973], [281, 6.1973]], "grant": [[244, 10.1645]], "granularity": [[285, 4.02]], "grep": [[286, 4.267]], "group": [[6, 4.3873], [7, 4.3157], [8, 4.3631], [9, 4.3631], [10, 4.3873], [28, 4.3752], [29, 4.304], [30, 4.3512], [31, 4.3512], [32, 4.3752], [40, 4.3994], [41, 4.3274], [42, 4.3752], [43, 4.3752], [44, 4.3994], [138, 4.2238], [139, 4.1574], [140, 4.2014], [141, 4.2014], [142, 4.2238], [144, 3.0156], [145, 2.8998], [146, 2.9648], [147, 2.9648], [148, 2.9985], [149, 4.3752], [150, 4.304], [151, 4.3512], [152, 4.3512], [153, 4.3752], [259, 4.2351]], "guest": [[39, 2.6504], [134, 3.3298], [135, 3.1925], [136, 3.2827], [137, 3.2827], [155, 3.1925], [165, 2.5913], [167, 5.8717], [186, 3.3782], [189, 2.8397], [228, 5.7747], [231, 5.6671], [251, 5.7881], [252, 5.7881], [261, 3.2827]], "gw": [[173, 4.8718], [175, 4.1353], [177, 4.1353], [178, 4.1353], [180, 4.1353], [186, 4.3758]], "health": [[168, 9.4061], [288, 7.1723]], "heatmap": [[50, 6.6012], [51, 6.4622], [52, 6.5542], [53, 6.5542], [54, 6.6012], [55, 6.4587], [56, 6.3419], [57, 6.4193], [58, 6.4193], [59, 6.4587]], "heatmappoint": [[55, 4.2077], [56, 3.8946], [57, 4.0979], [58, 4.0979], [59, 4.2077]], "height": [[75, 3.7106], [76, 3.465], [77, 3.6249], [78, 3.6249], [79, 3.7106]], "help": [[289, 5.7354]], "historical": [[284, 3.8149], [285, 3.6309]], "history": [[261, 7.3971], [284, 5.8083], [285, 3.1832], [286, 3.3788]], "hostname": [[134, 2.7942], [135, 2.6413], [136, 2.7413], [137, 2.7413], [155, 2.6413], [186, 2.8491], [261, 2.7413]], "hotspot": [[60, 2.329], [61, 2.1557], [62, 2.2682], [63, 2.2682], [64, 2.329], [65, 4.2818], [66, 4.2042], [67, 4.2556], [68, 4.2556], [69, 4.2818], [70, 4.2818], [71, 4.2042], [72, 4.2556], [73, 4.2556], [74, 4.2818], [100, 2.329], [101, 2.1557], [102, 2.2682], [103, 2.2682], [104, 2.329], [105, 1.8565], [106, 1.7447], [107, 1.8177], [108, 1.8177], [109, 1.8565], [170, 2.8202], [192, 2.8202], [228, 4.2561], [229, 3.8235], [230, 3.8235], [231, 3.6368], [232, 3.8235]], "hotspot2": [[60, 7.712], [61, 7.5725], [62, 7.6649], [63, 7.6649], [64, 7.712]], "hotspot2conf": [[60, 4.2077], [61, 3.8946], [62, 4.0979], [63, 4.0979], [64, 4.2077]], "hotspotop": [[65, 4.2648], [66, 3.9435], [67, 4.1521], [68, 4.1521], [69, 4.2648]], "hotspotpackage": [[70, 4.2648], [71, 3.9435], [72, 4.1521], [73, 4.1521], [74, 4.2648]], "hourly": [[156, 5.7117], [173, 5.3418], [178, 7.3151], [285, 4.7292]], "http": [[221, 10.1292]], "id": [[1, 2.8248], [7, 2.5581], [14, 2.5581], [19, 2.5581], [24, 2.5581], [29, 2.5363], [34, 2.5363], [41, 2.5802], [46, 2.5802], [51, 2.8248], [56, 2.5581], [61, 2.5581], [66, 2.5802], [71, 2.5802], [76, 2.3559], [81, 2.5581], [86, 2.0769], [91, 1.9166], [96, 2.5581], [101, 2.5581], [105, 2.3014], [106, 2.8761], [107, 2.2664], [108, 2.2664], [109, 2.3014], [112, 2.7982], [116, 2.2837], [117, 2.8622], [118, 2.2493], [119, 2.2493], [120, 2.2837], [125, 2.5581], [130, 2.8248], [134, 2.1364], [135, 2.7437], [136, 2.1062], [137, 2.1062], [139, 2.2837], [145, 2.0344], [150, 2.5363], [155, 2.0483], [161, 2.1364], [189, 1.4227], [261, 1.4108]], "identity": [[134, 4.5022], [135, 4.3165], [136, 4.4385], [137, 4.4385], [155, 4.3165]], "idle": [[90, 4.2011], [91, 4.039], [92, 4.1456], [93, 4.1456], [94, 4.2011]], "ids": [[90, 3.4223], [91, 3.2902], [92, 3.3771], [93, 3.3771], [94, 3.4223], [144, 3.6675], [145, 3.4923], [146, 3.5903], [147, 3.5903], [148, 3.6414], [169, 4.2108]], "if": [[163, 3.706], [164, 3.498], [166, 3.706], [171, 3.498], [175, 3.4259], [176, 3.5732], [177, 3.4259], [178, 3.4259], [180, 3.4259], [184, 3.706], [187, 3.6787], [190, 3.6787]], "in": [[162, 5.5205], [261, 4.6624], [283, 5.3854], [288, 5.4297]], "incremental": [[284, 6.1943]], "inform": [[225, 10.3254]], "interface": [[85, 4.5676], [86, 4.3767], [87, 4.5022], [88, 4.5022], [89, 4.5676]], "interval": [[173, 6.093], [285, 5.3943]], "invite": [[240, 10.4187]], "ip": [[134, 4.1512], [135, 3.9801], [136, 4.0925], [137, 4.0925], [155, 3.9801], [161, 4.1512], [186, 2.8491]], "ips": [[121, 4.5033], [122, 4.3547], [123, 4.5342], [169, 8.075]], "ipv6": [[85, 6.0029], [86, 5.8356], [87, 5.9461], [88, 5.9461], [89, 6.0029]], "is": [[5, 3.3099], [39, 3.1759], [134, 3.3549], [135, 3.2439], [136, 3.317], [137, 3.317], [154, 3.1759], [155, 3.2439], [163, 2.9162], [164, 2.7526], [166, 2.9162], [171, 2.7526], [175, 2.6958], [176, 2.8117], [177, 2.6958], [178, 2.6958], [180, 2.6958], [183, 3.1759], [184, 2.9162], [186, 3.3935], [187, 2.8947], [189, 2.3979], [190, 2.8947], [261, 3.6787]], "isolation": [[90, 2.7637], [91, 2.6251], [92, 2.7159], [93, 2.7159], [94, 2.7637]], "issue": [[287, 9.8015]], "join": [[189, 3.9771]], "just": [[189, 3.9771]], "kbp": [[90, 5.0821], [91, 4.9228], [92, 5.0278], [93, 5.0278], [94, 5.0821]], "key": [[5, 3.6408], [121, 4.1071], [122, 5.3903], [123, 4.1353], [154, 3.4331], [286, 4.5069]], "keyword": [[289, 7.6783]], "kick": [[249, 10.4549]], "known": [[110, 9.9851]], "last": [[75, 4.2457], [76, 4.0444], [77, 4.1764], [78, 4.1764], [79, 4.2457], [134, 5.4236], [135, 5.311], [136, 5.3855], [137, 5.3855], [155, 5.311], [189, 3.1278]], "lazy": [[290, 8.2555]], "led": [[212, 9.3261], [239, 9.2973]], "left": [[75, 5.2119], [76, 4.9647], [77, 5.1268], [78, 5.1268], [79, 5.2119]], "limit": [[90, 5.0821], [91, 4.9228], [92, 5.0278], [93, 5.0278], [94, 5.0821]], "list": [[0, 2.3177], [5, 2.1496], [6, 2.2173], [11, 2.2173], [12, 2.2349], [13, 2.2173], [18, 2.2173], [23, 2.2173], [28, 2.2086], [33, 2.1662], [38, 2.3177], [39, 2.1094], [40, 2.2261], [45, 2.2261], [50, 2.3177], [55, 2.2173], [60, 2.2173], [65, 2.2261], [70, 2.2261], [75, 2.1333], [80, 2.2173], [85, 2.0043], [90, 1.9222], [95, 2.2173], [100, 2.2173], [105, 2.063], [110, 2.1496], [111, 2.3082], [116, 2.0555], [121, 1.9421], [124, 2.2173], [129, 2.3177], [134, 1.9901], [138, 2.1015], [143, 2.2261], [144, 2.0606], [145, 1.2815], [146, 1.3174], [147, 1.3174], [148, 1.3362], [149, 2.2086], [154, 2.1094], [155, 1.9488], [156, 2.1745], [157, 2.3369], [158, 2.2618], [159, 2.2438], [160, 2.3466], [161, 1.9901], [162, 2.1414], [163, 2.0259], [164, 1.9693], [165, 2.0937], [166, 2.0259], [167, 2.3369], [168, 2.3466], [169, 2.1253], [170, 2.3369], [171, 1.9693], [172, 2.1333], [173, 2.1094], [174, 2.2086], [175, 1.9488], [176, 1.9901], [177, 1.9488], [178, 1.9488], [179, 2.2086], [180, 1.9488], [181, 2.2086], [182, 2.2086], [183, 2.1094], [184, 2.0259], [185, 2.2709], [186, 2.0043], [187, 2.0187], [188, 2.2438], [189, 1.5956], [190, 2.0187], [191, 2.3466], [192, 2.3369], [194, 2.3393], [259, 2.1094], [260, 2.0187], [261, 1.9762], [262, 2.2], [266, 2.2], [268, 2.1914], [272, 2.1829], [289, 1.2924]], "lldpmed": [[90, 5.0821], [91, 4.9228], [92, 5.0278], [93, 5.0278], [94, 5.0821]], "load": [[290, 8.2555]], "loading": [[290, 7.213]], "local": [[284, 6.1943]], "locate": [[204, 9.4431], [205, 8.5388]], "log": [[286, 4.267]], "logout": [[274, 10.6355]], "mac": [[156, 3.3026], [161, 3.7705], [162, 3.1447], [183, 4.2588], [186, 4.5507], [189, 2.5108], [259, 4.2588], [260, 3.8818], [284, 3.9106], [286, 3.9399]], "manual": [[189, 3.9771]], "many": [[283, 6.8009]], "map": [[75, 7.3303], [76, 7.1865], [77, 7.2817], [78, 7.2817], [79, 7.3303]], "mapping": [[189, 3.9771]], "max": [[138, 5.4162], [139, 5.2209], [140, 5.3495], [141, 5.3495], [142, 5.4162], [284, 4.3055], [285, 5.4826]], "mcp": [[289, 7.6783]], "md5": [[75, 3.7106], [76, 3.465], [77, 3.6249], [78, 3.6249], [79, 3.7106]], "media": [[80, 7.712], [81, 7.5725], [82, 7.6649], [83, 7.6649], [84, 7.712]], "mediafile": [[80, 4.2077], [81, 3.8946], [82, 4.0979], [83, 4.0979], [84, 4.2077]], "migrate": [[208, 9.4781], [209, 9.3261]], "min": [[284, 5.5948], [285, 5.3943]], "mlo": [[261, 5.8879]], "mode": [[121, 3.6982], [122, 3.5762], [123, 3.7236], [144, 4.6339], [145, 4.4561], [146, 4.556], [147, 4.556], [148, 4.6076], [162, 4.5336]], "model": [[5, 5.2998], [39, 5.0853], [154, 5.0853], [162, 3.755], [165, 5.0043]], "modified": [[75, 5.2119], [76, 4.9647], [77, 5.1268], [78, 5.1268], [79, 5.2119]], "module": [[290, 9.8888]], "monitor": [[5, 1.9669], [39, 1.8547], [154, 1.8547], [156, 2.041], [157, 2.6369], [160, 2.6804], [163, 1.6479], [164, 1.5243], [165, 1.8133], [166, 1.6479], [168, 2.6804], [169, 1.898], [171, 1.5243], [172, 1.9204], [173, 1.8547], [174, 2.1489], [175, 1.4825], [176, 1.5684], [177, 1.4825], [178, 1.4825], [179, 2.1489], [180, 1.4825], [181, 2.1489], [182, 2.1489], [183, 1.8547], [184, 1.6479], [185, 2.368], [187, 1.6313], [190, 1.6313], [191, 2.6804], [193, 2.5948], [226, 2.2376], [227, 2.4762], [254, 2.368], [284, 1.6479], [285, 1.5684], [286, 1.6647]], "monthly": [[173, 4.8718], [179, 7.2397], [180, 6.6715], [181, 7.2397], [182, 7.2397], [285, 4.3131]], "move": [[237, 10.4187]], "msg": [[5, 4.5535], [154, 4.2937]], "na": [[144, 4.5022], [145, 4.2871], [146, 4.4074], [147, 4.4074], [148, 4.4701]], "name": [[5, 2.5149], [28, 1.9703], [29, 1.8255], [30, 1.9195], [31, 1.9195], [32, 1.9703], [39, 2.4131], [75, 1.7608], [76, 1.6443], [77, 1.7202], [78, 1.7202], [79, 1.7608], [105, 1.5916], [106, 1.4957], [107, 1.5583], [108, 1.5583], [109, 1.5916], [116, 1.5748], [117, 1.4809], [118, 1.5422], [119, 1.5422], [120, 1.5748], [134, 2.1364], [135, 2.0483], [136, 2.1062], [137, 2.1062], [138, 1.6814], [139, 1.5748], [140, 1.6443], [141, 1.6443], [142, 1.6814], [149, 1.9703], [150, 1.8255], [151, 1.9195], [152, 1.9195], [153, 1.9703], [154, 2.4131], [155, 2.0483], [162, 1.7819], [165, 2.3747], [186, 1.4663], [189, 2.533], [259, 1.7005], [261, 2.1062]], "needed": [[189, 3.9771]], "negative": [[5, 5.9019], [39, 5.663], [154, 5.663]], "network": [[85, 4.9191], [86, 4.8277], [87, 4.8882], [88, 4.8882], [89, 4.9191], [90, 1.9598], [91, 1.8615], [92, 1.9259], [93, 1.9259], [94, 1.9598], [134, 3.8091], [135, 3.6831], [136, 3.7662], [137, 3.7662], [155, 3.6831], [189, 3.785], [288, 4.8592]], "networkconf": [[85, 2.5172], [86, 2.3769], [87, 2.4686], [88, 2.4686], [89, 2.5172], [90, 3.4223], [91, 3.2902], [92, 3.3771], [93, 3.3771], [94, 3.4223], [189, 2.4423]], "networkgroup": [[85, 3.09], [86, 2.9178], [87, 3.0304], [88, 3.0304], [89, 3.09]], "new": [[2, 3.4733], [8, 3.1338], [15, 3.1338], [20, 3.1338], [25, 3.1338], [30, 3.1062], [35, 3.1062], [42, 3.1619], [47, 3.1619], [52, 3.4733], [57, 3.1338], [62, 3.1338], [67, 3.1619], [72, 3.1619], [77, 2.878], [82, 3.1338], [87, 2.5274], [92, 2.3272], [97, 3.1338], [102, 3.1338], [107, 2.6811], [113, 3.4394], [118, 2.6609], [126, 3.1338], [131, 3.4733], [136, 2.4917], [140, 2.787], [146, 2.4742], [151, 3.1062], [263, 3.0791], [269, 3.0524]], "ng": [[144, 4.5022], [145, 4.2871], [146, 4.4074], [147, 4.4074], [148, 4.4701]], "no": [[163, 3.6157], [164, 3.4127], [166, 3.6157], [171, 3.4127], [175, 3.3424], [176, 3.4861], [177, 3.3424], [178, 3.3424], [180, 3.3424], [184, 3.6157], [187, 3.589], [189, 2.3215], [190, 3.589]], "notify": [[90, 4.2011], [91, 4.039], [92, 4.1456], [93, 4.1456], [94, 4.2011]], "num": [[173, 6.7459]], "o": [[173, 4.7538]], "of": [[286, 6.2407]], "offset": [[75, 6.0243], [76, 5.8018], [77, 5.9483], [78, 5.9483], [79, 6.0243]], "oid": [[173, 4.7538]], "on": [[290, 7.213]], "once": [[116, 4.8126], [117, 4.6011], [118, 4.74], [119, 4.74], [120, 4.8126]], "one": [[283, 6.8009]], "only": [[116, 4.6105], [117, 4.4079], [118, 4.5409], [119, 4.5409], [120, 4.6105], [291, 4.8718]], "operator": [[65, 7.837], [66, 7.7087], [67, 7.7937], [68, 7.7937], [69, 7.837]], "option": [[13, 7.8153], [14, 7.6878], [15, 7.7723], [16, 7.7723], [17, 7.8153]], "over": [[285, 5.9723]], "override": [[212, 8.6679], [282, 7.5507], [283, 8.1089]], "overview": [[288, 9.4317]], "package": [[70, 7.837], [71, 7.7087], [72, 7.7937], [73, 7.7937], [74, 7.837]], "payment": [[170, 10.5316]], "per": [[284, 6.1943]], "pick": [[285, 5.9723]], "plan": [[11, 10.3674]], "poe": [[282, 4.8467], [283, 4.3433]], "point": [[55, 7.4872], [56, 7.365], [57, 7.446], [58, 7.446], [59, 7.4872], [285, 4.3131]], "policie": [[262, 7.911], [263, 5.7615], [264, 5.8639], [265, 5.8639]], "policy": [[262, 5.8639], [263, 7.8571], [264, 7.911], [265, 7.911]], "port": [[90, 5.2095], [91, 5.1252], [92, 5.1811], [93, 5.1811], [94, 5.2095], [95, 5.833], [96, 5.7276], [97, 5.7975], [98, 5.7975], [99, 5.833], [171, 5.1654], [201, 5.4948], [282, 5.5451], [283, 5.7214]], "portal": [[221, 10.1292]], "portconf": [[90, 2.7637], [91, 2.6251], [92, 2.7159], [93, 2.7159], [94, 2.7637]], "portforward": [[95, 4.031], [96, 3.7311], [97, 3.9258], [98, 3.9258], [99, 4.031], [171, 2.8215]], "post": [[161, 5.3943], [186, 5.4728]], "posture": [[121, 4.7741], [122, 4.6165], [123, 4.8069]], "power": [[201, 10.2935]], "poweroff": [[280, 10.456]], "preference": [[85, 4.0679], [86, 3.8978], [87, 4.0096], [88, 4.0096], [89, 4.0679], [121, 4.6005], [122, 4.4777], [123, 4.6258]], "preset": [[121, 4.7741], [122, 4.6165], [123, 4.8069]], "priority": [[85, 4.5676], [86, 4.3767], [87, 4.5022], [88, 4.5022], [89, 4.5676]], "profile": [[90, 5.599], [91, 5.5164], [92, 5.5712], [93, 5.5712], [94, 5.599], [105, 5.8931], [106, 5.8017], [107, 5.8623], [108, 5.8623], [109, 5.8931], [282, 5.0053], [283, 2.877]], "programming": [[261, 5.8879]], "provision": [[200, 10.3254]], "purpose": [[85, 3.09], [86, 2.9178], [87, 3.0304], [88, 3.0304], [89, 3.09]], "qos": [[138, 5.8741], [139, 5.6623], [140, 5.8018], [141, 5.8018], [142, 5.8741]], "query": [[284, 8.9907]], "ra": [[85, 4.5676], [86, 4.3767], [87, 4.5022], [88, 4.5022], [89, 4.5676]], "radar": [[286, 4.267]], "radio": [[134, 4.5022], [135, 4.3165], [136, 4.4385], [137, 4.4385], [155, 4.3165]], "radiu": [[100, 6.4587], [101, 6.3419], [102, 6.4193], [103, 6.4193], [104, 6.4587], [105, 6.1028], [106, 5.9984], [107, 6.0676], [108, 6.0676], [109, 6.1028]], "radiusaccount": [[100, 4.2077], [101, 3.8946], [102, 4.0979], [103, 4.0979], [104, 4.2077]], "radiusprofile": [[105, 3.354], [106, 3.152], [107, 3.2839], [108, 3.2839], [109, 3.354]], "range": [[285, 6.4363], [286, 5.6367]], "rate": [[90, 4.2561], [91, 4.1227], [92, 4.2107], [93, 4.2107], [94, 4.2561], [138, 4.9195], [139, 4.7421], [140, 4.8589], [141, 4.8589], [142, 4.9195]], "read": [[291, 6.7459]], "readonly": [[291, 4.7538]], "reboot": [[256, 9.3769], [281, 9.4441]], "reconnect": [[253, 10.4549]], "record": [[18, 6.5452], [19, 6.4384], [20, 6.5092], [21, 6.5092], [22, 6.5452], [124, 6.5452], [125, 6.4384], [126, 6.5092], [127, 6.5092], [128, 6.5452]], "reference": [[291, 7.8412]], "remote": [[172, 10.0885]], "remoteuservpn": [[172, 4.9223]], "rename": [[211, 10.4937]], "report": [[173, 5.4642], [174, 5.8516], [175, 5.3923], [176, 3.4861], [177, 5.3923], [178, 5.3923], [179, 5.8516], [180, 5.3923], [181, 5.8516], [182, 5.8516], [284, 4.2815], [285, 5.1553], [287, 5.3075]], "require": [[163, 3.6157], [164, 3.4127], [166, 3.6157], [171, 3.4127], [175, 3.3424], [176, 3.4861], [177, 3.3424], [178, 3.3424], [180, 3.3424], [184, 3.6157], [186, 3.5368], [187, 3.589], [190, 3.589]], "reset": [[254, 9.4537]], "resolved": [[189, 3.9771]], "rest": [[0, 0.8223], [1, 0.7515], [2, 0.7973], [3, 0.7973], [4, 0.8223], [5, 0.6333], [6, 0.7011], [7, 0.649], [8, 0.6828], [9, 0.6828], [10, 0.7011], [11, 0.7011], [12, 0.7204], [13, 0.7011], [14, 0.649], [15, 0.6828], [16, 0.6828], [17, 0.7011], [18, 0.7011], [19, 0.649], [20, 0.6828], [21, 0.6828], [22, 0.7011], [23, 0.7011], [24, 0.649], [25, 0.6828], [26, 0.6828], [27, 0.7011], [28, 0.6919], [29, 0.641], [30, 0.674], [31, 0.674], [32, 0.6919], [33, 0.649], [34, 0.641], [35, 0.674], [36, 0.674], [37, 0.6919], [38, 0.8223], [39, 0.5971], [40, 0.7106], [41, 0.6571], [42, 0.6919], [43, 0.6919], [44, 0.7106], [45, 0.7106], [46, 0.6571], [47, 0.6919], [48, 0.6919], [49, 0.7106], [50, 0.8223], [51, 0.7515], [52, 0.7973], [53, 0.7973], [54, 0.8223], [55, 0.7011], [56, 0.649], [57, 0.6828], [58, 0.6828], [59, 0.7011], [60, 0.7011], [61, 0.649], [62, 0.6828], [63, 0.6828], [64, 0.7011], [65, 0.7106], [66, 0.6571], [67, 0.6919], [68, 0.6919], [69, 0.7106], [70, 0.7106], [71, 0.6571], [72, 0.6919], [73, 0.6919], [74, 0.7106], [75, 0.6183], [76, 0.5774], [77, 0.604], [78, 0.604], [79, 0.6183], [80, 0.7011], [81, 0.649], [82, 0.6828], [83, 0.6828], [84, 0.7011], [85, 0.5149], [86, 0.4862], [87, 0.505], [88, 0.505], [89, 0.5149], [90, 0.4605], [91, 0.4374], [92, 0.4526], [93, 0.4526], [94, 0.4605], [95, 0.7011], [96, 0.649], [97, 0.6828], [98, 0.6828], [99, 0.7011], [100, 0.7011], [101, 0.649], [102, 0.6828], [103, 0.6828], [104, 0.7011], [105, 0.5589], [106, 0.5252], [107, 0.5472], [108, 0.5472], [109, 0.5589], [110, 0.6333], [111, 0.8096], [112, 0.7408], [113, 0.7853], [114, 0.7853], [115, 0.8096], [116, 0.553], [117, 0.52], [118, 0.5415], [119, 0.5415], [120, 0.553], [124, 0.7011], [125, 0.649], [126, 0.6828], [127, 0.6828], [128, 0.7011], [129, 0.8223], [130, 0.7515], [131, 0.7973], [132, 0.7973], [133, 0.8223], [134, 0.505], [135, 0.4773], [136, 0.4954], [137, 0.4954], [138, 0.5904], [139, 0.553], [140, 0.5774], [141, 0.5774], [142, 0.5904], [143, 0.7106], [144, 0.505], [145, 0.473], [146, 0.4907], [147, 0.4907], [148, 0.5001], [149, 0.6919], [150, 0.641], [151, 0.674], [152, 0.674], [153, 0.6919]], "restart": [[199, 9.4781], [221, 9.1489]], "result": [[176, 9.1447]], "retention": [[121, 4.7741], [122, 4.6165], [123, 4.8069]], "return": [[163, 3.6157], [164, 3.4127], [166, 3.6157], [171, 3.4127], [175, 3.3424], [176, 3.4861], [177, 3.3424], [178, 3.3424], [180, 3.3424], [184, 3.6157], [187, 3.589], [190, 3.589], [292, 4.2845]], "revoke": [[230, 8.7462], [243, 8.7462], [246, 8.5328]], "roam": [[286, 4.267]], "rogue": [[110, 9.0188], [183, 8.6959]], "rogueap": [[183, 4.7538]], "rogueknown": [[110, 5.0414]], "rolling": [[214, 9.3769], [215, 9.1489]], "rollupgrade": [[219, 9.3769], [220, 9.3769]], "route": [[111, 7.2418], [112, 7.0898], [113, 7.1904], [114, 7.1904], [115, 7.2418], [272, 7.1273], [273, 7.1273]], "routing": [[111, 4.6546], [112, 4.2593], [113, 4.5149], [114, 4.5149], [115, 4.6546], [184, 6.7093]], "rule": [[45, 6.7605], [46, 6.6498], [47, 6.7232], [48, 6.7232], [49, 6.7605], [268, 6.6863], [269, 6.6498], [270, 6.6863], [271, 6.6863]], "run": [[202, 10.0557]], "s": [[290, 7.213]], "scale": [[85, 4.3758], [86, 4.1929], [87, 4.3131], [88, 4.3131], [89, 4.3758], [156, 5.2091]], "scan": [[188, 9.4423], [210, 9.3769]], "schedule": [[116, 7.266], [117, 7.1421], [118, 7.2242], [119, 7.2242], [120, 7.266]], "scheduletask": [[116, 3.3185], [117, 3.1207], [118, 3.2499], [119, 3.2499], [120, 3.3185]], "schema": [[291, 4.7538]], "sdn": [[185, 10.2719]], "search": [[286, 7.5747], [289, 8.326], [292, 7.5507]], "security": [[121, 4.7741], [122, 4.6165], [123, 4.8069]], "see": [[189, 3.9771]], "seen": [[134, 4.1512], [135, 3.9801], [136, 4.0925], [137, 4.0925], [155, 3.9801], [189, 3.5403], [261, 4.0925]], "selected": [[75, 3.7106], [76, 3.465], [77, 3.6249], [78, 3.6249], [79, 3.7106]], "self": [[275, 10.6355]], "serie": [[284, 5.5948], [285, 5.3943]], "server": [[105, 6.6215], [106, 6.4581], [107, 6.5661], [108, 6.5661], [109, 6.6215]], "session": [[186, 9.2024]], "set": [[204, 6.8663], [219, 7.4974], [225, 7.4568], [239, 6.9597], [282, 6.4957], [283, 6.1948]], "setting": [[85, 4.0679], [86, 3.8978], [87, 4.0096], [88, 4.0096], [89, 4.0679], [121, 6.1849], [122, 5.9168], [123, 6.026]], "single": [[1, 3.3899], [7, 3.0699], [14, 3.0699], [19, 3.0699], [24, 3.0699], [29, 3.0438], [34, 3.0438], [41, 3.0965], [46, 3.0965], [51, 3.3899], [56, 3.0699], [61, 3.0699], [66, 3.0965], [71, 3.0965], [76, 2.8273], [81, 3.0699], [86, 2.4924], [91, 2.3001], [96, 3.0699], [101, 3.0699], [106, 2.6395], [112, 3.3581], [117, 2.6202], [125, 3.0699], [130, 3.3899], [135, 2.4582], [139, 2.7407], [145, 2.4414], [150, 3.0438], [288, 2.9436]], "singular": [[169, 6.8569]], "site": [[116, 3.2817], [117, 3.1375], [118, 3.2322], [119, 3.2322], [120, 3.2817], [121, 2.9234], [122, 2.8269], [123, 2.9434], [156, 3.7078], [173, 4.0307], [181, 5.1531], [187, 4.7604], [197, 5.225], [233, 5.3366], [234, 5.3366], [235, 5.3366], [239, 5.2913], [276, 5.4671], [278, 5.3748]], "sitedpi": [[187, 4.1813]], "sitemgr": [[233, 5.1866], [234, 5.1866], [235, 5.1866], [236, 5.1866], [237, 5.2246], [238, 5.2246], [239, 4.9352], [240, 5.2246], [241, 4.9696], [242, 5.2246], [243, 5.2246], [244, 4.9696], [245, 5.2246], [246, 4.9696]], "spatial": [[124, 7.712], [125, 7.5725], [126, 7.6649], [127, 7.6649], [128, 7.712]], "spatialrecord": [[124, 4.2077], [125, 3.8946], [126, 4.0979], [127, 4.0979], [128, 4.2077]], "specific": [[122, 5.4994]], "spectrum": [[188, 9.3261], [210, 9.3769]], "speedtest": [[176, 7.8861], [202, 8.7775], [203, 8.6411]], "ssid": [[189, 3.9771]], "sta": [[173, 4.6889], [189, 1.6678], [247, 6.6085], [248, 6.6085], [249, 6.6085], [250, 6.6085], [253, 6.6085]], "stadpi": [[190, 4.1813]], "stamgr": [[247, 6.2321], [248, 6.2321], [249, 6.2321], [250, 6.2321], [251, 6.3228], [252, 6.3228], [253, 6.2321]], "start": [[85, 4.3758], [86, 4.1929], [87, 4.3131], [88, 4.3131], [89, 4.3758], [186, 4.3758]], "stat": [[154, 3.5279], [155, 1.3924], [156, 1.9169], [157, 2.4766], [158, 2.1922], [159, 2.131], [160, 2.5175], [161, 1.473], [162, 1.8253], [163, 3.4915], [164, 3.4135], [165, 3.5048], [166, 3.4915], [167, 2.4766], [168, 2.5175], [169, 1.7826], [170, 2.4766], [171, 3.4135], [172, 2.9284], [173, 1.742], [174, 2.0183], [175, 1.3924], [176, 1.473], [177, 1.3924], [178, 1.3924], [179, 2.0183], [180, 1.3924], [181, 2.0183], [182, 2.0183], [183, 1.742], [184, 3.4915], [185, 2.2241], [186, 1.502], [187, 1.5322], [188, 2.131], [189, 0.8792], [190, 1.5322], [191, 2.5175], [192, 2.4766], [254, 3.2621], [277, 3.8314], [278, 3.8314]], "state": [[162, 4.4991], [260, 5.5535]], "statu": [[185, 8.1339], [203, 8.151], [279, 8.4218], [288, 3.8522]], "stitche": [[285, 5.9723]], "stop": [[85, 4.5676], [86, 4.3767], [87, 4.5022], [88, 4.5022], [89, 4.5676]], "store": [[284, 6.1943]], "sum": [[284, 6.1943]], "summary": [[288, 4.8648]], "super": [[244, 9.1808], [246, 9.1808]], "support": [[156, 7.213]], "supported": [[144, 4.5022], [145, 4.2871], [146, 4.4074], [147, 4.4074], [148, 4.4701]], "switch": [[282, 7.5563], [283, 7.127]], "sync": [[284, 6.1943]], "sysinfo": [[191, 10.414]], "system": [[255, 6.6665], [256, 6.5694], [257, 6.5694], [258, 6.5694], [280, 7.5512], [281, 7.5512]], "tag": [[129, 7.8821], [130, 7.7162], [131, 7.826], [132, 7.826], [133, 7.8821]], "target": [[116, 4.8126], [117, 4.6011], [118, 4.74], [119, 4.74], [120, 4.8126]], "task": [[116, 7.4058], [117, 7.2912], [118, 7.3672], [119, 7.3672], [120, 7.4058]], "test": [[224, 10.3816]], "text": [[286, 6.2407]], "the": [[189, 3.5922], [284, 5.5948]], "time": [[186, 4.3758], [189, 2.8722], [260, 4.4404], [284, 4.4734], [285, 4.3131], [286, 4.5069]], "timeout": [[90, 4.2011], [91, 4.039], [92, 4.1456], [93, 4.1456], [94, 4.2011]], "timeserie": [[284, 8.0789]], "timestamp": [[134, 4.3131], [135, 4.1353], [136, 4.2522], [137, 4.2522], [155, 4.1353], [156, 5.962]], "timezone": [[121, 4.7741], [122, 4.6165], [123, 4.8069]], "to": [[39, 5.663], [165, 5.5727], [189, 4.9737]], "tolerant": [[292, 7.3401]], "tool": [[289, 7.8537], [290, 7.3918], [291, 5.3418], [292, 5.8123]], "top": [[75, 5.2119], [76, 4.9647], [77, 5.1268], [78, 5.1268], [79, 5.2119]], "traffic": [[268, 6.8056], [269, 6.7644], [270, 6.8056], [271, 6.8056], [272, 6.7849], [273, 6.7849], [284, 2.8356], [285, 2.6988]], "trafficroute": [[272, 4.7851], [273, 4.7851]], "transition": [[144, 4.5022], [145, 4.2871], [146, 4.4074], [147, 4.4074], [148, 4.4701]], "trend": [[284, 3.8149], [285, 3.6309]], "type": [[75, 3.6957], [76, 3.5205], [77, 3.6354], [78, 3.6354], [79, 3.6957], [85, 3.2389], [86, 3.1035], [87, 3.1925], [88, 3.1925], [89, 3.2389], [121, 3.04], [122, 2.9396], [123, 3.0608], [162, 2.6626], [173, 3.606], [186, 3.2389], [291, 4.5618]], "typo": [[292, 7.3401]], "uap": [[189, 5.9249]], "ucg": [[163, 3.706], [164, 3.498], [166, 3.706], [171, 3.498], [175, 3.4259], [176, 3.5732], [177, 3.4259], [178, 3.4259], [180, 3.4259], [184, 3.706], [187, 3.6787], [190, 3.6787]], "udm": [[163, 3.706], [164, 3.498], [166, 3.706], [171, 3.498], [175, 3.4259], [176, 3.5732], [177, 3.4259], [178, 3.4259], [180, 3.4259], [184, 3.706], [187, 3.6787], [190, 3.6787]], "unauthorize": [[251, 10.3816]], "unblock": [[248, 10.4549]], "unexpected": [[287, 7.4717]], "unifi": [[163, 3.6157], [164, 3.4127], [166, 3.6157], [171, 3.4127], [175, 3.3424], [176, 3.4861], [177, 3.3424], [178, 3.3424], [180, 3.3424], [184, 3.6157], [187, 3.589], [190, 3.589], [289, 4.4819]], "unlocate": [[205, 9.8187]], "unpoller": [[156, 6.5149], [169, 6.1933]], "unset": [[205, 8.5388], [220, 9.3769]], "up": [[138, 5.0445], [139, 4.8126], [140, 4.9647], [141, 4.9647], [142, 5.0445]], "update": [[3, 3.9292], [9, 3.7604], [16, 3.7604], [21, 3.7604], [26, 3.7604], [31, 3.7458], [36, 3.7458], [43, 3.7751], [48, 3.7751], [53, 3.9292], [58, 3.7604], [63, 3.7604], [68, 3.7751], [73, 3.7751], [78, 3.6191], [83, 3.7604], [88, 3.4017], [93, 3.2634], [98, 3.7604], [103, 3.7604], [108, 3.5006], [114, 3.9132], [119, 3.488], [123, 3.3311], [127, 3.7604], [132, 3.9292], [137, 3.3778], [141, 3.5655], [147, 3.366], [152, 3.7458], [216, 3.9014], [235, 3.9986], [242, 4.0129], [264, 3.7604], [267, 3.7604], [270, 3.7458], [273, 3.7313], [283, 2.6195]], "upgrade": [[116, 4.0305], [117, 3.8533], [118, 3.9696], [119, 3.9696], [120, 4.0305], [206, 6.6249], [207, 6.5187], [214, 6.5542], [215, 6.3948], [217, 6.3948]], "upgraded": [[161, 5.9723]], "uptime": [[161, 5.3943], [189, 4.6004]], "url": [[161, 5.9723]], "use": [[105, 4.6461], [106, 4.4404], [107, 4.5755], [108, 4.5755], [109, 4.6461], [189, 2.8722]], "user": [[134, 5.3378], [135, 5.2393], [136, 5.3046], [137, 5.3046], [138, 5.7255], [139, 5.6262], [140, 5.692], [141, 5.692], [142, 5.7255], [155, 5.2393], [172, 5.8887], [173, 3.9376], [182, 5.8516]], "usergroup": [[138, 3.5432], [139, 3.3185], [140, 3.465], [141, 3.465], [142, 3.5432]], "usg": [[105, 3.4389], [106, 3.2867], [107, 3.3866], [108, 3.3866], [109, 3.4389], [163, 3.3111], [164, 3.1253], [166, 3.3111], [171, 3.1253], [175, 3.0608], [176, 3.1925], [177, 3.0608], [178, 3.0608], [180, 3.0608], [184, 3.3111], [187, 3.2867], [190, 3.2867]], "usw": [[189, 5.9249]], "utilization": [[284, 3.8149], [285, 3.6309]], "v2": [[259, 4.3717], [260, 4.0657], [261, 3.9282], [262, 4.6958], [263, 4.6333], [264, 4.6958], [265, 4.6958], [266, 4.6958], [267, 4.6958], [268, 4.6643], [269, 4.6027], [270, 4.6643], [271, 4.6643], [272, 4.6333], [273, 4.6333]], "validity": [[231, 10.1645]], "value": [[291, 4.7538]], "via": [[189, 3.9771]], "virtual": [[143, 10.2618]], "virtualdevice": [[143, 5.6575]], "visual": [[261, 5.8879]], "vlan": [[189, 4.9737], [282, 7.023], [283, 4.0367]], "voucher": [[192, 8.3395], [229, 8.2501], [230, 8.2501], [232, 8.2501]], "vpn": [[172, 10.0885]], "when": [[161, 5.9723]], "which": [[292, 8.366]], "width": [[260, 6.1486]], "wifi": [[11, 3.112], [144, 2.2413], [145, 2.0995], [146, 2.1782], [147, 2.1782], [148, 2.2199], [149, 3.0709], [150, 2.8452], [151, 2.9918], [152, 2.9918], [153, 3.0709], [158, 3.3354], [159, 3.2423], [188, 3.2423], [259, 2.6504]], "wired": [[134, 4.3131], [135, 4.1353], [136, 4.2522], [137, 4.2522], [155, 4.1353], [186, 4.3758]], "wireless": [[189, 3.9771]], "with": [[161, 4.7292], [186, 4.798], [189, 3.1493], [284, 4.905]], "wlan": [[144, 5.6156], [145, 5.495], [146, 5.5633], [147, 5.5633], [148, 5.5981], [149, 6.2631], [150, 6.1502], [151, 6.225], [152, 6.225], [153, 6.2631], [288, 4.8764]], "wlanconf": [[144, 2.7942], [145, 2.6174], [146, 2.7156], [147, 2.7156], [148, 2.7675], [189, 2.7644], [259, 4.6889]], "wlangroup": [[149, 4.1521], [150, 3.8469], [151, 4.0451], [152, 4.0451], [153, 4.1521]], "word": [[286, 6.2407]], "writable": [[291, 4.7538]], "zone": [[266, 9.3125], [267, 9.3125]]}}')
+
+_SEARCH_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _search_tokens(text: str) -> list[str]:
+    """Tokenize like the generator: lowercase alphanumerics, plural 's' stripped."""
+    tokens = []
+    for t in _SEARCH_TOKEN_RE.findall(text.lower()):
+        if len(t) > 3 and t.endswith("s") and not t.endswith("ss"):
+            t = t[:-1]
+        tokens.append(t)
+    return tokens
+
+
+# Trigram index over search tokens and field names, for typo tolerance:
+# terms[i] = token or field name; trigrams[gram] = [i, ...]
+_TRIGRAM_INDEX = json.loads(r'{"terms": ["0", "1x", "5min", "5minute", "6e", "9999999999", "_is_guest_by_uap", "_is_guest_by_usw", "_last_seen_by_uap", "_last_seen_by_usw", "_uptime", "_uptime_by_uap", "_uptime_by_usw", "a", "account", "acct", "acct_servers", "action", "activate", "active", "ad_blocking_enabled", "add", "adhoc", "admin", "adopt", "adopt_ip", "adopt_url", "adoptable", "adoptable_when_upgraded", "adopted", "adopted_at", "adopted_by_client", "adoption", "adoption_completed", "advanced", "advanced_feature_enabled", "advanced_filtering_preference", "afc", "age", "aggregate", "airtime_avg", "alarm", "alert_enabled", "all", "allowed", "alluser", "also", "an", "and", "anomalie", "anomalies", "anomaly", "anon", "anon_client_id", "anon_id", "anonymous_controller_id", "antenna_table", "any", "ap", "ap_displayname", "ap_group_ids", "ap_group_mode", "ap_mac", "ap_model", "ap_name", "apgroup", "api", "apieventpathid", "app", "aps", "architecture", "archive", "archived", "are", "assign", "assignment", "assoc", "assoc_time", "at", "atf_enabled", "attr_hidden", "attr_hidden_id", "attr_no_delete", "attr_no_edit", "attribute", "auth", "auth_servers", "authorization", "authorize", "authorized", "auto", "auto_adjust_channels_to_country", "auto_channel_presets_type", "auto_enabled", "auto_engine_id_enabled", "auto_scale_enabled", "auto_upgrade", "auto_upgrade_hour", "autobackup", "autobackup_cron_expr", "autobackup_days", "autobackup_enabled", "autobackup_max_files", "autobackup_timezone", "automatically", "autoneg", "available_controller_channels", "available_firmware_channels", "avg", "b", "b_supported", "backup", "backup_to_cloud_enabled", "band", "bandsteering_mode", "basic", "bc", "bc_filter_enabled", "bc_filter_list", "ble_caps", "block", "blocked", "board_rev", "brightness", "broadcast", "broadcast_ping", "broadcastgroup", "bss", "bss_transition", "bssid", "bug", "build", "bulk", "bw", "by", "bytes", "bytes-d", "bytes-r", "cable", "call", "cancel", "ccode", "ccq", "center", "center_freq", "cfgversion", "channel", "channel_from", "channel_to", "channel_width", "channelplan", "channels_6e", "channels_6e_160", "channels_6e_320", "channels_6e_40", "channels_6e_80", "channels_6e_indoor", "channels_6e_outdoor", "channels_6e_psc", "channels_ad_1080", "channels_ad_2160", "channels_ad_4320", "channels_ad_ext_1080", "channels_ad_ext_2160", "channels_ad_ext_outdoor", "channels_ad_outdoor", "channels_blacklist", "channels_na", "channels_na_160", "channels_na_240", "channels_na_40", "channels_na_80", "channels_na_dfs", "channels_na_indoor", "channels_na_outdoor", "channels_ng", "channels_ng_40", "channels_ng_indoor", "channels_ng_outdoor", "channelwidth", "check", "clear", "client", "cloud_env", "cloudkey", "cmd", "code", "column", "command", "community", "completed", "compose", "config", "config_network", "configure", "connect_request_ip", "connect_request_port", "connected", "connected_at", "connecting", "connection", "connection_network_id", "connection_network_name", "content", "content_filtering_blocking_page_enabled", "content_type", "country", "country_code", "countrycode_table", "create", "credential_caps", "cron", "cron_expr", "cross", "ctrl", "current", "custom_services", "cycle", "daily", "dashboard", "data", "data_retention_days", "data_retention_setting_preference", "data_retention_time_in_hours_for_5minutes_scale", "data_retention_time_in_hours_for_daily_scale", "data_retention_time_in_hours_for_hourly_scale", "data_retention_time_in_hours_for_monthly_scale", "data_retention_time_in_hours_for_others", "datetime", "debug_device", "debug_mgmt", "debug_sdn", "debug_setting_preference", "debug_system", "debug_tools_enabled", "default", "default_security_posture", "default_site_device_auth_password_alert", "delete", "demand", "describe", "detailed", "detailed_states", "device", "device_auth", "device_id", "device_macs", "devmgr", "dfs", "dhcp", "dhcp_server_table", "dhcp_snoop", "dhcpd", "dhcpd_conflict_checking", "dhcpd_enabled", "dhcpd_start", "dhcpd_stop", "dhcpdv6", "dhcpdv6_dns_auto", "dhcpdv6_enabled", "dhcpdv6_leasetime", "dhcpdv6_start", "dhcpdv6_stop", "dhcpend_time", "dhcpguard_enabled", "dhcpoption", "disable", "disabled", "disconnect", "disconnect_timestamp", "disconnected_at", "discover", "discoverable", "discovered_via", "display", "display_name", "displayable_version", "displayname", "dns", "dns_filtering", "dns_verification", "dnsrecord", "domain_name", "dot1x", "dot1x_ctrl", "dot1x_fallback_networkconf_id", "dot1x_idle_timeout", "dot1x_portctrl_enabled", "down", "downlink_lldp_macs", "downlink_table", "download", "downsample", "dpi", "dpiapp", "dpigroup", "dropped_rate_avg", "dtim", "dtim_6e", "dtim_mode", "dtim_na", "dtim_ng", "duration", "dynamic", "dynamicdn", "eagerly_discovered", "ec_enabled", "egress", "egress_rate_limit_kbps", "egress_rate_limit_kbps_enabled", "element", "element_peer_mac", "empty", "enable", "enable_analytics", "enabled", "enabled_categories", "end", "endpoint", "endpoint_scanning", "enhanced_iot", "enriched", "entrie", "enum", "error", "essid", "ethernet_table", "event", "evtmgr", "exclude_devices", "excluded", "excluded_network_ids", "excluded_networkconf_ids", "execute", "execute_only_once", "existing", "expire", "expire_number", "expire_unit", "export_frequency", "expr", "extend", "external", "external_id", "facebook_enabled", "facebook_wifi_gw_name", "facebook_wifi_registered", "fast_roaming_enabled", "field", "file", "filename", "filesize", "filter", "filtering", "find", "fingerbank", "fingerprint", "fingerprintingenabled", "firewall", "firewallgroup", "firewallrule", "firmware", "firmware_channel", "first", "first_seen", "fixed_ap_available", "flag", "flowctrl_enabled", "for", "for_wlanconf", "force", "forget", "form", "forward", "freq", "from", "ftp_module", "full", "fw2_caps", "fw3_caps", "fw_caps", "gateway", "gateway_mac", "generate", "get", "gh", "github", "global", "google_enabled", "grant", "granularity", "gre_module", "grep", "group", "group_rekey", "guest", "guest-num_sta", "guest-wlan-num_sta", "guest_kicks", "guest_token", "gw", "gw_mac", "h323_module", "has_eth1", "has_fan", "has_speaker", "has_sso_auth", "has_temperature", "has_webrtc", "has_webrtc_support", "hash_id", "health", "heatmap", "heatmappoint", "height", "heightinmeters", "help", "hide_ch_width", "hide_ssid", "hints", "historical", "history", "honeypot_enabled", "hostname", "hostname_source", "hotspot", "hotspot2", "hotspot2conf", "hotspot2conf_enabled", "hotspotop", "hotspotpackage", "hourly", "ht_modes_na", "ht_modes_ng", "http", "https_port", "hw_caps", "iapp_enabled", "icmp_timeout", "id", "identity", "idle", "idle_timeout", "idletime", "ids", "if", "igmp_snooping", "image_maps_use_google_engine", "in", "in_gateway_mode", "incremental", "inform", "inform_ip", "inform_port", "inform_url", "interface", "internet", "interval", "invite", "ip", "ip_addrs", "ip_subnet", "ips", "ips_mode", "ipv6", "ipv6_client_address_assignment", "ipv6_enabled", "ipv6_interface_type", "ipv6_pd_start", "ipv6_pd_stop", "ipv6_ra_enabled", "ipv6_ra_preferred_lifetime", "ipv6_ra_priority", "ipv6_setting_preference", "is", "is_11r", "is_access_point", "is_adhoc", "is_admin", "is_allowed_in_visual_programming", "is_cloud_key", "is_guest", "is_mlo", "is_nat", "is_negative", "is_rogue", "is_ubnt", "is_udm", "is_wired", "isolated", "isolation", "issue", "join", "jumboframe_enabled", "just", "kbp", "kernel_version", "key", "keyword", "kick", "known", "known_cfgversion", "l2_isolation", "last", "last_1x_identity", "last_connection_network_id", "last_connection_network_name", "last_ip", "last_modified", "last_radio", "last_seen", "last_uplink", "last_uplink_mac", "last_uplink_name", "last_uplink_remote_port", "latest_assoc_time", "layout_preference", "lazy", "led", "led_enabled", "led_override", "led_override_color", "led_override_color_brightness", "left", "limit", "link_aggregation_groups", "list", "live_chat", "live_updates", "lldp_table", "lldpmed", "lldpmed_enabled", "lldpmed_notify_enabled", "load", "loading", "local", "local_dns_record_enabled", "locate", "locating", "log", "log_all_contents", "logout", "lte_lan_enabled", "mac", "mac_filter_enabled", "mac_filter_list", "mac_filter_policy", "manual", "manufacturer_id", "many", "map", "map_id", "mapping", "max", "mcastenhance_enabled", "mcp", "md5", "mdns_enabled", "mdns_proxy_custom", "mdns_proxy_mode", "media", "mediafile", "memory_optimized", "mesh_sta_vap_enabled", "meshv3_peer_mac", "mgmt_network_id", "migrate", "mimo", "min", "min_inform_interval_seconds", "minimum_usable_hd_space", "minimum_usable_sd_space", "minrate_na_advertising_rates", "minrate_na_data_rate_kbps", "minrate_na_enabled", "minrate_ng_advertising_rates", "minrate_ng_data_rate_kbps", "minrate_ng_enabled", "minrate_setting_preference", "mlo", "mlo_enabled", "mode", "model", "model_in_eol", "model_in_lts", "model_incompatible", "modified", "module", "monitor", "monthly", "move", "msg", "mss_clamp", "multiple_sites_enabled", "na", "name", "native_networkconf_id", "needed", "negative", "network", "network_defaults", "network_id", "network_members_group_ids", "network_name", "network_overrides", "networkconf", "networkconf_id", "networkgroup", "new", "next_interval", "ng", "no", "no2ghz_oui", "noise", "noted", "notify", "nss", "ntp_server_1", "ntp_server_2", "ntp_server_3", "ntp_server_4", "num", "num_adopted", "num_ap", "num_disabled", "num_disconnected", "num_guest", "num_gw", "num_iot", "num_pending", "num_sta", "num_sw", "num_user", "o", "of", "offload_accounting", "offload_l2_blocking", "offload_sch", "offset", "offset_left", "offset_top", "oid", "on", "once", "one", "only", "op_mode", "operator", "optimize", "optimize_iot_wifi_connectivity", "option", "other_timeout", "oui", "outdoor_mode_override", "over", "overheating", "override", "override_inform_host", "overview", "package", "passphrase_autogenerated", "password_enabled", "payment", "payment_enabled", "per", "pick", "plan", "pmf_mode", "poe", "poe_mode", "point", "policie", "policy", "port", "port_overrides", "port_table", "portal", "portal_customized", "portal_customized_authentication_text", "portal_customized_bg_color", "portal_customized_bg_image_enabled", "portal_customized_bg_image_tile", "portal_customized_bg_type", "portal_customized_box_color", "portal_customized_box_link_color", "portal_customized_box_opacity", "portal_customized_box_radius", "portal_customized_box_text_color", "portal_customized_button_color", "portal_customized_button_text", "portal_customized_button_text_color", "portal_customized_languages", "portal_customized_link_color", "portal_customized_logo_enabled", "portal_customized_logo_position", "portal_customized_logo_size", "portal_customized_success_text", "portal_customized_text_color", "portal_customized_title", "portal_customized_tos", "portal_customized_welcome_text", "portal_enabled", "portal_hostname", "portal_http_port", "portal_use_hostname", "portconf", "portforward", "post", "posture", "power", "power_source_ctrl_enabled", "poweroff", "powersave_enabled", "pptp_module", "predefined_services", "preference", "preset", "prev_non_busy_state", "previous_version", "priority", "private_preshared_keys", "private_preshared_keys_enabled", "profile", "programming", "provider", "provision", "provisioned_at", "proxy_arp", "psk", "purpose", "qos", "qos_policy_applied", "qos_rate_max_down", "qos_rate_max_up", "query", "quick_scan_state", "quickscan_scanning", "ra", "radar", "radar_channel", "radio", "radio_from", "radio_name", "radio_proto", "radio_table", "radio_table_stats", "radio_to", "radios", "radios_configuration", "radiu", "radius_auth_type", "radius_das_enabled", "radius_disconnect_running", "radius_enabled", "radius_mac_auth_enabled", "radius_macacl_empty_password", "radius_macacl_format", "radiusaccount", "radiusprofile", "radiusprofile_id", "range", "rate", "rate_imbalance", "read", "readonly", "reboot", "reboot_duration", "receive_redirects", "reconnect", "record", "redirect_enabled", "redirect_https", "redirect_to_https", "redirect_url", "reference", "refresh_rate", "registered", "remote", "remoteuservpn", "rename", "report", "report_time", "require", "required_version", "reset", "resolved", "rest", "restart", "restricted_subnet_1", "restricted_subnet_2", "restricted_subnet_3", "result", "retention", "retries_rate_avg", "return", "revoke", "roam", "roam_count", "roaming_sessions", "rogue", "rogueap", "rogueknown", "rolling", "rollupgrade", "route", "routing", "rssi", "rssi_age", "rule", "run", "rx_bytes", "rx_bytes-d", "rx_bytes-r", "rx_packets", "rx_rate", "s", "sae_groups", "sae_psk", "safe_for_autoupgrade", "satisfaction", "satisfaction_avg", "satisfaction_now", "satisfaction_real", "satisfaction_reason", "scale", "scan", "scan_radio_table", "scanning", "schedule", "schedule_with_duration", "scheduletask", "schema", "sdn", "search", "security", "see", "seen", "selected", "self", "send_redirects", "serial", "serie", "server", "server_names", "service_mac", "session", "set", "setting", "setting_preference", "setup_id", "shortname", "signal", "single", "singular", "sip_module", "site", "site_id", "sitedpi", "sitemgr", "slimcfg_caps", "snmp_contact", "snmp_location", "spatial", "spatialrecord", "specific", "spectrum", "spectrum_scanning", "speed_defaults", "speed_overrides", "speedtest", "ssh_session_table", "ssid", "sso_app_id", "sso_login_enabled", "sta", "stadpi", "stamgr", "start", "start_connected_millis", "start_disconnected_millis", "startup_timestamp", "stat", "state", "statu", "status", "stitche", "stop", "store", "store_enabled", "stormctrl_bcast_enabled", "stormctrl_bcast_rate", "stormctrl_mcast_enabled", "stormctrl_mcast_rate", "stormctrl_ucast_enabled", "stormctrl_ucast_rate", "stp_port_mode", "stp_priority", "stp_version", "subsystem", "sum", "summary", "super", "support", "support_wifi6e", "supported", "supported_afc_regions", "supports_fingerprint_ml", "sw", "sw_depth", "sw_displayname", "sw_mac", "sw_model", "sw_name", "sw_port", "switch", "switch_caps", "switch_exclusions", "syn_cookies", "sync", "sys_error_caps", "sys_stats", "sysid", "sysinfo", "syslog_key", "system", "system-stats", "tag", "tagged_vlan_mgmt", "tags", "target", "task", "tcp_close_timeout", "tcp_close_wait_timeout", "tcp_established_timeout", "tcp_fin_wait_timeout", "tcp_last_ack_timeout", "tcp_syn_recv_timeout", "tcp_syn_sent_timeout", "tcp_time_wait_timeout", "template_engine", "test", "text", "tftp_module", "the", "time", "time_series_per_client_stats_enabled", "timeout", "timeout_setting_preference", "timeserie", "timestamp", "timestamps", "timezone", "to", "tolerant", "tool", "top", "total_max_effective_power", "total_max_power", "total_used_power", "touch_event", "traffic", "trafficroute", "transition", "trend", "two_phase_adopt", "tx_bytes", "tx_bytes-d", "tx_bytes-r", "tx_mcs", "tx_mcs_index", "tx_packets", "tx_power", "tx_rate", "tx_retries", "tx_retries_total", "tx_retry_burst_count", "type", "typo", "uap", "uapsd_enabled", "ubic_env", "ubic_uuid", "ucg", "udm", "udp_other_timeout", "udp_stream_timeout", "ugw3_wan2_enabled", "unauthorize", "unblock", "unexpected", "unifi", "unifi_device", "unifi_idp_enabled", "unit", "unlocate", "unpoller", "unset", "unsupported", "unsupported_device_count", "unsupported_device_list", "unsupported_reason", "up", "update", "update_available", "update_downloaded", "upgradable", "upgrade", "upgrade_duration", "upgrade_targets", "upgraded", "uplink", "uplink_depth", "uplink_mac", "uplink_table", "uplink_type", "upload", "upnp_enabled", "upnp_nat_pmp_enabled", "upnp_secure_mode", "upp", "uptime", "url", "use", "use_fixedip", "use_usg_auth_server", "user", "user-num_sta", "user-wlan-num_sta", "user_group_id_computed", "user_id", "usergroup", "usergroup_id", "usg", "usw", "utilization", "v2", "validity", "value", "vap_table", "version", "version_from", "version_to", "via", "virtual", "virtual_network_override_enabled", "virtualdevice", "visual", "vlan", "vlan_enabled", "voice_networkconf_id", "voucher", "voucher_enabled", "vpn", "vwire_table", "vwire_vap_table", "vwireenabled", "wan_dhcpv6_pd_size_auto", "wechat_enabled", "wep_idx", "when", "which", "width", "wifi", "wifi_caps", "wifi_caps2", "wifi_experience_average", "wifi_experience_score", "wifi_tx_attempts", "wifi_tx_attempts_total", "wifi_tx_dropped", "wifi_tx_dropped_total", "wifi_tx_retries_percentage", "wired", "wired-rx_bytes", "wired-rx_bytes-r", "wired-rx_packets", "wired-tx_bytes", "wired-tx_bytes-r", "wired-tx_packets", "wired_rate_mbps", "wireless", "with", "wlan", "wlan_band", "wlan_bands", "wlanconf", "wlanconf_id", "wlangroup", "wlangroup_id_na", "wlangroup_id_ng", "word", "wpa3_enhanced_192", "wpa3_fast_roaming", "wpa3_support", "wpa3_transition", "wpa_enc", "wpa_mode", "writable", "x", "x_aes_gcm", "x_api_token", "x_authkey", "x_certificate_arn", "x_certificate_pem", "x_element_essid", "x_element_psk", "x_fingerprint", "x_has_ssh_hostkey", "x_iapp_key", "x_mesh_essid", "x_mesh_psk", "x_mgmt_key", "x_passphrase", "x_password", "x_pregenerated_dh_key", "x_private_key", "x_ssh_auth_password_enabled", "x_ssh_bind_wildcard", "x_ssh_enabled", "x_ssh_hostkey_fingerprint", "x_ssh_keys", "x_ssh_md5passwd", "x_ssh_password", "x_ssh_sha512passwd", "x_ssh_username", "x_vwirekey", "y", "zone", "zoom"], "trigrams": {"  0": [0], "  1": [1], "  5": [2, 3], "  6": [4], "  9": [5], "  _": [6, 7, 8, 9, 10, 11, 12], "  a": [13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108], "  b": [109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137], "  c": [138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217], "  d": [218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262, 263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304], "  e": [305, 306, 307, 308, 309, 310, 311, 312, 313, 314, 315, 316, 317, 318, 319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 335, 336, 337, 338, 339, 340, 341, 342, 343], "  f": [344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376, 377, 378, 379, 380], "  g": [381, 382, 383, 384, 385, 386, 387, 388, 389, 390, 391, 392, 393, 394, 395, 396, 397, 398, 399, 400, 401], "  h": [402, 403, 404, 405, 406, 407, 408, 409, 410, 411, 412, 413, 414, 415, 416, 417, 418, 419, 420, 421, 422, 423, 424, 425, 426, 427, 428, 429, 430, 431, 432, 433, 434, 435, 436], "  i": [437, 438, 439, 440, 441, 442, 443, 444, 445, 446, 447, 448, 449, 450, 451, 452, 453, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 464, 465, 466, 467, 468, 469, 470, 471, 472, 473, 474, 475, 476, 477, 478, 479, 480, 481, 482, 483, 484, 485, 486, 487, 488, 489, 490, 491], "  j": [492, 493, 494], "  k": [495, 496, 497, 498, 499, 500, 501], "  l": [502, 503, 504, 505, 506, 507, 508, 509, 510, 511, 512, 513, 514, 515, 516, 517, 518, 519, 520, 521, 522, 523, 524, 525, 526, 527, 528, 529, 530, 531, 532, 533, 534, 535, 536, 537, 538, 539, 540, 541, 542], "  m": [543, 544, 545, 546, 547, 548, 549, 550, 551, 552, 553, 554, 555, 556, 557, 558, 559, 560, 561, 562, 563, 564, 565, 566, 567, 568, 569, 570, 571, 572, 573, 574, 575, 576, 577, 578, 579, 580, 581, 582, 583, 584, 585, 586, 587, 588, 589, 590, 591, 592, 593], "  n": [594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620, 621, 622, 623, 624, 625, 626, 627, 628, 629, 630, 631, 632], "  o": [633, 634, 635, 636, 637, 638, 639, 640, 641, 642, 643, 644, 645, 646, 647, 648, 649, 650, 651, 652, 653, 654, 655, 656, 657, 658], "  p": [659, 660, 661, 662, 663, 664, 665, 666, 667, 668, 669, 670, 671, 672, 673, 674, 675, 676, 677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700, 701, 702, 703, 704, 705, 706, 707, 708, 709, 710, 711, 712, 713, 714, 715, 716, 717, 718, 719, 720, 721, 722, 723, 724, 725, 726, 727, 728, 729], "  q": [730, 731, 732, 733, 734, 735, 736], "  r": [737, 738, 739, 740, 741, 742, 743, 744, 745, 746, 747, 748, 749, 750, 751, 752, 753, 754, 755, 756, 757, 758, 759, 760, 761, 762, 763, 764, 765, 766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779, 780, 781, 782, 783, 784, 785, 786, 787, 788, 789, 790, 791, 792, 793, 794, 795, 796, 797, 798, 799, 800, 801, 802, 803, 804, 805, 806, 807, 808, 809, 810, 811, 812, 813, 814], "  s": [815, 816, 817, 818, 819, 820, 821, 822, 823, 824, 825, 826, 827, 828, 829, 830, 831, 832, 833, 834, 835, 836, 837, 838, 839, 840, 841, 842, 843, 844, 845, 846, 847, 848, 849, 850, 851, 852, 853, 854, 855, 856, 857, 858, 859, 860, 861, 862, 863, 864, 865, 866, 867, 868, 869, 870, 871, 872, 873, 874, 875, 876, 877, 878, 879, 880, 881, 882, 883, 884, 885, 886, 887, 888, 889, 890, 891, 892, 893, 894, 895, 896, 897, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925], "  t": [926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975, 976, 977], "  u": [978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1000, 1001, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019, 1020, 1021, 1022, 1023, 1024, 1025, 1026, 1027, 1028, 1029, 1030, 1031, 1032, 1033, 1034], "  v": [1035, 1036, 1037, 1038, 1039, 1040, 1041, 1042, 1043, 1044, 1045, 1046, 1047, 1048, 1049, 1050, 1051, 1052, 1053, 1054, 1055], "  w": [1056, 1057, 1058, 1059, 1060, 1061, 1062, 1063, 1064, 1065, 1066, 1067, 1068, 1069, 1070, 1071, 1072, 1073, 1074, 1075, 1076, 1077, 1078, 1079, 1080, 1081, 1082, 1083, 1084, 1085, 1086, 1087, 1088, 1089, 1090, 1091, 1092, 1093, 1094, 1095, 1096, 1097], "  x": [1098, 1099, 1100, 1101, 1102, 1103, 1104, 1105, 1106, 1107, 1108, 1109, 1110, 1111, 1112, 1113, 1114, 1115, 1116, 1117, 1118, 1119, 1120, 1121, 1122, 1123, 1124, 1125], "  y": [1126], "  z": [1127, 1128], " 0 ": [0], " 1x": [1], " 5m": [2, 3], " 6e": [4], " 99": [5], " _i": [6, 7], " _l": [8, 9], " _u": [10, 11, 12], " a ": [13], " ac": [14, 15, 16, 17, 18, 19], " ad": [20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36], " af": [37], " ag": [38, 39], " ai": [40], " al": [41, 42, 43, 44, 45, 46], " an": [47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57], " ap": [58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69], " ar": [70, 71, 72, 73], " as": [74, 75, 76, 77], " at": [78, 79, 80, 81, 82, 83, 84], " au": [85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105], " av": [106, 107, 108], " b ": [109], " b_": [110], " ba": [111, 112, 113, 114, 115], " bc": [116, 117, 118], " bl": [119, 120, 121], " bo": [122], " br": [123, 124, 125, 126], " bs": [127, 128, 129], " bu": [130, 131, 132], " bw": [133], " by": [134, 135, 136, 137], " ca": [138, 139, 140], " cc": [141, 142], " ce": [143, 144], " cf": [145], " ch": [146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180], " cl": [181, 182, 183, 184], " cm": [185], " co": [186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208], " cr": [209, 210, 211, 212, 213], " ct": [214], " cu": [215, 216], " cy": [217], " da": [218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228], " de": [229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247], " df": [248], " dh": [249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262, 263, 264, 265], " di": [266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277], " dn": [278, 279, 280, 281], " do": [282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292], " dp": [293, 294, 295], " dr": [296], " dt": [297, 298, 299, 300, 301], " du": [302], " dy": [303, 304], " ea": [305], " ec": [306], " eg": [307, 308, 309], " el": [310, 311], " em": [312], " en": [313, 314, 315, 316, 317, 318, 319, 320, 321, 322, 323], " er": [324], " es": [325], " et": [326], " ev": [327, 328], " ex": [329, 330, 331, 332, 333, 334, 335, 336, 337, 338, 339, 340, 341, 342, 343], " fa": [344, 345, 346, 347], " fi": [348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365], " fl": [366, 367], " fo": [368, 369, 370, 371, 372, 373], " fr": [374, 375], " ft": [376], " fu": [377], " fw": [378, 379, 380], " ga": [381, 382], " ge": [383, 384], " gh": [385], " gi": [386], " gl": [387], " go": [388], " gr": [389, 390, 391, 392, 393, 394], " gu": [395, 396, 397, 398, 399], " gw": [400, 401], " h3": [402], " ha": [403, 404, 405, 406, 407, 408, 409, 410], " he": [411, 412, 413, 414, 415, 416], " hi": [417, 418, 419, 420, 421], " ho": [422, 423, 424, 425, 426, 427, 428, 429, 430, 431], " ht": [432, 433, 434, 435], " hw": [436], " ia": [437], " ic": [438], " id": [439, 440, 441, 442, 443, 444], " if": [445], " ig": [446], " im": [447], " in": [448, 449, 450, 451, 452, 453, 454, 455, 456, 457, 458], " ip": [459, 460, 461, 462, 463, 464, 465, 466, 467, 468, 469, 470, 471, 472, 473], " is": [474, 475, 476, 477, 478, 479, 480, 481, 482, 483, 484, 485, 486, 487, 488, 489, 490, 491], " jo": [492], " ju": [493, 494], " kb": [495], " ke": [496, 497, 498], " ki": [499], " kn": [500, 501], " l2": [502], " la": [503, 504, 505, 506, 507, 508, 509, 510, 511, 512, 513, 514, 515, 516, 517], " le": [518, 519, 520, 521, 522, 523], " li": [524, 525, 526, 527, 528], " ll": [529, 530, 531, 532], " lo": [533, 534, 535, 536, 537, 538, 539, 540, 541], " lt": [542], " ma": [543, 544, 545, 546, 547, 548, 549, 550, 551, 552, 553], " mc": [554, 555], " md": [556, 557, 558, 559], " me": [560, 561, 562, 563, 564], " mg": [565], " mi": [566, 567, 568, 569, 570, 571, 572, 573, 574, 575, 576, 577, 578], " ml": [579, 580], " mo": [581, 582, 583, 584, 585, 586, 587, 588, 589, 590], " ms": [591, 592], " mu": [593], " na": [594, 595, 596], " ne": [597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 607, 608, 609], " ng": [610], " no": [611, 612, 613, 614, 615], " ns": [616], " nt": [617, 618, 619, 620], " nu": [621, 622, 623, 624, 625, 626, 627, 628, 629, 630, 631, 632], " o ": [633], " of": [634, 635, 636, 637, 638, 639, 640], " oi": [641], " on": [642, 643, 644, 645], " op": [646, 647, 648, 649, 650], " ot": [651], " ou": [652, 653], " ov": [654, 655, 656, 657, 658], " pa": [659, 660, 661, 662, 663], " pe": [664], " pi": [665], " pl": [666], " pm": [667], " po": [668, 669, 670, 671, 672, 673, 674, 675, 676, 677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700, 701, 702, 703, 704, 705, 706, 707, 708, 709, 710, 711, 712], " pp": [713], " pr": [714, 715, 716, 717, 718, 719, 720, 721, 722, 723, 724, 725, 726, 727], " ps": [728], " pu": [729], " qo": [730, 731, 732, 733], " qu": [734, 735, 736], " ra": [737, 738, 739, 740, 741, 742, 743, 744, 745, 746, 747, 748, 749, 750, 751, 752, 753, 754, 755, 756, 757, 758, 759, 760, 761, 762], " re": [763, 764, 765, 766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779, 780, 781, 782, 783, 784, 785, 786, 787, 788, 789, 790, 791, 792, 793, 794, 795], " ro": [796, 797, 798, 799, 800, 801, 802, 803, 804, 805], " rs": [806, 807], " ru": [808, 809], " rx": [810, 811, 812, 813, 814], " s ": [815], " sa": [816, 817, 818, 819, 820, 821, 822, 823], " sc": [824, 825, 826, 827, 828, 829, 830, 831], " sd": [832], " se": [833, 834, 835, 836, 837, 838, 839, 840, 841, 842, 843, 844, 845, 846, 847, 848, 849], " sh": [850], " si": [851, 852, 853, 854, 855, 856, 857, 858], " sl": [859], " sn": [860, 861], " sp": [862, 863, 864, 865, 866, 867, 868, 869], " ss": [870, 871, 872, 873], " st": [874, 875, 876, 877, 878, 879, 880, 881, 882, 883, 884, 885, 886, 887, 888, 889, 890, 891, 892, 893, 894, 895, 896, 897], " su": [898, 899, 900, 901, 902, 903, 904, 905, 906], " sw": [907, 908, 909, 910, 911, 912, 913, 914, 915, 916], " sy": [917, 918, 919, 920, 921, 922, 923, 924, 925], " ta": [926, 927, 928, 929, 930], " tc": [931, 932, 933, 934, 935, 936, 937, 938], " te": [939, 940, 941], " tf": [942], " th": [943], " ti": [944, 945, 946, 947, 948, 949, 950, 951], " to": [952, 953, 954, 955, 956, 957, 958, 959], " tr": [960, 961, 962, 963], " tw": [964], " tx": [965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975], " ty": [976, 977], " ua": [978, 979], " ub": [980, 981], " uc": [982], " ud": [983, 984, 985], " ug": [986], " un": [987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1000], " up": [1001, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019, 1020], " ur": [1021], " us": [1022, 1023, 1024, 1025, 1026, 1027, 1028, 1029, 1030, 1031, 1032, 1033], " ut": [1034], " v2": [1035], " va": [1036, 1037, 1038], " ve": [1039, 1040, 1041], " vi": [1042, 1043, 1044, 1045, 1046], " vl": [1047, 1048], " vo": [1049, 1050, 1051], " vp": [1052], " vw": [1053, 1054, 1055], " wa": [1056], " we": [1057, 1058], " wh": [1059, 1060], " wi": [1061, 1062, 1063, 1064, 1065, 1066, 1067, 1068, 1069, 1070, 1071, 1072, 1073, 1074, 1075, 1076, 1077, 1078, 1079, 1080, 1081], " wl": [1082, 1083, 1084, 1085, 1086, 1087, 1088, 1089], " wo": [1090], " wp": [1091, 1092, 1093, 1094, 1095, 1096], " wr": [1097], " x ": [1098], " x_": [1099, 1100, 1101, 1102, 1103, 1104, 1105, 1106, 1107, 1108, 1109, 1110, 1111, 1112, 1113, 1114, 1115, 1116, 1117, 1118, 1119, 1120, 1121, 1122, 1123, 1124, 1125], " y ": [1126], " zo": [1127, 1128], "-d ": [136, 811, 966], "-nu": [396, 397, 1026, 1027], "-r ": [137, 812, 967, 1074, 1077], "-rx": [1073, 1074, 1075], "-st": [925], "-tx": [1076, 1077, 1078], "-wl": [397, 1027], "080": [159, 162], "108": [159, 162], "11r": [475], "12p": [1123], "160": [152, 160, 163, 168], "192": [1091], "1r ": [475], "1x ": [1, 283], "1x_": [284, 285, 286, 287, 504], "20 ": [153, 161], "216": [160, 163], "23_": [402], "240": [169], "2_b": [636], "2_c": [378], "2_e": [986], "2_i": [502], "2co": [427, 428], "2gh": [612], "2pa": [1123], "320": [153, 161], "323": [402], "3_c": [379], "3_e": [1091], "3_f": [1092], "3_m": [402], "3_p": [564], "3_s": [1093], "3_t": [1094], "3_w": [986], "40 ": [154, 169, 170, 176], "432": [161], "512": [1123], "5mi": [2, 3, 223], "5pa": [1121], "60 ": [152, 160, 163, 168], "6_c": [465], "6_d": [258], "6_e": [259, 466], "6_i": [467], "6_l": [260], "6_p": [468, 469, 1056], "6_r": [470, 471, 472], "6_s": [261, 262, 473], "6e ": [4, 151, 298, 903], "6e_": [152, 153, 154, 155, 156, 157, 158], "80 ": [155, 159, 162, 171], "92 ": [1091], "99 ": [5], "999": [5], "_1 ": [617, 788], "_10": [159, 162], "_11": [475], "_16": [152, 168], "_19": [1091], "_1x": [504], "_2 ": [618, 789], "_21": [160, 163], "_24": [169], "_3 ": [619, 790], "_32": [153], "_4 ": [620], "_40": [154, 170, 176], "_43": [161], "_5m": [223], "_6e": [151, 152, 153, 154, 155, 156, 157, 158, 298], "_80": [155, 171], "_ac": [476, 635, 935], "_ad": [91, 159, 160, 161, 162, 163, 164, 165, 460, 465, 477, 478, 572, 575, 622, 964], "_ae": [1099], "_af": [905], "_ag": [525, 807], "_al": [237, 479, 540], "_an": [314], "_ap": [365, 623, 731, 872, 1100], "_ar": [727, 1102], "_as": [465, 515], "_at": [30, 198, 270, 726, 1067, 1068], "_au": [237, 244, 258, 406, 660, 678, 750, 754, 818, 1024, 1056, 1101, 1116], "_av": [40, 296, 365, 793, 820, 1003, 1065], "_ba": [1083, 1084], "_bc": [889, 890], "_bg": [679, 680, 681, 682], "_bi": [1117], "_bl": [20, 166, 204, 636], "_bo": [683, 684, 685, 686, 687], "_br": [522], "_bu": [688, 689, 690, 717, 975], "_by": [6, 7, 8, 9, 11, 12, 31, 810, 811, 812, 965, 966, 967, 1073, 1074, 1076, 1077], "_ca": [119, 210, 316, 378, 379, 380, 436, 859, 915, 919, 1063, 1064], "_ce": [1102, 1103], "_cf": [501], "_ch": [91, 92, 106, 107, 253, 362, 417, 527, 739], "_cl": [31, 53, 112, 465, 480, 592, 931, 932, 945], "_co": [33, 55, 91, 106, 207, 253, 505, 506, 521, 522, 540, 649, 679, 683, 684, 687, 688, 690, 692, 697, 748, 797, 860, 878, 917, 975, 998, 1028], "_cr": [99], "_ct": [284, 710], "_cu": [558, 677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700], "_da": [100, 221, 224, 573, 576, 751], "_de": [82, 229, 237, 329, 600, 867, 908, 991, 998, 999, 1011], "_df": [172], "_dh": [1056, 1114], "_di": [59, 305, 624, 625, 752, 879, 909], "_dn": [258, 536], "_do": [732, 1004], "_dr": [1069, 1070], "_du": [766, 829, 1007], "_ed": [83], "_ef": [956], "_el": [1104, 1105], "_em": [755], "_en": [20, 35, 42, 79, 93, 94, 95, 101, 112, 117, 183, 204, 234, 254, 259, 264, 287, 306, 309, 344, 347, 367, 388, 422, 428, 437, 447, 466, 470, 493, 519, 531, 532, 536, 542, 544, 554, 557, 563, 574, 577, 580, 593, 661, 663, 680, 693, 701, 710, 712, 721, 751, 753, 754, 770, 873, 888, 889, 891, 893, 939, 945, 979, 980, 986, 992, 1016, 1017, 1044, 1048, 1051, 1057, 1091, 1095, 1116, 1118], "_eo": [583], "_er": [919], "_es": [933, 1104, 1109], "_et": [403], "_ev": [959], "_ex": [99, 162, 163, 164, 212, 916, 1065, 1066], "_fa": [285, 404, 1092], "_fe": [35], "_fi": [36, 102, 107, 117, 118, 204, 279, 544, 545, 546, 906, 934, 1023, 1106, 1119], "_fo": [223, 224, 225, 226, 227, 756, 818], "_fr": [144, 147, 339, 741, 1040], "_ga": [449], "_gc": [1099], "_go": [447], "_gr": [60, 61, 525, 602, 816, 1028], "_gu": [6, 7, 481, 626], "_gw": [345, 627], "_ha": [1107], "_hd": [570], "_hi": [80, 81], "_ho": [97, 223, 224, 225, 226, 227, 657, 702, 704, 1107, 1119], "_ht": [703, 771, 772], "_ia": [1108], "_id": [53, 54, 55, 60, 81, 94, 201, 245, 285, 286, 331, 332, 343, 410, 504, 505, 548, 551, 565, 596, 601, 602, 606, 759, 849, 856, 872, 992, 1028, 1029, 1031, 1049, 1058, 1086, 1088, 1089], "_im": [680, 681, 762], "_in": [156, 173, 177, 223, 224, 225, 226, 227, 467, 479, 569, 583, 584, 585, 609, 657, 969], "_io": [320, 628, 649], "_ip": [25, 195, 452, 507], "_is": [6, 7, 502], "_kb": [308, 309, 573, 576], "_ke": [480, 720, 721, 923, 1108, 1111, 1114, 1115, 1120], "_ki": [398], "_l2": [636], "_la": [8, 9, 542, 691, 935], "_le": [260, 639], "_li": [118, 308, 309, 471, 545, 684, 692, 999], "_ll": [289], "_lo": [693, 694, 695, 861, 873], "_lt": [584], "_ma": [62, 102, 246, 289, 311, 382, 401, 447, 512, 564, 732, 733, 754, 755, 756, 844, 910, 956, 957, 1012], "_mb": [1079], "_mc": [891, 892, 968, 969], "_md": [1121], "_me": [602, 1109, 1110], "_mg": [230, 927, 1111], "_mi": [878, 879], "_ml": [482, 906], "_mo": [61, 63, 114, 226, 299, 376, 391, 402, 432, 433, 449, 463, 508, 559, 646, 653, 667, 669, 713, 854, 895, 911, 942, 1018, 1096], "_na": [64, 167, 168, 169, 170, 171, 172, 173, 174, 202, 275, 282, 300, 345, 432, 483, 506, 513, 572, 573, 574, 603, 742, 843, 912, 1017, 1088], "_ne": [193, 201, 202, 285, 331, 332, 484, 505, 506, 565, 596, 1044, 1049], "_ng": [175, 176, 177, 178, 301, 433, 575, 576, 577, 1089], "_no": [82, 83, 532, 717, 821], "_nu": [337], "_on": [334], "_op": [562, 685], "_ot": [227, 984], "_ou": [157, 164, 165, 174, 178, 612], "_ov": [520, 521, 522, 604, 653, 674, 868, 1044], "_pa": [204, 237, 755, 813, 970, 1075, 1078, 1112, 1113, 1116, 1122], "_pd": [468, 469, 1056], "_pe": [311, 564, 629, 945, 1071, 1103], "_ph": [964], "_pi": [125], "_pm": [1017], "_po": [196, 236, 287, 435, 453, 476, 514, 546, 694, 703, 731, 895, 913, 956, 957, 958, 971], "_pr": [36, 92, 222, 232, 471, 472, 473, 479, 516, 558, 559, 578, 720, 721, 743, 848, 896, 947, 1114, 1115], "_ps": [158, 817, 1105, 1110], "_ra": [296, 308, 309, 470, 471, 472, 509, 572, 573, 575, 576, 686, 732, 733, 775, 793, 814, 826, 890, 892, 894, 972, 1079], "_re": [122, 195, 196, 221, 222, 223, 224, 225, 226, 227, 346, 394, 514, 536, 767, 822, 823, 839, 905, 936, 973, 974, 975, 1000, 1071], "_ro": [347, 485, 1092], "_ru": [752], "_sc": [95, 223, 224, 225, 226, 319, 637, 735, 736, 866, 1066], "_sd": [231, 571], "_se": [8, 9, 16, 86, 216, 222, 232, 236, 250, 364, 473, 510, 569, 578, 617, 618, 619, 620, 714, 798, 870, 937, 945, 947, 1018, 1024], "_sh": [1123], "_si": [237, 593, 695, 1056], "_sn": [251, 446], "_so": [424, 710], "_sp": [405, 570, 571], "_ss": [406, 418, 1107, 1116, 1117, 1118, 1119, 1120, 1121, 1122, 1123, 1124], "_st": [242, 255, 256, 261, 262, 396, 397, 468, 469, 563, 630, 717, 735, 745, 920, 945, 985, 1026, 1027], "_su": [110, 409, 461, 696, 788, 789, 790, 1093], "_sw": [631], "_sy": [233, 936, 937], "_ta": [56, 208, 250, 290, 326, 529, 675, 744, 745, 826, 870, 1008, 1013, 1038, 1053, 1054], "_te": [407, 678, 687, 689, 690, 696, 697, 700], "_ti": [77, 103, 223, 224, 225, 226, 227, 263, 269, 286, 438, 442, 515, 651, 681, 698, 781, 880, 931, 932, 933, 934, 935, 936, 937, 938, 984, 985], "_to": [91, 112, 148, 234, 399, 640, 699, 746, 772, 974, 1041, 1068, 1070, 1100], "_tr": [128, 1094], "_tx": [1067, 1068, 1069, 1070, 1071], "_ty": [92, 205, 467, 682, 750, 1014], "_ua": [6, 8, 11], "_ub": [486], "_uc": [893, 894], "_ud": [487], "_un": [338], "_up": [10, 11, 12, 28, 96, 97, 511, 512, 513, 514, 528, 733], "_ur": [26, 454, 773], "_us": [7, 9, 12, 447, 570, 571, 632, 704, 958, 1024, 1124], "_uu": [981], "_va": [563, 1054], "_ve": [276, 280, 496, 718, 783, 897], "_vi": [273, 479], "_vl": [927], "_vw": [1125], "_wa": [932, 934, 938, 986], "_we": [408, 409, 700], "_wh": [28], "_wi": [149, 345, 346, 417, 488, 649, 829, 903, 1117], "_wl": [369], "a3_": [1091, 1092, 1093, 1094], "a51": [1123], "a_1": [168], "a_2": [169], "a_4": [170], "a_8": [171], "a_a": [572], "a_d": [172, 573], "a_e": [470, 574, 1095], "a_i": [173], "a_m": [1096], "a_o": [174], "a_p": [471, 472], "a_r": [221, 222, 223, 224, 225, 226, 227, 573, 576], "a_t": [56], "a_v": [563], "abl": [20, 27, 28, 35, 42, 56, 79, 93, 94, 95, 101, 106, 107, 112, 117, 138, 204, 208, 234, 250, 254, 259, 264, 266, 267, 272, 276, 287, 290, 306, 309, 313, 314, 315, 316, 326, 344, 347, 357, 365, 367, 388, 422, 428, 437, 466, 470, 493, 519, 529, 531, 532, 536, 542, 544, 554, 557, 563, 570, 571, 574, 577, 580, 593, 624, 661, 663, 675, 680, 693, 701, 710, 712, 721, 744, 745, 751, 753, 754, 770, 826, 870, 873, 888, 889, 891, 893, 933, 945, 979, 986, 992, 1003, 1005, 1013, 1016, 1017, 1038, 1044, 1048, 1051, 1053, 1054, 1055, 1057, 1097, 1116, 1118], "ac ": [62, 311, 382, 401, 512, 543, 564, 844, 910, 1012], "ac_": [544, 545, 546, 754], "aca": [755, 756], "acc": [14, 15, 16, 476, 635, 757], "ace": [344, 345, 346, 455, 467, 570, 571], "aci": [685], "ack": [98, 99, 100, 101, 102, 103, 111, 112, 166, 285, 430, 659, 813, 935, 970, 1075, 1078], "acl": [755, 756], "acs": [246, 289], "act": [17, 18, 19, 548, 819, 820, 821, 822, 823, 860], "ad ": [291, 533, 763, 1015], "ad_": [20, 159, 160, 161, 162, 163, 164, 165, 635, 636, 637], "ada": [738, 739, 1005], "adc": [124, 125, 126], "add": [21, 460, 465], "ade": [28, 96, 97, 803, 818, 1004, 1006, 1007, 1008, 1009], "adh": [22, 477], "adi": [509, 534, 686, 740, 741, 742, 743, 744, 745, 746, 747, 748, 749, 750, 751, 752, 753, 754, 755, 756, 757, 758, 759, 826], "adj": [91], "adm": [23, 478], "ado": [24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 622, 764, 964], "adp": [875], "adv": [34, 35, 36, 572, 575], "ae_": [816, 817], "aes": [1099], "afc": [37, 905], "afe": [818], "aff": [960, 961], "afi": [561], "ag ": [366, 926], "age": [38, 204, 305, 430, 447, 659, 680, 681, 691, 807, 1065, 1071], "agg": [39, 525, 927], "ags": [928], "ail": [106, 107, 218, 224, 241, 242, 365, 1003], "ain": [282], "air": [40], "ait": [932, 934, 938], "ake": [405], "al ": [342, 387, 420, 450, 457, 535, 547, 609, 676, 822, 840, 851, 862, 974, 1043, 1046, 1068, 1070], "al_": [210, 343, 479, 536, 569, 677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700, 701, 702, 703, 704, 956, 957, 958, 1044], "ala": [41, 762], "ald": [1045], "ale": [42, 95, 223, 224, 225, 226, 237, 824], "ali": [49, 50, 1036], "all": [43, 44, 45, 104, 139, 285, 358, 359, 360, 479, 540], "alr": [863], "als": [46], "alt": [411], "alu": [1037], "aly": [51, 314], "am ": [796], "am_": [797, 985], "ame": [59, 64, 202, 275, 277, 282, 345, 350, 423, 424, 493, 506, 513, 595, 603, 702, 704, 742, 779, 843, 850, 909, 912, 1124], "amg": [876], "ami": [303, 304, 347, 798, 1092], "amm": [479, 723], "amp": [269, 292, 592, 880, 949, 950], "an ": [47, 150, 404, 666, 825, 1047, 1082], "an-": [397, 1027], "an2": [986], "an_": [542, 735, 736, 826, 927, 1048, 1056, 1083, 1084], "ana": [314], "anc": [34, 35, 36, 140, 320, 369, 554, 762, 1085, 1086, 1091], "and": [48, 113, 114, 188, 239, 1083, 1084], "ang": [691, 760, 1087, 1088, 1089], "ank": [355], "ann": [91, 92, 106, 107, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 319, 362, 736, 739, 827, 866], "ano": [49, 50, 51, 52, 53, 54, 55], "ans": [128, 962, 1094], "ant": [56, 389, 953], "anu": [390, 547, 548], "any": [57, 549], "ap ": [6, 8, 11, 58, 412, 550, 623, 800, 978], "ap_": [59, 60, 61, 62, 63, 64, 365, 551, 563, 1038, 1054], "apg": [65], "api": [66, 67, 1100], "app": [68, 294, 413, 437, 552, 731, 872, 1108], "aps": [69, 119, 210, 378, 379, 380, 436, 447, 859, 915, 919, 979, 1063, 1064], "ar ": [181, 738, 853], "ar_": [739], "arc": [70, 71, 72, 833], "ard": [122, 219, 264, 373, 706, 1117], "are": [73, 107, 361, 362, 720, 721], "arg": [929, 1008], "ari": [390], "arm": [41], "arn": [1102], "arp": [727], "art": [255, 261, 468, 787, 877, 878, 879, 880], "ary": [900], "as_": [403, 404, 405, 406, 407, 408, 409, 751, 1107], "ase": [260, 660, 964, 1112], "ash": [219, 410], "asi": [115], "ask": [830, 930], "aso": [823, 1000], "ass": [74, 75, 76, 77, 237, 465, 515, 660, 661, 755, 1112, 1113, 1116, 1121, 1122, 1123], "ast": [8, 9, 124, 125, 126, 347, 503, 504, 505, 506, 507, 508, 509, 510, 511, 512, 513, 514, 554, 889, 890, 891, 892, 893, 894, 935, 1092], "at ": [30, 78, 198, 270, 483, 527, 726, 756, 881], "at_": [1017, 1057], "ata": [220, 221, 222, 223, 224, 225, 226, 227, 573, 576], "ate": [18, 39, 209, 228, 242, 296, 308, 309, 316, 381, 382, 383, 449, 489, 515, 528, 537, 566, 572, 573, 574, 575, 576, 577, 578, 660, 717, 720, 721, 732, 733, 735, 761, 762, 775, 793, 814, 882, 890, 892, 894, 939, 972, 994, 1002, 1003, 1004, 1079, 1102, 1103, 1114, 1115], "atf": [79], "ath": [67], "ati": [87, 104, 280, 302, 484, 490, 502, 525, 538, 585, 596, 598, 655, 678, 748, 766, 819, 820, 821, 822, 823, 829, 861, 862, 863, 1007, 1034], "atm": [412, 413], "ato": [647], "ats": [745, 920, 925, 945], "att": [80, 81, 82, 83, 84, 1067, 1068], "atu": [35, 407, 883, 884], "aul": [235, 236, 237, 600, 867], "aut": [85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 237, 244, 258, 406, 660, 678, 750, 754, 818, 987, 1024, 1056, 1101, 1116], "ava": [106, 107, 365, 1003], "ave": [712, 1065], "avg": [40, 108, 296, 793, 820], "ax ": [553], "ax_": [102, 732, 733, 956, 957], "ay ": [274, 381], "ay_": [275, 382, 449], "aya": [276], "aym": [662, 663], "ayn": [59, 277, 909], "ayo": [516], "ays": [100, 221], "azy": [517], "b_s": [110], "bac": [98, 99, 100, 101, 102, 103, 111, 112, 285], "bal": [387, 762], "ban": [113, 114, 355, 1083, 1084], "bas": [115], "bc ": [116], "bc_": [117, 118], "bca": [889, 890], "be ": [240], "ber": [337, 602], "bg_": [679, 680, 681, 682], "bic": [980, 981], "bin": [1117], "bla": [166], "ble": [20, 27, 28, 35, 42, 56, 79, 93, 94, 95, 101, 106, 107, 112, 117, 119, 138, 204, 208, 234, 250, 254, 259, 264, 266, 267, 272, 276, 287, 290, 306, 309, 313, 314, 315, 316, 326, 344, 347, 357, 365, 367, 388, 422, 428, 437, 466, 470, 493, 519, 529, 531, 532, 536, 542, 544, 554, 557, 563, 570, 571, 574, 577, 580, 585, 593, 624, 661, 663, 675, 680, 693, 701, 710, 712, 721, 744, 745, 751, 753, 754, 770, 826, 870, 873, 888, 889, 891, 893, 945, 979, 986, 992, 1003, 1005, 1013, 1016, 1017, 1038, 1044, 1048, 1051, 1053, 1054, 1055, 1057, 1097, 1116, 1118], "bli": [933], "blo": [20, 120, 121, 204, 636, 988], "bne": [461, 788, 789, 790], "bnt": [486], "boa": [122, 219], "bof": [493], "boo": [344, 345, 346, 765, 766], "box": [683, 684, 685, 686, 687], "bp ": [495], "bps": [308, 309, 573, 576, 1079], "bri": [123, 522], "bro": [124, 125, 126], "brt": [408, 409], "bss": [127, 128, 129], "bsy": [898], "bug": [130, 229, 230, 231, 232, 233, 234], "bui": [131], "bul": [132], "bur": [975], "bus": [717], "but": [84, 688, 689, 690], "bw ": [133], "by ": [134], "by_": [6, 7, 8, 9, 11, 12, 31], "byt": [135, 136, 137, 810, 811, 812, 965, 966, 967, 1073, 1074, 1076, 1077], "c_a": [754], "c_e": [306, 980], "c_f": [117, 118, 544, 545, 546], "c_r": [905], "c_s": [409], "c_t": [77, 515], "c_u": [981], "cab": [138], "cac": [755, 756], "cal": [95, 104, 139, 223, 224, 225, 226, 420, 535, 536, 824], "can": [140, 319, 735, 736, 825, 826, 827, 866], "cap": [119, 210, 378, 379, 380, 436, 859, 915, 919, 1063, 1064], "car": [1117], "cas": [124, 125, 126, 554, 889, 890, 891, 892, 893, 894], "cat": [280, 316, 537, 538, 678, 861, 994, 1102, 1103], "cce": [476, 696], "cco": [14, 141, 635, 757], "ccq": [142], "cct": [15, 16], "cdn": [304], "ce ": [36, 222, 229, 232, 243, 334, 370, 424, 455, 473, 516, 570, 571, 578, 643, 715, 762, 774, 848, 947, 991, 1045], "ce_": [237, 244, 245, 246, 467, 554, 710, 844, 998, 999, 1049, 1065, 1066], "ceb": [344, 345, 346], "ced": [34, 35, 36, 320, 1091], "cei": [767], "cel": [140], "cen": [143, 144, 1071], "cer": [1102, 1103], "ces": [216, 329, 476, 696, 714], "cfg": [145, 501, 859], "cg ": [982], "ch ": [637, 833, 914, 1060], "ch_": [417, 915, 916, 959], "cha": [91, 92, 106, 107, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 362, 527, 739, 1057], "che": [180, 253, 321, 828, 829, 830, 831, 885, 1050, 1051], "chi": [70, 71, 72], "cie": [671], "cif": [864], "cit": [685], "ck ": [120, 180, 499, 665, 988], "ck_": [285, 735, 935], "cka": [430, 659], "cke": [121, 813, 970, 1075, 1078], "cki": [20, 204, 253, 636], "ckl": [166], "cks": [398, 736], "cku": [98, 99, 100, 101, 102, 103, 111, 112], "cl_": [755, 756], "cla": [592], "cle": [181, 217], "cli": [31, 53, 182, 465, 945], "clo": [112, 183, 184, 480, 931, 932], "clu": [329, 330, 331, 332, 916], "cm ": [1099], "cmd": [185], "cmp": [438], "cod": [141, 186, 207, 208], "col": [187, 521, 522, 679, 683, 684, 687, 688, 690, 692, 697], "com": [33, 188, 189, 190, 191, 585, 700, 1028], "con": [55, 106, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 253, 268, 269, 270, 285, 332, 369, 427, 428, 505, 506, 540, 569, 596, 605, 606, 625, 649, 705, 748, 752, 768, 860, 878, 879, 1049, 1085, 1086], "coo": [917], "cor": [281, 536, 769, 863, 1066], "cou": [14, 91, 206, 207, 208, 635, 757, 797, 975, 998], "cov": [271, 272, 273, 305], "cp ": [249, 555], "cp_": [250, 251, 931, 932, 933, 934, 935, 936, 937, 938], "cpd": [252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262], "cpe": [263], "cpg": [264], "cpo": [265], "cpv": [1056], "cq ": [142], "cre": [209, 210, 450], "cri": [240], "cro": [99, 211, 212, 213, 961], "cs ": [246, 289, 314, 968], "cs_": [969], "ct ": [15, 268, 768, 860], "ct_": [16, 195, 196, 253, 269, 752, 770, 771, 772, 773], "cte": [197, 198, 270, 625, 788, 789, 790, 837, 878, 879, 989], "cti": [17, 18, 19, 199, 200, 201, 202, 505, 506, 649, 819, 820, 821, 822, 823, 956], "ctr": [214, 284, 287, 367, 710, 865, 866, 889, 890, 891, 892, 893, 894], "cts": [767, 839], "ctu": [70, 548], "cur": [215, 236, 834, 1018], "cus": [216, 558, 677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700], "cut": [333, 334], "cv_": [936], "cy ": [339, 546, 672], "cy_": [731], "cyc": [217], "d-r": [1073, 1074, 1075], "d-t": [1076, 1077, 1078], "d5 ": [556], "d5p": [1121], "d_1": [159, 1091], "d_2": [160], "d_4": [161], "d_a": [30, 198, 237, 270, 365, 635, 678, 726, 905], "d_b": [20, 31, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690], "d_c": [253, 316, 1028], "d_d": [867, 998, 999, 1114], "d_e": [94, 112, 162, 163, 164, 183, 254, 264, 519, 531, 536, 661, 979, 1116], "d_f": [35, 36], "d_i": [320, 479], "d_k": [480, 720, 721], "d_l": [471, 636, 691, 692, 693, 694, 695], "d_m": [878, 879], "d_n": [331, 332, 532, 1088, 1089], "d_o": [165, 520, 521, 522, 868], "d_p": [958], "d_r": [122, 296, 839, 1000, 1079], "d_s": [242, 255, 256, 468, 469, 570, 571, 637, 696, 714, 788, 789, 790, 1056], "d_t": [263, 697, 698, 699, 933, 1070], "d_v": [273, 783, 927], "d_w": [700, 1117], "dab": [1005], "dai": [218, 224], "dar": [738, 739], "das": [219, 751], "dat": [220, 221, 222, 223, 224, 225, 226, 227, 228, 528, 573, 576, 1002, 1003, 1004], "day": [100, 221], "dca": [124, 125, 126, 1117], "dd ": [21], "dde": [80, 81], "ddr": [460, 465], "de ": [61, 96, 114, 141, 186, 207, 299, 449, 463, 520, 559, 581, 646, 653, 656, 667, 669, 803, 818, 895, 1006, 1018, 1096], "de_": [97, 208, 329, 417, 418, 521, 522, 653, 657, 1007, 1008, 1044], "deb": [229, 230, 231, 232, 233, 234], "ded": [28, 330, 331, 332, 597, 1004, 1009], "def": [235, 236, 237, 600, 714, 867], "del": [63, 82, 238, 582, 583, 584, 585, 911], "dem": [239], "den": [80, 81, 210, 440, 504], "dep": [908, 1011], "der": [724], "des": [240, 432, 433, 604, 674, 868], "det": [241, 242], "dev": [229, 237, 243, 244, 245, 246, 247, 329, 991, 998, 999, 1045], "dex": [969], "dfs": [172, 248], "dh_": [1114], "dhc": [249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262, 263, 264, 265, 1056], "dho": [22, 477], "dia": [560, 561], "dif": [508, 586], "din": [534, 629], "dio": [509, 740, 741, 742, 743, 744, 745, 746, 747, 748, 826], "dip": [1023], "dir": [767, 770, 771, 772, 773, 839], "dis": [59, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 305, 624, 625, 752, 879, 909], "dit": [83, 1036], "diu": [686, 749, 750, 751, 752, 753, 754, 755, 756, 757, 758, 759], "dju": [91], "dke": [184], "dle": [286, 441, 442, 443], "dm ": [487, 983], "dmi": [23, 478], "dn ": [231, 304, 832], "dns": [258, 278, 279, 280, 281, 536, 557, 558, 559], "dom": [282], "don": [764], "doo": [156, 157, 164, 165, 173, 174, 177, 178, 653], "dop": [24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 622, 964], "dot": [283, 284, 285, 286, 287], "dow": [288, 289, 290, 291, 292, 732, 1004], "dp_": [289, 529, 984, 985, 992], "dpi": [293, 294, 295, 857, 875], "dpm": [530, 531, 532], "dpo": [318, 319], "dre": [465], "dro": [296, 1069, 1070], "drs": [460], "ds ": [60, 331, 332, 444, 569, 602, 1084], "dst": [114], "dte": [869], "dth": [149, 179, 417, 1061], "dti": [297, 298, 299, 300, 301], "dul": [376, 391, 402, 587, 713, 828, 829, 830, 854, 942], "dur": [302, 766, 829, 1007], "dv6": [257, 258, 259, 260, 261, 262], "dva": [34, 35, 36], "dve": [572, 575], "dx ": [1058], "dyn": [303, 304], "e_1": [152], "e_3": [153], "e_4": [154], "e_8": [155], "e_a": [40, 237, 244, 296, 314, 660, 793, 964, 1003, 1056, 1065, 1102], "e_b": [11, 12], "e_c": [106, 107, 119, 362, 417, 521, 522, 527, 710, 998], "e_d": [237, 329, 1004, 1007], "e_e": [35, 95, 204, 388, 447, 493, 554, 680, 712, 888, 939, 1044], "e_f": [107, 818, 1023], "e_g": [447, 816], "e_h": [97, 570, 704], "e_i": [94, 156, 223, 224, 225, 226, 227, 245, 649, 657, 759, 762, 856], "e_k": [573, 576, 1115], "e_l": [308, 309, 542, 999], "e_m": [246, 391, 447, 669, 732, 733, 844, 1018, 1079], "e_n": [337, 572, 573, 574, 575, 576, 577, 596, 1049], "e_o": [157, 334, 653], "e_p": [158, 514, 720, 721, 817, 956, 1103], "e_r": [767], "e_s": [418, 424, 571, 578, 593, 745, 945, 1066], "e_t": [208, 286, 442, 467, 681, 700, 931, 1008, 1053], "e_u": [338, 528, 1024], "e_v": [276, 1054], "e_w": [28, 829, 932, 938], "ead": [763, 764], "eag": [305], "eak": [405], "eal": [411, 822], "eam": [985], "eap": [800], "ear": [181, 833], "eas": [260, 823, 1000], "eat": [35, 209, 412, 413, 655], "ebo": [344, 345, 346, 765, 766], "ebr": [408, 409], "ebu": [229, 230, 231, 232, 233, 234], "ec_": [306], "ece": [767], "ech": [1057], "eci": [864], "eck": [180, 253], "eco": [281, 536, 569, 768, 769, 863], "ect": [70, 195, 196, 197, 198, 199, 200, 201, 202, 268, 269, 270, 505, 506, 625, 649, 752, 767, 768, 770, 771, 772, 773, 837, 839, 865, 866, 878, 879, 956, 989], "ecu": [236, 333, 334, 834, 1018], "ecv": [936], "ed ": [20, 28, 29, 33, 34, 35, 42, 44, 72, 79, 89, 93, 94, 95, 101, 110, 112, 117, 121, 190, 197, 204, 234, 241, 254, 259, 264, 267, 287, 305, 306, 309, 315, 321, 330, 344, 346, 347, 357, 367, 388, 422, 428, 437, 466, 470, 488, 489, 493, 508, 518, 519, 530, 531, 532, 536, 542, 544, 554, 557, 562, 563, 574, 577, 580, 586, 593, 597, 614, 622, 624, 625, 660, 661, 663, 677, 680, 693, 701, 710, 712, 721, 731, 751, 753, 754, 770, 776, 785, 837, 873, 888, 889, 891, 893, 904, 945, 979, 986, 989, 992, 997, 1004, 1009, 1016, 1017, 1028, 1044, 1048, 1051, 1055, 1057, 1069, 1072, 1116, 1118], "ed-": [1073, 1074, 1075, 1076, 1077, 1078], "ed_": [30, 31, 35, 36, 198, 242, 270, 273, 296, 316, 320, 331, 332, 365, 471, 479, 519, 520, 521, 522, 531, 532, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700, 714, 720, 721, 726, 783, 788, 789, 790, 867, 868, 878, 879, 905, 927, 933, 958, 998, 999, 1000, 1070, 1079, 1091, 1114], "ede": [210, 597, 714], "edi": [83, 560, 561, 767, 770, 771, 772, 773, 839, 1023], "edp": [857], "edt": [869], "edu": [828, 829, 830], "ee ": [835], "eed": [597, 867, 868, 869], "een": [8, 9, 364, 510, 836, 1055], "eer": [114, 311, 564], "efa": [235, 236, 237, 600, 867], "efe": [36, 222, 232, 471, 473, 516, 578, 715, 774, 848, 947], "eff": [956], "efi": [714], "efr": [775], "eft": [523, 639], "eg ": [105], "ega": [39, 484, 525, 598], "ege": [1114], "egi": [346, 776, 905], "ego": [316], "egr": [307, 308, 309], "eig": [414, 415], "eiv": [767], "eke": [394, 1125], "ekn": [801], "el ": [63, 140, 146, 362, 582, 739, 911], "el_": [92, 147, 148, 149, 496, 583, 584, 585], "elc": [700], "eld": [348], "ele": [82, 238, 310, 311, 837, 1080, 1104, 1105], "elf": [838], "elp": [150, 416], "els": [91, 106, 107, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178], "elw": [179], "em ": [233, 898, 924, 1103], "em-": [925], "ema": [239, 831], "emb": [602], "eme": [310, 311, 450, 1104, 1105], "emg": [858], "emo": [514, 562, 777, 778], "emp": [312, 407, 755, 939, 1067, 1068], "en ": [80, 364, 399, 510, 836, 1059, 1100], "en_": [8, 9, 28, 81], "ena": [20, 35, 42, 79, 93, 94, 95, 101, 112, 117, 204, 234, 254, 259, 264, 287, 306, 309, 313, 314, 315, 316, 344, 347, 350, 357, 367, 388, 422, 428, 437, 466, 470, 493, 519, 531, 532, 536, 542, 544, 554, 557, 563, 574, 577, 580, 593, 661, 663, 680, 693, 701, 710, 712, 721, 751, 753, 754, 770, 779, 873, 888, 889, 891, 893, 945, 979, 986, 992, 1016, 1017, 1044, 1048, 1051, 1055, 1057, 1116, 1118], "enc": [36, 222, 232, 339, 473, 516, 578, 715, 774, 848, 947, 1065, 1066, 1095], "end": [263, 317, 318, 319, 341, 629, 839, 963], "ene": [383, 660, 1114], "eng": [94, 447, 939], "enh": [320, 554, 1091], "enn": [56], "enr": [321], "ent": [31, 53, 67, 75, 143, 144, 182, 203, 204, 205, 210, 215, 221, 222, 223, 224, 225, 226, 227, 310, 311, 322, 327, 440, 450, 465, 504, 540, 662, 663, 678, 792, 937, 945, 959, 1071, 1104, 1105], "enu": [323], "env": [183, 980], "eol": [583], "eou": [286, 438, 442, 651, 931, 932, 933, 934, 935, 936, 937, 938, 946, 947, 984, 985], "ep ": [392], "ep_": [1058], "epo": [780, 781], "ept": [908, 1011], "eq ": [144, 374], "equ": [195, 196, 339, 782, 783], "er ": [45, 143, 271, 337, 352, 405, 632, 654, 664, 709, 724, 842, 901, 956, 957, 958, 971, 995, 1024, 1025, 1050], "er-": [1026, 1027], "er_": [55, 106, 117, 118, 144, 250, 311, 544, 545, 546, 548, 564, 617, 618, 619, 620, 651, 710, 843, 945, 984, 1028, 1029, 1051], "era": [272, 383, 407, 647, 660, 953, 1065, 1114], "erb": [355], "erc": [1071], "ere": [36, 222, 232, 273, 305, 346, 473, 516, 578, 715, 774, 776, 848, 947], "erf": [455, 467], "erg": [1030, 1031], "erh": [655], "eri": [36, 114, 204, 279, 280, 353, 840, 841, 945, 948, 1065, 1066], "erl": [305], "ern": [326, 342, 343, 456, 496, 1124], "ero": [711], "erp": [356, 357, 906, 1106, 1119], "err": [324, 471, 520, 521, 522, 604, 653, 656, 657, 674, 868, 919, 1044], "ers": [16, 86, 145, 227, 276, 415, 496, 501, 602, 712, 718, 783, 897, 1039, 1040, 1041], "ert": [42, 237, 572, 575, 1102, 1103], "erv": [16, 86, 216, 250, 457, 569, 609, 617, 618, 619, 620, 658, 714, 778, 842, 843, 844, 1024], "ery": [734], "es ": [50, 102, 135, 216, 242, 316, 329, 528, 572, 575, 604, 674, 691, 714, 810, 843, 868, 917, 965, 973, 1073, 1076], "es-": [136, 137, 811, 812, 966, 967, 1074, 1077], "es_": [223, 432, 433, 593, 793, 945, 974, 1071, 1099], "esc": [240], "ese": [92, 716, 784, 948], "esh": [563, 564, 720, 721, 775, 1109, 1110], "esi": [351], "eso": [785], "ess": [123, 307, 308, 309, 325, 465, 476, 522, 696, 798, 845, 870, 1080, 1104, 1109], "est": [6, 7, 195, 196, 269, 395, 396, 397, 398, 399, 481, 515, 626, 786, 787, 788, 789, 790, 869, 880, 933, 940, 949, 950], "esu": [791], "et ": [371, 384, 456, 461, 638, 716, 784, 846, 929, 996], "et_": [326, 639, 640, 788, 789, 790], "eta": [241, 242, 830], "ete": [33, 82, 190, 221, 222, 223, 224, 225, 226, 227, 238, 415, 792], "eth": [326, 403], "eti": [228, 260, 443, 471], "etr": [793, 973, 974, 975, 1071], "ets": [92, 813, 970, 1008, 1075, 1078], "ett": [222, 232, 473, 578, 847, 848, 947], "etu": [794, 849], "etw": [193, 201, 202, 285, 331, 332, 505, 506, 565, 596, 599, 600, 601, 602, 603, 604, 605, 606, 607, 1044, 1049], "eus": [778], "ev ": [122], "ev_": [717], "eve": [67, 327, 959], "evi": [229, 237, 243, 244, 245, 246, 329, 718, 991, 998, 999, 1045], "evm": [247], "evo": [795], "evt": [328], "ew ": [608, 658], "ewa": [358, 359, 360, 381, 382, 449], "ex ": [969], "exc": [329, 330, 331, 332, 916], "exe": [333, 334], "exi": [335], "exp": [99, 212, 336, 337, 338, 339, 340, 989, 1065, 1066], "ext": [162, 163, 164, 341, 342, 343, 609, 678, 687, 689, 690, 696, 697, 700, 941], "ey ": [184, 394, 480, 497, 923, 1101, 1107, 1108, 1111, 1114, 1115, 1125], "ey_": [1119], "eyp": [422], "eys": [720, 721, 1120], "eyw": [498], "ezo": [103, 951], "f_e": [79, 428], "f_i": [285, 332, 596, 606, 1049, 1086], "f_m": [667], "fac": [344, 345, 346, 455, 467, 548, 819, 820, 821, 822, 823], "fal": [285], "fan": [404], "fas": [347, 1092], "fau": [235, 236, 237, 600, 867], "fc ": [37], "fc_": [905], "fe_": [818], "fea": [35], "fec": [956], "fer": [36, 222, 232, 471, 473, 516, 578, 715, 774, 848, 947], "fet": [471], "ff ": [711], "ffe": [956], "ffi": [960, 961], "ffl": [635, 636, 637], "ffs": [638, 639, 640], "fg_": [859], "fgv": [145, 501], "fi ": [990, 1062], "fi6": [903], "fi_": [345, 346, 649, 991, 992, 1063, 1064, 1065, 1066, 1067, 1068, 1069, 1070, 1071], "fic": [280, 864, 960, 961, 1102, 1103], "fie": [348, 508, 586], "fig": [192, 193, 194, 748], "fil": [36, 102, 117, 118, 204, 279, 349, 350, 351, 352, 353, 544, 545, 546, 561, 722, 758, 759], "fin": [354, 355, 356, 357, 714, 906, 934, 1106, 1119], "fir": [107, 358, 359, 360, 361, 362, 363, 364], "fix": [365, 1023], "fla": [366], "fli": [253], "flo": [367, 635, 636, 637], "fo ": [922], "for": [223, 224, 225, 226, 227, 368, 369, 370, 371, 372, 373, 451, 452, 453, 454, 569, 657, 706, 756, 818], "fra": [493], "fre": [144, 339, 374, 775], "fro": [147, 375, 741, 1040], "fs ": [172, 248], "fse": [638, 639, 640], "ft ": [523, 639], "ftp": [376, 942], "ful": [377], "fw2": [378], "fw3": [379], "fw_": [380], "fy ": [615], "fy_": [532], "g_4": [176], "g_a": [540, 575, 1024], "g_b": [204], "g_c": [679, 859], "g_d": [229, 576], "g_e": [20, 347, 577], "g_i": [177, 680, 681], "g_k": [923], "g_m": [114, 230], "g_n": [193], "g_o": [178], "g_p": [36, 204, 222, 232, 473, 578, 848, 947], "g_r": [572, 575], "g_s": [231, 232, 233, 798], "g_t": [234, 682], "gat": [39, 381, 382, 449, 484, 525, 598], "gcm": [1099], "ge ": [38, 430, 659, 760, 807, 1065, 1071], "ge_": [204, 447, 680, 681], "ged": [927], "gen": [357, 383, 660, 1114], "ger": [305, 355, 356, 357, 906, 1106, 1119], "ges": [691], "get": [371, 384, 929, 1008], "gge": [927], "ggr": [39, 525], "gh ": [385], "ght": [123, 414, 415, 522], "ghz": [612], "gin": [94, 447, 873, 939], "gio": [905], "gis": [346, 776], "git": [386], "gle": [388, 447, 852], "glo": [387], "gmp": [446], "gmt": [230, 565, 927, 1111], "gn ": [74], "gna": [851], "gnm": [75, 465], "go_": [693, 694, 695], "goo": [388, 447], "gor": [316], "gou": [541], "gr ": [247, 328, 858, 876], "gra": [28, 96, 97, 389, 390, 479, 566, 723, 803, 818, 1005, 1006, 1007, 1008, 1009], "gre": [39, 307, 308, 309, 391, 392, 525], "gro": [60, 61, 65, 126, 295, 359, 393, 394, 525, 602, 607, 816, 1028, 1030, 1031, 1087, 1088, 1089], "gs ": [928], "gua": [264, 691], "gue": [6, 7, 395, 396, 397, 398, 399, 481, 485, 626, 799, 800, 801], "gul": [853], "gur": [194, 748], "gve": [145, 501], "gw ": [400, 627], "gw3": [986], "gw_": [345, 401], "h1 ": [403], "h32": [402], "h_a": [1116], "h_b": [1117], "h_c": [915], "h_d": [829], "h_e": [754, 916, 959, 1109, 1118], "h_h": [1107, 1119], "h_i": [410], "h_k": [1114, 1120], "h_m": [1121], "h_p": [237, 1110, 1116, 1122], "h_r": [775], "h_s": [86, 563, 870, 1024, 1123], "h_t": [750], "h_u": [1124], "h_w": [417], "ha5": [1123], "han": [91, 92, 106, 107, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 320, 362, 554, 739, 1091], "har": [720, 721], "has": [403, 404, 405, 406, 407, 408, 409, 410, 964, 1107], "hat": [527, 1057], "hbo": [219], "hcp": [249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262, 263, 264, 265, 1056], "hd_": [570], "he ": [885, 943], "hea": [411, 412, 413, 655], "hec": [180, 253], "hed": [321, 828, 829, 830, 933], "hei": [414, 415], "hel": [416], "hem": [831], "hen": [28, 678, 1059], "her": [227, 326, 651, 984, 1050, 1051], "hic": [1060], "hid": [67, 80, 81, 417, 418], "hin": [419], "his": [420, 421], "hit": [70], "hiv": [71, 72], "hke": [1101], "hly": [226, 589], "hoc": [22, 477], "hon": [422], "hor": [87, 88, 89, 850, 987], "hos": [423, 424, 657, 702, 704, 1107, 1119], "hot": [425, 426, 427, 428, 429, 430], "hou": [97, 223, 224, 225, 226, 227, 431], "hra": [660, 1112], "ht ": [414], "ht_": [432, 433], "hti": [415], "htn": [123, 522], "htt": [434, 435, 703, 771, 772], "hub": [386], "hv3": [564], "hw_": [436], "hz_": [612], "i6e": [903], "i_a": [807], "i_c": [649, 1063, 1064], "i_d": [991], "i_e": [1065, 1066], "i_g": [345], "i_i": [992], "i_r": [346], "i_t": [1067, 1068, 1069, 1070, 1071, 1100], "ia ": [273, 560, 1042], "iaf": [561], "ial": [210, 840, 862, 863], "iap": [294, 437, 1108], "ibe": [240], "ibl": [585], "ibu": [84], "ic ": [115, 303, 864, 960], "ic_": [980, 981], "ica": [104, 280, 420, 678, 1102, 1103], "icd": [304], "ice": [216, 229, 237, 243, 244, 245, 246, 329, 714, 844, 991, 998, 999, 1045, 1049], "ich": [321, 1060], "ici": [671], "ick": [398, 499, 665, 735, 736], "icm": [438], "icr": [961], "ics": [314], "ict": [253, 788, 789, 790], "icy": [546, 672, 731], "id ": [53, 54, 55, 67, 81, 129, 201, 245, 285, 325, 343, 410, 418, 439, 505, 548, 551, 565, 596, 601, 606, 641, 759, 849, 856, 871, 872, 921, 981, 1029, 1031, 1049, 1086, 1104, 1109], "id_": [94, 1028, 1088, 1089], "idd": [80, 81], "ide": [417, 418, 440, 504, 520, 521, 522, 604, 653, 656, 657, 674, 724, 868, 1044], "idi": [1036], "idl": [286, 441, 442, 443], "idp": [992], "ids": [60, 331, 332, 444, 602], "idt": [149, 179, 417, 1061], "idx": [1058], "ie ": [49, 322, 671, 841, 948], "ied": [508, 586, 731], "iel": [348], "ien": [31, 53, 182, 465, 945, 1065, 1066], "ies": [50, 316, 793, 917, 945, 973, 974, 1071], "iev": [67], "iew": [658], "if ": [445], "ife": [471], "ifi": [280, 345, 346, 508, 586, 649, 864, 903, 990, 991, 992, 1062, 1063, 1064, 1065, 1066, 1067, 1068, 1069, 1070, 1071, 1102, 1103], "ify": [532, 615], "ig ": [192], "ig_": [193], "igh": [123, 414, 415, 522], "igm": [446], "ign": [74, 75, 465, 851], "igr": [295, 566], "igu": [194, 748], "ila": [106, 107, 365, 1003], "ild": [131, 1117], "ile": [102, 241, 242, 349, 350, 351, 561, 681, 722, 758, 759], "ili": [1034], "ill": [878, 879], "ilt": [36, 117, 118, 204, 279, 352, 353, 544, 545, 546], "ily": [218, 224], "im ": [297], "im_": [298, 299, 300, 301], "ima": [447, 680, 681], "imb": [762], "imc": [859], "ime": [10, 11, 12, 40, 77, 103, 223, 224, 225, 226, 227, 228, 260, 263, 269, 286, 438, 442, 443, 471, 515, 651, 781, 880, 931, 932, 933, 934, 935, 936, 937, 938, 944, 945, 946, 947, 948, 949, 950, 951, 984, 985, 1020], "imi": [308, 309, 524, 562, 648, 649], "imo": [567], "imu": [570, 571], "in ": [2, 23, 448, 478, 492, 568], "in_": [223, 224, 225, 226, 227, 282, 449, 479, 569, 583, 584, 873, 934], "inc": [450, 585], "ind": [156, 173, 177, 354, 969, 1117], "ine": [94, 447, 714, 939], "inf": [451, 452, 453, 454, 569, 657, 922], "ing": [20, 36, 114, 125, 199, 204, 222, 232, 253, 279, 319, 335, 347, 353, 355, 356, 357, 446, 473, 479, 534, 538, 552, 572, 575, 578, 629, 635, 636, 655, 723, 736, 752, 798, 802, 805, 827, 847, 848, 852, 853, 866, 906, 947, 1092, 1106, 1119], "ini": [570, 571], "ink": [289, 290, 511, 512, 513, 514, 525, 684, 692, 1010, 1011, 1012, 1013, 1014], "inm": [415], "inr": [572, 573, 574, 575, 576, 577, 578], "int": [318, 319, 356, 357, 413, 419, 455, 456, 457, 467, 476, 569, 609, 670, 906, 1106, 1119], "inu": [3, 223], "inv": [458], "io ": [509, 740], "io_": [741, 742, 743, 744, 745, 746, 826], "ion": [17, 32, 33, 87, 128, 145, 200, 201, 202, 221, 222, 223, 224, 225, 226, 227, 265, 276, 280, 302, 490, 496, 501, 502, 505, 506, 525, 650, 678, 694, 718, 725, 726, 748, 766, 783, 792, 798, 819, 820, 821, 822, 823, 829, 845, 861, 870, 897, 905, 916, 962, 1007, 1034, 1039, 1040, 1041, 1094], "ior": [472, 719, 896], "ios": [747, 748], "iot": [320, 628, 649], "iou": [718], "ip ": [25, 195, 452, 459, 507, 1023], "ip_": [460, 461, 854], "ipl": [593], "ips": [462, 463], "ipv": [464, 465, 466, 467, 468, 469, 470, 471, 472, 473], "ire": [336, 337, 338, 358, 359, 360, 488, 767, 770, 771, 772, 773, 782, 783, 839, 1053, 1054, 1055, 1072, 1073, 1074, 1075, 1076, 1077, 1078, 1079, 1080, 1125], "irm": [107, 361, 362], "irs": [363, 364], "irt": [40, 1043, 1044, 1045], "is ": [474, 878, 879], "is_": [6, 7, 475, 476, 477, 478, 479, 480, 481, 482, 483, 484, 485, 486, 487, 488], "isa": [266, 267, 624], "isc": [268, 269, 270, 271, 272, 273, 305, 625, 752, 879], "ise": [613], "isf": [819, 820, 821, 822, 823], "ish": [933], "isi": [572, 575, 725, 726], "iso": [489, 490, 502], "isp": [59, 274, 275, 276, 277, 909], "iss": [491], "ist": [118, 166, 335, 346, 420, 421, 526, 545, 776, 999], "isu": [479, 1046], "it ": [83, 338, 524, 993], "it_": [308, 309, 932, 934, 938], "ita": [1097], "itc": [885, 914, 915, 916], "ite": [70, 237, 458, 593, 855, 856, 857, 858], "ith": [386, 829, 1081], "iti": [128, 694, 962, 1094], "itl": [698], "ito": [588], "ity": [189, 236, 390, 440, 472, 504, 649, 685, 719, 834, 896, 1036], "iu ": [749], "ius": [686, 750, 751, 752, 753, 754, 755, 756, 757, 758, 759], "iva": [18, 720, 721, 1115], "ive": [19, 71, 72, 484, 527, 528, 596, 598, 767, 956], "ivi": [649], "ixe": [365, 1023], "iza": [87, 1034], "ize": [88, 89, 351, 562, 648, 649, 677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700, 987, 1056], "joi": [492], "jum": [493], "jus": [91, 494], "k_a": [525], "k_c": [684, 692], "k_d": [600, 1011], "k_e": [344], "k_i": [201, 331, 505, 565, 601], "k_l": [289], "k_m": [512, 602, 1012], "k_n": [202, 285, 506, 513, 603], "k_o": [604, 1044], "k_r": [514], "k_s": [735], "k_t": [290, 935, 1013, 1014], "k_w": [345, 346], "kag": [430, 659], "kbp": [308, 309, 495, 573, 576], "kco": [285, 332, 596, 605, 606, 1049], "ke ": [795], "ked": [121], "ken": [399, 1100], "ker": [405, 496], "ket": [813, 970, 1075, 1078], "key": [184, 394, 480, 497, 498, 720, 721, 923, 1101, 1107, 1108, 1111, 1114, 1115, 1119, 1120, 1125], "kgr": [607], "kic": [398, 499], "kie": [917], "kin": [20, 204, 253, 636], "kli": [166], "kno": [500, 501, 801], "ks ": [398], "ksc": [736], "kup": [98, 99, 100, 101, 102, 103, 111, 112], "l2_": [502, 636], "l_b": [889, 890], "l_c": [210, 540, 677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700], "l_d": [536], "l_e": [287, 367, 701, 710, 755], "l_f": [147, 756], "l_h": [702, 703], "l_i": [343, 583, 584, 585], "l_m": [891, 892, 956, 957], "l_n": [1044], "l_p": [92, 479], "l_s": [569], "l_t": [148], "l_u": [704, 893, 894, 958], "l_v": [496], "l_w": [149], "lab": [106, 107, 365, 1003], "lac": [166], "lag": [366], "lam": [592], "lan": [150, 369, 397, 542, 666, 691, 762, 927, 1027, 1047, 1048, 1082, 1083, 1084, 1085, 1086, 1087, 1088, 1089], "lar": [41, 390, 853], "las": [8, 9, 503, 504, 505, 506, 507, 508, 509, 510, 511, 512, 513, 514, 935], "lat": [489, 490, 502, 515, 939], "lay": [59, 274, 275, 276, 277, 516, 909], "laz": [517], "lba": [285], "lco": [700], "ld ": [131, 348], "ldc": [1117], "lde": [1045], "ldp": [289, 529, 530, 531, 532], "le ": [27, 56, 138, 208, 217, 223, 224, 225, 226, 250, 266, 272, 290, 292, 313, 326, 349, 360, 365, 376, 391, 402, 441, 529, 561, 585, 587, 675, 681, 698, 713, 722, 744, 758, 808, 824, 826, 828, 852, 854, 870, 942, 1003, 1005, 1013, 1038, 1053, 1054, 1097], "le_": [28, 95, 106, 107, 119, 276, 286, 314, 388, 442, 447, 570, 571, 593, 745, 759, 829], "lea": [181, 260], "lec": [837], "led": [20, 35, 42, 79, 93, 94, 95, 101, 112, 117, 204, 234, 241, 242, 254, 259, 264, 267, 287, 306, 309, 315, 316, 344, 347, 357, 367, 388, 422, 428, 437, 466, 470, 493, 518, 519, 520, 521, 522, 531, 532, 536, 542, 544, 554, 557, 563, 574, 577, 580, 593, 624, 661, 663, 680, 693, 701, 710, 712, 721, 751, 753, 754, 770, 873, 888, 889, 891, 893, 945, 979, 986, 992, 1016, 1017, 1044, 1048, 1051, 1055, 1057, 1116, 1118], "lef": [523, 639], "lem": [310, 311, 1104, 1105], "len": [350], "ler": [42, 55, 106, 237, 953, 995], "les": [102, 351, 1080], "let": [33, 82, 190, 238, 443, 830], "lf ": [838], "lgr": [359], "lic": [253, 546, 671, 672, 731], "lid": [1036], "lie": [31, 49, 50, 53, 182, 465, 731, 945], "lif": [471], "lim": [308, 309, 524, 859], "lin": [289, 290, 511, 512, 513, 514, 525, 684, 692, 802, 1010, 1011, 1012, 1013, 1014], "lis": [118, 166, 526, 545, 878, 879, 933, 999], "liv": [527, 528], "liz": [1034], "lk ": [132], "ll ": [43, 139, 358, 377], "ll_": [540], "llb": [285], "lld": [289, 529, 530, 531, 532], "lle": [55, 106, 995], "llg": [359], "lli": [802, 878, 879], "llo": [44, 479], "llr": [360], "llu": [45, 803], "lly": [104], "lo ": [482, 579], "lo_": [580], "loa": [291, 533, 534, 635, 636, 637, 1004, 1015], "lob": [387], "loc": [20, 120, 121, 204, 535, 536, 537, 538, 636, 861, 988, 994], "log": [539, 540, 541, 693, 694, 695, 873, 923], "lor": [521, 522, 679, 683, 684, 687, 688, 690, 692, 697], "los": [931, 932], "lou": [112, 183, 184, 480], "low": [44, 367, 479], "lp ": [416], "lpl": [150], "lre": [863], "lru": [360], "ls ": [106, 107], "ls_": [91, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 234], "lso": [46], "lt ": [235, 791], "lt_": [236, 237], "lte": [36, 117, 118, 204, 279, 352, 353, 542, 544, 545, 546], "lth": [411], "lti": [593], "lts": [584, 600, 867], "lud": [329, 330, 331, 332], "lue": [1037], "lum": [187], "lup": [803], "lus": [45, 916], "lve": [785], "lwi": [179], "ly ": [51, 104, 218, 431, 589, 645, 764], "ly_": [224, 225, 226, 305, 334], "lyt": [314], "m-s": [925], "m_6": [298], "m_a": [622, 623], "m_c": [797], "m_d": [624, 625], "m_g": [626, 627], "m_h": [657], "m_i": [452, 569, 628], "m_m": [299], "m_n": [300, 301], "m_p": [453, 629], "m_s": [216, 396, 397, 630, 631, 866, 1026, 1027], "m_t": [985], "m_u": [454, 570, 571, 632], "ma ": [831], "mac": [62, 246, 289, 311, 382, 401, 512, 543, 544, 545, 546, 564, 754, 755, 756, 844, 910, 1012], "mag": [447, 680, 681], "mai": [282], "mal": [49, 50, 51], "man": [188, 239, 547, 548, 549], "map": [412, 413, 447, 550, 551, 552], "mar": [900], "mat": [104, 756], "max": [102, 553, 732, 733, 956, 957], "mba": [762], "mbe": [337, 602], "mbo": [493], "mbp": [1079], "mca": [554, 891, 892], "mcf": [859], "mcp": [555], "mcs": [968, 969], "mct": [889, 890, 891, 892, 893, 894], "md ": [185], "md5": [556, 1121], "mdn": [557, 558, 559], "me ": [10, 59, 64, 77, 202, 228, 260, 263, 275, 277, 282, 345, 350, 423, 443, 471, 506, 513, 515, 595, 603, 702, 704, 742, 779, 781, 850, 909, 912, 944, 1020, 1124], "me_": [11, 12, 40, 223, 224, 225, 226, 227, 424, 493, 700, 938, 945], "med": [530, 531, 532, 560, 561], "mem": [562, 602], "men": [75, 310, 311, 450, 465, 662, 663, 1104, 1105], "meo": [286, 438, 442, 651, 931, 932, 933, 934, 935, 936, 937, 938, 946, 947, 984, 985], "mes": [269, 563, 564, 843, 880, 948, 949, 950, 1109, 1110], "met": [415], "mez": [103, 951], "mf_": [667], "mgm": [230, 565, 927, 1111], "mgr": [247, 328, 858, 876], "mic": [303, 304], "mig": [566], "mil": [878, 879], "mim": [567], "min": [2, 3, 23, 223, 347, 478, 479, 568, 569, 570, 571, 572, 573, 574, 575, 576, 577, 578, 723, 798, 1092], "mit": [308, 309, 524], "miz": [562, 648, 649, 677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700], "ml ": [906], "mlo": [482, 579, 580], "mma": [188, 900], "mmi": [479, 723], "mmu": [189], "mn ": [187], "mo ": [567], "mod": [61, 63, 114, 299, 376, 391, 402, 432, 433, 449, 463, 508, 559, 581, 582, 583, 584, 585, 586, 587, 646, 653, 667, 669, 713, 854, 895, 911, 942, 1018, 1096], "mon": [226, 588, 589], "mor": [562], "mot": [514, 777, 778], "mou": [55], "mov": [590], "mp ": [269, 592, 880, 949], "mp_": [438, 446, 860, 861, 1017], "mpa": [585], "mpe": [407], "mpl": [33, 190, 292, 939], "mpo": [191], "mps": [950], "mpt": [312, 755, 1067, 1068], "mpu": [1028], "msg": [591], "mss": [592], "mt ": [230, 927], "mt_": [565, 1111], "mul": [593], "mum": [570, 571], "mun": [189], "mwa": [107, 361, 362], "n-n": [397, 1027], "n2_": [986], "n_a": [820], "n_b": [8, 9, 717, 1083, 1084], "n_c": [33, 53, 501, 688, 917], "n_d": [221, 1056], "n_e": [99, 212, 542, 583, 873, 1048], "n_f": [1040], "n_g": [449, 525], "n_h": [223, 224, 225, 226, 227], "n_i": [54, 81, 569], "n_l": [584], "n_m": [927], "n_n": [201, 202, 282, 505, 506, 821], "n_r": [822, 823, 826, 936], "n_s": [222, 735, 736, 937], "n_t": [223, 224, 225, 226, 227, 678, 689, 690, 870, 1041], "n_u": [28], "n_v": [479], "n_w": [934], "na ": [167, 300, 432, 594, 1088], "na_": [56, 168, 169, 170, 171, 172, 173, 174, 572, 573, 574], "nab": [20, 35, 42, 79, 93, 94, 95, 101, 112, 117, 204, 234, 254, 259, 264, 287, 306, 309, 313, 314, 315, 316, 344, 347, 357, 367, 388, 422, 428, 437, 466, 470, 493, 519, 531, 532, 536, 542, 544, 554, 557, 563, 574, 577, 580, 593, 661, 663, 680, 693, 701, 710, 712, 721, 751, 753, 754, 770, 873, 888, 889, 891, 893, 945, 979, 986, 992, 1016, 1017, 1044, 1048, 1051, 1055, 1057, 1116, 1118], "nal": [314, 342, 343, 851], "nam": [59, 64, 202, 275, 277, 282, 303, 304, 345, 350, 423, 424, 506, 513, 595, 603, 702, 704, 742, 779, 843, 850, 909, 912, 1124], "nat": [483, 596, 1017], "nau": [987], "nbl": [988], "nc ": [918, 1095], "nce": [34, 35, 36, 140, 222, 232, 320, 334, 473, 516, 554, 578, 643, 715, 762, 774, 848, 947, 1065, 1066, 1091], "nco": [369, 585, 1085, 1086], "ncr": [450], "ncy": [339], "nd ": [48, 113, 188, 239, 317, 341, 354, 963, 1083], "nd_": [263, 839, 1117], "nde": [969], "ndi": [629], "ndo": [156, 173, 177], "ndp": [318, 319], "nds": [114, 569, 1084], "ne ": [103, 447, 644, 939, 951, 1127], "ne_": [94], "nec": [195, 196, 197, 198, 199, 200, 201, 202, 268, 269, 270, 505, 506, 625, 649, 752, 768, 878, 879], "ned": [714, 726], "nee": [597], "neg": [105, 484, 598], "nel": [91, 92, 106, 107, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 362, 496, 739], "ner": [383, 660, 1114], "nes": [123, 522], "net": [193, 201, 202, 285, 326, 331, 332, 456, 461, 505, 506, 565, 596, 599, 600, 601, 602, 603, 604, 605, 606, 607, 788, 789, 790, 1044, 1049], "new": [608], "nex": [609, 989], "ney": [422], "nf ": [369, 427, 605, 705, 1085], "nf_": [285, 332, 428, 596, 606, 1049, 1086], "nfi": [192, 193, 194, 748], "nfl": [253], "nfo": [451, 452, 453, 454, 569, 657, 922], "ng ": [125, 175, 199, 253, 279, 301, 319, 335, 353, 433, 446, 479, 534, 538, 552, 610, 629, 635, 636, 655, 723, 736, 752, 802, 805, 827, 847, 866, 1089, 1092], "ng_": [20, 36, 114, 176, 177, 178, 204, 222, 232, 347, 473, 572, 575, 576, 577, 578, 798, 848, 947], "nge": [355, 356, 357, 760, 906, 1106, 1119], "ngi": [94, 447, 939], "ngl": [852], "ngr": [1087, 1088, 1089], "ngu": [691, 853], "nha": [320, 554, 1091], "nif": [990, 991, 992], "nim": [570, 571], "nin": [319, 736, 752, 827, 866], "nit": [189, 338, 588, 993], "nk ": [355, 511, 1010], "nk_": [289, 290, 512, 513, 514, 525, 684, 692, 1011, 1012, 1013, 1014], "nli": [289, 290], "nlo": [291, 994, 1004], "nly": [334, 645, 764], "nme": [75, 415, 465], "nmp": [860, 861], "nna": [56], "nne": [91, 92, 106, 107, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 195, 196, 197, 198, 199, 200, 201, 202, 268, 269, 270, 362, 505, 506, 625, 649, 739, 752, 768, 878, 879], "nni": [319, 736, 752, 827, 866], "no ": [611], "no2": [612], "no_": [82, 83], "noi": [613], "nom": [49, 50, 51], "non": [52, 53, 54, 55, 717], "noo": [251, 446], "not": [532, 614, 615], "now": [500, 501, 801, 821], "np_": [1016, 1017, 1018], "npo": [995], "nra": [572, 573, 574, 575, 576, 577, 578], "nri": [321], "ns ": [278, 798, 905, 916], "ns_": [258, 279, 280, 536, 557, 558, 559], "nsa": [292], "nse": [996], "nsi": [128, 962, 1094], "nsr": [281], "nss": [616], "nsu": [997, 998, 999, 1000], "nt ": [14, 31, 75, 182, 203, 215, 310, 318, 327, 356, 389, 413, 465, 476, 486, 662, 670, 757, 797, 953, 959, 975, 998, 1106, 1119], "nt_": [53, 204, 205, 311, 319, 465, 663, 906, 937, 945, 1104, 1105], "nta": [450, 860, 1071], "nte": [56, 143, 144, 203, 204, 205, 455, 456, 457, 467, 540, 569, 609], "nth": [226, 589], "nti": [210, 221, 222, 223, 224, 225, 226, 227, 357, 440, 504, 635, 678, 792], "ntp": [67, 617, 618, 619, 620], "ntr": [55, 91, 106, 206, 207, 208, 322], "nts": [419, 540], "nua": [547], "nuf": [548], "nul": [390], "num": [323, 337, 396, 397, 621, 622, 623, 624, 625, 626, 627, 628, 629, 630, 631, 632, 1026, 1027], "nut": [3, 223], "nv ": [183, 980], "nvi": [458], "ny ": [57, 549], "nym": [55], "o2g": [612], "o_a": [91, 406, 872], "o_c": [91, 92, 112], "o_d": [82], "o_e": [83, 93, 94, 580, 693], "o_f": [741], "o_h": [772], "o_l": [873], "o_n": [742], "o_p": [694, 743, 964], "o_s": [95, 695], "o_t": [744, 745, 746, 826], "o_u": [96, 97], "oad": [124, 125, 126, 291, 533, 534, 635, 636, 637, 1004, 1015], "oam": [347, 796, 797, 798, 1092], "oar": [122, 219], "oba": [98, 99, 100, 101, 102, 103, 387], "oc ": [22, 76, 477], "oc_": [77, 515], "oca": [535, 536, 537, 538, 861, 994], "ock": [20, 120, 121, 204, 636, 988], "ode": [61, 63, 114, 141, 186, 207, 208, 299, 432, 433, 449, 463, 559, 581, 582, 583, 584, 585, 646, 653, 667, 669, 895, 911, 1018, 1096], "odi": [508, 586], "odu": [376, 391, 402, 587, 713, 854, 942], "oe ": [668], "oe_": [669], "of ": [634], "off": [635, 636, 637, 638, 639, 640, 711], "ofi": [722, 758, 759], "ofr": [493], "og ": [539], "og_": [540, 923], "oge": [660], "ogi": [873], "ogl": [388, 447], "ogo": [541, 693, 694, 695], "ogr": [479, 723], "ogu": [485, 799, 800, 801], "oic": [1049], "oid": [641], "oin": [318, 319, 413, 476, 492, 670], "ois": [613], "ok_": [344, 345, 346], "oke": [399, 795, 1100], "oki": [917], "ol ": [583, 954], "ola": [489, 490, 502], "ole": [953], "oli": [546, 671, 672, 731], "oll": [55, 106, 802, 803, 995], "olo": [521, 522, 679, 683, 684, 687, 688, 690, 692, 697], "ols": [234], "olu": [187], "olv": [785], "om ": [147, 375, 558, 741, 1040, 1128], "om_": [216], "oma": [49, 50, 51, 104, 282], "ome": [700], "omi": [677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700], "omm": [188, 189], "omp": [33, 190, 191, 585, 1028], "on ": [17, 32, 52, 87, 128, 145, 200, 211, 265, 276, 280, 302, 490, 496, 501, 502, 642, 650, 694, 718, 725, 748, 766, 783, 792, 819, 823, 829, 845, 861, 897, 962, 1000, 1007, 1034, 1039, 1094], "on_": [33, 53, 54, 99, 201, 202, 212, 221, 222, 223, 224, 225, 226, 227, 505, 506, 525, 678, 688, 689, 690, 717, 820, 821, 822, 823, 870, 1040, 1041], "onc": [334, 643], "ond": [569], "one": [103, 105, 422, 644, 726, 951, 1127], "onf": [192, 193, 194, 253, 285, 332, 369, 427, 428, 596, 605, 606, 705, 748, 1049, 1085, 1086], "oni": [588], "onl": [334, 645, 764], "onn": [195, 196, 197, 198, 199, 200, 201, 202, 268, 269, 270, 505, 506, 625, 649, 752, 768, 878, 879], "ons": [798, 905, 916], "ont": [55, 106, 203, 204, 205, 226, 540, 589, 860], "ony": [55], "oog": [388, 447], "ook": [344, 345, 346, 917], "ool": [234, 954], "oom": [1128], "oop": [251, 446], "oor": [156, 157, 164, 165, 173, 174, 177, 178, 653], "oot": [765, 766], "op ": [251, 256, 262, 429, 469, 640, 886, 955], "op_": [646], "opa": [685], "ope": [647], "opi": [446], "opp": [296, 1069, 1070], "opt": [24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 265, 562, 622, 648, 649, 650, 964], "or ": [156, 157, 164, 165, 173, 174, 177, 178, 324, 368, 521, 588, 647, 679, 683, 684, 687, 688, 690, 692, 697], "or_": [223, 224, 225, 226, 227, 369, 522, 653, 818, 919], "orc": [370], "ord": [237, 281, 498, 536, 661, 755, 769, 863, 1090, 1113, 1116, 1122], "ore": [887, 888, 1066], "org": [371], "ori": [87, 88, 89, 316, 420, 472, 719, 896, 987], "ork": [193, 201, 202, 285, 331, 332, 505, 506, 565, 596, 599, 600, 601, 602, 603, 604, 605, 606, 607, 1044, 1049], "orm": [372, 451, 452, 453, 454, 569, 657, 756, 889, 890, 891, 892, 893, 894], "ort": [110, 196, 287, 339, 409, 435, 453, 514, 673, 674, 675, 676, 677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700, 701, 702, 703, 704, 705, 706, 780, 781, 850, 895, 902, 903, 904, 905, 906, 913, 997, 998, 999, 1000, 1093], "orw": [373, 706], "ory": [421, 562], "os ": [699, 730, 747], "os_": [731, 732, 733, 748], "ose": [191, 729, 931, 932], "osi": [694], "oss": [213], "ost": [236, 423, 424, 657, 702, 704, 707, 708, 1107, 1119], "ot ": [320, 425, 628, 765], "ot1": [283, 284, 285, 286, 287], "ot2": [426, 427, 428], "ot_": [422, 649, 766], "ota": [956, 957, 958, 974, 1068, 1070], "ote": [514, 614, 777, 778], "oth": [227, 651, 984], "oti": [532, 615], "oto": [429, 743], "otp": [430], "ots": [425, 426, 427, 428, 429, 430], "ouc": [959, 1050, 1051], "oud": [112, 183, 184, 480], "oui": [612, 652], "oun": [14, 91, 206, 207, 208, 635, 757, 797, 975, 998], "oup": [60, 61, 65, 126, 295, 359, 393, 394, 525, 602, 607, 816, 818, 1028, 1030, 1031, 1087, 1088, 1089], "our": [97, 223, 224, 225, 226, 227, 424, 431, 710], "ous": [55, 718], "out": [157, 164, 165, 174, 178, 286, 438, 442, 516, 541, 651, 653, 804, 805, 931, 932, 933, 934, 935, 936, 937, 938, 946, 947, 961, 984, 985], "ove": [271, 272, 273, 305, 520, 521, 522, 590, 604, 653, 654, 655, 656, 657, 658, 674, 868, 1044], "ovi": [724, 725, 726], "ow ": [821], "owc": [367], "owe": [44, 479, 709, 710, 711, 712, 956, 957, 958, 971], "own": [288, 289, 290, 291, 292, 500, 501, 732, 801, 1004], "ox_": [683, 684, 685, 686, 687], "oxy": [558, 559, 727], "p_a": [365, 460], "p_c": [99, 860, 931, 932], "p_d": [59, 100], "p_e": [101, 437, 563, 933, 992, 1016, 1017], "p_f": [934], "p_g": [60, 61], "p_i": [60, 551, 602, 849, 872, 1028, 1031, 1058, 1088, 1089], "p_k": [1108], "p_l": [861, 935], "p_m": [61, 62, 63, 102, 289, 376, 646, 713, 854, 942], "p_n": [64, 1017], "p_o": [984], "p_p": [703, 895, 896], "p_r": [394], "p_s": [250, 251, 446, 461, 617, 618, 619, 620, 936, 937, 985, 1018], "p_t": [103, 112, 438, 529, 880, 938, 1038, 1054], "p_v": [897], "pa3": [1091, 1092, 1093, 1094], "pa_": [1095, 1096], "pac": [430, 570, 571, 659, 685, 813, 970, 1075, 1078], "pag": [204], "pas": [237, 660, 661, 755, 1112, 1113, 1116, 1121, 1122, 1123], "pat": [67, 585, 862, 863], "pay": [662, 663], "pd ": [252], "pd_": [253, 254, 255, 256, 468, 469, 1056], "pda": [528, 1002, 1003, 1004], "pdv": [257, 258, 259, 260, 261, 262], "pe ": [92, 205, 467, 682, 750, 976, 1014], "pea": [405], "pec": [864, 865, 866, 989], "ped": [296, 1069, 1070], "pee": [311, 564, 867, 868, 869], "pem": [1103], "pen": [263, 629], "per": [407, 647, 664, 901, 945, 1065, 1066, 1071], "pgr": [28, 65, 96, 97, 803, 818, 1005, 1006, 1007, 1008, 1009], "pgu": [264], "pha": [964], "phr": [660, 1112], "pi ": [66, 293, 857, 875], "pi_": [1100], "pia": [294], "pic": [665], "pie": [67], "pig": [295], "pin": [125, 446, 552], "pir": [336, 337, 338], "pla": [59, 150, 274, 275, 276, 277, 666, 909, 939], "ple": [33, 190, 292, 593], "pli": [511, 512, 513, 514, 731, 1010, 1011, 1012, 1013, 1014], "plo": [1015], "pme": [530, 531, 532], "pmf": [667], "pmp": [1017], "pn ": [778, 1052], "pnp": [1016, 1017, 1018], "po ": [977], "poe": [668, 669], "poi": [318, 319, 413, 476, 670], "pol": [546, 671, 672, 731, 995], "pop": [265], "por": [110, 196, 287, 339, 409, 435, 453, 514, 673, 674, 675, 676, 677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700, 701, 702, 703, 704, 705, 706, 780, 781, 895, 902, 903, 904, 905, 906, 913, 997, 998, 999, 1000, 1093], "pos": [191, 236, 694, 707, 708, 729], "pot": [422, 425, 426, 427, 428, 429, 430], "pow": [709, 710, 711, 712, 956, 957, 958, 971], "pp ": [68, 294, 1019], "pp_": [437, 872, 1108], "ppe": [296, 1069, 1070], "ppi": [552], "ppl": [731], "ppo": [110, 409, 413, 902, 903, 904, 905, 906, 997, 998, 999, 1000, 1093], "ppt": [713], "pr ": [99, 212, 340], "pre": [36, 92, 222, 232, 471, 473, 516, 578, 714, 715, 716, 717, 718, 720, 721, 848, 947, 1114], "pri": [356, 357, 472, 719, 720, 721, 896, 906, 1106, 1115, 1119], "pro": [479, 558, 559, 722, 723, 724, 725, 726, 727, 743, 758, 759], "ps ": [69, 119, 210, 308, 378, 379, 380, 436, 462, 525, 573, 576, 771, 772, 816, 859, 915, 919, 950, 1063, 1079], "ps2": [1064], "ps_": [309, 435, 447, 463], "psc": [158], "psd": [979], "psk": [728, 817, 1105, 1110], "pt ": [24, 964], "pt_": [25, 26], "pta": [27, 28], "pte": [29, 30, 31, 622], "pth": [908, 1011], "pti": [10, 11, 12, 32, 33, 265, 562, 648, 649, 650, 1020], "ptp": [713], "pts": [1067, 1068], "pty": [312, 755], "pur": [729], "put": [1028], "pv6": [464, 465, 466, 467, 468, 469, 470, 471, 472, 473, 1056], "qos": [730, 731, 732, 733], "que": [195, 196, 339, 734], "qui": [735, 736, 782, 783], "r-n": [1026], "r-w": [1027], "r_1": [617], "r_2": [618], "r_3": [619], "r_4": [620], "r_5": [223], "r_a": [818], "r_b": [522], "r_c": [106, 739, 919, 945], "r_d": [224], "r_e": [117, 544, 1051], "r_f": [144], "r_g": [1028], "r_h": [80, 81, 225], "r_i": [55, 548, 1029], "r_l": [118, 545], "r_m": [226, 311, 564, 653], "r_n": [82, 83, 843], "r_o": [227], "r_p": [546], "r_s": [710], "r_t": [250, 651, 984], "r_w": [369], "ra ": [737], "ra_": [470, 471, 472], "rab": [272], "rad": [28, 96, 97, 509, 686, 738, 739, 740, 741, 742, 743, 744, 745, 746, 747, 748, 749, 750, 751, 752, 753, 754, 755, 756, 757, 758, 759, 803, 818, 826, 1005, 1006, 1007, 1008, 1009], "raf": [960, 961], "rag": [1065], "ram": [479, 493, 723], "ran": [128, 389, 390, 760, 953, 962, 1094], "ras": [660, 1112], "rat": [296, 302, 308, 309, 383, 407, 566, 572, 573, 574, 575, 576, 577, 578, 647, 660, 732, 733, 748, 761, 762, 766, 775, 793, 814, 829, 890, 892, 894, 972, 1007, 1079, 1114], "rba": [355], "rce": [370, 424, 710, 1071], "rch": [70, 71, 72, 833], "rd ": [219, 281, 373, 498, 706, 755, 769, 863, 1090, 1113, 1117, 1122], "rd_": [122, 237, 264, 536, 661, 1116], "re ": [70, 73, 194, 236, 336, 361, 407, 708, 782, 887, 1066], "re_": [35, 107, 337, 338, 362, 391, 888, 1018, 1053, 1054], "rea": [209, 763, 764, 822, 823, 985, 1000], "reb": [765, 766], "rec": [281, 536, 767, 768, 769, 770, 771, 772, 773, 839, 863, 936], "red": [210, 273, 305, 346, 471, 488, 714, 720, 721, 767, 770, 771, 772, 773, 776, 783, 839, 1072, 1073, 1074, 1075, 1076, 1077, 1078, 1079], "ree": [1055], "ref": [36, 222, 232, 471, 473, 516, 578, 715, 774, 775, 848, 947], "reg": [39, 346, 525, 776, 905, 1114], "rek": [394, 1125], "rel": [1080], "rem": [450, 514, 777, 778], "ren": [36, 215, 222, 232, 473, 516, 578, 715, 774, 779, 848, 947, 963], "rep": [392, 780, 781], "req": [144, 195, 196, 339, 374, 782, 783], "rer": [548], "res": [92, 307, 308, 309, 465, 716, 720, 721, 775, 784, 785, 786, 787, 788, 789, 790, 791], "ret": [221, 222, 223, 224, 225, 226, 227, 792, 793, 794, 973, 974, 975, 1071], "rev": [122, 717, 718, 795], "rew": [358, 359, 360], "rfa": [455, 467], "rge": [371, 929, 1008], "rgr": [1030, 1031], "rhe": [655], "ria": [840], "rib": [84, 240], "ric": [321, 420, 788, 789, 790], "rid": [520, 521, 522, 604, 653, 656, 657, 674, 868, 1044], "rie": [316, 322, 793, 841, 945, 948, 973, 974, 1065, 1066, 1071], "rif": [280], "rig": [123, 522], "rin": [36, 114, 204, 279, 353, 356, 357, 906, 1106, 1119], "rio": [472, 719, 896], "rit": [236, 390, 472, 719, 834, 896, 1097], "riv": [720, 721, 1115], "riz": [87, 88, 89, 987], "rk ": [193, 599], "rk_": [201, 202, 331, 505, 506, 565, 600, 601, 602, 603, 604, 1044], "rkc": [285, 332, 596, 605, 606, 1049], "rkg": [607], "rl ": [26, 214, 284, 454, 773, 1021], "rl_": [287, 367, 710, 889, 890, 891, 892, 893, 894], "rly": [225, 305, 431], "rm ": [41, 372, 451], "rm_": [452, 453, 454, 569, 657], "rma": [756], "rmc": [889, 890, 891, 892, 893, 894], "rmw": [107, 361, 362], "rn ": [794, 1102], "rna": [342, 343, 1124], "rne": [326, 456, 496], "roa": [124, 125, 126, 347, 796, 797, 798, 1092], "rof": [711, 722, 758, 759], "rog": [479, 485, 723, 799, 800, 801], "rol": [55, 106, 802, 803], "rom": [147, 375, 741, 1040], "ron": [99, 211, 212], "rop": [296, 1069, 1070], "ror": [324, 919], "ros": [213], "rot": [743], "rou": [60, 61, 65, 126, 295, 359, 393, 394, 525, 602, 607, 804, 805, 816, 961, 1028, 1030, 1031, 1087, 1088, 1089], "rov": [724, 725, 726], "rox": [558, 559, 727], "rp ": [727], "rpo": [729], "rpr": [356, 357, 906, 1106, 1119], "rre": [215, 471], "rri": [520, 521, 522, 604, 653, 656, 657, 674, 868, 1044], "rro": [324, 919], "rs ": [16, 86, 227, 415, 460], "rs_": [223, 224, 225, 226, 227, 602], "rsa": [712], "rsi": [145, 276, 496, 501, 718, 783, 897, 1039, 1040, 1041], "rss": [806, 807], "rst": [363, 364, 975], "rt ": [196, 237, 255, 261, 409, 435, 453, 468, 514, 673, 703, 780, 787, 877, 902, 913, 1093], "rt_": [42, 339, 674, 675, 781, 878, 879, 895, 903], "rta": [676, 677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700, 701, 702, 703, 704], "rtc": [287, 408, 409, 705], "rte": [110, 904, 905, 997, 998, 999, 1000], "rtf": [706], "rti": [40, 572, 575, 1102, 1103], "rtn": [850], "rts": [906], "rtu": [880, 1043, 1044, 1045], "rul": [360, 808], "rum": [865, 866], "run": [752, 809], "rva": [457, 569, 609], "rve": [16, 86, 250, 617, 618, 619, 620, 842, 843, 1024], "rvi": [216, 658, 714, 844], "rvp": [778], "rwa": [373, 706], "rx_": [810, 811, 812, 813, 814, 1073, 1074, 1075], "ry ": [91, 206, 421, 734, 900], "ry_": [207, 562, 975], "ryc": [208], "s-d": [136, 811, 966], "s-r": [137, 812, 967, 1074, 1077], "s2 ": [1064], "s_1": [475], "s_6": [151, 152, 153, 154, 155, 156, 157, 158], "s_a": [159, 160, 161, 162, 163, 164, 165, 258, 465, 476, 477, 478, 479, 750], "s_b": [166], "s_c": [55, 480, 592, 748], "s_d": [751, 752], "s_e": [234, 309, 403, 557, 593, 721, 751, 753, 919, 945], "s_f": [223, 224, 225, 226, 227, 279, 404, 906], "s_g": [6, 7, 481, 602, 1099], "s_i": [969], "s_m": [463, 482, 754, 755, 756], "s_n": [167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 432, 433, 483, 484], "s_p": [435, 476, 558, 559, 731, 945, 1071], "s_r": [308, 309, 485, 536, 732, 733, 793], "s_s": [223, 405, 406, 920, 1107], "s_t": [91, 92, 128, 407, 696, 974, 1068], "s_u": [447, 486, 487], "s_v": [280, 718], "s_w": [408, 409, 488], "sab": [266, 267, 570, 571, 624], "sac": [757], "sae": [816, 817], "saf": [818], "sam": [292], "sat": [819, 820, 821, 822, 823], "sav": [712], "sc ": [158], "sca": [95, 223, 224, 225, 226, 319, 735, 736, 824, 825, 826, 827, 866], "sch": [637, 828, 829, 830, 831], "sco": [268, 269, 270, 271, 272, 273, 305, 625, 752, 879, 1066], "scr": [240], "sd_": [571, 979], "sdn": [231, 832], "se ": [191, 613, 729, 1022, 1112], "se_": [447, 660, 704, 931, 932, 964, 1023, 1024], "sea": [833], "sec": [236, 569, 834, 1018], "sed": [958], "see": [8, 9, 364, 510, 835, 836], "sel": [837, 838], "sen": [839, 937], "ser": [16, 45, 86, 216, 250, 617, 618, 619, 620, 632, 714, 778, 840, 841, 842, 843, 844, 945, 948, 1024, 1025, 1026, 1027, 1028, 1029, 1030, 1031, 1124], "ses": [798, 845, 870], "set": [92, 222, 232, 260, 473, 578, 638, 639, 640, 716, 784, 846, 847, 848, 849, 947, 996], "sfa": [819, 820, 821, 822, 823], "sg ": [591, 1032], "sg_": [1024], "sh_": [410, 563, 775, 870, 1107, 1109, 1110, 1116, 1117, 1118, 1119, 1120, 1121, 1122, 1123, 1124], "sha": [720, 721, 1123], "shb": [219], "she": [933], "sho": [850], "shv": [564], "si ": [806], "si_": [807], "sic": [115], "sid": [129, 325, 418, 871, 921, 1104, 1109], "sig": [74, 75, 465, 851], "sin": [572, 575, 852, 853, 922], "sio": [145, 276, 496, 501, 718, 725, 726, 783, 798, 845, 870, 897, 916, 1039, 1040, 1041], "sip": [854], "sit": [128, 237, 593, 694, 855, 856, 857, 858, 962, 1094], "siz": [351, 695, 1056], "sk ": [728, 817, 830, 930, 1105, 1110], "sli": [859], "slo": [923], "snm": [860, 861], "sno": [251, 446], "so ": [46], "so_": [406, 872, 873], "soc": [76, 77, 515], "sol": [489, 490, 502, 785], "son": [823, 1000], "sou": [424, 710], "spa": [570, 571, 862, 863], "spe": [405, 864, 865, 866, 867, 868, 869], "sph": [660, 1112], "spl": [59, 274, 275, 276, 277, 909], "spo": [425, 426, 427, 428, 429, 430], "spr": [758, 759], "sre": [281], "ss ": [123, 127, 213, 307, 522, 616, 1080], "ss_": [128, 308, 309, 465, 476, 592, 696], "ssh": [870, 1107, 1116, 1117, 1118, 1119, 1120, 1121, 1122, 1123, 1124], "ssi": [74, 75, 129, 325, 418, 465, 798, 806, 807, 845, 870, 871, 1104, 1109], "sso": [76, 77, 406, 515, 872, 873], "ssp": [660, 1112], "ssu": [491], "ssw": [237, 661, 755, 1113, 1116, 1121, 1122, 1123], "st ": [118, 124, 166, 363, 395, 481, 494, 503, 526, 545, 626, 657, 707, 786, 869, 940, 999], "st-": [396, 397], "st_": [6, 7, 8, 9, 91, 125, 195, 196, 347, 364, 398, 399, 504, 505, 506, 507, 508, 509, 510, 511, 512, 513, 514, 515, 889, 890, 891, 892, 893, 894, 935, 975, 1092], "sta": [242, 255, 261, 269, 396, 397, 468, 563, 630, 717, 735, 745, 787, 874, 875, 876, 877, 878, 879, 880, 881, 882, 883, 884, 920, 925, 933, 945, 949, 950, 1026, 1027], "ste": [114, 233, 346, 554, 776, 898, 924, 925], "stg": [126], "sti": [335, 885], "stk": [1107, 1119], "stn": [423, 424, 702, 704], "sto": [216, 256, 262, 420, 421, 469, 558, 677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700, 886, 887, 888, 889, 890, 891, 892, 893, 894], "stp": [895, 896, 897], "str": [788, 789, 790, 985], "stu": [236, 708], "sua": [479, 1046], "sub": [461, 788, 789, 790, 898], "suc": [696], "sue": [491], "sul": [791], "sum": [899, 900], "sup": [110, 409, 901, 902, 903, 904, 905, 906, 997, 998, 999, 1000, 1093], "sw ": [7, 9, 12, 631, 907, 1033], "sw_": [908, 909, 910, 911, 912, 913], "swd": [1121, 1123], "swi": [914, 915, 916], "swo": [237, 661, 755, 1113, 1116, 1122], "sy_": [717], "syn": [917, 918, 936, 937], "sys": [233, 898, 919, 920, 921, 922, 923, 924, 925], "t-n": [396], "t-w": [397], "t1x": [283, 284, 285, 286, 287], "t2 ": [426], "t2c": [427, 428], "t_1": [162, 504, 788], "t_2": [163, 789], "t_3": [790], "t_a": [465, 515, 935], "t_b": [6, 7], "t_c": [91, 253, 505, 506, 687, 690, 697, 878, 975], "t_d": [766, 879], "t_e": [42, 422, 663, 770, 889, 891, 893, 1057, 1104], "t_f": [204, 339], "t_h": [771], "t_i": [25, 53, 195, 507, 609], "t_k": [308, 309, 398, 1111], "t_l": [639], "t_m": [432, 433, 508, 895, 906], "t_n": [565], "t_o": [164, 674], "t_p": [125, 196, 311, 516, 1017, 1105], "t_r": [195, 196, 347, 509, 752, 890, 892, 894, 1092], "t_s": [8, 9, 16, 236, 237, 319, 364, 510, 945, 947], "t_t": [205, 269, 326, 399, 640, 675, 772, 781, 932, 934, 937, 938], "t_u": [26, 511, 512, 513, 514, 773], "t_w": [649, 903], "ta ": [220, 396, 397, 630, 874, 1026, 1027], "ta_": [221, 222, 223, 224, 225, 226, 227, 563, 573, 576], "tab": [27, 28, 56, 208, 250, 290, 326, 529, 675, 744, 745, 826, 870, 933, 1013, 1038, 1053, 1054, 1097], "tac": [860], "tad": [875], "tag": [926, 927, 928, 1071], "tai": [241, 242], "tal": [450, 676, 677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700, 701, 702, 703, 704, 956, 957, 958, 974, 1068, 1070], "tam": [269, 876, 880, 949, 950], "tar": [255, 261, 468, 787, 877, 878, 879, 880, 929, 1008], "tas": [830, 930], "tat": [242, 717, 735, 745, 881, 882, 883, 884, 920, 925, 945], "tc ": [408], "tc_": [409], "tch": [885, 914, 915, 916], "tco": [705], "tcp": [931, 932, 933, 934, 935, 936, 937, 938], "tct": [287], "tdo": [157, 164, 165, 174, 178, 653], "te ": [3, 18, 39, 82, 84, 209, 238, 333, 383, 458, 537, 566, 717, 735, 761, 775, 777, 804, 814, 855, 882, 890, 892, 894, 961, 972, 994, 1002], "te_": [237, 296, 308, 309, 334, 514, 542, 572, 573, 574, 575, 576, 577, 578, 720, 721, 732, 733, 762, 793, 856, 939, 1003, 1004, 1079, 1102, 1103, 1115], "tec": [70], "ted": [29, 30, 31, 33, 110, 190, 197, 198, 270, 489, 614, 622, 625, 660, 788, 789, 790, 837, 857, 878, 879, 904, 905, 989, 997, 998, 999, 1000, 1028, 1114], "tee": [114], "teg": [316], "tem": [233, 407, 858, 898, 924, 925, 939, 1067, 1068], "ten": [56, 203, 204, 205, 221, 222, 223, 224, 225, 226, 227, 341, 540, 554, 792], "ter": [36, 117, 118, 143, 144, 204, 279, 342, 343, 346, 352, 353, 415, 455, 456, 457, 467, 544, 545, 546, 569, 609, 776], "tes": [135, 136, 137, 223, 242, 515, 528, 572, 575, 593, 810, 811, 812, 869, 940, 965, 966, 967, 1073, 1074, 1076, 1077], "tet": [228], "teu": [778], "tew": [381, 382, 449], "tex": [678, 687, 689, 690, 696, 697, 700, 941], "tf_": [79], "tfo": [706], "tft": [942], "tgr": [126], "th ": [85, 149, 179, 244, 406, 411, 417, 908, 1011, 1061, 1081], "th1": [403], "th_": [86, 237, 750, 754, 829, 1024, 1116], "the": [227, 326, 651, 678, 943, 984], "thi": [67], "thk": [1101], "thl": [226, 589], "tho": [87, 88, 89, 987], "thu": [386], "tia": [210, 862, 863], "tib": [585], "tic": [104, 314, 678], "tif": [532, 615, 1102, 1103], "til": [681, 1034], "tim": [10, 11, 12, 40, 77, 103, 223, 224, 225, 226, 227, 228, 260, 263, 269, 286, 297, 298, 299, 300, 301, 438, 442, 443, 471, 515, 562, 648, 649, 651, 781, 880, 931, 932, 933, 934, 935, 936, 937, 938, 944, 945, 946, 947, 948, 949, 950, 951, 984, 985, 1020], "tin": [199, 222, 232, 335, 357, 415, 473, 538, 578, 635, 655, 805, 847, 848, 947], "tio": [17, 32, 33, 87, 128, 200, 201, 202, 221, 222, 223, 224, 225, 226, 227, 265, 280, 302, 490, 502, 505, 506, 525, 650, 678, 694, 748, 766, 792, 819, 820, 821, 822, 823, 829, 861, 962, 1007, 1034, 1094], "tip": [593], "tis": [572, 575, 819, 820, 821, 822, 823], "tit": [440, 504, 698, 885], "tiv": [18, 19, 484, 596, 598, 649, 956], "tke": [1107, 1119], "tle": [698], "tma": [412, 413], "tmg": [328], "tna": [423, 424, 702, 704, 850], "tne": [123, 522], "to ": [90, 148, 258, 743, 746, 952, 1041, 1056], "to_": [91, 92, 93, 94, 95, 96, 97, 112, 772], "tob": [98, 99, 100, 101, 102, 103], "tog": [660], "tok": [399, 1100], "tol": [953], "tom": [104, 216, 558, 677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700], "ton": [105, 688, 689, 690], "too": [234, 954], "top": [256, 262, 429, 469, 640, 886, 955], "tor": [420, 421, 588, 647, 887, 888, 889, 890, 891, 892, 893, 894], "tos": [699], "tot": [956, 957, 958, 974, 1068, 1070], "tou": [818, 959], "tp ": [434], "tp_": [376, 617, 618, 619, 620, 703, 713, 895, 896, 897, 942], "tpa": [67, 430], "tps": [435, 771, 772], "tr_": [80, 81, 82, 83], "tra": [128, 960, 961, 962, 1094], "tre": [963, 985], "tri": [84, 322, 788, 789, 790, 793, 973, 974, 1071], "trl": [214, 284, 287, 367, 710, 889, 890, 891, 892, 893, 894], "tro": [55, 106], "tru": [865, 866], "try": [91, 206, 207, 208, 975], "ts ": [419, 540, 584, 600, 745, 767, 813, 839, 867, 920, 925, 970, 1008, 1067, 1075, 1078], "ts_": [92, 906, 945, 1068], "tsp": [425, 426, 427, 428, 429, 430], "tte": [1067, 1068], "tti": [222, 232, 473, 578, 847, 848, 947], "tto": [688, 689, 690], "ttp": [434, 435, 703, 771, 772], "ttr": [80, 81, 82, 83, 84], "tu ": [883], "tua": [1043, 1044, 1045], "tup": [849, 880], "tur": [35, 70, 236, 407, 548, 708, 794], "tus": [884], "two": [193, 201, 202, 285, 331, 332, 505, 506, 565, 596, 599, 600, 601, 602, 603, 604, 605, 606, 607, 964, 1044, 1049], "tx_": [965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975, 1067, 1068, 1069, 1070, 1071, 1076, 1077, 1078], "ty ": [189, 312, 390, 440, 472, 504, 649, 685, 719, 834, 896, 1036], "ty_": [236, 755], "typ": [92, 205, 467, 682, 750, 976, 977, 1014], "uag": [691], "ual": [479, 547, 1043, 1044, 1045, 1046], "uap": [6, 8, 11, 978, 979], "uar": [264], "ub ": [386], "ubi": [980, 981], "ubn": [461, 486, 788, 789, 790], "ubs": [898], "uca": [893, 894], "ucc": [696], "ucg": [982], "uch": [959, 1050, 1051], "ud_": [112, 183, 480], "ude": [329, 330, 331, 332], "udk": [184], "udm": [487, 983], "udp": [984, 985], "ue ": [485, 491, 799, 1037], "uea": [800], "uek": [801], "uen": [339], "uer": [734], "ues": [6, 7, 195, 196, 395, 396, 397, 398, 399, 481, 626], "ufa": [548], "ug ": [130], "ug_": [229, 230, 231, 232, 233, 234], "ugw": [986], "ui ": [612, 652], "uic": [735, 736], "uid": [981], "uil": [131], "uir": [782, 783], "ula": [390, 853], "ule": [360, 376, 391, 402, 587, 713, 808, 828, 829, 830, 854, 942], "ulk": [132], "ull": [377], "ult": [235, 236, 237, 593, 600, 791, 867], "um ": [323, 621, 865, 899], "um_": [396, 397, 570, 571, 622, 623, 624, 625, 626, 627, 628, 629, 630, 631, 632, 866, 1026, 1027], "umb": [337, 493], "umm": [900], "umn": [187], "un ": [809], "una": [987], "unb": [988], "une": [989], "uni": [189, 338, 990, 991, 992, 993], "unl": [994], "unn": [752], "unp": [995], "uns": [996, 997, 998, 999, 1000], "unt": [14, 91, 206, 207, 208, 635, 757, 797, 975, 998], "up ": [65, 98, 111, 126, 295, 359, 393, 607, 733, 1001, 1030, 1087], "up_": [60, 61, 99, 100, 101, 102, 103, 112, 394, 602, 849, 880, 1028, 1031, 1088, 1089], "upd": [528, 1002, 1003, 1004], "upe": [901], "upg": [28, 96, 97, 803, 818, 1005, 1006, 1007, 1008, 1009], "upl": [511, 512, 513, 514, 1010, 1011, 1012, 1013, 1014, 1015], "upn": [1016, 1017, 1018], "upp": [110, 409, 902, 903, 904, 905, 906, 997, 998, 999, 1000, 1019, 1093], "ups": [525, 816], "upt": [10, 11, 12, 1020], "ur ": [97], "ura": [302, 748, 766, 829, 1007], "urc": [424, 710], "ure": [35, 70, 194, 236, 407, 548, 708, 1018], "uri": [236, 834], "url": [26, 225, 431, 454, 773, 1021], "urn": [794], "urp": [729], "urr": [215], "urs": [223, 224, 225, 226, 227, 975], "us ": [686, 884], "us_": [55, 718, 750, 751, 752, 753, 754, 755, 756], "usa": [570, 571, 757], "use": [45, 447, 632, 704, 778, 958, 1022, 1023, 1024, 1025, 1026, 1027, 1028, 1029, 1030, 1031, 1124], "usg": [1024, 1032], "usi": [916], "usp": [758, 759], "ust": [91, 216, 494, 558, 677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700], "usw": [7, 9, 12, 1033], "usy": [717], "ut ": [286, 438, 442, 541, 651, 931, 932, 933, 934, 935, 936, 937, 938, 946, 984, 985], "ut_": [516, 947], "utd": [157, 164, 165, 174, 178, 653], "ute": [3, 84, 223, 333, 334, 804, 961, 1028], "uth": [85, 86, 87, 88, 89, 237, 244, 406, 678, 750, 754, 987, 1024, 1101, 1116], "uti": [805, 1034], "uto": [90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 258, 660, 818, 1056], "utt": [688, 689, 690], "uui": [981], "v2 ": [1035], "v3_": [564], "v6 ": [257, 464], "v6_": [258, 259, 260, 261, 262, 465, 466, 467, 468, 469, 470, 471, 472, 473, 1056], "v_n": [717], "v_t": [936], "vai": [106, 107, 365, 1003], "val": [457, 569, 609, 1036, 1037], "van": [34, 35, 36], "vap": [563, 1038, 1054], "vat": [18, 720, 721, 1115], "ve ": [19, 71, 484, 590, 598], "ve_": [527, 528, 596, 712, 767, 956], "ved": [72, 785], "ven": [67, 327, 959], "ver": [16, 86, 145, 250, 271, 272, 273, 276, 280, 305, 496, 501, 520, 521, 522, 572, 575, 604, 617, 618, 619, 620, 653, 654, 655, 656, 657, 658, 674, 718, 783, 842, 843, 868, 897, 1024, 1039, 1040, 1041, 1044, 1065], "vg ": [40, 108, 296, 793, 820], "via": [273, 1042], "vic": [216, 229, 237, 243, 244, 245, 246, 329, 714, 844, 991, 998, 999, 1045], "vid": [724], "vie": [658], "vio": [718], "vir": [1043, 1044, 1045], "vis": [479, 725, 726, 1046], "vit": [458, 649], "vla": [927, 1047, 1048], "vmg": [247], "voi": [1049], "vok": [795], "vou": [1050, 1051], "vpn": [778, 1052], "vtm": [328], "vwi": [1053, 1054, 1055, 1125], "w2_": [378], "w3_": [379, 986], "w_c": [380, 436], "w_d": [908, 909], "w_m": [401, 910, 911], "w_n": [345, 912], "w_p": [913], "wai": [932, 934, 938], "wal": [358, 359, 360], "wan": [986, 1056], "war": [107, 361, 362, 373, 706], "way": [381, 382, 449], "wct": [367], "wd ": [1121, 1123], "web": [408, 409], "wec": [1057], "wed": [44, 479], "wel": [700], "wep": [1058], "wer": [709, 710, 711, 712, 956, 957, 958, 971], "whe": [28, 1059], "whi": [1060], "wid": [149, 179, 417, 1061], "wif": [345, 346, 649, 903, 1062, 1063, 1064, 1065, 1066, 1067, 1068, 1069, 1070, 1071], "wil": [1117], "wir": [488, 1053, 1054, 1055, 1072, 1073, 1074, 1075, 1076, 1077, 1078, 1079, 1080, 1125], "wit": [829, 914, 915, 916, 1081], "wla": [369, 397, 1027, 1082, 1083, 1084, 1085, 1086, 1087, 1088, 1089], "wn ": [288, 500, 732, 801], "wn_": [501], "wnl": [289, 290, 291, 1004], "wns": [292], "wo_": [964], "wor": [193, 201, 202, 237, 285, 331, 332, 498, 505, 506, 565, 596, 599, 600, 601, 602, 603, 604, 605, 606, 607, 661, 755, 1044, 1049, 1090, 1113, 1116, 1122], "wpa": [1091, 1092, 1093, 1094, 1095, 1096], "wri": [1097], "x_a": [1067, 1068, 1099, 1100, 1101], "x_b": [810, 811, 812, 965, 966, 967, 1073, 1074, 1076, 1077], "x_c": [284, 683, 1102, 1103], "x_d": [732, 1069, 1070], "x_e": [956, 1104, 1105], "x_f": [102, 285, 1106], "x_h": [1107], "x_i": [286, 504, 1108], "x_l": [684], "x_m": [968, 969, 1109, 1110, 1111], "x_o": [685], "x_p": [287, 813, 957, 970, 971, 1075, 1078, 1112, 1113, 1114, 1115], "x_r": [686, 814, 972, 973, 974, 975, 1071], "x_s": [1116, 1117, 1118, 1119, 1120, 1121, 1122, 1123, 1124], "x_t": [687], "x_u": [733], "x_v": [1125], "xcl": [329, 330, 331, 332, 916], "xec": [333, 334], "xed": [365, 1023], "xis": [335], "xpe": [989, 1065, 1066], "xpi": [336, 337, 338], "xpo": [339], "xpr": [99, 212, 340], "xt ": [678, 689, 696, 700, 941], "xt_": [162, 163, 164, 609, 687, 690, 697], "xte": [341, 342, 343], "xy_": [558, 559, 727], "y_a": [727, 731], "y_b": [975], "y_c": [31, 207, 558], "y_d": [305], "y_e": [532], "y_f": [1119], "y_m": [382, 449, 559], "y_n": [275], "y_o": [334, 562], "y_p": [236, 755], "y_s": [224, 225, 226, 717], "y_u": [6, 7, 8, 9, 11, 12], "yab": [276], "ycl": [217], "yco": [208], "yme": [662, 663], "ymo": [55], "yn_": [917, 936, 937], "yna": [59, 277, 303, 304, 909], "ync": [918], "you": [516], "ype": [92, 205, 467, 682, 750, 976, 1014], "ypo": [422, 977], "ys ": [100, 221, 720, 1120], "ys_": [721, 919, 920], "ysi": [921, 922], "ysl": [923], "yst": [233, 898, 924, 925], "yte": [135, 136, 137, 810, 811, 812, 965, 966, 967, 1073, 1074, 1076, 1077], "yti": [314], "ywo": [498], "z_o": [612], "zat": [87, 1034], "ze ": [88, 351, 648, 695, 987], "ze_": [649, 1056], "zed": [89, 562, 677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700], "zon": [103, 951, 1127], "zoo": [1128], "zy ": [517]}}')
+
+# Fields from spec/field-inventory.json: sources[i] = [list tool, endpoint path];
+# fields[name] = [i, ...]
+_FIELD_INDEX = json.loads(r'{"fields": {"_is_guest_by_uap": [10], "_is_guest_by_usw": [10], "_last_seen_by_uap": [10], "_last_seen_by_usw": [10], "_uptime": [16], "_uptime_by_uap": [10], "_uptime_by_usw": [10], "acct_servers": [49], "action": [63], "ad_blocking_enabled": [66], "admin": [72], "adopt_ip": [16], "adopt_url": [16], "adoptable_when_upgraded": [16], "adopted": [16, 17], "adopted_at": [16], "adopted_by_client": [16], "adoption_completed": [16], "advanced_feature_enabled": [66], "advanced_filtering_preference": [66], "afc": [13], "age": [60], "airtime_avg": [14], "alert_enabled": [66], "anomalies": [1, 10, 16], "anomaly": [4], "anon_client_id": [10], "anon_id": [16], "anonymous_controller_id": [73], "antenna_table": [16], "ap": [2, 26, 71, 72], "ap_displayName": [2, 26, 71, 72], "ap_group_ids": [82], "ap_group_mode": [82], "ap_mac": [1, 10, 60, 65], "ap_model": [2, 26, 71, 72], "ap_name": [2, 26, 71, 72], "architecture": [16], "archived": [2, 71], "assoc_time": [1, 10, 65], "atf_enabled": [16], "attr_hidden": [81], "attr_hidden_id": [5, 21, 43, 49, 77, 81], "attr_no_delete": [5, 21, 43, 49, 77, 81], "attr_no_edit": [81], "auth": [66], "auth_servers": [49], "authorized": [1, 10], "auto_adjust_channels_to_country": [66], "auto_channel_presets_type": [66], "auto_enabled": [66], "auto_engine_id_enabled": [66], "auto_scale_enabled": [43], "auto_upgrade": [66], "auto_upgrade_hour": [66], "autobackup": [73], "autobackup_cron_expr": [66], "autobackup_days": [66], "autobackup_enabled": [66], "autobackup_max_files": [66], "autobackup_timezone": [66], "autoneg": [47], "available_controller_channels": [66], "available_firmware_channels": [66], "b_supported": [82], "backup_to_cloud_enabled": [66], "band": [60], "bandsteering_mode": [16], "bc_filter_enabled": [82], "bc_filter_list": [82], "ble_caps": [16], "blocked": [1, 11], "board_rev": [16], "brightness": [66], "broadcast_ping": [66], "bss_transition": [82], "bssid": [1, 10, 60], "build": [73], "bw": [60], "bytes": [16], "bytes-d": [16], "bytes-r": [10, 16], "ccq": [1, 10], "center_freq": [60], "cfgversion": [16], "channel": [1, 10, 11, 60], "channelWidth": [10], "channel_from": [26, 72], "channel_to": [26, 72], "channel_width": [1, 10], "channels_6e": [13, 66], "channels_6e_160": [13], "channels_6e_320": [13], "channels_6e_40": [13], "channels_6e_80": [13], "channels_6e_indoor": [13], "channels_6e_outdoor": [13], "channels_6e_psc": [13], "channels_ad_1080": [13], "channels_ad_2160": [13], "channels_ad_4320": [13], "channels_ad_ext_1080": [13], "channels_ad_ext_2160": [13], "channels_ad_ext_outdoor": [13], "channels_ad_outdoor": [13], "channels_blacklist": [66], "channels_na": [13, 66], "channels_na_160": [13], "channels_na_240": [13], "channels_na_40": [13], "channels_na_80": [13], "channels_na_dfs": [13], "channels_na_indoor": [13], "channels_na_outdoor": [13], "channels_ng": [13, 66], "channels_ng_40": [13], "channels_ng_indoor": [13], "channels_ng_outdoor": [13], "cloud_env": [64], "code": [12, 13, 66], "community": [66], "config_network": [16], "connect_request_ip": [16], "connect_request_port": [16], "connected": [64], "connected_at": [16], "connecting": [64], "connection_network_id": [16], "connection_network_name": [16], "content_filtering_blocking_page_enabled": [66], "content_type": [41], "country_code": [16], "countrycode_table": [16], "credential_caps": [16], "cron_expr": [63, 66], "custom_services": [66], "data_retention_days": [73], "data_retention_setting_preference": [66], "data_retention_time_in_hours_for_5minutes_scale": [66, 73], "data_retention_time_in_hours_for_daily_scale": [66, 73], "data_retention_time_in_hours_for_hourly_scale": [66, 73], "data_retention_time_in_hours_for_monthly_scale": [66, 73], "data_retention_time_in_hours_for_others": [66, 73], "datetime": [2, 26, 71, 72], "debug_device": [73], "debug_mgmt": [73], "debug_sdn": [73], "debug_setting_preference": [73], "debug_system": [73], "debug_tools_enabled": [66], "default": [16, 66], "default_security_posture": [66], "default_site_device_auth_password_alert": [73], "detailed_states": [1, 10, 16], "device_auth": [66], "device_id": [16, 66], "device_macs": [5], "dhcp_server_table": [16], "dhcp_snoop": [66], "dhcpd_conflict_checking": [43], "dhcpd_enabled": [43], "dhcpd_start": [43], "dhcpd_stop": [43], "dhcpdv6_dns_auto": [43], "dhcpdv6_enabled": [43], "dhcpdv6_leasetime": [43], "dhcpdv6_start": [43], "dhcpdv6_stop": [43], "dhcpend_time": [1, 10], "dhcpguard_enabled": [43], "disabled": [16, 17], "disconnect_timestamp": [3, 10, 78], "disconnected_at": [16], "discoverable": [66], "discovered_via": [16], "display_name": [1, 11], "displayable_version": [16], "dns_filtering": [66], "dns_verification": [66], "domain_name": [43], "dot1x_ctrl": [47], "dot1x_fallback_networkconf_id": [66], "dot1x_idle_timeout": [47], "dot1x_portctrl_enabled": [16, 66], "downlink_lldp_macs": [16], "downlink_table": [16], "download": [66], "dropped_rate_avg": [14], "dtim_6e": [82], "dtim_mode": [82], "dtim_na": [82], "dtim_ng": [82], "duration": [65], "eagerly_discovered": [10], "ec_enabled": [66], "egress_rate_limit_kbps": [47], "egress_rate_limit_kbps_enabled": [47], "element_peer_mac": [16], "enable_analytics": [66], "enabled": [43, 64, 66, 82], "enabled_categories": [66], "endpoint_scanning": [66], "enhanced_iot": [82], "essid": [1, 10, 60], "ethernet_table": [16], "exclude_devices": [66], "excluded_network_ids": [66], "excluded_networkconf_ids": [47], "execute_only_once": [63], "expire": [66], "expire_number": [66], "expire_unit": [66], "export_frequency": [66], "external_id": [16, 43, 49, 82], "facebook_enabled": [66], "facebook_wifi_gw_name": [66], "facebook_wifi_registered": [73], "fast_roaming_enabled": [82], "filename": [41], "filesize": [41], "fingerprint": [1, 11], "fingerprintingEnabled": [66], "firmware_channel": [66], "first_seen": [1, 3, 10, 11, 78], "fixed_ap_available": [16], "flowctrl_enabled": [16, 66], "for_wlanconf": [5], "forward": [47], "freq": [2, 26, 60, 71, 72], "ftp_module": [66], "fw2_caps": [16], "fw3_caps": [16], "fw_caps": [16], "gateway_mac": [16], "google_enabled": [66], "gre_module": [66], "group_rekey": [82], "guest": [26, 72], "guest-num_sta": [16], "guest-wlan-num_sta": [16], "guest_kicks": [16], "guest_token": [16], "gw_mac": [65], "h323_module": [66], "has_eth1": [16], "has_fan": [16], "has_speaker": [16], "has_sso_auth": [64], "has_temperature": [16], "has_webrtc": [64], "has_webrtc_support": [73], "hash_id": [16], "height": [41], "heightInMeters": [16], "hide_ch_width": [16], "hide_ssid": [82], "hints": [13], "honeypot_enabled": [66], "hostname": [1, 3, 10, 11, 65, 66, 73, 78], "hostname_source": [10], "hotspot2conf_enabled": [82], "ht_modes_na": [66], "ht_modes_ng": [66], "https_port": [73], "hw_caps": [16], "iapp_enabled": [82], "icmp_timeout": [66], "id": [1, 11], "idle_timeout": [66], "idletime": [1, 10], "igmp_snooping": [43], "image_maps_use_google_engine": [73], "in_gateway_mode": [17], "inform_ip": [16], "inform_port": [73], "inform_url": [16], "internet": [16], "ip": [1, 10, 16, 65, 72], "ip_addrs": [73], "ip_subnet": [43], "ips_mode": [66], "ipv6": [16], "ipv6_client_address_assignment": [43], "ipv6_enabled": [43], "ipv6_interface_type": [43], "ipv6_pd_start": [43], "ipv6_pd_stop": [43], "ipv6_ra_enabled": [43], "ipv6_ra_preferred_lifetime": [43], "ipv6_ra_priority": [43], "ipv6_setting_preference": [43], "is_11r": [10], "is_access_point": [16], "is_adhoc": [60], "is_admin": [72], "is_allowed_in_visual_programming": [1, 11], "is_cloud_key": [64], "is_guest": [1, 3, 10, 11, 65, 78, 82], "is_mlo": [1, 10, 11], "is_nat": [43], "is_negative": [2, 26, 71, 72], "is_rogue": [60], "is_ubnt": [60], "is_udm": [64], "is_wired": [1, 3, 10, 11, 65, 78], "isolated": [16], "isolation": [47], "jumboframe_enabled": [16, 66], "kernel_version": [16], "key": [2, 12, 13, 26, 66, 71, 72], "known_cfgversion": [16], "l2_isolation": [82], "last_1x_identity": [3, 10, 78], "last_connection_network_id": [1, 3, 10, 11, 16, 78], "last_connection_network_name": [1, 3, 10, 11, 16, 78], "last_ip": [1, 3, 10, 11, 78], "last_modified": [41], "last_radio": [1, 3, 10, 11, 78], "last_seen": [1, 3, 10, 11, 16, 60, 78], "last_uplink": [16], "last_uplink_mac": [1, 3, 10, 11, 78], "last_uplink_name": [1, 3, 10, 11, 78], "last_uplink_remote_port": [1, 3, 10, 11, 78], "latest_assoc_time": [1, 10], "layout_preference": [66], "led_enabled": [66], "led_override": [16], "led_override_color": [16], "led_override_color_brightness": [16], "link_aggregation_groups": [16], "live_chat": [73], "live_updates": [66], "lldp_table": [16], "lldpmed_enabled": [47], "lldpmed_notify_enabled": [47], "local_dns_record_enabled": [1, 11], "locating": [16], "log_all_contents": [66], "lte_lan_enabled": [43], "mac": [1, 3, 4, 10, 11, 16, 17, 65, 78], "mac_filter_enabled": [82], "mac_filter_list": [82], "mac_filter_policy": [82], "manufacturer_id": [16], "map_id": [16], "mcastenhance_enabled": [82], "md5": [41], "mdns_enabled": [43], "mdns_proxy_custom": [82], "mdns_proxy_mode": [82], "memory_optimized": [66], "mesh_sta_vap_enabled": [16], "meshv3_peer_mac": [16], "mgmt_network_id": [16], "mimo": [1], "min_inform_interval_seconds": [16], "minimum_usable_hd_space": [66], "minimum_usable_sd_space": [66], "minrate_na_advertising_rates": [82], "minrate_na_data_rate_kbps": [82], "minrate_na_enabled": [82], "minrate_ng_advertising_rates": [82], "minrate_ng_data_rate_kbps": [82], "minrate_ng_enabled": [82], "minrate_setting_preference": [82], "mlo_enabled": [82], "mode": [66], "model": [16, 17], "model_in_eol": [16], "model_in_lts": [16], "model_incompatible": [16], "msg": [2, 26, 71, 72], "mss_clamp": [66], "multiple_sites_enabled": [66], "name": [5, 12, 13, 16, 17, 21, 41, 43, 47, 49, 63, 65, 66, 73, 77, 81, 82], "native_networkconf_id": [47], "network": [10], "network_defaults": [66], "network_id": [1, 10], "network_members_group_ids": [1, 3, 10, 11, 78], "network_name": [1], "network_overrides": [66], "networkconf_id": [82], "networkgroup": [43], "next_interval": [16], "no2ghz_oui": [82], "noise": [1, 10, 60], "noted": [1, 11], "nss": [10], "ntp_server_1": [66], "ntp_server_2": [66], "ntp_server_3": [66], "ntp_server_4": [66], "num_adopted": [33], "num_ap": [33], "num_disabled": [33], "num_disconnected": [33], "num_guest": [33], "num_gw": [33], "num_iot": [33], "num_pending": [33], "num_sta": [16, 51], "num_sw": [33], "num_user": [33], "o": [51, 65], "offload_accounting": [66], "offload_l2_blocking": [66], "offload_sch": [66], "offset_left": [41], "offset_top": [41], "oid": [51, 65], "op_mode": [47], "optimize": [66], "optimize_iot_wifi_connectivity": [82], "other_timeout": [66], "oui": [1, 3, 10, 11, 60, 78], "outdoor_mode_override": [16], "overheating": [16], "override_inform_host": [73], "passphrase_autogenerated": [82], "password_enabled": [66], "payment_enabled": [66], "pmf_mode": [82], "poe_mode": [47], "port": [66], "port_overrides": [16], "port_table": [16], "portal_customized": [66], "portal_customized_authentication_text": [66], "portal_customized_bg_color": [66], "portal_customized_bg_image_enabled": [66], "portal_customized_bg_image_tile": [66], "portal_customized_bg_type": [66], "portal_customized_box_color": [66], "portal_customized_box_link_color": [66], "portal_customized_box_opacity": [66], "portal_customized_box_radius": [66], "portal_customized_box_text_color": [66], "portal_customized_button_color": [66], "portal_customized_button_text": [66], "portal_customized_button_text_color": [66], "portal_customized_languages": [66], "portal_customized_link_color": [66], "portal_customized_logo_enabled": [66], "portal_customized_logo_position": [66], "portal_customized_logo_size": [66], "portal_customized_success_text": [66], "portal_customized_text_color": [66], "portal_customized_title": [66], "portal_customized_tos": [66], "portal_customized_welcome_text": [66], "portal_enabled": [66], "portal_hostname": [66], "portal_http_port": [73], "portal_use_hostname": [66], "power_source_ctrl_enabled": [16], "powersave_enabled": [1, 10], "pptp_module": [66], "predefined_services": [66], "prev_non_busy_state": [16], "previous_version": [73], "private_preshared_keys": [82], "private_preshared_keys_enabled": [82], "provider": [66], "provisioned_at": [16], "proxy_arp": [82], "psk": [66], "purpose": [43], "qos_policy_applied": [10], "qos_rate_max_down": [77], "qos_rate_max_up": [77], "quick_scan_state": [16], "quickscan_scanning": [16], "radar_channel": [2, 26, 71, 72], "radio": [1, 10, 26, 60, 72], "radio_from": [26, 72], "radio_name": [1, 10, 60], "radio_proto": [1, 10], "radio_table": [16], "radio_table_stats": [16], "radio_to": [26, 72], "radios": [66], "radios_configuration": [66], "radius_auth_type": [66], "radius_das_enabled": [82], "radius_disconnect_running": [73], "radius_enabled": [66], "radius_mac_auth_enabled": [82], "radius_macacl_empty_password": [82], "radius_macacl_format": [82], "radiusprofile_id": [66], "rate_imbalance": [1], "reboot_duration": [16], "receive_redirects": [66], "redirect_enabled": [66], "redirect_https": [66], "redirect_to_https": [66], "redirect_url": [66], "refresh_rate": [66], "registered": [64], "report_time": [60], "required_version": [16], "restricted_subnet_1": [66], "restricted_subnet_2": [66], "restricted_subnet_3": [66], "retries_rate_avg": [14], "roam_count": [1, 10], "roaming_sessions": [65], "rollupgrade": [16], "rssi": [1, 10, 60, 66], "rssi_age": [60], "rx_bytes": [1, 10, 16, 65], "rx_bytes-d": [16], "rx_bytes-r": [1, 10, 14, 33], "rx_packets": [1, 10], "rx_rate": [1, 10], "sae_groups": [82], "sae_psk": [82], "safe_for_autoupgrade": [16], "satisfaction": [10, 16, 65], "satisfaction_avg": [10, 65], "satisfaction_now": [10], "satisfaction_real": [10], "satisfaction_reason": [10], "scan_radio_table": [16], "scanning": [16], "schedule": [82], "schedule_with_duration": [82], "security": [60, 82], "selected": [41], "send_redirects": [66], "serial": [16], "server_names": [66], "service_mac": [16], "setting_preference": [43, 47, 66, 82], "setup_id": [16], "shortname": [16], "signal": [1, 10, 60], "sip_module": [66], "site": [51], "site_id": [1, 2, 3, 10, 11, 16, 21, 26, 41, 43, 47, 49, 60, 63, 66, 71, 72, 77, 78, 81, 82], "slimcfg_caps": [16], "snmp_contact": [16], "snmp_location": [16], "spectrum_scanning": [16], "speed_defaults": [66], "speed_overrides": [66], "ssh_session_table": [16], "ssid": [66], "sso_app_id": [73], "sso_login_enabled": [64, 66], "start_connected_millis": [16], "start_disconnected_millis": [16], "startup_timestamp": [16], "stat": [16], "state": [16, 17, 66], "status": [1, 11, 33], "store_enabled": [73], "stormctrl_bcast_enabled": [47], "stormctrl_bcast_rate": [47], "stormctrl_mcast_enabled": [47], "stormctrl_mcast_rate": [47], "stormctrl_ucast_enabled": [47], "stormctrl_ucast_rate": [47], "stp_port_mode": [47], "stp_priority": [16], "stp_version": [16, 66], "subsystem": [2, 26, 33, 71, 72], "support_wifi6e": [16], "supported_afc_regions": [16], "supports_fingerprint_ml": [16], "sw": [26, 72], "sw_depth": [10], "sw_displayName": [26, 72], "sw_mac": [10, 65], "sw_model": [26, 72], "sw_name": [26, 72], "sw_port": [1, 10, 11, 65], "switch_caps": [16], "switch_exclusions": [66], "syn_cookies": [66], "sync": [66], "sys_error_caps": [16], "sys_stats": [16], "sysid": [16], "syslog_key": [16], "system-stats": [16], "tagged_vlan_mgmt": [47], "tags": [1, 11], "tcp_close_timeout": [66], "tcp_close_wait_timeout": [66], "tcp_established_timeout": [66], "tcp_fin_wait_timeout": [66], "tcp_last_ack_timeout": [66], "tcp_syn_recv_timeout": [66], "tcp_syn_sent_timeout": [66], "tcp_time_wait_timeout": [66], "template_engine": [66], "tftp_module": [66], "time": [2, 14, 26, 71, 72], "time_series_per_client_stats_enabled": [66], "timeout_setting_preference": [66], "timestamps": [4], "timezone": [66, 73], "total_max_effective_power": [16], "total_max_power": [16], "total_used_power": [16], "touch_event": [66], "two_phase_adopt": [16], "tx_bytes": [1, 10, 16, 65], "tx_bytes-d": [16], "tx_bytes-r": [1, 10, 14, 33], "tx_mcs": [10], "tx_mcs_index": [1], "tx_packets": [1, 10], "tx_power": [10], "tx_rate": [1, 10], "tx_retries": [10], "tx_retries_total": [14], "tx_retry_burst_count": [10], "type": [1, 11, 16, 17, 41], "uapsd_enabled": [82], "ubic_env": [64], "ubic_uuid": [66], "udp_other_timeout": [66], "udp_stream_timeout": [66], "ugw3_wan2_enabled": [66], "unifi_device": [1, 11], "unifi_idp_enabled": [66], "unit": [41], "unsupported": [16], "unsupported_device_count": [73], "unsupported_device_list": [73], "unsupported_reason": [16], "update_available": [73], "update_downloaded": [73], "upgradable": [16], "upgrade_duration": [16], "upgrade_targets": [63], "uplink": [16], "uplink_depth": [16], "uplink_mac": [1, 11], "uplink_table": [16], "uplink_type": [66], "upload": [66], "upnp_enabled": [66], "upnp_nat_pmp_enabled": [66], "upnp_secure_mode": [66], "upp": [41], "uptime": [1, 10, 16, 73], "url": [41], "use_fixedip": [1, 11], "use_usg_auth_server": [49], "user": [26, 72], "user-num_sta": [16], "user-wlan-num_sta": [16], "user_group_id_computed": [10], "user_id": [1, 10, 11], "usergroup_id": [1, 3, 10, 11, 78, 82], "vap_table": [16], "version": [16, 66, 73], "version_from": [26, 72], "version_to": [26, 72], "virtual_network_override_enabled": [1, 11], "vlan": [43], "vlan_enabled": [43], "voice_networkconf_id": [47], "voucher_enabled": [66], "vwireEnabled": [16], "vwire_table": [16], "vwire_vap_table": [16], "wan_dhcpv6_pd_size_auto": [43], "wechat_enabled": [66], "wep_idx": [82], "width": [41], "wifi_caps": [16], "wifi_caps2": [16], "wifi_experience_average": [1], "wifi_experience_score": [1], "wifi_tx_attempts": [1, 10], "wifi_tx_attempts_total": [14], "wifi_tx_dropped": [10], "wifi_tx_dropped_total": [14], "wifi_tx_retries_percentage": [1, 10], "wired-rx_bytes": [10], "wired-rx_bytes-r": [10], "wired-rx_packets": [10], "wired-tx_bytes": [10], "wired-tx_bytes-r": [10], "wired-tx_packets": [10], "wired_rate_mbps": [1, 10, 11], "wlan_band": [82], "wlan_bands": [82], "wlanconf_id": [1, 3, 10, 11, 78], "wlangroup_id_na": [16], "wlangroup_id_ng": [16], "wpa3_enhanced_192": [82], "wpa3_fast_roaming": [82], "wpa3_support": [82], "wpa3_transition": [82], "wpa_enc": [82], "wpa_mode": [82], "x": [16], "x_aes_gcm": [16], "x_api_token": [66], "x_authkey": [16], "x_certificate_arn": [66], "x_certificate_pem": [66], "x_element_essid": [66], "x_element_psk": [66], "x_fingerprint": [16], "x_has_ssh_hostkey": [16], "x_iapp_key": [82], "x_mesh_essid": [66], "x_mesh_psk": [66], "x_mgmt_key": [66], "x_passphrase": [82], "x_password": [66], "x_pregenerated_dh_key": [66], "x_private_key": [66], "x_ssh_auth_password_enabled": [66], "x_ssh_bind_wildcard": [66], "x_ssh_enabled": [66], "x_ssh_hostkey_fingerprint": [16], "x_ssh_keys": [66], "x_ssh_md5passwd": [66], "x_ssh_password": [66], "x_ssh_sha512passwd": [66], "x_ssh_username": [66], "x_vwirekey": [16], "y": [16], "zoom": [41]}, "sources": [["unifi_list_accounts", "rest/account"], ["unifi_list_active_clients", "v2/api/site/{site}/clients/active"], ["unifi_list_alarms", "rest/alarm"], ["unifi_list_all_users", "stat/alluser"], ["unifi_list_anomalies", "stat/anomalies"], ["unifi_list_ap_groups", "v2/api/site/{site}/apgroups"], ["unifi_list_authorizations", "stat/authorization"], ["unifi_list_broadcast_groups", "rest/broadcastgroup"], ["unifi_list_channel_plans", "rest/channelplan"], ["unifi_list_client_dpi", "stat/stadpi"], ["unifi_list_clients", "stat/sta"], ["unifi_list_clients_history", "v2/api/site/{site}/clients/history"], ["unifi_list_country_codes", "stat/ccode"], ["unifi_list_current_channels", "stat/current-channel"], ["unifi_list_dashboard", "stat/dashboard"], ["unifi_list_device_configs", "rest/device"], ["unifi_list_devices", "stat/device"], ["unifi_list_devices_basic", "stat/device-basic"], ["unifi_list_dhcp_options", "rest/dhcpoption"], ["unifi_list_dns_records", "rest/dnsrecord"], ["unifi_list_dpi_apps", "rest/dpiapp"], ["unifi_list_dpi_groups", "rest/dpigroup"], ["unifi_list_dpi_stats", "stat/dpi"], ["unifi_list_dynamic_dns_entries", "rest/dynamicdns"], ["unifi_list_dynamic_dns_stats", "stat/dynamicdns"], ["unifi_list_elements", "rest/element"], ["unifi_list_events", "rest/event"], ["unifi_list_firewall_groups", "rest/firewallgroup"], ["unifi_list_firewall_policies", "v2/api/site/{site}/firewall-policies"], ["unifi_list_firewall_rules", "rest/firewallrule"], ["unifi_list_firewall_zones", "v2/api/site/{site}/firewall/zone"], ["unifi_list_gateway_stats", "stat/gateway"], ["unifi_list_guests", "stat/guest"], ["unifi_list_health", "stat/health"], ["unifi_list_heatmap_points", "rest/heatmappoint"], ["unifi_list_heatmaps", "rest/heatmap"], ["unifi_list_hotspot2_configs", "rest/hotspot2conf"], ["unifi_list_hotspot_operators", "rest/hotspotop"], ["unifi_list_hotspot_packages", "rest/hotspotpackage"], ["unifi_list_ips_events", "stat/ips/event"], ["unifi_list_known_rogue_aps", "rest/rogueknown"], ["unifi_list_maps", "rest/map"], ["unifi_list_media_files", "rest/mediafile"], ["unifi_list_networks", "rest/networkconf"], ["unifi_list_payments", "stat/payment"], ["unifi_list_port_forward_stats", "stat/portforward"], ["unifi_list_port_forwards", "rest/portforward"], ["unifi_list_port_profiles", "rest/portconf"], ["unifi_list_radius_accounts", "rest/radiusaccount"], ["unifi_list_radius_profiles", "rest/radiusprofile"], ["unifi_list_remote_user_vpn", "stat/remoteuservpn"], ["unifi_list_report", "stat/report/{interval}.{type}"], ["unifi_list_report_5min_ap", "stat/report/5minutes.ap"], ["unifi_list_report_5min_gateway", "stat/report/5minutes.gw"], ["unifi_list_report_daily_gateway", "stat/report/daily.gw"], ["unifi_list_report_hourly_gateway", "stat/report/hourly.gw"], ["unifi_list_report_monthly_ap", "stat/report/monthly.ap"], ["unifi_list_report_monthly_gateway", "stat/report/monthly.gw"], ["unifi_list_report_monthly_site", "stat/report/monthly.site"], ["unifi_list_report_monthly_user", "stat/report/monthly.user"], ["unifi_list_rogue_aps", "stat/rogueap"], ["unifi_list_routes", "rest/routing"], ["unifi_list_routing_stats", "stat/routing"], ["unifi_list_schedule_tasks", "rest/scheduletask"], ["unifi_list_sdn_status", "stat/sdn"], ["unifi_list_sessions", "stat/session"], ["unifi_list_settings", "rest/setting"], ["unifi_list_site_dpi", "stat/sitedpi"], ["unifi_list_spatial_records", "rest/spatialrecord"], ["unifi_list_spectrum_scans", "stat/spectrum-scan"], ["unifi_list_speedtest_results", "stat/report/archive.speedtest"], ["unifi_list_stat_alarms", "stat/alarm"], ["unifi_list_stat_events", "stat/event"], ["unifi_list_sysinfo", "stat/sysinfo"], ["unifi_list_tags", "rest/tag"], ["unifi_list_traffic_routes", "v2/api/site/{site}/trafficroutes"], ["unifi_list_traffic_rules", "v2/api/site/{site}/trafficrules"], ["unifi_list_user_groups", "rest/usergroup"], ["unifi_list_users", "rest/user"], ["unifi_list_virtual_devices", "rest/virtualdevice"], ["unifi_list_vouchers", "stat/voucher"], ["unifi_list_wlan_groups", "rest/wlangroup"], ["unifi_list_wlans", "rest/wlanconf"]]}')
+
+# Lowercased field name (as indexed in _TRIGRAM_INDEX) → field names
+_FIELD_NAMES_BY_TERM: dict[str, list[str]] = {}
+for _name in _FIELD_INDEX["fields"]:
+    _FIELD_NAMES_BY_TERM.setdefault(_name.lower(), []).append(_name)
+
+_FUZZY_MIN_SIMILARITY = 0.5
+
+
+def _trigrams(term: str) -> set[str]:
+    """Character trigrams of a term, padded like the generator's."""
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+_TRIGRAM_SIZES = [len(_trigrams(t)) for t in _TRIGRAM_INDEX["terms"]]
+
+
+def _fuzzy_terms(term: str, min_similarity: float = _FUZZY_MIN_SIMILARITY) -> list[tuple[str, float]]:
+    """Return indexed terms similar to term as (term, similarity), best first.
+
+    Similarity is the Dice coefficient of the trigram sets; a term that
+    contains the query as a substring scores at least 0.9.
+    """
+    grams = _trigrams(term)
+    shared: dict[int, int] = {}
+    for g in grams:
+        for i in _TRIGRAM_INDEX["trigrams"].get(g, []):
+            shared[i] = shared.get(i, 0) + 1
+    vocab = _TRIGRAM_INDEX["terms"]
+    scored = []
+    for i, n in shared.items():
+        candidate = vocab[i]
+        similarity = 2 * n / (len(grams) + _TRIGRAM_SIZES[i])
+        if len(term) >= 3 and term in candidate:
+            similarity = max(similarity, 0.9)
+        if similarity >= min_similarity:
+            scored.append((candidate, round(similarity, 3)))
+    scored.sort(key=lambda x: (-x[1], x[0]))
+    return scored
+
+
+def _rank_tools(query: str, limit: int = 10) -> tuple[list[dict], bool]:
+    """Rank tools for query by BM25; AND-match first, OR-match as fallback.
+
+    Query tokens missing from the index are replaced by their closest
+    indexed token (trigram similarity), so 'firewal' finds 'firewall'.
+    Returns (results, matched_all_terms). Ties break on tool name so the
+    order is deterministic.
+    """
+    terms = []
+    for t in _search_tokens(query):
+        if t not in _SEARCH_INDEX["postings"]:
+            close = [c for c, _ in _fuzzy_terms(t) if c in _SEARCH_INDEX["postings"]]
+            t = close[0] if close else t
+        if t not in terms:
+            terms.append(t)
+    postings = [_SEARCH_INDEX["postings"].get(t, []) for t in terms]
+    scores: dict[int, float] = {}
+    hits: dict[int, int] = {}
+    for plist in postings:
+        for doc, weight in plist:
+            scores[doc] = scores.get(doc, 0.0) + weight
+            hits[doc] = hits.get(doc, 0) + 1
+    matched_all = any(n == len(terms) for n in hits.values())
+    if matched_all:
+        scores = {d: s for d, s in scores.items() if hits[d] == len(terms)}
+    docs = _SEARCH_INDEX["docs"]
+    ranked = sorted(scores, key=lambda d: (-scores[d], docs[d]["name"]))
+    if limit:
+        ranked = ranked[:limit]
+    results = [
+        {"tool": docs[d]["name"], "description": docs[d]["description"],
+         "module": docs[d]["module"], "score": round(scores[d], 3)}
+        for d in ranked
+    ]
+    return results, matched_all
 
 
 @mcp.tool()
-async def unifi_search_tools(query: str) -> dict:
+async def unifi_search_tools(query: str, limit: int = 10) -> dict:
     """Search for UniFi MCP tools by keyword.
 
-    Returns matching tool names with descriptions. Use this to discover which
-    tools are available for a task instead of scanning all tool signatures.
+    Returns matching tool names with descriptions, best match first. Use this
+    to discover which tools are available for a task instead of scanning all
+    tool signatures.
 
     Examples: "vlan", "firewall", "client wifi", "switch port", "backup"
 
     Args:
         query: Search terms (e.g. "wifi clients", "firewall rules", "port").
-              Multiple words require all to match (AND logic).
+              Tools matching all words rank first; if none do, tools matching any word are returned.
+        limit: Max results (default 10, 0 = all).
+    """
+    if not _search_tokens(query):
+        return _format_response([], "No search terms provided")
+    results, matched_all = _rank_tools(query, limit)
+    note = None if matched_all or not results else "No tool matched every term; showing tools matching any term."
+    unloaded = sorted({
+        r["module"] for r in results
+        if r["module"] in _MODULE_APIS and r["module"] not in _LOADED_MODULES
+    })
+    if unloaded:
+        hint = f"Load module(s) {', '.join(unloaded)} with unifi_enable_module before calling their tools."
+        note = f"{note} {hint}" if note else hint
+    return _format_response(results, f"Tools matching '{query}'", note=note)
+
+
+@mcp.tool()
+async def unifi_enable_module(module: str) -> dict:
+    """Load a module's tools so they can be called.
+
+    With UNIFI_TOOL_LOADING=lazy only meta tools are listed at startup; use
+    unifi_search_tools to find a tool, then enable its module here. Clients
+    are notified that the tool list changed. Without lazy loading every
+    module is already loaded and this is a no-op.
+
+    Args:
+        module: One of device, client, wifi, network, firewall, monitor, admin, hotspot, advanced, global.
+    """
+    if module not in _MODULE_APIS:
+        return _tool_error(f"Unknown module '{module}'. Available: {', '.join(_MODULE_APIS)}")
+    if module in _LOADED_MODULES:
+        return _format_response({"module": module, "added": 0}, f"Module '{module}' is already loaded")
+    before = len(await mcp.get_tools())
+    _enable_module(module)
+    added = len(await mcp.get_tools()) - before
+    if not added:
+        return _format_response(
+            {"module": module, "added": 0},
+            f"Module '{module}' has no tools allowed by UNIFI_MODULES/UNIFI_READ_ONLY",
+        )
+    return _format_response({"module": module, "added": added}, f"Loaded {added} tools from module '{module}'")
+
+
+def _search_fields(query: str, limit: int = 20) -> list[dict]:
+    """Find field names similar to query and the list tools that return them."""
+    results = []
+    for term, similarity in _fuzzy_terms(query.strip().lower()):
+        for name in _FIELD_NAMES_BY_TERM.get(term, []):
+            for i in _FIELD_INDEX["fields"][name]:
+                tool, endpoint = _FIELD_INDEX["sources"][i]
+                results.append({"field": name, "tool": tool, "endpoint": endpoint, "similarity": similarity})
+    return results[:limit] if limit else results
+
+
+@mcp.tool()
+async def unifi_search_fields(query: str, limit: int = 20) -> dict:
+    """Find which tools return a given field, tolerating typos.
+
+    Searches the field names seen on a real controller (spec/field-inventory.json)
+    and returns each matching field with the list tool and endpoint that expose it.
+    Use it instead of listing everything to find e.g. 'satisfaction' or 'tx_retries';
+    then call the tool with fields=<field> to fetch only that column.
+
+    Args:
+        query: Field name or part of one (e.g. 'satisfaction', 'tx_retries', 'dhcp_opton').
+        limit: Max results (default 20, 0 = all).
     """
-    terms = query.lower().split()
-    if not terms:
+    if not query.strip():
         return _format_response([], "No search terms provided")
-    matches = [entry for entry in _TOOL_INDEX if all(t in entry["keywords"] for t in terms)]
-    results = [{"tool": m["name"], "description": m["description"], "module": m["module"]} for m in matches]
-    return _format_response(results, f"Tools matching '{query}'")
+    results = _search_fields(query, limit)
+    return _format_response(results, f"Fields matching '{query}'")
+
+
+# Field catalogue built by generator/field_catalogue.py: endpoints[i] =
+# [path, [[name, type, read_only, enum values, cross-ref tool], ...]];
+# tools[name] = i. Tool docstrings only point to unifi_describe_fields, and the
+# catalogue stays compressed until that tool is first called.
+_FIELD_CATALOGUE_Z = "eNrtXeuT2zaS/1dcum9btuPR2E4833J57O6dk73HplK7rhQLIiESGZJgAFAaJZX//boBkqIkdgMz4zi7e/YHJxZ+APFoNPoJ/LKSbdFp1Tq7unn3bmWkdZ+IWphm9RT+mali9XRlnVk9daaXT9/98HS1+uHpu5Xoxt+3orYnBVmhbFeLw7eikTSo0YWs6eKWqWzySu0kdmyjdX1RXggnnSKrb438CYpgxBdFymatLIWD1qnGb+VheUIaWxIfNKIQJssr0bbkiK1ykpxr22/swTrZEJWHwV6M6Af/dVzQolOl0X0XWVPnTFapopAtj2l1Bosn3XGWTkHM4tEDPfZW7iQO5R+U/IaFzLZGNxGI0wTg4SRa9jBDRLXfj3wBozRXxs1WAJBz9aitYfdkQQKdAIijEyhm6ITalVDUW2mIWjtprNItN18jZHnGjtuoEZH9nuvWwU7L3KEjKVHVkhkjFlv1MzXOSqqyoqi1Ftbh9Kqt8rx8qYGmeEXUZjqlt1srXVbLrSOaHRBOdwTAAnfLHX3EsDTJTGffKmo6+g47s621WKAXQ5HgXhWuIsp+1p6EmGOhlW6vzS3QwfYDnQyidzqzuahlBnS1qZlTvMq7IsOu1Sp3wH9kfqvakocntWmdMNQqjAjdcYDd66xobYaDYT8FuJQeAayWwkqGY4y4aN89hu192QsTnyndCNVy7C3SgLxz0rSinpHL+WlVNl1mW607ZlkVQPoN0CnVSAcDzmuFbEwUBVA1LIu1qmwbL0PQlSL99xhYCWm2IpdLLHLV6lauTvAR4jpiyAXyECOSegewzsitNEYWWa22HP0cKyhtlDucj6UCRn06FiBHBwszfEK2+cX4PfnPZQ/kXMv9rYFd1qKNDavBXRXBMCQ5sLNB0j3t7NvPv5362vWm0/ZiPLmGnw1IZqvjMRCZg6TzYAcjJ5ZllzApe4Dgvh1oB05bmvEcWTuMxCXwdWgIREaaC7iruyx35PETAKoAdo7Ep3vqxJWl35o4u0CqjXLZ7aaz9wJnUY6T130BW2F2qkHX8CO1spdf2WqzB05IytK6BklatyRJ10XXyCgjHWGtdmp7eAxxe7n+bHCXWJAwtirDAY9QG0SeoPIQjXdacsXvZx8A2zMNElO2yVH2i8zFOdzvTEJcm6DN/Vpu0lvu79dyH2+5y3CTjvO+2J4TZQnE49lEUzbUwbLTKn8gaRw5Bqphve2MRqE+wjZykMhAh0FNhNpe709kHECyUI6WKqtYf+ICyYOsFkGby3pbZrNeRJizBWm26GHMwt7GZnrgQYtmBgNaoLzrKF1S3sm8h47rtj7AX7l8ANvhR96VQDXA+4UppVue+tmoAxeJDbgGctghPc9Z8DKJAba+TsAV2abWXn2IbWBR7ARMVJFtpXC9kel4BTKO4QWmQtnQ2FS7libKU5CsWNHT61Si+LG3bjTTWNBtQXfqW2cOTLt6xGOnYXnsopwLDAWpOtiVTmrHe46YUrVIQknogaJSMFmle0MwV8RtRH7bdxm1SVbXL568eHL15A9P/rBaqFaIg403njCkAdmIu8xbS+KNoiT1My7wWYe/++sXx57uhKrx26ghO6NroKRp8cl9MFXaKtOA8COjVcYuAaXUuo+u4cagwacF6Y0Y5sZoUfijkdP6Jip+LamOTZBNDV0MkAiyFXFISUJo6SjXTYOGnQNZHsxsRxYxcaNOlFEWQxLwiyfXSL0z+s2BBejGn0HAQMlFLYQTmZHYKbQj3lPTO6uN1AqKst+NNgOhOnvVqBaOHRvsPJRBI9ZKAbR6eFwT+H+PbaOBxase24h2VZBMFmvLTV/CDtN1VMUp5Fb0tYsUw4LmPSr5IF9aPMTOl/Pzt2//8n0Gfx/XNJy4C0fNGYIUnlBDDdYcsnfK5hpkIxwhiQH9f9omHAjaAWE2H4/9QuWOUE7hxxq5WFQ8ntXxyjNK8VEr2b6tgaFRemwe1Vl9cSZALj04lVseF2mmyGCoeg//dUZsYXZicJg+WWqjaE4x+oaR/NuWWZNB+R5EN0YIP9XROf0cWJ4y1JYLhVnbNxtpeMxgcycQqIGhu60HvncgYGgBhFHfxlZzwu1R0SpZ79AWJlOajWhvs5lPbtyh//PVl59/8devvlydwjvYFsiqv4r04+x0p7pQa11kty0QMfB+7XSua5ICAbxP2RKDVQVmPTQ8aNgaDgTj9xX9BedNFD3NHUqg1704ZAlWwlLrMu5jKI2MfLK6Xl/HICDyTHbV2AaoQK47dDoq9FfAuRnqqYLZgJNpjhBSplF500XsdgmmPdXZJdvRpbbzI2xWvTUwqtjoL7zUlxuiFgfoUqrMUicY6tC61nfombd8W7pERpsNYh1Jz41stAG9u4PpUz8zRm/VqqZvst5PV1YVme1ETjG+M7SNoGmptbEWZHrRdOxgG5AnVIcfUijRPdo2nw0yCrlBRhxKCkYV9E5qgV0EY0t2dSEZP+83rXveQR+fA+65NuVqod76vN5VWr3r83rrtHovL1RQpp7eoi8YzvTc6/HM2Tsi6/WkWMSgNq9IyECv1Lx7WTbCEjphLaxidM914oBuuihMG/JLUCRgL3rFh9tlF0Av7KLEHoTIzMm7c/Pq6n99GMCTv4Eg/+QU/qSRrtJH3nbZ/KYEDlHrC63t3168ePXVl2/4mqpJUAyZmk7R59VitWW7D3afqabviCF+7f9EqtYKZJ+l+nw1Dewu6NpJ9ODrBNP2vaogOZALiH+40fXOAUVRtV9H5ibUXqLHt7pUbVrVh65MLdqyBxIi+e5CFWohEwYLh6m+P537WqDcqgXj+CqX6LWPfZOJWrqsYfs8R4/k0pp8L+tcN/KJ00++a9XX6skfMULvyZ+0syDnMd1gVmkNUuf6NVdXufrSPni/z2ubvO/2YYzvYfxpSx2RfgcU+l1myOUGu6hWASIkCCWqxXWOGM5AS9qBTEIyLPTmnJlaNl+Xm+rP+d//vXxz+82b/Js6t9VP3/7FvNVv/1usf1ydBEGSHw6lPhpKlb1hvR2B2QVvFBOKNsAiC3LiFIx5FYcmB3TwOxuZS5SsYZJBGc9pcXkERHs04irnunhrTicC6Rg7UDGMtBXnzEX/llEYMTiEK13IpDRynYy8ppDWKsrLDAJ+jcbdJQ2tEvYY9DMhOZ+1bIv4Sg7SLm5LkqDvaXO2KraL+ciDTsIsxlSPgIoqHjDZxcU2f/WFFH/+4j9v7fW3zfc//8d/fff3W/ld+0ezVd++Lf/0t+NArMbzR7XxSIKwDCefAfF9NY8fGCKBz2EGyo64vvNmlxBEMMZGLX9zr1xeZd5Ih+3SU3BA6UbfBsvhcluHlrQ/urxDd5KNWRaOuL1QLgEMOwYmVdnKH5ExNPD81IZ9rDIakeNQnBvYHrtEqPUB2FGo9ymkdFbCLsa4qeB2vdhUINzV4igcubjRzVXKzpyMiTD4fm4OHTIvjD4ga+GwgF8AIWUdejBDJCcSf/RoGibivu4rwrs6Feset0DIQFn+cL9Redb3pA+hL7osRUtGHNSXookBy/01LH67jk1JOIsHV00jWpDjU/TrUE0VXRpwlJKi6M5rBkuq5WDJXc2gtBul79p4zxDTCpd1TRrW+8gkG3x15K6LoZtIKJ7Q+ehNmVciugLoMGjioaB3megUiDS3kgoJAo1cGhdcYzITJg3Xkfkzd5msBxpaOPcuUZci8BHToBDFN+MhbBtl4xYcJkfAaHqiAUaWspUo5YBIUPGNGbXD+eEwFnrsZe0FoxddY6NAktqrushDCCqx3AiN0gSCoIfkaR0QTfHK95DvV3T6EGQr8epqndAa5jlRetwxLixkQ3FBYd513LZengdOCcdDQ2XubBVIP7C7JbVvI7olnGJjit1y5L2FZTOMGwElBR8TjcZCMibEw4YxofXx6A9ND+ml2mBG56uojivlUvk8gJlbXz6w/UbkXCsDKtbXAWZko5FP0YZg+nPjtDQSfcU2iMCc41n36oFhoGZsm11EBIZehHXcg2DORCWcbpR/kDTen/QQn49xbRgGQSzLCa4n0+0SkoLHWYrlBbPrO1uF/aQO2dOajM9skw3aFBMBlw8BLNFQuQnIBa9t0OpoRDuZOpfjUIArhli5xQAjLGVG5cu9I5ms7T1KixEUscCUKoTHKu0enim2DSEEokkI4A1raGQ4shcPAGDN2SCFEL53b7pc+z0ZS8QSXVTejB0p9TqLZpsAe0ukqxmSI6wZrNO1yqmDysdvDMuYlL7VGX13GIzH5MePQM5DrVrPOlqRiWKH4qod7VOWcaaPdUJUnhff6FSjGT42uBFZPqA35T17U6b2Jjkzp6n147339846avW6rH7OwonKupuRQ4S4qVGi2QXpiXAcW9tVRtiQCzcJ9CS+2bLpT4Ocj1HwlcB0Sk6eXkZHXRue3IXpeFM7EEqiUR4lrKB5JMMxYUI2HUaGHuX8hDpbbRpBJR9ZIcdzlDIXAiIodcvFQzZMrBzIAwZbRNwfY/Drb5rK1ovORqMbHi4QSqxyRzAJL7hsREudllM5uR77Tlxn09F89WZNmiUQOD99WeAgG7GYuCwDMDQeUoODUmYjg96FB3LMQBBYBy9s4zTeT9jm8tc+UCLcwy/eQZPrx3uf/oXufRoWtP5Xt660fV1/NK98NK88yrwSNkurG1F7n+Y7dJXhv0i1iJyPaQsx6bD+c3lIKXvH5pYlREKzBtbwpd6ApOOeTawIh7fNqbyZ+2TfvZbZ1esXKbDrdRLsZRLqsySUagvto6uiSN27VGhn8yhMgFT1IqGPgFunTB/gXqbMH+AwqCz124hN/T5iU2cJ4KnQlJxMkURiAFu/TIKloT5LQhVbmwJLpERAJk9cmQBJGmqZ3Lsy2ruFIKPPXh5DZSvV0uE374XVgfZcbbT3qSGTU8ZHGIhdSd6tVhjddaAGeXMKBzTS+TiFOPAu2xyctM+mxLSz++Hoa5pcrOpdNnbDaSdqsg/ekgJo0BlQ4U+Fj5PBoGdz7eMMeNkSJIz5cM90iUJ3jLwUium4PF/us2D2FehWw7UAzFUNunPR4kxQItAI2ByGMBWuW8rHfzcdqnP0J48Cx/IXW93SVnGB6UfAMdyQULuc8o86kwMJ9jIN+KhWRq3c3prgZEhe5/wjeB+BIM2bfmMCAe+o8oMj5yJsi4ItNUeKPbvoclsuh8rNUvS3qhxFfFIwGrQkny7KSfrnwEGwZqAc4SXqMRSWu8o23BCSDXx7+eMeggie0nIMowalDCPHaRKIZrA7oTBZz4c/WjKzOykZPYShsp2echS5nPXoAo2Z7XhTkxJUn4JxxPMrnhgfkIOOShzeNIZqIX3tw4hkp2SK5IHtzmiZEgPcMCiZbyzu21N3OLVdNl1O8ugM5P2ao8Dt/pov5krHDGR6Xrx541nbN0jC3B3Oz1AvTQFmtyq/tSyCiwir0J/gqivS2wnlW9FyxbaT4pYO/UQIShnoggnHDAWraDoIVwX/uf0GDkx/VcayoOKdt3mVcffeVuwSqha9GTTvHsppscNfChpuJCXu5mTu9iRTsS0memKOkb9vgbaPoZ+Ypv37pFgbvPeJ50QhhT96ev6e1rY0cxl1kNSzgH/qKzMIm654Ccyi1yF5dizK0njrs24jjjTP4lmGW2vMT6UdNTTjakTbb4UXFE1YuWU7YEfvYR+9Cdws24loUARid9exU8aHe0aFnkaBmDxsa9ycOzhwrARiKiyTF0/tb1+G9/dI7DbR+xFTM/n/AwbVAFgT5mRjHe93bhoUMRj+DBlUdi+2x2gdiyvJEpC/MCWaI+NRLKF2eg8rb3VvQJBLOdY70BsyVIg2vT1kY3rMYv4mZukhu+Jktp96OFX9tTZTW4scwuMCLHIFzvCMATfoGSTkOJBAvEfGzX3dy1ln0DsvdbLsGTMyIvfqjSYL6kOjWaIg08y20t90hdEYkW9ZGJLdThdbLjaH850wn7ElwcwSQbreQhoDw32sdD3D7mwFVP7QqzNtrRo4WDlJxbZN51NqRE7GXiAk8Hxy+UF6g/2FPCI2W8i9MT4fU8jZacc7zrOjYtSoGnDkPbcIPlGk4vjhFkTOFYn7h9q0HHfw9+4u34IeT607S6rzAUuvaUofg0Uzsc0zOOPZnLoxT2921VPW1JFcvYF8lmcBg5KMgV3JERmARlZEtUJKA1CGt+HQ4RbBff2M/YC3Nfr4YLnd+sAv9ETuyWu9jvg4qrcw+SNsWaMA2SLrKh9JhoY7MtuM55AuxiHZR0GiUcUzCNCRsCTnDLyXU6PH21MjZwsvNw9+40J2XgujG+AZyalxeCF8KqIfe0iCHo3yKNsRfrfvMCYhcueax0Q+4iHRvoQgSHrHTuVrJkBs9JQHBxsVJnZEUTEsd+S+ucuEtFmZN0yyWu8qLhRrxulIjLc/wMGEgSWhLSYLagAlNexXg+7dIc378WwjLF60+C7qX4iZGkGZmKxLTFIioysxOg0npTBnJcW0jrOQ8lRbAfoZGfD18Rm3exiQ0LUeJpOKnvr4/tvH99/GvQmafI3H87tgIjjyJ8qIIDqmcMa/GMgk5DOwkfbJ8j1TGBKJqNJOtoUik5W8kMA1PqwLqwITnnmc8f7i4sjhFtRVckQn95XjyhqJsuAnv4yGoV+f/4Ks+tdprRlzEGX6odVc5SKHgNGwpLHHBkVJ7QbRMTo4E+i+YVLJN9Qyh9vBMoY1HzndYsIb81E+wlgUlc4Z1u1nkSnHqyLZuFjGFN5qZSVpIFQP5uoM+ws0mjFckLm2CIsymmJiOR6qbElraUocvC3aEJg5vHmwu7hRZG9XFx588gL/wavB3J4duQzYy8B6vJ6dxOzlxjiOxMJ4Uu6bRnorGvrSrBI0F8kEaiffc+QvU1mY4c6Mt2vOliUYp6IZwDQ3EdCvnKPJiFZc7ofGF6POY8HvHVXxsWHxTHR26M7iV+9/FIw5uMNC0OZr3lhyZgFe1i/noCHcbrGtPWfA3XOhN5xJZ0Z0eJSyIW7j6mFkWC86IjXnFObFkEXYxMqPzS2IG2ewo1SzGH7HNzXDUO0kRaoNlzfRAWuP2pnI/LThrvhl5YFIgFj+MGlgKP1+iEZgIFPEwnJUVFrYU5WjgMvyr/RcHgnnKz6PcoxeIo8nTuZ5ZEbQWDy4AinWWdT866a0xnx1ZR6amA/lTa0/3gTzz5WqhAEyeFtfjKFEU5oiCU/0O4L3zYjipPOWjB2h5Xbv8LBiFw0CwttZwu0PoPvD/PI55A9XBTzAPzHCCBbhvboH6AqJvmuS+RtMCs5vwwOGRBPcpagJ/uxLWWbZ1zbHtXqf0pyRtKpzhqPdRg/UmAY7GuMFShTPOJdaSqrE4roCosmZ6vyiu4h/kaWJY54GDzhkm9543k2TftRJNjEYn3HQO/LqOQ9WXOnDEizPck04v9UxxySCGtNcOmnQZBNsAVTyCpzCzyJs4BREE82E46kjwFzKN13iN13SN4fbtOg7ZJLTXdGx3271mOzaHhrdn1zhSgvy01uVpCjeq/rikmQBq5hdvXj+4vnV6zXmg376mnpUkHl98+Pzg7/F84NjLtfpiu3xAtFT4MIr1Eswb0GLo+758mSotGRAP299eAgRT67Z24bHOzr9y7vxV9dOHnSLW72ORrjYZSjR971cZ7nDMTzz0ghA4TMI03Nnw6XPhIfZh8hyrXaZKAr6DW3/RhbeZ3s+czBaaZ75m54TXM5TlPTQI5yM2IsQbngunYz5hFVG/hUJhRzuWDpqyaaPxMRpFI2ZIECnT16Jjk1LyuO+82ifgXpZAeESzt38Ft44i+fbDLjxjUvuPmVGQCGuqB+PgZmJd7f+RHTqE9yzn/yCf/8K/x7j4T/IfZfTxdl0DhWy0+NNlPcL56ZGGexm9hORB8/9uwR7229tSsN3xB5maXukKY3N7HmvdjL0/XNaK2/1mgcYLXbi0VflFO/fFja+DwvSwU7ZXuC777o0ouHu9voAVrKP5q8Pb/7CqPHaP6VqZJ7wVh8TeKYa/eFsZfG1Zc1pmnHUvgeL2m9tJ8MTWTUbgUcQ6Vf/QMa0BT/RY01pDzdDLYXfJNqZRElS231sUMvXdTS5xftV5N0j7FDm/hGaZ4+BRJ7ooPd2zPiU+fxt1XF3YP4GJqedMg6Pr/PXYlPe2cjkXYcvzuCFxgLfoyfDTM7RoDQYGbFbJRrB7mveei9mH0b2rBQqMgcvfEaEP16MSxCsflfh6aMQ9P9CCHpvws0DnHkPkjB+l9Pttz48/gnPh/fCa+E/Dpq3q5tfhl7mRnpjSqeGJ/hurp6eFjUCfrw++3H0RN+8PCvwsZXDQ5urm1dnpacPca5uXp+VTzdqO2Gh8U/Pin0Y9M2bhV+nzr84K8QpgZ+vFn6e6qyfTmSFRpjFyRiKTidj+PFyMoYCYjKGUnIyhnJqMobi5WEPhefDnv18OexSusUx4++nA8ZfLkeLvxJDxSJynFhIDdKXBSv86uaz+a9nRDD+dDkVWHI+D+Nvl5Pgt2uwdA0BY7BLrl+cFuM11PDz+a8+n9NAwdXL05LJWnZz9eq0pBu5ws36zUnJ9O31p0u/Z6NAdHN9dVo+uzILv/f6tDTctDpmyyDgtPnj/YQ3V5+dlsjw9PDN1Zul37OQaHazPp2UiZ7sjKB8ic/MwvGd/DrkhNysT39GR8KM/k6li5vT2Z6ToJ3R4OITwDen8xOCwuHzp5/yoe+Z78P69GMndGtnhBtKi3B7Q48VTzsyhajerF+fFXhqtzNyD79DOxPlXV1flk0TejrPoxv1Zv0ZeSTNdstUZmeb6+JBovMNg2V2vsFG4/wCOxmKTjnK8OMlUxkKCL4ylJKsZSinuMtYfMFghoIzHjP79ZLNDIXnnGb285HZ/Prr/wGB/v2z"
+_field_catalogue_cache: dict | None = None
+
+
+def _field_catalogue() -> dict:
+    """Decompress the field catalogue on first use."""
+    global _field_catalogue_cache
+    if _field_catalogue_cache is None:
+        _field_catalogue_cache = json.loads(zlib.decompress(base64.b64decode(_FIELD_CATALOGUE_Z)))
+    return _field_catalogue_cache
+
+
+def _describe_fields(tool: str, filter: str = "") -> tuple[str, list[dict]] | None:
+    """Return (endpoint, field descriptions) for tool, or None if it has no catalogue entry.
+
+    filter is a comma-separated list of case-insensitive substrings; a field
+    is kept if its name contains any of them.
+    """
+    catalogue = _field_catalogue()
+    if tool not in catalogue["tools"]:
+        return None
+    endpoint, rows = catalogue["endpoints"][catalogue["tools"][tool]]
+    needles = [n.strip().lower() for n in filter.split(",") if n.strip()]
+    fields = []
+    for name, ptype, read_only, enum_values, see in rows:
+        if needles and not any(n in name.lower() for n in needles):
+            continue
+        field: dict[str, Any] = {"field": name, "type": ptype, "read_only": read_only}
+        if enum_values:
+            field["enum_values"] = enum_values
+        if see:
+            field["see"] = see
+        fields.append(field)
+    return endpoint, fields
+
+
+@mcp.tool()
+async def unifi_describe_fields(tool: str, filter: str = "") -> dict:
+    """Describe the fields a tool returns or accepts.
+
+    Returns each field's type, whether the controller sets it (read_only),
+    observed enum values, and for ID fields the tool that lists the objects
+    they refer to. Tool docstrings point here instead of listing every field.
+
+    Args:
+        tool: Tool name (e.g. 'unifi_list_devices', 'unifi_update_wlan').
+        filter: Comma-separated parts of field names to keep (e.g. 'vlan,poe'). Empty = all fields.
+    """
+    described = _describe_fields(tool.strip(), filter)
+    if described is None:
+        return _tool_error(
+            f"No field catalogue for '{tool}'. Use unifi_search_tools to find a list, get, create or update tool."
+        )
+    endpoint, fields = described
+    summary = f"{len(fields)} fields of {tool} ({endpoint})"
+    if filter.strip():
+        summary += f" matching '{filter}'"
+    return _format_response(fields, summary)
 
 
 # ---------------------------------------------------------------------------
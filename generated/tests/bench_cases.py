@@ -0,0 +1,213 @@
+"""Benchmark cases for the generated tools (auto-generated).
+
+Rendered alongside the tests in this directory, from the same tool
+contexts, and run by bench_tools.py. One case per tool:
+
+    (family, tool, arguments, cleanup tool or None)
+
+Families are list (REST and stat listings), get, create, cmd, v2 and
+overview. Argument placeholders are filled in by the runner:
+
+    "{id:<tool>}"      _id of the first record <tool> returns
+    "{mac:<tool>}"     mac of the first record <tool> returns
+    "{unique}"         a fresh suffix per call (create payloads)
+    "{default_network_id}"  same as {id:unifi_list_networks}
+
+A create case's cleanup tool deletes what it created, untimed, so
+repeated calls do not grow the dataset.
+
+DO NOT EDIT THIS FILE. All changes must be made in the generator.
+"""
+
+from __future__ import annotations
+
+CASES: tuple[tuple[str, str, dict, str | None], ...] = (
+    # --- REST ---
+    ("list", "unifi_list_accounts", {}, None),
+    ("get", "unifi_get_account", {"id": "{id:unifi_list_accounts}"}, None),
+    ("create", "unifi_create_account", {"data": {'name': 'test_account_{unique}', 'x_password': 'testpassword'}, "confirm": True},
+     "unifi_delete_account"),
+    ("list", "unifi_list_broadcast_groups", {}, None),
+    ("get", "unifi_get_broadcast_group", {"id": "{id:unifi_list_broadcast_groups}"}, None),
+    ("list", "unifi_list_channel_plans", {}, None),
+    ("list", "unifi_list_device_configs", {}, None),
+    ("list", "unifi_list_dhcp_options", {}, None),
+    ("get", "unifi_get_dhcp_option", {"id": "{id:unifi_list_dhcp_options}"}, None),
+    ("list", "unifi_list_dns_records", {}, None),
+    ("get", "unifi_get_dns_record", {"id": "{id:unifi_list_dns_records}"}, None),
+    ("list", "unifi_list_dpi_apps", {}, None),
+    ("get", "unifi_get_dpi_app", {"id": "{id:unifi_list_dpi_apps}"}, None),
+    ("list", "unifi_list_dpi_groups", {}, None),
+    ("get", "unifi_get_dpi_group", {"id": "{id:unifi_list_dpi_groups}"}, None),
+    ("list", "unifi_list_dynamic_dns_entries", {}, None),
+    ("get", "unifi_get_dynamic_dns", {"id": "{id:unifi_list_dynamic_dns_entries}"}, None),
+    ("create", "unifi_create_dynamic_dns", {"data": {'host_name': 'test_{unique}.example.com',
+ 'login': 'testuser',
+ 'service': 'dyndns',
+ 'x_password': 'testpass'}, "confirm": True},
+     "unifi_delete_dynamic_dns"),
+    ("list", "unifi_list_elements", {}, None),
+    ("list", "unifi_list_firewall_groups", {}, None),
+    ("get", "unifi_get_firewall_group", {"id": "{id:unifi_list_firewall_groups}"}, None),
+    ("create", "unifi_create_firewall_group", {"data": {'group_members': ['192.168.1.0/24'],
+ 'group_type': 'address-group',
+ 'name': 'test_fwgroup_{unique}'}, "confirm": True},
+     "unifi_delete_firewall_group"),
+    ("list", "unifi_list_firewall_rules", {}, None),
+    ("get", "unifi_get_firewall_rule", {"id": "{id:unifi_list_firewall_rules}"}, None),
+    ("create", "unifi_create_firewall_rule", {"data": {'action': 'drop',
+ 'dst_address': '',
+ 'dst_firewallgroup_ids': [],
+ 'dst_networkconf_id': '',
+ 'dst_networkconf_type': 'NETv4',
+ 'enabled': True,
+ 'ipsec': '',
+ 'logging': False,
+ 'name': 'test_fwrule_{unique}',
+ 'protocol': 'all',
+ 'protocol_match_excepted': False,
+ 'rule_index': 4000,
+ 'ruleset': 'WAN_IN',
+ 'src_address': '',
+ 'src_firewallgroup_ids': [],
+ 'src_mac_address': '',
+ 'src_networkconf_id': '',
+ 'src_networkconf_type': 'NETv4',
+ 'state_established': True,
+ 'state_invalid': False,
+ 'state_new': True,
+ 'state_related': True}, "confirm": True},
+     "unifi_delete_firewall_rule"),
+    ("list", "unifi_list_heatmaps", {}, None),
+    ("get", "unifi_get_heatmap", {"id": "{id:unifi_list_heatmaps}"}, None),
+    ("list", "unifi_list_heatmap_points", {}, None),
+    ("get", "unifi_get_heatmap_point", {"id": "{id:unifi_list_heatmap_points}"}, None),
+    ("list", "unifi_list_hotspot2_configs", {}, None),
+    ("get", "unifi_get_hotspot2_config", {"id": "{id:unifi_list_hotspot2_configs}"}, None),
+    ("list", "unifi_list_hotspot_operators", {}, None),
+    ("get", "unifi_get_hotspot_operator", {"id": "{id:unifi_list_hotspot_operators}"}, None),
+    ("list", "unifi_list_hotspot_packages", {}, None),
+    ("get", "unifi_get_hotspot_package", {"id": "{id:unifi_list_hotspot_packages}"}, None),
+    ("list", "unifi_list_maps", {}, None),
+    ("get", "unifi_get_map", {"id": "{id:unifi_list_maps}"}, None),
+    ("list", "unifi_list_media_files", {}, None),
+    ("get", "unifi_get_media_file", {"id": "{id:unifi_list_media_files}"}, None),
+    ("list", "unifi_list_networks", {}, None),
+    ("get", "unifi_get_network", {"id": "{id:unifi_list_networks}"}, None),
+    ("create", "unifi_create_network", {"data": {'name': 'test_network_{unique}',
+ 'purpose': 'vlan-only',
+ 'vlan': 999,
+ 'vlan_enabled': True}, "confirm": True},
+     "unifi_delete_network"),
+    ("list", "unifi_list_port_profiles", {}, None),
+    ("get", "unifi_get_port_profile", {"id": "{id:unifi_list_port_profiles}"}, None),
+    ("create", "unifi_create_port_profile", {"data": {'forward': 'customize',
+ 'name': 'test_portprofile_{unique}',
+ 'native_networkconf_id': '{default_network_id}'}, "confirm": True},
+     "unifi_delete_port_profile"),
+    ("list", "unifi_list_port_forwards", {}, None),
+    ("get", "unifi_get_port_forward", {"id": "{id:unifi_list_port_forwards}"}, None),
+    ("create", "unifi_create_port_forward", {"data": {'dst_port': '9090',
+ 'fwd': '192.168.1.100',
+ 'fwd_port': '8080',
+ 'name': 'test_portforward_{unique}',
+ 'proto': 'tcp_udp'}, "confirm": True},
+     "unifi_delete_port_forward"),
+    ("list", "unifi_list_radius_accounts", {}, None),
+    ("get", "unifi_get_radius_account", {"id": "{id:unifi_list_radius_accounts}"}, None),
+    ("list", "unifi_list_radius_profiles", {}, None),
+    ("get", "unifi_get_radius_profile", {"id": "{id:unifi_list_radius_profiles}"}, None),
+    ("create", "unifi_create_radius_profile", {"data": {'auth_servers': [{'ip': '192.168.1.200', 'port': 1812, 'x_secret': 'secret'}],
+ 'name': 'test_radius_{unique}'}, "confirm": True},
+     "unifi_delete_radius_profile"),
+    ("list", "unifi_list_known_rogue_aps", {}, None),
+    ("list", "unifi_list_routes", {}, None),
+    ("get", "unifi_get_route", {"id": "{id:unifi_list_routes}"}, None),
+    ("list", "unifi_list_schedule_tasks", {}, None),
+    ("get", "unifi_get_schedule_task", {"id": "{id:unifi_list_schedule_tasks}"}, None),
+    ("list", "unifi_list_spatial_records", {}, None),
+    ("get", "unifi_get_spatial_record", {"id": "{id:unifi_list_spatial_records}"}, None),
+    ("list", "unifi_list_tags", {}, None),
+    ("get", "unifi_get_tag", {"id": "{id:unifi_list_tags}"}, None),
+    ("create", "unifi_create_tag", {"data": {'member_table': [], 'name': 'test_tag_{unique}'}, "confirm": True},
+     "unifi_delete_tag"),
+    ("list", "unifi_list_users", {}, None),
+    ("get", "unifi_get_user", {"id": "{id:unifi_list_users}"}, None),
+    ("list", "unifi_list_user_groups", {}, None),
+    ("get", "unifi_get_user_group", {"id": "{id:unifi_list_user_groups}"}, None),
+    ("create", "unifi_create_user_group", {"data": {'name': 'test_usergroup_{unique}'}, "confirm": True},
+     "unifi_delete_user_group"),
+    ("list", "unifi_list_virtual_devices", {}, None),
+    ("list", "unifi_list_wlans", {}, None),
+    ("get", "unifi_get_wlan", {"id": "{id:unifi_list_wlans}"}, None),
+    ("list", "unifi_list_wlan_groups", {}, None),
+    ("get", "unifi_get_wlan_group", {"id": "{id:unifi_list_wlan_groups}"}, None),
+    ("create", "unifi_create_wlan_group", {"data": {'name': 'test_wlangroup_{unique}'}, "confirm": True},
+     "unifi_delete_wlan_group"),
+    # --- stat ---
+    ("list", "unifi_list_stat_alarms", {}, None),
+    ("list", "unifi_list_all_users", {}, None),
+    ("list", "unifi_list_anomalies", {}, None),
+    ("list", "unifi_list_authorizations", {}, None),
+    ("list", "unifi_list_country_codes", {}, None),
+    ("list", "unifi_list_current_channels", {}, None),
+    ("list", "unifi_list_dashboard", {}, None),
+    ("list", "unifi_list_devices", {}, None),
+    ("list", "unifi_list_devices_basic", {}, None),
+    ("list", "unifi_list_dpi_stats", {}, None),
+    ("list", "unifi_list_dynamic_dns_stats", {}, None),
+    ("list", "unifi_list_stat_events", {}, None),
+    ("list", "unifi_list_gateway_stats", {}, None),
+    ("list", "unifi_list_guests", {}, None),
+    ("list", "unifi_list_health", {}, None),
+    ("list", "unifi_list_ips_events", {}, None),
+    ("list", "unifi_list_payments", {}, None),
+    ("list", "unifi_list_port_forward_stats", {}, None),
+    ("list", "unifi_list_remote_user_vpn", {}, None),
+    ("list", "unifi_list_report", {}, None),
+    ("list", "unifi_list_report_5min_ap", {}, None),
+    ("list", "unifi_list_report_5min_gateway", {}, None),
+    ("list", "unifi_list_speedtest_results", {}, None),
+    ("list", "unifi_list_report_daily_gateway", {}, None),
+    ("list", "unifi_list_report_hourly_gateway", {}, None),
+    ("list", "unifi_list_report_monthly_ap", {}, None),
+    ("list", "unifi_list_report_monthly_gateway", {}, None),
+    ("list", "unifi_list_report_monthly_site", {}, None),
+    ("list", "unifi_list_report_monthly_user", {}, None),
+    ("list", "unifi_list_rogue_aps", {}, None),
+    ("list", "unifi_list_routing_stats", {}, None),
+    ("list", "unifi_list_sdn_status", {}, None),
+    ("list", "unifi_list_sessions", {}, None),
+    ("list", "unifi_list_site_dpi", {}, None),
+    ("list", "unifi_list_spectrum_scans", {}, None),
+    ("list", "unifi_list_clients", {}, None),
+    ("list", "unifi_list_client_dpi", {}, None),
+    ("list", "unifi_list_sysinfo", {}, None),
+    ("list", "unifi_list_vouchers", {}, None),
+    # --- cmd (the commands the tests run) ---
+    ("cmd", "unifi_list_backups", {}, None),
+    ("cmd", "unifi_get_speedtest_status", {}, None),
+    ("cmd", "unifi_locate_device", {
+        "mac": "{mac:unifi_list_devices}",
+        "confirm": True,
+    }, None),
+    ("cmd", "unifi_unlocate_device", {
+        "mac": "{mac:unifi_list_devices}",
+        "confirm": True,
+    }, None),
+    ("cmd", "unifi_check_firmware_update", {}, None),
+    ("cmd", "unifi_archive_all_alarms", {
+        "confirm": True,
+    }, None),
+    ("cmd", "unifi_get_admins", {}, None),
+    # --- v2 ---
+    ("v2", "unifi_list_ap_groups", {}, None),
+    ("v2", "unifi_list_active_clients", {}, None),
+    ("v2", "unifi_list_clients_history", {}, None),
+    ("v2", "unifi_list_firewall_policies", {}, None),
+    ("v2", "unifi_list_firewall_zones", {}, None),
+    ("v2", "unifi_list_traffic_rules", {}, None),
+    ("v2", "unifi_list_traffic_routes", {}, None),
+    # --- overview ---
+    ("overview", "unifi_get_overview", {}, None),
+)
@@ -48,9 +48,9 @@ class TestGlobalStatsites:
 class TestGlobalStatus:
     """Tests for the global status endpoint."""
 
-    def test_status_no_auth(self, controller_url):
+    def test_status_no_auth(self, controller_url, controller_transport):
         """Verify status endpoint works without authentication."""
-        with httpx.Client(verify=False, timeout=10.0) as client:
+        with httpx.Client(verify=False, timeout=10.0, transport=controller_transport) as client:
             resp = client.get(f"{controller_url}/status")
             assert resp.status_code == 200
             data = resp.json()
@@ -1,4 +1,4 @@
-"""Validation tests for the generated server.py (auto-generated).
+"""Validation tests for the generated server.py and unifi_tools/ (auto-generated).
 
 These tests catch generator bugs — syntax errors, duplicate parameters,
 duplicate function names — that would prevent the MCP server from loading.
@@ -16,15 +16,40 @@ from pathlib import Path
 
 
 SERVER_PATH = Path(__file__).parent.parent / "server.py"
+TOOL_MODULE_PATHS = sorted((Path(__file__).parent.parent / "unifi_tools").glob("*.py"))
+SOURCE_PATHS = [SERVER_PATH, *TOOL_MODULE_PATHS]
+
+
+def _table_rows(tree: ast.Module) -> list[tuple]:
+    """Rows of the module-level tool tables (_V1_TOOLS / _V2_TOOLS)."""
+    rows: list[tuple] = []
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id in ("_V1_TOOLS", "_V2_TOOLS") for t in node.targets
+        ):
+            rows.extend(ast.literal_eval(node.value))
+    return rows
 
 
 class TestServerSyntax:
-    """Verify generated/server.py is syntactically valid Python."""
+    """Verify generated/server.py and the tool modules are valid Python."""
 
     def test_server_compiles(self):
-        """Compile server.py — catches SyntaxError including duplicate params."""
-        source = SERVER_PATH.read_text()
-        compile(source, str(SERVER_PATH), "exec")
+        """Compile every file — catches SyntaxError including duplicate params."""
+        for path in SOURCE_PATHS:
+            compile(path.read_text(), str(path), "exec")
+
+    def test_tool_modules_generated(self):
+        """Every module listed in server._MODULE_APIS has a tool module file."""
+        tree = ast.parse(SERVER_PATH.read_text())
+        modules = next(
+            ast.literal_eval(node.value)
+            for node in tree.body
+            if isinstance(node, ast.AnnAssign) and getattr(node.target, "id", "") == "_MODULE_APIS"
+        )
+        names = {path.stem for path in TOOL_MODULE_PATHS}
+        missing = [m for m in modules if m != "global" and m not in names]
+        assert not missing, f"Tool modules without a unifi_tools/ file: {missing}"
 
     def test_no_duplicate_parameters(self):
         """Every function must have unique parameter names.
@@ -33,20 +58,19 @@ class TestServerSyntax:
         explicit check catches them.  This test gives a better error message
         than compile() by naming the offending function.
         """
-        source = SERVER_PATH.read_text()
-        tree = ast.parse(source)
-
         errors: list[str] = []
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                params = [arg.arg for arg in node.args.args]
-                seen: set[str] = set()
-                for p in params:
-                    if p in seen:
-                        errors.append(
-                            f"line {node.lineno}: {node.name}() has duplicate parameter '{p}'"
-                        )
-                    seen.add(p)
+        for path in SOURCE_PATHS:
+            tree = ast.parse(path.read_text())
+            for node in ast.walk(tree):
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    params = [arg.arg for arg in node.args.args]
+                    seen: set[str] = set()
+                    for p in params:
+                        if p in seen:
+                            errors.append(
+                                f"{path.name}:{node.lineno}: {node.name}() has duplicate parameter '{p}'"
+                            )
+                        seen.add(p)
 
         assert not errors, (
             "Duplicate parameters found in generated server:\n"
@@ -54,19 +78,27 @@ class TestServerSyntax:
         )
 
     def test_no_duplicate_function_names(self):
-        """Every top-level function name must be unique."""
-        source = SERVER_PATH.read_text()
-        tree = ast.parse(source)
-
-        names: dict[str, int] = {}
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if node.name in names:
-                    first_line = names[node.name]
-                    assert False, (
-                        f"Duplicate function '{node.name}' at lines {first_line} and {node.lineno}"
-                    )
-                names[node.name] = node.lineno
+        """Function names are unique per file, and tool names across all files."""
+        tools: dict[str, str] = {}
+        for path in SOURCE_PATHS:
+            tree = ast.parse(path.read_text())
+            names: dict[str, int] = {}
+            for node in ast.walk(tree):
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    if node.name in names:
+                        first_line = names[node.name]
+                        assert False, (
+                            f"Duplicate function '{node.name}' in {path.name} "
+                            f"at lines {first_line} and {node.lineno}"
+                        )
+                    names[node.name] = node.lineno
+            tool_names = [n for n in names if n.startswith("unifi_")]
+            tool_names += [row[1] for row in _table_rows(tree)]
+            for name in tool_names:
+                assert name not in tools, (
+                    f"Tool '{name}' defined in both {tools[name]} and {path.name}"
+                )
+                tools[name] = path.name
 
     def test_server_importable(self):
         """Verify server.py can be imported without error."""
@@ -77,18 +109,34 @@ class TestServerSyntax:
         )
         assert result.returncode == 0, f"Server import failed:\n{result.stderr}"
 
+    def test_tool_tables_valid(self):
+        """Every tool table row has a known kind, a unifi_ name and a docstring."""
+        kinds = {"list", "get", "create", "update", "delete", "stat", "cmd",
+                 "v2_list", "v2_create", "v2_update", "v2_delete"}
+        for path in TOOL_MODULE_PATHS:
+            for row in _table_rows(ast.parse(path.read_text())):
+                assert len(row) == 6, f"{path.name}: malformed row {row[:2]}"
+                kind, name, tool_path, label, options, doc = row
+                assert kind in kinds, f"{path.name}: {name} has unknown kind '{kind}'"
+                assert name.startswith("unifi_") and tool_path and label and doc.strip()
+                if kind == "cmd":
+                    assert set(options) == {"params", "mutation"}, f"{name}: bad cmd options"
+                    params = [p for p, _ in options["params"]]
+                    assert len(params) == len(set(params)), f"{name}: duplicate command parameter"
+
     def test_tool_count(self):
-        """Verify the expected number of tool functions are generated."""
-        source = SERVER_PATH.read_text()
-        tree = ast.parse(source)
-
-        tool_funcs = [
-            node.name
-            for node in ast.walk(tree)
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
-            and node.name.startswith("unifi_")
-        ]
-        assert len(tool_funcs) == 286, (
-            f"Expected 286 tool functions, found {len(tool_funcs)}: "
+        """Verify the expected number of tools (functions + table rows) are generated."""
+        tool_funcs = []
+        for path in SOURCE_PATHS:
+            tree = ast.parse(path.read_text())
+            tool_funcs += [
+                node.name
+                for node in ast.walk(tree)
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+                and node.name.startswith("unifi_")
+            ]
+            tool_funcs += [row[1] for row in _table_rows(tree)]
+        assert len(tool_funcs) == 293, (
+            f"Expected 293 tools, found {len(tool_funcs)}: "
             f"missing or extra tools detected"
         )
@@ -0,0 +1,132 @@
+"""Workload capture for the MCP server (auto-generated).
+
+Set UNIFI_CAPTURE to a file and every tool call is appended to it as one
+JSON line, after a {"capture": 1} header:
+
+  {"tool": "unifi_list_clients", "args": {...}, "session": "...",
+   "start": <epoch seconds>, "duration_ms": 12.5, "result_bytes": 48213,
+   "error": false, "requests": ["GET /api/s/default/stat/sta", ...]}
+
+"requests" are the controller requests the call issued, in order, logins
+and re-logins included (paths only, no query strings). Arguments, nested
+ones included, named x_* or like password, passphrase, secret, token
+are written as "REDACTED"; IDs and filter values (key, device_id, ...)
+are kept so the capture replays as issued. bench_replay.py re-issues a
+capture against the mock controller or a cassette.
+
+DO NOT EDIT THIS FILE. All changes must be made in the generator.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+# Controller requests of the tool call running in this context; tasks the
+# call starts copy the context, so their requests land in the same list.
+_REQUESTS: contextvars.ContextVar[list[str] | None] = contextvars.ContextVar("unifi_capture_requests", default=None)
+
+
+class RequestCounter(httpx.AsyncBaseTransport):
+    """Async transport wrapper that notes each request against the current tool call."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        requests = _REQUESTS.get()
+        if requests is not None:
+            requests.append(f"{request.method} {request.url.path}")
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+# generator/scrub.py's ARG_SCRUB_PREFIXES and ARG_SCRUB_SUBSTRINGS
+ARG_SCRUB_PREFIXES = ("x_", )
+ARG_SCRUB_SUBSTRINGS = ("password", "passphrase", "secret", "token", )
+
+
+def _secret_arg(name: str) -> bool:
+    lower = name.lower()
+    return lower.startswith(ARG_SCRUB_PREFIXES) or any(s in lower for s in ARG_SCRUB_SUBSTRINGS)
+
+
+def scrub_args(obj: Any) -> Any:
+    """Recursively redact secret-looking arguments of a tool call."""
+    if isinstance(obj, dict):
+        return {k: "REDACTED" if _secret_arg(k) else scrub_args(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [scrub_args(item) for item in obj]
+    return obj
+
+
+def _result_bytes(result: Any) -> int:
+    return sum(len(getattr(c, "text", "").encode()) for c in getattr(result, "content", None) or ())
+
+
+def _is_error(result: Any) -> bool:
+    structured = getattr(result, "structured_content", None)
+    return isinstance(structured, dict) and structured.get("error") is True
+
+
+def _session_id(context: MiddlewareContext) -> str | None:
+    try:
+        return context.fastmcp_context.session_id
+    except (AttributeError, RuntimeError):
+        return None
+
+
+class CaptureMiddleware(Middleware):
+    """FastMCP middleware that appends one line per tool call to a capture file."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        new = not self.path.exists() or self.path.stat().st_size == 0
+        self._file = self.path.open("a")
+        if new:
+            self._write({"capture": 1})
+
+    def _write(self, line: dict) -> None:
+        with self._lock:
+            self._file.write(json.dumps(line, separators=(",", ":"), ensure_ascii=False, default=str) + "\n")
+            self._file.flush()
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next) -> Any:
+        requests: list[str] = []
+        token = _REQUESTS.set(requests)
+        start = time.time()
+        started = time.perf_counter()
+        result = None
+        try:
+            result = await call_next(context)
+            return result
+        finally:
+            duration = time.perf_counter() - started
+            _REQUESTS.reset(token)
+            self._write({
+                "tool": context.message.name,
+                "args": scrub_args(context.message.arguments or {}),
+                "session": _session_id(context),
+                "start": round(start, 6),
+                "duration_ms": round(duration * 1000, 3),
+                "result_bytes": _result_bytes(result),
+                "error": result is None or _is_error(result),
+                "requests": requests,
+            })
+
+
+def middleware_from_env() -> CaptureMiddleware | None:
+    """The capture middleware configured by UNIFI_CAPTURE, if any."""
+    path = os.environ.get("UNIFI_CAPTURE", "")
+    return CaptureMiddleware(path) if path else None
@@ -0,0 +1,238 @@
+"""Record/replay transport for UniFi controller traffic (auto-generated).
+
+Set UNIFI_CASSETTE to a cassette file and every controller request made by
+UniFiClient, the generated test fixtures and probe.py goes through it:
+
+  UNIFI_CASSETTE_MODE=record   forward to the controller and append each
+                               request/response pair to the cassette
+  UNIFI_CASSETTE_MODE=replay   (default) answer from the cassette, no network
+  UNIFI_CASSETTE_LATENCY       multiply recorded response times by this when
+                               replaying (default 1; 0 = no delay)
+
+The cassette is JSON lines: a {"cassette": 1} header, then one line per
+interaction, carrying its lookup key so replay only has to group lines by
+key. The key is method, path and query, and a hash of the scrubbed request
+body (the host is left out, so a cassette replays against any UNIFI_HOST).
+Repeated requests with the same key replay their recorded responses in
+order; once those run out, the last one repeats.
+
+Secrets are scrubbed with generator/scrub.py's rules (probe.py's) before
+anything is written: JSON fields named like secret, token, key, password, passphrase (and a few exact
+names) become "REDACTED", as do cookie and CSRF token values.
+
+DO NOT EDIT THIS FILE. All changes must be made in the generator.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+# generator/scrub.py's SCRUB_FIELDS and SCRUB_SUBSTRINGS
+SCRUB_FIELDS = frozenset({
+    "device_auth",
+    "device_id",
+    "ubic_uuid",
+    "x_certificate_arn",
+    "x_certificate_pem",
+    "x_passphrase",
+    "x_password",
+    "x_private_key",
+    "x_shadow",
+})
+SCRUB_SUBSTRINGS = ("secret", "token", "key", "password", "passphrase", )
+
+# Response headers worth replaying; values of the secret ones are scrubbed
+_KEPT_HEADERS = ("content-type", "set-cookie", "x-csrf-token")
+
+
+def _should_scrub(field_name: str) -> bool:
+    if field_name in SCRUB_FIELDS:
+        return True
+    lower = field_name.lower()
+    return any(s in lower for s in SCRUB_SUBSTRINGS)
+
+
+def scrub_value(obj: Any) -> Any:
+    """Recursively scrub sensitive fields from a JSON-like object."""
+    if isinstance(obj, dict):
+        return {k: "REDACTED" if _should_scrub(k) else scrub_value(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [scrub_value(item) for item in obj]
+    return obj
+
+
+def _scrub_header(name: str, value: str) -> str:
+    if name == "set-cookie":
+        cookie, sep, attributes = value.partition(";")
+        return f"{cookie.split('=', 1)[0]}=REDACTED{sep}{attributes}"
+    if name == "x-csrf-token":
+        return "REDACTED"
+    return value
+
+
+def _encode_body(content: bytes) -> tuple[str, Any]:
+    """(encoding, body) for a cassette line; JSON bodies are stored scrubbed."""
+    if not content:
+        return "text", ""
+    try:
+        return "json", scrub_value(json.loads(content))
+    except ValueError:
+        pass
+    try:
+        return "text", content.decode()
+    except UnicodeDecodeError:
+        return "base64", base64.b64encode(content).decode("ascii")
+
+
+def _decode_body(encoding: str, body: Any) -> bytes:
+    if encoding == "json":
+        return json.dumps(body, separators=(",", ":")).encode()
+    if encoding == "base64":
+        return base64.b64decode(body)
+    return body.encode()
+
+
+def request_key(request: httpx.Request) -> str:
+    """Cassette lookup key: method, path and query, scrubbed-body hash."""
+    encoding, body = _encode_body(request.read())
+    digest = hashlib.sha256(json.dumps([encoding, body], sort_keys=True).encode()).hexdigest()[:16]
+    return f"{request.method} {request.url.raw_path.decode()} {digest}"
+
+
+class CassetteMiss(httpx.TransportError):
+    """A replayed request has no recorded response."""
+
+
+class CassetteTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """httpx transport (sync and async) that records to or replays from a cassette."""
+
+    def __init__(self, path: str | Path, mode: str = "replay", latency: float = 1.0,
+                 verify: bool = True) -> None:
+        if mode not in ("record", "replay"):
+            raise ValueError(f"UNIFI_CASSETTE_MODE must be 'record' or 'replay', not {mode!r}")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = latency
+        self._lock = threading.Lock()
+        if mode == "record":
+            self._sync = httpx.HTTPTransport(verify=verify)
+            self._async = httpx.AsyncHTTPTransport(verify=verify)
+            new = not self.path.exists() or self.path.stat().st_size == 0
+            self._file = self.path.open("a")
+            if new:
+                self._write({"cassette": 1})
+        else:
+            self._recorded: dict[str, list[dict]] = {}
+            self._played: dict[str, int] = {}
+            with self.path.open() as f:
+                for line in f:
+                    interaction = json.loads(line)
+                    if "key" in interaction:
+                        self._recorded.setdefault(interaction["key"], []).append(interaction)
+
+    # -- recording ---------------------------------------------------------
+
+    def _write(self, line: dict) -> None:
+        with self._lock:
+            self._file.write(json.dumps(line, separators=(",", ":"), ensure_ascii=False) + "\n")
+            self._file.flush()
+
+    def _record(self, request: httpx.Request, response: httpx.Response, elapsed: float) -> None:
+        encoding, body = _encode_body(response.content)
+        self._write({
+            "key": request_key(request),
+            "status": response.status_code,
+            "headers": [
+                [name, _scrub_header(name, value)]
+                for name, value in response.headers.multi_items()
+                if name in _KEPT_HEADERS
+            ],
+            "encoding": encoding,
+            "body": body,
+            "elapsed": round(elapsed, 4),
+        })
+
+    # -- replaying ---------------------------------------------------------
+
+    def _next(self, request: httpx.Request) -> dict:
+        key = request_key(request)
+        with self._lock:
+            recorded = self._recorded.get(key)
+            if not recorded:
+                raise CassetteMiss(f"No recorded response in {self.path} for {key}", request=request)
+            played = self._played.get(key, 0)
+            self._played[key] = played + 1
+        return recorded[min(played, len(recorded) - 1)]
+
+    def _response(self, interaction: dict, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            interaction["status"],
+            headers=interaction["headers"],
+            content=_decode_body(interaction["encoding"], interaction["body"]),
+            request=request,
+        )
+
+    # -- transport API -----------------------------------------------------
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.mode == "record":
+            started = time.perf_counter()
+            response = self._sync.handle_request(request)
+            response.read()
+            self._record(request, response, time.perf_counter() - started)
+            return response
+        interaction = self._next(request)
+        if self.latency:
+            time.sleep(interaction["elapsed"] * self.latency)
+        return self._response(interaction, request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.mode == "record":
+            started = time.perf_counter()
+            response = await self._async.handle_async_request(request)
+            await response.aread()
+            self._record(request, response, time.perf_counter() - started)
+            return response
+        interaction = self._next(request)
+        if self.latency:
+            await asyncio.sleep(interaction["elapsed"] * self.latency)
+        return self._response(interaction, request)
+
+    def close(self) -> None:
+        # Shared by every client in the process; the cassette stays open
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+_TRANSPORTS: dict[str, CassetteTransport] = {}
+
+
+def transport_from_env(verify: bool = True) -> CassetteTransport | None:
+    """The process-wide cassette transport configured by UNIFI_CASSETTE*, if any.
+
+    Every client gets the same transport, so replay order and the recording
+    are shared across clients; when recording, verify comes from the first.
+    """
+    path = os.environ.get("UNIFI_CASSETTE", "")
+    if not path:
+        return None
+    if path not in _TRANSPORTS:
+        _TRANSPORTS[path] = CassetteTransport(
+            path,
+            mode=os.environ.get("UNIFI_CASSETTE_MODE", "replay").strip().lower(),
+            latency=float(os.environ.get("UNIFI_CASSETTE_LATENCY", "1")),
+            verify=verify,
+        )
+    return _TRANSPORTS[path]
@@ -0,0 +1 @@
+"""Per-module UniFi MCP tools (auto-generated), imported by server._enable_module()."""
@@ -0,0 +1,466 @@
+"""UniFi MCP tools: admin module (auto-generated).
+
+Imported by server._enable_module() only when the module is enabled, so
+tools of disabled modules cost nothing at startup.
+
+Generated from controller version 10.0.162.
+
+DO NOT EDIT THIS FILE. All changes must be made in the generator.
+"""
+
+from __future__ import annotations
+
+# server.py registers itself as "unifi_server" before importing tool modules
+from unifi_server import (
+    UNIFI_READ_ONLY,
+    _format_response,
+    _get_client,
+    _paginate_and_filter,
+    _register_tool_table,
+    _tool_error,
+    mcp,
+)
+
+
+# v1 tool table: (kind, tool name, path, label, options, docstring) rows that
+# server._register_tool_table() turns into typed tools (see server._ToolSpec)
+_V1_TOOLS = (
+    # --- Account CRUD ---
+    ("list", "unifi_list_accounts", "rest/account", "accounts", None, """List all accounts.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_account", "rest/account", "account", None, """Get a single account by ID.
+
+        Args:
+            id: The _id of the account.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_account", "rest/account", "account", None, """Create a new account.
+
+        Args:
+            data: Account configuration.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_account", "rest/account", "account", None, """Update an existing account.
+
+        Args:
+            id: The _id of the account to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_account", "rest/account", "account", None, """Delete a account.
+
+        Args:
+            id: The _id of the account to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Tag CRUD ---
+    ("list", "unifi_list_tags", "rest/tag", "tags", None, """List all tags.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_tag", "rest/tag", "tag", None, """Get a single tag by ID.
+
+        Args:
+            id: The _id of the tag.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_tag", "rest/tag", "tag", None, """Create a new tag.
+
+        Args:
+            data: Tag configuration.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_tag", "rest/tag", "tag", None, """Update an existing tag.
+
+        Args:
+            id: The _id of the tag to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_tag", "rest/tag", "tag", None, """Delete a tag.
+
+        Args:
+            id: The _id of the tag to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- User_group CRUD ---
+    ("list", "unifi_list_user_groups", "rest/usergroup", "user_groups", None, """List all user_groups.
+
+        Field reference: unifi_describe_fields("unifi_list_user_groups")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_user_group", "rest/usergroup", "user_group", None, """Get a single user_group by ID.
+
+        Args:
+            id: The _id of the user_group.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_user_group", "rest/usergroup", "user_group", None, """Create a new user_group.
+
+        Args:
+            data: User_group configuration.
+                Field reference: unifi_describe_fields("unifi_create_user_group")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Tip: Assign users to this group by setting usergroup_id when creating or updating users.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_user_group", "rest/usergroup", "user_group", None, """Update an existing user_group.
+
+        Args:
+            id: The _id of the user_group to update.
+            data: Fields to update.
+                Field reference: unifi_describe_fields("unifi_update_user_group")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Tip: Assign users to this group by setting usergroup_id when creating or updating users.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_user_group", "rest/usergroup", "user_group", None, """Delete a user_group.
+
+        Args:
+            id: The _id of the user_group to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_list_backups", "cmd/backup", "list-backups", {"params": (), "mutation": False}, """Execute 'list-backups' via backup.
+
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_delete_backup", "cmd/backup", "delete-backup", {"params": (("filename", "str"), ), "mutation": True}, """Execute 'delete-backup' via backup.
+
+        Args:
+            filename: filename parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_generate_backup", "cmd/backup", "generate-backup", {"params": (), "mutation": True}, """Execute 'generate-backup' via backup.
+
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_generate_backup_site", "cmd/backup", "generate-backup-site", {"params": (), "mutation": True}, """Execute 'generate-backup-site' via backup.
+
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_rolling_upgrade", "cmd/devmgr", "rolling-upgrade", {"params": (), "mutation": True}, """Execute 'rolling-upgrade' via devmgr.
+
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_cancel_rolling_upgrade", "cmd/devmgr", "cancel-rolling-upgrade", {"params": (), "mutation": True}, """Execute 'cancel-rolling-upgrade' via devmgr.
+
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_check_firmware_update", "cmd/devmgr", "check-firmware-update", {"params": (), "mutation": False}, """Execute 'check-firmware-update' via devmgr.
+
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_set_rollupgrade", "cmd/devmgr", "set-rollupgrade", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'set-rollupgrade' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_unset_rollupgrade", "cmd/devmgr", "unset-rollupgrade", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'unset-rollupgrade' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_add_site", "cmd/sitemgr", "add-site", {"params": (("desc", "str"), ), "mutation": True}, """Execute 'add-site' via sitemgr.
+
+        Args:
+            desc: desc parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_delete_site", "cmd/sitemgr", "delete-site", {"params": (("site", "str"), ), "mutation": True}, """Execute 'delete-site' via sitemgr.
+
+        Args:
+            target_site: Target site for the command (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_update_site", "cmd/sitemgr", "update-site", {"params": (("desc", "str"), ), "mutation": True}, """Execute 'update-site' via sitemgr.
+
+        Args:
+            desc: desc parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_get_admins", "cmd/sitemgr", "get-admins", {"params": (), "mutation": False}, """Execute 'get-admins' via sitemgr.
+
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_set_site_leds", "cmd/sitemgr", "site-leds", {"params": (("led_enabled", "bool"), ), "mutation": True}, """Execute 'site-leds' via sitemgr.
+
+        Args:
+            led_enabled: led_enabled parameter (bool).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_invite_admin", "cmd/sitemgr", "invite-admin", {"params": (("email", "str"), ("name", "str"), ("role", "str"), ), "mutation": True}, """Execute 'invite-admin' via sitemgr.
+
+        Args:
+            email: email parameter (str).
+        Args:
+            name: name parameter (str).
+        Args:
+            role: role parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_assign_existing_admin", "cmd/sitemgr", "assign-existing-admin", {"params": (("admin", "str"), ("role", "str"), ), "mutation": True}, """Execute 'assign-existing-admin' via sitemgr.
+
+        Args:
+            admin: admin parameter (str).
+        Args:
+            role: role parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_update_admin", "cmd/sitemgr", "update-admin", {"params": (("admin", "str"), ("role", "str"), ), "mutation": True}, """Execute 'update-admin' via sitemgr.
+
+        Args:
+            admin: admin parameter (str).
+        Args:
+            role: role parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_revoke_admin", "cmd/sitemgr", "revoke-admin", {"params": (("admin", "str"), ), "mutation": True}, """Execute 'revoke-admin' via sitemgr.
+
+        Args:
+            admin: admin parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_grant_super_admin", "cmd/sitemgr", "grant-super-admin", {"params": (("admin", "str"), ), "mutation": True}, """Execute 'grant-super-admin' via sitemgr.
+
+        Args:
+            admin: admin parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_create_admin", "cmd/sitemgr", "create-admin", {"params": (("name", "str"), ("email", "str"), ("x_password", "str"), ("role", "str"), ), "mutation": True}, """Execute 'create-admin' via sitemgr.
+
+        Args:
+            name: name parameter (str).
+        Args:
+            email: email parameter (str).
+        Args:
+            x_password: x_password parameter (str).
+        Args:
+            role: role parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_revoke_super_admin", "cmd/sitemgr", "revoke-super-admin", {"params": (("admin", "str"), ), "mutation": True}, """Execute 'revoke-super-admin' via sitemgr.
+
+        Args:
+            admin: admin parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_create_backup", "cmd/system", "backup", {"params": (), "mutation": True}, """Execute 'backup' via system.
+
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_download_backup", "cmd/system", "download-backup", {"params": (("filename", "str"), ), "mutation": True}, """Execute 'download-backup' via system.
+
+        Args:
+            filename: filename parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+)
+
+
+def register_v1() -> None:
+    """Register the admin module's v1 tools."""
+    _register_tool_table(_V1_TOOLS)
+
+    # --- Settings (special handling: keyed by 'key' field) ---
+
+    @mcp.tool()
+    async def unifi_list_settings(
+        site: str = "",
+        limit: int = 0,
+        offset: int = 0,
+        fields: str = "",
+    ) -> dict:
+        """List all site settings. Returns all setting categories.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'key,name'). Supports dot-notation for nested fields. Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """
+        try:
+            client = await _get_client()
+            data = await client.request("GET", "rest/setting", site=site or None)
+            total = len(data)
+            data, missing = _paginate_and_filter(data, limit, offset, fields)
+            return _format_response(data, f"Found {total} setting categories", missing_fields=missing)
+        except RuntimeError as e:
+            return _tool_error(e)
+
+
+    @mcp.tool()
+    async def unifi_get_setting(key: str, site: str = "") -> dict:
+        """Get a specific site setting by key (e.g. 'super_identity', 'snmp').
+
+        Args:
+            key: The setting key to retrieve.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """
+        try:
+            client = await _get_client()
+            data = await client.request("GET", "rest/setting", site=site or None)
+            for item in data:
+                if isinstance(item, dict) and item.get("key") == key:
+                    return _format_response(item)
+            return _format_response(None, f"Setting '{key}' not found")
+        except RuntimeError as e:
+            return _tool_error(e)
+
+    if not UNIFI_READ_ONLY:
+        
+        @mcp.tool()
+        async def unifi_update_setting(
+            key: str,
+            data: dict,
+            confirm: bool = False,
+            site: str = "",
+        ) -> dict:
+            """Update a site setting by key.
+
+            Args:
+                key: The setting key to update (e.g. 'mgmt', 'snmp', 'ntp', 'locale').
+                data: Fields to update. Read current values first with unifi_get_setting.
+                confirm: Must be True to execute. Returns preview if False.
+                site: Site name (default: from env).
+
+            If this tool returns an unexpected error, call unifi_report_issue to report it.
+            """
+            try:
+                if not confirm:
+                    return _format_response(
+                        {"action": "update_setting", "key": key, "data": data},
+                        "DRY RUN (PUT set/setting/{key}): Set confirm=True to execute.",
+                    )
+                client = await _get_client()
+                result = await client.request("PUT", f"set/setting/{key}", json_data=data, site=site or None)
+                return _format_response(result, f"Updated setting '{key}'")
+            except RuntimeError as e:
+                return _tool_error(e)
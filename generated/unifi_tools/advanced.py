@@ -0,0 +1,490 @@
+"""UniFi MCP tools: advanced module (auto-generated).
+
+Imported by server._enable_module() only when the module is enabled, so
+tools of disabled modules cost nothing at startup.
+
+Generated from controller version 10.0.162.
+
+DO NOT EDIT THIS FILE. All changes must be made in the generator.
+"""
+
+from __future__ import annotations
+
+# server.py registers itself as "unifi_server" before importing tool modules
+from unifi_server import (
+    _register_tool_table,
+)
+
+
+# v1 tool table: (kind, tool name, path, label, options, docstring) rows that
+# server._register_tool_table() turns into typed tools (see server._ToolSpec)
+_V1_TOOLS = (
+    # --- Broadcast_group CRUD ---
+    ("list", "unifi_list_broadcast_groups", "rest/broadcastgroup", "broadcast_groups", None, """List all broadcast_groups.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_broadcast_group", "rest/broadcastgroup", "broadcast_group", None, """Get a single broadcast_group by ID.
+
+        Args:
+            id: The _id of the broadcast_group.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_broadcast_group", "rest/broadcastgroup", "broadcast_group", None, """Create a new broadcast_group.
+
+        Args:
+            data: Broadcast_group configuration.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_broadcast_group", "rest/broadcastgroup", "broadcast_group", None, """Update an existing broadcast_group.
+
+        Args:
+            id: The _id of the broadcast_group to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_broadcast_group", "rest/broadcastgroup", "broadcast_group", None, """Delete a broadcast_group.
+
+        Args:
+            id: The _id of the broadcast_group to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Dpi_app CRUD ---
+    ("list", "unifi_list_dpi_apps", "rest/dpiapp", "dpi_apps", None, """List all dpi_apps.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_dpi_app", "rest/dpiapp", "dpi_app", None, """Get a single dpi_app by ID.
+
+        Args:
+            id: The _id of the dpi_app.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_dpi_app", "rest/dpiapp", "dpi_app", None, """Create a new dpi_app.
+
+        Args:
+            data: Dpi_app configuration.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_dpi_app", "rest/dpiapp", "dpi_app", None, """Update an existing dpi_app.
+
+        Args:
+            id: The _id of the dpi_app to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_dpi_app", "rest/dpiapp", "dpi_app", None, """Delete a dpi_app.
+
+        Args:
+            id: The _id of the dpi_app to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Dpi_group CRUD ---
+    ("list", "unifi_list_dpi_groups", "rest/dpigroup", "dpi_groups", None, """List all dpi_groups.
+
+        Field reference: unifi_describe_fields("unifi_list_dpi_groups")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_dpi_group", "rest/dpigroup", "dpi_group", None, """Get a single dpi_group by ID.
+
+        Args:
+            id: The _id of the dpi_group.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_dpi_group", "rest/dpigroup", "dpi_group", None, """Create a new dpi_group.
+
+        Args:
+            data: Dpi_group configuration.
+                Field reference: unifi_describe_fields("unifi_create_dpi_group")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_dpi_group", "rest/dpigroup", "dpi_group", None, """Update an existing dpi_group.
+
+        Args:
+            id: The _id of the dpi_group to update.
+            data: Fields to update.
+                Field reference: unifi_describe_fields("unifi_update_dpi_group")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_dpi_group", "rest/dpigroup", "dpi_group", None, """Delete a dpi_group.
+
+        Args:
+            id: The _id of the dpi_group to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Heatmap CRUD ---
+    ("list", "unifi_list_heatmaps", "rest/heatmap", "heatmaps", None, """List all heatmaps.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_heatmap", "rest/heatmap", "heatmap", None, """Get a single heatmap by ID.
+
+        Args:
+            id: The _id of the heatmap.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_heatmap", "rest/heatmap", "heatmap", None, """Create a new heatmap.
+
+        Args:
+            data: Heatmap configuration.
+                Required: name (str), map_id (str, _id from unifi_list_maps)
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_heatmap", "rest/heatmap", "heatmap", None, """Update an existing heatmap.
+
+        Args:
+            id: The _id of the heatmap to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_heatmap", "rest/heatmap", "heatmap", None, """Delete a heatmap.
+
+        Args:
+            id: The _id of the heatmap to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Heatmap_point CRUD ---
+    ("list", "unifi_list_heatmap_points", "rest/heatmappoint", "heatmap_points", None, """List all heatmap_points.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_heatmap_point", "rest/heatmappoint", "heatmap_point", None, """Get a single heatmap_point by ID.
+
+        Args:
+            id: The _id of the heatmap_point.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_heatmap_point", "rest/heatmappoint", "heatmap_point", None, """Create a new heatmap_point.
+
+        Args:
+            data: Heatmap_point configuration.
+                Required: heatmap_id (str, _id from unifi_list_heatmaps), x (float, 0.0–1.0), y (float, 0.0–1.0)
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_heatmap_point", "rest/heatmappoint", "heatmap_point", None, """Update an existing heatmap_point.
+
+        Args:
+            id: The _id of the heatmap_point to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_heatmap_point", "rest/heatmappoint", "heatmap_point", None, """Delete a heatmap_point.
+
+        Args:
+            id: The _id of the heatmap_point to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Map CRUD ---
+    ("list", "unifi_list_maps", "rest/map", "maps", None, """List all maps.
+
+        Field reference: unifi_describe_fields("unifi_list_maps")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_map", "rest/map", "map", None, """Get a single map by ID.
+
+        Args:
+            id: The _id of the map.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_map", "rest/map", "map", None, """Create a new map.
+
+        Args:
+            data: Map configuration.
+                Field reference: unifi_describe_fields("unifi_create_map")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_map", "rest/map", "map", None, """Update an existing map.
+
+        Args:
+            id: The _id of the map to update.
+            data: Fields to update.
+                Field reference: unifi_describe_fields("unifi_update_map")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_map", "rest/map", "map", None, """Delete a map.
+
+        Args:
+            id: The _id of the map to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Media_file CRUD ---
+    ("list", "unifi_list_media_files", "rest/mediafile", "media_files", None, """List all media_files.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_media_file", "rest/mediafile", "media_file", None, """Get a single media_file by ID.
+
+        Args:
+            id: The _id of the media_file.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_media_file", "rest/mediafile", "media_file", None, """Create a new media_file.
+
+        Args:
+            data: Media_file configuration.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_media_file", "rest/mediafile", "media_file", None, """Update an existing media_file.
+
+        Args:
+            id: The _id of the media_file to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_media_file", "rest/mediafile", "media_file", None, """Delete a media_file.
+
+        Args:
+            id: The _id of the media_file to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Known_rogue_ap (read-only) ---
+    ("list", "unifi_list_known_rogue_aps", "rest/rogueknown", "known_rogue_aps", None, """List all known_rogue_aps.
+
+        Returns known_rogue_aps from the UniFi controller.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Schedule_task CRUD ---
+    ("list", "unifi_list_schedule_tasks", "rest/scheduletask", "schedule_tasks", None, """List all schedule_tasks.
+
+        Field reference: unifi_describe_fields("unifi_list_schedule_tasks")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_schedule_task", "rest/scheduletask", "schedule_task", None, """Get a single schedule_task by ID.
+
+        Args:
+            id: The _id of the schedule_task.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_schedule_task", "rest/scheduletask", "schedule_task", None, """Create a new schedule_task.
+
+        Args:
+            data: Schedule_task configuration.
+                Field reference: unifi_describe_fields("unifi_create_schedule_task")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_schedule_task", "rest/scheduletask", "schedule_task", None, """Update an existing schedule_task.
+
+        Args:
+            id: The _id of the schedule_task to update.
+            data: Fields to update.
+                Field reference: unifi_describe_fields("unifi_update_schedule_task")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Note: This resource requires sending the FULL object on update, not just changed fields.
+        First GET the current object, modify the fields you want, then send the complete object.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_schedule_task", "rest/scheduletask", "schedule_task", None, """Delete a schedule_task.
+
+        Args:
+            id: The _id of the schedule_task to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Spatial_record CRUD ---
+    ("list", "unifi_list_spatial_records", "rest/spatialrecord", "spatial_records", None, """List all spatial_records.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_spatial_record", "rest/spatialrecord", "spatial_record", None, """Get a single spatial_record by ID.
+
+        Args:
+            id: The _id of the spatial_record.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_spatial_record", "rest/spatialrecord", "spatial_record", None, """Create a new spatial_record.
+
+        Args:
+            data: Spatial_record configuration.
+                Required: name (str), devices (list, device references e.g. []), description (str, e.g. 'Room label')
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_spatial_record", "rest/spatialrecord", "spatial_record", None, """Update an existing spatial_record.
+
+        Args:
+            id: The _id of the spatial_record to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_spatial_record", "rest/spatialrecord", "spatial_record", None, """Delete a spatial_record.
+
+        Args:
+            id: The _id of the spatial_record to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+)
+
+
+def register_v1() -> None:
+    """Register the advanced module's v1 tools."""
+    _register_tool_table(_V1_TOOLS)
@@ -0,0 +1,273 @@
+"""UniFi MCP tools: client module (auto-generated).
+
+Imported by server._enable_module() only when the module is enabled, so
+tools of disabled modules cost nothing at startup.
+
+Generated from controller version 10.0.162.
+
+DO NOT EDIT THIS FILE. All changes must be made in the generator.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+# server.py registers itself as "unifi_server" before importing tool modules
+from unifi_server import (
+    _SESSION_DEFAULT_WINDOW_S,
+    _fetch_sessions,
+    _format_response,
+    _get_client,
+    _paginate_and_filter,
+    _register_tool_table,
+    _session_windows,
+    _tool_error,
+    _validate_mac,
+    mcp,
+)
+
+
+# v1 tool table: (kind, tool name, path, label, options, docstring) rows that
+# server._register_tool_table() turns into typed tools (see server._ToolSpec)
+_V1_TOOLS = (
+    # --- User CRUD ---
+    ("list", "unifi_list_users", "rest/user", "users", None, """List all users.
+
+        Field reference: unifi_describe_fields("unifi_list_users")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_user", "rest/user", "user", None, """Get a single user by ID.
+
+        Args:
+            id: The _id of the user.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_user", "rest/user", "user", None, """Create a new user.
+
+        Args:
+            data: User configuration.
+                Field reference: unifi_describe_fields("unifi_create_user")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Note: To remove a user, use unifi_forget_client with the user's MAC address. REST DELETE is not supported for the user resource.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_user", "rest/user", "user", None, """Update an existing user.
+
+        Args:
+            id: The _id of the user to update.
+            data: Fields to update.
+                Field reference: unifi_describe_fields("unifi_update_user")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Note: To remove a user, use unifi_forget_client with the user's MAC address. REST DELETE is not supported for the user resource.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_all_users", "stat/alluser", "all_users", None, """List all_users statistics.
+
+        Field reference: unifi_describe_fields("unifi_list_all_users")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_guests", "stat/guest", "guests", None, """List guests statistics.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_clients", "stat/sta", "clients", {"enrich": True}, """List clients statistics.
+
+        Note: Wireless clients are automatically enriched with network_name (the VLAN/network name from networkconf, resolved via essid → wlanconf). No manual join needed — just use fields=essid,network_name to see SSID-to-VLAN mappings.
+
+        Field reference: unifi_describe_fields("unifi_list_clients")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_block_client", "cmd/stamgr", "block-sta", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'block-sta' via stamgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_unblock_client", "cmd/stamgr", "unblock-sta", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'unblock-sta' via stamgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_kick_client", "cmd/stamgr", "kick-sta", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'kick-sta' via stamgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_forget_client", "cmd/stamgr", "forget-sta", {"params": (("macs", "list"), ), "mutation": True}, """Execute 'forget-sta' via stamgr.
+
+        Args:
+            macs: macs parameter (list).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_unauthorize_guest", "cmd/stamgr", "unauthorize-guest", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'unauthorize-guest' via stamgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_authorize_guest", "cmd/stamgr", "authorize-guest", {"params": (("mac", "str"), ("minutes", "int"), ), "mutation": True}, """Execute 'authorize-guest' via stamgr.
+
+        Args:
+            mac: mac parameter (str).
+        Args:
+            minutes: minutes parameter (int).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_reconnect_client", "cmd/stamgr", "reconnect-sta", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'reconnect-sta' via stamgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+)
+
+
+def register_v1() -> None:
+    """Register the client module's v1 tools."""
+    _register_tool_table(_V1_TOOLS)
+
+    @mcp.tool()
+    async def unifi_list_sessions(
+        start: int = 0,
+        end: int = 0,
+        mac: str = "",
+        type: str = "all",
+        site: str = "",
+        limit: int = 0,
+        offset: int = 0,
+        fields: str = "",
+    ) -> dict:
+        """List client sessions (connect/disconnect history) in a time window.
+
+        Defaults to the last 24 hours. Long ranges are split into one-day
+        windows fetched concurrently; with limit set, fetching stops once
+        enough sessions (newest windows first) are collected.
+
+        Args:
+            start: Window start, epoch seconds (0 = 24 hours before end).
+            end: Window end, epoch seconds (0 = now).
+            mac: Only sessions of this client MAC (e.g. 'aa:bb:cc:dd:ee:ff').
+            type: Session type: 'all', 'guest' or 'user'.
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """
+        try:
+            end = end or int(time.time())
+            start = start or end - _SESSION_DEFAULT_WINDOW_S
+            if start >= end:
+                return _tool_error(f"start ({start}) must be before end ({end})")
+            body: dict[str, Any] = {"type": type}
+            if mac:
+                mac_err = _validate_mac(mac)
+                if mac_err:
+                    return _tool_error(mac_err)
+                body["mac"] = mac.lower()
+            client = await _get_client()
+            want = offset + limit if limit else 0
+            data, complete = await _fetch_sessions(client, body, _session_windows(start, end), site or None, want)
+            total = len(data)
+            data, missing = _paginate_and_filter(data, limit, offset, fields)
+            found = f"{total}" if complete else f"at least {total}"
+            return _format_response(data, f"Found {found} sessions records", missing_fields=missing)
+        except RuntimeError as e:
+            return _tool_error(e)
+
+
+# v2 tool table, same layout as _V1_TOOLS
+_V2_TOOLS = (
+    # --- v2: Active_client ---
+    ("v2_list", "unifi_list_active_clients", "/v2/api/site/{site}/clients/active", "active_clients", None, """List all active_clients (v2 API).
+
+        Field reference: unifi_describe_fields("unifi_list_active_clients")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- v2: Client_history ---
+    ("v2_list", "unifi_list_clients_history", "/v2/api/site/{site}/clients/history", "clients_history", None, """List all clients_history (v2 API).
+
+        Field reference: unifi_describe_fields("unifi_list_clients_history")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+)
+
+
+def register_v2() -> None:
+    """Register the client module's v2 tools."""
+    _register_tool_table(_V2_TOOLS)
@@ -0,0 +1,467 @@
+"""UniFi MCP tools: device module (auto-generated).
+
+Imported by server._enable_module() only when the module is enabled, so
+tools of disabled modules cost nothing at startup.
+
+Generated from controller version 10.0.162.
+
+DO NOT EDIT THIS FILE. All changes must be made in the generator.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# server.py registers itself as "unifi_server" before importing tool modules
+from unifi_server import (
+    UNIFI_READ_ONLY,
+    _apply_port_overrides,
+    _format_response,
+    _get_client,
+    _register_tool_table,
+    _tool_error,
+    mcp,
+)
+
+
+# v1 tool table: (kind, tool name, path, label, options, docstring) rows that
+# server._register_tool_table() turns into typed tools (see server._ToolSpec)
+_V1_TOOLS = (
+    # --- Device_config (read-only) ---
+    ("list", "unifi_list_device_configs", "rest/device", "device_configs", None, """List all device_configs.
+
+        Returns device_configs from the UniFi controller.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Element (read-only) ---
+    ("list", "unifi_list_elements", "rest/element", "elements", None, """List all elements.
+
+        Returns elements from the UniFi controller.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Virtual_device (read-only) ---
+    ("list", "unifi_list_virtual_devices", "rest/virtualdevice", "virtual_devices", None, """List all virtual_devices.
+
+        Returns virtual_devices from the UniFi controller.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_devices", "stat/device", "devices", None, """List devices statistics.
+
+        Note: also POST with macs filter
+
+        Field reference: unifi_describe_fields("unifi_list_devices")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_devices_basic", "stat/device-basic", "devices_basic", None, """List devices_basic statistics.
+
+        Field reference: unifi_describe_fields("unifi_list_devices_basic")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_adopt_device", "cmd/devmgr", "adopt", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'adopt' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_restart_device", "cmd/devmgr", "restart", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'restart' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_force_provision_device", "cmd/devmgr", "force-provision", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'force-provision' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_power_cycle_port", "cmd/devmgr", "power-cycle", {"params": (("mac", "str"), ("port_idx", "int"), ), "mutation": True}, """Execute 'power-cycle' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+        Args:
+            port_idx: port_idx parameter (int).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_run_speedtest", "cmd/devmgr", "speedtest", {"params": (), "mutation": True}, """Execute 'speedtest' via devmgr.
+
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_get_speedtest_status", "cmd/devmgr", "speedtest-status", {"params": (), "mutation": False}, """Execute 'speedtest-status' via devmgr.
+
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_locate_device", "cmd/devmgr", "set-locate", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'set-locate' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_unlocate_device", "cmd/devmgr", "unset-locate", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'unset-locate' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_upgrade_device", "cmd/devmgr", "upgrade", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'upgrade' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_upgrade_device_external", "cmd/devmgr", "upgrade-external", {"params": (("mac", "str"), ("url", "str"), ), "mutation": True}, """Execute 'upgrade-external' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+        Args:
+            url: url parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_migrate_device", "cmd/devmgr", "migrate", {"params": (("mac", "str"), ("inform_url", "str"), ), "mutation": True}, """Execute 'migrate' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+        Args:
+            inform_url: inform_url parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_cancel_migrate_device", "cmd/devmgr", "cancel-migrate", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'cancel-migrate' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_spectrum_scan", "cmd/devmgr", "spectrum-scan", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'spectrum-scan' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_rename_device", "cmd/devmgr", "rename", {"params": (("mac", "str"), ("name", "str"), ), "mutation": True}, """Execute 'rename' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+        Args:
+            name: name parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_led_override_device", "cmd/devmgr", "led-override", {"params": (("mac", "str"), ("led_override", "str"), ), "mutation": True}, """Execute 'led-override' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+        Args:
+            led_override: led_override parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_disable_ap", "cmd/devmgr", "disable-ap", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'disable-ap' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_upgrade_all_devices", "cmd/devmgr", "upgrade-all-devices", {"params": (), "mutation": True}, """Execute 'upgrade-all-devices' via devmgr.
+
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_advanced_adopt_device", "cmd/devmgr", "advanced-adopt", {"params": (("mac", "str"), ("url", "str"), ("key", "str"), ), "mutation": True}, """Execute 'advanced-adopt' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+        Args:
+            url: url parameter (str).
+        Args:
+            key: key parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_restart_http_portal", "cmd/devmgr", "restart-http-portal", {"params": (), "mutation": True}, """Execute 'restart-http-portal' via devmgr.
+
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_enable_device", "cmd/devmgr", "enable", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'enable' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_disable_device", "cmd/devmgr", "disable", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'disable' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_cable_test", "cmd/devmgr", "cable-test", {"params": (("mac", "str"), ("port_idx", "int"), ), "mutation": True}, """Execute 'cable-test' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+        Args:
+            port_idx: port_idx parameter (int).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_set_inform_device", "cmd/devmgr", "set-inform", {"params": (("mac", "str"), ("inform_url", "str"), ), "mutation": True}, """Execute 'set-inform' via devmgr.
+
+        Args:
+            mac: mac parameter (str).
+        Args:
+            inform_url: inform_url parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_move_device", "cmd/sitemgr", "move-device", {"params": (("mac", "str"), ("site", "str"), ), "mutation": True}, """Execute 'move-device' via sitemgr.
+
+        Args:
+            mac: mac parameter (str).
+        Args:
+            target_site: Target site for the command (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_delete_device", "cmd/sitemgr", "delete-device", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'delete-device' via sitemgr.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_reboot_cloudkey", "cmd/system", "reboot-cloudkey", {"params": (), "mutation": True}, """Execute 'reboot-cloudkey' via system.
+
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_element_adoption", "cmd/system", "element-adoption", {"params": (("mac", "str"), ), "mutation": True}, """Execute 'element-adoption' via system.
+
+        Args:
+            mac: mac parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+)
+
+
+def register_v1() -> None:
+    """Register the device module's v1 tools."""
+    _register_tool_table(_V1_TOOLS)
+
+    # ===========================================================================
+    # Special: Port Override Helper
+    # ===========================================================================
+
+    if not UNIFI_READ_ONLY:
+        @mcp.tool()
+        async def unifi_set_port_override(
+            device_id: str,
+            port_idx: int,
+            portconf_id: str = "",
+            name: str = "",
+            native_networkconf_id: str = "",
+            forward: str = "",
+            poe_mode: str = "",
+            confirm: bool = False,
+            site: str = "",
+        ) -> dict:
+            """Set port override on a device (switch port configuration).
+
+            This updates a specific port on a UniFi switch device.
+            To change several ports at once, use unifi_set_port_overrides (one PUT for all ports).
+
+            Args:
+                device_id: The _id of the device.
+                port_idx: Port number (1-based).
+                portconf_id: Port profile ID to apply (from rest/portconf).
+                name: Custom port name.
+                native_networkconf_id: Network ID for native VLAN.
+                forward: Forward mode ('all', 'customize', 'disabled').
+                poe_mode: PoE mode ('auto', 'off', 'pasv24', 'passthrough').
+                confirm: Must be True to execute. Returns preview if False.
+                site: Site name (default: from env).
+
+            If this tool returns an unexpected error, call unifi_report_issue to report it.
+            """
+            try:
+                override: dict[str, Any] = {"port_idx": port_idx}
+                if portconf_id:
+                    override["portconf_id"] = portconf_id
+                if name:
+                    override["name"] = name
+                if native_networkconf_id:
+                    override["native_networkconf_id"] = native_networkconf_id
+                if forward:
+                    override["forward"] = forward
+                if poe_mode:
+                    override["poe_mode"] = poe_mode
+
+                if not confirm:
+                    return _format_response(
+                        {"action": "set_port_override", "device_id": device_id, "override": override},
+                        "DRY RUN (PUT rest/device/{device_id}): Set confirm=True to execute.",
+                    )
+
+                client = await _get_client()
+                result = await _apply_port_overrides(client, device_id, [override], site or None)
+                return _format_response(result, f"Set port override on port {port_idx}")
+            except RuntimeError as e:
+                return _tool_error(e)
+
+
+        @mcp.tool()
+        async def unifi_set_port_overrides(
+            device_id: str,
+            overrides: list[dict],
+            confirm: bool = False,
+            site: str = "",
+        ) -> dict:
+            """Set port overrides on many ports of a device in a single update.
+
+            Fetches the device once, merges all overrides into its port_overrides,
+            and writes them back with one PUT (one provisioning cycle on the switch).
+            Ports not listed keep their current override.
+
+            Args:
+                device_id: The _id of the device.
+                overrides: List of port overrides, one per port. Each needs port_idx (int, 1-based)
+                    and may set portconf_id (see unifi_list_port_profiles), name,
+                    native_networkconf_id (see unifi_list_networks), forward
+                    ('all', 'customize', 'disabled'), poe_mode ('auto', 'off', 'pasv24', 'passthrough').
+                    Example: [{"port_idx": 1, "portconf_id": "..."}, {"port_idx": 2, "poe_mode": "off"}]
+                confirm: Must be True to execute. Returns preview if False.
+                site: Site name (default: from env).
+
+            If this tool returns an unexpected error, call unifi_report_issue to report it.
+            """
+            try:
+                cleaned: list[dict] = []
+                seen_ports: set[int] = set()
+                for o in overrides:
+                    if not isinstance(o, dict) or not isinstance(o.get("port_idx"), int) or isinstance(o.get("port_idx"), bool):
+                        return _tool_error(f"Each override needs an integer port_idx, got: {o!r}")
+                    if o["port_idx"] in seen_ports:
+                        return _tool_error(f"Duplicate port_idx {o['port_idx']} in overrides")
+                    seen_ports.add(o["port_idx"])
+                    # Empty strings mean "not set", same as the single-port tool
+                    cleaned.append({k: v for k, v in o.items() if v != ""})
+                if not cleaned:
+                    return _tool_error("No overrides provided")
+
+                if not confirm:
+                    return _format_response(
+                        {"action": "set_port_overrides", "device_id": device_id, "overrides": cleaned},
+                        "DRY RUN (PUT rest/device/{device_id}): Set confirm=True to execute.",
+                    )
+
+                client = await _get_client()
+                result = await _apply_port_overrides(client, device_id, cleaned, site or None)
+                ports = ", ".join(str(o["port_idx"]) for o in cleaned)
+                return _format_response(result, f"Set port overrides on ports {ports}")
+            except RuntimeError as e:
+                return _tool_error(e)
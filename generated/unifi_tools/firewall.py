@@ -0,0 +1,518 @@
+"""UniFi MCP tools: firewall module (auto-generated).
+
+Imported by server._enable_module() only when the module is enabled, so
+tools of disabled modules cost nothing at startup.
+
+Generated from controller version 10.0.162.
+
+DO NOT EDIT THIS FILE. All changes must be made in the generator.
+"""
+
+from __future__ import annotations
+
+# server.py registers itself as "unifi_server" before importing tool modules
+from unifi_server import (
+    _register_tool_table,
+)
+
+
+# v1 tool table: (kind, tool name, path, label, options, docstring) rows that
+# server._register_tool_table() turns into typed tools (see server._ToolSpec)
+_V1_TOOLS = (
+    # --- Dhcp_option CRUD ---
+    ("list", "unifi_list_dhcp_options", "rest/dhcpoption", "dhcp_options", None, """List all dhcp_options.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_dhcp_option", "rest/dhcpoption", "dhcp_option", None, """Get a single dhcp_option by ID.
+
+        Args:
+            id: The _id of the dhcp_option.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_dhcp_option", "rest/dhcpoption", "dhcp_option", None, """Create a new dhcp_option.
+
+        Args:
+            data: Dhcp_option configuration.
+                Required: name (str), code (int, DHCP option number 7-254 excluding reserved: 15,42,43,44,51,66,67,252), value (str). Note: May require a DHCP-enabled network with gateway device.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_dhcp_option", "rest/dhcpoption", "dhcp_option", None, """Update an existing dhcp_option.
+
+        Args:
+            id: The _id of the dhcp_option to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_dhcp_option", "rest/dhcpoption", "dhcp_option", None, """Delete a dhcp_option.
+
+        Args:
+            id: The _id of the dhcp_option to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Dns_record CRUD ---
+    ("list", "unifi_list_dns_records", "rest/dnsrecord", "dns_records", None, """List all dns_records.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_dns_record", "rest/dnsrecord", "dns_record", None, """Get a single dns_record by ID.
+
+        Args:
+            id: The _id of the dns_record.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_dns_record", "rest/dnsrecord", "dns_record", None, """Create a new dns_record.
+
+        Args:
+            data: Dns_record configuration.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_dns_record", "rest/dnsrecord", "dns_record", None, """Update an existing dns_record.
+
+        Args:
+            id: The _id of the dns_record to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_dns_record", "rest/dnsrecord", "dns_record", None, """Delete a dns_record.
+
+        Args:
+            id: The _id of the dns_record to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Dynamic_dns CRUD ---
+    ("list", "unifi_list_dynamic_dns_entries", "rest/dynamicdns", "dynamic_dns_entries", None, """List all dynamic_dns_entries.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_dynamic_dns", "rest/dynamicdns", "dynamic_dns", None, """Get a single dynamic_dns by ID.
+
+        Args:
+            id: The _id of the dynamic_dns.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_dynamic_dns", "rest/dynamicdns", "dynamic_dns", None, """Create a new dynamic_dns.
+
+        Args:
+            data: Dynamic_dns configuration.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_dynamic_dns", "rest/dynamicdns", "dynamic_dns", None, """Update an existing dynamic_dns.
+
+        Args:
+            id: The _id of the dynamic_dns to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_dynamic_dns", "rest/dynamicdns", "dynamic_dns", None, """Delete a dynamic_dns.
+
+        Args:
+            id: The _id of the dynamic_dns to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Firewall_group CRUD ---
+    ("list", "unifi_list_firewall_groups", "rest/firewallgroup", "firewall_groups", None, """List all firewall_groups.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_firewall_group", "rest/firewallgroup", "firewall_group", None, """Get a single firewall_group by ID.
+
+        Args:
+            id: The _id of the firewall_group.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_firewall_group", "rest/firewallgroup", "firewall_group", None, """Create a new firewall_group.
+
+        Args:
+            data: Firewall_group configuration.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Tip: Reference this group's _id in src_firewallgroup_ids or dst_firewallgroup_ids when creating firewall rules.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_firewall_group", "rest/firewallgroup", "firewall_group", None, """Update an existing firewall_group.
+
+        Args:
+            id: The _id of the firewall_group to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Tip: Reference this group's _id in src_firewallgroup_ids or dst_firewallgroup_ids when creating firewall rules.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_firewall_group", "rest/firewallgroup", "firewall_group", None, """Delete a firewall_group.
+
+        Args:
+            id: The _id of the firewall_group to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Firewall_rule CRUD ---
+    ("list", "unifi_list_firewall_rules", "rest/firewallrule", "firewall_rules", None, """List all firewall_rules.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_firewall_rule", "rest/firewallrule", "firewall_rule", None, """Get a single firewall_rule by ID.
+
+        Args:
+            id: The _id of the firewall_rule.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_firewall_rule", "rest/firewallrule", "firewall_rule", None, """Create a new firewall_rule.
+
+        Args:
+            data: Firewall_rule configuration.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Tip: Create firewall groups first (unifi_create_firewall_group) to use in src/dst_firewallgroup_ids.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_firewall_rule", "rest/firewallrule", "firewall_rule", None, """Update an existing firewall_rule.
+
+        Args:
+            id: The _id of the firewall_rule to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Tip: Create firewall groups first (unifi_create_firewall_group) to use in src/dst_firewallgroup_ids.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_firewall_rule", "rest/firewallrule", "firewall_rule", None, """Delete a firewall_rule.
+
+        Args:
+            id: The _id of the firewall_rule to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Port_forward CRUD ---
+    ("list", "unifi_list_port_forwards", "rest/portforward", "port_forwards", None, """List all port_forwards.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_port_forward", "rest/portforward", "port_forward", None, """Get a single port_forward by ID.
+
+        Args:
+            id: The _id of the port_forward.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_port_forward", "rest/portforward", "port_forward", None, """Create a new port_forward.
+
+        Args:
+            data: Port_forward configuration.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Tip: Ensure the destination IP (fwd) is a static address or DHCP reservation on your network.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_port_forward", "rest/portforward", "port_forward", None, """Update an existing port_forward.
+
+        Args:
+            id: The _id of the port_forward to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Tip: Ensure the destination IP (fwd) is a static address or DHCP reservation on your network.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_port_forward", "rest/portforward", "port_forward", None, """Delete a port_forward.
+
+        Args:
+            id: The _id of the port_forward to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Route CRUD ---
+    ("list", "unifi_list_routes", "rest/routing", "routes", None, """List all routes.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_route", "rest/routing", "route", None, """Get a single route by ID.
+
+        Args:
+            id: The _id of the route.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_route", "rest/routing", "route", None, """Create a new route.
+
+        Args:
+            data: Route configuration.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_route", "rest/routing", "route", None, """Update an existing route.
+
+        Args:
+            id: The _id of the route to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_route", "rest/routing", "route", None, """Delete a route.
+
+        Args:
+            id: The _id of the route to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+)
+
+
+def register_v1() -> None:
+    """Register the firewall module's v1 tools."""
+    _register_tool_table(_V1_TOOLS)
+
+
+# v2 tool table, same layout as _V1_TOOLS
+_V2_TOOLS = (
+    # --- v2: Firewall_policy ---
+    ("v2_list", "unifi_list_firewall_policies", "/v2/api/site/{site}/firewall-policies", "firewall_policies", None, """List all firewall_policies (v2 API).
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("v2_create", "unifi_create_firewall_policy", "/v2/api/site/{site}/firewall-policies", "firewall_policy", None, """Create a new firewall_policy (v2 API).
+
+        Args:
+            data: Firewall_policy configuration.
+                Required: action (str), ipVersion (str: 'V4'|'V6'), source (obj with zoneId from unifi_list_firewall_zones), destination (obj with zoneId from unifi_list_firewall_zones), schedule (obj with mode, e.g. {'mode': 'ALWAYS'}). Note: Requires firewall zones which are created when a gateway device is adopted.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("v2_update", "unifi_update_firewall_policy", "/v2/api/site/{site}/firewall-policies", "firewall_policy", None, """Update a firewall_policy (v2 API).
+
+        Args:
+            id: The ID of the firewall_policy to update.
+            data: The FULL firewall_policy object with your changes applied.
+                v2 API requires sending the complete object, not just changed fields.
+                First GET the current object, modify the fields you want, then send the full object.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("v2_delete", "unifi_delete_firewall_policy", "/v2/api/site/{site}/firewall-policies", "firewall_policy", None, """Delete a firewall_policy (v2 API).
+
+        Args:
+            id: The ID of the firewall_policy to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- v2: Firewall_zone ---
+    ("v2_list", "unifi_list_firewall_zones", "/v2/api/site/{site}/firewall/zone", "firewall_zones", None, """List all firewall_zones (v2 API).
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("v2_update", "unifi_update_firewall_zone", "/v2/api/site/{site}/firewall/zone", "firewall_zone", None, """Update a firewall_zone (v2 API).
+
+        Args:
+            id: The ID of the firewall_zone to update.
+            data: The FULL firewall_zone object with your changes applied.
+                v2 API requires sending the complete object, not just changed fields.
+                First GET the current object, modify the fields you want, then send the full object.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- v2: Traffic_rule ---
+    ("v2_list", "unifi_list_traffic_rules", "/v2/api/site/{site}/trafficrules", "traffic_rules", None, """List all traffic_rules (v2 API).
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("v2_create", "unifi_create_traffic_rule", "/v2/api/site/{site}/trafficrules", "traffic_rule", None, """Create a new traffic_rule (v2 API).
+
+        Args:
+            data: Traffic_rule configuration.
+                Required: action (str: 'BLOCK'|'ALLOW'), enabled (bool), matching_target (str: 'INTERNET'|'LOCAL_NETWORK'), target_devices (list of {type: 'ALL_CLIENTS'|'CLIENT'|'NETWORK', client_mac/network_id}), network_id (str, _id from unifi_list_networks)
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("v2_update", "unifi_update_traffic_rule", "/v2/api/site/{site}/trafficrules", "traffic_rule", None, """Update a traffic_rule (v2 API).
+
+        Args:
+            id: The ID of the traffic_rule to update.
+            data: The FULL traffic_rule object with your changes applied.
+                v2 API requires sending the complete object, not just changed fields.
+                First GET the current object, modify the fields you want, then send the full object.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("v2_delete", "unifi_delete_traffic_rule", "/v2/api/site/{site}/trafficrules", "traffic_rule", None, """Delete a traffic_rule (v2 API).
+
+        Args:
+            id: The ID of the traffic_rule to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- v2: Traffic_route ---
+    ("v2_list", "unifi_list_traffic_routes", "/v2/api/site/{site}/trafficroutes", "traffic_routes", None, """List all traffic_routes (v2 API).
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("v2_update", "unifi_update_traffic_route", "/v2/api/site/{site}/trafficroutes", "traffic_route", None, """Update a traffic_route (v2 API).
+
+        Args:
+            id: The ID of the traffic_route to update.
+            data: The FULL traffic_route object with your changes applied.
+                v2 API requires sending the complete object, not just changed fields.
+                First GET the current object, modify the fields you want, then send the full object.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+)
+
+
+def register_v2() -> None:
+    """Register the firewall module's v2 tools."""
+    _register_tool_table(_V2_TOOLS)
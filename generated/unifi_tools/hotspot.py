@@ -0,0 +1,346 @@
+"""UniFi MCP tools: hotspot module (auto-generated).
+
+Imported by server._enable_module() only when the module is enabled, so
+tools of disabled modules cost nothing at startup.
+
+Generated from controller version 10.0.162.
+
+DO NOT EDIT THIS FILE. All changes must be made in the generator.
+"""
+
+from __future__ import annotations
+
+# server.py registers itself as "unifi_server" before importing tool modules
+from unifi_server import (
+    _register_tool_table,
+)
+
+
+# v1 tool table: (kind, tool name, path, label, options, docstring) rows that
+# server._register_tool_table() turns into typed tools (see server._ToolSpec)
+_V1_TOOLS = (
+    # --- Hotspot2_config CRUD ---
+    ("list", "unifi_list_hotspot2_configs", "rest/hotspot2conf", "hotspot2_configs", None, """List all hotspot2_configs.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_hotspot2_config", "rest/hotspot2conf", "hotspot2_config", None, """Get a single hotspot2_config by ID.
+
+        Args:
+            id: The _id of the hotspot2_config.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_hotspot2_config", "rest/hotspot2conf", "hotspot2_config", None, """Create a new hotspot2_config.
+
+        Args:
+            data: Hotspot2_config configuration.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_hotspot2_config", "rest/hotspot2conf", "hotspot2_config", None, """Update an existing hotspot2_config.
+
+        Args:
+            id: The _id of the hotspot2_config to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_hotspot2_config", "rest/hotspot2conf", "hotspot2_config", None, """Delete a hotspot2_config.
+
+        Args:
+            id: The _id of the hotspot2_config to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Hotspot_operator CRUD ---
+    ("list", "unifi_list_hotspot_operators", "rest/hotspotop", "hotspot_operators", None, """List all hotspot_operators.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_hotspot_operator", "rest/hotspotop", "hotspot_operator", None, """Get a single hotspot_operator by ID.
+
+        Args:
+            id: The _id of the hotspot_operator.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_hotspot_operator", "rest/hotspotop", "hotspot_operator", None, """Create a new hotspot_operator.
+
+        Args:
+            data: Hotspot_operator configuration.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_hotspot_operator", "rest/hotspotop", "hotspot_operator", None, """Update an existing hotspot_operator.
+
+        Args:
+            id: The _id of the hotspot_operator to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_hotspot_operator", "rest/hotspotop", "hotspot_operator", None, """Delete a hotspot_operator.
+
+        Args:
+            id: The _id of the hotspot_operator to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Hotspot_package CRUD ---
+    ("list", "unifi_list_hotspot_packages", "rest/hotspotpackage", "hotspot_packages", None, """List all hotspot_packages.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_hotspot_package", "rest/hotspotpackage", "hotspot_package", None, """Get a single hotspot_package by ID.
+
+        Args:
+            id: The _id of the hotspot_package.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_hotspot_package", "rest/hotspotpackage", "hotspot_package", None, """Create a new hotspot_package.
+
+        Args:
+            data: Hotspot_package configuration.
+                Required: name (str), amount (int, price in cents, 0=free), currency (str, e.g. 'USD'), hours (int, access duration in hours), bytes (int, bandwidth limit, 0=unlimited). Note: Requires hotspot portal + payment gateway configured on the controller.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_hotspot_package", "rest/hotspotpackage", "hotspot_package", None, """Update an existing hotspot_package.
+
+        Args:
+            id: The _id of the hotspot_package to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_hotspot_package", "rest/hotspotpackage", "hotspot_package", None, """Delete a hotspot_package.
+
+        Args:
+            id: The _id of the hotspot_package to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Radius_account CRUD ---
+    ("list", "unifi_list_radius_accounts", "rest/radiusaccount", "radius_accounts", None, """List all radius_accounts.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_radius_account", "rest/radiusaccount", "radius_account", None, """Get a single radius_account by ID.
+
+        Args:
+            id: The _id of the radius_account.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_radius_account", "rest/radiusaccount", "radius_account", None, """Create a new radius_account.
+
+        Args:
+            data: Radius_account configuration.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_radius_account", "rest/radiusaccount", "radius_account", None, """Update an existing radius_account.
+
+        Args:
+            id: The _id of the radius_account to update.
+            data: Fields to update.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_radius_account", "rest/radiusaccount", "radius_account", None, """Delete a radius_account.
+
+        Args:
+            id: The _id of the radius_account to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Radius_profile CRUD ---
+    ("list", "unifi_list_radius_profiles", "rest/radiusprofile", "radius_profiles", None, """List all radius_profiles.
+
+        Field reference: unifi_describe_fields("unifi_list_radius_profiles")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_radius_profile", "rest/radiusprofile", "radius_profile", None, """Get a single radius_profile by ID.
+
+        Args:
+            id: The _id of the radius_profile.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_radius_profile", "rest/radiusprofile", "radius_profile", None, """Create a new radius_profile.
+
+        Args:
+            data: Radius_profile configuration.
+                Field reference: unifi_describe_fields("unifi_create_radius_profile")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Tip: Reference this profile's _id as radiusprofile_id when configuring WLANs with 802.1X authentication.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_radius_profile", "rest/radiusprofile", "radius_profile", None, """Update an existing radius_profile.
+
+        Args:
+            id: The _id of the radius_profile to update.
+            data: Fields to update.
+                Field reference: unifi_describe_fields("unifi_update_radius_profile")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Tip: Reference this profile's _id as radiusprofile_id when configuring WLANs with 802.1X authentication.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_radius_profile", "rest/radiusprofile", "radius_profile", None, """Delete a radius_profile.
+
+        Args:
+            id: The _id of the radius_profile to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_payments", "stat/payment", "payments", None, """List payments statistics.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_vouchers", "stat/voucher", "vouchers", None, """List vouchers statistics.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_hotspot_authorize_guest", "cmd/hotspot", "authorize-guest", {"params": (("mac", "str"), ("minutes", "int"), ), "mutation": True}, """Execute 'authorize-guest' via hotspot.
+
+        Args:
+            mac: mac parameter (str).
+        Args:
+            minutes: minutes parameter (int).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_create_voucher", "cmd/hotspot", "create-voucher", {"params": (("expire", "int"), ("n", "int"), ("quota", "int"), ), "mutation": True}, """Execute 'create-voucher' via hotspot.
+
+        Args:
+            expire: expire parameter (int).
+        Args:
+            n: n parameter (int).
+        Args:
+            quota: quota parameter (int).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_revoke_voucher", "cmd/hotspot", "revoke-voucher", {"params": (("_id", "str"), ), "mutation": True}, """Execute 'revoke-voucher' via hotspot.
+
+        Args:
+            _id: _id parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_extend_guest_validity", "cmd/hotspot", "extend-guest-validity", {"params": (("_id", "str"), ), "mutation": True}, """Execute 'extend-guest-validity' via hotspot.
+
+        Args:
+            _id: _id parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_delete_voucher", "cmd/hotspot", "delete-voucher", {"params": (("_id", "str"), ), "mutation": True}, """Execute 'delete-voucher' via hotspot.
+
+        Args:
+            _id: _id parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+)
+
+
+def register_v1() -> None:
+    """Register the hotspot module's v1 tools."""
+    _register_tool_table(_V1_TOOLS)
@@ -0,0 +1,860 @@
+"""UniFi MCP tools: monitor module (auto-generated).
+
+Imported by server._enable_module() only when the module is enabled, so
+tools of disabled modules cost nothing at startup.
+
+Generated from controller version 10.0.162.
+
+DO NOT EDIT THIS FILE. All changes must be made in the generator.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+
+# server.py registers itself as "unifi_server" before importing tool modules
+from unifi_server import (
+    UNIFI_SITE,
+    _EVENT_ARCHIVE_PATHS,
+    _REPORT_DEFAULT_ATTRS,
+    _REPORT_OBJECT_KEYS,
+    _downsample_report,
+    _event_archive_db,
+    _event_archive_search,
+    _event_archive_sync,
+    _event_query_body,
+    _format_response,
+    _get_client,
+    _paginate_and_filter,
+    _parse_report,
+    _plan_report_segments,
+    _register_tool_table,
+    _report_body,
+    _timeseries_db,
+    _timeseries_query,
+    _timeseries_sync,
+    _tool_error,
+    _validate_mac,
+    mcp,
+)
+
+
+# v1 tool table: (kind, tool name, path, label, options, docstring) rows that
+# server._register_tool_table() turns into typed tools (see server._ToolSpec)
+_V1_TOOLS = (
+    ("stat", "unifi_list_anomalies", "stat/anomalies", "anomalies", None, """List anomalies statistics.
+
+        Note: site anomalies (unpoller). Supports ?scale=hourly&end=<timestamp>
+
+        Field reference: unifi_describe_fields("unifi_list_anomalies")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_authorizations", "stat/authorization", "authorizations", {"body": {}}, """List authorizations statistics.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_dashboard", "stat/dashboard", "dashboard", None, """List dashboard statistics.
+
+        Field reference: unifi_describe_fields("unifi_list_dashboard")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_dpi_stats", "stat/dpi", "dpi_stats", {"gateway": True}, """List dpi_stats statistics.
+
+        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_dynamic_dns_stats", "stat/dynamicdns", "dynamic_dns_stats", {"gateway": True}, """List dynamic_dns_stats statistics.
+
+        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_gateway_stats", "stat/gateway", "gateway_stats", {"gateway": True}, """List gateway_stats statistics.
+
+        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_health", "stat/health", "health", None, """List health statistics.
+
+        Field reference: unifi_describe_fields("unifi_list_health")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_ips_events", "stat/ips/event", "ips_events", {"body": {}}, """List ips_events statistics.
+
+        Note: IDS/IPS events — singular form (unpoller APIEventPathIDS)
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_port_forward_stats", "stat/portforward", "port_forward_stats", {"gateway": True}, """List port_forward_stats statistics.
+
+        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_remote_user_vpn", "stat/remoteuservpn", "remote_user_vpn", None, """List remote_user_vpn statistics.
+
+        Note: remote user VPN stats
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_report_5min_ap", "stat/report/5minutes.ap", "report_5min_ap", {"report": True, "macs": True}, """List report_5min_ap statistics.
+
+        Args:
+            start: Window start, epoch milliseconds (0 = controller default).
+            end: Window end, epoch milliseconds (0 = now).
+            attrs: Comma-separated attributes to compute (e.g. 'bytes,num_sta'). 'time' is always included. Empty = controller defaults.
+            macs: Comma-separated MACs to restrict ap/user/gw reports to (e.g. 'aa:bb:cc:dd:ee:ff'). Empty = all objects.
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_report_5min_gateway", "stat/report/5minutes.gw", "report_5min_gateway", {"report": True, "macs": True, "gateway": True}, """List report_5min_gateway statistics.
+
+        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
+
+        Args:
+            start: Window start, epoch milliseconds (0 = controller default).
+            end: Window end, epoch milliseconds (0 = now).
+            attrs: Comma-separated attributes to compute (e.g. 'bytes,num_sta'). 'time' is always included. Empty = controller defaults.
+            macs: Comma-separated MACs to restrict ap/user/gw reports to (e.g. 'aa:bb:cc:dd:ee:ff'). Empty = all objects.
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_speedtest_results", "stat/report/archive.speedtest", "speedtest_results", {"report": True, "gateway": True}, """List speedtest_results statistics.
+
+        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
+
+        Args:
+            start: Window start, epoch milliseconds (0 = controller default).
+            end: Window end, epoch milliseconds (0 = now).
+            attrs: Comma-separated attributes to compute (e.g. 'bytes,num_sta'). 'time' is always included. Empty = controller defaults.
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_report_daily_gateway", "stat/report/daily.gw", "report_daily_gateway", {"report": True, "macs": True, "gateway": True}, """List report_daily_gateway statistics.
+
+        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
+
+        Args:
+            start: Window start, epoch milliseconds (0 = controller default).
+            end: Window end, epoch milliseconds (0 = now).
+            attrs: Comma-separated attributes to compute (e.g. 'bytes,num_sta'). 'time' is always included. Empty = controller defaults.
+            macs: Comma-separated MACs to restrict ap/user/gw reports to (e.g. 'aa:bb:cc:dd:ee:ff'). Empty = all objects.
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_report_hourly_gateway", "stat/report/hourly.gw", "report_hourly_gateway", {"report": True, "macs": True, "gateway": True}, """List report_hourly_gateway statistics.
+
+        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
+
+        Args:
+            start: Window start, epoch milliseconds (0 = controller default).
+            end: Window end, epoch milliseconds (0 = now).
+            attrs: Comma-separated attributes to compute (e.g. 'bytes,num_sta'). 'time' is always included. Empty = controller defaults.
+            macs: Comma-separated MACs to restrict ap/user/gw reports to (e.g. 'aa:bb:cc:dd:ee:ff'). Empty = all objects.
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_report_monthly_ap", "stat/report/monthly.ap", "report_monthly_ap", {"report": True, "macs": True}, """List report_monthly_ap statistics.
+
+        Args:
+            start: Window start, epoch milliseconds (0 = controller default).
+            end: Window end, epoch milliseconds (0 = now).
+            attrs: Comma-separated attributes to compute (e.g. 'bytes,num_sta'). 'time' is always included. Empty = controller defaults.
+            macs: Comma-separated MACs to restrict ap/user/gw reports to (e.g. 'aa:bb:cc:dd:ee:ff'). Empty = all objects.
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_report_monthly_gateway", "stat/report/monthly.gw", "report_monthly_gateway", {"report": True, "macs": True, "gateway": True}, """List report_monthly_gateway statistics.
+
+        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
+
+        Args:
+            start: Window start, epoch milliseconds (0 = controller default).
+            end: Window end, epoch milliseconds (0 = now).
+            attrs: Comma-separated attributes to compute (e.g. 'bytes,num_sta'). 'time' is always included. Empty = controller defaults.
+            macs: Comma-separated MACs to restrict ap/user/gw reports to (e.g. 'aa:bb:cc:dd:ee:ff'). Empty = all objects.
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_report_monthly_site", "stat/report/monthly.site", "report_monthly_site", {"report": True}, """List report_monthly_site statistics.
+
+        Args:
+            start: Window start, epoch milliseconds (0 = controller default).
+            end: Window end, epoch milliseconds (0 = now).
+            attrs: Comma-separated attributes to compute (e.g. 'bytes,num_sta'). 'time' is always included. Empty = controller defaults.
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_report_monthly_user", "stat/report/monthly.user", "report_monthly_user", {"report": True, "macs": True}, """List report_monthly_user statistics.
+
+        Args:
+            start: Window start, epoch milliseconds (0 = controller default).
+            end: Window end, epoch milliseconds (0 = now).
+            attrs: Comma-separated attributes to compute (e.g. 'bytes,num_sta'). 'time' is always included. Empty = controller defaults.
+            macs: Comma-separated MACs to restrict ap/user/gw reports to (e.g. 'aa:bb:cc:dd:ee:ff'). Empty = all objects.
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_rogue_aps", "stat/rogueap", "rogue_aps", None, """List rogue_aps statistics.
+
+        Field reference: unifi_describe_fields("unifi_list_rogue_aps")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_routing_stats", "stat/routing", "routing_stats", {"gateway": True}, """List routing_stats statistics.
+
+        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_sdn_status", "stat/sdn", "sdn_status", None, """List sdn_status statistics.
+
+        Field reference: unifi_describe_fields("unifi_list_sdn_status")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_site_dpi", "stat/sitedpi", "site_dpi", {"gateway": True}, """List site_dpi statistics.
+
+        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_client_dpi", "stat/stadpi", "client_dpi", {"gateway": True}, """List client_dpi statistics.
+
+        Note: Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_sysinfo", "stat/sysinfo", "sysinfo", None, """List sysinfo statistics.
+
+        Field reference: unifi_describe_fields("unifi_list_sysinfo")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_alarm_archive", "cmd/alarm", "archive", {"params": (("_id", "str"), ), "mutation": True}, """Execute 'archive' via alarm.
+
+        Args:
+            _id: _id parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_archive_all_alarms", "cmd/evtmgr", "archive-all-alarms", {"params": (), "mutation": True}, """Execute 'archive-all-alarms' via evtmgr.
+
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_archive_alarm", "cmd/evtmgr", "archive-alarm", {"params": (("_id", "str"), ), "mutation": True}, """Execute 'archive-alarm' via evtmgr.
+
+        Args:
+            _id: _id parameter (str).
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("cmd", "unifi_clear_dpi", "cmd/stat", "reset-dpi", {"params": (), "mutation": True}, """Execute 'reset-dpi' via stat.
+
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name override (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+)
+
+
+def register_v1() -> None:
+    """Register the monitor module's v1 tools."""
+    _register_tool_table(_V1_TOOLS)
+
+    # --- Alarm (read-only, queried on the controller) ---
+
+    @mcp.tool()
+    async def unifi_list_alarms(
+        within_hours: int = 0,
+        archived: str = "",
+        site: str = "",
+        limit: int = 0,
+        offset: int = 0,
+        fields: str = "",
+    ) -> dict:
+        """List alarms, newest first.
+
+        Filtering and pagination run on the controller (stat/alarm POST),
+        so only the requested page is transferred.
+
+        Field reference: unifi_describe_fields("unifi_list_alarms")
+
+        Args:
+            within_hours: Only alarms from the last N hours (0 = controller default).
+            archived: 'false' = active alarms only, 'true' = archived only, '' = both.
+            site: Site name (default: from env).
+            limit: Max records to return (0 = controller default page, 3000 records; page with offset for more).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """
+        try:
+            if archived not in ("", "true", "false"):
+                return _tool_error(f"archived must be 'true', 'false' or '', got '{archived}'")
+            body = _event_query_body(limit, offset, within_hours, archived)
+            client = await _get_client()
+            data = await client.request("POST", "stat/alarm", json_data=body, site=site or None)
+            # offset/limit were applied by the controller; only project fields here
+            data, missing = _paginate_and_filter(data, 0, 0, fields)
+            return _format_response(data, f"Found {len(data)} alarms", missing_fields=missing)
+        except RuntimeError as e:
+            return _tool_error(e)
+
+
+
+    # --- Event (read-only, queried on the controller) ---
+
+    @mcp.tool()
+    async def unifi_list_events(
+        within_hours: int = 0,
+        site: str = "",
+        limit: int = 0,
+        offset: int = 0,
+        fields: str = "",
+    ) -> dict:
+        """List events, newest first.
+
+        Filtering and pagination run on the controller (stat/event POST),
+        so only the requested page is transferred.
+
+        Field reference: unifi_describe_fields("unifi_list_events")
+
+        Args:
+            within_hours: Only events from the last N hours (0 = controller default).
+            site: Site name (default: from env).
+            limit: Max records to return (0 = controller default page, 3000 records; page with offset for more).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """
+        try:
+            body = _event_query_body(limit, offset, within_hours)
+            client = await _get_client()
+            data = await client.request("POST", "stat/event", json_data=body, site=site or None)
+            # offset/limit were applied by the controller; only project fields here
+            data, missing = _paginate_and_filter(data, 0, 0, fields)
+            return _format_response(data, f"Found {len(data)} events", missing_fields=missing)
+        except RuntimeError as e:
+            return _tool_error(e)
+
+
+
+    @mcp.tool()
+    async def unifi_list_stat_alarms(
+        within_hours: int = 0,
+        archived: str = "",
+        site: str = "",
+        limit: int = 0,
+        offset: int = 0,
+        fields: str = "",
+    ) -> dict:
+        """List alarms, newest first.
+
+        Filtering and pagination run on the controller (stat/alarm POST),
+        so only the requested page is transferred.
+
+        Field reference: unifi_describe_fields("unifi_list_stat_alarms")
+
+        Args:
+            within_hours: Only alarms from the last N hours (0 = controller default).
+            archived: 'false' = active alarms only, 'true' = archived only, '' = both.
+            site: Site name (default: from env).
+            limit: Max records to return (0 = controller default page, 3000 records; page with offset for more).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """
+        try:
+            if archived not in ("", "true", "false"):
+                return _tool_error(f"archived must be 'true', 'false' or '', got '{archived}'")
+            body = _event_query_body(limit, offset, within_hours, archived)
+            client = await _get_client()
+            data = await client.request("POST", "stat/alarm", json_data=body, site=site or None)
+            # offset/limit were applied by the controller; only project fields here
+            data, missing = _paginate_and_filter(data, 0, 0, fields)
+            return _format_response(data, f"Found {len(data)} alarms", missing_fields=missing)
+        except RuntimeError as e:
+            return _tool_error(e)
+
+
+
+
+
+
+
+
+    @mcp.tool()
+    async def unifi_list_stat_events(
+        within_hours: int = 0,
+        site: str = "",
+        limit: int = 0,
+        offset: int = 0,
+        fields: str = "",
+    ) -> dict:
+        """List events, newest first.
+
+        Filtering and pagination run on the controller (stat/event POST),
+        so only the requested page is transferred.
+
+        Field reference: unifi_describe_fields("unifi_list_stat_events")
+
+        Args:
+            within_hours: Only events from the last N hours (0 = controller default).
+            site: Site name (default: from env).
+            limit: Max records to return (0 = controller default page, 3000 records; page with offset for more).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """
+        try:
+            body = _event_query_body(limit, offset, within_hours)
+            client = await _get_client()
+            data = await client.request("POST", "stat/event", json_data=body, site=site or None)
+            # offset/limit were applied by the controller; only project fields here
+            data, missing = _paginate_and_filter(data, 0, 0, fields)
+            return _format_response(data, f"Found {len(data)} events", missing_fields=missing)
+        except RuntimeError as e:
+            return _tool_error(e)
+
+
+
+
+
+
+
+
+    @mcp.tool()
+    async def unifi_list_report(
+        interval: str = "hourly",
+        report_type: str = "site",
+        start: int = 0,
+        end: int = 0,
+        attrs: str = "",
+        macs: str = "",
+        site: str = "",
+        limit: int = 0,
+        offset: int = 0,
+        fields: str = "",
+    ) -> dict:
+        """Get statistical reports.
+
+        Args:
+            interval: Report interval: '5minutes', 'hourly', or 'daily'.
+            report_type: Report type: 'site', 'user', 'ap'.
+            start: Window start, epoch milliseconds (0 = controller default).
+            end: Window end, epoch milliseconds (0 = now).
+            attrs: Comma-separated attributes to compute (e.g. 'bytes,num_sta'). 'time' is always included. Empty = controller defaults.
+            macs: Comma-separated MACs to restrict ap/user/gw reports to (e.g. 'aa:bb:cc:dd:ee:ff'). Empty = all objects.
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        Note: intervals: 5minutes, hourly, daily, monthly; types: site, ap, user, gw
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """
+        try:
+            client = await _get_client()
+            path = f"stat/report/{interval}.{report_type}"
+            body = _report_body(start, end, attrs, macs)
+            data = await client.request("POST", path, json_data=body, site=site or None)
+            total = len(data)
+            data, missing = _paginate_and_filter(data, limit, offset, fields)
+            return _format_response(data, f"Found {total} report records", missing_fields=missing)
+        except RuntimeError as e:
+            return _tool_error(e)
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+    # ===========================================================================
+    # Special: Local History
+    # ===========================================================================
+
+    @mcp.tool()
+    async def unifi_query_timeseries(
+        report: str = "5minutes.ap",
+        start: int = 0,
+        end: int = 0,
+        macs: str = "",
+        attrs: str = "",
+        agg: str = "",
+        sync: bool = True,
+        site: str = "",
+        limit: int = 0,
+        offset: int = 0,
+        fields: str = "",
+    ) -> dict:
+        """Query report history from the local time-series store.
+
+        Requires UNIFI_TIMESERIES_DB. Before answering, new report rows are pulled
+        incrementally from the controller (from the last stored sample per MAC and
+        attribute; attrs never pulled before are backfilled), so history older than
+        the controller's retention keeps accumulating locally.
+        Use agg for questions like "which AP had the highest traffic last week".
+
+        Args:
+            report: Report as '<interval>.<type>': interval 5minutes/hourly/daily/monthly, type site/ap/user/gw (e.g. 'hourly.gw').
+            start: Range start, epoch milliseconds (0 = 24 hours before end).
+            end: Range end, epoch milliseconds (0 = now).
+            macs: Comma-separated MACs to restrict to (e.g. 'aa:bb:cc:dd:ee:ff'). Empty = all objects.
+            attrs: Comma-separated attributes (e.g. 'bytes,num_sta'). Also pulled on sync in addition to the defaults.
+            agg: Aggregate per MAC over the range: 'avg', 'min', 'max' or 'sum'. Empty = raw samples.
+            sync: Pull new rows from the controller before querying (False = local data only).
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'mac,avg_bytes').
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """
+        try:
+            conn = _timeseries_db()
+            _parse_report(report)
+            effective_site = site or UNIFI_SITE
+            now_ms = int(time.time() * 1000)
+            end = end or now_ms
+            start = start or end - 24 * 3600 * 1000
+            mac_list = [m.strip().lower() for m in macs.split(",") if m.strip()]
+            for m in mac_list:
+                mac_err = _validate_mac(m)
+                if mac_err:
+                    return _tool_error(mac_err)
+            attr_list = [a.strip() for a in attrs.split(",") if a.strip()]
+
+            note = None
+            if sync:
+                client = await _get_client()
+                received = await _timeseries_sync(client, conn, effective_site, report, mac_list, attr_list, now_ms)
+                note = f"Synced {received} rows from stat/report/{report}"
+
+            data = _timeseries_query(conn, effective_site, report, start, end, mac_list, attr_list, agg)
+            total = len(data)
+            data, missing = _paginate_and_filter(data, limit, offset, fields)
+            return _format_response(data, f"Found {total} {report} records", missing_fields=missing, note=note)
+        except RuntimeError as e:
+            return _tool_error(e)
+
+
+    # ===========================================================================
+    # Special: Event Archive Search
+    # ===========================================================================
+
+    @mcp.tool()
+    async def unifi_search_events(
+        query: str = "",
+        key: str = "",
+        mac: str = "",
+        since: int = 0,
+        until: int = 0,
+        kind: str = "",
+        sync: bool = True,
+        site: str = "",
+        limit: int = 50,
+        offset: int = 0,
+        fields: str = "",
+    ) -> dict:
+        """Search archived events and alarms by text, event key, MAC and time.
+
+        Requires UNIFI_EVENT_ARCHIVE_DB. New events/alarms are pulled
+        incrementally before searching (only records not yet archived), and the
+        search runs on a local full-text index, so weeks of history can be
+        searched without re-downloading the log. Examples: query='radar' for DFS
+        events, mac='aa:bb:cc:dd:ee:ff' with query='roam' for roaming history.
+
+        Args:
+            query: Words that must all appear in msg, key or device/client names (e.g. 'radar', 'disconnected'). 'roam*' matches prefixes.
+            key: Exact event key (e.g. 'EVT_WU_Roam', 'EVT_AP_RadarDetected').
+            mac: Only records mentioning this MAC in any field (ap, user, sw, gw, ...).
+            since: Only records at or after this time, epoch milliseconds.
+            until: Only records at or before this time, epoch milliseconds.
+            kind: 'event' or 'alarm' (empty = both).
+            sync: Pull new events/alarms from the controller first (False = archive only).
+            site: Site name (default: from env).
+            limit: Max records to return (default 50, 0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'time,key,msg').
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """
+        try:
+            if kind and kind not in _EVENT_ARCHIVE_PATHS:
+                return _tool_error(f"kind must be 'event', 'alarm' or '', got '{kind}'")
+            if mac:
+                mac_err = _validate_mac(mac)
+                if mac_err:
+                    return _tool_error(mac_err)
+            conn = _event_archive_db()
+            effective_site = site or UNIFI_SITE
+
+            note = None
+            if sync:
+                client = await _get_client()
+                synced = [
+                    f"{await _event_archive_sync(client, conn, effective_site, k)} new {k}s"
+                    for k in ([kind] if kind else list(_EVENT_ARCHIVE_PATHS))
+                ]
+                note = "Synced " + ", ".join(synced)
+
+            try:
+                data = _event_archive_search(conn, effective_site, query, key, mac, since, until, kind, limit, offset)
+            except sqlite3.OperationalError as e:
+                return _tool_error(f"Invalid search query '{query}': {e}")
+            data, missing = _paginate_and_filter(data, 0, 0, fields)
+            return _format_response(data, f"Found {len(data)} matching events/alarms", missing_fields=missing, note=note)
+        except RuntimeError as e:
+            return _tool_error(e)
+
+
+    # ===========================================================================
+    # Special: Report Granularity Planner
+    # ===========================================================================
+
+    @mcp.tool()
+    async def unifi_get_report(
+        scope: str = "site",
+        macs: str = "",
+        start: int = 0,
+        end: int = 0,
+        max_points: int = 200,
+        attrs: str = "",
+        site: str = "",
+    ) -> dict:
+        """Get a report series over any time range without picking the interval yourself.
+
+        Chooses the finest of 5minutes/hourly/daily/monthly that fits max_points,
+        fetches older parts of the range from coarser reports once the fine data
+        has aged out on the controller, and downsamples to max_points buckets
+        per object (attr_min/attr_avg/attr_max) when still too many points.
+        Each point carries its source interval; byte counters are per-bucket
+        totals, so compare values within the same interval.
+
+        Args:
+            scope: Report type: 'site', 'ap', 'user' or 'gw'.
+            macs: Comma-separated MACs to restrict ap/user/gw reports to. Empty = all objects.
+            start: Range start, epoch milliseconds (0 = 24 hours before end).
+            end: Range end, epoch milliseconds (0 = now).
+            max_points: Max points per object in the response (default 200).
+            attrs: Comma-separated attributes (e.g. 'bytes,num_sta'). Empty = scope defaults.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """
+        try:
+            if scope not in _REPORT_OBJECT_KEYS:
+                return _tool_error(f"Unknown scope '{scope}'. Expected one of: {', '.join(_REPORT_OBJECT_KEYS)}.")
+            if max_points < 1:
+                return _tool_error("max_points must be at least 1")
+            mac_list = [m.strip().lower() for m in macs.split(",") if m.strip()]
+            for m in mac_list:
+                mac_err = _validate_mac(m)
+                if mac_err:
+                    return _tool_error(mac_err)
+            attr_list = [a.strip() for a in attrs.split(",") if a.strip()] or _REPORT_DEFAULT_ATTRS[scope]
+            now_ms = int(time.time() * 1000)
+            end = end or now_ms
+            start = start or end - 24 * 3600 * 1000
+
+            segments = _plan_report_segments(start, end, max_points, now_ms)
+            client = await _get_client()
+            results = await asyncio.gather(*(
+                client.request(
+                    "POST",
+                    f"stat/report/{interval}.{scope}",
+                    json_data=_report_body(seg_start, seg_end, ",".join(attr_list), ",".join(mac_list)),
+                    site=site or None,
+                )
+                for interval, seg_start, seg_end in segments
+            ))
+
+            obj_key = _REPORT_OBJECT_KEYS[scope]
+            rows: list[dict] = []
+            for (interval, seg_start, seg_end), data in zip(segments, results):
+                for r in data:
+                    if not isinstance(r, dict) or not isinstance(r.get("time"), (int, float)):
+                        continue
+                    # Segment bounds are inclusive on the controller; keep each bucket once
+                    if not seg_start <= r["time"] <= seg_end:
+                        continue
+                    row = {"time": int(r["time"])}
+                    if obj_key:
+                        row["mac"] = str(r.get(obj_key, "")).lower()
+                    row["interval"] = interval
+                    row.update({a: r.get(a) for a in attr_list})
+                    rows.append(row)
+            rows.sort(key=lambda r: (r.get("mac", ""), r["time"]))
+            fetched = len(rows)
+            data = _downsample_report(rows, attr_list, start, end, max_points)
+
+            plan = ", ".join(f"{i} {s0}..{s1}" for i, s0, s1 in segments)
+            summary = f"Found {len(data)} {scope} report points ({fetched} fetched)"
+            return _format_response(data, summary, note=f"Plan: {plan}")
+        except RuntimeError as e:
+            return _tool_error(e)
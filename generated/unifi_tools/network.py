@@ -0,0 +1,138 @@
+"""UniFi MCP tools: network module (auto-generated).
+
+Imported by server._enable_module() only when the module is enabled, so
+tools of disabled modules cost nothing at startup.
+
+Generated from controller version 10.0.162.
+
+DO NOT EDIT THIS FILE. All changes must be made in the generator.
+"""
+
+from __future__ import annotations
+
+# server.py registers itself as "unifi_server" before importing tool modules
+from unifi_server import (
+    _register_tool_table,
+)
+
+
+# v1 tool table: (kind, tool name, path, label, options, docstring) rows that
+# server._register_tool_table() turns into typed tools (see server._ToolSpec)
+_V1_TOOLS = (
+    # --- Network CRUD ---
+    ("list", "unifi_list_networks", "rest/networkconf", "networks", None, """List all networks.
+
+        Field reference: unifi_describe_fields("unifi_list_networks")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_network", "rest/networkconf", "network", None, """Get a single network by ID.
+
+        Args:
+            id: The _id of the network.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_network", "rest/networkconf", "network", None, """Create a new network.
+
+        Args:
+            data: Network configuration.
+                Field reference: unifi_describe_fields("unifi_create_network")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Tip: Use this network's _id as native_networkconf_id in port profiles or networkconf_id in WLANs.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_network", "rest/networkconf", "network", None, """Update an existing network.
+
+        Args:
+            id: The _id of the network to update.
+            data: Fields to update.
+                Field reference: unifi_describe_fields("unifi_update_network")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Tip: Use this network's _id as native_networkconf_id in port profiles or networkconf_id in WLANs.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_network", "rest/networkconf", "network", None, """Delete a network.
+
+        Args:
+            id: The _id of the network to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Port_profile CRUD ---
+    ("list", "unifi_list_port_profiles", "rest/portconf", "port_profiles", None, """List all port_profiles.
+
+        Field reference: unifi_describe_fields("unifi_list_port_profiles")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_port_profile", "rest/portconf", "port_profile", None, """Get a single port_profile by ID.
+
+        Args:
+            id: The _id of the port_profile.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_port_profile", "rest/portconf", "port_profile", None, """Create a new port_profile.
+
+        Args:
+            data: Port_profile configuration.
+                Field reference: unifi_describe_fields("unifi_create_port_profile")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Tip: Apply this profile to switch ports via unifi_set_port_override with portconf_id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_port_profile", "rest/portconf", "port_profile", None, """Update an existing port_profile.
+
+        Args:
+            id: The _id of the port_profile to update.
+            data: Fields to update.
+                Field reference: unifi_describe_fields("unifi_update_port_profile")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Tip: Apply this profile to switch ports via unifi_set_port_override with portconf_id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_port_profile", "rest/portconf", "port_profile", None, """Delete a port_profile.
+
+        Args:
+            id: The _id of the port_profile to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+)
+
+
+def register_v1() -> None:
+    """Register the network module's v1 tools."""
+    _register_tool_table(_V1_TOOLS)
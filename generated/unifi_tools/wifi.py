@@ -0,0 +1,205 @@
+"""UniFi MCP tools: wifi module (auto-generated).
+
+Imported by server._enable_module() only when the module is enabled, so
+tools of disabled modules cost nothing at startup.
+
+Generated from controller version 10.0.162.
+
+DO NOT EDIT THIS FILE. All changes must be made in the generator.
+"""
+
+from __future__ import annotations
+
+# server.py registers itself as "unifi_server" before importing tool modules
+from unifi_server import (
+    _register_tool_table,
+)
+
+
+# v1 tool table: (kind, tool name, path, label, options, docstring) rows that
+# server._register_tool_table() turns into typed tools (see server._ToolSpec)
+_V1_TOOLS = (
+    # --- Channel_plan (read-only) ---
+    ("list", "unifi_list_channel_plans", "rest/channelplan", "channel_plans", None, """List all channel_plans.
+
+        Returns channel_plans from the UniFi controller.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Wlan CRUD ---
+    ("list", "unifi_list_wlans", "rest/wlanconf", "wlans", None, """List all wlans.
+
+        Field reference: unifi_describe_fields("unifi_list_wlans")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_wlan", "rest/wlanconf", "wlan", None, """Get a single wlan by ID.
+
+        Args:
+            id: The _id of the wlan.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_wlan", "rest/wlanconf", "wlan", None, """Create a new wlan.
+
+        Args:
+            data: Wlan configuration.
+                Field reference: unifi_describe_fields("unifi_create_wlan")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Tip: Requires a network (networkconf_id from unifi_list_networks) and at least one adopted AP.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_wlan", "rest/wlanconf", "wlan", None, """Update an existing wlan.
+
+        Args:
+            id: The _id of the wlan to update.
+            data: Fields to update.
+                Field reference: unifi_describe_fields("unifi_update_wlan")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        Tip: Requires a network (networkconf_id from unifi_list_networks) and at least one adopted AP.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_wlan", "rest/wlanconf", "wlan", None, """Delete a wlan.
+
+        Args:
+            id: The _id of the wlan to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+
+    # --- Wlan_group CRUD ---
+    ("list", "unifi_list_wlan_groups", "rest/wlangroup", "wlan_groups", None, """List all wlan_groups.
+
+        Field reference: unifi_describe_fields("unifi_list_wlan_groups")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("get", "unifi_get_wlan_group", "rest/wlangroup", "wlan_group", None, """Get a single wlan_group by ID.
+
+        Args:
+            id: The _id of the wlan_group.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("create", "unifi_create_wlan_group", "rest/wlangroup", "wlan_group", None, """Create a new wlan_group.
+
+        Args:
+            data: Wlan_group configuration.
+                Field reference: unifi_describe_fields("unifi_create_wlan_group")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("update", "unifi_update_wlan_group", "rest/wlangroup", "wlan_group", None, """Update an existing wlan_group.
+
+        Args:
+            id: The _id of the wlan_group to update.
+            data: Fields to update.
+                Field reference: unifi_describe_fields("unifi_update_wlan_group")
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("delete", "unifi_delete_wlan_group", "rest/wlangroup", "wlan_group", None, """Delete a wlan_group.
+
+        Args:
+            id: The _id of the wlan_group to delete.
+            confirm: Must be True to execute. Returns preview if False.
+            site: Site name (default: from env).
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_country_codes", "stat/ccode", "country_codes", None, """List country_codes statistics.
+
+        Field reference: unifi_describe_fields("unifi_list_country_codes")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_current_channels", "stat/current-channel", "current_channels", None, """List current_channels statistics.
+
+        Field reference: unifi_describe_fields("unifi_list_current_channels")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+    ("stat", "unifi_list_spectrum_scans", "stat/spectrum-scan", "spectrum_scans", None, """List spectrum_scans statistics.
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+)
+
+
+def register_v1() -> None:
+    """Register the wifi module's v1 tools."""
+    _register_tool_table(_V1_TOOLS)
+
+
+# v2 tool table, same layout as _V1_TOOLS
+_V2_TOOLS = (
+    # --- v2: Ap_group ---
+    ("v2_list", "unifi_list_ap_groups", "/v2/api/site/{site}/apgroups", "ap_groups", None, """List all ap_groups (v2 API).
+
+        Field reference: unifi_describe_fields("unifi_list_ap_groups")
+
+        Args:
+            site: Site name (default: from env).
+            limit: Max records to return (0 = all).
+            offset: Number of records to skip.
+            fields: Comma-separated field names to include (e.g. 'name,mac'). Supports dot-notation for nested fields (e.g. 'port_table.port_idx,port_table.speed'). Always includes _id.
+
+        If this tool returns an unexpected error, call unifi_report_issue to report it.
+        """),
+)
+
+
+def register_v2() -> None:
+    """Register the wifi module's v2 tools."""
+    _register_tool_table(_V2_TOOLS)
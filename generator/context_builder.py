@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from generator.field_catalogue import build_field_catalogue, compress_catalogue, field_rows
 from generator.loader import APIInventory
 from generator.naming import (
     CLIENT_ENRICHMENT_STATS,
@@ -10,6 +11,7 @@ from generator.naming import (
     COMMAND_TOOL_NAMES,
     CRUD_REST,
     DEVICE_DEPENDENT_COMMANDS,
+    EVENT_QUERY_PATHS,
     FULL_OBJECT_UPDATE_REST,
     HARDWARE_DEPENDENT_REST,
     MODULE_ORDER,
@@ -23,6 +25,7 @@ from generator.naming import (
     MINIMAL_CREATE_PAYLOADS,
     MUTATION_COMMANDS,
     READ_ONLY_REST,
+    REPORT_MAC_TYPES,
     REQUIRED_CREATE_FIELDS,
     RESOURCE_NAMES,
     SAFE_TEST_COMMANDS,
@@ -36,6 +39,11 @@ from generator.naming import (
     WORKFLOW_HINTS,
 )
 from generator.schema_inference import FieldInfo, infer_schema
+from generator.search_index import (
+    build_field_index,
+    build_search_index,
+    build_trigram_index,
+)
 
 
 def _schema_to_dict(schema: dict[str, FieldInfo]) -> list[dict]:
@@ -142,6 +150,7 @@ def build_context(inventory: APIInventory) -> dict:
             "full_object_update": name in FULL_OBJECT_UPDATE_REST,
             "no_rest_delete": name in NO_REST_DELETE,
             "workflow_hint": WORKFLOW_HINTS.get(name, ""),
+            "query_path": EVENT_QUERY_PATHS.get(name, ""),
         }
         tool["module"] = REST_MODULES.get(name, "advanced")
         ctx["rest_tools"].append(tool)
@@ -178,6 +187,9 @@ def build_context(inventory: APIInventory) -> dict:
             "note": merged_note,
             "is_gateway_dependent": name in GATEWAY_DEPENDENT_STATS,
             "is_client_enrichable": name in CLIENT_ENRICHMENT_STATS,
+            "is_report": ep.path.startswith("stat/report/"),
+            "report_macs": ep.path.startswith("stat/report/") and ep.path.rsplit(".", 1)[-1] in REPORT_MAC_TYPES,
+            "query_path": EVENT_QUERY_PATHS.get(name, ""),
             "sample_fields": sample_fields,
             "known_fields": known_fields_stat,
         }
@@ -270,6 +282,19 @@ def build_context(inventory: APIInventory) -> dict:
     ctx["v2_by_module"] = dict(v2_by_module)
     ctx["module_order"] = MODULE_ORDER
 
+    # Which APIs each module has tools for; one generated/unifi_tools/<module>.py
+    # per entry (the device module always has the port override specials)
+    module_apis: dict[str, list[str]] = {}
+    for mod in MODULE_ORDER:
+        apis = []
+        if rest_by_module.get(mod) or stat_by_module.get(mod) or cmd_by_module.get(mod) or mod == "device":
+            apis.append("v1")
+        if v2_by_module.get(mod):
+            apis.append("v2")
+        if apis:
+            module_apis[mod] = apis
+    ctx["module_apis"] = module_apis
+
     # --- Build tool index for search_tools ---
     tool_index: list[dict] = []
 
@@ -355,11 +380,76 @@ def build_context(inventory: APIInventory) -> dict:
 
     # Always-on helpers
     tool_index.append({"name": "unifi_set_port_override", "description": "Configure switch port profiles and VLAN assignments", "module": "device", "keywords": _kw("set", "port", "override", "switch", "vlan", "poe", "device", "profile")})
+    tool_index.append({"name": "unifi_set_port_overrides", "description": "Configure many switch ports in one update (bulk port override)", "module": "device", "keywords": _kw("set", "port", "ports", "overrides", "override", "bulk", "switch", "vlan", "poe", "device", "profile")})
+    tool_index.append({"name": "unifi_query_timeseries", "description": "Query report history (min/avg/max/sum per MAC) from the local time-series store with incremental sync", "module": "monitor", "keywords": _kw("query", "timeseries", "history", "historical", "report", "trend", "utilization", "traffic", "aggregate", "monitor")})
+    tool_index.append({"name": "unifi_get_report", "description": "Report series over any time range: picks 5minutes/hourly/daily/monthly for max_points, stitches intervals, downsamples min/avg/max", "module": "monitor", "keywords": _kw("get", "report", "history", "historical", "range", "trend", "granularity", "downsample", "traffic", "utilization", "monitor")})
+    tool_index.append({"name": "unifi_search_events", "description": "Full-text search of archived events and alarms by words, event key, MAC and time range", "module": "monitor", "keywords": _kw("search", "events", "event", "alarms", "alarm", "log", "history", "grep", "roam", "radar", "dfs", "archive", "monitor")})
     tool_index.append({"name": "unifi_report_issue", "description": "Compose a gh issue create command for unexpected errors", "module": "global", "keywords": _kw("report", "issue", "error", "bug", "github")})
     tool_index.append({"name": "unifi_get_overview", "description": "Network overview in a single call: health, devices, networks, WLANs, clients, alarms", "module": "global", "keywords": _kw("overview", "summary", "health", "status", "network", "device", "client", "wlan", "alarm")})
     tool_index.append({"name": "unifi_search_tools", "description": "Search for UniFi MCP tools by keyword", "module": "global", "keywords": _kw("search", "tools", "find", "discover", "help", "list")})
+    tool_index.append({"name": "unifi_enable_module", "description": "Load a module's tools on demand (lazy tool loading)", "module": "global", "keywords": _kw("enable", "load", "module", "modules", "lazy", "tools", "activate")})
+    tool_index.append({"name": "unifi_describe_fields", "description": "Field types, enums, read-only flags and cross-references for a tool", "module": "global", "keywords": _kw("describe", "fields", "field", "schema", "type", "types", "enum", "values", "writable", "readonly", "reference")})
+    tool_index.append({"name": "unifi_search_fields", "description": "Find which tools return a field (typo-tolerant)", "module": "global", "keywords": _kw("search", "fields", "field", "find", "discover", "column", "attribute", "which", "endpoint")})
 
     ctx["tool_index"] = tool_index
+    ctx["search_index"] = build_search_index(tool_index)
+
+    # --- Field index for search_fields (field-inventory.json → list tools) ---
+    field_sources: list[dict] = []
+    for t in ctx["rest_tools"]:
+        if t["is_setting"]:
+            field_sources.append({"key": f"rest_{t['resource']}", "tool": "unifi_list_settings", "endpoint": t["path"]})
+        elif t["is_readonly"] or t["is_crud"]:
+            field_sources.append({"key": f"rest_{t['resource']}", "tool": f"unifi_list_{t['plural']}", "endpoint": t["path"]})
+    for t in ctx["stat_tools"]:
+        name = "unifi_list_report" if t["resource"] == "report" else f"unifi_list_{t['display_name']}"
+        field_sources.append({"key": f"stat_{t['resource']}", "tool": name, "endpoint": t["path"]})
+    for t in ctx["v2_tools"]:
+        if "GET" in t["methods"]:
+            field_sources.append({"key": f"v2_{t['resource']}", "tool": f"unifi_list_{t['plural']}", "endpoint": t["path"]})
+    for src in field_sources:
+        src["fields"] = [f for f in fi.get(src.pop("key"), []) if f != "_id"]
+    ctx["field_index"] = build_field_index(field_sources)
+    ctx["trigram_index"] = build_trigram_index(
+        set(ctx["search_index"]["postings"]) | {f.lower() for f in ctx["field_index"]["fields"]}
+    )
+
+    # --- Field catalogue for describe_fields (docstrings only point to it) ---
+    ft = inventory.field_types
+    catalogue_entries: list[dict] = []
+    for t in ctx["rest_tools"]:
+        if t["is_setting"]:
+            names = ["unifi_list_settings", "unifi_get_setting", "unifi_update_setting"]
+        elif t["is_readonly"]:
+            names = [f"unifi_list_{t['plural']}"]
+        elif t["is_crud"]:
+            names = [f"unifi_list_{t['plural']}", f"unifi_get_{t['singular']}",
+                     f"unifi_create_{t['singular']}", f"unifi_update_{t['singular']}"]
+            if not t["no_rest_delete"]:
+                names.append(f"unifi_delete_{t['singular']}")
+        else:
+            continue
+        t["fields"] = field_rows(t["schema"], ft.get(f"rest_{t['resource']}", {}))
+        catalogue_entries.append({"tools": names, "endpoint": t["path"], "fields": t["fields"]})
+    for t in ctx["stat_tools"]:
+        name = "unifi_list_report" if t["resource"] == "report" else f"unifi_list_{t['display_name']}"
+        t["fields"] = field_rows(t["schema"], ft.get(f"stat_{t['resource']}", {}))
+        catalogue_entries.append({"tools": [name], "endpoint": t["path"], "fields": t["fields"]})
+    for t in ctx["v2_tools"]:
+        names = [
+            f"unifi_{verb}_{t['plural'] if verb == 'list' else t['singular']}"
+            for method, verb in (("GET", "list"), ("POST", "create"), ("PUT", "update"), ("DELETE", "delete"))
+            if method in t["methods"]
+        ]
+        t["fields"] = field_rows(t["schema"], ft.get(f"v2_{t['resource']}", {}))
+        catalogue_entries.append({"tools": names, "endpoint": t["path"], "fields": t["fields"]})
+    catalogue = build_field_catalogue(catalogue_entries)
+    ctx["field_catalogue"] = compress_catalogue(catalogue)
+    ctx["field_catalogue_stats"] = {
+        "tools": len(catalogue["tools"]),
+        "fields": sum(len(rows) for _, rows in catalogue["endpoints"]),
+        "bytes": len(ctx["field_catalogue"]),
+    }
 
     # Summary counts
     ctx["tool_count"] = (
@@ -376,10 +466,12 @@ def build_context(inventory: APIInventory) -> dict:
             for t in ctx["v2_tools"]
         )
         + len(ctx["global_tools"])
-        + 1  # port override helper
+        + 2  # port override helpers (single + bulk)
+        + 3  # local history helpers (time-series query, report planner, event search)
         + 1  # report issue helper
         + 1  # network overview tool
-        + 1  # search tools helper
+        + 3  # search helpers (tools, fields, field descriptions)
+        + 1  # module loading helper
     )
 
     return ctx
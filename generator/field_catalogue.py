@@ -0,0 +1,58 @@
+"""Build the compressed field catalogue behind unifi_describe_fields.
+
+Tool docstrings carry only a pointer to unifi_describe_fields; the field
+types, enums, read-only flags and cross-references live here instead, so
+they are not sent with every tools/list response. The catalogue is
+embedded in the generated server as zlib-compressed, base64-encoded JSON
+and decompressed on the first unifi_describe_fields call.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import zlib
+
+from generator.naming import ID_CROSS_REFS
+from generator.schema_inference import is_readonly
+
+
+def field_rows(schema: list[dict], inventory_types: dict[str, str]) -> list[list]:
+    """Merge sample-inferred fields with field-inventory names.
+
+    Returns [name, type, read_only, enum values, cross-ref tool] rows sorted
+    by name. Sample inference wins where both know a field; fields seen only
+    in the inventory get its type and the name-based read-only rule.
+    """
+    rows = {
+        f["name"]: [f["name"], f["python_type"], f["read_only"], f["enum_values"], ID_CROSS_REFS.get(f["name"], "")]
+        for f in schema
+    }
+    for name, ptype in inventory_types.items():
+        if name not in rows:
+            rows[name] = [name, ptype, is_readonly(name), [], ID_CROSS_REFS.get(name, "")]
+    return [rows[name] for name in sorted(rows)]
+
+
+def build_field_catalogue(entries: list[dict]) -> dict:
+    """Build {"endpoints": [[path, rows]], "tools": {tool name: endpoint index}}.
+
+    entries are {"tools": [names], "endpoint": path, "fields": rows}; entries
+    without fields are dropped, so "tools" names exactly the tools that can
+    be described.
+    """
+    endpoints: list[list] = []
+    tools: dict[str, int] = {}
+    for entry in entries:
+        if not entry["fields"]:
+            continue
+        for name in entry["tools"]:
+            tools[name] = len(endpoints)
+        endpoints.append([entry["endpoint"], entry["fields"]])
+    return {"endpoints": endpoints, "tools": dict(sorted(tools.items()))}
+
+
+def compress_catalogue(catalogue: dict) -> str:
+    """Compact JSON → zlib (level 9) → base64; byte-stable for equal input."""
+    raw = json.dumps(catalogue, separators=(",", ":"), sort_keys=True).encode()
+    return base64.b64encode(zlib.compress(raw, 9)).decode("ascii")
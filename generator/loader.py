@@ -63,6 +63,7 @@ class APIInventory:
     v2_endpoints: dict[str, V2Endpoint] = field(default_factory=dict)
     global_endpoints: dict[str, GlobalEndpoint] = field(default_factory=dict)
     field_inventory: dict[str, list[str]] = field(default_factory=dict)
+    field_types: dict[str, dict[str, str]] = field(default_factory=dict)
 
 
 def _load_sample(samples_dir: Path, prefix: str, name: str) -> list[dict]:
@@ -98,6 +99,18 @@ def load_field_inventory(path: Path) -> dict[str, list[str]]:
     return result
 
 
+def load_field_types(path: Path) -> dict[str, dict[str, str]]:
+    """Load field-inventory.json → dict mapping endpoint key to {field name: type}."""
+    if not path.exists():
+        return {}
+    raw = json.loads(path.read_text())
+    return {
+        key: {name: info.get("type", "") for name, info in entry.get("fields", {}).items()}
+        for key, entry in raw.items()
+        if entry.get("fields")
+    }
+
+
 def load_inventory(
     inventory_path: Path,
     samples_dir: Path,
@@ -168,5 +181,6 @@ def load_inventory(
     # Field inventory (optional enrichment from production controllers)
     if field_inventory_path:
         inv.field_inventory = load_field_inventory(field_inventory_path)
+        inv.field_types = load_field_types(field_inventory_path)
 
     return inv
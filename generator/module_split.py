@@ -0,0 +1,58 @@
+"""Work out what each generated tool module imports from the server core.
+
+Tool modules (generated/unifi_tools/<module>.py) hold only registrar
+functions; every helper, constant and the FastMCP instance they use lives in
+generated/server.py. Rather than hand-maintaining an import list in the
+template, the generator renders the module once, finds which server-level
+names it references, and renders it again with explicit imports.
+"""
+
+from __future__ import annotations
+
+import ast
+import functools
+
+
+@functools.lru_cache(maxsize=4)
+def top_level_names(server_source: str) -> tuple[dict[str, str], set[str]]:
+    """Split the server's top-level names into imports and definitions.
+
+    Returns ({name: import statement}, {defined names}). Cached, since every
+    tool module is resolved against the same server source; callers must not
+    mutate the result.
+    """
+    imports: dict[str, str] = {}
+    defined: set[str] = set()
+    for node in ast.parse(server_source).body:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports[alias.asname or alias.name] = f"import {alias.name}"
+        elif isinstance(node, ast.ImportFrom) and node.module != "__future__":
+            for alias in node.names:
+                imports[alias.asname or alias.name] = f"from {node.module} import {alias.name}"
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            defined.add(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                defined.update(n.id for n in ast.walk(target) if isinstance(n, ast.Name))
+    return imports, defined
+
+
+def core_imports(module_source: str, server_source: str) -> tuple[list[str], list[str]]:
+    """Return (import statements, server names) a tool module needs.
+
+    Names the server itself imports (json, Any, ...) are re-imported from
+    their origin; everything else is imported from the server. Both lists
+    are sorted for byte-stable output.
+    """
+    imports, defined = top_level_names(server_source)
+    used = {
+        n.id for n in ast.walk(ast.parse(module_source))
+        if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load)
+    }
+    stdlib = sorted(
+        {imports[n] for n in used if n in imports},
+        key=lambda line: (line.startswith("from "), line),
+    )
+    return stdlib, sorted(used & defined)
@@ -286,16 +286,29 @@ V2_RESOURCE_NAMES: dict[str, tuple[str, str]] = {
 }
 
 # Stat endpoints that need method/body overrides for tests
-# session requires POST with params — GET returns 400 InvalidArgs
+# session requires POST with params — GET returns 400 InvalidArgs.
+# The unifi_list_sessions tool itself builds a windowed body (start/end/mac/type).
 STAT_OVERRIDES: dict[str, dict] = {
     "session": {"method": "POST", "body": {"type": "all", "start": 0, "end": 9999999999}},
 }
 
+# Resources whose list tools query the controller's POST form instead of
+# downloading everything. The POST accepts _limit/_start/_sort/within
+# (and archived for alarms), so pagination happens on the controller.
+EVENT_QUERY_PATHS: dict[str, str] = {
+    "event": "stat/event",
+    "alarm": "stat/alarm",
+}
+
 # Additional notes for stat tool docstrings (merged with ep.note from inventory)
 _GW_NOTE = "Requires a UniFi gateway (USG/UDM/UCG). Returns empty data if no gateway is adopted."
 # Stat endpoints that get client enrichment (network_name from WLAN+network join)
 CLIENT_ENRICHMENT_STATS: set[str] = {"sta"}
 
+# Report types (stat/report/<interval>.<type>) whose rows are per object and
+# accept a macs filter. Site and archive.* reports have no object MACs.
+REPORT_MAC_TYPES: set[str] = {"ap", "user", "gw"}
+
 GATEWAY_DEPENDENT_STATS: set[str] = {
     "report_archive_speedtest", "portforward", "routing", "dpi",
     "sitedpi", "stadpi", "gateway", "dynamicdns",
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import json
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from pathlib import Path
 
 
 @dataclass
@@ -28,7 +33,8 @@ _READONLY_PREFIXES = ("_", "attr_")
 _READONLY_SUFFIXES = ("-r",)
 
 
-def _is_readonly(field_name: str) -> bool:
+def is_readonly(field_name: str) -> bool:
+    """True for fields the controller sets itself (ids, attr_*, *-r)."""
     if field_name in _READONLY_EXACT:
         return True
     for prefix in _READONLY_PREFIXES:
@@ -94,56 +100,154 @@ def _looks_like_data_value(value: str) -> bool:
 _MAX_ENUM_VALUES = 10
 
 
-def infer_schema(records: list[dict]) -> dict[str, FieldInfo]:
-    """Infer schema from a list of sample JSON records.
+@dataclass
+class FieldStats:
+    """Running statistics for one field, bounded in size.
 
-    Returns a dict of field_name → FieldInfo, sorted by field name.
+    values holds the distinct enum-candidate strings seen so far, or None once
+    there are more than _MAX_ENUM_VALUES of them (the field can no longer be
+    an enum, so nothing more needs to be kept).
+    """
+
+    types: dict[str, int] = field(default_factory=dict)  # insertion order breaks ties
+    present: int = 0  # records with a non-null value
+    values: set[str] | None = field(default_factory=set)
+
+    def add_value(self, value: str) -> None:
+        if self.values is not None and value not in self.values:
+            self.values.add(value)
+            if len(self.values) > _MAX_ENUM_VALUES:
+                self.values = None
+
+    def merge(self, other: FieldStats) -> None:
+        for ptype, n in other.types.items():
+            self.types[ptype] = self.types.get(ptype, 0) + n
+        self.present += other.present
+        if other.values is None:
+            self.values = None
+        else:
+            for value in other.values:
+                self.add_value(value)
+
+
+@dataclass
+class SchemaAccumulator:
+    """Streaming schema inference: feed records one at a time, merge partial results.
+
+    Memory is bounded per field (type counts, a presence count and at most
+    _MAX_ENUM_VALUES + 1 distinct strings), not per record, so captures of any
+    size can be streamed through add(). Accumulators are picklable and
+    merge() is equivalent to feeding the other accumulator's records after
+    this one's, so files can be accumulated in separate processes and
+    combined in order.
     """
-    if not records:
-        return {}
 
-    # Collect all field names and their observed types
-    field_types: dict[str, dict[str, int]] = {}
-    field_counts: dict[str, int] = {}
-    field_string_values: dict[str, set[str]] = {}
-    total = len(records)
+    records: int = 0
+    fields: dict[str, FieldStats] = field(default_factory=dict)
 
-    for record in records:
+    def add(self, record: object) -> None:
+        """Account for one record; non-dict records count towards the total only."""
+        self.records += 1
         if not isinstance(record, dict):
-            continue
+            return
         for key, value in record.items():
             if value is None:
                 continue
+            stats = self.fields.get(key)
+            if stats is None:
+                stats = self.fields[key] = FieldStats()
             ptype = _infer_type(value)
-            field_types.setdefault(key, {})
-            field_types[key][ptype] = field_types[key].get(ptype, 0) + 1
-            field_counts[key] = field_counts.get(key, 0) + 1
+            stats.types[ptype] = stats.types.get(ptype, 0) + 1
+            stats.present += 1
             # Track unique string values for enum inference
             if (isinstance(value, str) and value
                     and _is_enum_candidate(key)
                     and not _looks_like_data_value(value)):
-                field_string_values.setdefault(key, set()).add(value)
-
-    # Build FieldInfo for each field
-    result: dict[str, FieldInfo] = {}
-    for fname in sorted(field_types.keys()):
-        type_counts = field_types[fname]
-        # Pick the most common type
-        best_type = max(type_counts, key=lambda t: type_counts[t])
-        # Collect enum values for string fields with few distinct values
-        # Skip if every observed value is unique (instance data, not enums)
-        enum_vals: list[str] = []
-        if best_type == "str" and fname in field_string_values:
-            unique = field_string_values[fname]
-            count = field_counts.get(fname, 0)
-            if len(unique) <= _MAX_ENUM_VALUES and (count <= 1 or len(unique) < count):
-                enum_vals = sorted(unique)
-        result[fname] = FieldInfo(
-            name=fname,
-            python_type=best_type,
-            read_only=_is_readonly(fname),
-            common=field_counts.get(fname, 0) == total,
-            enum_values=enum_vals,
-        )
-
-    return result
+                stats.add_value(value)
+
+    def update(self, records: Iterable[object]) -> SchemaAccumulator:
+        for record in records:
+            self.add(record)
+        return self
+
+    def merge(self, other: SchemaAccumulator) -> SchemaAccumulator:
+        self.records += other.records
+        for key, other_stats in other.fields.items():
+            stats = self.fields.get(key)
+            if stats is None:
+                stats = self.fields[key] = FieldStats()
+            stats.merge(other_stats)
+        return self
+
+    def schema(self) -> dict[str, FieldInfo]:
+        """Return field_name → FieldInfo, sorted by field name."""
+        result: dict[str, FieldInfo] = {}
+        for fname in sorted(self.fields):
+            stats = self.fields[fname]
+            # Pick the most common type
+            best_type = max(stats.types, key=lambda t: stats.types[t])
+            # Collect enum values for string fields with few distinct values
+            # Skip if every observed value is unique (instance data, not enums)
+            enum_vals: list[str] = []
+            if best_type == "str" and stats.values:
+                if stats.present <= 1 or len(stats.values) < stats.present:
+                    enum_vals = sorted(stats.values)
+            result[fname] = FieldInfo(
+                name=fname,
+                python_type=best_type,
+                read_only=is_readonly(fname),
+                common=stats.present == self.records,
+                enum_values=enum_vals,
+            )
+        return result
+
+
+def infer_schema(records: Iterable[object]) -> dict[str, FieldInfo]:
+    """Infer schema from sample JSON records (any iterable, consumed once).
+
+    Returns a dict of field_name → FieldInfo, sorted by field name.
+    """
+    return SchemaAccumulator().update(records).schema()
+
+
+def iter_capture(path: Path) -> Iterator[object]:
+    """Yield the records of one capture file without keeping them all.
+
+    *.ndjson / *.jsonl files are read line by line. Other files are JSON
+    samples: a v1 {"meta": ..., "data": [...]} envelope or a bare v2 list.
+    """
+    if path.suffix in (".ndjson", ".jsonl"):
+        with path.open() as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        return
+    raw = json.loads(path.read_text())
+    if isinstance(raw, dict) and "data" in raw:
+        raw = raw["data"]
+    if isinstance(raw, list):
+        yield from raw
+
+
+def accumulate_capture(path: Path) -> SchemaAccumulator:
+    """Accumulate one capture file (picklable result, for process pools)."""
+    return SchemaAccumulator().update(iter_capture(path))
+
+
+def infer_schema_from_captures(paths: Iterable[Path], jobs: int | None = None) -> dict[str, FieldInfo]:
+    """Infer one schema from many capture files, e.g. from several controllers.
+
+    Files are accumulated in up to jobs worker processes (default: CPU
+    count; 1 = in this process) and merged in the given order, so the
+    result does not depend on scheduling.
+    """
+    paths = list(paths)
+    total = SchemaAccumulator()
+    if (jobs or os.cpu_count() or 1) > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            partials = list(pool.map(accumulate_capture, paths))
+    else:
+        partials = [accumulate_capture(path) for path in paths]
+    for partial in partials:
+        total.merge(partial)
+    return total.schema()
@@ -0,0 +1,51 @@
+"""Scrub rules for controller data and tool arguments written to disk.
+
+probe.py scrubs API samples and its cache with these; generate.py renders
+them into the cassette transport and (the argument rules) into the
+capture middleware.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Fields to scrub from sample data before writing to disk.
+SCRUB_FIELDS = frozenset({
+    "x_password",
+    "x_passphrase",
+    "x_shadow",
+    "x_private_key",
+    "x_certificate_pem",
+    "x_certificate_arn",
+    "device_auth",
+    "ubic_uuid",
+    "device_id",
+})
+
+# Substrings — any field whose name contains one of these gets scrubbed.
+SCRUB_SUBSTRINGS = ("secret", "token", "key", "password", "passphrase")
+
+# Tool arguments have their own, narrower rules: arguments such as key (an
+# event key) or device_id are filters and IDs a replay needs, not secrets.
+ARG_SCRUB_PREFIXES = ("x_",)
+ARG_SCRUB_SUBSTRINGS = ("password", "passphrase", "secret", "token")
+
+
+def should_scrub(field_name: str) -> bool:
+    """Check if a field name indicates sensitive data."""
+    if field_name in SCRUB_FIELDS:
+        return True
+    lower = field_name.lower()
+    return any(s in lower for s in SCRUB_SUBSTRINGS)
+
+
+def scrub_value(obj: Any) -> Any:
+    """Recursively scrub sensitive fields from a JSON-like object."""
+    if isinstance(obj, dict):
+        return {
+            k: "REDACTED" if should_scrub(k) else scrub_value(v)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, list):
+        return [scrub_value(item) for item in obj]
+    return obj
@@ -0,0 +1,113 @@
+"""Precompute the tool and field search indexes embedded in the generated server.
+
+The server only looks up precomputed postings at query time, so
+search_tokens() and trigrams() here must match _search_tokens() and
+_trigrams() in templates/server.py.j2.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+
+# BM25 parameters
+_K1 = 1.2
+_B = 0.75
+
+# Field weights: a hit in the tool name counts more than one in a field list
+_NAME_WEIGHT = 3
+_DESCRIPTION_WEIGHT = 2
+_KEYWORD_WEIGHT = 1
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def search_tokens(text: str) -> list[str]:
+    """Lowercase, split on non-alphanumerics, and strip a plural 's'."""
+    tokens = []
+    for t in _TOKEN_RE.findall(text.lower()):
+        if len(t) > 3 and t.endswith("s") and not t.endswith("ss"):
+            t = t[:-1]
+        tokens.append(t)
+    return tokens
+
+
+def build_search_index(tool_index: list[dict]) -> dict:
+    """Build an inverted index with BM25 term weights per tool.
+
+    Returns {"docs": [{name, description, module}], "postings": {token:
+    [[doc, weight], ...]}}. Each weight is the full BM25 contribution of
+    the token to that doc, so a query score is the sum over its tokens.
+    Output is sorted and rounded so regeneration is byte-stable.
+    """
+    docs = []
+    term_freqs: list[Counter] = []
+    for entry in tool_index:
+        tf: Counter = Counter()
+        for t in search_tokens(entry["name"].removeprefix("unifi_")):
+            tf[t] += _NAME_WEIGHT
+        for t in search_tokens(entry["description"]):
+            tf[t] += _DESCRIPTION_WEIGHT
+        for t in search_tokens(entry["keywords"]):
+            tf[t] += _KEYWORD_WEIGHT
+        docs.append({"name": entry["name"], "description": entry["description"], "module": entry["module"]})
+        term_freqs.append(tf)
+
+    n = len(docs)
+    lengths = [sum(tf.values()) for tf in term_freqs]
+    avgdl = sum(lengths) / n if n else 0.0
+    df: Counter = Counter()
+    for tf in term_freqs:
+        df.update(tf.keys())
+
+    postings: dict[str, list[list]] = {}
+    for token in sorted(df):
+        idf = math.log(1 + (n - df[token] + 0.5) / (df[token] + 0.5))
+        plist = []
+        for i, tf in enumerate(term_freqs):
+            f = tf.get(token)
+            if f:
+                norm = _K1 * (1 - _B + _B * lengths[i] / avgdl)
+                plist.append([i, round(idf * f * (_K1 + 1) / (f + norm), 4)])
+        postings[token] = plist
+    return {"docs": docs, "postings": postings}
+
+
+def trigrams(term: str) -> set[str]:
+    """Character trigrams of a term, padded so short terms still get some."""
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def build_field_index(field_sources: list[dict]) -> dict:
+    """Map each field name to the list tools/endpoints that return it.
+
+    field_sources entries are {"tool", "endpoint", "fields"}. Returns
+    {"sources": [[tool, endpoint], ...], "fields": {field: [source_idx, ...]}},
+    sorted for byte-stable output.
+    """
+    sources = sorted({(src["tool"], src["endpoint"]) for src in field_sources})
+    source_idx = {s: i for i, s in enumerate(sources)}
+    index: dict[str, set[int]] = {}
+    for src in field_sources:
+        for f in src["fields"]:
+            index.setdefault(f, set()).add(source_idx[(src["tool"], src["endpoint"])])
+    return {
+        "sources": [list(s) for s in sources],
+        "fields": {f: sorted(index[f]) for f in sorted(index)},
+    }
+
+
+def build_trigram_index(terms: set[str]) -> dict:
+    """Build a trigram index over search tokens and field names.
+
+    Returns {"terms": [term, ...], "trigrams": {trigram: [term_idx, ...]}}.
+    Used by the server for typo-tolerant lookups (see _fuzzy_terms()).
+    """
+    vocab = sorted(terms)
+    grams: dict[str, list[int]] = {}
+    for i, term in enumerate(vocab):
+        for g in sorted(trigrams(term)):
+            grams.setdefault(g, []).append(i)
+    return {"terms": vocab, "trigrams": {g: grams[g] for g in sorted(grams)}}
@@ -0,0 +1,649 @@
+"""Synthesize UniFi API records at scale from inferred schemas.
+
+Field names, types, enum values and presence come from the same sources
+the generator uses: schema_inference over spec/api-samples, plus the
+seen_in/total_records counts in field-inventory.json for endpoints (like
+stat/device) that a bare controller returns empty.
+
+Every record is a pure function of (seed, endpoint, index), and IDs and
+MACs are functions of (entity, index), so datasets of any size can be
+streamed to NDJSON with nothing but the schemas in memory, and
+cross-references still point at records that exist:
+
+- ID_CROSS_REFS fields (and wlanconf_id, network_id, user_id, ...) hold
+  IDs from the referenced endpoint's dataset; *_ids fields hold several.
+- stat_sta, rest_user, stat_alluser and the v2 client lists describe the
+  same clients. Wireless clients sit on real AP MACs and real WLAN
+  IDs/SSIDs (and that WLAN's network); wired ones on real switch ports.
+- stat_device entries are a gateway, switches and APs, with port_table
+  sized by model, portconf_id pointing at port profiles, and radio/vap
+  tables on APs.
+- Events and alarms are newest first and evenly spaced in time, naming
+  real client and device MACs.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import time
+import zlib
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+from generator.naming import ID_CROSS_REFS, RESOURCE_NAMES
+from generator.schema_inference import FieldInfo, SchemaAccumulator, is_readonly, iter_capture
+
+# Endpoint keys (api-samples / field-inventory naming) that describe the
+# same underlying objects; others are their own entity ("rest_wlanconf" and
+# "list_wlanconf" both → "wlanconf"). Clients are "user" objects, as on the
+# controller: a client's stat/sta _id is its rest/user _id.
+ENTITIES: dict[str, str] = {
+    "stat_device": "device",
+    "stat_device_basic": "device",
+    "rest_device": "device",
+    "stat_sta": "user",
+    "stat_alluser": "user",
+    "stat_guest": "user",
+    "rest_user": "user",
+    "list_user": "user",
+    "v2_clients_active": "user",
+    "v2_clients_history": "user",
+    "stat_event": "event",
+    "rest_event": "event",
+    "stat_alarm": "alarm",
+    "rest_alarm": "alarm",
+    "list_alarm": "alarm",
+}
+
+# Reference fields not in ID_CROSS_REFS → entity
+_EXTRA_REFS: dict[str, str] = {
+    "wlanconf_id": "wlanconf",
+    "network_id": "networkconf",
+    "mgmt_network_id": "networkconf",
+    "connection_network_id": "networkconf",
+    "user_id": "user",
+    "map_id": "map",
+    "wlangroup_id_na": "wlangroup",
+    "wlangroup_id_ng": "wlangroup",
+}
+
+# Sample categories worth synthesizing (cmd_*, get_setting_* etc. are singletons)
+_CATEGORIES = ("rest_", "list_", "stat_", "v2_")
+
+_MAX_EXAMPLES = 10
+
+# Reference collections a site has a handful of
+REFERENCE_COUNTS: dict[str, int] = {
+    "networkconf": 12, "wlanconf": 8, "wlangroup": 2, "usergroup": 4, "portconf": 8,
+    "firewallgroup": 20, "firewallrule": 40, "radiusprofile": 2, "portforward": 10,
+    "map": 3, "tag": 5, "routing": 5, "dhcpoption": 4, "setting": 30,
+}
+DEFAULT_COUNT = 5  # any other endpoint
+
+DEVICE_PROFILES = {  # role → [(model, shortname, port count)]
+    "gateway": [("UDMPRO", "UDM-Pro", 11)],
+    "switch": [("USL8LP", "USW-Lite-8-PoE", 8), ("USL16LP", "USW-Lite-16-PoE", 16),
+               ("US24P250", "USW-24-PoE", 26), ("US48PRO", "USW-Pro-48-PoE", 52)],
+    "ap": [("U7PG2", "UAP-AC-Pro", 1), ("UAL6", "U6-Lite", 1), ("UAE6", "U6-Enterprise", 2),
+           ("U7LR", "UAP-AC-LR", 1)],
+}
+_DEVICE_TYPES = {"gateway": "udm", "switch": "usw", "ap": "uap"}
+# The mock controller's OUIs and address plan, so a dataset's MACs are ones
+# mock-controller/mock_controller.py --dataset also accepts in commands
+DEVICE_OUIS = ("f4:e2:c6", "74:ac:b9", "e4:38:83")
+CLIENT_OUIS = (("a4:83:e7", "Apple"), ("3c:22:fb", "Apple"), ("f0:d5:bf", "Intel"),
+               ("dc:a6:32", "Raspberry Pi"), ("b0:be:76", "TP-Link"), ("f8:ff:c2", "Apple"),
+               ("94:65:2d", "OnePlus"), ("00:17:88", "Philips Lighting"))
+
+EVENT_KEYS = (
+    ("EVT_WU_Connected", "wlan", "User[{user}] has connected to AP[{ap}]"),
+    ("EVT_WU_Disconnected", "wlan", "User[{user}] disconnected from AP[{ap}]"),
+    ("EVT_WU_Roam", "wlan", "User[{user}] roams from AP[{ap}]"),
+    ("EVT_LU_Connected", "lan", "User[{user}] has connected to Switch[{sw}]"),
+    ("EVT_AP_Lost_Contact", "wlan", "AP[{ap}] was disconnected"),
+    ("EVT_SW_Lost_Contact", "lan", "Switch[{sw}] was disconnected"),
+    ("EVT_GW_WANTransition", "wan", "Gateway[{gw}] WAN transition"),
+)
+EVENT_SPAN_MS = 30 * 24 * 3600 * 1000  # events spread over the last 30 days
+
+# Client fields that only make sense for one connection type
+_WIRELESS_ONLY = frozenset({
+    "ap_mac", "bssid", "essid", "channel", "channel_width", "channelWidth", "radio", "radio_name",
+    "radio_proto", "rssi", "signal", "noise", "tx_rate", "rx_rate", "tx_power", "ccq", "is_11r",
+    "is_mlo", "nss", "roam_count", "wlanconf_id", "powersave_enabled", "tx_mcs", "tx_mcs_index",
+    "mimo", "last_radio", "idletime", "tx_retries", "tx_retry_burst_count",
+})
+# Fields whose sample values identify one object and must not be copied
+_IDENTIFYING = re.compile(r"(^|_)(id|ids|mac|ip|subnet|name|hostname|serial|key|msg|email|url)$")
+
+_WIRED_ONLY = frozenset({"sw_mac", "sw_port", "sw_depth", "wired_rate_mbps"})
+
+# Nested tables a bare controller never returns (no samples to infer them from)
+_BUILTIN_ELEMENTS: dict[str, list[FieldInfo]] = {
+    "port_table": [
+        FieldInfo("port_idx", "int", common=True), FieldInfo("name", "str", common=True),
+        FieldInfo("media", "str", common=True, enum_values=["GE", "SFP+", "2P5GE"]),
+        FieldInfo("enable", "bool", common=True), FieldInfo("up", "bool", common=True),
+        FieldInfo("speed", "int", common=True), FieldInfo("full_duplex", "bool", common=True),
+        FieldInfo("poe_enable", "bool", common=True),
+        FieldInfo("poe_mode", "str", common=True, enum_values=["auto", "off", "pasv24"]),
+        FieldInfo("portconf_id", "str", common=True), FieldInfo("is_uplink", "bool", common=True),
+        FieldInfo("rx_bytes", "int", common=True), FieldInfo("tx_bytes", "int", common=True),
+    ],
+    "radio_table": [
+        FieldInfo("name", "str", common=True), FieldInfo("radio", "str", common=True, enum_values=["ng", "na", "6e"]),
+        FieldInfo("channel", "int", common=True), FieldInfo("ht", "int", common=True),
+        FieldInfo("tx_power_mode", "str", common=True, enum_values=["auto", "medium", "high", "low"]),
+        FieldInfo("min_rssi_enabled", "bool", common=True),
+    ],
+    "vap_table": [
+        FieldInfo("essid", "str", common=True), FieldInfo("bssid", "str", common=True),
+        FieldInfo("wlanconf_id", "str", common=True), FieldInfo("radio", "str", common=True, enum_values=["ng", "na"]),
+        FieldInfo("channel", "int", common=True), FieldInfo("num_sta", "int", common=True),
+        FieldInfo("satisfaction", "int", common=True), FieldInfo("tx_bytes", "int", common=True),
+        FieldInfo("rx_bytes", "int", common=True),
+    ],
+}
+
+
+# ---------------------------------------------------------------------------
+# Schemas
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class FieldSpec:
+    info: FieldInfo
+    presence: float  # fraction of records carrying the field
+    element: EndpointSchema | None = None  # element/object schema of list/dict fields
+    examples: list = field(default_factory=list)  # scalar values seen in samples
+
+
+@dataclass
+class EndpointSchema:
+    key: str  # "stat_device"
+    fields: dict[str, FieldSpec] = field(default_factory=dict)
+
+    @property
+    def entity(self) -> str:
+        return entity_of(self.key)
+
+
+def entity_of(key: str) -> str:
+    return ENTITIES.get(key) or key.split("_", 1)[-1]
+
+
+def schema_from_records(key: str, records: list[dict], depth: int = 2) -> EndpointSchema:
+    """Schema of sample records, with element schemas for nested objects."""
+    acc = SchemaAccumulator().update(records)
+    schema = EndpointSchema(key)
+    for name, info in acc.schema().items():
+        spec = FieldSpec(info, acc.fields[name].present / max(acc.records, 1))
+        if info.python_type in ("str", "int", "float"):
+            seen = {json.dumps(r[name]) for r in records if isinstance(r.get(name), (str, int, float))}
+            spec.examples = [json.loads(v) for v in sorted(seen)[:_MAX_EXAMPLES] if v not in ('""', '"REDACTED"')]
+        if depth and info.python_type in ("list", "dict"):
+            nested = []
+            for record in records:
+                value = record.get(name)
+                items = value if isinstance(value, list) else [value]
+                nested.extend(item for item in items if isinstance(item, dict))
+            if nested:
+                spec.element = schema_from_records(f"{key}.{name}", nested, depth - 1)
+        schema.fields[name] = spec
+    return schema
+
+
+def load_schemas(samples_dir: Path, field_inventory_path: Path | None = None) -> dict[str, EndpointSchema]:
+    """Endpoint key → schema, from api-samples and field-inventory.json.
+
+    Sample inference supplies types, enum values and nested shapes; the
+    field inventory (recorded on production controllers) adds the fields
+    a bare controller never returns, with presence = seen_in/total_records.
+    """
+    schemas: dict[str, EndpointSchema] = {}
+    for path in sorted(samples_dir.glob("*.json")):
+        if not path.stem.startswith(_CATEGORIES):
+            continue
+        records = [r for r in iter_capture(path) if isinstance(r, dict)]
+        if records:
+            schemas[path.stem] = schema_from_records(path.stem, records)
+    if field_inventory_path and field_inventory_path.exists():
+        for key, entry in json.loads(field_inventory_path.read_text()).items():
+            if not key.startswith(_CATEGORIES) or not entry.get("fields"):
+                continue
+            schema = schemas.setdefault(key, EndpointSchema(key))
+            for name, stats in entry["fields"].items():
+                total = stats.get("total_records") or 0
+                presence = stats.get("seen_in", 0) / total if total else 1.0
+                if name in schema.fields:
+                    schema.fields[name].presence = max(schema.fields[name].presence, presence)
+                    continue
+                info = FieldInfo(name, stats.get("type") or "str", read_only=is_readonly(name),
+                                 common=presence >= 1.0)
+                schema.fields[name] = FieldSpec(info, presence)
+    for schema in schemas.values():
+        for name, elements in _BUILTIN_ELEMENTS.items():
+            if name in schema.fields and schema.fields[name].element is None:
+                schema.fields[name].element = EndpointSchema(
+                    f"{schema.key}.{name}", {f.name: FieldSpec(f, 1.0) for f in elements})
+        schema.fields = dict(sorted(schema.fields.items()))
+    return dict(sorted(schemas.items()))
+
+
+def default_counts(schemas: dict[str, EndpointSchema], devices: int, clients: int, events: int) -> dict[str, int]:
+    """Records per endpoint key for a site of the given size."""
+    by_entity = {"device": devices, "user": clients, "event": events, "alarm": events // 10}
+    return {key: by_entity.get(s.entity, REFERENCE_COUNTS.get(s.entity, DEFAULT_COUNT)) for key, s in schemas.items()}
+
+
+# ---------------------------------------------------------------------------
+# Identities
+# ---------------------------------------------------------------------------
+
+
+@lru_cache(maxsize=None)
+def _tag(entity: str) -> str:
+    return f"{zlib.crc32(entity.encode()):08x}"
+
+
+def object_id(entity: str, index: int) -> str:
+    """24-hex Mongo-style ID unique to (entity, index)."""
+    return f"{_tag(entity)}{index:016x}"
+
+
+def client_mac(index: int) -> str:
+    return _mac(CLIENT_OUIS[index % len(CLIENT_OUIS)][0], index)
+
+
+def _mac(oui: str, index: int) -> str:
+    return f"{oui}:{(index >> 16) & 0xff:02x}:{(index >> 8) & 0xff:02x}:{index & 0xff:02x}"
+
+
+def _ip(base: int, index: int) -> str:
+    n = base + index
+    return f"{n >> 24}.{(n >> 16) & 0xff}.{(n >> 8) & 0xff}.{n & 0xff}"
+
+
+_DEVICE_NET = 10 << 24  # 10.0.0.0
+_CLIENT_NET = (10 << 24) + (128 << 16)  # 10.128.0.0
+
+
+def device_role(index: int) -> str:
+    """Device 0 is the gateway, every fourth from 1 a switch, the rest APs."""
+    if index == 0:
+        return "gateway"
+    return "switch" if index % 4 == 1 else "ap"
+
+
+def _ap_index(k: int) -> int:
+    """Device index of the k-th AP (devices 2, 3, 4, 6, 7, 8, 10, ...)."""
+    return 2 + k + k // 3
+
+
+def _ap_count(devices: int) -> int:
+    return max(devices - 1 - len(range(1, devices, 4)), 0)
+
+
+def _ref_entity(name: str) -> str | None:
+    tool = ID_CROSS_REFS.get(name)
+    if tool:
+        return _TOOL_ENTITIES.get(tool)
+    return _EXTRA_REFS.get(name)
+
+
+_TOOL_ENTITIES = {f"unifi_list_{plural}": entity_of(f"rest_{resource}")
+                  for resource, (_, plural) in RESOURCE_NAMES.items()}
+
+
+# ---------------------------------------------------------------------------
+# Synthesizer
+# ---------------------------------------------------------------------------
+
+
+class Synthesizer:
+    """Deterministic record factory for a set of endpoint schemas and counts."""
+
+    def __init__(self, schemas: dict[str, EndpointSchema], counts: dict[str, int], seed: int = 0,
+                 now_ms: int | None = None) -> None:
+        self.schemas = schemas
+        self.counts = counts
+        self.seed = seed
+        self.now_ms = now_ms if now_ms is not None else int(time.time() * 1000)
+        self.entity_counts: dict[str, int] = {}
+        for key, count in counts.items():
+            entity = entity_of(key)
+            self.entity_counts[entity] = max(self.entity_counts.get(entity, 0), count)
+        devices = self.entity_counts.get("device", 0)
+        self.aps = _ap_count(devices)
+        self.switches = len(range(1, devices, 4))
+        self.site_id = object_id("site", 0)
+        self._caches()
+
+    def _caches(self) -> None:
+        self._plans: dict[str, list[tuple[str, float, str | None, Callable]]] = {}
+        self._reference = lru_cache(maxsize=4096)(self._reference_record)
+
+    # Worker processes get the settings only; plans and the reference cache
+    # hold closures, which do not pickle, and are rebuilt on first use.
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        del state["_plans"], state["_reference"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._caches()
+
+    # -- public ------------------------------------------------------------
+
+    def records(self, key: str, start: int = 0, stop: int | None = None) -> Iterator[dict]:
+        count = self.counts.get(key, 0)
+        for index in range(start, count if stop is None else min(stop, count)):
+            yield self.record(key, index)
+
+    def record(self, key: str, index: int) -> dict:
+        schema = self.schemas[key]
+        rng = random.Random(f"{self.seed}:{key}:{index}")
+        ctx = self._context(schema.entity, index, rng)
+        return self._object(schema, rng, index, ctx)
+
+    # -- per-entity context --------------------------------------------------
+
+    def _context(self, entity: str, index: int, rng: random.Random) -> dict:
+        """Values every endpoint describing this entity must agree on."""
+        if entity == "device":
+            return self._device_context(index)
+        if entity == "user":
+            return self._client_context(index)
+        if entity in ("event", "alarm"):
+            return self._event_context(entity, index, rng)
+        return {"_id": object_id(entity, index), "name": f"{entity}-{index}"}
+
+    def _device_mac(self, index: int) -> str:
+        return _mac(DEVICE_OUIS[index % len(DEVICE_OUIS)], index)
+
+    def _device_context(self, index: int) -> dict:
+        role = device_role(index)
+        model, shortname, ports = DEVICE_PROFILES[role][index // 4 % len(DEVICE_PROFILES[role])]
+        parent = -1 if index == 0 else 0 if role == "switch" or not self.switches else 1 + 4 * (index % self.switches)
+        ctx = {
+            "_id": object_id("device", index), "device_id": object_id("device", index),
+            "mac": self._device_mac(index), "serial": f"{zlib.crc32(str(index).encode()):012X}",
+            "name": f"{shortname} {index:05d}", "model": model, "shortname": shortname,
+            "type": _DEVICE_TYPES[role], "ip": _ip(_DEVICE_NET, 10 + index), "adopted": True,
+            "_ports": ports, "_role": role,
+        }
+        if parent >= 0:
+            ctx["uplink"] = {"uplink_mac": self._device_mac(parent), "uplink_remote_port": index % 8 + 1,
+                             "type": "wire", "speed": 1000, "full_duplex": True}
+            ctx["gateway_mac"] = self._device_mac(0)
+        return ctx
+
+    def _client_context(self, index: int) -> dict:
+        vendor = CLIENT_OUIS[index % len(CLIENT_OUIS)][1]
+        wired = index % 5 == 0 or not self.aps
+        ctx = {
+            "_id": object_id("user", index), "id": object_id("user", index),
+            "user_id": object_id("user", index), "mac": client_mac(index), "oui": vendor,
+            "hostname": f"host-{index:06d}", "name": f"host-{index:06d}", "display_name": f"host-{index:06d}",
+            "ip": _ip(_CLIENT_NET, 2 + index), "last_ip": _ip(_CLIENT_NET, 2 + index),
+            "is_wired": wired, "_wired": wired,
+        }
+        if wired and self.switches:
+            switch = 1 + 4 * (index % self.switches)
+            ports = self._device_context(switch)["_ports"]
+            ctx.update(sw_mac=self._device_mac(switch), last_uplink_mac=self._device_mac(switch),
+                       sw_port=index % ports + 1, last_uplink_remote_port=index % ports + 1)
+            network = self._pick("networkconf", index)
+        elif not wired:
+            ap_mac = self._device_mac(_ap_index(index % self.aps))
+            ctx.update(ap_mac=ap_mac, bssid=ap_mac, last_uplink_mac=ap_mac)
+            wlan = self._reference("wlanconf", index % max(self.entity_counts.get("wlanconf", 0), 1)) \
+                if self.entity_counts.get("wlanconf") else None
+            if wlan:
+                ctx.update(wlanconf_id=wlan["_id"], essid=wlan.get("name", ""))
+            network = wlan.get("networkconf_id") if wlan else self._pick("networkconf", index)
+        else:
+            network = self._pick("networkconf", index)
+        if network:
+            net = self._reference("networkconf", int(network[8:], 16))
+            ctx.update(network_id=network, last_connection_network_id=network,
+                       network=net.get("name", ""), network_name=net.get("name", ""),
+                       last_connection_network_name=net.get("name", ""))
+        return ctx
+
+    def _event_context(self, entity: str, index: int, rng: random.Random) -> dict:
+        count = max(self.entity_counts.get(entity, 1), 1)
+        at = self.now_ms - index * max(1, EVENT_SPAN_MS // count)
+        key, subsystem, msg = EVENT_KEYS[rng.randrange(len(EVENT_KEYS))]
+        macs = {
+            "user": client_mac(rng.randrange(self.entity_counts["user"]))
+            if self.entity_counts.get("user") else "",
+            "ap": self._device_mac(_ap_index(rng.randrange(self.aps))) if self.aps else "",
+            "sw": self._device_mac(1 + 4 * rng.randrange(self.switches)) if self.switches else "",
+            "gw": self._device_mac(0),
+        }
+        ctx = {"_id": object_id(entity, index), "time": at,
+               "datetime": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(at / 1000)),
+               "key": key, "subsystem": subsystem, "msg": msg.format(**macs)}
+        # Only the MACs the message names; the others are left out of the record
+        ctx.update({k: v if "{" + k + "}" in msg else None for k, v in macs.items()})
+        return ctx
+
+    def _reference_record(self, entity: str, index: int) -> dict:
+        """A record of a (small) reference entity, as its rest_ endpoint renders it."""
+        key = f"rest_{entity}"
+        if key not in self.schemas or not self.counts.get(key):
+            return {"_id": object_id(entity, index)}
+        return self.record(key, index)
+
+    def _pick(self, entity: str, salt: int) -> str:
+        count = self.entity_counts.get(entity, 0)
+        if not count:
+            return ""
+        return object_id(entity, zlib.crc32(f"{self.seed}:{entity}:{salt}".encode()) % count)
+
+    # -- values --------------------------------------------------------------
+    #
+    # Each (nested) schema is compiled once into a plan of per-field value
+    # generators, so the per-record loop does no name matching.
+
+    def _plan(self, schema: EndpointSchema) -> list[tuple[str, float, str | None, Callable]]:
+        plan = self._plans.get(schema.key)
+        if plan is None:
+            plan = self._plans[schema.key] = [
+                (name, spec.presence, _connection(name), self._generator(name, spec))
+                for name, spec in schema.fields.items()
+            ]
+        return plan
+
+    def _object(self, schema: EndpointSchema, rng: random.Random, index: int, ctx: dict) -> dict:
+        wired = ctx.get("_wired")
+        skip = None if wired is None else "wireless" if wired else "wired"
+        uniform = rng.random
+        record: dict = {}
+        for name, presence, connection, generate in self._plan(schema):
+            if name in ctx:
+                if ctx[name] is not None:
+                    record[name] = ctx[name]
+                continue
+            if connection is not None and connection == skip:
+                continue
+            if presence < 1.0 and uniform() >= presence:
+                continue
+            record[name] = generate(rng, index, ctx)
+        return record
+
+    def _generator(self, name: str, spec: FieldSpec) -> Callable[[random.Random, int, dict], object]:
+        """Value generator for one field: (rng, index, ctx) → value."""
+        info = spec.info
+        ptype = info.python_type
+        if name == "site_id":
+            site_id = self.site_id
+            return lambda rng, index, ctx: site_id
+        ref = _ref_entity(name)
+        if ref:
+            count = self.entity_counts.get(ref, 0)
+            if not count:
+                empty = [] if ptype == "list" else ""
+                return lambda rng, index, ctx: empty.copy() if isinstance(empty, list) else empty
+            if ptype == "list" or name.endswith("_ids"):
+                most = min(3, count)
+                return lambda rng, index, ctx: [object_id(ref, int(rng.random() * count))
+                                                for _ in range(1 + int(rng.random() * most))]
+            return lambda rng, index, ctx: object_id(ref, int(rng.random() * count))
+        if info.enum_values:
+            pick = _one_of(info.enum_values)
+            return lambda rng, index, ctx: pick(rng)
+        if ptype == "bool":
+            return lambda rng, index, ctx: rng.random() < 0.5
+        if spec.examples and ptype == "str" and not _IDENTIFYING.search(name):
+            pick = _one_of(spec.examples)
+            return lambda rng, index, ctx: pick(rng)
+        if ptype == "int":
+            number = _number(name, self.now_ms)
+            return lambda rng, index, ctx: number(rng)
+        if ptype == "float":
+            number = _number(name, self.now_ms)
+            return lambda rng, index, ctx: number(rng) + round(rng.random(), 2)
+        if ptype == "list":
+            element = spec.element
+            if element is None:
+                return lambda rng, index, ctx: []
+            return lambda rng, index, ctx: [self._element(element, rng, n, ctx)
+                                            for n in range(self._list_length(name, rng, ctx))]
+        if ptype == "dict":
+            element = spec.element
+            if element is None:
+                return lambda rng, index, ctx: {}
+            return lambda rng, index, ctx: self._element(element, rng, 0, ctx)
+        return _string(name)
+
+    def _list_length(self, name: str, rng: random.Random, ctx: dict) -> int:
+        if name == "port_table":
+            return ctx.get("_ports") or 1 + int(rng.random() * 8)
+        if name == "radio_table":
+            return 2 if ctx.get("_role") == "ap" else 0
+        if name == "vap_table":
+            return self.entity_counts.get("wlanconf", 0) if ctx.get("_role") == "ap" else 0
+        return int(rng.random() * 4)
+
+    def _element(self, schema: EndpointSchema, rng: random.Random, n: int, ctx: dict) -> dict:
+        element = self._object(schema, rng, n, {})
+        if "port_idx" in schema.fields:
+            element.update(port_idx=n + 1, name=f"Port {n + 1}", is_uplink=n == 0)
+            if "portconf_id" in element and self.entity_counts.get("portconf"):
+                element["portconf_id"] = object_id("portconf", n % self.entity_counts["portconf"])
+        if "radio" in schema.fields and schema.key.endswith("radio_table"):
+            element.update(radio=("ng", "na", "6e")[n % 3], name=f"wifi{n}")
+        if schema.key.endswith("vap_table"):
+            wlan = self._reference("wlanconf", n)
+            element.update(essid=wlan.get("name", ""), wlanconf_id=wlan["_id"],
+                           bssid=f"{2 + 4 * n:02x}" + ctx.get("mac", "")[2:])  # locally administered
+        return element
+
+
+def _connection(name: str) -> str | None:
+    """"wireless"/"wired" for client fields that only one connection type has."""
+    if name in _WIRELESS_ONLY or name.startswith("wifi_"):
+        return "wireless"
+    if name in _WIRED_ONLY or name.startswith("wired"):
+        return "wired"
+    return None
+
+
+def _between(low: int, high: int) -> Callable[[random.Random], int]:
+    span = high - low
+    return lambda rng: low + int(rng.random() * span)
+
+
+def _one_of(values) -> Callable[[random.Random], object]:
+    values = tuple(values)
+    n = len(values)
+    return lambda rng: values[int(rng.random() * n)]
+
+
+def _number(name: str, now_ms: int) -> Callable[[random.Random], int]:
+    """Generator of plausible integers for a field, by name."""
+    lower = name.lower()
+    if "bytes" in lower:
+        return _between(10**3, 10**11)
+    if "packets" in lower:
+        return _between(10, 10**8)
+    if lower == "time" or lower.endswith("_millis"):
+        return _between(now_ms - 7 * 86400 * 1000, now_ms)
+    if lower.endswith(("_seen", "_at", "_time", "timestamp")) or lower in ("start", "end", "datetime"):
+        return _between(now_ms // 1000 - 30 * 86400, now_ms // 1000)
+    if "uptime" in lower or "duration" in lower:
+        return _between(60, 90 * 86400)
+    if lower in ("rssi", "rssi_age"):
+        return _between(5, 70)
+    if lower in ("signal", "noise") or lower.endswith("_dbm"):
+        return _between(-100, -30)
+    if lower == "channel" or lower.startswith("channel_"):
+        return _one_of((1, 6, 11, 36, 44, 149, 157))
+    if "satisfaction" in lower or lower.endswith(("_percentage", "_pct", "_score")):
+        return _between(0, 101)
+    if lower == "vlan":
+        return _between(2, 4095)
+    if lower.endswith("port") or lower.endswith("_port_idx"):
+        return _between(1, 49)
+    if lower == "speed":
+        return _one_of((10, 100, 1000, 2500, 10000))
+    if lower == "ht":
+        return _one_of((20, 40, 80, 160))
+    if "rate" in lower:
+        return _one_of((6_000, 144_000, 288_000, 866_000, 1_200_000))
+    if lower.startswith("num_") or lower.endswith(("_count", "count")):
+        return _between(0, 50)
+    return _between(0, 1000)
+
+
+def _string(name: str) -> Callable[[random.Random, int, dict], str]:
+    """Generator of plausible strings for a field, by name."""
+    lower = name.lower()
+    if lower.endswith("subnet"):
+        return lambda rng, index, ctx: f"10.{index % 256}.{int(rng.random() * 256)}.1/24"
+    if lower.endswith("mac") or lower in ("bssid", "mac_address"):
+        return lambda rng, index, ctx: _mac("02:00:00", rng.getrandbits(24))
+    if lower == "ip" or lower.endswith(("_ip", "ip_address")) or lower.startswith("ip_"):
+        return lambda rng, index, ctx: _ip(_CLIENT_NET, rng.getrandbits(16))
+    if lower in ("name", "desc", "hostname", "display_name") or lower.endswith("_name"):
+        prefix = name.replace("_", "-")
+        return lambda rng, index, ctx: f"{prefix}-{index:05d}"
+    if "version" in lower:
+        return lambda rng, index, ctx: f"7.{int(rng.random() * 3)}.{10 + int(rng.random() * 80)}.{10000 + int(rng.random() * 6000)}"
+    if lower == "datetime":
+        return lambda rng, index, ctx: time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    if lower.endswith("_id"):
+        return lambda rng, index, ctx: object_id(lower, rng.getrandbits(20))
+    if lower.startswith("x_"):
+        return lambda rng, index, ctx: f"{rng.getrandbits(64):016x}"
+    prefix = lower[:8]
+    return lambda rng, index, ctx: f"{prefix}-{rng.getrandbits(24):06x}"
+
+
+# ---------------------------------------------------------------------------
+# NDJSON output
+# ---------------------------------------------------------------------------
+
+
+def write_ndjson(synth: Synthesizer, key: str, path: Path, start: int = 0, stop: int | None = None) -> tuple[int, int]:
+    """Stream records [start, stop) of key to path, one JSON object per line.
+
+    Returns (records, bytes written). Memory stays flat however many
+    records are written.
+    """
+    written = size = 0
+    with path.open("w", buffering=1 << 20) as f:
+        for record in synth.records(key, start, stop):
+            line = json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+            f.write(line)
+            written += 1
+            size += len(line.encode()) if not line.isascii() else len(line)
+    return written, size
@@ -20,6 +20,15 @@ Usage:
 
     # Limit to first 5 for testing:
     python llm-probe/llm_probe.py --max-endpoints 5 ...
+
+    # Run 8 agents at once; any command that takes the same arguments as
+    # `claude -p` works, e.g. the stub agent for testing:
+    python llm-probe/llm_probe.py --jobs 8 --agent-cmd "python llm-probe/stub_agent.py" ...
+
+Verdicts are appended to llm-probe/verdicts.jsonl as each probe finishes.
+An interrupted or repeated run skips endpoints that already have a verdict
+for the same controller version (--no-resume re-probes them). Timed-out or
+failed agent runs are not recorded, so they are retried.
 """
 
 from __future__ import annotations
@@ -28,9 +37,13 @@ import argparse
 import json
 import os
 import re
+import shlex
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -38,7 +51,10 @@ ROOT = Path(__file__).parent.parent
 NOT_FOUND_FILE = ROOT / "not-found-endpoints.json"
 DISCOVERIES_FILE = Path(__file__).parent / "discoveries.json"
 
+CHECKPOINT_FILE = Path(__file__).parent / "verdicts.jsonl"
+
 DEFAULT_MODEL = "sonnet"
+DEFAULT_AGENT_CMD = "claude -p --permission-mode bypassPermissions --model {model}"
 
 SYSTEM_PROMPT = """\
 You are probing a UniFi Network Controller API (v10.0.162, standalone) to discover \
@@ -259,57 +275,62 @@ def parse_verdict(text: str) -> tuple[str, str]:
 
 
 # ── Probe one endpoint ─────────────────────────────────────────────────────
+def endpoint_key(ep: dict) -> str:
+    """Identify an endpoint probe across runs (for the verdict checkpoint)."""
+    return f"{ep['source_category']}:{ep['category']}/{ep['name']}:{ep['path']}"
+
+
 def probe_endpoint(ep: dict, site: str, cookie_file: str,
                    csrf_token: str | None, base_url: str,
                    verify_ssl: bool, index: int, total: int,
-                   model: str) -> dict:
-    """Probe one endpoint using claude -p. Returns a result dict."""
+                   agent_cmd: list[str], timeout: float = 180) -> tuple[dict, str, bool]:
+    """Probe one endpoint with the agent CLI.
 
+    Returns (result dict, log text, whether the agent ran to completion).
+    The log is returned rather than printed so concurrent probes can be
+    printed in order.
+    """
     path_display = ep["path"].replace("{site}", site)
 
-    # Print header
-    print(f"\n{'=' * 70}")
-    print(f"[{index}/{total}] {ep['category']}/{ep['name']}")
-    print(f"  Path: {path_display}")
+    # Header
+    log = [
+        f"\n{'=' * 70}",
+        f"[{index}/{total}] {ep['category']}/{ep['name']}",
+        f"  Path: {path_display}",
+    ]
     if ep["original_status"]:
-        print(f"  Previous: {ep['method_tried']} -> {ep['original_status']}")
+        log.append(f"  Previous: {ep['method_tried']} -> {ep['original_status']}")
     if ep.get("try_next"):
-        print(f"  Hints: {'; '.join(ep['try_next'][:3])}")
-    print(f"{'-' * 70}")
-    sys.stdout.flush()
+        log.append(f"  Hints: {'; '.join(ep['try_next'][:3])}")
+    log.append(f"{'-' * 70}")
 
     prompt = build_prompt(ep, site, cookie_file, csrf_token,
                           base_url, verify_ssl)
 
-    cmd = [
-        "claude", "-p",
-        "--permission-mode", "bypassPermissions",
-        "--model", model,
-        "--append-system-prompt", SYSTEM_PROMPT,
-        prompt,
-    ]
+    cmd = [*agent_cmd, "--append-system-prompt", SYSTEM_PROMPT, prompt]
 
+    completed = False
     try:
         result = subprocess.run(
             cmd,
             capture_output=True,
             text=True,
-            timeout=180,
+            timeout=timeout,
             env={**os.environ, "TERM": "dumb"},
         )
         output = result.stdout
+        completed = result.returncode == 0
     except subprocess.TimeoutExpired:
         output = "VERDICT: UNCERTAIN — timed out"
     except Exception as e:
-        output = f"VERDICT: UNCERTAIN — error running claude: {e}"
+        output = f"VERDICT: UNCERTAIN — error running {agent_cmd[0]}: {e}"
 
-    # Print Claude's output (indented)
+    # Agent output (indented)
     for line in output.strip().split("\n"):
-        print(f"  {line}")
+        log.append(f"  {line}")
 
     verdict, notes = parse_verdict(output)
-    print(f"\n  >>> VERDICT: {verdict}" + (f" — {notes}" if notes else ""))
-    sys.stdout.flush()
+    log.append(f"\n  >>> VERDICT: {verdict}" + (f" — {notes}" if notes else ""))
 
     # Build result
     result_dict: dict = {
@@ -325,7 +346,110 @@ def probe_endpoint(ep: dict, site: str, cookie_file: str,
     if re.search(r'(?:HTTP|status|returned|"rc":\s*"ok")\s*200|"rc":\s*"ok"', output):
         result_dict["response_status"] = 200
 
-    return result_dict
+    return result_dict, "\n".join(log), completed
+
+
+# ── Verdict checkpoint ──────────────────────────────────────────────────────
+def load_checkpoint(path: Path, controller_version: str) -> dict[str, dict]:
+    """Verdicts already reached for this controller version, by endpoint key.
+
+    The checkpoint is JSONL, one {"key", "controller_version", "result"} line
+    per probed endpoint; later lines win and a torn last line is ignored.
+    """
+    verdicts: dict[str, dict] = {}
+    if not path.exists():
+        return verdicts
+    for line in path.read_text().splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if record.get("controller_version") == controller_version:
+            verdicts[record["key"]] = record["result"]
+    return verdicts
+
+
+class Checkpoint:
+    """Appends verdicts to the checkpoint file as probes finish (thread-safe)."""
+
+    def __init__(self, path: Path, controller_version: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.controller_version = controller_version
+        self._file = path.open("a")
+        self._lock = threading.Lock()
+
+    def record(self, key: str, result: dict):
+        line = json.dumps({"key": key, "controller_version": self.controller_version,
+                           "result": result}, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+# ── Worker pool ─────────────────────────────────────────────────────────────
+class _WorkerSession(threading.local):
+    """Each worker thread logs in with its own cookie file.
+
+    Agents run curl with -b/-c on the cookie file, so sharing one file
+    between concurrent agents would interleave writes to it.
+    """
+
+    cookie_file: str | None = None
+    csrf_token: str | None = None
+    probes = 0
+
+
+def probe_all(endpoints: list[dict], jobs: int, login, probe, on_done) -> list[dict | None]:
+    """Probe endpoints on up to jobs worker threads.
+
+    login(cookie_file) -> (ok, csrf_token) authenticates a worker's cookie
+    file (again every 15 probes); probe(ep, index, cookie_file, csrf_token)
+    -> (result, log, completed). on_done(ep, result, completed) runs as each
+    probe finishes. Logs are printed in endpoint order as soon as every
+    earlier endpoint's log has been printed. Returns results in endpoint
+    order; on Ctrl-C, unfinished endpoints are None.
+    """
+    session = _WorkerSession()
+    cookie_files: list[str] = []
+    cookie_lock = threading.Lock()
+
+    def work(index: int, ep: dict):
+        if session.cookie_file is None:
+            fd, session.cookie_file = tempfile.mkstemp(suffix=".txt", prefix="unifi_cookies_")
+            os.close(fd)
+            with cookie_lock:
+                cookie_files.append(session.cookie_file)
+        if session.csrf_token is None or (session.probes and session.probes % 15 == 0):
+            ok, csrf_token = login(session.cookie_file)
+            if ok:
+                session.csrf_token = csrf_token
+        session.probes += 1
+        result, log, completed = probe(ep, index, session.cookie_file, session.csrf_token)
+        on_done(ep, result, completed)
+        return result, log
+
+    pool = ThreadPoolExecutor(max_workers=max(1, jobs))
+    futures = []
+    try:
+        futures = [pool.submit(work, i, ep) for i, ep in enumerate(endpoints, 1)]
+        for future in futures:
+            print(future.result()[1])
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        print("\n\nInterrupted! Saving partial results...", file=sys.stderr)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        for cookie_file in cookie_files:
+            try:
+                os.unlink(cookie_file)
+            except OSError:
+                pass
+    return [future.result()[0] if future.done() and not future.cancelled()
+            and future.exception() is None else None
+            for future in futures]
 
 
 # ── Dry run ─────────────────────────────────────────────────────────────────
@@ -384,6 +508,18 @@ def main():
                         help="Path to not-found-endpoints.json")
     parser.add_argument("--output", type=Path, default=DISCOVERIES_FILE,
                         help="Output discoveries file")
+    parser.add_argument("--jobs", "-j", type=int, default=4,
+                        help="Agent subprocesses run at once (default: 4)")
+    parser.add_argument("--timeout", type=float, default=180,
+                        help="Seconds before an agent run is abandoned (default: 180)")
+    parser.add_argument("--agent-cmd", default=os.environ.get("LLM_PROBE_AGENT_CMD", DEFAULT_AGENT_CMD),
+                        help="Agent command; the system prompt and prompt are appended as "
+                             "--append-system-prompt SYSTEM PROMPT, {model} is substituted "
+                             f"(default: '{DEFAULT_AGENT_CMD}', env: LLM_PROBE_AGENT_CMD)")
+    parser.add_argument("--checkpoint", type=Path, default=CHECKPOINT_FILE,
+                        help=f"Verdict checkpoint (default: llm-probe/{CHECKPOINT_FILE.name})")
+    parser.add_argument("--no-resume", action="store_true",
+                        help="Re-probe endpoints that already have a checkpointed verdict")
     args = parser.parse_args()
 
     # Load not-found-endpoints.json
@@ -416,11 +552,9 @@ def main():
         print("ERROR: --username and --password required", file=sys.stderr)
         sys.exit(1)
 
-    # Check claude CLI is available
-    try:
-        subprocess.run(["claude", "--version"], capture_output=True, timeout=10)
-    except FileNotFoundError:
-        print("ERROR: 'claude' CLI not found on PATH", file=sys.stderr)
+    agent_cmd = shlex.split(args.agent_cmd.format(model=args.model))
+    if not agent_cmd or shutil.which(agent_cmd[0]) is None:
+        print(f"ERROR: agent command {agent_cmd[:1]} not found on PATH", file=sys.stderr)
         sys.exit(1)
 
     verify_ssl = not args.no_verify_ssl
@@ -428,47 +562,56 @@ def main():
         verify_ssl = False
 
     base_url = f"https://{args.host}:{args.port}"
+    controller_version = data.get("controller_version", "unknown")
 
-    # Create temp cookie file (persists across all probes)
+    def login(cookie_file: str) -> tuple[bool, str | None]:
+        return login_curl(args.host, args.port, args.username, args.password,
+                          verify_ssl, cookie_file)
+
+    # Check the credentials once before starting any agents
+    print("Authenticating via curl...", file=sys.stderr)
     cookie_fd, cookie_file = tempfile.mkstemp(suffix=".txt", prefix="unifi_cookies_")
     os.close(cookie_fd)
-
     try:
-        # Login
-        print("Authenticating via curl...", file=sys.stderr)
-        ok, csrf_token = login_curl(
-            args.host, args.port, args.username, args.password,
-            verify_ssl, cookie_file,
-        )
-        if not ok:
-            print("FATAL: Authentication failed", file=sys.stderr)
-            sys.exit(1)
-        print(f"Authenticated. Cookie file: {cookie_file}", file=sys.stderr)
+        ok, _ = login(cookie_file)
+    finally:
+        os.unlink(cookie_file)
+    if not ok:
+        print("FATAL: Authentication failed", file=sys.stderr)
+        sys.exit(1)
+    print("Authenticated.", file=sys.stderr)
 
-        print(f"\nProbing {len(endpoints)} endpoints with claude -p ({args.model})...\n")
-        sys.stdout.flush()
+    # Skip endpoints that already have a verdict for this controller version
+    cached = {} if args.no_resume else load_checkpoint(args.checkpoint, controller_version)
+    pending = [ep for ep in endpoints if endpoint_key(ep) not in cached]
+    if len(pending) < len(endpoints):
+        print(f"Reusing {len(endpoints) - len(pending)} verdicts from {args.checkpoint}",
+              file=sys.stderr)
 
-        results = []
-        try:
-            for i, ep in enumerate(endpoints, 1):
-                # Refresh cookies every 15 endpoints
-                if i > 1 and i % 15 == 0:
-                    print("  [Refreshing auth cookies...]", file=sys.stderr)
-                    login_curl(args.host, args.port, args.username,
-                               args.password, verify_ssl, cookie_file)
-
-                result = probe_endpoint(
-                    ep, args.site, cookie_file, csrf_token,
-                    base_url, verify_ssl, i, len(endpoints), args.model,
-                )
-                results.append(result)
-        except KeyboardInterrupt:
-            print("\n\nInterrupted! Saving partial results...", file=sys.stderr)
+    print(f"\nProbing {len(pending)} endpoints with {agent_cmd[0]} ({args.model}), "
+          f"{args.jobs} at a time...\n")
+    sys.stdout.flush()
+
+    checkpoint = Checkpoint(args.checkpoint, controller_version)
+
+    def probe(ep: dict, index: int, cookie_file: str, csrf_token: str | None):
+        return probe_endpoint(ep, args.site, cookie_file, csrf_token, base_url,
+                              verify_ssl, index, len(pending), agent_cmd, args.timeout)
+
+    def on_done(ep: dict, result: dict, completed: bool):
+        # Timeouts and agent failures are retried next run
+        if completed:
+            checkpoint.record(endpoint_key(ep), result)
+
+    try:
+        fresh = iter(probe_all(pending, args.jobs, login, probe, on_done))
     finally:
-        try:
-            os.unlink(cookie_file)
-        except OSError:
-            pass
+        checkpoint.close()
+    results = []
+    for ep in endpoints:
+        result = cached.get(endpoint_key(ep)) or next(fresh)
+        if result is not None:
+            results.append(result)
 
     # Build summary
     summary = {
@@ -481,7 +624,7 @@ def main():
 
     output = {
         "probed_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "controller_version": data.get("controller_version", "unknown"),
+        "controller_version": controller_version,
         "model": args.model,
         "results": results,
         "summary": summary,
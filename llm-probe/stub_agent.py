@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Stand-in for `claude -p` when testing llm_probe.py without an LLM.
+
+Takes the same arguments llm_probe.py passes its agent command
+(... --append-system-prompt SYSTEM PROMPT), makes no requests and answers
+every prompt with a FOUND verdict. Environment variables, each a
+comma-separated list of endpoint names (as in the prompt, e.g. rest/foo):
+
+    LLM_PROBE_STUB_SLOW  answer after 0.5s instead of at once
+    LLM_PROBE_STUB_FAIL  exit 1 after printing an UNCERTAIN verdict
+    LLM_PROBE_STUB_HANG  never answer (until the probe's --timeout)
+
+LLM_PROBE_STUB_LOG, if set, is a file the stub appends each endpoint name
+to as it answers.
+
+Usage:
+    python llm-probe/llm_probe.py --agent-cmd "python llm-probe/stub_agent.py" ...
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+import time
+
+
+def _names(variable: str) -> set[str]:
+    return {name.strip() for name in os.environ.get(variable, "").split(",") if name.strip()}
+
+
+def main():
+    prompt = sys.argv[-1]
+    match = re.search(r"Probe this UniFi API endpoint: (\S+)", prompt)
+    endpoint = match.group(1) if match else "unknown"
+
+    if endpoint in _names("LLM_PROBE_STUB_HANG"):
+        time.sleep(3600)
+    if endpoint in _names("LLM_PROBE_STUB_SLOW"):
+        time.sleep(0.5)
+
+    log = os.environ.get("LLM_PROBE_STUB_LOG")
+    if log:
+        with open(log, "a") as f:
+            f.write(endpoint + "\n")
+
+    if endpoint in _names("LLM_PROBE_STUB_FAIL"):
+        print("VERDICT: UNCERTAIN — stub agent failed")
+        sys.exit(1)
+    print(f"Stub probe of {endpoint}: HTTP 200")
+    print(f"VERDICT: FOUND — stub answer for {endpoint}")
+
+
+if __name__ == "__main__":
+    main()
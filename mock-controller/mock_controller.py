@@ -0,0 +1,1424 @@
+#!/usr/bin/env python3
+"""Mock UniFi controller: a local ASGI stand-in for load and benchmark runs.
+
+Serves the API surface in spec/endpoint-inventory.json over HTTPS, shaped
+like a v10 standalone controller:
+
+  - /api/login and /api/logout with a unifises session cookie and a
+    csrf_token cookie / X-CSRF-Token header (checked on non-GET requests)
+  - the {meta, data} envelope on /api/s/{site}/*: rest/* CRUD, list/*,
+    stat/*, cmd/* (commands from the inventory), upd/*, group/*, cnt/*,
+    get/set setting; /v2/api/site/{site}/* without the envelope
+  - the /wss/s/{site}/events websocket, pushing synthetic events
+  - /status, /api/self, /api/self/sites, /api/stat/sites, guest and dl
+
+Small collections come from spec/api-samples. Devices, clients, known
+users, events and alarms are synthesized at the configured scale. Records
+are a pure function of (seed, kind, index), so a site with 100k clients
+and 1M events costs nothing until it is read, IDs and MACs encode their
+index (O(1) lookups), and GET responses are serialized once per site
+version. Cross-references are consistent: clients point at real AP and
+switch MACs, network, WLAN and user group IDs; device ports point at
+port profiles.
+
+Usage:
+    # 10k devices, 100k clients, 1M events per site, 20 ms +/- 5 ms latency
+    uv run python mock-controller/mock_controller.py --scale large \\
+        --latency 20 --jitter 5
+
+    # Explicit sizes, two sites, 1% injected 500s, sessions expire every 500 requests
+    uv run python mock-controller/mock_controller.py --devices 500 --clients 8000 \\
+        --events 200000 --sites 2 --error-rate 0.01 --expire-every 500
+
+    # Point the MCP server (or probe.py) at it:
+    UNIFI_HOST=127.0.0.1 UNIFI_PORT=8443 UNIFI_PASSWORD=x uv run fastmcp run generated/server.py
+
+    # Serve a dataset written by synth_dataset.py (NDJSON, streamed from disk)
+    uv run python mock-controller/mock_controller.py --dataset /tmp/unifi-large
+
+Any username/password logs in unless --username/--password are given.
+GET /_mock/stats returns request counts per route (POST /_mock/reset
+clears them), so load tests can measure controller fan-out.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import ipaddress
+import json
+import random
+import secrets
+import sys
+import tempfile
+import time
+import zlib
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route, WebSocketRoute
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+ROOT = Path(__file__).parent.parent
+INVENTORY = ROOT / "spec" / "endpoint-inventory.json"
+SAMPLES_DIR = ROOT / "spec" / "api-samples"
+
+# --scale presets: per-site devices, clients, events (alarms default to events / 10)
+SCALES = {
+    "small": (20, 200, 2_000),
+    "medium": (1_000, 10_000, 100_000),
+    "large": (10_000, 100_000, 1_000_000),
+}
+
+DAY_MS = 24 * 3600 * 1000
+EVENT_SPAN_MS = 30 * DAY_MS  # events are spread evenly over the last 30 days
+DEFAULT_EVENT_LIMIT = 3000  # stat/event page size when the body gives no _limit
+
+REPORT_STEP_MS = {"5minutes": 300_000, "hourly": 3_600_000, "daily": DAY_MS, "monthly": 30 * DAY_MS}
+REPORT_OBJECT_KEYS = {"site": "", "ap": "ap", "user": "user", "gw": "gw"}
+
+
+# ---------------------------------------------------------------------------
+# Deterministic identifiers
+# ---------------------------------------------------------------------------
+
+
+def _tag(kind: str) -> str:
+    return f"{zlib.crc32(kind.encode()):08x}"
+
+
+def object_id(kind: str, index: int) -> str:
+    """24-hex Mongo-style ID that encodes its kind and index."""
+    return f"{_tag(kind)}{index:016x}"
+
+
+def object_index(kind: str, oid: str) -> int | None:
+    """Inverse of object_id; None when oid was not minted for kind."""
+    if len(oid) != 24 or not oid.startswith(_tag(kind)):
+        return None
+    try:
+        return int(oid[8:], 16)
+    except ValueError:
+        return None
+
+
+DEVICE_OUIS = ("f4:e2:c6", "74:ac:b9", "e4:38:83")
+CLIENT_OUIS = (("a4:83:e7", "Apple"), ("3c:22:fb", "Apple"), ("f0:d5:bf", "Intel"),
+               ("dc:a6:32", "Raspberry Pi"), ("b0:be:76", "TP-Link"), ("f8:ff:c2", "Apple"),
+               ("94:65:2d", "OnePlus"), ("00:17:88", "Philips Lighting"))
+
+
+def mac_address(oui: str, index: int) -> str:
+    """MAC whose low three bytes are index."""
+    return f"{oui}:{(index >> 16) & 0xff:02x}:{(index >> 8) & 0xff:02x}:{index & 0xff:02x}"
+
+
+def mac_index(mac: str) -> int:
+    parts = mac.lower().split(":")
+    if len(parts) != 6:
+        return -1
+    try:
+        return int("".join(parts[3:]), 16)
+    except ValueError:
+        return -1
+
+
+def _ip(base: int, index: int) -> str:
+    n = base + index
+    return f"{n >> 24}.{(n >> 16) & 0xff}.{(n >> 8) & 0xff}.{n & 0xff}"
+
+
+DEVICE_NET = 10 << 24  # 10.0.0.0/8
+CLIENT_NET = (10 << 24) + (128 << 16)  # 10.128.0.0/9
+ADMIN_NET = (192 << 24) + (168 << 16) + (1 << 8)  # 192.168.1.0/24
+
+
+# ---------------------------------------------------------------------------
+# Collections
+# ---------------------------------------------------------------------------
+
+
+class Collection:
+    """CRUD over stored records plus an optional synthetic range.
+
+    Synthetic records 0..count-1 are built by factory(index) on read;
+    updates are kept as patches and deletes as tombstones, so the range is
+    never materialized.
+    """
+
+    def __init__(self, kind: str, records: list[dict] | None = None, count: int = 0,
+                 factory: Callable[[int], dict] | None = None) -> None:
+        self.kind = kind
+        self.count = count if factory else 0
+        self.factory = factory
+        self.stored: dict[str, dict] = {}
+        self.patches: dict[int, dict] = {}
+        self.deleted: set[int] = set()
+        self._next = 0
+        for record in records or []:
+            if not record.get("_id"):
+                record = {**record, "_id": self._new_id()}
+            self.stored[record["_id"]] = record
+
+    def _new_id(self) -> str:
+        self._next += 1
+        return object_id(f"{self.kind}:new", self._next)
+
+    def synthetic(self, index: int) -> dict | None:
+        if not 0 <= index < self.count or index in self.deleted:
+            return None
+        record = self.factory(index)
+        if index in self.patches:
+            record.update(self.patches[index])
+        return record
+
+    def __len__(self) -> int:
+        return self.count - len(self.deleted) + len(self.stored)
+
+    def __iter__(self) -> Iterator[dict]:
+        for index in range(self.count):
+            record = self.synthetic(index)
+            if record is not None:
+                yield record
+        yield from self.stored.values()
+
+    def get(self, oid: str) -> dict | None:
+        index = object_index(self.kind, oid)
+        if index is not None:
+            return self.synthetic(index)
+        return self.stored.get(oid)
+
+    def create(self, data: dict, site_id: str) -> dict:
+        record = {**data, "_id": self._new_id(), "site_id": site_id}
+        self.stored[record["_id"]] = record
+        return record
+
+    def update(self, oid: str, data: dict) -> dict | None:
+        patch = {k: v for k, v in data.items() if k != "_id"}
+        index = object_index(self.kind, oid)
+        if index is not None:
+            if self.synthetic(index) is None:
+                return None
+            self.patches.setdefault(index, {}).update(patch)
+            return self.synthetic(index)
+        if oid not in self.stored:
+            return None
+        self.stored[oid].update(patch)
+        return self.stored[oid]
+
+    def delete(self, oid: str) -> bool:
+        index = object_index(self.kind, oid)
+        if index is not None:
+            if self.synthetic(index) is None:
+                return False
+            self.deleted.add(index)
+            self.patches.pop(index, None)
+            return True
+        return self.stored.pop(oid, None) is not None
+
+
+class EventLog:
+    """Newest-first synthetic event or alarm log, evenly spaced in time.
+
+    Record i happened at now - i * step, so "within N hours" and
+    _start/_limit paging are index arithmetic, not scans.
+    """
+
+    def __init__(self, count: int, now_ms: int, factory: Callable[[int, int], dict],
+                 unarchived: int | None = None) -> None:
+        self.count = count
+        self.now_ms = now_ms
+        self.step = max(1, EVENT_SPAN_MS // max(count, 1))
+        self.factory = factory
+        # Alarms: the newest `unarchived` are open, older ones archived
+        self.archivable = unarchived is not None
+        self.unarchived = count if unarchived is None else unarchived
+        self.archived: set[int] = set()
+
+    def time_of(self, index: int) -> int:
+        return self.now_ms - index * self.step
+
+    def record(self, index: int) -> dict:
+        record = self.factory(index, self.time_of(index))
+        if self.archivable:
+            record["archived"] = index >= self.unarchived or index in self.archived
+        return record
+
+    def window(self, within_hours: float | None = None, archived: bool | None = None) -> range:
+        """Index range matching the filters (newest first)."""
+        end = self.count
+        if within_hours:
+            end = min(end, int(within_hours * 3_600_000) // self.step + 1)
+        if archived is False:
+            return range(0, min(end, self.unarchived))
+        if archived is True:
+            return range(min(end, self.unarchived), end)
+        return range(0, end)
+
+    def page(self, start: int, limit: int, within_hours: float | None = None,
+             archived: bool | None = None) -> tuple[list[dict], int]:
+        window = self.window(within_hours, archived)
+        selected = window[start:start + limit] if limit else window[start:]
+        return [self.record(i) for i in selected], len(window)
+
+
+class Dataset:
+    """NDJSON endpoint files from synth_dataset.py, served from disk.
+
+    <key>.ndjson (e.g. stat_sta, rest_wlanconf, v2_clients_active) answers
+    the matching full-collection read by streaming the file into the
+    response, so fixtures larger than memory can be served. stat_event and
+    stat_alarm are paged through a line-offset index built on first use;
+    their records are newest first, so "within N hours" (counted back from
+    the newest record) is a binary search. The files are read-only: writes
+    still go to the synthetic site but do not change what is served.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.files = {path.stem: path for path in root.glob("*.ndjson")}
+        manifest = root / "manifest.json"
+        self.manifest = json.loads(manifest.read_text()) if manifest.exists() else {}
+        self._offsets: dict[str, array] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.files
+
+    def count(self, key: str) -> int:
+        return len(self.offsets(key)) - 1
+
+    def stream(self, key: str, envelope: bool = True) -> StreamingResponse:
+        """The file as a JSON array (in the {meta, data} envelope unless v2)."""
+        head, tail = (b'{"meta":{"rc":"ok"},"data":[', b"]}") if envelope else (b"[", b"]")
+        return StreamingResponse(self._chunks(self.files[key], head, tail), media_type="application/json")
+
+    @staticmethod
+    def _chunks(path: Path, head: bytes, tail: bytes) -> Iterator[bytes]:
+        yield head
+        pending = b""
+        with path.open("rb") as f:
+            while chunk := f.read(1 << 20):
+                chunk = pending + chunk.replace(b"\n", b",")
+                pending = chunk[-1:]  # hold back a possible trailing comma
+                yield chunk[:-1]
+        if pending not in (b"", b","):
+            yield pending
+        yield tail
+
+    def offsets(self, key: str) -> array:
+        """Start offset of every line, plus the file size."""
+        if key not in self._offsets:
+            offsets = array("q", [0])
+            with self.files[key].open("rb") as f:
+                for line in f:
+                    offsets.append(offsets[-1] + len(line))
+            self._offsets[key] = offsets
+        return self._offsets[key]
+
+    def _read(self, f: Any, offsets: array, index: int) -> dict:
+        f.seek(offsets[index])
+        return json.loads(f.read(offsets[index + 1] - offsets[index]))
+
+    def page(self, key: str, start: int, limit: int, within_hours: float | None = None) -> tuple[list[dict], int]:
+        offsets = self.offsets(key)
+        end = len(offsets) - 1
+        with self.files[key].open("rb") as f:
+            if within_hours and end:
+                cutoff = self._read(f, offsets, 0).get("time", 0) - within_hours * 3_600_000
+                lo, hi = 0, end  # first record older than the cutoff
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if self._read(f, offsets, mid).get("time", 0) >= cutoff:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                end = lo
+            stop = min(end, start + limit) if limit else end
+            return [self._read(f, offsets, i) for i in range(start, stop)], end
+
+
+# ---------------------------------------------------------------------------
+# Synthetic site
+# ---------------------------------------------------------------------------
+
+EVENT_TYPES = (
+    ("EVT_WU_Connected", "wlan", 'User[{user}] has connected to AP[{ap}] with SSID "{ssid}" on "channel {channel}(na)"'),
+    ("EVT_WU_Disconnected", "wlan", 'User[{user}] disconnected from "{ssid}" (3h 12m connected, 1.2G bytes, last AP[{ap}])'),
+    ("EVT_WU_Roam", "wlan", "User[{user}] roams from AP[{ap}] to AP[{ap2}] from \"channel 36(na)\" to \"channel 149(na)\""),
+    ("EVT_WG_Connected", "wlan", 'Guest[{user}] has connected to AP[{ap}] with SSID "{ssid}"'),
+    ("EVT_LU_Connected", "lan", "User[{user}] has connected to Switch[{sw}] port {port}"),
+    ("EVT_LU_Disconnected", "lan", "User[{user}] disconnected from Switch[{sw}] port {port}"),
+    ("EVT_AP_Connected", "wlan", "AP[{ap}] was connected"),
+    ("EVT_AP_Lost_Contact", "wlan", "AP[{ap}] was disconnected"),
+    ("EVT_SW_Lost_Contact", "lan", "Switch[{sw}] was disconnected"),
+    ("EVT_AD_Login", "", "Admin[admin] log in from {ip}"),
+)
+ALARM_TYPES = (
+    ("EVT_AP_Lost_Contact", "wlan", "AP[{ap}] was disconnected"),
+    ("EVT_SW_Lost_Contact", "lan", "Switch[{sw}] was disconnected"),
+    ("EVT_GW_WANTransition", "wan", "Gateway[{gw}] WAN transition: eth8 is down"),
+    ("EVT_AP_RadarDetected", "wlan", "AP[{ap}] detected radar on channel 52"),
+)
+
+AP_MODELS = (("U7PG2", "UAP-AC-Pro"), ("UAL6", "U6-Lite"), ("UAE6", "U6-Enterprise"), ("U7LR", "UAP-AC-LR"))
+SWITCH_MODELS = (("USL8LP", "USW-Lite-8-PoE", 8), ("USL16LP", "USW-Lite-16-PoE", 16),
+                 ("US24P250", "USW-24-PoE", 26), ("US48PRO", "USW-Pro-48-PoE", 52))
+GATEWAY_MODEL = ("UDMPRO", "UDM-Pro", 11)
+
+
+@dataclass
+class Scale:
+    devices: int = 20
+    clients: int = 200
+    events: int = 2_000
+    alarms: int | None = None
+    seed: int = 0
+
+
+def _load_sample(name: str) -> Any:
+    path = SAMPLES_DIR / f"{name}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def _sample_data(name: str) -> list:
+    sample = _load_sample(name)
+    if isinstance(sample, dict) and "data" in sample:
+        return sample["data"]
+    return sample if isinstance(sample, list) else []
+
+
+class Site:
+    """One site's dataset: sample-backed collections plus the synthetic ones."""
+
+    def __init__(self, name: str, site_id: str, scale: Scale, now_ms: int) -> None:
+        self.name = name
+        self.site_id = site_id
+        self.scale = scale
+        self.now_ms = now_ms
+        self.version = 0  # bumped on every mutation; keys the response cache
+        self._cache: dict[str, bytes] = {}
+
+        self.rest: dict[str, Collection] = {}
+        self.v2: dict[str, Collection] = {}
+        # get_setting.json has its "key" fields scrubbed; the per-key samples name them
+        self.settings = Collection("setting", [
+            dict(record, key=sample.stem[len("get_setting_"):], site_id=site_id)
+            for sample in sorted(SAMPLES_DIR.glob("get_setting_*.json"))
+            for record in _sample_data(sample.stem)[:1]
+        ])
+        self.stat_samples: dict[str, list] = {}
+        self._seed_references()
+
+        # Device roles: index 0 is the gateway, every fourth a switch, the rest APs
+        n = scale.devices
+        self.switch_indexes = [i for i in range(1, n) if i % 4 == 1]
+        self.ap_indexes = [i for i in range(1, n) if i % 4 != 1]
+        self.ap_load = Counter(self._client_ap(j) for j in range(scale.clients) if self._client_ap(j) is not None)
+
+        self.devices = Collection("device", count=n, factory=self._device)
+        self.clients = Collection("sta", count=scale.clients, factory=self._client)
+        self.rest["user"] = Collection("user", count=scale.clients, factory=self._user)
+        alarms = scale.events // 10 if scale.alarms is None else scale.alarms
+        self.events = EventLog(scale.events, now_ms, self._event)
+        self.alarms = EventLog(alarms, now_ms, self._alarm, unarchived=max(1, alarms // 4) if alarms else 0)
+
+    # -- reference collections --------------------------------------------
+
+    def _seed_references(self) -> None:
+        """Sample-backed rest/v2 collections, plus the few every site needs."""
+        inventory = json.loads(INVENTORY.read_text())
+        for name in inventory["rest_endpoints"]:
+            if name == "user":
+                continue
+            records = _sample_data(f"rest_{name}") or _sample_data(f"list_{name}")
+            self.rest[name] = Collection(name, [dict(r, site_id=self.site_id) for r in records])
+        for name, ep in inventory["v2_endpoints"].items():
+            if name not in ("clients_active", "clients_history"):
+                self.v2[ep["path"].split("{site}/", 1)[1]] = Collection(f"v2:{name}", _sample_data(f"v2_{name}"))
+        for sample in SAMPLES_DIR.glob("stat_*.json"):
+            self.stat_samples[sample.stem[len("stat_"):]] = _sample_data(sample.stem)
+
+        networks = self.rest["networkconf"]
+        for vlan, purpose in ((10, "corporate"), (20, "guest"), (30, "corporate")):
+            networks.create({
+                "name": f"VLAN {vlan}", "purpose": purpose, "vlan_enabled": True, "vlan": vlan,
+                "ip_subnet": f"10.{vlan}.0.1/16", "dhcpd_enabled": True, "enabled": True,
+            }, self.site_id)
+        self.network_ids = [r["_id"] for r in networks]
+        self.network_names = {r["_id"]: r.get("name", "Default") for r in networks}
+        usergroups = self.rest["usergroup"]
+        if not len(usergroups):
+            usergroups.create({"name": "Default", "qos_rate_max_down": -1, "qos_rate_max_up": -1}, self.site_id)
+        self.usergroup_ids = [r["_id"] for r in usergroups]
+        wlans = self.rest["wlanconf"]
+        if not len(wlans):
+            for ssid, network_id in (("Office", self.network_ids[0]), ("Guest", self.network_ids[-2]),
+                                     ("IoT", self.network_ids[-1])):
+                wlans.create({
+                    "name": ssid, "enabled": True, "security": "wpapsk", "wpa_mode": "wpa2",
+                    "x_passphrase": secrets.token_hex(8), "networkconf_id": network_id,
+                    "is_guest": ssid == "Guest", "usergroup_id": self.usergroup_ids[0],
+                }, self.site_id)
+        self.wlans = [(r["_id"], r["name"], r.get("networkconf_id") or self.network_ids[0]) for r in wlans]
+        self.ssids = {wlan_id: ssid for wlan_id, ssid, _ in self.wlans}
+        portconfs = self.rest["portconf"]
+        if not len(portconfs):
+            portconfs.create({"name": "All", "forward": "all"}, self.site_id)
+        self.portconf_ids = [r["_id"] for r in portconfs]
+
+    # -- devices -----------------------------------------------------------
+
+    def _device_mac(self, index: int) -> str:
+        return mac_address(DEVICE_OUIS[index % len(DEVICE_OUIS)], index)
+
+    def device_index(self, mac: str) -> int | None:
+        index = mac_index(mac)
+        if 0 <= index < self.scale.devices and self._device_mac(index) == mac.lower():
+            return index
+        return None
+
+    def _uplink(self, index: int) -> int:
+        """Switches hang off the gateway; APs off a switch (or the gateway)."""
+        if index == 0:
+            return -1
+        if index % 4 == 1 or not self.switch_indexes:
+            return 0
+        return self.switch_indexes[index % len(self.switch_indexes)]
+
+    def _device(self, index: int) -> dict:
+        rng = random.Random(f"{self.scale.seed}:{self.name}:device:{index}")
+        mac = self._device_mac(index)
+        if index == 0:
+            model, shortname, ports = GATEWAY_MODEL
+            kind = "udm"
+        elif index % 4 == 1:
+            model, shortname, ports = SWITCH_MODELS[index % len(SWITCH_MODELS)]
+            kind = "usw"
+        else:
+            model, shortname = AP_MODELS[index % len(AP_MODELS)]
+            ports, kind = 1 if index % 3 else 2, "uap"
+        connected = rng.random() > 0.02
+        uptime = rng.randrange(3600, 90 * 86400) if connected else 0
+        ip = _ip(DEVICE_NET, 10 + index)
+        record: dict[str, Any] = {
+            "_id": object_id("device", index),
+            "mac": mac,
+            "serial": hashlib.md5(mac.encode()).hexdigest()[:12].upper(),
+            "name": f"{shortname} {index:05d}",
+            "model": model,
+            "shortname": shortname,
+            "type": kind,
+            "version": "7.0.76.15293" if kind == "uap" else "7.1.26.15869",
+            "adopted": True,
+            "state": 1 if connected else 0,
+            "disabled": False,
+            "ip": ip,
+            "config_network": {"type": "dhcp", "ip": ip},
+            "site_id": self.site_id,
+            "inform_url": "http://unifi:8080/inform",
+            "uptime": uptime,
+            "_uptime": uptime,
+            "last_seen": self.now_ms // 1000 - (rng.randrange(5, 30) if connected else rng.randrange(3600, 86400)),
+            "adopted_at": self.now_ms // 1000 - 200 * 86400,
+            "upgradable": rng.random() < 0.1,
+            "satisfaction": rng.randrange(60, 100) if connected else -1,
+            "num_sta": self.ap_load.get(index, 0),
+            "rx_bytes": rng.randrange(10**9, 10**12),
+            "tx_bytes": rng.randrange(10**9, 10**12),
+            "bytes": 0,
+            "led_override": "default",
+            "port_table": [self._port(rng, index, n, kind) for n in range(1, ports + 1)],
+        }
+        record["bytes"] = record["rx_bytes"] + record["tx_bytes"]
+        uplink = self._uplink(index)
+        if uplink >= 0:
+            record["uplink"] = {"uplink_mac": self._device_mac(uplink), "type": "wire",
+                                "uplink_remote_port": index % 8 + 1, "speed": 1000, "full_duplex": True}
+        if kind == "uap":
+            record["radio_table"] = [
+                {"radio": "ng", "name": "wifi0", "channel": (1, 6, 11)[index % 3], "ht": 20, "tx_power_mode": "auto"},
+                {"radio": "na", "name": "wifi1", "channel": (36, 44, 149, 157)[index % 4], "ht": 80,
+                 "tx_power_mode": "auto"},
+            ]
+            record["vap_table"] = [
+                {"essid": ssid, "wlanconf_id": wlan_id, "radio": "na", "num_sta": 0}
+                for wlan_id, ssid, _ in self.wlans
+            ]
+        return record
+
+    def _port(self, rng: random.Random, index: int, n: int, kind: str) -> dict:
+        up = rng.random() < 0.7
+        return {
+            "port_idx": n,
+            "name": f"Port {n}",
+            "media": "GE" if n <= 48 else "SFP+",
+            "enable": True,
+            "up": up,
+            "speed": 1000 if up else 0,
+            "full_duplex": up,
+            "poe_enable": kind == "usw" and n <= 48,
+            "portconf_id": self.portconf_ids[n % len(self.portconf_ids)],
+            "rx_bytes": rng.randrange(10**6, 10**11) if up else 0,
+            "tx_bytes": rng.randrange(10**6, 10**11) if up else 0,
+        }
+
+    # -- clients and known users -------------------------------------------
+
+    def _client_ap(self, index: int) -> int | None:
+        """AP serving client index, or None for wired clients (every fifth)."""
+        if index % 5 == 0 or not self.ap_indexes:
+            return None
+        return self.ap_indexes[index % len(self.ap_indexes)]
+
+    def client_mac(self, index: int) -> str:
+        return mac_address(CLIENT_OUIS[index % len(CLIENT_OUIS)][0], index)
+
+    def client_index(self, mac: str) -> int | None:
+        index = mac_index(mac)
+        if 0 <= index < self.scale.clients and self.client_mac(index) == mac.lower():
+            return index
+        return None
+
+    def _user(self, index: int, rng: random.Random | None = None) -> dict:
+        """rest/user (known client) view of client index."""
+        rng = rng or random.Random(f"{self.scale.seed}:{self.name}:sta:{index}")
+        ap = self._client_ap(index)
+        wlan_id, ssid, network_id = self.wlans[index % len(self.wlans)]
+        if ap is None:
+            network_id = self.network_ids[index % len(self.network_ids)]
+        first_seen = self.now_ms // 1000 - rng.randrange(86400, 365 * 86400)
+        record = {
+            "_id": object_id("user", index),
+            "mac": self.client_mac(index),
+            "site_id": self.site_id,
+            "oui": CLIENT_OUIS[index % len(CLIENT_OUIS)][1],
+            "hostname": f"host-{index:06d}",
+            "is_guest": ssid == "Guest" and ap is not None,
+            "is_wired": ap is None,
+            "first_seen": first_seen,
+            "last_seen": self.now_ms // 1000 - rng.randrange(0, 300),
+            "usergroup_id": self.usergroup_ids[index % len(self.usergroup_ids)],
+            "last_connection_network_id": network_id,
+            "last_connection_network_name": self.network_names.get(network_id, "Default"),
+            "last_ip": _ip(CLIENT_NET, index + 2),
+        }
+        if ap is None:
+            switch = self.switch_indexes[index % len(self.switch_indexes)] if self.switch_indexes else 0
+            record["last_uplink_mac"] = self._device_mac(switch)
+            record["last_uplink_remote_port"] = index % 8 + 1
+        else:
+            record["wlanconf_id"] = wlan_id
+            record["last_uplink_mac"] = self._device_mac(ap)
+        return record
+
+    def _client(self, index: int) -> dict:
+        """stat/sta (connected client) record for client index."""
+        rng = random.Random(f"{self.scale.seed}:{self.name}:sta:{index}")
+        user = self._user(index, rng)
+        ap = self._client_ap(index)
+        record = {
+            "_id": user["_id"],
+            "user_id": user["_id"],
+            "mac": user["mac"],
+            "site_id": self.site_id,
+            "oui": user["oui"],
+            "hostname": user["hostname"],
+            "ip": user["last_ip"],
+            "is_guest": user["is_guest"],
+            "is_wired": user["is_wired"],
+            "first_seen": user["first_seen"],
+            "last_seen": user["last_seen"],
+            "usergroup_id": user["usergroup_id"],
+            "network_id": user["last_connection_network_id"],
+            "network": user["last_connection_network_name"],
+            "uptime": rng.randrange(60, 7 * 86400),
+            "authorized": True,
+            "rx_bytes": rng.randrange(10**5, 10**10),
+            "tx_bytes": rng.randrange(10**5, 10**10),
+            "rx_packets": rng.randrange(10**3, 10**7),
+            "tx_packets": rng.randrange(10**3, 10**7),
+            "satisfaction": rng.randrange(40, 100),
+        }
+        if ap is None:
+            record.update({
+                "sw_mac": user["last_uplink_mac"],
+                "sw_port": user["last_uplink_remote_port"],
+                "wired_rate_mbps": 1000,
+            })
+        else:
+            channel = (36, 44, 149, 157)[ap % 4]
+            rssi = rng.randrange(10, 60)
+            record.update({
+                "ap_mac": user["last_uplink_mac"],
+                "bssid": user["last_uplink_mac"],
+                "essid": self.ssids[user["wlanconf_id"]],
+                "wlanconf_id": user["wlanconf_id"],
+                "radio": "na",
+                "radio_proto": "ax",
+                "channel": channel,
+                "rssi": rssi,
+                "signal": rssi - 95,
+                "noise": -95,
+                "tx_rate": rng.choice((144_000, 288_000, 576_000, 1_200_000)),
+                "rx_rate": rng.choice((144_000, 288_000, 576_000, 1_200_000)),
+                "roam_count": rng.randrange(0, 20),
+            })
+        return record
+
+    def v2_client(self, record: dict, active: bool) -> dict:
+        """v2 clients/active|history view of a stat/sta or rest/user record."""
+        v2 = {k: v for k, v in record.items() if k != "_id"}
+        v2["id"] = record["_id"]
+        v2["type"] = "WIRED" if record.get("is_wired") else "WIRELESS"
+        v2["status"] = "online" if active else "offline"
+        v2["display_name"] = record.get("hostname") or record["mac"]
+        if active:
+            v2["network_name"] = record.get("network")
+        return v2
+
+    # -- events and alarms -------------------------------------------------
+
+    def _event_context(self, rng: random.Random) -> dict:
+        ap = self.ap_indexes[rng.randrange(len(self.ap_indexes))] if self.ap_indexes else 0
+        sw = self.switch_indexes[rng.randrange(len(self.switch_indexes))] if self.switch_indexes else 0
+        user = rng.randrange(self.scale.clients) if self.scale.clients else 0
+        wlan_id, ssid, _ = self.wlans[user % len(self.wlans)]
+        return {
+            "ap": self._device_mac(ap), "ap2": self._device_mac(self.ap_indexes[0] if self.ap_indexes else 0),
+            "sw": self._device_mac(sw), "gw": self._device_mac(0), "user": self.client_mac(user),
+            "ssid": ssid, "channel": (36, 44, 149, 157)[ap % 4], "port": user % 8 + 1,
+            "ip": _ip(ADMIN_NET, rng.randrange(2, 250)),
+        }
+
+    def _log_record(self, kind: str, types: tuple, index: int, at_ms: int) -> dict:
+        rng = random.Random(f"{self.scale.seed}:{self.name}:{kind}:{index}")
+        key, subsystem, template = types[rng.randrange(len(types))]
+        ctx = self._event_context(rng)
+        record = {
+            "_id": object_id(kind, index),
+            "key": key,
+            "subsystem": subsystem,
+            "site_id": self.site_id,
+            "time": at_ms,
+            "datetime": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(at_ms / 1000)),
+            "msg": template.format(**ctx),
+        }
+        for name in ("user", "ap", "sw", "gw", "ssid", "channel"):
+            if "{" + name + "}" in template:
+                record[name] = ctx[name]
+        return record
+
+    def _event(self, index: int, at_ms: int) -> dict:
+        return self._log_record("event", EVENT_TYPES, index, at_ms)
+
+    def _alarm(self, index: int, at_ms: int) -> dict:
+        return self._log_record("alarm", ALARM_TYPES, index, at_ms)
+
+    def live_event(self, seq: int) -> dict:
+        """A fresh event for the websocket feed (negative indexes: newer than the log)."""
+        return self._log_record("event", EVENT_TYPES, -seq, int(time.time() * 1000))
+
+    # -- reports -----------------------------------------------------------
+
+    def report(self, interval: str, rtype: str, body: dict) -> list[dict]:
+        step = REPORT_STEP_MS[interval]
+        end = int(body.get("end") or self.now_ms)
+        start = int(body.get("start") or end - 12 * step)
+        attrs = [a for a in body.get("attrs", []) if a not in ("time", "oid")] or ["bytes"]
+        key = REPORT_OBJECT_KEYS[rtype]
+        if rtype == "ap":
+            macs = body.get("macs") or [self._device_mac(i) for i in self.ap_indexes]
+        elif rtype == "user":
+            macs = body.get("macs") or [self.client_mac(i) for i in range(min(self.scale.clients, 100))]
+        elif rtype == "gw":
+            macs = [self._device_mac(0)]
+        else:
+            macs = [""]
+        rows = []
+        first = -(-start // step) * step
+        for bucket in range(first, end + 1, step):
+            for mac in macs:
+                seed = zlib.crc32(f"{self.scale.seed}:{mac}:{bucket}".encode())
+                row = {"time": bucket, "o": rtype, "oid": mac or self.name}
+                if key:
+                    row[key] = mac
+                for n, attr in enumerate(attrs):
+                    row[attr] = float(((seed >> (n % 16)) % 10_000) * (step // 300_000 or 1))
+                rows.append(row)
+        return rows
+
+    def sessions(self, body: dict) -> list[dict]:
+        """stat/session rows: one session per client per day overlapping [start, end] (epoch s)."""
+        end = int(body.get("end") or self.now_ms // 1000)
+        start = int(body.get("start") or end - 86400)
+        if body.get("mac"):
+            index = self.client_index(str(body["mac"]))
+            indexes: Iterable[int] = [] if index is None else [index]
+        else:
+            indexes = range(self.scale.clients)
+        rows = []
+        for day in range(start // 86400, end // 86400 + 1):
+            for index in indexes:
+                seed = zlib.crc32(f"{self.scale.seed}:{self.name}:session:{index}:{day}".encode())
+                assoc = day * 86400 + seed % 72000
+                duration = 600 + (seed >> 8) % 14400
+                if assoc > end or assoc + duration < start:
+                    continue
+                ap = self._client_ap(index)
+                row = {
+                    "_id": object_id("session", day << 24 | index),
+                    "mac": self.client_mac(index),
+                    "user_id": object_id("user", index),
+                    "site_id": self.site_id,
+                    "hostname": f"host-{index:06d}",
+                    "is_wired": ap is None,
+                    "is_guest": False,
+                    "assoc_time": assoc,
+                    "disassoc_time": assoc + duration,
+                    "duration": duration,
+                    "rx_bytes": seed % 10**8,
+                    "tx_bytes": (seed >> 4) % 10**8,
+                }
+                row["ap_mac" if ap is not None else "sw_mac"] = self._device_mac(ap if ap is not None else 0)
+                rows.append(row)
+        return rows
+
+    def speedtests(self, body: dict) -> list[dict]:
+        """stat/report/archive.speedtest rows: one gateway speedtest per hour in [start, end] (ms)."""
+        end = int(body.get("end") or self.now_ms)
+        start = int(body.get("start") or end - DAY_MS)
+        rows = []
+        for at in range(-(-start // 3_600_000) * 3_600_000, end + 1, 3_600_000):
+            seed = zlib.crc32(f"{self.scale.seed}:{self.name}:speedtest:{at}".encode())
+            rows.append({"time": at, "o": "gw", "oid": self._device_mac(0), "latency": 5 + seed % 30,
+                         "xput_download": 500.0 + seed % 400, "xput_upload": 100.0 + (seed >> 10) % 300})
+        return rows
+
+    # -- response cache ----------------------------------------------------
+
+    def mutated(self) -> None:
+        self.version += 1
+        self._cache.clear()
+
+    def cached(self, key: str, build: Callable[[], bytes]) -> bytes:
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def listing(self, key: str, records: Callable[[], Iterable[dict]]) -> bytes:
+        """{meta, data} bytes for a full-collection GET, built once per version."""
+        return self.cached(key, lambda: _dumps({"meta": {"rc": "ok"}, "data": list(records())}))
+
+    def v2_clients(self, active: bool) -> bytes:
+        source = self.clients if active else self.rest["user"]
+        key = "v2/clients/active" if active else "v2/clients/history"
+        return self.cached(key, lambda: _dumps([self.v2_client(r, active) for r in source]))
+
+    def warm(self) -> None:
+        """Build the large listings now instead of on their first request."""
+        self.listing("stat/device", lambda: self.devices)
+        self.listing("stat/sta", lambda: self.clients)
+        self.listing("rest/user", lambda: self.rest["user"])
+        self.v2_clients(True)
+
+
+# ---------------------------------------------------------------------------
+# Controller state and fault injection
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class Faults:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    slow_rate: float = 0.0
+    slow_ms: float = 1000.0
+    expire_every: int = 0  # drop all sessions every N authenticated requests (0 = never)
+
+
+@dataclass
+class Controller:
+    sites: dict[str, Site]
+    faults: Faults = field(default_factory=Faults)
+    username: str | None = None
+    password: str | None = None
+    ws_interval: float = 1.0
+    commands: dict[str, set[str]] = field(default_factory=dict)
+    dataset: Dataset | None = None  # served instead of the synthetic collections it covers
+    sessions: dict[str, str] = field(default_factory=dict)  # unifises → csrf token
+    stats: Counter = field(default_factory=Counter)
+    rng: random.Random = field(default_factory=random.Random)
+
+    def site(self, name: str) -> Site | None:
+        return self.sites.get(name)
+
+
+def build_controller(scale: Scale, site_count: int = 1, faults: Faults | None = None, **kwargs: Any) -> Controller:
+    """Build every site's dataset (synthetic records stay lazy)."""
+    now_ms = int(time.time() * 1000)
+    names = ["default"] + [f"site{n}" for n in range(2, site_count + 1)]
+    sites = {name: Site(name, object_id("site", n), scale, now_ms) for n, name in enumerate(names)}
+    inventory = json.loads(INVENTORY.read_text())
+    commands = {ep["path"].split("/", 1)[1]: set(ep.get("commands", [])) for ep in inventory["cmd_endpoints"].values()}
+    return Controller(sites=sites, faults=faults or Faults(), commands=commands,
+                      rng=random.Random(scale.seed), **kwargs)
+
+
+def _dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def envelope(data: Any, status: int = 200, **meta: Any) -> Response:
+    return Response(_dumps({"meta": {"rc": "ok", **meta}, "data": data}), status, media_type="application/json")
+
+
+def api_error(msg: str, status: int = 400) -> Response:
+    return Response(_dumps({"meta": {"rc": "error", "msg": msg}, "data": []}), status, media_type="application/json")
+
+
+def v2_error(message: str, status: int = 404) -> Response:
+    return Response(_dumps({"code": "api.err.NotFound" if status == 404 else "api.err.Invalid",
+                            "errorCode": status, "message": message}), status, media_type="application/json")
+
+
+def raw_json(content: bytes, status: int = 200) -> Response:
+    return Response(content, status, media_type="application/json")
+
+
+async def _json_body(request: Request) -> dict:
+    body = await request.body()
+    if not body:
+        return {}
+    try:
+        parsed = json.loads(body)
+    except ValueError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+# ---------------------------------------------------------------------------
+# ASGI app
+# ---------------------------------------------------------------------------
+
+
+def create_app(controller: Controller) -> Starlette:
+    """Starlette app serving the mock controller."""
+    global_samples = {name: _sample_data(f"global_{name}") for name in ("self", "stat_admin")}
+    status_meta = (_load_sample("global_status") or {}).get("meta", {"rc": "ok", "up": True})
+    bundles = _load_sample("dl_firmware_bundles") or {}
+    guest = {name: _sample_data(f"guest_{name}") for name in ("hotspotconfig", "hotspotpackages")}
+    inventory = json.loads(INVENTORY.read_text())
+    known_stats = {ep["path"][len("stat/"):] for ep in inventory["stat_endpoints"].values()}
+    list_only = {ep["path"][len("list/"):] for ep in inventory["list_endpoints"].values()}
+
+    def session_of(request: Request | WebSocket) -> str | None:
+        sid = request.cookies.get("unifises")
+        return sid if sid in controller.sessions else None
+
+    async def with_faults(request: Request, route: str, handler: Callable, auth: bool = True) -> Response:
+        faults = controller.faults
+        controller.stats[f"{request.method} {route}"] += 1
+        controller.stats["requests"] += 1
+        delay = faults.latency_ms + (controller.rng.uniform(-faults.jitter_ms, faults.jitter_ms) if faults.jitter_ms else 0)
+        if faults.slow_rate and controller.rng.random() < faults.slow_rate:
+            delay = faults.slow_ms
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if auth:
+            sid = session_of(request)
+            if sid is None:
+                return api_error("api.err.LoginRequired", 401)
+            if request.method != "GET" and request.headers.get("x-csrf-token") != controller.sessions[sid]:
+                return api_error("api.err.InvalidCSRFToken", 403)
+            controller.stats["authenticated"] += 1
+            if faults.expire_every and controller.stats["authenticated"] % faults.expire_every == 0:
+                # This request still succeeds; the next one on any session gets a 401
+                controller.sessions.clear()
+                controller.stats["expired"] += 1
+        if faults.error_rate and controller.rng.random() < faults.error_rate:
+            controller.stats["errors_injected"] += 1
+            return api_error("api.err.ServerError", 500)
+        return await handler()
+
+    # -- auth and global ---------------------------------------------------
+
+    async def login(request: Request) -> Response:
+        async def handle() -> Response:
+            body = await _json_body(request)
+            if not body.get("username") or not body.get("password") or \
+                    (controller.username is not None and body["username"] != controller.username) or \
+                    (controller.password is not None and body["password"] != controller.password):
+                return api_error("api.err.Invalid", 400)
+            sid, token = secrets.token_hex(16), secrets.token_hex(16)
+            controller.sessions[sid] = token
+            response = envelope([])
+            response.set_cookie("unifises", sid, httponly=True, secure=True, samesite="strict")
+            response.set_cookie("csrf_token", token, secure=True, samesite="strict")
+            response.headers["x-csrf-token"] = token
+            return response
+        return await with_faults(request, "login", handle, auth=False)
+
+    async def logout(request: Request) -> Response:
+        async def handle() -> Response:
+            controller.sessions.pop(request.cookies.get("unifises", ""), None)
+            return envelope([])
+        return await with_faults(request, "logout", handle, auth=False)
+
+    async def status(request: Request) -> Response:
+        async def handle() -> Response:
+            return envelope([], **{k: v for k, v in status_meta.items() if k != "rc"})
+        return await with_faults(request, "status", handle, auth=False)
+
+    def site_summary(site: Site, with_health: bool) -> dict:
+        record = {"_id": site.site_id, "name": site.name, "desc": "Default" if site.name == "default" else site.name,
+                  "attr_hidden_id": site.name, "attr_no_delete": site.name == "default", "role": "admin",
+                  "device_count": site.scale.devices}
+        if with_health:
+            record["health"] = [
+                {"subsystem": "wlan", "status": "ok", "num_ap": len(site.ap_indexes),
+                 "num_user": site.scale.clients - site.scale.clients // 5},
+                {"subsystem": "lan", "status": "ok", "num_sw": len(site.switch_indexes),
+                 "num_user": site.scale.clients // 5},
+                {"subsystem": "wan", "status": "ok", "num_gw": 1 if site.scale.devices else 0},
+            ]
+        return record
+
+    async def global_api(request: Request) -> Response:
+        path = request.path_params["path"]
+
+        async def handle() -> Response:
+            if path == "self":
+                return envelope(global_samples["self"])
+            if path in ("self/sites", "stat/sites"):
+                return envelope([site_summary(s, path == "stat/sites") for s in controller.sites.values()])
+            if path == "stat/admin":
+                return envelope(global_samples["stat_admin"])
+            if path in ("system/reboot", "system/poweroff"):
+                return envelope([])  # accepted and ignored
+            return api_error("api.err.NotFound", 404)
+        return await with_faults(request, path, handle)
+
+    async def dl_bundles(request: Request) -> Response:
+        async def handle() -> Response:
+            return raw_json(_dumps(bundles))
+        return await with_faults(request, "dl/firmware/bundles.json", handle, auth=False)
+
+    async def guest_api(request: Request) -> Response:
+        name = request.path_params["name"]
+
+        async def handle() -> Response:
+            if name not in guest or controller.site(request.path_params["site"]) is None:
+                return api_error("api.err.NotFound", 404)
+            return envelope(guest[name])
+        return await with_faults(request, f"guest/{name}", handle)
+
+    # -- /api/s/{site}/* ---------------------------------------------------
+
+    def rest_crud(site: Site, request: Request, collection: Collection, oid: str | None, body: dict) -> Response:
+        if request.method == "GET":
+            if oid is None:
+                return raw_json(site.listing(f"rest/{collection.kind}", lambda: collection))
+            record = collection.get(oid)
+            return envelope([record]) if record else api_error("api.err.IdInvalid", 400)
+        if request.method == "POST" and oid is None:
+            if not body:
+                return api_error("api.err.InvalidObject", 400)
+            site.mutated()
+            return envelope([collection.create(body, site.site_id)])
+        if request.method == "PUT" and oid is not None:
+            record = collection.update(oid, body)
+            if record is None:
+                return api_error("api.err.IdInvalid", 400)
+            site.mutated()
+            return envelope([record])
+        if request.method == "DELETE" and oid is not None:
+            if not collection.delete(oid):
+                return api_error("api.err.IdInvalid", 400)
+            site.mutated()
+            return envelope([])
+        return api_error("api.err.InvalidObject", 400)
+
+    def settings(site: Site, request: Request, key: str | None, body: dict) -> Response:
+        if request.method == "GET":
+            records = [r for r in site.settings if key is None or r.get("key") == key]
+            return envelope(records)
+        record = next((r for r in site.settings if r.get("key") == key), None)
+        if record is None:
+            return api_error("api.err.InvalidObject", 400)
+        site.mutated()
+        return envelope([site.settings.update(record["_id"], body)])
+
+    def page_args(body: dict, query: dict) -> tuple[int, int, float | None, bool | None]:
+        limit = int(body.get("_limit", query.get("_limit", DEFAULT_EVENT_LIMIT)))
+        start = int(body.get("_start", query.get("_start", 0)))
+        within = body.get("within", query.get("within"))
+        archived = body.get("archived", query.get("archived"))
+        if isinstance(archived, str):
+            archived = archived.lower() == "true"
+        return start, limit, float(within) if within else None, archived
+
+    def events(site: Site, log: EventLog, body: dict, query: dict) -> Response:
+        records, total = log.page(*page_args(body, query))
+        return envelope(records, count=total)
+
+    def from_dataset(key: str, body: dict, query: dict) -> Response | None:
+        """The --dataset answer for a full read of key, or None to synthesize."""
+        dataset = controller.dataset
+        if dataset is None or key not in dataset:
+            return None
+        if key in ("stat_event", "stat_alarm"):
+            start, limit, within, _ = page_args(body, query)
+            records, total = dataset.page(key, start, limit, within)
+            return envelope(records, count=total)
+        if body:
+            return None  # filtered reads (macs, attrs, ...) stay synthetic
+        return dataset.stream(key, envelope=not key.startswith("v2_"))
+
+    def stat(site: Site, request: Request, rest: list[str], body: dict) -> Response:
+        name = "/".join(rest)
+        query = dict(request.query_params)
+        if len(rest) == 1 and (response := from_dataset(f"stat_{name.replace('-', '_')}", body, query)):
+            return response
+        if name in ("device", "device-basic") or (rest[0] == "device" and len(rest) == 2):
+            macs = {m.lower() for m in body.get("macs", [])}
+            if len(rest) == 2:
+                macs = {rest[1].lower()}
+            if macs:
+                indexes = (site.device_index(m) for m in macs)
+                records = [d for d in (site.devices.synthetic(i) for i in indexes if i is not None) if d]
+                return envelope(records)
+            if name == "device-basic":
+                return raw_json(site.listing("stat/device-basic", lambda: (
+                    {k: d[k] for k in ("mac", "state", "adopted", "disabled", "type", "model", "name")}
+                    for d in site.devices)))
+            return raw_json(site.listing("stat/device", lambda: site.devices))
+        if name == "sta":
+            return raw_json(site.listing("stat/sta", lambda: site.clients))
+        if name == "alluser":
+            return raw_json(site.listing("stat/alluser", lambda: site.rest["user"]))
+        if name == "event":
+            return events(site, site.events, body, query)
+        if name == "alarm":
+            return events(site, site.alarms, body, query)
+        if name == "session":
+            return envelope(site.sessions(body))
+        if name == "gateway":
+            return envelope([d for d in [site.devices.synthetic(0)] if d])
+        if name == "report/archive.speedtest":
+            return envelope(site.speedtests(body))
+        if rest[0] == "report" and len(rest) == 2:
+            interval, _, rtype = rest[1].partition(".")
+            if interval not in REPORT_STEP_MS or rtype not in REPORT_OBJECT_KEYS:
+                return api_error("api.err.InvalidArgs", 400)
+            return envelope(site.report(interval, rtype, body))
+        if name == "health":
+            return envelope(site_summary(site, True)["health"])
+        sample_name = name.replace("-", "_").replace("/", "_").replace(".", "_").replace("5minutes", "5min")
+        if sample_name in site.stat_samples:
+            return envelope(site.stat_samples[sample_name])
+        if name in known_stats:
+            return envelope([])
+        return api_error("api.err.NotFound", 404)
+
+    def command(site: Site, manager: str, body: dict) -> Response:
+        cmd = body.get("cmd")
+        if manager not in controller.commands:
+            return api_error("api.err.NotFound", 404)
+        if not cmd or cmd not in controller.commands[manager]:
+            return api_error("api.err.UnknownCmd", 400)
+        mac = str(body.get("mac", ""))
+        if manager == "devmgr" and mac and site.device_index(mac) is None:
+            return api_error("api.err.UnknownDevice", 400)
+        if manager == "stamgr" and mac and site.client_index(mac) is None:
+            return api_error("api.err.UnknownStation", 400)
+        if manager == "devmgr" and cmd == "rename" and mac:
+            site.devices.update(object_id("device", site.device_index(mac)), {"name": body.get("name", "")})
+            site.mutated()
+        if manager == "stamgr" and cmd == "forget-sta":
+            for m in body.get("macs", [mac]):
+                index = site.client_index(str(m))
+                if index is not None:
+                    site.clients.delete(object_id("sta", index))
+                    site.rest["user"].delete(object_id("user", index))
+            site.mutated()
+        if manager == "evtmgr" and cmd == "archive-all-alarms":
+            site.alarms.unarchived = 0
+        if manager == "evtmgr" and cmd == "archive-alarm":
+            index = object_index("alarm", str(body.get("_id", "")))
+            if index is None or not 0 <= index < site.alarms.count:
+                return api_error("api.err.IdInvalid", 400)
+            site.alarms.archived.add(index)
+        return envelope([])
+
+    def count(site: Site, name: str) -> Response:
+        counts = {
+            "alarm": len(site.alarms.window(archived=False)),
+            "event": site.events.count,
+            "sta": len(site.clients),
+            "user": len(site.rest["user"]),
+        }
+        if name not in counts:
+            return api_error("api.err.NotFound", 404)
+        return envelope([{"count": counts[name]}])
+
+    async def site_api(request: Request) -> Response:
+        site = controller.site(request.path_params["site"])
+        parts = request.path_params["path"].strip("/").split("/")
+        category = parts[0]
+        route = "/".join(parts[:2]) if category in ("stat", "rest", "list", "cmd", "cnt") else category
+
+        async def handle() -> Response:
+            if site is None:
+                return api_error("api.err.NoSiteContext", 400)
+            body = await _json_body(request)
+            if category in ("rest", "list") and len(parts) >= 2:
+                name = parts[1]
+                if request.method == "GET" and len(parts) == 2 and (
+                        response := from_dataset(f"{category}_{name}", body, dict(request.query_params))):
+                    return response
+                if name == "setting":
+                    return settings(site, request, parts[2] if len(parts) > 2 else None, body)
+                if name == "device":
+                    return rest_crud(site, request, site.devices, parts[2] if len(parts) > 2 else None, body)
+                if name in site.rest and (category == "rest" or request.method == "GET") and len(parts) <= 3:
+                    return rest_crud(site, request, site.rest[name], parts[2] if len(parts) > 2 else None, body)
+                if category == "list" and name == "devices" and request.method == "GET":
+                    return raw_json(site.listing("stat/device", lambda: site.devices))
+                if category == "list" and name in list_only and request.method == "GET":
+                    return envelope(_sample_data(f"list_{name}"))
+                return api_error("api.err.NotFound", 404)
+            if category == "stat" and len(parts) >= 2:
+                return stat(site, request, parts[1:], body)
+            if category == "cmd" and len(parts) == 2:
+                return command(site, parts[1], body)
+            if category == "cnt" and len(parts) == 2:
+                return count(site, parts[1])
+            if category == "get" and len(parts) >= 2 and parts[1] == "setting":
+                return settings(site, request, parts[2] if len(parts) > 2 else None, body)
+            if category == "set" and len(parts) == 3 and parts[1] == "setting":
+                return settings(site, request, parts[2], body)
+            if category in ("upd", "group") and request.method == "GET":
+                return envelope([])
+            if category == "upd" and len(parts) == 3 and request.method == "PUT":
+                collection = site.rest["user"] if parts[1] == "user" else site.devices if parts[1] == "device" else None
+                if collection is None:
+                    return api_error("api.err.NotFound", 404)
+                return rest_crud(site, request, collection, parts[2], body)
+            if category == "group" and len(parts) == 2 and parts[1] == "user" and request.method == "POST":
+                for obj in body.get("objects", []):
+                    data = obj.get("data", {})
+                    index = site.client_index(str(data.get("mac", "")))
+                    if index is not None:
+                        site.rest["user"].update(object_id("user", index), data)
+                site.mutated()
+                return envelope([])
+            return api_error("api.err.NotFound", 404)
+        return await with_faults(request, route, handle)
+
+    # -- /v2/api/site/{site}/* ---------------------------------------------
+
+    async def v2_api(request: Request) -> Response:
+        site = controller.site(request.path_params["site"])
+        path = request.path_params["path"].strip("/")
+
+        async def handle() -> Response:
+            if site is None:
+                return v2_error(f"Site {request.path_params['site']} not found")
+            if request.method == "GET" and (response := from_dataset(f"v2_{path.replace('/', '_')}", {}, {})):
+                return response
+            if path in ("clients/active", "clients/history") and request.method == "GET":
+                return raw_json(site.v2_clients(path == "clients/active"))
+            for name, collection in site.v2.items():
+                if path == name or path.startswith(name + "/"):
+                    oid = path[len(name) + 1:] or None
+                    body = await _json_body(request)
+                    if request.method == "GET" and oid is None:
+                        return raw_json(site.cached(f"v2/{name}", lambda: _dumps(list(collection))))
+                    if request.method == "POST" and oid is None:
+                        site.mutated()
+                        return raw_json(_dumps(collection.create(body, site.site_id)))
+                    if request.method == "PUT" and oid is None and isinstance(body, dict):
+                        # Batch-style PUT on trafficroutes / firewall zone: accept as-is
+                        site.mutated()
+                        return raw_json(_dumps(body))
+                    if request.method == "PUT":
+                        record = collection.update(oid, body)
+                        if record is None:
+                            return v2_error(f"{name} {oid} not found")
+                        site.mutated()
+                        return raw_json(_dumps(record))
+                    if request.method == "DELETE":
+                        if not collection.delete(oid):
+                            return v2_error(f"{name} {oid} not found")
+                        site.mutated()
+                        return raw_json(b"{}")
+                    return v2_error(f"Unsupported {request.method} on {name}", 400)
+            return v2_error(f"No route for {path}")
+        return await with_faults(request, f"v2/{path.split('/')[0]}", handle)
+
+    # -- events websocket --------------------------------------------------
+
+    async def events_http(request: Request) -> Response:
+        async def handle() -> Response:
+            return envelope([])  # without an Upgrade header the controller answers like an API GET
+        return await with_faults(request, "wss/events", handle)
+
+    async def events_ws(websocket: WebSocket) -> None:
+        site = controller.site(websocket.path_params["site"])
+        if site is None or session_of(websocket) is None:
+            await websocket.close(code=4001)
+            return
+        await websocket.accept()
+        controller.stats["ws connections"] += 1
+        seq = 0
+        try:
+            while True:
+                seq += 1
+                message = {"meta": {"rc": "ok", "message": "events"}, "data": [site.live_event(seq)]}
+                await websocket.send_text(_dumps(message).decode())
+                controller.stats["ws events"] += 1
+                await asyncio.sleep(controller.ws_interval)
+        except (WebSocketDisconnect, RuntimeError):
+            pass
+
+    # -- mock introspection ------------------------------------------------
+
+    async def mock_stats(request: Request) -> Response:
+        if request.method == "POST":
+            controller.stats.clear()
+            return raw_json(b"{}")
+        return raw_json(_dumps({"sessions": len(controller.sessions), **controller.stats}))
+
+    methods = ["GET", "POST", "PUT", "DELETE"]
+    return Starlette(routes=[
+        Route("/api/login", login, methods=["POST"]),
+        Route("/api/logout", logout, methods=["GET", "POST"]),
+        Route("/status", status),
+        Route("/api/s/{site}/{path:path}", site_api, methods=methods),
+        Route("/api/{path:path}", global_api, methods=methods),
+        Route("/v2/api/site/{site}/{path:path}", v2_api, methods=methods),
+        Route("/guest/s/{site}/{name}", guest_api),
+        Route("/dl/firmware/bundles.json", dl_bundles),
+        WebSocketRoute("/wss/s/{site}/events", events_ws),
+        Route("/wss/s/{site}/events", events_http),
+        Route("/_mock/stats", mock_stats),
+        Route("/_mock/reset", mock_stats, methods=["POST"]),
+    ])
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def self_signed_cert(host: str) -> tuple[str, str]:
+    """Write a throwaway self-signed certificate; returns (certfile, keyfile)."""
+    import datetime
+
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "unifi-mock")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    try:
+        san = x509.IPAddress(ipaddress.ip_address(host))
+    except ValueError:
+        san = x509.DNSName(host)
+    cert = (x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(key.public_key())
+            .serial_number(x509.random_serial_number()).not_valid_before(now)
+            .not_valid_after(now + datetime.timedelta(days=30))
+            .add_extension(x509.SubjectAlternativeName([san]), critical=False)
+            .sign(key, hashes.SHA256()))
+    directory = Path(tempfile.mkdtemp(prefix="unifi-mock-"))
+    (directory / "cert.pem").write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    (directory / "key.pem").write_bytes(key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()))
+    return str(directory / "cert.pem"), str(directory / "key.pem")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mock UniFi controller for load and benchmark testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small",
+                        help="Preset per-site sizes: " + ", ".join(
+                            f"{k}={d}/{c}/{e}" for k, (d, c, e) in SCALES.items()) + " (devices/clients/events)")
+    parser.add_argument("--devices", type=int, help="Devices per site (overrides --scale)")
+    parser.add_argument("--clients", type=int, help="Clients per site (overrides --scale)")
+    parser.add_argument("--events", type=int, help="Events per site (overrides --scale)")
+    parser.add_argument("--alarms", type=int, help="Alarms per site (default: events / 10)")
+    parser.add_argument("--sites", type=int, default=1, help="Number of sites (default, site2, ...)")
+    parser.add_argument("--seed", type=int, default=0, help="Dataset seed (same seed → same records)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Added latency per request, ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Uniform +/- jitter on --latency, ms")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="Fraction of requests delayed by --slow-latency")
+    parser.add_argument("--slow-latency", type=float, default=1000.0, help="Tail latency for --slow-rate, ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--expire-every", type=int, default=0,
+                        help="Invalidate all sessions every N authenticated requests (forces relogin)")
+    parser.add_argument("--ws-interval", type=float, default=1.0, help="Seconds between websocket events")
+    parser.add_argument("--dataset", type=Path,
+                        help="Serve the NDJSON files written by synth_dataset.py for the endpoints they cover "
+                             "(sizes default to its manifest)")
+    parser.add_argument("--warm", action="store_true",
+                        help="Build the device/client listings before listening (no cold first request)")
+    parser.add_argument("--username", help="Only accept this username (default: any)")
+    parser.add_argument("--password", help="Only accept this password (default: any)")
+    parser.add_argument("--certfile", help="TLS certificate (default: generate a self-signed one)")
+    parser.add_argument("--keyfile", help="TLS key for --certfile")
+    args = parser.parse_args()
+
+    devices, clients, events = SCALES[args.scale]
+    alarms = args.alarms
+    dataset = Dataset(args.dataset) if args.dataset else None
+    if dataset and dataset.manifest:
+        # Size the synthetic site like the dataset so its MACs and IDs resolve in commands
+        counts = dataset.manifest.get("counts", {})
+        devices = counts.get("stat_device", devices)
+        clients = counts.get("stat_sta", clients)
+        events = counts.get("stat_event", events)
+        alarms = counts.get("stat_alarm", alarms) if alarms is None else alarms
+    scale = Scale(
+        devices=devices if args.devices is None else args.devices,
+        clients=clients if args.clients is None else args.clients,
+        events=events if args.events is None else args.events,
+        alarms=alarms,
+        seed=args.seed,
+    )
+    faults = Faults(latency_ms=args.latency, jitter_ms=args.jitter, error_rate=args.error_rate,
+                    slow_rate=args.slow_rate, slow_ms=args.slow_latency, expire_every=args.expire_every)
+    started = time.perf_counter()
+    controller = build_controller(scale, args.sites, faults, username=args.username, password=args.password,
+                                  ws_interval=args.ws_interval, dataset=dataset)
+    if args.warm:
+        for site in controller.sites.values():
+            site.warm()
+    print(f"Mock controller: {args.sites} site(s) x {scale.devices} devices, {scale.clients} clients, "
+          f"{scale.events} events (built in {time.perf_counter() - started:.2f}s)", file=sys.stderr)
+
+    certfile, keyfile = args.certfile, args.keyfile
+    if not certfile:
+        certfile, keyfile = self_signed_cert(args.host)
+    print(f"Listening on https://{args.host}:{args.port}", file=sys.stderr)
+
+    import uvicorn
+
+    uvicorn.run(create_app(controller), host=args.host, port=args.port, ssl_certfile=certfile,
+                ssl_keyfile=keyfile, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Write a synthetic UniFi dataset as NDJSON, one file per endpoint.
+
+Records come from generator/synthetic.py: field types, enum values and
+presence follow the schemas inferred from spec/api-samples and
+spec/field-inventory.json, and IDs/MACs cross-reference consistently
+across files (clients → APs, switch ports, WLANs and networks; device
+ports → port profiles; events → clients and devices). Output is streamed
+a line at a time, and large endpoints are split into chunks written by
+--jobs processes and concatenated in order, so multi-GB fixtures need
+neither the memory nor a single core. The same --seed gives the same
+bytes.
+
+Usage:
+    # 10k devices, 100k clients, 1M events
+    uv run python mock-controller/synth_dataset.py --scale large --out /tmp/unifi-large
+
+    # Just clients and devices, explicit sizes
+    uv run python mock-controller/synth_dataset.py --out /tmp/ds --devices 500 --clients 20000 \\
+        --endpoints stat_sta,stat_device
+
+    # Serve it
+    uv run python mock-controller/mock_controller.py --dataset /tmp/unifi-large
+
+Writes <out>/<endpoint>.ndjson plus manifest.json (seed, counts, sizes).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add repo root to path so we can import generator modules
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from generator.synthetic import Synthesizer, default_counts, load_schemas, write_ndjson
+
+SAMPLES_DIR = REPO_ROOT / "spec" / "api-samples"
+FIELD_INVENTORY = REPO_ROOT / "spec" / "field-inventory.json"
+
+# --scale presets, the same as mock_controller.py: devices, clients, events
+SCALES = {
+    "small": (20, 200, 2_000),
+    "medium": (1_000, 10_000, 100_000),
+    "large": (10_000, 100_000, 1_000_000),
+}
+CHUNK = 50_000  # records per worker task
+
+
+_WORKER_SYNTH: Synthesizer | None = None  # set once per worker process
+
+
+def _init_worker(synth: Synthesizer) -> None:
+    global _WORKER_SYNTH
+    _WORKER_SYNTH = synth
+
+
+def _write_chunk(key: str, path: Path, start: int, stop: int) -> tuple[int, int]:
+    return write_ndjson(_WORKER_SYNTH, key, path, start, stop)
+
+
+def write_dataset(synth: Synthesizer, out: Path, keys: list[str], jobs: int | None = None) -> dict[str, dict]:
+    """Write every key to out/<key>.ndjson; returns key → {records, bytes}."""
+    out.mkdir(parents=True, exist_ok=True)
+    tasks = []
+    for key in keys:
+        count = synth.counts[key]
+        for start in range(0, max(count, 1), CHUNK):
+            tasks.append((key, out / f".{key}.{start:012d}.part", start, min(start + CHUNK, count)))
+    results: dict[str, dict] = {key: {"records": 0, "bytes": 0} for key in keys}
+    workers = min(jobs or os.cpu_count() or 1, len(tasks))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(synth,)) as pool:
+            futures = [pool.submit(_write_chunk, *task) for task in tasks]
+            sizes = [future.result() for future in futures]
+    else:
+        sizes = [write_ndjson(synth, *task) for task in tasks]
+    for key in keys:
+        with (out / f"{key}.ndjson").open("wb") as f:
+            for (task_key, part, _, _), (records, size) in zip(tasks, sizes):
+                if task_key != key:
+                    continue
+                with part.open("rb") as chunk:
+                    shutil.copyfileobj(chunk, f, 1 << 20)
+                part.unlink()
+                results[key]["records"] += records
+                results[key]["bytes"] += size
+    return results
+
+
+def _count(value: str) -> tuple[str, int]:
+    key, sep, n = value.partition("=")
+    if not sep or not n.isdigit():
+        raise argparse.ArgumentTypeError(f"expected ENDPOINT=N, got {value!r}")
+    return key, int(n)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write a synthetic UniFi dataset as NDJSON.")
+    parser.add_argument("--out", type=Path, required=True, help="Output directory")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small",
+                        help="Preset devices/clients/events (default: small)")
+    parser.add_argument("--devices", type=int, help="Devices (overrides --scale)")
+    parser.add_argument("--clients", type=int, help="Clients (overrides --scale)")
+    parser.add_argument("--events", type=int, help="Events; alarms are a tenth (overrides --scale)")
+    parser.add_argument("--count", type=_count, action="append", default=[], metavar="ENDPOINT=N",
+                        help="Records for one endpoint, e.g. rest_networkconf=200 (repeatable)")
+    parser.add_argument("--endpoints", help="Comma-separated endpoint keys to write (default: all)")
+    parser.add_argument("--seed", type=int, default=0, help="Dataset seed (default: 0)")
+    parser.add_argument("--now", type=int, help="Newest event time, epoch ms (default: now)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes (default: CPU count; 1 = no pool)")
+    parser.add_argument("--list", action="store_true", help="List endpoint keys and counts, write nothing")
+    args = parser.parse_args()
+
+    schemas = load_schemas(SAMPLES_DIR, FIELD_INVENTORY)
+    devices, clients, events = SCALES[args.scale]
+    counts = default_counts(schemas, args.devices if args.devices is not None else devices,
+                            args.clients if args.clients is not None else clients,
+                            args.events if args.events is not None else events)
+    for key, n in args.count:
+        if key not in schemas:
+            parser.error(f"unknown endpoint {key!r} (see --list)")
+        counts[key] = n
+    keys = list(schemas)
+    if args.endpoints:
+        keys = [key.strip() for key in args.endpoints.split(",") if key.strip()]
+        unknown = [key for key in keys if key not in schemas]
+        if unknown:
+            parser.error(f"unknown endpoints: {', '.join(unknown)} (see --list)")
+    if args.list:
+        for key in keys:
+            print(f"  {key:<28} {counts[key]:>10,}  ({len(schemas[key].fields)} fields)")
+        return
+
+    synth = Synthesizer(schemas, counts, seed=args.seed, now_ms=args.now)
+    started = time.perf_counter()
+    results = write_dataset(synth, args.out, keys, args.jobs)
+    elapsed = time.perf_counter() - started
+    manifest = {
+        "seed": args.seed,
+        "now_ms": synth.now_ms,
+        "counts": counts,
+        "endpoints": results,
+    }
+    (args.out / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n")
+    total_records = sum(r["records"] for r in results.values())
+    total_bytes = sum(r["bytes"] for r in results.values())
+    print(f"Wrote {total_records:,} records ({total_bytes / 1e6:,.1f} MB) in {len(results)} files "
+          f"to {args.out} in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,18 +13,24 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
 import json
 import os
 import sys
-from dataclasses import dataclass
+from collections.abc import Callable, Generator
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
 import httpx
 
+from generator.scrub import scrub_value
+
 ROOT = Path(__file__).parent
 DEFAULT_SPEC = ROOT / "spec" / "probe-spec.json"
 DEFAULT_OUTPUT = ROOT / "spec" / "endpoint-inventory.json"
 DEFAULT_SAMPLES_DIR = ROOT / "spec" / "api-samples"
+DEFAULT_CACHE = ROOT / "spec" / ".probe-cache.jsonl"
 
 # ── Safety ──────────────────────────────────────────────────────────────────
 # Commands that are safe to execute via POST (read-only / no side effects).
@@ -36,23 +42,6 @@ SAFE_COMMANDS = frozenset({
     "check-firmware-update",
 })
 
-# Fields to scrub from sample data before writing to disk.
-SCRUB_FIELDS = frozenset({
-    "x_password",
-    "x_passphrase",
-    "x_shadow",
-    "x_private_key",
-    "x_certificate_pem",
-    "x_certificate_arn",
-    "device_auth",
-    "ubic_uuid",
-    "device_id",
-})
-
-# Substrings — any field whose name contains one of these gets scrubbed.
-SCRUB_SUBSTRINGS = ("secret", "token", "key", "password", "passphrase")
-
-
 # ── Result types ────────────────────────────────────────────────────────────
 @dataclass
 class ProbeResult:
@@ -68,54 +57,70 @@ class ProbeResult:
     verified: bool = True  # False for cmd endpoints we didn't execute
 
 
-# ── Scrubbing ───────────────────────────────────────────────────────────────
-def _should_scrub(field_name: str) -> bool:
-    """Check if a field name indicates sensitive data."""
-    if field_name in SCRUB_FIELDS:
-        return True
-    lower = field_name.lower()
-    return any(s in lower for s in SCRUB_SUBSTRINGS)
-
-
-def scrub_value(obj):
-    """Recursively scrub sensitive fields from a JSON-like object."""
-    if isinstance(obj, dict):
-        return {
-            k: "REDACTED" if _should_scrub(k) else scrub_value(v)
-            for k, v in obj.items()
-        }
-    if isinstance(obj, list):
-        return [scrub_value(item) for item in obj]
-    return obj
+# ── Probe plan ──────────────────────────────────────────────────────────────
+# A probe step asks for one request: (method, path, json body). The engine
+# sends back the response, or None on timeout/connection error.
+ProbeStep = tuple[str, str, "dict | None"]
+ProbeSteps = Generator[ProbeStep, "httpx.Response | None", "ProbeResult | list[ProbeResult]"]
+# Called with (category, name, ep) and its results as each endpoint finishes
+ProbeDone = Callable[[tuple[str, str, dict], "list[ProbeResult]"], None]
+
+# Spec categories in probe order: (spec key, result category)
+PROBE_CATEGORIES = (
+    ("global_endpoints", "global"),
+    ("rest_endpoints", "rest"),
+    ("list_endpoints", "list"),
+    ("stat_endpoints", "stat"),
+    ("cmd_endpoints", "cmd"),
+    ("v2_endpoints", "v2"),
+    ("guest_endpoints", "guest"),
+    ("upd_endpoints", "upd"),
+    ("group_endpoints", "group"),
+    ("cnt_endpoints", "cnt"),
+    ("get_endpoints", "get"),
+    ("set_endpoints", "set"),
+    ("dl_endpoints", "dl"),
+    ("websocket_endpoints", "websocket"),
+)
+
+# Categories whose endpoints are probed one at a time even when probing
+# concurrently: cmd managers POST to the controller (and run SAFE_COMMANDS).
+DEFAULT_SERIAL_CATEGORIES = frozenset({"cmd"})
+
+
+def _record_count(body) -> int | None:
+    """Number of records in a v1 {"data": [...]} envelope."""
+    if isinstance(body, dict) and "data" in body:
+        records = body["data"]
+        if isinstance(records, list):
+            return len(records)
+    return None
+
+
+def _json_or_none(r: httpx.Response):
+    try:
+        return r.json()
+    except Exception:
+        return None
 
 
-# ── HTTP client ─────────────────────────────────────────────────────────────
-class UniFiProber:
-    """Manages auth and requests to a live UniFi controller."""
+# ── Probe logic ─────────────────────────────────────────────────────────────
+class _ProbeLogic:
+    """What to request for each endpoint and how to read the response.
 
-    def __init__(self, host: str, port: int, username: str, password: str,
-                 site: str, verify_ssl: bool, verbose: bool):
-        self.base_url = f"https://{host}:{port}"
-        self.username = username
-        self.password = password
-        self.site = site
-        self.verbose = verbose
-        self.csrf_token: str | None = None
-        self.client = httpx.Client(
-            base_url=self.base_url,
-            verify=verify_ssl,
-            timeout=30.0,
-            follow_redirects=True,
-        )
-        self.controller_version: str | None = None
-        self.controller_type: str | None = None
+    Each probe is a generator of ProbeSteps, so the same logic runs on the
+    synchronous UniFiProber and the concurrent AsyncUniFiProber; they only
+    differ in how a step's request is sent. Auth state (CSRF token, login
+    handling) is shared here too.
+    """
 
-    def close(self):
-        try:
-            self.client.post("/api/logout")
-        except Exception:
-            pass
-        self.client.close()
+    site: str
+    verbose: bool
+    username: str
+    password: str
+    csrf_token: str | None
+    controller_version: str | None
+    controller_type: str | None
 
     def _log(self, msg: str):
         if self.verbose:
@@ -138,149 +143,89 @@ class UniFiProber:
             h["X-Csrf-Token"] = self.csrf_token
         return h
 
-    def probe_status(self) -> ProbeResult:
-        """Probe /status (unauthenticated) to get controller version."""
-        try:
-            r = self.client.get("/status")
-            self._log(f"GET /status → {r.status_code}")
-            if r.status_code == 200:
-                data = r.json()
-                self.controller_version = data.get("meta", {}).get("server_version",
-                                                                     data.get("server_version"))
-                # Try to detect controller type
-                if "ubnt_device_type" in data.get("meta", {}):
-                    self.controller_type = "unifi_os"
-                else:
-                    self.controller_type = "standalone"
-                return ProbeResult("global", "status", "/status", "existing",
-                                   status_code=r.status_code, response_data=data)
+    def _status_result(self, r: httpx.Response) -> ProbeResult:
+        """Read controller version/type from a /status response."""
+        self._log(f"GET /status → {r.status_code}")
+        if r.status_code == 200:
+            data = r.json()
+            self.controller_version = data.get("meta", {}).get("server_version",
+                                                                 data.get("server_version"))
+            # Try to detect controller type
+            if "ubnt_device_type" in data.get("meta", {}):
+                self.controller_type = "unifi_os"
+            else:
+                self.controller_type = "standalone"
             return ProbeResult("global", "status", "/status", "existing",
-                               status_code=r.status_code)
-        except Exception as e:
-            return ProbeResult("global", "status", "/status", "existing", error=str(e))
-
-    def login(self) -> bool:
-        """Authenticate and establish session."""
-        try:
-            r = self.client.post("/api/login", json={
-                "username": self.username,
-                "password": self.password,
-            })
-            self._update_csrf(r)
-            self._log(f"POST /api/login → {r.status_code}")
-            if r.status_code == 200:
-                return True
-            print(f"ERROR: Login failed with status {r.status_code}", file=sys.stderr)
-            try:
-                body = r.json()
-                print(f"  Response: {body}", file=sys.stderr)
-            except Exception:
-                pass
-            return False
-        except Exception as e:
-            print(f"ERROR: Login failed: {e}", file=sys.stderr)
-            return False
+                               status_code=r.status_code, response_data=data)
+        return ProbeResult("global", "status", "/status", "existing",
+                           status_code=r.status_code)
 
-    def _relogin(self) -> bool:
-        """Re-authenticate on 401."""
-        self._log("Got 401, re-authenticating...")
-        return self.login()
+    def _login_body(self) -> dict:
+        return {"username": self.username, "password": self.password}
 
-    def _request(self, method: str, path: str, json_body: dict | None = None,
-                 retry_auth: bool = True) -> httpx.Response | None:
-        """Make a request with auth retry."""
+    def _login_result(self, r: httpx.Response) -> bool:
+        """Record the session from a login response; report failures."""
+        self._update_csrf(r)
+        self._log(f"POST /api/login → {r.status_code}")
+        if r.status_code == 200:
+            return True
+        print(f"ERROR: Login failed with status {r.status_code}", file=sys.stderr)
         try:
-            r = self.client.request(method, path, headers=self._headers(),
-                                     json=json_body)
-            self._update_csrf(r)
-            if r.status_code == 401 and retry_auth:
-                if self._relogin():
-                    return self._request(method, path, json_body, retry_auth=False)
-            return r
-        except httpx.TimeoutException:
-            self._log(f"TIMEOUT: {method} {path}")
-            return None
-        except Exception as e:
-            self._log(f"ERROR: {method} {path}: {e}")
-            return None
+            body = r.json()
+            print(f"  Response: {body}", file=sys.stderr)
+        except Exception:
+            pass
+        return False
 
     def _site_path(self, relative: str) -> str:
         """Build /api/s/{site}/{relative} path."""
         return f"/api/s/{self.site}/{relative}"
 
-    def probe_global(self, name: str, ep: dict) -> ProbeResult:
+    def steps(self, category: str, name: str, ep: dict) -> ProbeSteps:
+        """Probe steps for one spec entry of a category (see PROBE_CATEGORIES)."""
+        if category == "global":
+            return self._global_steps(name, ep)
+        if category == "stat":
+            return self._stat_steps(name, ep)
+        if category == "cmd":
+            return self._cmd_manager_steps(name, ep)
+        if category == "v2":
+            return self._v2_steps(name, ep)
+        if category in ("guest", "dl", "websocket"):
+            return self._plain_steps(category, name, ep)
+        # rest, list and the generic site-scoped upd/group/cnt/get/set
+        return self._site_get_steps(category, name, ep)
+
+    def _global_steps(self, name: str, ep: dict) -> ProbeSteps:
         """Probe a global endpoint."""
-        path = ep["path"]
         source = ep.get("source", "community")
         method = ep.get("method", "GET")
-
         # Replace {site} if present
-        path = path.replace("{site}", self.site)
+        path = ep["path"].replace("{site}", self.site)
 
-        r = self._request(method, path)
+        r = yield method, path, None
         if r is None:
             return ProbeResult("global", name, path, source, error="connection error")
         self._log(f"{method} {path} → {r.status_code}")
-        data = None
-        if r.status_code == 200:
-            try:
-                data = r.json()
-            except Exception:
-                pass
+        data = _json_or_none(r) if r.status_code == 200 else None
         return ProbeResult("global", name, path, source,
                            status_code=r.status_code, response_data=data)
 
-    def probe_rest(self, name: str, ep: dict) -> ProbeResult:
-        """Probe a REST endpoint (GET only — never mutate)."""
-        path = self._site_path(ep["path"])
-        source = ep.get("source", "community")
-
-        r = self._request("GET", path)
-        if r is None:
-            return ProbeResult("rest", name, path, source, error="connection error")
-        self._log(f"GET {path} → {r.status_code}")
-        data = None
-        count = None
-        if r.status_code == 200:
-            try:
-                body = r.json()
-                data = body
-                if isinstance(body, dict) and "data" in body:
-                    records = body["data"]
-                    if isinstance(records, list):
-                        count = len(records)
-            except Exception:
-                pass
-        return ProbeResult("rest", name, path, source,
-                           status_code=r.status_code, record_count=count,
-                           response_data=data)
-
-    def probe_list(self, name: str, ep: dict) -> ProbeResult:
-        """Probe a list/ endpoint (GET only)."""
+    def _site_get_steps(self, category: str, name: str, ep: dict) -> ProbeSteps:
+        """Probe a site-scoped endpoint (GET only — never mutate): rest, list, upd/, group/, cnt/, get/, set/."""
         path = self._site_path(ep["path"])
         source = ep.get("source", "community")
 
-        r = self._request("GET", path)
+        r = yield "GET", path, None
         if r is None:
-            return ProbeResult("list", name, path, source, error="connection error")
+            return ProbeResult(category, name, path, source, error="connection error")
         self._log(f"GET {path} → {r.status_code}")
-        data = None
-        count = None
-        if r.status_code == 200:
-            try:
-                body = r.json()
-                data = body
-                if isinstance(body, dict) and "data" in body:
-                    records = body["data"]
-                    if isinstance(records, list):
-                        count = len(records)
-            except Exception:
-                pass
-        return ProbeResult("list", name, path, source,
-                           status_code=r.status_code, record_count=count,
+        data = _json_or_none(r) if r.status_code == 200 else None
+        return ProbeResult(category, name, path, source,
+                           status_code=r.status_code, record_count=_record_count(data),
                            response_data=data)
 
-    def probe_stat(self, name: str, ep: dict) -> ProbeResult:
+    def _stat_steps(self, name: str, ep: dict) -> ProbeSteps:
         """Probe a stat endpoint."""
         relative = ep["path"]
         source = ep.get("source", "community")
@@ -294,27 +239,16 @@ class UniFiProber:
         path = self._site_path(relative)
         json_body = {} if method == "POST" else None
 
-        r = self._request(method, path, json_body=json_body)
+        r = yield method, path, json_body
         if r is None:
             return ProbeResult("stat", name, path, source, error="connection error")
         self._log(f"{method} {path} → {r.status_code}")
-        data = None
-        count = None
-        if r.status_code == 200:
-            try:
-                body = r.json()
-                data = body
-                if isinstance(body, dict) and "data" in body:
-                    records = body["data"]
-                    if isinstance(records, list):
-                        count = len(records)
-            except Exception:
-                pass
+        data = _json_or_none(r) if r.status_code == 200 else None
         return ProbeResult("stat", name, path, source,
-                           status_code=r.status_code, record_count=count,
+                           status_code=r.status_code, record_count=_record_count(data),
                            response_data=data, method_used=method)
 
-    def probe_cmd_manager(self, manager: str, ep: dict) -> list[ProbeResult]:
+    def _cmd_manager_steps(self, manager: str, ep: dict) -> ProbeSteps:
         """Probe a cmd manager: check path exists, execute only safe commands."""
         relative = ep["path"]
         source = ep.get("source", "community")
@@ -324,7 +258,7 @@ class UniFiProber:
         path = self._site_path(relative)
 
         # First: check if the manager path exists (POST with no body → 400 = exists)
-        r = self._request("POST", path, json_body={})
+        r = yield "POST", path, {}
         manager_exists = False
         if r is not None:
             self._log(f"POST {path} (empty) → {r.status_code}")
@@ -346,15 +280,10 @@ class UniFiProber:
         for cmd in commands:
             if cmd in SAFE_COMMANDS:
                 # Actually execute the safe command
-                r2 = self._request("POST", path, json_body={"cmd": cmd})
+                r2 = yield "POST", path, {"cmd": cmd}
                 if r2 is not None:
                     self._log(f"POST {path} cmd={cmd} → {r2.status_code}")
-                    data = None
-                    if r2.status_code == 200:
-                        try:
-                            data = r2.json()
-                        except Exception:
-                            pass
+                    data = _json_or_none(r2) if r2.status_code == 200 else None
                     results.append(ProbeResult(
                         "cmd", f"{manager}/{cmd}", path, source,
                         status_code=r2.status_code, response_data=data,
@@ -381,114 +310,367 @@ class UniFiProber:
 
         return results
 
-    def probe_v2(self, name: str, ep: dict) -> ProbeResult:
+    def _v2_steps(self, name: str, ep: dict) -> ProbeSteps:
         """Probe a v2 endpoint (GET only)."""
-        raw_path = ep["path"]
         source = ep.get("source", "community")
-
         # v2 paths use {site} directly
-        path = "/" + raw_path.replace("{site}", self.site)
+        path = "/" + ep["path"].replace("{site}", self.site)
 
-        r = self._request("GET", path)
+        r = yield "GET", path, None
         if r is None:
             return ProbeResult("v2", name, path, source, error="connection error")
         self._log(f"GET {path} → {r.status_code}")
-        data = None
-        count = None
-        if r.status_code == 200:
-            try:
-                body = r.json()
-                data = body
-                # v2 may return a bare list
-                if isinstance(body, list):
-                    count = len(body)
-                elif isinstance(body, dict) and "data" in body:
-                    records = body["data"]
-                    if isinstance(records, list):
-                        count = len(records)
-            except Exception:
-                pass
+        data = _json_or_none(r) if r.status_code == 200 else None
+        # v2 may return a bare list
+        count = len(data) if isinstance(data, list) else _record_count(data)
         return ProbeResult("v2", name, path, source,
                            status_code=r.status_code, record_count=count,
                            response_data=data)
 
-    def probe_guest(self, name: str, ep: dict) -> ProbeResult:
-        """Probe a guest endpoint."""
-        path = ep["path"].replace("{site}", self.site)
+    def _plain_steps(self, category: str, name: str, ep: dict) -> ProbeSteps:
+        """Probe a guest, download or WebSocket endpoint by its own path.
+
+        WebSocket endpoints only record the status: 101 = upgrade, 400 =
+        endpoint exists but needs WS upgrade, 404 = not found.
+        """
+        path = ep["path"]
+        if category != "dl":  # dl paths are global
+            path = path.replace("{site}", self.site)
         source = ep.get("source", "community")
-        method = ep.get("method", "GET")
+        method = ep.get("method", "GET") if category == "guest" else "GET"
 
-        r = self._request(method, path)
+        r = yield method, path, None
         if r is None:
-            return ProbeResult("guest", name, path, source, error="connection error")
+            return ProbeResult(category, name, path, source, error="connection error")
         self._log(f"{method} {path} → {r.status_code}")
         data = None
-        if r.status_code == 200:
-            try:
-                data = r.json()
-            except Exception:
-                pass
-        return ProbeResult("guest", name, path, source,
+        if r.status_code == 200 and category != "websocket":
+            data = _json_or_none(r)
+        return ProbeResult(category, name, path, source,
                            status_code=r.status_code, response_data=data)
 
-    def probe_site_endpoint(self, category: str, name: str, ep: dict) -> ProbeResult:
-        """Probe a generic site-scoped endpoint (GET only). Works for upd/, group/, cnt/, get/, set/."""
-        path = self._site_path(ep["path"])
-        source = ep.get("source", "community")
 
-        r = self._request("GET", path)
-        if r is None:
-            return ProbeResult(category, name, path, source, error="connection error")
-        self._log(f"GET {path} → {r.status_code}")
-        data = None
-        count = None
-        if r.status_code == 200:
-            try:
-                body = r.json()
-                data = body
-                if isinstance(body, dict) and "data" in body:
-                    records = body["data"]
-                    if isinstance(records, list):
-                        count = len(records)
-            except Exception:
-                pass
-        return ProbeResult(category, name, path, source,
-                           status_code=r.status_code, record_count=count,
-                           response_data=data)
+# ── HTTP clients ────────────────────────────────────────────────────────────
+def _cassette_transport(verify_ssl: bool):
+    """Record/replay transport when UNIFI_CASSETTE is set (see generated/unifi_cassette.py)."""
+    if not os.environ.get("UNIFI_CASSETTE"):
+        return None
+    from generated.unifi_cassette import transport_from_env
+    return transport_from_env(verify=verify_ssl)
 
-    def probe_dl(self, name: str, ep: dict) -> ProbeResult:
-        """Probe a download endpoint (global path, GET only)."""
-        path = ep["path"]
-        source = ep.get("source", "community")
 
-        r = self._request("GET", path)
-        if r is None:
-            return ProbeResult("dl", name, path, source, error="connection error")
-        self._log(f"GET {path} → {r.status_code}")
-        data = None
-        if r.status_code == 200:
-            try:
-                data = r.json()
-            except Exception:
-                pass
-        return ProbeResult("dl", name, path, source,
-                           status_code=r.status_code, response_data=data)
+class UniFiProber(_ProbeLogic):
+    """Manages auth and requests to a live UniFi controller, one at a time."""
 
-    def probe_websocket(self, name: str, ep: dict) -> ProbeResult:
-        """Check if a WebSocket endpoint exists (HTTP GET, expect 101 or 400)."""
-        path = ep["path"].replace("{site}", self.site)
-        source = ep.get("source", "community")
+    def __init__(self, host: str, port: int, username: str, password: str,
+                 site: str, verify_ssl: bool, verbose: bool):
+        self.base_url = f"https://{host}:{port}"
+        self.username = username
+        self.password = password
+        self.site = site
+        self.verbose = verbose
+        self.csrf_token: str | None = None
+        self.client = httpx.Client(
+            base_url=self.base_url,
+            verify=verify_ssl,
+            timeout=30.0,
+            follow_redirects=True,
+            transport=_cassette_transport(verify_ssl),
+        )
+        self.controller_version: str | None = None
+        self.controller_type: str | None = None
 
-        r = self._request("GET", path)
-        if r is None:
-            return ProbeResult("websocket", name, path, source, error="connection error")
-        self._log(f"GET {path} → {r.status_code}")
-        # 101 = upgrade, 400 = endpoint exists but needs WS upgrade, 404 = not found
-        return ProbeResult("websocket", name, path, source,
-                           status_code=r.status_code)
+    def close(self):
+        try:
+            self.client.post("/api/logout")
+        except Exception:
+            pass
+        self.client.close()
+
+    def probe_status(self) -> ProbeResult:
+        """Probe /status (unauthenticated) to get controller version."""
+        try:
+            return self._status_result(self.client.get("/status"))
+        except Exception as e:
+            return ProbeResult("global", "status", "/status", "existing", error=str(e))
+
+    def login(self) -> bool:
+        """Authenticate and establish session."""
+        try:
+            return self._login_result(self.client.post("/api/login", json=self._login_body()))
+        except Exception as e:
+            print(f"ERROR: Login failed: {e}", file=sys.stderr)
+            return False
+
+    def _relogin(self) -> bool:
+        """Re-authenticate on 401."""
+        self._log("Got 401, re-authenticating...")
+        return self.login()
+
+    def _request(self, method: str, path: str, json_body: dict | None = None,
+                 retry_auth: bool = True) -> httpx.Response | None:
+        """Make a request with auth retry."""
+        try:
+            r = self.client.request(method, path, headers=self._headers(),
+                                     json=json_body)
+            self._update_csrf(r)
+            if r.status_code == 401 and retry_auth:
+                if self._relogin():
+                    return self._request(method, path, json_body, retry_auth=False)
+            return r
+        except httpx.TimeoutException:
+            self._log(f"TIMEOUT: {method} {path}")
+            return None
+        except Exception as e:
+            self._log(f"ERROR: {method} {path}: {e}")
+            return None
+
+    def probe(self, category: str, name: str, ep: dict) -> list[ProbeResult]:
+        """Run one endpoint's probe steps."""
+        steps = self.steps(category, name, ep)
+        try:
+            step = next(steps)
+            while True:
+                step = steps.send(self._request(*step))
+        except StopIteration as done:
+            return done.value if isinstance(done.value, list) else [done.value]
+
+    def probe_all(self, plan: list[tuple[str, str, dict]],
+                  done: ProbeDone | None = None) -> list[list[ProbeResult]]:
+        """Probe every (category, name, ep) of plan in order.
+
+        done(entry, results) is called as each endpoint finishes.
+        """
+        probed = []
+        for entry in plan:
+            results = self.probe(*entry)
+            if done:
+                done(entry, results)
+            probed.append(results)
+        return probed
+
+
+class AsyncUniFiProber(_ProbeLogic):
+    """Probes many endpoints at once over one session.
+
+    At most `concurrency` requests are in flight. Endpoints of a serial
+    category are probed one after another (in spec order), alongside the
+    other categories. When several in-flight requests hit 401 after the
+    session expired, only the first re-authenticates; the rest retry on
+    the new session.
+    """
+
+    def __init__(self, host: str, port: int, username: str, password: str,
+                 site: str, verify_ssl: bool, verbose: bool,
+                 concurrency: int = 8, serial_categories=DEFAULT_SERIAL_CATEGORIES):
+        self.base_url = f"https://{host}:{port}"
+        self.username = username
+        self.password = password
+        self.site = site
+        self.verbose = verbose
+        self.csrf_token: str | None = None
+        self.concurrency = concurrency
+        self.serial_categories = frozenset(serial_categories)
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            verify=verify_ssl,
+            timeout=30.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=concurrency),
+            transport=_cassette_transport(verify_ssl),
+        )
+        self.controller_version: str | None = None
+        self.controller_type: str | None = None
+        self._session = 0  # bumped on every successful login
+        self._login_lock = asyncio.Lock()
+
+    async def close(self):
+        try:
+            await self.client.post("/api/logout")
+        except Exception:
+            pass
+        await self.client.aclose()
+
+    async def probe_status(self) -> ProbeResult:
+        """Probe /status (unauthenticated) to get controller version."""
+        try:
+            return self._status_result(await self.client.get("/status"))
+        except Exception as e:
+            return ProbeResult("global", "status", "/status", "existing", error=str(e))
+
+    async def login(self) -> bool:
+        """Authenticate and establish session."""
+        try:
+            ok = self._login_result(await self.client.post("/api/login", json=self._login_body()))
+        except Exception as e:
+            print(f"ERROR: Login failed: {e}", file=sys.stderr)
+            return False
+        if ok:
+            self._session += 1
+        return ok
+
+    async def _relogin(self, session: int) -> bool:
+        """Re-authenticate on 401, once per expired session."""
+        async with self._login_lock:
+            if self._session != session:
+                return True  # another request already logged in again
+            self._log("Got 401, re-authenticating...")
+            return await self.login()
+
+    async def _request(self, method: str, path: str, json_body: dict | None = None,
+                       retry_auth: bool = True) -> httpx.Response | None:
+        """Make a request with auth retry."""
+        session = self._session
+        try:
+            r = await self.client.request(method, path, headers=self._headers(),
+                                          json=json_body)
+            self._update_csrf(r)
+            if r.status_code == 401 and retry_auth:
+                if await self._relogin(session):
+                    return await self._request(method, path, json_body, retry_auth=False)
+            return r
+        except httpx.TimeoutException:
+            self._log(f"TIMEOUT: {method} {path}")
+            return None
+        except Exception as e:
+            self._log(f"ERROR: {method} {path}: {e}")
+            return None
+
+    async def probe(self, category: str, name: str, ep: dict,
+                    limit: asyncio.Semaphore) -> list[ProbeResult]:
+        """Run one endpoint's probe steps; each request waits for a slot in limit."""
+        steps = self.steps(category, name, ep)
+        try:
+            step = next(steps)
+            while True:
+                async with limit:
+                    response = await self._request(*step)
+                step = steps.send(response)
+        except StopIteration as done:
+            return done.value if isinstance(done.value, list) else [done.value]
+
+    async def probe_all(self, plan: list[tuple[str, str, dict]],
+                        done: ProbeDone | None = None) -> list[list[ProbeResult]]:
+        """Probe every (category, name, ep) of plan; results come back in plan order.
+
+        done(entry, results) is called as each endpoint finishes, in
+        completion order.
+        """
+        limit = asyncio.Semaphore(self.concurrency)
+
+        async def one(entry):
+            results = await self.probe(*entry, limit)
+            if done:
+                done(entry, results)
+            return results
+
+        async def serial(entries):
+            return [await one(entry) for entry in entries]
+
+        tasks = []
+        for category in dict.fromkeys(c for c, _, _ in plan):
+            entries = [entry for entry in plan if entry[0] == category]
+            if category in self.serial_categories:
+                tasks.append(serial(entries))
+            else:
+                tasks.append(asyncio.gather(*(one(entry) for entry in entries)))
+        by_category = await asyncio.gather(*tasks)
+        return [results for category_results in by_category for results in category_results]
+
+
+# ── Probe cache ─────────────────────────────────────────────────────────────
+def _digest(*parts) -> str:
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class _ProbeCache:
+    """Results of earlier runs, keyed by what was probed and against what.
+
+    A key covers the endpoint's spec entry (path, method, body, commands),
+    the site, the controller (address and version) and this script's code,
+    so any change to one of those re-probes the endpoint.
+
+    The file is an append-only JSONL journal: a {"run": n} line when a run
+    starts, one {"key", "run", "results"} line as each endpoint finishes,
+    and {"run": n, "complete": true} when the run ends. A crash therefore
+    loses only the endpoints in flight, and a torn last line is ignored.
+    A finished run compacts the journal to its own entries (atomically).
+    Response data is stored scrubbed, exactly as samples are written.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        self.last_run = 0
+        self.last_complete = True
+        if path.exists():
+            for line in path.read_text().splitlines():
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # torn write from a crashed run
+                if "key" in record:
+                    self.entries[record["key"]] = record
+                elif "run" in record:
+                    self.last_run = record["run"]
+                    self.last_complete = record.get("complete", False)
+        self.run = self.last_run + 1
+        self.code = _digest(Path(__file__).read_text())
+        self.used: dict[str, dict] = {}
+        self._journal = None
+
+    def key(self, prober: _ProbeLogic, category: str, name: str, ep: dict) -> str:
+        return _digest(self.code, prober.base_url, prober.site,
+                       prober.controller_version, category, name, ep)
+
+    def lookup(self, key: str, resume: bool, only_changed: bool) -> list[ProbeResult] | None:
+        """Cached results for key, if this run may reuse them.
+
+        resume reuses what the interrupted last run already probed;
+        only_changed reuses any result whose key still matches.
+        """
+        record = self.entries.get(key)
+        if record is None:
+            return None
+        if not (only_changed or (resume and record["run"] == self.last_run)):
+            return None
+        self.used[key] = dict(record, run=self.run)
+        return [ProbeResult(**r) for r in record["results"]]
+
+    def start(self):
+        """Open the journal and mark the start of this run."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._journal = self.path.open("a")
+        self._append({"run": self.run})
+        for record in self.used.values():
+            self._append(record)
+
+    def record(self, key: str, results: list[ProbeResult]):
+        """Journal an endpoint's results. Connection errors are not cached."""
+        if any(r.error == "connection error" for r in results):
+            return
+        stored = [dict(asdict(r), response_data=scrub_value(r.response_data))
+                  for r in results]
+        record = {"key": key, "run": self.run, "results": stored}
+        self.used[key] = record
+        self._append(record)
+
+    def _append(self, record: dict):
+        self._journal.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._journal.flush()
+
+    def finish(self):
+        """Compact the journal to this run's entries and mark it complete."""
+        self._journal.close()
+        lines = [json.dumps(record, ensure_ascii=False) for record in self.used.values()]
+        lines.append(json.dumps({"run": self.run, "complete": True}))
+        _write_atomic(self.path, "\n".join(lines) + "\n")
+
+    def close(self):
+        if self._journal and not self._journal.closed:
+            self._journal.close()
 
 
-# ── Inventory output ────────────────────────────────────────────────────────
 def _build_inventory(results: list[ProbeResult], spec: dict,
                      controller_version: str | None,
                      controller_type: str | None) -> dict:
@@ -707,10 +889,19 @@ def _write_sample(samples_dir: Path, prefix: str, name: str, data) -> bool:
         return False
     scrubbed = scrub_value(data)
     sample_path = samples_dir / f"{prefix}_{name}.json"
-    sample_path.write_text(json.dumps(scrubbed, indent=None, ensure_ascii=False))
+    content = json.dumps(scrubbed, indent=None, ensure_ascii=False)
+    if not sample_path.exists() or sample_path.read_text() != content:
+        _write_atomic(sample_path, content)
     return True
 
 
+def _write_atomic(path: Path, content: str):
+    """Write content via a temporary file, so readers never see a partial file."""
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(content)
+    os.replace(tmp, path)
+
+
 # ── Diff report ─────────────────────────────────────────────────────────────
 def _print_report(results: list[ProbeResult],
                   controller_version: str | None):
@@ -832,6 +1023,40 @@ def _dry_run(spec: dict):
     print(f"\nTotal endpoints to probe: {total}")
 
 
+def _probe_plan(spec: dict) -> list[tuple[str, str, dict]]:
+    """(category, name, ep) for every spec endpoint, in probe order.
+
+    Prints the per-category "Probing ..." lines as it goes.
+    """
+    plan = []
+    for key, category in PROBE_CATEGORIES:
+        eps = spec.get(key, {})
+        if category == "global":
+            print("Probing global endpoints...", file=sys.stderr)
+            eps = {name: ep for name, ep in eps.items() if name != "status"}
+        elif category == "cmd":
+            print(f"Probing {len(eps)} cmd managers...", file=sys.stderr)
+        elif eps:
+            label = "REST" if category == "rest" else category
+            print(f"Probing {len(eps)} {label} endpoints...", file=sys.stderr)
+        plan.extend((category, name, ep) for name, ep in eps.items())
+    return plan
+
+
+def _category_set(value: str) -> frozenset[str]:
+    """Parse --serial-categories."""
+    categories = frozenset(c.strip() for c in value.split(",") if c.strip())
+    unknown = categories - {category for _, category in PROBE_CATEGORIES}
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown categories: {', '.join(sorted(unknown))}")
+    return categories
+
+
+def _returned(value):
+    """Stand-in for loop.run_until_complete when probing synchronously."""
+    return value
+
+
 # ── Main ────────────────────────────────────────────────────────────────────
 def main():
     parser = argparse.ArgumentParser(
@@ -860,6 +1085,21 @@ def main():
                         help="Print detailed request/response info")
     parser.add_argument("--no-verify-ssl", action="store_true",
                         help="Disable SSL certificate verification")
+    parser.add_argument("--concurrency", "-j", type=int, default=8,
+                        help="Requests in flight at once (default: 8; 1 = one at a time)")
+    parser.add_argument("--serial-categories", type=_category_set,
+                        default=DEFAULT_SERIAL_CATEGORIES,
+                        help="Comma-separated categories probed one endpoint at a time "
+                             "even when concurrent (default: cmd)")
+    parser.add_argument("--cache", type=Path, default=DEFAULT_CACHE,
+                        help=f"Probe result cache (default: spec/{DEFAULT_CACHE.name})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Neither read nor update the probe cache")
+    parser.add_argument("--only-changed", action="store_true",
+                        help="Reuse cached results; probe only endpoints that are new or "
+                             "changed in the spec (or whose controller version changed)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted run, reusing what it already probed")
     args = parser.parse_args()
 
     # Load spec
@@ -891,7 +1131,7 @@ def main():
     if os.environ.get("UNIFI_VERIFY_SSL", "").lower() in ("false", "0", "no"):
         verify_ssl = False
 
-    prober = UniFiProber(
+    connection = dict(
         host=args.host,
         port=args.port,
         username=args.username,
@@ -900,6 +1140,21 @@ def main():
         verify_ssl=verify_ssl,
         verbose=args.verbose,
     )
+    loop = None
+    if args.concurrency > 1:
+        prober = AsyncUniFiProber(**connection, concurrency=args.concurrency,
+                                  serial_categories=args.serial_categories)
+        # One loop for the whole session: the client's connections belong to it
+        loop = asyncio.new_event_loop()
+        run = loop.run_until_complete
+    else:
+        prober = UniFiProber(**connection)
+        run = _returned
+
+    cache = None if args.no_cache else _ProbeCache(args.cache)
+    if args.resume and cache is not None and cache.last_run and cache.last_complete:
+        print("Last probe run completed; --resume reuses all of its results.",
+              file=sys.stderr)
 
     results: list[ProbeResult] = []
     samples_written = 0
@@ -907,7 +1162,7 @@ def main():
     try:
         # 1. Probe /status (unauthenticated)
         print("Probing /status...", file=sys.stderr)
-        status_result = prober.probe_status()
+        status_result = run(prober.probe_status())
         results.append(status_result)
         if status_result.response_data:
             if _write_sample(args.samples_dir, "global", "status",
@@ -921,132 +1176,57 @@ def main():
 
         # 2. Login
         print("Authenticating...", file=sys.stderr)
-        if not prober.login():
+        if not run(prober.login()):
             print("FATAL: Cannot authenticate. Aborting.", file=sys.stderr)
             sys.exit(1)
         print("Authenticated.", file=sys.stderr)
 
-        # 3. Probe all categories
-        # ── Global (skip status, already probed)
-        print("Probing global endpoints...", file=sys.stderr)
-        for name, ep in spec.get("global_endpoints", {}).items():
-            if name == "status":
-                continue  # already probed
-            r = prober.probe_global(name, ep)
-            results.append(r)
-            if r.response_data:
-                if _write_sample(args.samples_dir, "global", name, r.response_data):
-                    samples_written += 1
-
-        # ── REST
-        rest_eps = spec.get("rest_endpoints", {})
-        print(f"Probing {len(rest_eps)} REST endpoints...", file=sys.stderr)
-        for name, ep in rest_eps.items():
-            r = prober.probe_rest(name, ep)
-            results.append(r)
-            if r.response_data:
-                if _write_sample(args.samples_dir, "rest", name, r.response_data):
-                    samples_written += 1
-
-        # ── List
-        list_eps = spec.get("list_endpoints", {})
-        print(f"Probing {len(list_eps)} list endpoints...", file=sys.stderr)
-        for name, ep in list_eps.items():
-            r = prober.probe_list(name, ep)
-            results.append(r)
-            if r.response_data:
-                if _write_sample(args.samples_dir, "list", name, r.response_data):
-                    samples_written += 1
-
-        # ── Stat
-        stat_eps = spec.get("stat_endpoints", {})
-        print(f"Probing {len(stat_eps)} stat endpoints...", file=sys.stderr)
-        for name, ep in stat_eps.items():
-            r = prober.probe_stat(name, ep)
-            results.append(r)
-            if r.response_data:
-                if _write_sample(args.samples_dir, "stat", name, r.response_data):
-                    samples_written += 1
-
-        # ── Cmd
-        cmd_eps = spec.get("cmd_endpoints", {})
-        print(f"Probing {len(cmd_eps)} cmd managers...", file=sys.stderr)
-        for manager, ep in cmd_eps.items():
-            cmd_results = prober.probe_cmd_manager(manager, ep)
-            results.extend(cmd_results)
-            for cr in cmd_results:
-                if cr.response_data:
-                    # Use manager_command as filename
-                    safe_name = cr.name.replace("/", "_")
-                    if _write_sample(args.samples_dir, "cmd", safe_name,
-                                      cr.response_data):
-                        samples_written += 1
-
-        # ── V2
-        v2_eps = spec.get("v2_endpoints", {})
-        print(f"Probing {len(v2_eps)} v2 endpoints...", file=sys.stderr)
-        for name, ep in v2_eps.items():
-            r = prober.probe_v2(name, ep)
-            results.append(r)
-            if r.response_data:
-                if _write_sample(args.samples_dir, "v2", name, r.response_data):
-                    samples_written += 1
-
-        # ── Guest
-        guest_eps = spec.get("guest_endpoints", {})
-        print(f"Probing {len(guest_eps)} guest endpoints...", file=sys.stderr)
-        for name, ep in guest_eps.items():
-            r = prober.probe_guest(name, ep)
-            results.append(r)
-            if r.response_data:
-                if _write_sample(args.samples_dir, "guest", name, r.response_data):
-                    samples_written += 1
-
-        # ── Generic site-scoped categories (upd, group, cnt, get, set)
-        for cat_key in ("upd_endpoints", "group_endpoints", "cnt_endpoints",
-                         "get_endpoints", "set_endpoints"):
-            cat_prefix = cat_key.replace("_endpoints", "")
-            cat_eps = spec.get(cat_key, {})
-            if cat_eps:
-                print(f"Probing {len(cat_eps)} {cat_prefix} endpoints...",
-                      file=sys.stderr)
-                for name, ep in cat_eps.items():
-                    r = prober.probe_site_endpoint(cat_prefix, name, ep)
-                    results.append(r)
-                    if r.response_data:
-                        if _write_sample(args.samples_dir, cat_prefix, name,
-                                          r.response_data):
-                            samples_written += 1
-
-        # ── Download
-        dl_eps = spec.get("dl_endpoints", {})
-        if dl_eps:
-            print(f"Probing {len(dl_eps)} dl endpoints...", file=sys.stderr)
-            for name, ep in dl_eps.items():
-                r = prober.probe_dl(name, ep)
-                results.append(r)
+        # 3. Probe all categories (global skips status, already probed),
+        # reusing cached results where allowed. Results are taken in spec
+        # order whatever the concurrency.
+        plan = _probe_plan(spec)
+        cached: dict[tuple[str, str], list[ProbeResult]] = {}
+        done = None
+        if cache is not None:
+            keys = {(category, name): cache.key(prober, category, name, ep)
+                    for category, name, ep in plan}
+            for endpoint, key in keys.items():
+                hit = cache.lookup(key, args.resume, args.only_changed)
+                if hit is not None:
+                    cached[endpoint] = hit
+            if cached:
+                print(f"Reusing {len(cached)} cached endpoint results.", file=sys.stderr)
+            cache.start()
+            done = lambda entry, endpoint_results: cache.record(keys[entry[:2]], endpoint_results)
+        fresh = iter(run(prober.probe_all(
+            [entry for entry in plan if entry[:2] not in cached], done)))
+        if cache is not None:
+            cache.finish()
+        for category, name, _ in plan:
+            endpoint_results = cached[(category, name)] if (category, name) in cached else next(fresh)
+            results.extend(endpoint_results)
+            for r in endpoint_results:
                 if r.response_data:
-                    if _write_sample(args.samples_dir, "dl", name,
+                    # cmd results are named manager/command
+                    safe_name = r.name.replace("/", "_")
+                    if _write_sample(args.samples_dir, r.category, safe_name,
                                       r.response_data):
                         samples_written += 1
 
-        # ── WebSocket
-        ws_eps = spec.get("websocket_endpoints", {})
-        print(f"Probing {len(ws_eps)} websocket endpoints...", file=sys.stderr)
-        for name, ep in ws_eps.items():
-            r = prober.probe_websocket(name, ep)
-            results.append(r)
-
         # 4. Logout
         print("Logging out...", file=sys.stderr)
 
     finally:
-        prober.close()
+        run(prober.close())
+        if loop is not None:
+            loop.close()
+        if cache is not None:
+            cache.close()
 
     # 5. Build and write inventory
     inv = _build_inventory(results, spec, prober.controller_version,
                            prober.controller_type)
-    args.output.write_text(json.dumps(inv, indent=2, ensure_ascii=False) + "\n")
+    _write_atomic(args.output, json.dumps(inv, indent=2, ensure_ascii=False) + "\n")
     print(f"Wrote {args.output}", file=sys.stderr)
     print(f"Wrote {samples_written} sample files to {args.samples_dir}/",
           file=sys.stderr)
@@ -1068,7 +1248,7 @@ def _rescrub_existing_samples(samples_dir: Path):
             data = json.loads(f.read_text())
             scrubbed = scrub_value(data)
             if scrubbed != data:
-                f.write_text(json.dumps(scrubbed, indent=None, ensure_ascii=False))
+                _write_atomic(f, json.dumps(scrubbed, indent=None, ensure_ascii=False))
                 count += 1
         except Exception:
             pass
@@ -22,7 +22,7 @@ uv run python generate.py
 
 echo ""
 echo "=== Step 2: Verify generated code parses ==="
-uv run python -c "import ast; ast.parse(open('generated/server.py').read()); print('server.py: OK')"
+uv run python -c "import ast, glob; [ast.parse(open(p).read()) for p in ['generated/server.py', *glob.glob('generated/unifi_tools/*.py')]]; print('server.py + unifi_tools: OK')"
 
 echo ""
 echo "=== Step 3: Start UniFi controller ==="
@@ -42,7 +42,10 @@ from generator.naming import (
 
 _COUNTS = count_from_spec()
 _MODULES = count_module_breakdown(_COUNTS)
-_ALWAYS_ON = _COUNTS["tools"]["global"] + _COUNTS["tools"]["report_issue"] + _COUNTS["tools"]["overview"] + _COUNTS["tools"]["search_tools"]
+_ALWAYS_ON = (
+    _COUNTS["tools"]["global"] + _COUNTS["tools"]["report_issue"] + _COUNTS["tools"]["overview"]
+    + _COUNTS["tools"]["search_tools"] + _COUNTS["tools"]["enable_module"]
+)
 _TOTAL = _COUNTS["tools"]["total"]
 _V1_TOTAL = sum(_MODULES[m]["v1"] for m in MODULE_ORDER) + _ALWAYS_ON
 _V2_TOTAL = sum(_MODULES[m]["v2"] for m in MODULE_ORDER) + _ALWAYS_ON
@@ -64,7 +67,8 @@ _RO_ALWAYS_ON = (
     len([n for n in _raw_for_ro["global_endpoints"] if n not in MUTATING_GLOBALS])
     + 1  # report_issue
     + 1  # overview
-    + 1  # search_tools
+    + 3  # search_tools + search_fields + describe_fields
+    + 1  # enable_module
 )
 
 # Per-module read-only expected count when loaded alone
@@ -120,8 +124,9 @@ def _derive_mutating_tools() -> set[str]:
     for name in MUTATING_GLOBALS:
         mutating.add(f"unifi_{name}")
 
-    # Port override
+    # Port override helpers
     mutating.add("unifi_set_port_override")
+    mutating.add("unifi_set_port_overrides")
 
     return mutating
 
@@ -132,7 +137,7 @@ _MUTATING_TOOLS = _derive_mutating_tools()
 def _derive_always_on_tools() -> set[str]:
     """Derive always-on tool names from the inventory."""
     raw = json.loads(Path("spec/endpoint-inventory.json").read_text())
-    return {f"unifi_{name}" for name in raw["global_endpoints"]} | {"unifi_report_issue", "unifi_get_overview", "unifi_search_tools"}
+    return {f"unifi_{name}" for name in raw["global_endpoints"]} | {"unifi_report_issue", "unifi_get_overview", "unifi_search_tools", "unifi_search_fields", "unifi_describe_fields", "unifi_enable_module"}
 
 
 def _derive_module_tools() -> dict[str, set[str]]:
@@ -193,8 +198,14 @@ def _derive_module_tools() -> dict[str, set[str]]:
         if "DELETE" in methods:
             tools[mod].add(f"unifi_delete_{singular}")
 
-    # Port override helper → device
+    # Port override helpers → device
     tools["device"].add("unifi_set_port_override")
+    tools["device"].add("unifi_set_port_overrides")
+
+    # Local history helpers → monitor
+    tools["monitor"].add("unifi_query_timeseries")
+    tools["monitor"].add("unifi_get_report")
+    tools["monitor"].add("unifi_search_events")
 
     return tools
 
@@ -234,20 +245,27 @@ if len(sys.argv) > 2 and sys.argv[2] == "readonly":
     os.environ["UNIFI_READ_ONLY"] = "true"
 sys.path.insert(0, "generated")
 import server as srv
+for mod in sys.argv[3:]:
+    srv._enable_module(mod)
 tools = srv.mcp._tool_manager._tools
 names = sorted(tools.keys())
-print(json.dumps({"count": len(names), "names": names}))
+imported = sorted(m.split(".", 1)[1] for m in sys.modules if m.startswith("unifi_tools."))
+print(json.dumps({"count": len(names), "names": names, "imported": imported}))
 """
 
 
-def _run(modules_str: str, *, read_only: bool = False) -> dict:
-    """Run helper with given UNIFI_MODULES, return {"count": N, "names": [...]}."""
+def _run(modules_str: str, *, read_only: bool = False, lazy: bool = False, enable: tuple[str, ...] = ()) -> dict:
+    """Run helper with given UNIFI_MODULES, return {"count": N, "names": [...], "imported": [...]}.
+
+    lazy sets UNIFI_TOOL_LOADING=lazy; enable lists modules to load afterwards.
+    """
     env = os.environ.copy()
     env.pop("UNIFI_MODULES", None)
     env.pop("UNIFI_READ_ONLY", None)
-    args = [sys.executable, "-c", _HELPER, modules_str]
-    if read_only:
-        args.append("readonly")
+    env.pop("UNIFI_TOOL_LOADING", None)
+    if lazy:
+        env["UNIFI_TOOL_LOADING"] = "lazy"
+    args = [sys.executable, "-c", _HELPER, modules_str, "readonly" if read_only else "", *enable]
     result = subprocess.run(
         args,
         capture_output=True, text=True, env=env,
@@ -359,8 +377,11 @@ class TestModuleToolPresence:
 
     def test_port_override_in_device_only(self):
         """Port override is in device module, not always-on."""
-        assert "unifi_set_port_override" in _run("device")["names"]
-        assert "unifi_set_port_override" not in _run("")["names"]
+        device_names = _run("device")["names"]
+        empty_names = _run("")["names"]
+        for name in ("unifi_set_port_override", "unifi_set_port_overrides"):
+            assert name in device_names
+            assert name not in empty_names
 
 
 class TestReadOnly:
@@ -428,3 +449,98 @@ class TestReadOnly:
     def test_readonly_off_by_default(self):
         """Default (no env var) should include all tools."""
         assert _run("v1,v2")["count"] == _TOTAL
+
+
+# Tools registered at startup with UNIFI_TOOL_LOADING=lazy
+_LAZY_META_TOOLS = {
+    "unifi_search_tools", "unifi_search_fields", "unifi_describe_fields",
+    "unifi_enable_module", "unifi_get_overview", "unifi_report_issue",
+}
+
+_LIST_CHANGED_HELPER = """\
+import asyncio, json, os, sys
+os.environ["UNIFI_TOOL_LOADING"] = "lazy"
+sys.path.insert(0, "generated")
+import server as srv
+from fastmcp import Client
+from fastmcp.client.messages import MessageHandler
+
+
+class Handler(MessageHandler):
+    changed = 0
+
+    async def on_tool_list_changed(self, notification):
+        Handler.changed += 1
+
+
+async def main():
+    async with Client(srv.mcp, message_handler=Handler()) as client:
+        before = len(await client.list_tools())
+        result = await client.call_tool("unifi_enable_module", {"module": sys.argv[1]})
+        after = len(await client.list_tools())
+    added = result.structured_content["data"]["added"]
+    print(json.dumps({"before": before, "after": after, "added": added, "changed": Handler.changed}))
+
+
+asyncio.run(main())
+"""
+
+
+class TestLazyLoading:
+    """Verify UNIFI_TOOL_LOADING=lazy registers modules on demand."""
+
+    def test_lazy_exposes_meta_tools_only(self):
+        """Lazy mode starts with the meta tools only."""
+        assert set(_run("v1,v2", lazy=True)["names"]) == _LAZY_META_TOOLS
+
+    @pytest.mark.parametrize("mod", ["device", "firewall"])
+    def test_enable_module_registers_module(self, mod):
+        """Enabling a module registers exactly that module's tools."""
+        names = set(_run("v1,v2", lazy=True, enable=(mod,))["names"])
+        assert names == _LAZY_META_TOOLS | _MODULE_TOOLS[mod]
+
+    def test_enable_all_matches_eager(self):
+        """Enabling every module (and global) equals eager loading."""
+        lazy = _run("v1,v2", lazy=True, enable=(*MODULE_ORDER, "global"))
+        assert lazy["names"] == _run("v1,v2")["names"]
+
+    def test_enable_module_respects_modules_and_read_only(self):
+        """UNIFI_MODULES and UNIFI_READ_ONLY still gate lazily loaded tools."""
+        assert set(_run("client", lazy=True, enable=("device",))["names"]) == _LAZY_META_TOOLS
+        names = set(_run("v1,v2", read_only=True, lazy=True, enable=("device",))["names"])
+        assert names and not (_MUTATING_TOOLS & names)
+
+    def test_enable_module_sends_list_changed(self):
+        """Enabling a module from a tool call notifies the client."""
+        env = os.environ.copy()
+        env.pop("UNIFI_MODULES", None)
+        env.pop("UNIFI_READ_ONLY", None)
+        result = subprocess.run(
+            [sys.executable, "-c", _LIST_CHANGED_HELPER, "device"],
+            capture_output=True, text=True, env=env,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        assert result.returncode == 0, result.stderr
+        info = json.loads(result.stdout)
+        assert info["before"] == len(_LAZY_META_TOOLS)
+        assert info["after"] == len(_LAZY_META_TOOLS) + len(_MODULE_TOOLS["device"])
+        assert info["added"] == info["after"] - info["before"]
+        assert info["changed"] >= 1
+
+
+class TestModuleImports:
+    """Verify tool modules in generated/unifi_tools/ are imported only when enabled."""
+
+    def test_single_module_imports_only_itself(self):
+        """UNIFI_MODULES=device imports unifi_tools.device and nothing else."""
+        assert _run("device")["imported"] == ["device"]
+
+    def test_v2_imports_only_v2_modules(self):
+        """UNIFI_MODULES=v2 skips modules that have no v2 tools."""
+        imported = _run("v2")["imported"]
+        assert imported == sorted(set(V2_MODULES.values()))
+
+    def test_lazy_imports_nothing(self):
+        """Lazy loading imports no tool module until one is enabled."""
+        assert _run("v1,v2", lazy=True)["imported"] == []
+        assert _run("v1,v2", lazy=True, enable=("wifi",))["imported"] == ["wifi"]
@@ -98,7 +98,7 @@ def check_controller():
     import httpx
 
     try:
-        with httpx.Client(verify=False, timeout=5.0) as c:
+        with httpx.Client(verify=False, timeout=5.0, transport=srv._cassette_transport()) as c:
             resp = c.get(f"https://127.0.0.1:{os.environ['UNIFI_PORT']}/status")
             if resp.status_code != 200:
                 pytest.skip("UniFi controller not ready (status != 200)")
@@ -293,7 +293,7 @@ class TestLiveGlobal:
         """GET /status returns structured JSON."""
         import httpx
 
-        with httpx.Client(verify=False, timeout=10.0) as c:
+        with httpx.Client(verify=False, timeout=10.0, transport=srv._cassette_transport()) as c:
             resp = c.get(f"https://127.0.0.1:{os.environ['UNIFI_PORT']}/status")
             data = resp.json()
             formatted = srv._format_response(data)
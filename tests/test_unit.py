@@ -11,10 +11,20 @@ Run:
 from __future__ import annotations
 
 import asyncio
+import inspect
+import json
 import os
+import pickle
+import re
+import sqlite3
+import subprocess
 import sys
+import time
+import zlib
+from collections import defaultdict
 from pathlib import Path
 
+import httpx
 import pytest
 
 # ---------------------------------------------------------------------------
@@ -29,10 +39,24 @@ os.environ.setdefault("UNIFI_SITE", "default")
 os.environ.setdefault("UNIFI_VERIFY_SSL", "false")
 os.environ.setdefault("UNIFI_REDACT_SECRETS", "true")
 
-# Add generated/ to path so we can import server
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "generated"))
+# Add generated/ to path so we can import server, and field-probe/ for field_probe
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "generated"))
+sys.path.insert(0, str(ROOT / "field-probe"))
+sys.path.insert(0, str(ROOT / "llm-probe"))
+sys.path.insert(0, str(ROOT / "mock-controller"))
+sys.path.insert(0, str(ROOT))
 
+import bench_replay  # noqa: E402
+import bench_tools  # noqa: E402
+import field_probe  # noqa: E402
+import llm_probe  # noqa: E402
+import probe  # noqa: E402
 import server as srv  # noqa: E402
+import synth_dataset  # noqa: E402
+import unifi_capture  # noqa: E402
+import unifi_cassette  # noqa: E402
+from generator import schema_inference, synthetic  # noqa: E402
 
 
 # ===========================================================================
@@ -171,3 +195,1324 @@ class TestEnrichClients:
         assert result[0]["network_name"] == "LAN"
         assert result[1]["network_name"] == "Guest VLAN"
         assert "network_name" not in result[2]
+
+
+# ===========================================================================
+# Test: bulk port overrides (_merge_port_overrides / _apply_port_overrides)
+# ===========================================================================
+
+
+class TestPortOverrides:
+    """Unit tests for the shared port override merge + per-device lock."""
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    def test_merge_replaces_and_appends(self):
+        """Overrides for existing ports are replaced, new ports appended, others kept."""
+        existing = [
+            {"port_idx": 1, "name": "old1"},
+            {"port_idx": 2, "name": "keep"},
+        ]
+        merged = srv._merge_port_overrides(existing, [
+            {"port_idx": 1, "name": "new1"},
+            {"port_idx": 5, "poe_mode": "off"},
+        ])
+        assert merged == [
+            {"port_idx": 2, "name": "keep"},
+            {"port_idx": 1, "name": "new1"},
+            {"port_idx": 5, "poe_mode": "off"},
+        ]
+
+    def test_single_get_and_put(self):
+        """Many ports are written with exactly one GET and one PUT."""
+        calls = []
+
+        class MockClient:
+            async def request(self, method, path, json_data=None, site=None):
+                calls.append((method, path))
+                if method == "GET":
+                    return [{"_id": "dev1", "port_overrides": [{"port_idx": 3}]}]
+                return [json_data]
+
+        overrides = [{"port_idx": i, "portconf_id": "p"} for i in range(1, 25)]
+        result = self._run(srv._apply_port_overrides(MockClient(), "dev1", overrides, None))
+        assert calls == [("GET", "rest/device/dev1"), ("PUT", "rest/device/dev1")]
+        assert len(result[0]["port_overrides"]) == 24
+
+    def test_concurrent_edits_are_serialized(self):
+        """Concurrent edits on the same device do not overwrite each other."""
+        state = {"port_overrides": []}
+
+        class MockClient:
+            async def request(self, method, path, json_data=None, site=None):
+                if method == "GET":
+                    snapshot = {"port_overrides": list(state["port_overrides"])}
+                    await asyncio.sleep(0)  # yield so unlocked callers would interleave
+                    return [snapshot]
+                state["port_overrides"] = json_data["port_overrides"]
+                return [state]
+
+        async def main():
+            client = MockClient()
+            await asyncio.gather(*(
+                srv._apply_port_overrides(client, "dev1", [{"port_idx": i}], None)
+                for i in range(1, 9)
+            ))
+
+        self._run(main())
+        assert sorted(o["port_idx"] for o in state["port_overrides"]) == list(range(1, 9))
+
+
+# ===========================================================================
+# Test: stat/report body pushdown (_report_body)
+# ===========================================================================
+
+
+class TestReportBody:
+    """Unit tests for the stat/report POST body builder."""
+
+    def test_empty_keeps_controller_defaults(self):
+        """No arguments produce an empty body, as before."""
+        assert srv._report_body() == {}
+
+    def test_window_attrs_and_macs(self):
+        """start/end/attrs/macs are pushed into the body; time is always requested."""
+        body = srv._report_body(1000, 2000, "bytes, num_sta", "AA:BB:CC:DD:EE:FF,")
+        assert body == {
+            "start": 1000,
+            "end": 2000,
+            "attrs": ["time", "bytes", "num_sta"],
+            "macs": ["aa:bb:cc:dd:ee:ff"],
+        }
+
+    def test_time_not_duplicated(self):
+        """An explicit 'time' attribute is kept once, in place."""
+        assert srv._report_body(attrs="bytes,time")["attrs"] == ["bytes", "time"]
+
+
+# ===========================================================================
+# Test: local time-series store (_timeseries_sync / _timeseries_query)
+# ===========================================================================
+
+
+class TestTimeseriesStore:
+    """Unit tests for incremental report sync and local range queries."""
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    def _client(self, rows, calls):
+        class MockClient:
+            async def request(self, method, path, json_data=None, site=None):
+                calls.append((method, path, json_data))
+                return [r for r in rows if json_data["start"] <= r["time"] <= json_data["end"]]
+        return MockClient()
+
+    def test_sync_is_incremental_from_watermark(self):
+        """The second sync starts at the stored watermark, not the lookback window."""
+        conn = srv._timeseries_connect(":memory:")
+        rows = [
+            {"time": 1000, "ap": "AA:AA:AA:AA:AA:AA", "bytes": 10, "num_sta": 1},
+            {"time": 2000, "ap": "aa:aa:aa:aa:aa:aa", "bytes": 30, "num_sta": 3},
+            {"time": 2000, "ap": "bb:bb:bb:bb:bb:bb", "bytes": 5, "num_sta": 2},
+        ]
+        calls = []
+        client = self._client(rows, calls)
+        now = 10000
+        assert self._run(srv._timeseries_sync(client, conn, "default", "5minutes.ap", [], [], now)) == 3
+        assert calls[0][1] == "stat/report/5minutes.ap"
+        assert calls[0][2]["start"] == now - srv._REPORT_LOOKBACK_MS["5minutes"]
+        assert "time" in calls[0][2]["attrs"] and "bytes" in calls[0][2]["attrs"]
+
+        self._run(srv._timeseries_sync(client, conn, "default", "5minutes.ap", [], [], now))
+        assert calls[1][2]["start"] == 2000
+        # Re-fetching the last bucket does not duplicate samples
+        assert conn.execute("SELECT count(*) FROM samples").fetchone()[0] == 3
+
+        self._run(srv._timeseries_sync(client, conn, "default", "5minutes.ap", ["bb:bb:bb:bb:bb:bb"], [], now))
+        assert calls[2][2]["start"] == 2000
+        assert calls[2][2]["macs"] == ["bb:bb:bb:bb:bb:bb"]
+
+    def test_new_attr_backfills_from_lookback(self):
+        """An attr not synced before starts from the lookback window and lands in existing samples."""
+        conn = srv._timeseries_connect(":memory:")
+        rows = [
+            {"time": 1000, "ap": "aa:aa:aa:aa:aa:aa", "bytes": 10, "tx_retries": 4},
+            {"time": 2000, "ap": "aa:aa:aa:aa:aa:aa", "bytes": 30, "tx_retries": 6},
+        ]
+        calls = []
+
+        class MockClient:
+            async def request(self, method, path, json_data=None, site=None):
+                calls.append(json_data)
+                attrs = json_data["attrs"]
+                return [{k: v for k, v in r.items() if k in attrs or k == "ap"}
+                        for r in rows if json_data["start"] <= r["time"] <= json_data["end"]]
+
+        now, lookback = 10000, 10000 - srv._REPORT_LOOKBACK_MS["5minutes"]
+        self._run(srv._timeseries_sync(MockClient(), conn, "default", "5minutes.ap", [], [], now))
+        assert "tx_retries" not in calls[0]["attrs"]
+
+        self._run(srv._timeseries_sync(MockClient(), conn, "default", "5minutes.ap", [], ["tx_retries"], now))
+        assert calls[1]["start"] == lookback and "tx_retries" in calls[1]["attrs"]
+        raw = srv._timeseries_query(conn, "default", "5minutes.ap", 0, now, [], ["bytes", "tx_retries"])
+        assert [(r["bytes"], r["tx_retries"]) for r in raw] == [(10, 4), (30, 6)]
+
+        self._run(srv._timeseries_sync(MockClient(), conn, "default", "5minutes.ap", [], ["tx_retries"], now))
+        self._run(srv._timeseries_sync(MockClient(), conn, "default", "5minutes.ap",
+                                       ["aa:aa:aa:aa:aa:aa"], ["tx_retries"], now))
+        assert calls[2]["start"] == calls[3]["start"] == 2000
+        self._run(srv._timeseries_sync(MockClient(), conn, "default", "5minutes.ap",
+                                       ["aa:aa:aa:aa:aa:aa"], ["satisfaction"], now))
+        assert calls[4]["start"] == lookback
+
+    def test_legacy_watermarks_dropped(self, tmp_path):
+        """A store whose watermarks predate per-attr keys is reopened with them cleared, samples kept."""
+        path = str(tmp_path / "ts.db")
+        old = sqlite3.connect(path)
+        old.executescript(
+            "CREATE TABLE watermarks (site TEXT NOT NULL, report TEXT NOT NULL, mac TEXT NOT NULL, "
+            "time INTEGER NOT NULL, PRIMARY KEY (site, report, mac));"
+            "INSERT INTO watermarks VALUES ('default', '5minutes.ap', '*', 2000);"
+            + srv._TIMESERIES_SCHEMA.split("CREATE TABLE IF NOT EXISTS watermarks")[0]
+            + "INSERT INTO samples VALUES ('default', '5minutes.ap', 'aa', 2000, '{}');")
+        old.commit()
+        old.close()
+        conn = srv._timeseries_connect(path)
+        assert conn.execute("SELECT count(*) FROM watermarks").fetchone()[0] == 0
+        assert conn.execute("SELECT count(*) FROM samples").fetchone()[0] == 1
+        assert "attr" in [row[1] for row in conn.execute("PRAGMA table_info(watermarks)")]
+
+    def test_query_raw_and_aggregate(self):
+        """Raw queries return samples in range; agg returns one row per MAC."""
+        conn = srv._timeseries_connect(":memory:")
+        rows = [
+            {"time": 1000, "ap": "aa:aa:aa:aa:aa:aa", "bytes": 10, "wan-tx_bytes": 1},
+            {"time": 2000, "ap": "aa:aa:aa:aa:aa:aa", "bytes": 30, "wan-tx_bytes": 3},
+            {"time": 2000, "ap": "bb:bb:bb:bb:bb:bb", "bytes": 50, "wan-tx_bytes": 5},
+        ]
+        self._run(srv._timeseries_sync(self._client(rows, []), conn, "default", "hourly.ap", [], [], 10000))
+
+        raw = srv._timeseries_query(conn, "default", "hourly.ap", 0, 1500, [], ["bytes"])
+        assert raw == [{"time": 1000, "mac": "aa:aa:aa:aa:aa:aa", "bytes": 10}]
+
+        agg = srv._timeseries_query(conn, "default", "hourly.ap", 0, 5000, [], ["bytes", "wan-tx_bytes"], "avg")
+        assert [r["mac"] for r in agg] == ["bb:bb:bb:bb:bb:bb", "aa:aa:aa:aa:aa:aa"]
+        assert agg[1]["avg_bytes"] == 20
+        assert agg[1]["avg_wan-tx_bytes"] == 2
+        assert agg[1]["samples"] == 2
+
+    def test_unknown_report_rejected(self):
+        """Report names outside <interval>.<type> raise a RuntimeError."""
+        with pytest.raises(RuntimeError):
+            srv._parse_report("weekly.ap")
+
+
+# ===========================================================================
+# Test: report granularity planner (_plan_report_segments / _downsample_report)
+# ===========================================================================
+
+
+class TestReportPlanner:
+    """Unit tests for interval choice, stitching and min/avg/max downsampling."""
+
+    HOUR = 3600 * 1000
+    DAY = 24 * HOUR
+
+    def test_picks_finest_interval_that_fits(self):
+        """A recent 6h range at 200 points fits 5-minute data (72 points)."""
+        now = 100 * self.DAY
+        assert srv._plan_report_segments(now - 6 * self.HOUR, now, 200, now) == [
+            ("5minutes", now - 6 * self.HOUR, now),
+        ]
+
+    def test_long_range_uses_coarser_interval(self):
+        """30 days at 200 points is too many hourly points (720), so daily is used."""
+        now = 400 * self.DAY
+        segments = srv._plan_report_segments(now - 30 * self.DAY, now, 200, now)
+        assert [s[0] for s in segments] == ["daily"]
+
+    def test_stitches_when_fine_data_aged_out(self):
+        """Older parts of the range fall back to coarser intervals, oldest first."""
+        now = 400 * self.DAY
+        start = now - 10 * self.DAY
+        segments = srv._plan_report_segments(start, now, 1000, now)
+        hourly_cutoff = now - srv._REPORT_LOOKBACK_MS["hourly"]
+        assert segments == [
+            ("daily", start, hourly_cutoff - 1),
+            ("hourly", hourly_cutoff, now),
+        ]
+
+    def test_downsample_min_avg_max(self):
+        """Series over max_points are bucketed per mac with min/avg/max."""
+        rows = [
+            {"time": t, "mac": "aa", "interval": "5minutes", "bytes": t}
+            for t in range(0, 100)
+        ]
+        out = srv._downsample_report(rows, ["bytes"], 0, 99, 10)
+        assert len(out) == 10
+        assert out[0] == {
+            "time": 0, "mac": "aa", "interval": "5minutes", "points": 10,
+            "bytes_min": 0, "bytes_avg": 4.5, "bytes_max": 9,
+        }
+
+    def test_downsample_keeps_small_series(self):
+        """Series within max_points are returned unchanged."""
+        rows = [{"time": 1, "interval": "hourly", "bytes": 5}]
+        assert srv._downsample_report(rows, ["bytes"], 0, 10, 10) is rows
+
+
+# ===========================================================================
+# Test: windowed session queries (_session_windows / _fetch_sessions)
+# ===========================================================================
+
+
+class TestSessionWindows:
+    """Unit tests for chunked stat/session fetching."""
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    def test_windows_newest_first(self):
+        """Ranges are split into chunk-sized windows, newest first."""
+        assert srv._session_windows(0, 250, 100) == [(150, 250), (50, 150), (0, 50)]
+
+    def test_fetch_dedups_and_stops_early(self):
+        """Sessions spanning windows are kept once; fetching stops at `want`."""
+        calls = []
+
+        class MockClient:
+            async def request(self, method, path, json_data=None, site=None):
+                calls.append(json_data)
+                return [{"_id": "span", "mac": "aa"}, {"_id": f"s{json_data['start']}"}]
+
+        windows = srv._session_windows(0, 10 * srv._SESSION_CHUNK_S)
+        records, complete = self._run(srv._fetch_sessions(MockClient(), {"type": "all"}, windows, None, want=3))
+        assert len(calls) == srv._SESSION_CONCURRENCY
+        assert calls[0]["type"] == "all" and calls[0]["end"] == 10 * srv._SESSION_CHUNK_S
+        assert [r["_id"] for r in records].count("span") == 1
+        assert not complete
+
+        calls.clear()
+        records, complete = self._run(srv._fetch_sessions(MockClient(), {"type": "all"}, windows, None))
+        assert len(calls) == 10
+        assert len(records) == 11
+        assert complete
+
+
+# ===========================================================================
+# Test: event/alarm query pushdown (_event_query_body)
+# ===========================================================================
+
+
+class TestEventQueryBody:
+    """Unit tests for the stat/event and stat/alarm POST body builder."""
+
+    def test_defaults_sort_newest_first(self):
+        """Without arguments only the sort order is sent."""
+        assert srv._event_query_body() == {"_sort": "-time"}
+
+    def test_limit_offset_within_archived(self):
+        """limit/offset/within_hours/archived map to the controller's query keys."""
+        assert srv._event_query_body(50, 100, 24, "false") == {
+            "_sort": "-time", "_limit": 50, "_start": 100, "within": 24, "archived": False,
+        }
+
+
+# ===========================================================================
+# Test: full-text event archive (_event_archive_*)
+# ===========================================================================
+
+
+class TestEventArchive:
+    """Unit tests for event/alarm ingestion, dedup and search."""
+
+    ROWS = [
+        {"_id": "e3", "time": 3000, "key": "EVT_WU_Roam", "user": "AA:AA:AA:AA:AA:AA",
+         "ap_from": "11:11:11:11:11:11", "ap_to": "22:22:22:22:22:22", "msg": "User roamed from AP A to AP B"},
+        {"_id": "e2", "time": 2000, "key": "EVT_AP_RadarDetected", "ap": "11:11:11:11:11:11",
+         "ap_name": "Office", "msg": "DFS radar detected on channel 52"},
+        {"_id": "e1", "time": 1000, "key": "EVT_WU_Disconnected", "user": "aa:aa:aa:aa:aa:aa",
+         "msg": "User disconnected"},
+    ]
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    def test_ingest_dedups_by_id(self):
+        """Re-ingesting the same records adds nothing."""
+        conn = srv._event_archive_connect(":memory:")
+        assert srv._event_archive_ingest(conn, "default", "event", self.ROWS) == (3, 0)
+        assert srv._event_archive_ingest(conn, "default", "event", self.ROWS) == (0, 3)
+        assert conn.execute("SELECT count(*) FROM events_fts").fetchone()[0] == 3
+
+    def test_search_by_text_key_mac_and_time(self):
+        """Text, key, MAC and time filters combine; results are newest first."""
+        conn = srv._event_archive_connect(":memory:")
+        srv._event_archive_ingest(conn, "default", "event", self.ROWS)
+        search = srv._event_archive_search
+        assert [r["_id"] for r in search(conn, "default", query="radar")] == ["e2"]
+        assert [r["_id"] for r in search(conn, "default", query="office")] == ["e2"]
+        assert [r["_id"] for r in search(conn, "default", query="roam*")] == ["e3"]
+        assert [r["_id"] for r in search(conn, "default", key="evt_wu_roam")] == ["e3"]
+        assert [r["_id"] for r in search(conn, "default", mac="AA:AA:AA:AA:AA:AA")] == ["e3", "e1"]
+        assert [r["_id"] for r in search(conn, "default", mac="11:11:11:11:11:11", since=2500)] == ["e3"]
+        assert [r["_id"] for r in search(conn, "default", limit=1, offset=1)] == ["e2"]
+        assert search(conn, "other") == []
+
+    def test_sync_stops_at_known_records(self):
+        """Sync pages newest first and stops on a page reaching archived records."""
+        conn = srv._event_archive_connect(":memory:")
+        srv._event_archive_ingest(conn, "default", "event", self.ROWS[1:])
+        calls = []
+
+        class MockClient:
+            async def request(self, method, path, json_data=None, site=None):
+                calls.append((path, json_data))
+                return self.rows
+
+        client = MockClient()
+        client.rows = self.ROWS
+        assert self._run(srv._event_archive_sync(client, conn, "default", "event")) == 1
+        assert len(calls) == 1
+        assert calls[0][0] == "stat/event"
+        assert calls[0][1]["_sort"] == "-time" and calls[0][1]["_limit"] == srv._EVENT_ARCHIVE_PAGE
+        assert conn.execute("SELECT count(*) FROM event_gaps").fetchone()[0] == 0
+
+    class _Controller:
+        """stat/event over a newest-first list, honouring _start/_limit."""
+
+        def __init__(self, rows, fail_on_page=None):
+            self.rows = rows
+            self.fail_on_page = fail_on_page
+            self.pages = 0
+
+        async def request(self, method, path, json_data=None, site=None):
+            self.pages += 1
+            if self.pages == self.fail_on_page:
+                raise RuntimeError("Request timed out")
+            start = json_data.get("_start", 0)
+            return self.rows[start:start + json_data["_limit"]]
+
+    def _events(self, first, last):
+        return [{"_id": f"e{n}", "time": 1000 + n, "key": "EVT_X", "msg": f"event {n}"}
+                for n in range(last, first - 1, -1)]
+
+    def _archived(self, conn):
+        return {row[0] for row in conn.execute("SELECT id FROM events")}
+
+    def test_capped_sync_resumes_without_gap(self, monkeypatch):
+        """A sync cut off by the page cap is finished by the next one, under new arrivals."""
+        monkeypatch.setattr(srv, "_EVENT_ARCHIVE_PAGE", 10)
+        monkeypatch.setattr(srv, "_EVENT_ARCHIVE_MAX_PAGES", 2)
+        conn = srv._event_archive_connect(":memory:")
+        srv._event_archive_ingest(conn, "default", "event", self._events(1, 5))
+        controller = self._Controller(self._events(1, 45))
+        assert self._run(srv._event_archive_sync(controller, conn, "default", "event")) == 20
+        assert conn.execute("SELECT count(*) FROM event_gaps").fetchone()[0] == 1
+
+        controller.rows = self._events(1, 48)  # three more arrive before the next sync
+        monkeypatch.setattr(srv, "_EVENT_ARCHIVE_MAX_PAGES", 50)
+        assert self._run(srv._event_archive_sync(controller, conn, "default", "event")) == 23
+        assert self._archived(conn) == {f"e{n}" for n in range(1, 49)}
+        assert conn.execute("SELECT count(*) FROM event_gaps").fetchone()[0] == 0
+
+    def test_failed_page_resumes_without_gap(self, monkeypatch):
+        """A request failing mid-sync leaves a gap the next sync fills."""
+        monkeypatch.setattr(srv, "_EVENT_ARCHIVE_PAGE", 10)
+        conn = srv._event_archive_connect(":memory:")
+        srv._event_archive_ingest(conn, "default", "event", self._events(1, 5))
+        controller = self._Controller(self._events(1, 45), fail_on_page=3)
+        with pytest.raises(RuntimeError):
+            self._run(srv._event_archive_sync(controller, conn, "default", "event"))
+        assert len(self._archived(conn)) == 25
+        assert self._run(srv._event_archive_sync(controller, conn, "default", "event")) == 20
+        assert self._archived(conn) == {f"e{n}" for n in range(1, 46)}
+
+
+# ===========================================================================
+# Test: BM25 tool search (_rank_tools)
+# ===========================================================================
+
+
+class TestToolSearch:
+    """Unit tests for the generator-emitted inverted index and BM25 ranking."""
+
+    def test_tokens_split_and_strip_plural(self):
+        """Queries tokenize on non-alphanumerics and drop a plural 's'."""
+        assert srv._search_tokens("Firewall_Rules, dns class") == ["firewall", "rule", "dns", "class"]
+
+    def test_name_matches_rank_first(self):
+        """All-term matches on the tool name outrank keyword-only matches."""
+        results, matched_all = srv._rank_tools("firewall rule", 5)
+        assert matched_all
+        assert all("firewall_rule" in r["tool"] for r in results)
+        assert results == sorted(results, key=lambda r: (-r["score"], r["tool"]))
+
+    def test_or_fallback(self):
+        """An unknown extra word falls back to matching any term."""
+        results, matched_all = srv._rank_tools("backup xyzzy", 3)
+        assert not matched_all
+        assert results and all("backup" in r["tool"] for r in results)
+
+    def test_limit_and_deterministic(self):
+        """limit caps results and repeated queries return the same order."""
+        first, _ = srv._rank_tools("client", 7)
+        assert len(first) == 7
+        assert srv._rank_tools("client", 7)[0] == first
+
+    def test_no_match(self):
+        """Unknown words return nothing."""
+        assert srv._rank_tools("xyzzy", 10) == ([], False)
+
+
+# ===========================================================================
+# Test: trigram fuzzy matching (_fuzzy_terms / _search_fields)
+# ===========================================================================
+
+
+class TestFuzzySearch:
+    """Unit tests for the generator-emitted trigram and field indexes."""
+
+    def test_misspelled_tool_query(self):
+        """Typos in a query still find the intended tools."""
+        results, matched_all = srv._rank_tools("firewal rulez", 3)
+        assert matched_all
+        assert all("firewall_rule" in r["tool"] for r in results)
+
+    def test_fuzzy_terms_best_first(self):
+        """Exact terms score 1.0 and come before near matches."""
+        terms = srv._fuzzy_terms("firewall")
+        assert terms[0] == ("firewall", 1.0)
+        assert [s for _, s in terms] == sorted((s for _, s in terms), reverse=True)
+
+    def test_search_fields_exact_and_partial(self):
+        """Fields are found by exact name, substring and misspelling."""
+        exact = srv._search_fields("satisfaction", 0)
+        assert {"field": "satisfaction", "tool": "unifi_list_clients", "endpoint": "stat/sta", "similarity": 1.0} in exact
+        assert any(r["field"] == "tx_retries" for r in srv._search_fields("retries", 0))
+        assert srv._search_fields("sattisfaction", 1)[0]["field"] == "satisfaction"
+
+    def test_search_fields_no_match(self):
+        """Unrelated queries return nothing."""
+        assert srv._search_fields("qqqqzzzz") == []
+
+
+# ===========================================================================
+# Test: field catalogue (_field_catalogue / _describe_fields)
+# ===========================================================================
+
+
+class TestFieldCatalogue:
+    """Unit tests for the compressed field catalogue behind unifi_describe_fields."""
+
+    def test_describe_known_tool(self):
+        """Rows carry type and read-only flag; ID fields point at their list tool."""
+        endpoint, fields = srv._describe_fields("unifi_list_port_profiles")
+        assert endpoint == "rest/portconf"
+        by_name = {f["field"]: f for f in fields}
+        assert by_name["_id"]["read_only"] is True
+        assert by_name["native_networkconf_id"]["see"] == "unifi_list_networks"
+        assert [f["field"] for f in fields] == sorted(by_name)
+
+    def test_filter(self):
+        """Comma-separated filters keep fields containing any part, case-insensitively."""
+        _, fields = srv._describe_fields("unifi_update_port_profile", "POE, native")
+        assert fields
+        assert all("poe" in f["field"] or "native" in f["field"] for f in fields)
+
+    def test_unknown_tool(self):
+        """Tools without a catalogue entry return None."""
+        assert srv._describe_fields("unifi_reboot_device") is None
+
+    def test_docstring_pointers_resolve(self):
+        """Every docstring pointer names a tool with a catalogue entry."""
+        sources = [Path(srv.__file__)] + sorted((Path(srv.__file__).parent / "unifi_tools").glob("*.py"))
+        refs = set()
+        for path in sources:
+            refs.update(re.findall(r'unifi_describe_fields\("(unifi_\w+)"\)', path.read_text()))
+        assert refs
+        assert refs <= set(srv._field_catalogue()["tools"])
+
+
+# ===========================================================================
+# Test: table-driven tools (_ToolSpec / _table_tool)
+# ===========================================================================
+
+
+class TestToolTable:
+    """Unit tests for the generic wrapper behind tool table rows."""
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    def test_cmd_params(self):
+        """Command parameters are required, "site" becomes target_site, confirm/site follow."""
+        spec = srv._ToolSpec("cmd", "unifi_move_device", "cmd/sitemgr", "move-device",
+                             {"params": (("mac", "str"), ("site", "str")), "mutation": True}, "Move.")
+        assert [p[0] for p in srv._tool_params(spec)] == ["mac", "target_site", "confirm", "site"]
+
+    def test_report_params(self):
+        """Every report takes a window and attrs; only per-object (ap/user/gw) reports take macs."""
+        registered = self._run(srv.mcp.get_tools())
+        window = ["start", "end", "attrs"]
+        for name, macs in (("unifi_list_report_monthly_user", True), ("unifi_list_speedtest_results", False),
+                           ("unifi_list_report_monthly_site", False)):
+            properties = list(registered[name].parameters["properties"])
+            assert properties[:3] == window and ("macs" in properties) == macs, name
+            assert ("macs:" in registered[name].description) == macs, name
+
+    def test_wrapper_signature_and_dry_run(self):
+        """The wrapper carries the row's name and doc, binds positionals and applies defaults."""
+        spec = srv._ToolSpec("create", "unifi_create_thing", "rest/thing", "thing", None, "Create a thing.")
+        tool = srv._table_tool(spec)
+        assert tool.__name__ == "unifi_create_thing"
+        assert tool.__doc__ == "Create a thing."
+        assert list(inspect.signature(tool).parameters) == ["data", "confirm", "site"]
+        result = self._run(tool({"name": "x"}))
+        assert result["summary"] == "DRY RUN (POST rest/thing): Set confirm=True to execute."
+        assert result["data"] == {"action": "create_thing", "data": {"name": "x"}}
+
+    def test_wrapper_calls_client_and_reports_errors(self, monkeypatch):
+        """Handlers use the shared client; RuntimeError becomes a structured error."""
+        class MockClient:
+            async def request(self, method, path, json_data=None, site=None):
+                if path.endswith("/missing"):
+                    raise RuntimeError("not found")
+                return [{"_id": "a1"}]
+        monkeypatch.setattr(srv, "_client", MockClient())
+        tool = srv._table_tool(srv._ToolSpec("get", "unifi_get_thing", "rest/thing", "thing", None, "Get."))
+        assert self._run(tool("a1")) == {"data": {"_id": "a1"}}
+        assert self._run(tool(id="missing")) == {"error": True, "message": "not found"}
+
+    def test_registered_tools_match_rows(self):
+        """Every registered table tool has its row's name and doc and the schema pydantic builds for it."""
+        from fastmcp.tools import Tool
+
+        registered = self._run(srv.mcp.get_tools())
+        checked = 0
+        for module in srv._MODULE_APIS:
+            if module == "global":
+                continue
+            tools = srv._import_generated(f"unifi_tools.{module}")
+            for row in getattr(tools, "_V1_TOOLS", ()) + getattr(tools, "_V2_TOOLS", ()):
+                spec = srv._ToolSpec(*row)
+                if spec.name not in registered:
+                    continue
+                tool, fresh = registered[spec.name], Tool.from_function(srv._table_tool(spec))
+                assert (tool.name, tool.description) == (spec.name, inspect.getdoc(fresh.fn))
+                assert (tool.parameters, tool.output_schema) == (fresh.parameters, fresh.output_schema), spec.name
+                checked += 1
+        assert checked > 200
+
+
+# ===========================================================================
+# Test: record/replay cassette transport (unifi_cassette)
+# ===========================================================================
+
+
+class TestCassette:
+    """Unit tests for recording and replaying controller traffic."""
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    def _controller(self, request):
+        if request.url.path == "/api/login":
+            return httpx.Response(200, json={"meta": {"rc": "ok"}, "data": []},
+                                  headers={"set-cookie": "unifises=secret-session; Path=/"})
+        count = int(request.url.params.get("n", "0"))
+        return httpx.Response(200, json={"data": [{"n": count, "x_passphrase": "hunter2"}]})
+
+    def test_record_then_replay(self, tmp_path):
+        """Recorded responses replay offline, scrubbed, in order, with the last repeating."""
+        path = tmp_path / "c.jsonl"
+        recorder = unifi_cassette.CassetteTransport(path, mode="record")
+        recorder._sync = httpx.MockTransport(self._controller)
+        with httpx.Client(base_url="https://ctl", transport=recorder) as client:
+            client.post("/api/login", json={"username": "admin", "password": "pw"})
+            client.get("/api/s/default/stat/device", params={"n": 1})
+            client.get("/api/s/default/stat/sta")
+            client.get("/api/s/default/stat/sta")
+        recorder._file.close()
+        raw = path.read_text()
+        assert "hunter2" not in raw and "secret-session" not in raw and '"pw"' not in raw
+
+        replayer = unifi_cassette.CassetteTransport(path, latency=0)
+        with httpx.Client(base_url="https://other", transport=replayer) as client:
+            login = client.post("/api/login", json={"username": "admin", "password": "pw"})
+            assert login.headers["set-cookie"] == "unifises=REDACTED; Path=/"
+            data = client.get("/api/s/default/stat/device", params={"n": 1}).json()["data"]
+            assert data == [{"n": 1, "x_passphrase": "REDACTED"}]
+            for _ in range(3):
+                assert client.get("/api/s/default/stat/sta").status_code == 200
+            with pytest.raises(unifi_cassette.CassetteMiss):
+                client.get("/api/s/default/stat/device", params={"n": 2})
+
+    def test_async_replay_scales_latency(self, tmp_path):
+        """Async replay sleeps the recorded time multiplied by the latency factor."""
+        path = tmp_path / "c.jsonl"
+        path.write_text('{"cassette":1}\n{"key":"%s","status":200,"headers":[],"encoding":"json",'
+                        '"body":{"data":[]},"elapsed":0.2}\n'
+                        % unifi_cassette.request_key(httpx.Request("GET", "https://ctl/status")))
+
+        async def fetch(latency):
+            transport = unifi_cassette.CassetteTransport(path, latency=latency)
+            async with httpx.AsyncClient(transport=transport) as client:
+                started = time.perf_counter()
+                assert (await client.get("https://ctl/status")).json() == {"data": []}
+                return time.perf_counter() - started
+
+        assert self._run(fetch(0)) < 0.1
+        assert self._run(fetch(0.5)) >= 0.1
+
+
+# ===========================================================================
+# Test: tool call capture (unifi_capture)
+# ===========================================================================
+
+
+class TestCapture:
+    """Unit tests for capturing tool calls with their controller requests."""
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    def test_capture_line_per_call(self, tmp_path):
+        """Each call is written with scrubbed args, result size and the requests it issued."""
+        from fastmcp import Client, FastMCP
+
+        path = tmp_path / "capture.ndjson"
+        mcp = FastMCP("capture")
+        mcp.add_middleware(unifi_capture.CaptureMiddleware(path))
+        transport = unifi_capture.RequestCounter(
+            httpx.MockTransport(lambda request: httpx.Response(200, json={"data": []})))
+
+        @mcp.tool()
+        async def fetch(data: dict, confirm: bool = False) -> dict:
+            async with httpx.AsyncClient(base_url="https://ctl", transport=transport) as client:
+                await asyncio.gather(client.get("/api/s/default/stat/sta", params={"n": 1}),
+                                     client.post("/api/s/default/cmd/stamgr"))
+            return srv._tool_error("refused") if confirm else srv._format_response([])
+
+        async def calls():
+            async with Client(mcp) as client:
+                await client.call_tool_mcp("fetch", {"data": {"name": "a", "x_passphrase": "hunter2"}})
+                await client.call_tool_mcp("fetch", {"data": {}, "confirm": True})
+
+        self._run(calls())
+        raw = path.read_text()
+        assert "hunter2" not in raw
+        header, first, second = (json.loads(line) for line in raw.splitlines())
+        assert header == {"capture": 1}
+        assert first["tool"] == "fetch" and first["args"] == {"data": {"name": "a", "x_passphrase": "REDACTED"}}
+        assert sorted(first["requests"]) == ["GET /api/s/default/stat/sta", "POST /api/s/default/cmd/stamgr"]
+        assert first["error"] is False and second["error"] is True
+        assert first["result_bytes"] > 0 and first["duration_ms"] >= 0 and first["session"]
+        assert second["start"] >= first["start"]
+
+    def test_capture_replay_keeps_ids_and_filters(self, tmp_path):
+        """Filter and ID arguments survive capture → replay; only secret ones are redacted."""
+        from fastmcp import Client, FastMCP
+
+        def app(path, received):
+            mcp = FastMCP("capture")
+            mcp.add_middleware(unifi_capture.CaptureMiddleware(path))
+
+            @mcp.tool()
+            async def search(key: str, device_id: str = "", filters: dict | None = None, x_password: str = "") -> dict:
+                received.append({"key": key, "device_id": device_id, "filters": filters, "x_password": x_password})
+                if not key.startswith("EVT_"):
+                    return srv._tool_error(f"unknown event key {key}")
+                return srv._format_response([])
+            return mcp
+
+        async def issue(mcp, calls):
+            async with Client(mcp) as client:
+                for call in calls:
+                    await client.call_tool_mcp(call["tool"], call["args"])
+
+        original, replayed = [], []
+        args = {"key": "EVT_WU_Roam", "device_id": "5f0c0a1b2c3d4e5f60718293",
+                "filters": {"site_key": "default", "api_token": "t0ken"}, "x_password": "hunter2"}
+        self._run(issue(app(tmp_path / "capture.ndjson", original), [{"tool": "search", "args": args}]))
+        captured = bench_replay.read_capture(tmp_path / "capture.ndjson", set(), 0)
+        assert "hunter2" not in (tmp_path / "capture.ndjson").read_text()
+        assert captured[0]["args"] == dict(args, x_password="REDACTED",
+                                           filters={"site_key": "default", "api_token": "REDACTED"})
+
+        self._run(issue(app(tmp_path / "replay.ndjson", replayed), captured))
+        replay = bench_replay.read_capture(tmp_path / "replay.ndjson", set(), 0)
+        assert replayed[0]["key"] == "EVT_WU_Roam" and replayed[0]["device_id"] == args["device_id"]
+        assert replay[0]["args"] == captured[0]["args"]
+        assert replay[0]["error"] is captured[0]["error"] is False
+
+    def test_controller_transport_counts_when_capturing(self, monkeypatch):
+        """Controller clients get the counting transport only when UNIFI_CAPTURE is set."""
+        monkeypatch.delenv("UNIFI_CASSETTE", raising=False)
+        monkeypatch.delenv("UNIFI_CAPTURE", raising=False)
+        assert srv._controller_transport() is None
+        monkeypatch.setenv("UNIFI_CAPTURE", "/dev/null")
+        assert isinstance(srv._controller_transport(), unifi_capture.RequestCounter)
+
+
+# ===========================================================================
+# Test: field_probe merging across targets
+# ===========================================================================
+
+class TestFieldProbeMerge:
+    KEY = "stat_sta"
+
+    @staticmethod
+    def _fields(total, **seen):
+        """A collect() field map: name=(type, seen_in), all over total records."""
+        return {name: {"type": vtype, "seen_in": count, "total_records": total}
+                for name, (vtype, count) in sorted(seen.items())}
+
+    def _result(self, fields):
+        return {self.KEY: fields}
+
+    def test_merge_fields_sums_over_targets(self):
+        """seen_in is summed and total_records counts every target's records."""
+        merged = field_probe.merge_fields([
+            self._fields(10, mac=("str", 10), satisfaction=("int", 4)),
+            self._fields(5, mac=("str", 5), radio=("str", 5)),
+        ])
+        assert merged == {
+            "mac": {"type": "str", "seen_in": 15, "total_records": 15},
+            "radio": {"type": "str", "seen_in": 5, "total_records": 15},
+            "satisfaction": {"type": "int", "seen_in": 4, "total_records": 15},
+        }
+
+    def test_merge_fields_null_type_gives_way(self):
+        """A field that was null on one target takes the first concrete type seen."""
+        merged = field_probe.merge_fields([
+            self._fields(3, note=("null", 3)),
+            self._fields(2, note=("str", 1)),
+            self._fields(2, note=("int", 2)),
+        ])
+        assert merged["note"] == {"type": "str", "seen_in": 6, "total_records": 7}
+
+    def test_two_targets_and_an_empty_one(self):
+        """Targets with no data or no login add nothing; the others are kept per source."""
+        inventory = field_probe.merge_inventory(
+            [self._result(self._fields(10, mac=("str", 10))), None,
+             self._result(None), self._result(self._fields(4, mac=("str", 2)))],
+            labels=["a:443/default", "b:443/default", "c:443/default", "d:443/default"])
+        entry = inventory[self.KEY]
+        assert entry["fields"] == {"mac": {"type": "str", "seen_in": 12, "total_records": 14}}
+        assert sorted(entry["sources"]) == ["a:443/default", "d:443/default"]
+        assert entry["field_count"] == 1 and entry["path"] == "stat/sta"
+        assert list(inventory) == [self.KEY]
+
+    def test_remerge_same_target_is_idempotent(self):
+        """Merging a target again replaces its contribution instead of adding it twice."""
+        labels = ["a:443/default", "b:443/default"]
+        results = [self._result(self._fields(10, mac=("str", 10))),
+                   self._result(self._fields(4, mac=("str", 4)))]
+        once = field_probe.merge_inventory(results, labels=labels)
+        again = field_probe.merge_inventory(results[:1], json.loads(json.dumps(once)), labels[:1])
+        assert again == once
+
+        # A newer probe of one target replaces its counts; the other's stay
+        newer = field_probe.merge_inventory([self._result(self._fields(6, mac=("str", 3), tx=("int", 6)))],
+                                            again, labels[:1])
+        assert newer[self.KEY]["fields"] == {
+            "mac": {"type": "str", "seen_in": 7, "total_records": 10},
+            "tx": {"type": "int", "seen_in": 6, "total_records": 10},
+        }
+
+    def test_merge_into_inventory_without_sources(self):
+        """An entry from before sources were recorded counts as one earlier target."""
+        legacy = {self.KEY: {"category": "stat", "name": "sta", "path": "stat/sta", "field_count": 1,
+                             "fields": self._fields(8, mac=("str", 8))},
+                  "stat_other": {"fields": {}}}
+        inventory = field_probe.merge_inventory([self._result(self._fields(2, mac=("str", 2)))],
+                                                legacy, ["a:443/default"])
+        assert inventory[self.KEY]["fields"]["mac"] == {"type": "str", "seen_in": 10, "total_records": 10}
+        assert sorted(inventory[self.KEY]["sources"]) == ["(previous)", "a:443/default"]
+        assert inventory["stat_other"] == {"fields": {}}
+
+
+# ===========================================================================
+# Test: streaming schema inference
+# ===========================================================================
+
+def _batch_infer_schema(records: list) -> dict:
+    """The list-based infer_schema that SchemaAccumulator replaced, as a reference."""
+    si = schema_inference
+    if not records:
+        return {}
+    field_types: dict[str, dict[str, int]] = {}
+    field_counts: dict[str, int] = {}
+    field_string_values: dict[str, set[str]] = {}
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        for key, value in record.items():
+            if value is None:
+                continue
+            ptype = si._infer_type(value)
+            field_types.setdefault(key, {})
+            field_types[key][ptype] = field_types[key].get(ptype, 0) + 1
+            field_counts[key] = field_counts.get(key, 0) + 1
+            if (isinstance(value, str) and value and si._is_enum_candidate(key)
+                    and not si._looks_like_data_value(value)):
+                field_string_values.setdefault(key, set()).add(value)
+    result = {}
+    for fname in sorted(field_types):
+        type_counts = field_types[fname]
+        best_type = max(type_counts, key=lambda t: type_counts[t])
+        enum_vals: list[str] = []
+        if best_type == "str" and fname in field_string_values:
+            unique = field_string_values[fname]
+            count = field_counts[fname]
+            if len(unique) <= si._MAX_ENUM_VALUES and (count <= 1 or len(unique) < count):
+                enum_vals = sorted(unique)
+        result[fname] = si.FieldInfo(name=fname, python_type=best_type, read_only=si.is_readonly(fname),
+                                     common=field_counts[fname] == len(records), enum_values=enum_vals)
+    return result
+
+
+class TestSchemaAccumulator:
+    SAMPLES = ["get_setting.json", "stat_ccode.json", "stat_dashboard.json",
+               "stat_health.json", "rest_networkconf.json"]
+
+    def _sample(self, name):
+        return list(schema_inference.iter_capture(ROOT / "spec" / "api-samples" / name))
+
+    def test_streaming_matches_batch_on_samples(self):
+        """Streaming inference gives the old batch result on real samples, alone and combined."""
+        combined = []
+        for name in self.SAMPLES:
+            records = self._sample(name)
+            assert records, name
+            combined += records
+            assert schema_inference.infer_schema(iter(records)) == _batch_infer_schema(records), name
+        assert schema_inference.infer_schema(combined) == _batch_infer_schema(combined)
+
+    def test_captures_match_batch(self, tmp_path):
+        """infer_schema_from_captures over files equals one batch over their records, any job count."""
+        paths = [ROOT / "spec" / "api-samples" / name for name in self.SAMPLES]
+        ndjson = tmp_path / "health.ndjson"
+        ndjson.write_text("".join(json.dumps(r) + "\n" for r in self._sample("stat_health.json")) + "\n")
+        paths.append(ndjson)
+        records = [r for path in paths for r in schema_inference.iter_capture(path)]
+        expected = _batch_infer_schema(records)
+        assert schema_inference.infer_schema_from_captures(paths, jobs=1) == expected
+        assert schema_inference.infer_schema_from_captures(paths, jobs=2) == expected
+
+    def test_merge_equals_single_pass(self):
+        """merge(a, b) equals accumulating a's records then b's in one pass."""
+        # The split also pushes "mode" past the enum limit only once both halves are in
+        a = [{"mode": f"m{i}", "band": "ng", "up": True} for i in range(6)] + self._sample("stat_health.json")
+        b = [{"mode": f"m{i}", "band": "na", "up": 1} for i in range(3, 11)] + ["not a record", {"up": None}]
+        single = schema_inference.SchemaAccumulator().update(a + b)
+        merged = schema_inference.SchemaAccumulator().update(a).merge(
+            schema_inference.SchemaAccumulator().update(b))
+        assert merged == single
+        assert merged.schema() == single.schema()
+        assert merged.fields["mode"].values is None
+        assert merged.schema()["band"].enum_values == ["na", "ng"]
+        assert merged.schema()["up"].python_type == "int" and not merged.schema()["up"].common
+
+    def test_nested_and_list_fields(self):
+        """Nested objects and lists are typed at the top level; their contents are not fields."""
+        schema = schema_inference.infer_schema([
+            {"port_table": [{"port_idx": 1, "media": "GE"}], "config": {"mode": "auto"}, "tags": ["a"]},
+            {"port_table": [], "config": {"mode": "manual"}, "tags": "a"},
+            {"port_table": [{"port_idx": 2}], "config": {}, "tags": ["b"]},
+        ])
+        assert sorted(schema) == ["config", "port_table", "tags"]
+        assert schema["port_table"].python_type == "list" and schema["port_table"].common
+        assert schema["config"].python_type == "dict" and schema["config"].enum_values == []
+        assert schema["tags"].python_type == "list"
+        assert schema["tags"].enum_values == []
+
+
+# ===========================================================================
+# Test: probe.py engine against a fake controller
+# ===========================================================================
+
+class _FakeController:
+    """A controller for probe.py: X-Csrf-Token sessions, optional expiry or crash, one record per GET."""
+
+    def __init__(self, expire_after: int = 0, interrupt_after: int = 0):
+        self.expire_after = expire_after  # authenticated requests before the session expires
+        self.interrupt_after = interrupt_after  # site requests before the run is killed
+        self.session = 0
+        self.served = 0
+        self.logins = 0
+        self.requests: list[tuple[str, str, dict | None]] = []
+
+    @property
+    def probed(self) -> list[str]:
+        """Site-scoped paths requested, logins and status aside."""
+        return [path for _, path, _ in self.requests if path not in ("/status", "/api/login", "/api/logout")]
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        body = json.loads(request.content) if request.content else None
+        self.requests.append((request.method, path, body))
+        if path == "/status":
+            return httpx.Response(200, json={"meta": {"rc": "ok", "server_version": "9.0.114"}})
+        if path == "/api/login":
+            self.session += 1
+            self.logins += 1
+            self.served = 0
+            return httpx.Response(200, headers={"x-csrf-token": f"s{self.session}"}, json={"data": []})
+        if path == "/api/logout":
+            return httpx.Response(200, json={"data": []})
+        if request.headers.get("x-csrf-token") != f"s{self.session}":
+            return httpx.Response(401, json={"meta": {"rc": "error", "msg": "api.err.LoginRequired"}})
+        if self.expire_after and self.served >= self.expire_after:
+            self.session += 1
+            return httpx.Response(401, json={"meta": {"rc": "error", "msg": "api.err.LoginRequired"}})
+        self.served += 1
+        if self.interrupt_after and len(self.probed) > self.interrupt_after:
+            raise KeyboardInterrupt
+        if "/cmd/" in path:
+            if not body:
+                return httpx.Response(400, json={"meta": {"rc": "error", "msg": "api.err.InvalidCommand"}})
+            return httpx.Response(200, json={"meta": {"rc": "ok"}, "data": [{"cmd": body["cmd"]}]})
+        return httpx.Response(200, json={"meta": {"rc": "ok"}, "data": [{"path": path, "x_passphrase": "hunter2"}]})
+
+
+class _ControllerTransport(httpx.MockTransport):
+    """Serves a _FakeController; async requests take 0-4ms by path and are tracked in flight."""
+
+    def __init__(self, controller: _FakeController):
+        super().__init__(controller.respond)
+        self.in_flight: dict[str, int] = defaultdict(int)
+        self.max_in_flight: dict[str, int] = defaultdict(int)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        kind = "cmd" if "/cmd/" in request.url.path else "other"
+        self.in_flight[kind] += 1
+        self.max_in_flight[kind] = max(self.max_in_flight[kind], self.in_flight[kind])
+        try:
+            await asyncio.sleep(zlib.crc32(request.url.path.encode()) % 5 / 1000)
+            return await super().handle_async_request(request)
+        finally:
+            self.in_flight[kind] -= 1
+
+
+def _probe_main(monkeypatch, workdir: Path, controller: _FakeController, *args: str) -> tuple[str, dict]:
+    """Run probe.py main() against controller; returns the inventory and samples it wrote."""
+    transport = _ControllerTransport(controller)
+    monkeypatch.setattr(probe, "_cassette_transport", lambda verify_ssl: transport)
+    out, samples = workdir / "endpoint-inventory.json", workdir / "api-samples"
+    samples.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setattr(sys, "argv", [
+        "probe.py", "--host", "ctl", "--username", "admin", "--password", "pw",
+        "--output", str(out), "--samples-dir", str(samples), *args])
+    probe.main()
+    return out.read_text(), {f.name: f.read_text() for f in sorted(samples.iterdir())}
+
+
+class TestProbeEngine:
+    SPEC = {k: v for k, v in json.loads((ROOT / "spec" / "probe-spec.json").read_text()).items()
+            if not k.startswith("_")}
+
+    def _run(self, coro):
+        return asyncio.get_event_loop().run_until_complete(coro)
+
+    def _prober(self, monkeypatch, controller, **kwargs):
+        transport = _ControllerTransport(controller)
+        monkeypatch.setattr(probe, "_cassette_transport", lambda verify_ssl: transport)
+        prober = probe.AsyncUniFiProber("ctl", 8443, "admin", "pw", "default", False, False, **kwargs)
+        return prober, transport
+
+    def _plan(self, *categories):
+        return [entry for entry in probe._probe_plan(self.SPEC) if entry[0] in categories]
+
+    def test_concurrent_401s_relogin_once(self, monkeypatch):
+        """Requests that all hit 401 after the session expired share one re-login."""
+        controller = _FakeController()
+        prober, _ = self._prober(monkeypatch, controller, concurrency=8)
+        plan = self._plan("rest", "list")
+
+        async def run():
+            assert await prober.login()
+            controller.session += 1  # the session expires under every request in flight
+            try:
+                return await prober.probe_all(plan)
+            finally:
+                await prober.close()
+
+        results = self._run(run())
+        assert controller.logins == 2
+        assert len(results) == len(plan)
+        assert all(r.status_code == 200 and r.record_count == 1 for rs in results for r in rs)
+        unauthorized = sum(1 for method, path, _ in controller.requests if path.startswith("/api/s/")) - len(plan)
+        assert 1 < unauthorized <= 8
+
+    def test_serial_categories_one_at_a_time(self, monkeypatch):
+        """cmd managers are probed one after another, in spec order, while other categories overlap."""
+        plan = self._plan("stat", "cmd", "v2")
+        controller = _FakeController()
+        prober, transport = self._prober(monkeypatch, controller, concurrency=8)
+
+        async def run(p):
+            assert await p.login()
+            try:
+                return await p.probe_all(plan)
+            finally:
+                await p.close()
+
+        results = self._run(run(prober))
+        assert [rs[0].category for rs in results] == [category for category, _, _ in plan]
+        assert transport.max_in_flight["cmd"] == 1 and transport.max_in_flight["other"] > 1
+        cmd_paths = [path for _, path, _ in controller.requests if "/cmd/" in path]
+        managers = list(dict.fromkeys(cmd_paths))
+        assert managers == [f"/api/s/default/{ep['path']}" for _, _, ep in self._plan("cmd")]
+        assert cmd_paths == sorted(cmd_paths, key=managers.index)  # no manager interleaves another
+        assert any(r.name.endswith("/speedtest-status") and r.status_code == 200 for rs in results for r in rs)
+
+        prober, transport = self._prober(monkeypatch, _FakeController(), concurrency=8, serial_categories=())
+        self._run(run(prober))
+        assert transport.max_in_flight["cmd"] > 1
+
+    def test_concurrency_does_not_change_output(self, monkeypatch, tmp_path, capsys):
+        """-j 1 and -j 8 write the same inventory and samples, with sessions expiring mid-run."""
+        serial, concurrent = _FakeController(expire_after=60), _FakeController(expire_after=60)
+        inventory_1, samples_1 = _probe_main(monkeypatch, tmp_path / "j1", serial, "--no-cache", "-j", "1")
+        inventory_8, samples_8 = _probe_main(monkeypatch, tmp_path / "j8", concurrent, "--no-cache", "-j", "8")
+        assert inventory_8 == inventory_1
+        assert samples_8 == samples_1
+        assert serial.logins > 2 and concurrent.logins > 2
+        assert json.loads(inventory_1)["controller_version"] == "9.0.114"
+        assert samples_1 and not any("hunter2" in text for text in samples_1.values())
+
+
+class TestProbeCache:
+    def _journal(self, path: Path) -> list[dict]:
+        return [json.loads(line) for line in path.read_text().splitlines()]
+
+    def test_resume_after_torn_journal(self, monkeypatch, tmp_path, capsys):
+        """--resume reuses the journaled endpoints of a killed run, skips a torn line and probes the rest."""
+        full = _FakeController()
+        reference, reference_samples = _probe_main(monkeypatch, tmp_path / "reference", full, "--no-cache", "-j", "1")
+        cache = tmp_path / "probe-cache.jsonl"
+        killed = _FakeController(interrupt_after=40)
+        with pytest.raises(KeyboardInterrupt):
+            _probe_main(monkeypatch, tmp_path / "run", killed, "--cache", str(cache), "-j", "1")
+        journal = self._journal(cache)
+        assert journal[0] == {"run": 1} and not any(record.get("complete") for record in journal)
+        done = [record for record in journal if "key" in record]
+        # The crash also tore the endpoint being written
+        torn = json.dumps({"key": "f" * 64, "run": 1, "results": [{"category": "rest"}]})
+        with cache.open("a") as f:
+            f.write(torn[:len(torn) // 2])
+
+        loaded = probe._ProbeCache(cache)
+        assert (loaded.last_run, loaded.last_complete, loaded.run) == (1, False, 2)
+        assert sorted(loaded.entries) == sorted(record["key"] for record in done)
+        assert "hunter2" not in cache.read_text()
+
+        resumed = _FakeController()
+        inventory, samples = _probe_main(monkeypatch, tmp_path / "run", resumed,
+                                         "--cache", str(cache), "--resume", "-j", "8")
+        assert inventory == reference and samples == reference_samples
+        reused = {r["path"] for record in done for r in record["results"]}
+        assert reused and not reused & set(resumed.probed)
+        assert set(resumed.probed) | reused >= set(full.probed)
+        assert killed.probed[-1] in resumed.probed  # in flight when the run was killed
+
+        journal = self._journal(cache)
+        assert journal[-1] == {"run": 2, "complete": True}
+        assert all(record["run"] == 2 for record in journal)
+        assert len(journal) - 1 == len(probe._probe_plan(TestProbeEngine.SPEC))
+
+    def test_only_changed_reprobes_changed_spec_entries(self, monkeypatch, tmp_path, capsys):
+        """--only-changed probes just the endpoints whose spec entry changed; a plain run probes all."""
+        cache = tmp_path / "probe-cache.jsonl"
+        spec = dict(TestProbeEngine.SPEC)
+        spec_path = tmp_path / "probe-spec.json"
+        spec_path.write_text(json.dumps(spec))
+        first = _FakeController()
+        _probe_main(monkeypatch, tmp_path / "run", first, "--cache", str(cache), "--spec", str(spec_path))
+        assert self._journal(cache)[-1] == {"run": 1, "complete": True}
+
+        # Resuming a finished run reuses all of it; a plain run probes everything again
+        resumed, plain = _FakeController(), _FakeController()
+        _probe_main(monkeypatch, tmp_path / "run", resumed, "--cache", str(cache), "--resume",
+                    "--spec", str(spec_path))
+        assert resumed.probed == []
+        _probe_main(monkeypatch, tmp_path / "run", plain, "--cache", str(cache), "--spec", str(spec_path))
+        assert sorted(plain.probed) == sorted(first.probed)
+
+        name, ep = next(iter(spec["rest_endpoints"].items()))
+        spec["rest_endpoints"] = dict(spec["rest_endpoints"], **{name: dict(ep, path=ep["path"] + "x")})
+        spec_path.write_text(json.dumps(spec))
+        changed = _FakeController()
+        inventory, _ = _probe_main(monkeypatch, tmp_path / "run", changed, "--cache", str(cache),
+                                   "--only-changed", "--spec", str(spec_path))
+        assert changed.probed == [f"/api/s/default/{ep['path']}x"]
+        assert json.loads(inventory)["rest_endpoints"][name]["path"].endswith("x")
+        assert len(self._journal(cache)) - 1 == len(probe._probe_plan(spec))
+
+
+# ===========================================================================
+# Test: llm_probe.py with the stub agent
+# ===========================================================================
+
+class TestLlmProbe:
+    NAMES = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot"]
+
+    def _main(self, monkeypatch, tmp_path, *args, version="9.0.114", **stub):
+        """Run llm_probe main() over NAMES with the stub agent; returns (stdout, discoveries, probed)."""
+        not_found = tmp_path / "not-found-endpoints.json"
+        not_found.write_text(json.dumps({"controller_version": version, "not_found_404": {
+            "rest_endpoints": [{"name": name, "path": f"/api/s/{{site}}/rest/{name}"} for name in self.NAMES]}}))
+        log = tmp_path / "stub.log"
+        log.unlink(missing_ok=True)
+        monkeypatch.setenv("LLM_PROBE_STUB_LOG", str(log))
+        for behaviour in ("slow", "fail", "hang"):
+            monkeypatch.setenv(f"LLM_PROBE_STUB_{behaviour.upper()}",
+                               ",".join(f"rest/{name}" for name in stub.get(behaviour, ())))
+        monkeypatch.setattr(llm_probe, "login_curl", lambda *a: (True, "csrf"))
+        monkeypatch.setattr(sys, "argv", [
+            "llm_probe.py", "--host", "ctl", "--username", "admin", "--password", "pw",
+            "--not-found-file", str(not_found), "--output", str(tmp_path / "discoveries.json"),
+            "--checkpoint", str(tmp_path / "verdicts.jsonl"),
+            "--agent-cmd", f"{sys.executable} {ROOT / 'llm-probe' / 'stub_agent.py'}", *args])
+        self.capsys.readouterr()
+        llm_probe.main()
+        stdout = self.capsys.readouterr().out
+        probed = [line.removeprefix("rest/") for line in log.read_text().splitlines()] if log.exists() else []
+        return stdout, json.loads((tmp_path / "discoveries.json").read_text()), probed
+
+    @pytest.fixture(autouse=True)
+    def _capsys(self, capsys):
+        self.capsys = capsys
+
+    def _checkpointed(self, tmp_path):
+        return [json.loads(line)["result"]["name"] for line in (tmp_path / "verdicts.jsonl").read_text().splitlines()]
+
+    def test_output_in_endpoint_order(self, monkeypatch, tmp_path):
+        """With --jobs 4, transcripts print in endpoint order even when earlier agents finish last."""
+        stdout, discoveries, probed = self._main(monkeypatch, tmp_path, "--jobs", "4", slow=["alpha", "bravo"])
+        assert probed[:2] != ["alpha", "bravo"] and sorted(probed) == sorted(self.NAMES)
+        headers = re.findall(r"\[(\d)/6\] rest/(\w+)", stdout)
+        assert headers == [(str(i), name) for i, name in enumerate(self.NAMES, 1)]
+        assert stdout.index("stub answer for rest/alpha") < stdout.index("[2/6] rest/bravo")
+        assert [r["name"] for r in discoveries["results"]] == self.NAMES
+        assert discoveries["summary"]["found"] == 6
+
+    def test_rerun_skips_checkpointed_verdicts(self, monkeypatch, tmp_path):
+        """A re-run for the same controller version reuses every verdict; a new version probes again."""
+        _, first, _ = self._main(monkeypatch, tmp_path, "--jobs", "3")
+        _, again, probed = self._main(monkeypatch, tmp_path, "--jobs", "3")
+        assert probed == []
+        assert again["results"] == first["results"]
+        _, _, probed = self._main(monkeypatch, tmp_path, "--jobs", "3", "--no-resume")
+        assert sorted(probed) == sorted(self.NAMES)
+        _, _, probed = self._main(monkeypatch, tmp_path, "--jobs", "3", version="9.1.0")
+        assert sorted(probed) == sorted(self.NAMES)
+
+    def test_failed_and_timed_out_runs_not_checkpointed(self, monkeypatch, tmp_path):
+        """Agents that exit non-zero or time out are reported but not checkpointed, so they are retried."""
+        _, discoveries, _ = self._main(monkeypatch, tmp_path, "--jobs", "3", "--timeout", "1",
+                                       fail=["bravo"], hang=["delta"])
+        verdicts = {r["name"]: r["verdict"] for r in discoveries["results"]}
+        assert verdicts["bravo"] == verdicts["delta"] == "UNCERTAIN"
+        assert "timed out" in next(r["notes"] for r in discoveries["results"] if r["name"] == "delta")
+        assert sorted(self._checkpointed(tmp_path)) == ["alpha", "charlie", "echo", "foxtrot"]
+
+        _, discoveries, probed = self._main(monkeypatch, tmp_path, "--jobs", "3")
+        assert sorted(probed) == ["bravo", "delta"]
+        assert all(r["verdict"] == "FOUND" for r in discoveries["results"])
+
+
+# ===========================================================================
+# Test: synthetic dataset writer
+# ===========================================================================
+
+class TestSyntheticDataset:
+    def _synth(self, events=500):
+        schemas = synthetic.load_schemas(ROOT / "spec" / "api-samples", ROOT / "spec" / "field-inventory.json")
+        counts = synthetic.default_counts(schemas, 12, 90, events)
+        return synthetic.Synthesizer(schemas, counts, seed=7, now_ms=1_700_000_000_000)
+
+    def test_synthesizer_pickles(self):
+        """A pickled Synthesizer (as sent to workers) produces the same records."""
+        synth = self._synth()
+        next(synth.records("stat_sta"))  # fill the plan and reference caches
+        clone = pickle.loads(pickle.dumps(synth))
+        for key in ("stat_sta", "stat_device", "stat_event"):
+            assert list(clone.records(key, 0, 20)) == list(synth.records(key, 0, 20))
+
+    def test_parallel_output_matches_serial(self, monkeypatch, tmp_path):
+        """write_dataset with jobs=2 writes byte-identical files to jobs=1, chunks concatenated in order."""
+        monkeypatch.setattr(synth_dataset, "CHUNK", 64)
+        synth = self._synth()
+        keys = ["stat_sta", "stat_device", "stat_event", "rest_networkconf"]
+        serial = synth_dataset.write_dataset(synth, tmp_path / "serial", keys, jobs=1)
+        parallel = synth_dataset.write_dataset(synth, tmp_path / "parallel", keys, jobs=2)
+        assert parallel == serial
+        assert serial["stat_event"]["records"] == synth.counts["stat_event"] > 64
+        for key in keys:
+            data = (tmp_path / "serial" / f"{key}.ndjson").read_bytes()
+            assert (tmp_path / "parallel" / f"{key}.ndjson").read_bytes() == data
+            assert len(data) == serial[key]["bytes"]
+        assert sorted(p.name for p in (tmp_path / "parallel").iterdir()) == sorted(f"{k}.ndjson" for k in keys)
+
+
+# ===========================================================================
+# Test: generated/ importable as a package
+# ===========================================================================
+
+class TestPackageImport:
+    SCRIPT = (
+        "import asyncio, importlib, json, sys\n"
+        "server = importlib.import_module(sys.argv[1])\n"
+        "tools = asyncio.run(server.mcp.get_tools())\n"
+        "print(json.dumps({'tools': sorted(tools), 'transport': type(server._controller_transport()).__name__,\n"
+        "                  'modules': sorted(m for m in sys.modules if 'unifi_tools.' in m)}))\n"
+    )
+
+    def _import(self, module, tmp_path, cwd, *path):
+        env = dict(os.environ, UNIFI_TOOL_LOADING="eager", UNIFI_CAPTURE=str(tmp_path / f"{module}.ndjson"),
+                   PYTHONPATH=os.pathsep.join(str(p) for p in path), PYTHONWARNINGS="ignore")
+        env.pop("UNIFI_MODULES", None)
+        env.pop("UNIFI_CASSETTE", None)
+        result = subprocess.run([sys.executable, "-c", self.SCRIPT, module], cwd=cwd, env=env,
+                                capture_output=True, text=True, timeout=120)
+        assert result.returncode == 0, result.stderr
+        return json.loads(result.stdout.splitlines()[-1])
+
+    def test_import_from_repo_root(self, tmp_path):
+        """`import generated.server` from the repo root loads the same tools as the top-level import."""
+        packaged = self._import("generated.server", tmp_path, ROOT)
+        flat = self._import("server", tmp_path, tmp_path, ROOT / "generated")
+        assert packaged["tools"] == flat["tools"] and len(packaged["tools"]) > 200
+        assert packaged["transport"] == flat["transport"] == "RequestCounter"
+        assert packaged["modules"] and all(m.startswith("generated.unifi_tools.") for m in packaged["modules"])
+        assert flat["modules"] and all(m.startswith("unifi_tools.") for m in flat["modules"])
+
+
+# ===========================================================================
+# Test: bench_tools regression gate
+# ===========================================================================
+
+class TestBenchGate:
+    BASE = {"family": "list", "p50_ms": 10.0, "p99_ms": 20.0, "alloc_kb": 100.0, "output_bytes": 5000, "errors": 0}
+
+    def _check(self, latency=False, **measured):
+        return bench_tools.regressions("small", {"t": dict(self.BASE, **measured)}, {"small": {"t": self.BASE}},
+                                       latency)
+
+    def test_latency_gated_only_on_request(self):
+        """A slow p50/p99 is noise by default and a regression with --check-latency."""
+        assert self._check(p50_ms=50.0, p99_ms=500.0) == []
+        found = self._check(latency=True, p50_ms=50.0, p99_ms=500.0)
+        assert [line.split()[2] for line in found] == ["p50_ms", "p99_ms"]
+
+    def test_deterministic_metrics_always_gated(self):
+        """Allocations, output size and errors regress with or without --check-latency."""
+        for latency in (False, True):
+            found = self._check(latency, alloc_kb=500.0, output_bytes=9000, errors=1)
+            assert [line.split()[2] for line in found] == ["alloc_kb", "output_bytes", "errors"]
+        assert self._check(alloc_kb=120.0) == []